@@ -4,14 +4,157 @@
 
 extern crate encoding;
 extern crate getopts;
+extern crate memmap;
 
-use std::{io, env};
+use std::{io, env, thread};
 use std::io::{Read, Write};
-use std::fs::File;
+use std::fs::{self, File};
 use std::path::Path;
-use encoding::{EncoderTrap, DecoderTrap};
+use std::collections::BTreeMap;
+use std::sync::{mpsc, Arc, Mutex, Condvar};
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::Instant;
+use encoding::{EncodingRef, EncoderTrap, DecoderTrap};
 use encoding::label::encoding_from_whatwg_label;
 use getopts::Options;
+use memmap::{Mmap, Protection};
+
+fn transcode(input: &[u8], inenc: EncodingRef, outenc: EncodingRef,
+             intrap: DecoderTrap, outtrap: EncoderTrap) -> Result<Vec<u8>, String> {
+    let decoded = match inenc.decode(input, intrap) {
+        Ok(s) => s,
+        Err(e) => return Err(format!("decoder error: {}", e)),
+    };
+    match outenc.encode(&decoded, outtrap) {
+        Ok(s) => Ok(s),
+        Err(e) => Err(format!("encoder error: {}", e)),
+    }
+}
+
+/// Returns a function which finds the first position at or after given position
+/// where the input can be split and decoded independently,
+/// or `None` if the input should be decoded as a whole.
+fn chunk_boundary(inenc: EncodingRef) -> Option<fn(&[u8], usize) -> usize> {
+    // any boundary not splitting a character is safe
+    fn char_boundary(input: &[u8], mut pos: usize) -> usize {
+        while pos < input.len() && (input[pos] & 0xc0) == 0x80 { pos += 1; }
+        pos
+    }
+    // trail bytes may be in the ASCII range (and GB 18030 four-byte sequences have
+    // ASCII digits in between), so a lead byte and one ASCII byte before the boundary
+    // may still be waiting for more bytes, which decides how invalid sequences are handled.
+    // with two ASCII bytes before the boundary, every sequence has been completed or rejected.
+    fn ascii_boundary(input: &[u8], mut pos: usize) -> usize {
+        while pos < input.len() &&
+                !(pos >= 2 && input[pos-2] < 0x80 && input[pos-1] < 0x80 && input[pos] < 0x80) {
+            pos += 1;
+        }
+        pos
+    }
+    fn any_boundary(_input: &[u8], pos: usize) -> usize {
+        pos
+    }
+
+    match inenc.name() {
+        // stateful, ASCII-incompatible or otherwise special encodings
+        "iso-2022-jp" | "hz" | "utf-16le" | "utf-16be" | "encoder-only-utf-8" | "error" => None,
+        "utf-8" => Some(char_boundary),
+        "windows-949" | "euc-jp" | "windows-31j" | "gbk" | "gb18030" | "big5-2003" => Some(ascii_boundary),
+        _ => Some(any_boundary), // single-byte encodings
+    }
+}
+
+/// Returns true if the outputs of independently encoded chunks can be simply concatenated.
+/// Stateful encoders return to the initial state at the end of each chunk,
+/// so the concatenated output would differ from (while still being equivalent to)
+/// the serial output by redundant escape sequences at chunk boundaries.
+fn is_stateless_output(outenc: EncodingRef) -> bool {
+    match outenc.name() {
+        "iso-2022-jp" | "hz" => false,
+        _ => true,
+    }
+}
+
+/// Transcodes chunks of a memory-mapped file with `jobs` threads, writing them in order.
+/// Returns the sizes of input chunks.
+fn transcode_parallel(path: &str, output: &mut Write, inenc: EncodingRef, outenc: EncodingRef,
+                      intrap: DecoderTrap, outtrap: EncoderTrap, boundary: fn(&[u8], usize) -> usize,
+                      jobs: usize, chunksize: usize) -> Vec<usize> {
+    // an empty file cannot be mapped
+    match fs::metadata(path) {
+        Ok(ref metadata) if metadata.len() == 0 => return Vec::new(),
+        Ok(_) => {}
+        Err(e) => panic!("cannot open the input {}: {}", path, e),
+    }
+    let mmap = match Mmap::open_path(path, Protection::Read) {
+        Ok(mmap) => mmap,
+        Err(e) => panic!("cannot map the input {}: {}", path, e),
+    };
+    let view = Arc::new(mmap.into_view_sync());
+    let input = unsafe { view.as_slice() };
+
+    let mut chunks = Vec::new();
+    let mut start = 0;
+    while start < input.len() {
+        let end = if input.len() - start <= chunksize {
+            input.len()
+        } else {
+            boundary(input, start + chunksize)
+        };
+        chunks.push((start, end));
+        start = end;
+    }
+    let chunks = Arc::new(chunks);
+
+    // workers take chunks in order, but do not start a chunk more than `window` chunks
+    // ahead of the writer, so at most `window` results wait to be written at any time
+    // even when a single chunk is much slower than others.
+    let window = jobs * 2;
+    let next = Arc::new(AtomicUsize::new(0));
+    let written = Arc::new((Mutex::new(0), Condvar::new()));
+    let (tx, rx) = mpsc::sync_channel(window);
+    for _ in 0..jobs {
+        let (view, chunks, next, written, tx) =
+            (view.clone(), chunks.clone(), next.clone(), written.clone(), tx.clone());
+        thread::spawn(move || {
+            let input = unsafe { view.as_slice() };
+            loop {
+                let i = next.fetch_add(1, Ordering::SeqCst);
+                if i >= chunks.len() { break; }
+                {
+                    let (ref lock, ref cvar) = *written;
+                    let mut nwritten = lock.lock().unwrap();
+                    while i >= *nwritten + window {
+                        nwritten = cvar.wait(nwritten).unwrap();
+                    }
+                }
+                let (start, end) = chunks[i];
+                let ret = transcode(&input[start..end], inenc, outenc, intrap, outtrap);
+                if tx.send((i, ret)).is_err() { break; }
+            }
+        });
+    }
+    drop(tx);
+
+    let mut pending = BTreeMap::new();
+    let mut nwritten = 0;
+    for (i, ret) in rx {
+        pending.insert(i, ret);
+        while let Some(ret) = pending.remove(&nwritten) {
+            match ret {
+                Ok(encoded) => output.write_all(&encoded).unwrap(),
+                Err(e) => panic!("{} in the chunk at byte {}", e, chunks[nwritten].0),
+            }
+            nwritten += 1;
+            let (ref lock, ref cvar) = *written;
+            *lock.lock().unwrap() = nwritten;
+            cvar.notify_all();
+        }
+    }
+    assert_eq!(nwritten, chunks.len());
+
+    chunks.iter().map(|&(start, end)| end - start).collect()
+}
 
 fn main() {
     let args: Vec<_> = env::args().collect();
@@ -23,6 +166,13 @@ fn main() {
                 "set error policy (one of strict, ignore, replace, ncr-escape)", "POLICY");
     opts.optflag("c", "", "same as `--error-policy=ignore`");
     opts.optopt("o", "output", "output file", "FILE");
+    opts.optopt("j", "jobs",
+                "transcode a memory-mapped input file in chunks with N threads \
+                 (stateful output encodings like iso-2022-jp and hz are always \
+                 transcoded serially)", "N");
+    opts.optopt("", "chunk-size", "set the approximate chunk size for `--jobs` [default: 4 MiB]",
+                "BYTES");
+    opts.optflag("", "stats", "report the throughput and chunk statistics to stderr");
     opts.optflag("h", "help", "print this help menu");
 
     let matches = match opts.parse(&args[1..]) {
@@ -41,14 +191,14 @@ fn main() {
             Some(enc) => enc,
             None => panic!("invalid input encoding name {}", name),
         },
-        None => encoding::all::UTF_8 as encoding::EncodingRef,
+        None => encoding::all::UTF_8 as EncodingRef,
     };
     let outenc = match outencname.as_ref().map(|s| &s[..]) {
         Some(name) => match encoding_from_whatwg_label(name) {
             Some(enc) => enc,
             None => panic!("invalid output encoding name {}", name),
         },
-        None => encoding::all::UTF_8 as encoding::EncodingRef,
+        None => encoding::all::UTF_8 as EncodingRef,
     };
 
     let mut policy = matches.opt_str("e");
@@ -63,12 +213,20 @@ fn main() {
         Some(s) => panic!("invalid error policy {}", s),
     };
 
-    let mut input = match matches.free.first().map(|s| &s[..]) {
-        Some("-") | None => Box::new(io::stdin()) as Box<Read>,
-        Some(f) => match File::open(&Path::new(f)) {
-            Ok(f) => Box::new(f) as Box<Read>,
-            Err(e) => panic!("cannot open the input {}: {}", f, e),
-        },
+    let jobs = match matches.opt_str("j").map(|s| s.parse::<usize>()) {
+        Some(Ok(0)) | Some(Err(_)) => panic!("invalid number of jobs"),
+        Some(Ok(n)) => n,
+        None => 1,
+    };
+    let chunksize = match matches.opt_str("chunk-size").map(|s| s.parse::<usize>()) {
+        Some(Ok(0)) | Some(Err(_)) => panic!("invalid chunk size"),
+        Some(Ok(n)) => n,
+        None => 4 << 20,
+    };
+
+    let inpath = match matches.free.first().map(|s| &s[..]) {
+        Some("-") | None => None,
+        Some(f) => Some(f),
     };
     let mut output = match matches.opt_str("o").as_ref().map(|s| &s[..]) {
         Some("-") | None => Box::new(io::stdout()) as Box<Write>,
@@ -78,17 +236,83 @@ fn main() {
         },
     };
 
-    // XXX should really use the incremental interface
-    let mut ret = Vec::new();
-    input.read_to_end(&mut ret).ok().expect("cannot read from the input");
-    let decoded = match inenc.decode(&ret, intrap) {
-        Ok(s) => s,
-        Err(e) => panic!("decoder error: {}", e),
-    };
-    let encoded = match outenc.encode(&decoded, outtrap) {
-        Ok(s) => s,
-        Err(e) => panic!("encoder error: {}", e),
+    let started = Instant::now();
+    let boundary = chunk_boundary(inenc);
+    let (chunksizes, threads) = match (inpath, boundary) {
+        (Some(path), Some(boundary)) if jobs > 1 && is_stateless_output(outenc) => {
+            (transcode_parallel(path, &mut output, inenc, outenc, intrap, outtrap,
+                                boundary, jobs, chunksize), jobs)
+        }
+        _ => {
+            if jobs > 1 {
+                let _ = writeln!(io::stderr(), "cannot split the input or output, transcoding serially");
+            }
+            let mut input = match inpath {
+                None => Box::new(io::stdin()) as Box<Read>,
+                Some(f) => match File::open(&Path::new(f)) {
+                    Ok(f) => Box::new(f) as Box<Read>,
+                    Err(e) => panic!("cannot open the input {}: {}", f, e),
+                },
+            };
+
+            // XXX should really use the incremental interface
+            let mut ret = Vec::new();
+            input.read_to_end(&mut ret).ok().expect("cannot read from the input");
+            match transcode(&ret, inenc, outenc, intrap, outtrap) {
+                Ok(encoded) => output.write_all(&encoded).unwrap(),
+                Err(e) => panic!("{}", e),
+            }
+            (vec![ret.len()], 1)
+        }
     };
-    output.write_all(&encoded).unwrap();
+    output.flush().unwrap();
+
+    if matches.opt_present("stats") {
+        let elapsed = started.elapsed();
+        let secs = elapsed.as_secs() as f64 + elapsed.subsec_nanos() as f64 * 1e-9;
+        let total: usize = chunksizes.iter().sum();
+        let _ = writeln!(io::stderr(), "{} bytes in {:.3}s ({:.1} MB/s)",
+                         total, secs, total as f64 / secs / 1e6);
+        let _ = writeln!(io::stderr(), "{} chunks with {} threads, {}/{}/{} bytes per chunk (min/avg/max)",
+                         chunksizes.len(), threads,
+                         chunksizes.iter().min().cloned().unwrap_or(0),
+                         total / chunksizes.len().max(1),
+                         chunksizes.iter().max().cloned().unwrap_or(0));
+    }
 }
 
+#[cfg(test)]
+mod tests {
+    use std::{env, fs, process};
+    use std::fs::File;
+    use std::io::Write;
+    use encoding::{EncoderTrap, DecoderTrap};
+    use encoding::all::UTF_8;
+    use encoding::label::encoding_from_whatwg_label;
+    use super::{transcode, chunk_boundary, transcode_parallel};
+
+    #[test]
+    fn test_parallel_invalid_input() {
+        // lone lead bytes, truncated GB 18030 four-byte sequences and invalid trail bytes,
+        // each followed by ASCII bytes
+        let pattern = b"ab\x81\x30cd\x81\x30\x81xy\xffz\xa4\xa4\x8f\xa1q\xe3\x81r";
+        let input: Vec<u8> = pattern.iter().cycle().take(pattern.len() * 16).cloned().collect();
+        let path = env::temp_dir().join(format!("recode-test-{}", process::id()));
+        File::create(&path).unwrap().write_all(&input).unwrap();
+
+        let labels = ["utf-8", "gb18030", "gbk", "big5", "euc-kr", "euc-jp", "shift_jis", "windows-1252"];
+        for &label in &labels {
+            // some indices may have been disabled
+            let inenc = match encoding_from_whatwg_label(label) { Some(e) => e, None => continue };
+            let serial = transcode(&input, inenc, UTF_8, DecoderTrap::Replace, EncoderTrap::Strict);
+            let boundary = chunk_boundary(inenc).unwrap();
+            for chunksize in 1..pattern.len() + 1 {
+                let mut output = Vec::new();
+                transcode_parallel(path.to_str().unwrap(), &mut output, inenc, UTF_8,
+                                   DecoderTrap::Replace, EncoderTrap::Strict, boundary, 3, chunksize);
+                assert_eq!(Ok(output), serial, "{} in chunks of {} bytes", inenc.name(), chunksize);
+            }
+        }
+        fs::remove_file(&path).unwrap();
+    }
+}
@@ -4,7 +4,7 @@
 
 //! A list of all supported encodings. Useful for encodings fixed in the compile time.
 
-use index_singlebyte as index;
+#[allow(unused_imports)] use index_singlebyte as index;
 use codec;
 use types::EncodingRef;
 
@@ -38,55 +38,92 @@ macro_rules! singlebyte(
 
 unique!(var=ERROR, mod=codec::error, val=ErrorEncoding);
 unique!(var=ASCII, mod=codec::ascii, val=ASCIIEncoding);
-singlebyte!(var=ARMSCII_8, mod=index::armscii_8, name="armscii-8");
-singlebyte!(var=IBM866, mod=index::ibm866, name|whatwg="ibm866");
+singlebyte!(#[cfg(feature = "index-armscii-8")]
+            var=ARMSCII_8, mod=index::armscii_8, name="armscii-8");
+singlebyte!(#[cfg(feature = "index-ibm866")]
+            var=IBM866, mod=index::ibm866, name|whatwg="ibm866");
 singlebyte!(var=ISO_8859_1, mod=codec::singlebyte::iso_8859_1, name="iso-8859-1");
-singlebyte!(var=ISO_8859_2, mod=index::iso_8859_2, name|whatwg="iso-8859-2");
-singlebyte!(var=ISO_8859_3, mod=index::iso_8859_3, name|whatwg="iso-8859-3");
-singlebyte!(var=ISO_8859_4, mod=index::iso_8859_4, name|whatwg="iso-8859-4");
-singlebyte!(var=ISO_8859_5, mod=index::iso_8859_5, name|whatwg="iso-8859-5");
-singlebyte!(var=ISO_8859_6, mod=index::iso_8859_6, name|whatwg="iso-8859-6");
-singlebyte!(var=ISO_8859_7, mod=index::iso_8859_7, name|whatwg="iso-8859-7");
-singlebyte!(var=ISO_8859_8, mod=index::iso_8859_8, name|whatwg="iso-8859-8");
-singlebyte!(var=ISO_8859_10, mod=index::iso_8859_10, name|whatwg="iso-8859-10");
-singlebyte!(var=ISO_8859_13, mod=index::iso_8859_13, name|whatwg="iso-8859-13");
-singlebyte!(var=ISO_8859_14, mod=index::iso_8859_14, name|whatwg="iso-8859-14");
-singlebyte!(var=ISO_8859_15, mod=index::iso_8859_15, name|whatwg="iso-8859-15");
-singlebyte!(var=ISO_8859_16, mod=index::iso_8859_16, name|whatwg="iso-8859-16");
-singlebyte!(var=KOI8_R, mod=index::koi8_r, name|whatwg="koi8-r");
-singlebyte!(var=KOI8_U, mod=index::koi8_u, name|whatwg="koi8-u");
-singlebyte!(var=MAC_ROMAN, mod=index::macintosh, name="mac-roman", whatwg=Some("macintosh"));
-singlebyte!(var=WINDOWS_874, mod=index::windows_874, name|whatwg="windows-874");
-singlebyte!(var=WINDOWS_1250, mod=index::windows_1250, name|whatwg="windows-1250");
-singlebyte!(var=WINDOWS_1251, mod=index::windows_1251, name|whatwg="windows-1251");
-singlebyte!(var=WINDOWS_1252, mod=index::windows_1252, name|whatwg="windows-1252");
-singlebyte!(var=WINDOWS_1253, mod=index::windows_1253, name|whatwg="windows-1253");
-singlebyte!(var=WINDOWS_1254, mod=index::windows_1254, name|whatwg="windows-1254");
-singlebyte!(var=WINDOWS_1255, mod=index::windows_1255, name|whatwg="windows-1255");
-singlebyte!(var=WINDOWS_1256, mod=index::windows_1256, name|whatwg="windows-1256");
-singlebyte!(var=WINDOWS_1257, mod=index::windows_1257, name|whatwg="windows-1257");
-singlebyte!(var=WINDOWS_1258, mod=index::windows_1258, name|whatwg="windows-1258");
-singlebyte!(var=MAC_CYRILLIC, mod=index::x_mac_cyrillic,
+singlebyte!(#[cfg(feature = "index-iso-8859-2")]
+            var=ISO_8859_2, mod=index::iso_8859_2, name|whatwg="iso-8859-2");
+singlebyte!(#[cfg(feature = "index-iso-8859-3")]
+            var=ISO_8859_3, mod=index::iso_8859_3, name|whatwg="iso-8859-3");
+singlebyte!(#[cfg(feature = "index-iso-8859-4")]
+            var=ISO_8859_4, mod=index::iso_8859_4, name|whatwg="iso-8859-4");
+singlebyte!(#[cfg(feature = "index-iso-8859-5")]
+            var=ISO_8859_5, mod=index::iso_8859_5, name|whatwg="iso-8859-5");
+singlebyte!(#[cfg(feature = "index-iso-8859-6")]
+            var=ISO_8859_6, mod=index::iso_8859_6, name|whatwg="iso-8859-6");
+singlebyte!(#[cfg(feature = "index-iso-8859-7")]
+            var=ISO_8859_7, mod=index::iso_8859_7, name|whatwg="iso-8859-7");
+singlebyte!(#[cfg(feature = "index-iso-8859-8")]
+            var=ISO_8859_8, mod=index::iso_8859_8, name|whatwg="iso-8859-8");
+singlebyte!(#[cfg(feature = "index-iso-8859-10")]
+            var=ISO_8859_10, mod=index::iso_8859_10, name|whatwg="iso-8859-10");
+singlebyte!(#[cfg(feature = "index-iso-8859-13")]
+            var=ISO_8859_13, mod=index::iso_8859_13, name|whatwg="iso-8859-13");
+singlebyte!(#[cfg(feature = "index-iso-8859-14")]
+            var=ISO_8859_14, mod=index::iso_8859_14, name|whatwg="iso-8859-14");
+singlebyte!(#[cfg(feature = "index-iso-8859-15")]
+            var=ISO_8859_15, mod=index::iso_8859_15, name|whatwg="iso-8859-15");
+singlebyte!(#[cfg(feature = "index-iso-8859-16")]
+            var=ISO_8859_16, mod=index::iso_8859_16, name|whatwg="iso-8859-16");
+singlebyte!(#[cfg(feature = "index-koi8-r")]
+            var=KOI8_R, mod=index::koi8_r, name|whatwg="koi8-r");
+singlebyte!(#[cfg(feature = "index-koi8-u")]
+            var=KOI8_U, mod=index::koi8_u, name|whatwg="koi8-u");
+singlebyte!(#[cfg(feature = "index-macintosh")]
+            var=MAC_ROMAN, mod=index::macintosh, name="mac-roman", whatwg=Some("macintosh"));
+singlebyte!(#[cfg(feature = "index-windows-874")]
+            var=WINDOWS_874, mod=index::windows_874, name|whatwg="windows-874");
+singlebyte!(#[cfg(feature = "index-windows-1250")]
+            var=WINDOWS_1250, mod=index::windows_1250, name|whatwg="windows-1250");
+singlebyte!(#[cfg(feature = "index-windows-1251")]
+            var=WINDOWS_1251, mod=index::windows_1251, name|whatwg="windows-1251");
+singlebyte!(#[cfg(feature = "index-windows-1252")]
+            var=WINDOWS_1252, mod=index::windows_1252, name|whatwg="windows-1252");
+singlebyte!(#[cfg(feature = "index-windows-1253")]
+            var=WINDOWS_1253, mod=index::windows_1253, name|whatwg="windows-1253");
+singlebyte!(#[cfg(feature = "index-windows-1254")]
+            var=WINDOWS_1254, mod=index::windows_1254, name|whatwg="windows-1254");
+singlebyte!(#[cfg(feature = "index-windows-1255")]
+            var=WINDOWS_1255, mod=index::windows_1255, name|whatwg="windows-1255");
+singlebyte!(#[cfg(feature = "index-windows-1256")]
+            var=WINDOWS_1256, mod=index::windows_1256, name|whatwg="windows-1256");
+singlebyte!(#[cfg(feature = "index-windows-1257")]
+            var=WINDOWS_1257, mod=index::windows_1257, name|whatwg="windows-1257");
+singlebyte!(#[cfg(feature = "index-windows-1258")]
+            var=WINDOWS_1258, mod=index::windows_1258, name|whatwg="windows-1258");
+singlebyte!(#[cfg(feature = "index-x-mac-cyrillic")]
+            var=MAC_CYRILLIC, mod=index::x_mac_cyrillic,
             name="mac-cyrillic", whatwg=Some("x-mac-cyrillic"));
 unique!(var=UTF_8, mod=codec::utf_8, val=UTF8Encoding);
 unique!(var=UTF_16LE, mod=codec::utf_16, val=UTF16LEEncoding);
 unique!(var=UTF_16BE, mod=codec::utf_16, val=UTF16BEEncoding);
-unique!(var=WINDOWS_949, mod=codec::korean, val=Windows949Encoding);
-unique!(var=EUC_JP, mod=codec::japanese, val=EUCJPEncoding);
-unique!(var=WINDOWS_31J, mod=codec::japanese, val=Windows31JEncoding);
-unique!(var=ISO_2022_JP, mod=codec::japanese, val=ISO2022JPEncoding);
-unique!(var=GBK, mod=codec::simpchinese, val=GBKEncoding);
-unique!(var=GB18030, mod=codec::simpchinese, val=GB18030Encoding);
-unique!(var=HZ, mod=codec::simpchinese, val=HZEncoding);
-unique!(var=BIG5_2003, mod=codec::tradchinese, val=BigFive2003Encoding);
+unique!(#[cfg(feature = "index-euc-kr")]
+        var=WINDOWS_949, mod=codec::korean, val=Windows949Encoding);
+unique!(#[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        var=EUC_JP, mod=codec::japanese, val=EUCJPEncoding);
+unique!(#[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        var=WINDOWS_31J, mod=codec::japanese, val=Windows31JEncoding);
+unique!(#[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        var=ISO_2022_JP, mod=codec::japanese, val=ISO2022JPEncoding);
+unique!(#[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        var=GBK, mod=codec::simpchinese, val=GBKEncoding);
+unique!(#[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        var=GB18030, mod=codec::simpchinese, val=GB18030Encoding);
+unique!(#[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        var=HZ, mod=codec::simpchinese, val=HZEncoding);
+unique!(#[cfg(feature = "index-big5")]
+        var=BIG5_2003, mod=codec::tradchinese, val=BigFive2003Encoding);
 
 pub mod whatwg {
-    use index_singlebyte as index;
+    #[allow(unused_imports)] use index_singlebyte as index;
     use codec;
 
     singlebyte!(var=X_USER_DEFINED, mod=codec::whatwg::x_user_defined,
                 name="pua-mapped-binary", whatwg=Some("x-user-defined"));
-    singlebyte!(var=ISO_8859_8_I, mod=index::iso_8859_8, name|whatwg="iso-8859-8-i");
+    singlebyte!(#[cfg(feature = "index-iso-8859-8")]
+                var=ISO_8859_8_I, mod=index::iso_8859_8, name|whatwg="iso-8859-8-i");
     unique!(var=REPLACEMENT, mod=codec::whatwg, val=EncoderOnlyUTF8Encoding);
 }
 
@@ -96,46 +133,82 @@ pub fn encodings() -> &'static [EncodingRef] {
     const ENCODINGS: &'static [EncodingRef] = &[
         ERROR,
         ASCII,
+        #[cfg(feature = "index-ibm866")]
         IBM866,
         ISO_8859_1,
+        #[cfg(feature = "index-iso-8859-2")]
         ISO_8859_2,
+        #[cfg(feature = "index-iso-8859-3")]
         ISO_8859_3,
+        #[cfg(feature = "index-iso-8859-4")]
         ISO_8859_4,
+        #[cfg(feature = "index-iso-8859-5")]
         ISO_8859_5,
+        #[cfg(feature = "index-iso-8859-6")]
         ISO_8859_6,
+        #[cfg(feature = "index-iso-8859-7")]
         ISO_8859_7,
+        #[cfg(feature = "index-iso-8859-8")]
         ISO_8859_8,
+        #[cfg(feature = "index-iso-8859-10")]
         ISO_8859_10,
+        #[cfg(feature = "index-iso-8859-13")]
         ISO_8859_13,
+        #[cfg(feature = "index-iso-8859-14")]
         ISO_8859_14,
+        #[cfg(feature = "index-iso-8859-15")]
         ISO_8859_15,
+        #[cfg(feature = "index-iso-8859-16")]
         ISO_8859_16,
+        #[cfg(feature = "index-koi8-r")]
         KOI8_R,
+        #[cfg(feature = "index-koi8-u")]
         KOI8_U,
+        #[cfg(feature = "index-macintosh")]
         MAC_ROMAN,
+        #[cfg(feature = "index-windows-874")]
         WINDOWS_874,
+        #[cfg(feature = "index-windows-1250")]
         WINDOWS_1250,
+        #[cfg(feature = "index-windows-1251")]
         WINDOWS_1251,
+        #[cfg(feature = "index-windows-1252")]
         WINDOWS_1252,
+        #[cfg(feature = "index-windows-1253")]
         WINDOWS_1253,
+        #[cfg(feature = "index-windows-1254")]
         WINDOWS_1254,
+        #[cfg(feature = "index-windows-1255")]
         WINDOWS_1255,
+        #[cfg(feature = "index-windows-1256")]
         WINDOWS_1256,
+        #[cfg(feature = "index-windows-1257")]
         WINDOWS_1257,
+        #[cfg(feature = "index-windows-1258")]
         WINDOWS_1258,
+        #[cfg(feature = "index-x-mac-cyrillic")]
         MAC_CYRILLIC,
         UTF_8,
         UTF_16LE,
         UTF_16BE,
+        #[cfg(feature = "index-euc-kr")]
         WINDOWS_949,
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         EUC_JP,
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         WINDOWS_31J,
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         ISO_2022_JP,
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
         GBK,
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
         GB18030,
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
         HZ,
+        #[cfg(feature = "index-big5")]
         BIG5_2003,
         whatwg::X_USER_DEFINED,
+        #[cfg(feature = "index-iso-8859-8")]
         whatwg::ISO_8859_8_I,
         whatwg::REPLACEMENT,
     ];
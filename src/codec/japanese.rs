@@ -9,6 +9,7 @@ use std::default::Default;
 use util::StrCharIndex;
 use index_japanese as index;
 use types::*;
+use dfa_table;
 use self::ISO2022JPState::{ASCII,Katakana,Lead};
 
 /**
@@ -36,6 +37,13 @@ impl Encoding for EUCJPEncoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { EUCJP0212Decoder::new() }
 }
 
+impl EUCJPEncoding {
+    /// Returns the length of the longest valid prefix of `input`; see `dfa_table::Dfa::valid_up_to`.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::EUC_JP.valid_up_to(input)
+    }
+}
+
 /// An encoder for EUC-JP with unused G3 character set.
 #[derive(Clone, Copy)]
 pub struct EUCJPEncoder;
@@ -429,6 +437,16 @@ mod eucjp_tests {
             EUCJPEncoding.decode(&s, DecoderTrap::Strict)
         }))
     }
+
+    #[bench]
+    fn bench_valid_up_to_short_text(bencher: &mut test::Bencher) {
+        let s = EUCJPEncoding.encode(testutils::JAPANESE_TEXT,
+                                     EncoderTrap::Strict).ok().unwrap();
+        bencher.bytes = s.len() as u64;
+        bencher.iter(|| test::black_box({
+            EUCJPEncoding.valid_up_to(&s)
+        }))
+    }
 }
 
 /**
@@ -456,6 +474,13 @@ impl Encoding for Windows31JEncoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { Windows31JDecoder::new() }
 }
 
+impl Windows31JEncoding {
+    /// Returns the length of the longest valid prefix of `input`; see `dfa_table::Dfa::valid_up_to`.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::WINDOWS_31J.valid_up_to(input)
+    }
+}
+
 /// An encoder for Shift_JIS with IBM/NEC extensions.
 #[derive(Clone, Copy)]
 pub struct Windows31JEncoder;
@@ -753,6 +778,16 @@ mod windows31j_tests {
             Windows31JEncoding.decode(&s, DecoderTrap::Strict)
         }))
     }
+
+    #[bench]
+    fn bench_valid_up_to_short_text(bencher: &mut test::Bencher) {
+        let s = Windows31JEncoding.encode(testutils::JAPANESE_TEXT,
+                                          EncoderTrap::Strict).ok().unwrap();
+        bencher.bytes = s.len() as u64;
+        bencher.iter(|| test::black_box({
+            Windows31JEncoding.valid_up_to(&s)
+        }))
+    }
 }
 
 /**
@@ -9,6 +9,7 @@ use std::default::Default;
 use util::StrCharIndex;
 use index_korean as index;
 use types::*;
+use dfa_table;
 
 /**
  * Windows code page 949.
@@ -31,6 +32,13 @@ impl Encoding for Windows949Encoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { Windows949Decoder::new() }
 }
 
+impl Windows949Encoding {
+    /// Returns the length of the longest valid prefix of `input`; see `dfa_table::Dfa::valid_up_to`.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::WINDOWS_949.valid_up_to(input)
+    }
+}
+
 /// An encoder for Windows code page 949.
 #[derive(Clone, Copy)]
 pub struct Windows949Encoder;
@@ -276,5 +284,15 @@ mod windows949_tests {
             Windows949Encoding.decode(&s, DecoderTrap::Strict)
         }))
     }
+
+    #[bench]
+    fn bench_valid_up_to_short_text(bencher: &mut test::Bencher) {
+        let s = Windows949Encoding.encode(testutils::KOREAN_TEXT,
+                                          EncoderTrap::Strict).ok().unwrap();
+        bencher.bytes = s.len() as u64;
+        bencher.iter(|| test::black_box({
+            Windows949Encoding.valid_up_to(&s)
+        }))
+    }
 }
 
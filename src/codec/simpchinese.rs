@@ -9,6 +9,7 @@ use std::default::Default;
 use util::StrCharIndex;
 use index_simpchinese as index;
 use types::*;
+use dfa_table;
 
 /// GB 18030.
 ///
@@ -44,6 +45,13 @@ impl Encoding for GB18030Encoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { GB18030Decoder::new() }
 }
 
+impl GB18030Encoding {
+    /// Returns the length of the longest valid prefix of `input`; see `dfa_table::Dfa::valid_up_to`.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::GB18030.valid_up_to(input)
+    }
+}
+
 /// An encoder for GB 18030.
 #[derive(Clone, Copy)]
 pub struct GB18030Encoder;
@@ -88,6 +96,13 @@ impl Encoding for GBKEncoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { GB18030Decoder::new() }
 }
 
+impl GBKEncoding {
+    /// Same as `GB18030Encoding::valid_up_to`, since GBK shares the GB 18030 decoder.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::GB18030.valid_up_to(input)
+    }
+}
+
 /// An encoder for GBK.
 #[derive(Clone, Copy)]
 pub struct GBKEncoder;
@@ -421,6 +436,16 @@ mod gb18030_tests {
             GB18030Encoding.decode(&s, DecoderTrap::Strict)
         }))
     }
+
+    #[bench]
+    fn bench_valid_up_to_short_text(bencher: &mut test::Bencher) {
+        let s = GB18030Encoding.encode(testutils::SIMPLIFIED_CHINESE_TEXT,
+                                       EncoderTrap::Strict).ok().unwrap();
+        bencher.bytes = s.len() as u64;
+        bencher.iter(|| test::black_box({
+            GB18030Encoding.valid_up_to(&s)
+        }))
+    }
 }
 
 #[cfg(test)]
@@ -116,7 +116,7 @@ pub mod iso_8859_1 {
     #[inline] pub fn backward(code: u32) -> u8 { if (code & !0x7f) == 0x80 {code as u8} else {0} }
 }
 
-#[cfg(test)]
+#[cfg(all(test, feature = "index-iso-8859-2"))]
 mod tests {
     use all::ISO_8859_2;
     use types::*;
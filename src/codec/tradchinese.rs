@@ -9,6 +9,7 @@ use std::default::Default;
 use util::StrCharIndex;
 use index_tradchinese as index;
 use types::*;
+use dfa_table;
 
 /**
  * Big5-2003 with common extensions. (XXX with asymmetric HKSCS-2008 support)
@@ -34,6 +35,13 @@ impl Encoding for BigFive2003Encoding {
     fn raw_decoder(&self) -> Box<RawDecoder> { BigFive2003HKSCS2008Decoder::new() }
 }
 
+impl BigFive2003Encoding {
+    /// Returns the length of the longest valid prefix of `input`; see `dfa_table::Dfa::valid_up_to`.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        dfa_table::BIG5_2003.valid_up_to(input)
+    }
+}
+
 /// An encoder for Big5-2003.
 #[derive(Clone, Copy)]
 pub struct BigFive2003Encoder;
@@ -164,6 +172,8 @@ mod bigfive2003_tests {
         assert_feed_ok!(e, "1\u{20ac}/m", "", [0x31, 0xa3, 0xe1, 0x2f, 0x6d]);
         assert_feed_ok!(e, "\u{ffed}", "", [0xf9, 0xfe]);
         assert_feed_ok!(e, "\u{2550}", "", [0xf9, 0xf9]); // not [0xa2, 0xa4]
+        // also mapped from HKSCS ([0x92, 0xaf] and [0x92, 0xb0]), which is never used
+        assert_feed_ok!(e, "\u{5159}\u{515b}", "", [0xa2, 0x59, 0xa2, 0x5a]);
         assert_finish_ok!(e, []);
     }
 
@@ -192,6 +202,7 @@ mod bigfive2003_tests {
         assert_feed_ok!(d, [0xf9, 0xf9], [], "\u{2550}");
         assert_feed_ok!(d, [0xa2, 0xa4], [], "\u{2550}");
         assert_feed_ok!(d, [0x87, 0x7e], [], "\u{3eec}"); // HKSCS-2008 addition
+        assert_feed_ok!(d, [0x92, 0xaf, 0xa2, 0x59], [], "\u{5159}\u{5159}");
         assert_feed_ok!(d, [0x88, 0x62, 0x88, 0x64, 0x88, 0xa3, 0x88, 0xa5], [],
                         "\u{ca}\u{304}\u{00ca}\u{30c}\u{ea}\u{304}\u{ea}\u{30c}"); // 2-byte output
         assert_finish_ok!(d, "");
@@ -276,4 +287,14 @@ mod bigfive2003_tests {
             BigFive2003Encoding.decode(&s, DecoderTrap::Strict)
         }))
     }
+
+    #[bench]
+    fn bench_valid_up_to_short_text(bencher: &mut test::Bencher) {
+        let s = BigFive2003Encoding.encode(testutils::TRADITIONAL_CHINESE_TEXT,
+                                           EncoderTrap::Strict).ok().unwrap();
+        bencher.bytes = s.len() as u64;
+        bencher.iter(|| test::black_box({
+            BigFive2003Encoding.valid_up_to(&s)
+        }))
+    }
 }
@@ -0,0 +1,225 @@
+// This is a part of rust-encoding.
+// Copyright (c) 2013-2015, Kang Seonghoon.
+// See README.md and LICENSE.txt for details.
+
+//! A single-pass charset detector for unlabeled documents.
+
+use detect_table::{Model, MODELS, INVALID, LOWER, UPPER, OTHER};
+use types::EncodingRef;
+
+/// The score of each byte class in single-byte encodings (indexed by the class).
+/// Letters are preferred, while C1 controls are heavily penalized.
+const CLASS_SCORES: [i64; 6] = [0, -8, 1, 1, 1, 0];
+
+/// The score of a lowercase letter followed by an uppercase letter,
+/// which is rare in a text but frequent in a misdetected one.
+const CASE_MISMATCH_SCORE: i64 = -2;
+
+/// The score of each byte in valid multi-byte sequences,
+/// which are much less likely to occur by chance than valid single bytes.
+const SEQUENCE_BYTE_SCORE: i64 = 2;
+
+/// The detector stops once the best candidate leads every other candidate by this score.
+const DOMINANCE: i64 = 256;
+
+struct Candidate {
+    encoding: EncodingRef,
+    model: &'static Model,
+    state: usize, // the validator state for multi-byte encodings
+    start: usize, // the start of the current sequence for multi-byte encodings
+    score: i64,
+    alive: bool,
+}
+
+impl Candidate {
+    /// Updates the score with `input[i]`, returning false if it is invalid.
+    #[inline]
+    fn feed(&mut self, input: &[u8], i: usize) -> bool {
+        let b = input[i];
+        match *self.model {
+            Model::SingleByte(classes) => {
+                let class = byte_class(classes, b);
+                if class == INVALID { return false; }
+                if b >= 0x80 {
+                    self.score += CLASS_SCORES[class as usize];
+                }
+                if i > 0 && (b >= 0x80 || input[i-1] >= 0x80) &&
+                        byte_class(classes, input[i-1]) == LOWER && class == UPPER {
+                    self.score += CASE_MISMATCH_SCORE;
+                }
+            }
+            Model::MultiByte(dfa) => {
+                if self.state == 0 {
+                    if b < 0x80 { return true; }
+                    self.start = i;
+                }
+                match dfa.next(self.state, input, i) {
+                    Some(next) => {
+                        self.state = next;
+                        if next == 0 {
+                            self.score += SEQUENCE_BYTE_SCORE * (i + 1 - self.start) as i64;
+                        }
+                    }
+                    None => { return false; }
+                }
+            }
+        }
+        true
+    }
+}
+
+#[inline]
+fn byte_class(classes: &[u8; 128], b: u8) -> u8 {
+    match b {
+        b'a'...b'z' => LOWER,
+        b'A'...b'Z' => UPPER,
+        0x00...0x7f => OTHER,
+        _ => classes[(b - 0x80) as usize],
+    }
+}
+
+/// Returns true if the best candidate leads every other one by `DOMINANCE`.
+fn dominated(candidates: &[Candidate]) -> bool {
+    let mut best = None;
+    let mut second = None;
+    for c in candidates.iter().filter(|c| c.alive) {
+        if best.map_or(true, |s| c.score > s) {
+            second = best;
+            best = Some(c.score);
+        } else if second.map_or(true, |s| c.score > s) {
+            second = Some(c.score);
+        }
+    }
+    match (best, second) {
+        (Some(best), Some(second)) => best - second >= DOMINANCE,
+        _ => true,
+    }
+}
+
+/// Guesses the encoding of `input` among `candidates`.
+///
+/// Every candidate is scored together in one pass over `input`,
+/// using the byte classes of single-byte encodings and the validators of multi-byte encodings.
+/// Candidates failing to decode `input` are dropped, except for a trailing incomplete sequence
+/// (so that `input` can be a prefix of the document).
+/// The pass stops early once only one candidate remains after dropping others
+/// or a candidate clearly dominates,
+/// so the result is not guaranteed to decode the remainder of `input`.
+/// Ties go to the earlier candidate.
+///
+/// Only ASCII-compatible and stateless encodings are supported;
+/// other candidates (e.g. UTF-16 or ISO-2022-JP) are ignored.
+/// Returns `None` if every supported candidate has been dropped.
+pub fn detect(input: &[u8], candidates: &[EncodingRef]) -> Option<EncodingRef> {
+    let mut candidates: Vec<Candidate> = candidates.iter().filter_map(|&encoding| {
+        MODELS.iter().find(|&&(e, _)| e.name() == encoding.name()).map(|&(_, ref model)| {
+            Candidate { encoding: encoding, model: model, state: 0, start: 0, score: 0, alive: true }
+        })
+    }).collect();
+
+    let mut nalive = candidates.len();
+    for i in 0..input.len() {
+        // a sole candidate from the beginning should still be validated
+        if nalive == 0 || (nalive == 1 && candidates.len() > 1) { break; }
+        if input[i] < 0x80 && (i == 0 || input[i-1] < 0x80) &&
+                candidates.iter().filter(|c| c.alive).all(|c| c.state == 0) {
+            continue; // no candidate changes its score
+        }
+        for c in candidates.iter_mut().filter(|c| c.alive) {
+            if !c.feed(input, i) {
+                c.alive = false;
+                nalive -= 1;
+            }
+        }
+        if i % 64 == 63 && dominated(&candidates) { break; }
+    }
+
+    let mut best: Option<&Candidate> = None;
+    for c in candidates.iter().filter(|c| c.alive) {
+        if best.map_or(true, |b| c.score > b.score) {
+            best = Some(c);
+        }
+    }
+    best.map(|c| c.encoding)
+}
+
+#[cfg(test)]
+mod tests {
+    extern crate test;
+    use super::detect;
+    use all;
+    use types::{Encoding, EncodingRef, EncoderTrap};
+    use testutils;
+
+    fn detect_encoded(s: &str, encoding: EncodingRef, candidates: &[EncodingRef]) -> Option<&'static str> {
+        let input = encoding.encode(s, EncoderTrap::Strict).unwrap();
+        detect(&input, candidates).map(|e| e.name())
+    }
+
+    #[test]
+    fn test_ascii() {
+        let candidates = [all::UTF_8 as EncodingRef, all::ISO_8859_1];
+        assert_eq!(detect(b"Hello, world!", &candidates).map(|e| e.name()), Some("utf-8"));
+        assert_eq!(detect(b"", &candidates).map(|e| e.name()), Some("utf-8"));
+        assert_eq!(detect(b"\xff", &candidates).map(|e| e.name()), Some("iso-8859-1"));
+        assert_eq!(detect(b"\xff", &[all::UTF_8 as EncodingRef, all::ASCII]).map(|e| e.name()), None);
+        assert_eq!(detect(b"abc", &[all::UTF_16LE as EncodingRef]).map(|e| e.name()), None);
+        // a single candidate is validated as well
+        assert_eq!(detect(b"\xff", &[all::UTF_8 as EncodingRef]).map(|e| e.name()), None);
+        assert_eq!(detect(b"abc\xff", &[all::UTF_8 as EncodingRef]).map(|e| e.name()), None);
+        assert_eq!(detect(b"abc", &[all::UTF_8 as EncodingRef]).map(|e| e.name()), Some("utf-8"));
+    }
+
+    #[test]
+    fn test_latin1() {
+        let candidates = [all::UTF_8 as EncodingRef, all::ISO_8859_1];
+        let s = "Le c\u{153}ur a ses raisons que la raison ne conna\u{ee}t point.";
+        assert_eq!(detect_encoded(s, all::UTF_8, &candidates), Some("utf-8"));
+        let s = "Caf\u{e9} cr\u{e8}me, na\u{ef}ve fa\u{e7}ade.";
+        assert_eq!(detect_encoded(s, all::ISO_8859_1, &candidates), Some("iso-8859-1"));
+        // the trailing incomplete sequence is not an error
+        assert_eq!(detect(b"caf\xc3", &candidates).map(|e| e.name()), Some("utf-8"));
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-windows-1252", feature = "index-euc-kr",
+              feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+    fn test_korean() {
+        let candidates = [all::WINDOWS_1252 as EncodingRef, all::UTF_8, all::WINDOWS_949, all::GBK];
+        let s = testutils::KOREAN_TEXT;
+        assert_eq!(detect_encoded(s, all::WINDOWS_949, &candidates), Some("windows-949"));
+        assert_eq!(detect_encoded(s, all::UTF_8, &candidates), Some("utf-8"));
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-windows-1252", feature = "index-jis0208", feature = "index-jis0212"))]
+    fn test_japanese() {
+        let candidates = [all::WINDOWS_1252 as EncodingRef, all::EUC_JP, all::WINDOWS_31J];
+        let s = testutils::JAPANESE_TEXT;
+        assert_eq!(detect_encoded(s, all::EUC_JP, &candidates), Some("euc-jp"));
+        assert_eq!(detect_encoded(s, all::WINDOWS_31J, &candidates), Some("windows-31j"));
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-koi8-r", feature = "index-windows-1251", feature = "index-ibm866"))]
+    fn test_cyrillic() {
+        let candidates = [all::KOI8_R as EncodingRef, all::WINDOWS_1251, all::IBM866];
+        let s = "\u{412} \u{447}\u{430}\u{449}\u{430}\u{445} \u{44e}\u{433}\u{430} \u{436}\u{438}\u{43b} \u{431}\u{44b} \
+                 \u{446}\u{438}\u{442}\u{440}\u{443}\u{441}? \u{414}\u{430}, \u{43d}\u{43e} \u{444}\u{430}\u{43b}\u{44c}\
+                 \u{448}\u{438}\u{432}\u{44b}\u{439} \u{44d}\u{43a}\u{437}\u{435}\u{43c}\u{43f}\u{43b}\u{44f}\u{440}!";
+        for &encoding in &candidates {
+            assert_eq!(detect_encoded(s, encoding, &candidates), Some(encoding.name()));
+        }
+    }
+
+    #[bench]
+    fn bench_detect_short_text(bencher: &mut test::Bencher) {
+        let candidates: Vec<EncodingRef> = all::encodings().to_vec();
+        let s = testutils::KOREAN_TEXT;
+        let input = all::UTF_8.encode(s, EncoderTrap::Strict).unwrap();
+        bencher.bytes = input.len() as u64;
+        bencher.iter(|| {
+            test::black_box(detect(&input, &candidates))
+        })
+    }
+}
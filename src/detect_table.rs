@@ -0,0 +1,478 @@
+// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+// https://encoding.spec.whatwg.org/
+
+//! Per-encoding byte and pair validity tables for the charset detector.
+
+#![allow(dead_code)] // when every single-byte index is disabled
+
+use all;
+use dfa_table::{self, Dfa};
+use types::EncodingRef;
+
+pub const INVALID: u8 = 0;
+pub const CONTROL: u8 = 1;
+pub const LOWER: u8 = 2;
+pub const UPPER: u8 = 3;
+pub const LETTER: u8 = 4;
+pub const OTHER: u8 = 5;
+
+pub enum Model {
+    /// The class of each byte from 0x80 to 0xff, decoded as is.
+    SingleByte(&'static [u8; 128]),
+    /// The validator, where bytes are decoded as sequences.
+    MultiByte(&'static Dfa),
+}
+
+/// Models of every encoding supported by the detector.
+pub static MODELS: &'static [(EncodingRef, Model)] = &[
+    (all::ASCII as EncodingRef, Model::SingleByte(&[
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+    ])),
+    (all::ISO_8859_1 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER,
+        OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-armscii-8")]
+    (all::ARMSCII_8 as EncodingRef, Model::SingleByte(&[
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, OTHER, INVALID, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, LOWER, UPPER, LOWER, UPPER,
+        LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER,
+        UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER,
+        LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER,
+        UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER,
+        LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER,
+        UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, OTHER, INVALID,
+    ])),
+    #[cfg(feature = "index-ibm866")]
+    (all::IBM866 as EncodingRef, Model::SingleByte(&[
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER,
+        LOWER, UPPER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+    ])),
+    #[cfg(feature = "index-iso-8859-2")]
+    (all::ISO_8859_2 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, OTHER, UPPER, OTHER, UPPER, UPPER, OTHER, OTHER, UPPER,
+        UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, OTHER, LOWER, OTHER, LOWER, OTHER, LOWER, LOWER,
+        LETTER, OTHER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+    ])),
+    #[cfg(feature = "index-iso-8859-3")]
+    (all::ISO_8859_3 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, OTHER, OTHER, OTHER, INVALID, UPPER, OTHER, OTHER, UPPER,
+        UPPER, UPPER, UPPER, OTHER, INVALID, UPPER, OTHER, LOWER, OTHER, OTHER, OTHER, LOWER,
+        LOWER, OTHER, OTHER, LOWER, LOWER, LOWER, LOWER, OTHER, INVALID, LOWER, UPPER, UPPER,
+        UPPER, INVALID, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, INVALID, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, INVALID, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, INVALID, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        OTHER,
+    ])),
+    #[cfg(feature = "index-iso-8859-4")]
+    (all::ISO_8859_4 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, LOWER, UPPER, OTHER, UPPER, UPPER, OTHER, OTHER, UPPER,
+        UPPER, UPPER, UPPER, OTHER, UPPER, OTHER, OTHER, LOWER, OTHER, LOWER, OTHER, LOWER, LOWER,
+        LETTER, OTHER, LOWER, LOWER, LOWER, LOWER, UPPER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+    ])),
+    #[cfg(feature = "index-iso-8859-5")]
+    (all::ISO_8859_5 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-iso-8859-6")]
+    (all::ISO_8859_6 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, INVALID, INVALID, INVALID, OTHER, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, OTHER, OTHER, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, OTHER,
+        INVALID, INVALID, INVALID, OTHER, INVALID, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, INVALID, INVALID,
+        INVALID, INVALID, INVALID, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID,
+    ])),
+    #[cfg(feature = "index-iso-8859-7")]
+    (all::ISO_8859_7 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        LETTER, OTHER, OTHER, OTHER, INVALID, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        UPPER, OTHER, UPPER, UPPER, UPPER, OTHER, UPPER, OTHER, UPPER, UPPER, LOWER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, INVALID, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, INVALID,
+    ])),
+    #[cfg(feature = "index-iso-8859-8")]
+    (all::ISO_8859_8 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, INVALID, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID, OTHER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, INVALID, INVALID, OTHER, OTHER, INVALID,
+    ])),
+    #[cfg(feature = "index-iso-8859-10")]
+    (all::ISO_8859_10 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-iso-8859-13")]
+    (all::ISO_8859_13 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER,
+        UPPER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER,
+        OTHER, LOWER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+    ])),
+    #[cfg(feature = "index-iso-8859-14")]
+    (all::ISO_8859_14 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, LOWER, OTHER, UPPER, LOWER, UPPER, OTHER, UPPER, OTHER,
+        UPPER, LOWER, UPPER, OTHER, OTHER, UPPER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, OTHER,
+        UPPER, LOWER, LOWER, LOWER, UPPER, LOWER, UPPER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-iso-8859-15")]
+    (all::ISO_8859_15 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER, LOWER, OTHER,
+        LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, LOWER, OTHER,
+        OTHER, LOWER, OTHER, LOWER, OTHER, UPPER, LOWER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-iso-8859-16")]
+    (all::ISO_8859_16 as EncodingRef, Model::SingleByte(&[
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, OTHER, UPPER, LOWER, UPPER, OTHER, OTHER, UPPER, OTHER, LOWER, OTHER,
+        UPPER, OTHER, UPPER, OTHER, LOWER, UPPER, OTHER, OTHER, UPPER, LOWER, UPPER, OTHER, OTHER,
+        OTHER, LOWER, LOWER, LOWER, OTHER, UPPER, LOWER, UPPER, LOWER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-koi8-r")]
+    (all::KOI8_R as EncodingRef, Model::SingleByte(&[
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+    ])),
+    #[cfg(feature = "index-koi8-u")]
+    (all::KOI8_U as EncodingRef, Model::SingleByte(&[
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, LOWER, OTHER, LOWER,
+        LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, LOWER, OTHER, OTHER, OTHER, OTHER, UPPER,
+        UPPER, OTHER, UPPER, UPPER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, UPPER, OTHER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+    ])),
+    #[cfg(feature = "index-macintosh")]
+    (all::MAC_ROMAN as EncodingRef, Model::SingleByte(&[
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, UPPER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, LOWER, OTHER, OTHER, OTHER, LOWER, OTHER, LOWER, LOWER, UPPER, LOWER, LOWER, OTHER,
+        OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, UPPER, UPPER,
+        UPPER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, UPPER, OTHER,
+        OTHER, OTHER, OTHER, LOWER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER,
+        LOWER, LETTER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LETTER,
+    ])),
+    #[cfg(feature = "index-windows-874")]
+    (all::WINDOWS_874 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, CONTROL,
+        CONTROL, OTHER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, OTHER, LETTER, LETTER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, INVALID, INVALID, INVALID, INVALID, OTHER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, INVALID, INVALID, INVALID, INVALID,
+    ])),
+    #[cfg(feature = "index-windows-1250")]
+    (all::WINDOWS_1250 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, CONTROL, OTHER, OTHER, OTHER, OTHER, CONTROL, OTHER, UPPER, OTHER,
+        UPPER, UPPER, UPPER, UPPER, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        CONTROL, OTHER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, OTHER, LETTER, OTHER, UPPER,
+        OTHER, UPPER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER,
+        OTHER, OTHER, LOWER, OTHER, LOWER, OTHER, OTHER, OTHER, LOWER, LOWER, OTHER, UPPER, OTHER,
+        LOWER, LOWER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        OTHER,
+    ])),
+    #[cfg(feature = "index-windows-1251")]
+    (all::WINDOWS_1251 as EncodingRef, Model::SingleByte(&[
+        UPPER, UPPER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER, UPPER,
+        UPPER, UPPER, UPPER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, CONTROL,
+        OTHER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, OTHER, UPPER, LOWER, UPPER, OTHER, UPPER,
+        OTHER, OTHER, UPPER, OTHER, UPPER, OTHER, OTHER, OTHER, OTHER, UPPER, OTHER, OTHER, UPPER,
+        LOWER, LOWER, LOWER, OTHER, OTHER, LOWER, OTHER, LOWER, OTHER, LOWER, UPPER, LOWER, LOWER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+    ])),
+    #[cfg(feature = "index-windows-1252")]
+    (all::WINDOWS_1252 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, UPPER, OTHER,
+        UPPER, CONTROL, UPPER, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, LOWER, OTHER, LOWER, CONTROL, LOWER, UPPER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER,
+    ])),
+    #[cfg(feature = "index-windows-1253")]
+    (all::WINDOWS_1253 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, CONTROL, OTHER, CONTROL, OTHER,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, CONTROL, OTHER, CONTROL, OTHER, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER,
+        UPPER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, INVALID, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, UPPER, UPPER, UPPER,
+        OTHER, UPPER, OTHER, UPPER, UPPER, LOWER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, INVALID, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, INVALID,
+    ])),
+    #[cfg(feature = "index-windows-1254")]
+    (all::WINDOWS_1254 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, UPPER, OTHER,
+        UPPER, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, LOWER, OTHER, LOWER, CONTROL, CONTROL, UPPER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER,
+    ])),
+    #[cfg(feature = "index-windows-1255")]
+    (all::WINDOWS_1255 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, CONTROL, OTHER,
+        CONTROL, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, CONTROL, OTHER, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, INVALID, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LETTER,
+        LETTER, LETTER, OTHER, OTHER, INVALID, INVALID, INVALID, INVALID, INVALID, INVALID,
+        INVALID, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, INVALID, INVALID, OTHER, OTHER, INVALID,
+    ])),
+    #[cfg(feature = "index-windows-1256")]
+    (all::WINDOWS_1256 as EncodingRef, Model::SingleByte(&[
+        OTHER, LETTER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, LETTER, OTHER,
+        UPPER, LETTER, LETTER, LETTER, LETTER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        LETTER, OTHER, LETTER, OTHER, LOWER, OTHER, OTHER, LETTER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LETTER, LETTER, OTHER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER, LETTER,
+        LETTER, LOWER, LETTER, LOWER, LETTER, LETTER, LETTER, LETTER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LETTER, LETTER, LOWER, LOWER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER,
+        OTHER, OTHER, LOWER, OTHER, LOWER, LOWER, OTHER, OTHER, LETTER,
+    ])),
+    #[cfg(feature = "index-windows-1257")]
+    (all::WINDOWS_1257 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, CONTROL, OTHER, OTHER, OTHER, OTHER, CONTROL, OTHER, CONTROL, OTHER,
+        CONTROL, OTHER, LETTER, OTHER, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        CONTROL, OTHER, CONTROL, OTHER, CONTROL, OTHER, OTHER, CONTROL, OTHER, INVALID, OTHER,
+        OTHER, OTHER, INVALID, OTHER, OTHER, UPPER, OTHER, UPPER, OTHER, OTHER, OTHER, OTHER,
+        UPPER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, LOWER, OTHER, LOWER, OTHER,
+        OTHER, OTHER, OTHER, LOWER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, OTHER,
+    ])),
+    #[cfg(feature = "index-windows-1258")]
+    (all::WINDOWS_1258 as EncodingRef, Model::SingleByte(&[
+        OTHER, CONTROL, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LETTER, OTHER, CONTROL, OTHER,
+        UPPER, CONTROL, CONTROL, CONTROL, CONTROL, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, CONTROL, OTHER, LOWER, CONTROL, CONTROL, UPPER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER,
+        OTHER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, UPPER, UPPER, UPPER, UPPER, OTHER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        OTHER, LOWER, LOWER, LOWER, LOWER, OTHER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+        LOWER,
+    ])),
+    #[cfg(feature = "index-x-mac-cyrillic")]
+    (all::MAC_CYRILLIC as EncodingRef, Model::SingleByte(&[
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, UPPER,
+        UPPER, UPPER, UPPER, UPPER, UPPER, UPPER, OTHER, OTHER, UPPER, OTHER, OTHER, OTHER, OTHER,
+        UPPER, OTHER, OTHER, OTHER, UPPER, LOWER, OTHER, UPPER, LOWER, OTHER, OTHER, OTHER, OTHER,
+        LOWER, LOWER, LOWER, UPPER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, UPPER, LOWER, LOWER,
+        UPPER, OTHER, OTHER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, LOWER, UPPER,
+        LOWER, LOWER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, OTHER, UPPER, LOWER, UPPER,
+        LOWER, OTHER, UPPER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER,
+        LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, LOWER, OTHER,
+    ])),
+    #[cfg(feature = "index-euc-kr")]
+    (all::WINDOWS_949 as EncodingRef, Model::MultiByte(&dfa_table::WINDOWS_949)),
+    #[cfg(feature = "index-big5")]
+    (all::BIG5_2003 as EncodingRef, Model::MultiByte(&dfa_table::BIG5_2003)),
+    #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+    (all::GB18030 as EncodingRef, Model::MultiByte(&dfa_table::GB18030)),
+    #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+    (all::EUC_JP as EncodingRef, Model::MultiByte(&dfa_table::EUC_JP)),
+    #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+    (all::WINDOWS_31J as EncodingRef, Model::MultiByte(&dfa_table::WINDOWS_31J)),
+    (all::UTF_8 as EncodingRef, Model::MultiByte(&dfa_table::UTF_8)),
+    #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+    (all::GBK as EncodingRef, Model::MultiByte(&dfa_table::GB18030)),
+];
+
+#[cfg(test)]
+mod tests {
+    use super::{MODELS, Model, INVALID};
+    use types::DecoderTrap;
+
+    #[test]
+    fn test_single_byte_classes() {
+        for &(encoding, ref model) in MODELS {
+            if let Model::SingleByte(classes) = *model {
+                for b in 0x80..0x100 {
+                    let valid = encoding.decode(&[b as u8], DecoderTrap::Strict).is_ok();
+                    assert_eq!(classes[b - 0x80] != INVALID, valid, "{} {:#x}", encoding.name(), b);
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,436 @@
+// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+// https://encoding.spec.whatwg.org/
+
+//! Table-driven validators for multi-byte encodings and UTF-8.
+//!
+//! Each validator is a DFA over byte classes, following the states of the corresponding decoder.
+//! A transition may additionally require the previous and current bytes to form a pair
+//! assigned in the index (checked with a per-lead-byte bitmap of trail bytes),
+//! or a GB 18030 four-byte sequence to be in the valid range.
+
+#![allow(dead_code)] // when every multi-byte index is disabled
+
+const REJECT: u8 = 0xff;
+const FOUR_BYTE_CHECK: u8 = 3;
+
+pub struct Dfa {
+    /// The byte class of each byte.
+    classes: [u8; 256],
+    nclasses: usize,
+    /// `transitions[state * nclasses + class]` is either `REJECT`
+    /// or the next state in the lower 3 bits and the check in the upper bits.
+    transitions: &'static [u8],
+    /// `trails[trailrows[check - 1][lead - 0x80]]` is a bitmap of assigned trail bytes.
+    trailrows: &'static [[u8; 128]],
+    trails: &'static [[u32; 8]],
+}
+
+impl Dfa {
+    /// Returns the next state after `input[i]` in given state, or `None` if it is invalid.
+    /// `input[..i]` should have been already fed, as the current sequence is checked against it.
+    #[inline(always)] // otherwise `valid_up_to` gets noticeably slower
+    pub fn next(&self, state: usize, input: &[u8], i: usize) -> Option<usize> {
+        let b = input[i];
+        let next = self.transitions[state * self.nclasses + self.classes[b as usize] as usize];
+        if next == REJECT { return None; }
+        match next >> 3 {
+            0 => {}
+            FOUR_BYTE_CHECK => {
+                let ptr = (input[i-3] as u32 - 0x81) * 12600 + (input[i-2] as u32 - 0x30) * 1260 +
+                          (input[i-1] as u32 - 0x81) * 10 + (b as u32 - 0x30);
+                if !(ptr <= 39419 || (189000 <= ptr && ptr <= 1237575)) { return None; }
+            }
+            check => {
+                let row = self.trailrows[check as usize - 1][(input[i-1] & 0x7f) as usize];
+                if (self.trails[row as usize][(b >> 5) as usize] >> (b & 31)) & 1 == 0 {
+                    return None;
+                }
+            }
+        }
+        Some((next & 7) as usize)
+    }
+
+    /// Returns the length of the longest prefix of `input` which the corresponding encoding
+    /// can decode without errors, not counting a trailing incomplete sequence.
+    ///
+    /// This only uses the generated byte-class and trail-byte tables,
+    /// so it is much faster than actually decoding `input`.
+    /// The `valid_up_to` methods of the CJK encodings are thin wrappers around this.
+    pub fn valid_up_to(&self, input: &[u8]) -> usize {
+        let mut state = 0;
+        let mut start = 0; // the start of the current sequence
+        for (i, &b) in input.iter().enumerate() {
+            if state == 0 {
+                if b < 0x80 { continue; }
+                start = i;
+            }
+            match self.next(state, input, i) {
+                Some(next) => { state = next; }
+                None => { return start; }
+            }
+        }
+        if state == 0 { input.len() } else { start }
+    }
+}
+
+#[cfg(feature = "index-euc-kr")]
+pub static WINDOWS_949: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
+    ],
+    nclasses: 3,
+    transitions: &[
+        0, 255, 1,
+        8, 8, 8,
+    ],
+    trailrows: &[
+        [
+            0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 3, 4, 5, 6, 1, 7, 8,
+            9, 10, 10, 10, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 11, 12, 12, 0, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+            12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+            12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
+            12, 12, 12, 12, 12, 12, 12, 12, 12, 0, 0,
+        ],
+    ],
+    trails: &[
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0xff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0x3ff07ff, 0x1fffffe, 0x1fffffe],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0x1f],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0xffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xfffeff5f, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0xfffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xffffffff, 0x7fffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0xffffffff, 0xfffe0003, 0x3ffff],
+        [0x0, 0x0, 0x7fffffe, 0x7fffffe, 0xfffffffe, 0x1, 0x0, 0x0],
+        [0x0, 0x0, 0x7fffe, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+    ],
+};
+
+#[cfg(feature = "index-big5")]
+pub static BIG5_2003: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 1,
+    ],
+    nclasses: 3,
+    transitions: &[
+        0, 255, 1,
+        8, 8, 8,
+    ],
+    trailrows: &[
+        [
+            0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 8, 8, 8, 8, 8, 8, 8,
+            8, 8, 8, 8, 8, 9, 8, 8, 10, 11, 12, 8, 8, 13, 8, 8, 8, 8, 8, 8, 8,
+            8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+            8, 8, 8, 8, 8, 8, 8, 14, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+            8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8,
+            8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 8, 0,
+        ],
+    ],
+    trails: &[
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fffffbf, 0x0, 0xfffffffe, 0xffffffff, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0x7fe, 0x0, 0x0],
+        [0x0, 0x0, 0xfffff3cb, 0x7fffffff, 0x0, 0xffe7787e, 0xffffffee, 0x7fffffff],
+        [0x0, 0x0, 0xfffffffb, 0x7fdffff7, 0x0, 0xfbfdf7fe, 0x9fffdeff, 0x7fdfffff],
+        [0x0, 0x0, 0xffefffff, 0x7fffffff, 0x0, 0xfffffffe, 0xdfffffff, 0x3fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0xffffffbe, 0xffffde3f, 0x7fffffdf],
+        [0x0, 0x0, 0xfffffffd, 0x7fffffff, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7ffffffd, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0xffffeffe, 0xffffffef, 0x7fefffff],
+        [0x0, 0x0, 0xffffbfff, 0x7fffffff, 0x0, 0xfffddffe, 0xfbfffefe, 0x7fff7bbf],
+        [0x0, 0x0, 0xfb6fffff, 0x7ffbfffb, 0x0, 0xffff5fde, 0xfff7ffff, 0x7ffffffd],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0xfffffffe, 0xffffffff, 0x3],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x0, 0x1e, 0xffffe000, 0x7fe3ffff],
+    ],
+};
+
+#[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+pub static GB18030: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3,
+    ],
+    nclasses: 4,
+    transitions: &[
+        0, 0, 1, 255,
+        8, 2, 8, 8,
+        255, 255, 3, 255,
+        255, 24, 255, 255,
+    ],
+    trailrows: &[
+        [
+            0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0,
+        ],
+    ],
+    trails: &[
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0xffffffff, 0xffffffff, 0xffffffff, 0x7fffffff],
+    ],
+};
+
+#[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+pub static EUC_JP: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 4, 4, 4, 4, 4, 4, 4,
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+        4, 4, 4, 4, 4, 4, 4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+        5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 1,
+    ],
+    nclasses: 6,
+    transitions: &[
+        0, 255, 1, 2, 3, 3,
+        255, 255, 255, 255, 0, 255,
+        255, 255, 255, 255, 4, 4,
+        8, 8, 8, 8, 8, 8,
+        16, 16, 16, 16, 16, 16,
+    ],
+    trailrows: &[
+        [
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 0, 0, 0,
+            0, 9, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 10, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 11, 0, 0, 0, 0, 1, 1, 1, 12, 0, 0, 0,
+        ],
+        [
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0, 0, 0, 14, 15, 0, 16, 17,
+            18, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+            19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        ],
+    ],
+    trails: &[
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0x7fffffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfc007ffe, 0xf001fc03, 0x43fc07ff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x3ff0000, 0x7fffffe, 0x7fffffe],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0xfffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0x7fffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x1fffffe, 0x1fffffe, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xfffe0003, 0x3ffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0x1, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x7ffffffe, 0x807fffff, 0x1fffffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xfffff, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x7e, 0x0, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0x7ffe7fff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x3ff8000, 0x1c, 0x3f800],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x1ffe16be],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x7ffc, 0x7ffc0000],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x1bb56, 0x1fffe, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfdfffffe, 0xffffffff, 0xffffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xeffffffe, 0xffffffef, 0xffffff],
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0xfffffffe, 0xffffffff, 0xf],
+    ],
+};
+
+#[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+pub static WINDOWS_31J: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2,
+    ],
+    nclasses: 3,
+    transitions: &[
+        0, 1, 255,
+        8, 8, 8,
+    ],
+    trailrows: &[
+        [
+            0, 1, 2, 3, 4, 0, 0, 5, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7,
+            7, 7, 8, 7, 7, 7, 7, 7, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+            0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 9, 0, 0, 7,
+            10, 0, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 11, 0, 0, 0,
+        ],
+    ],
+    trails: &[
+        [0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0xffffffff, 0xff001fff, 0xfc007f00, 0x10ff01ff],
+        [0x0, 0x0, 0x1ff8000, 0x3ffffff, 0x87fffffe, 0xffffffff, 0xffffffff, 0x3ffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0x807fffff, 0x807fffff, 0x7fffff, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fff0001, 0x8003ffff, 0x7fffffff, 0x0, 0x0],
+        [0x0, 0x0, 0xbfffffff, 0x403fffff, 0x1fffffff, 0x0, 0x0, 0x0],
+        [0x0, 0x0, 0x0, 0x0, 0x80000000, 0xffffffff, 0xffffffff, 0x1fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7ffff, 0x80000000, 0xffffffff, 0xffffffff, 0x1fffffff],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0xffffffff, 0x1f, 0x0, 0x0],
+        [0x0, 0x0, 0xffffffff, 0x7fffffff, 0xffffffff, 0xffffffff, 0xffffffff, 0x1fff9fff],
+        [0x0, 0x0, 0xfff, 0x0, 0x0, 0x0, 0x0, 0x0],
+    ],
+};
+
+pub static UTF_8: Dfa = Dfa {
+    classes: [
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3,
+        3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+        4, 4, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5,
+        5, 5, 5, 5, 5, 5, 5, 5, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 8, 7, 7,
+        9, 10, 10, 10, 11, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    ],
+    nclasses: 12,
+    transitions: &[
+        0, 255, 255, 255, 255, 1, 4, 2, 5, 6, 3, 7,
+        255, 0, 0, 0, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 1, 1, 1, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 2, 2, 2, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 255, 255, 1, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 1, 1, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 255, 2, 2, 255, 255, 255, 255, 255, 255, 255, 255,
+        255, 2, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255,
+    ],
+    trailrows: &[
+    ],
+    trails: &[
+    ],
+};
+
+#[cfg(test)]
+mod tests {
+    use super::Dfa;
+    #[allow(unused_imports)] use all;
+    use types::{Encoding, DecoderTrap};
+
+    // every sequence of `prefix` and two bytes should be validated as the decoder does
+    fn check_pairs(dfa: &Dfa, encoding: &Encoding, prefix: &[u8]) {
+        let mut buf = prefix.to_vec();
+        for lead in 0..0x100 {
+            for trail in 0..0x100 {
+                buf.truncate(prefix.len());
+                buf.push(lead as u8);
+                buf.push(trail as u8);
+                let valid = encoding.decode(&buf, DecoderTrap::Strict).is_ok();
+                assert_eq!(dfa.valid_up_to(&buf) == buf.len(), valid, "{:?}", buf);
+            }
+        }
+    }
+
+    #[test]
+    #[cfg(feature = "index-euc-kr")]
+    fn test_windows_949() {
+        check_pairs(&super::WINDOWS_949, all::WINDOWS_949, &[]);
+        assert_eq!(super::WINDOWS_949.valid_up_to(b"ab"), 2);
+        assert_eq!(super::WINDOWS_949.valid_up_to(b"ab\xff"), 2);
+    }
+
+    #[test]
+    #[cfg(feature = "index-big5")]
+    fn test_big5_2003() {
+        check_pairs(&super::BIG5_2003, all::BIG5_2003, &[]);
+        assert_eq!(super::BIG5_2003.valid_up_to(b"ab"), 2);
+        assert_eq!(super::BIG5_2003.valid_up_to(b"ab\xff"), 2);
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+    fn test_gb18030() {
+        check_pairs(&super::GB18030, all::GB18030, &[]);
+        // four-byte sequences, including the boundaries of valid ranges
+        for b1 in 0x81..0xff {
+            for b2 in 0x30..0x3a {
+                for &b3 in &[0x81, 0x9a, 0xa4, 0xfe] {
+                    for b4 in 0x2f..0x3b {
+                        let buf = [b1 as u8, b2 as u8, b3, b4 as u8];
+                        let valid = all::GB18030.decode(&buf, DecoderTrap::Strict).is_ok();
+                        assert_eq!(super::GB18030.valid_up_to(&buf) == 4, valid, "{:?}", buf);
+                    }
+                }
+            }
+        }
+        assert_eq!(super::GB18030.valid_up_to(b"ab"), 2);
+        assert_eq!(super::GB18030.valid_up_to(b"ab\xff"), 2);
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+    fn test_euc_jp() {
+        check_pairs(&super::EUC_JP, all::EUC_JP, &[]);
+        check_pairs(&super::EUC_JP, all::EUC_JP, &[0x8f]); // JIS X 0212
+        assert_eq!(super::EUC_JP.valid_up_to(b"ab"), 2);
+        assert_eq!(super::EUC_JP.valid_up_to(b"ab\xff"), 2);
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+    fn test_windows_31j() {
+        check_pairs(&super::WINDOWS_31J, all::WINDOWS_31J, &[]);
+        assert_eq!(super::WINDOWS_31J.valid_up_to(b"ab"), 2);
+        assert_eq!(super::WINDOWS_31J.valid_up_to(b"ab\xff"), 2);
+    }
+
+    #[test]
+    fn test_utf_8() {
+        check_pairs(&super::UTF_8, all::UTF_8, &[]);
+        // three- and four-byte sequences with restricted second bytes
+        for &prefix in &[&[0xe0][..], &[0xed], &[0xf0], &[0xf4], &[0xf1, 0x80]] {
+            check_pairs(&super::UTF_8, all::UTF_8, prefix);
+        }
+        assert_eq!(super::UTF_8.valid_up_to(b"ab"), 2);
+        assert_eq!(super::UTF_8.valid_up_to(b"ab\xff"), 2);
+    }
+}
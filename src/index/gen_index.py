@@ -7,7 +7,92 @@ import sys
 import os.path
 import re
 import heapq
+import bisect
 import argparse
+import json
+import time
+import unicodedata
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
+class Profiler(object):
+    # records the wall time and the peak memory of (nested) generation phases.
+    # the peak memory is the process-wide maximum RSS at the end of each phase,
+    # so it only grows; a phase responsible for a new peak shows a positive delta.
+
+    def __init__(self):
+        self.stack = [] # [name, wall time spent in children]
+        self.records = [] # (path, wall, self wall, peak rss in KB, rss delta in KB)
+
+    @staticmethod
+    def maxrss():
+        if resource is None: return 0
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss // 1024 if sys.platform == 'darwin' else rss # bytes in OS X, KB elsewhere
+
+    def __call__(self, name):
+        return ProfilerPhase(self, name)
+
+    def report(self, f, limit=25):
+        total = sum(wall for path, wall, _, _, _ in self.records if len(path) == 1) or 1e-9
+        print >>f, 'profile: %d phases, %.3fs total, peak RSS %d KB' % \
+                (len(self.records), total, self.maxrss())
+
+        print >>f, 'profile: top %d phases by wall time' % limit
+        print >>f, '%10s %6s %10s %10s %8s  %s' % ('wall', '%', 'self', 'peak KB', '+KB', 'phase')
+        for path, wall, selfwall, rss, rssdelta in \
+                sorted(self.records, key=lambda r: -r[1])[:limit]:
+            print >>f, '%9.3fs %5.1f%% %9.3fs %10d %8d  %s' % \
+                    (wall, 100 * wall / total, selfwall, rss, rssdelta, '/'.join(path))
+
+        # aggregate self times by the kind of phase (e.g. every `triebits=*`)
+        kinds = {}
+        for path, _, selfwall, _, _ in self.records:
+            kind = path[-1].partition('=')[0] if len(path) > 1 else '(index)'
+            count, wall = kinds.get(kind, (0, 0.0))
+            kinds[kind] = count + 1, wall + selfwall
+        print >>f, 'profile: self time by phase kind'
+        for kind, (count, wall) in sorted(kinds.items(), key=lambda (k, (c, w)): -w):
+            print >>f, '%9.3fs %5.1f%% %6dx  %s' % (wall, 100 * wall / total, count, kind)
+
+    def write_folded(self, f):
+        # the "folded stacks" format understood by flamegraph.pl and others,
+        # where the sample count is the self time in microseconds.
+        for path, _, selfwall, _, _ in self.records:
+            micros = int(selfwall * 1e6)
+            if micros > 0:
+                print >>f, '%s %d' % (';'.join(p.replace(' ', '_') for p in path), micros)
+
+class ProfilerPhase(object):
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.stack.append([self.name, 0.0])
+        self.rss = self.profiler.maxrss()
+        self.start = time.time()
+
+    def __exit__(self, *exc):
+        wall = time.time() - self.start
+        stack = self.profiler.stack
+        name, childwall = stack.pop()
+        if stack: stack[-1][1] += wall
+        path = tuple(n for n, _ in stack) + (name,)
+        rss = self.profiler.maxrss()
+        self.profiler.records.append((path, wall, wall - childwall, rss, rss - self.rss))
+
+class NoProfilerPhase(object):
+    def __enter__(self): pass
+    def __exit__(self, *exc): pass
+
+profiler = None # set by the --profile option
+
+def phase(name):
+    if profiler is None: return NoProfilerPhase()
+    return profiler(name)
 
 def open_index(path, comments):
     for line in open(path):
@@ -21,27 +106,39 @@ def open_index(path, comments):
         value = int(parts[1], 0)
         yield key, value
 
-def read_index(opts, crate, name, comments):
-    dirname = os.path.join(os.path.dirname(__file__), crate)
-    path = os.path.join(dirname, 'index-%s.txt' % name)
-    if os.path.isfile(path): return open_index(path, comments)
-
+def fetch_cached(opts, filename, url):
     try: os.mkdir(opts.cache_dir)
     except OSError: pass
-    cached_path = os.path.join(opts.cache_dir, '%s.txt' % name)
+    cached_path = os.path.join(opts.cache_dir, filename)
     if not opts.flush_cache and os.path.exists(cached_path):
         print >>sys.stderr, '(cached)',
     else:
         try:
-            urllib.urlretrieve('http://encoding.spec.whatwg.org/index-%s.txt' % name,
-                               cached_path)
+            urllib.urlretrieve(url, cached_path)
         except Exception:
             try: os.unlink(cached_path)
             except OSError: pass
             raise
+    return cached_path
+
+def read_index(opts, crate, name, comments):
+    dirname = os.path.join(os.path.dirname(__file__), crate)
+    path = os.path.join(dirname, 'index-%s.txt' % name)
+    if os.path.isfile(path): return open_index(path, comments)
 
+    cached_path = fetch_cached(opts, '%s.txt' % name,
+                               'http://encoding.spec.whatwg.org/index-%s.txt' % name)
     return open_index(cached_path, comments)
 
+def read_encodings(opts):
+    # returns a list of (name, labels) in the order of the Encoding Standard
+    cached_path = fetch_cached(opts, 'encodings.json',
+                               'http://encoding.spec.whatwg.org/encodings.json')
+    with open(cached_path) as f:
+        groups = json.load(f)
+    return [(encoding['name'], encoding['labels'])
+            for group in groups for encoding in group['encodings']]
+
 def mkdir_and_open(crate, name):
     dirname = os.path.join(os.path.dirname(__file__), crate)
     try:
@@ -80,6 +177,82 @@ def write_comma_separated(f, prefix, l, width=80):
     if buffered:
         print >>f, prefix + buffered.rstrip()
 
+# Integer tables are bit-packed into u32 words only when it saves this fraction of
+# the narrowest plain array, as every lookup then pays a division, a shift and a mask.
+MIN_PACKING_SAVING = 0.25
+
+# [bytes with the former fixed types, bytes with the narrowest types,
+#  bytes after bit-packing, number of bit-packed tables] of tables written by `write_int_table`
+int_table_stats = [0, 0, 0, 0]
+
+def narrowest_type(maxvalue):
+    for bits in (8, 16, 32, 64):
+        if maxvalue < 1 << bits:
+            return 'u%d' % bits, bits // 8
+
+def write_int_table(f, attrs, name, values, fixedsize):
+    # writes nonnegative integers either in the narrowest type or bit-packed into u32 words,
+    # where `attrs` is prepended and `fixedsize` is the element size of the former fixed type.
+    # returns the size and a function from the index expression to the value expression.
+    maxvalue = max(values)
+    bits = max(maxvalue.bit_length(), 1)
+    perword = 32 // bits
+    words = [0] * ((len(values) + perword - 1) // perword)
+    ty, size = narrowest_type(maxvalue)
+    int_table_stats[0] += fixedsize * len(values)
+    int_table_stats[1] += size * len(values)
+
+    if 4 * len(words) <= (1 - MIN_PACKING_SAVING) * size * len(values):
+        for i, v in enumerate(values):
+            words[i // perword] |= v << (i % perword * bits)
+        f.write(attrs + "const %s: &'static [u32] = &[\n" % name)
+        write_comma_separated(f, '    ', ['%d, ' % v for v in words])
+        print >>f, ']; // %d entries, %d %d-bit entries per word' % (len(values), perword, bits)
+        int_table_stats[2] += 4 * len(words)
+        int_table_stats[3] += 1
+        def access(i):
+            if not re.match(r'^\w+$', i): i = '(%s)' % i
+            return '((%s[%s / %d] >> (%s %% %d * %d)) & %#x)' % (name, i, perword, i, perword,
+                                                                bits, (1 << bits) - 1)
+        return 4 * len(words), access
+
+    f.write(attrs + "const %s: &'static [%s] = &[\n" % (name, ty))
+    write_comma_separated(f, '    ', ['%d, ' % v for v in values])
+    print >>f, ']; // %d entries' % len(values)
+    int_table_stats[2] += size * len(values)
+    return size * len(values), lambda i: '%s[%s]' % (name, i)
+
+OPTIMIZED_CFG = '#[cfg(not(feature = "no-optimized-legacy-encoding"))]\n'
+UNOPTIMIZED_CFG = '#[cfg(feature = "no-optimized-legacy-encoding")]\n'
+
+def mapping_hash(pairs):
+    # 64-bit FNV-1a over little endian u32 pairs; should match `MappingHash` in the tests crate
+    h = 0xcbf29ce484222325
+    for pair in sorted(pairs):
+        for v in pair:
+            for shift in (0, 8, 16, 24):
+                h = ((h ^ ((v >> shift) & 0xff)) * 0x100000001b3) & 0xffffffffffffffff
+    return h
+
+def write_golden(f, forward, backward):
+    # forward and backward are dicts for the expected mapping.
+    # the set of valid code points is run-length-encoded so that tests can
+    # check every valid code point without scanning 0..0x110000.
+    runs = []
+    next = 0
+    for code in sorted(backward):
+        if runs and code == next:
+            runs[-1] += 1
+        else:
+            runs += [code - next, 1]
+        next = code + 1
+    print >>f, '    golden = ['
+    print >>f, '        %#x, %#x, // forward & backward hash' % \
+            (mapping_hash(forward.items()), mapping_hash(backward.items()))
+    print >>f, '        // %d valid code points in %d runs' % (len(backward), len(runs) // 2)
+    write_comma_separated(f, '        ', ['%d, ' % v for v in runs])
+    print >>f, '    ]'
+
 def optimize_overlapping_blocks(blocks):
     # let's imagine that there are three blocks of size 8:
     #     [X,X,1,2,3,X,X,X], [4,X,X,5,X,X,X,X], [X,X,X,X,X,X,X,6]
@@ -167,58 +340,114 @@ def optimize_overlapping_blocks(blocks):
     return ret
 
 def make_minimal_trie(invdata, lowerlimit):
-    maxvalue = max(invdata) + 1
+    triebits, lower, uppers = make_minimal_shared_trie([invdata], lowerlimit)
+    return triebits, lower, uppers[0]
+
+def make_minimal_shared_trie(invdatas, lowerlimit):
+    # same to make_minimal_trie but builds one trie per mapping in `invdatas`,
+    # all sharing a single lower table. this is useful when the mappings
+    # mostly agree to each other, as only the differing blocks get duplicated.
+    maxvalue = max(max(invdata) for invdata in invdatas) + 1
     best = 0xffffffff
     besttrie = None
     for triebits in xrange(21):
-        blocks = []
-        upperidx = []
-        blockmap = {(None,) * (1<<triebits): -1}
-        for i in xrange(0, maxvalue, 1<<triebits):
-            blk = [invdata.get(j) for j in xrange(i, i + (1<<triebits))]
-            blockidx = blockmap.get(tuple(blk))
-            if blockidx is None:
-                blockidx = len(blocks)
-                blockmap[tuple(blk)] = blockidx
-                blocks.append(blk)
-            upperidx.append(blockidx)
-
-        lower = [None] * (1<<triebits)
-        uppermap = {-1: 0}
-        for idx, shift in optimize_overlapping_blocks(blocks):
-            blk = blocks[idx]
-            assert shift == 0 or lower[-shift:] == blk[:shift]
-            uppermap[idx] = len(lower) - shift
-            lower += blk[shift:]
-        upper = [uppermap[idx] for idx in upperidx]
-
-        if len(lower) < lowerlimit and best > len(lower) + len(upper):
-            best = len(lower) + len(upper)
-            besttrie = (triebits, lower, upper)
+        with phase('triebits=%d' % triebits):
+            blocks = []
+            upperidxs = []
+            blockmap = {(None,) * (1<<triebits): -1}
+            for invdata in invdatas:
+                upperidx = []
+                for i in xrange(0, maxvalue, 1<<triebits):
+                    blk = [invdata.get(j) for j in xrange(i, i + (1<<triebits))]
+                    blockidx = blockmap.get(tuple(blk))
+                    if blockidx is None:
+                        blockidx = len(blocks)
+                        blockmap[tuple(blk)] = blockidx
+                        blocks.append(blk)
+                    upperidx.append(blockidx)
+                upperidxs.append(upperidx)
+
+            lower = [None] * (1<<triebits)
+            uppermap = {-1: 0}
+            with phase('overlap'):
+                order = optimize_overlapping_blocks(blocks)
+            for idx, shift in order:
+                blk = blocks[idx]
+                assert shift == 0 or lower[-shift:] == blk[:shift]
+                uppermap[idx] = len(lower) - shift
+                lower += blk[shift:]
+            uppers = [[uppermap[idx] for idx in upperidx] for upperidx in upperidxs]
+
+            triesz = len(lower) + sum(len(upper) for upper in uppers)
+            if len(lower) < lowerlimit and best > triesz:
+                best = triesz
+                besttrie = (triebits, lower, uppers)
     return besttrie
 
 def make_minimal_search(data, invdata, premap, maxsearch):
     minkey = min(data)
     maxvalue = max(invdata) + 1
+
+    # the linear search returns the first key with given value, so values whose canonical key
+    # is preceded by a duplicate (e.g. Big5 duplicates where the later mapping is canonical)
+    # should always be encoded as a single pair put before any range.
+    firstkey = {}
+    for key, value in data.items():
+        if key < firstkey.get(value, 0x10000): firstkey[value] = key
+    pinned = set(j for j in invdata if firstkey[j] < premap(invdata[j]))
+
+    # buckets at the current level, mapping the bucket index k to pinned pairs and sorted keys
+    # for values in [k << searchbits, (k+1) << searchbits). only non-empty buckets are kept,
+    # and each level merges buckets 2k and 2k+1 of the level below to the bucket k.
+    buckets = {}
+    for j in invdata:
+        if j in pinned:
+            buckets[j] = [(0x8000 | (premap(invdata[j]) - minkey), j & 0xffff)], []
+        else:
+            buckets[j] = [], [premap(invdata[j])]
+
     best = 0xffffffff
     bestsearch = None
     for searchbits in xrange(21):
-        lower = []
-        upper = []
-        for i in xrange(0, maxvalue, 1<<searchbits):
-            v = sorted(premap(invdata[j]) for j in xrange(i, i+(1<<searchbits)) if j in invdata)
-            if v:
-                w = sorted((y - x, j) for j, (x, y) in enumerate(zip(v, v[1:])))
-                count = v[-1] - v[0]
-                block = [v[0], v[-1]]
-                for k, j in reversed(w):
-                    if count <= maxsearch: break
-                    assert v[j+1] - v[j] == k
-                    count -= k
-                    block.append(v[j])
-                    block.append(v[j+1])
-                block.sort()
-                assert minkey <= block[0] and block[-1] < 0x7fff
+        with phase('searchbits=%d' % searchbits):
+            if searchbits > 0:
+                merged = {}
+                for k in sorted(buckets):
+                    pins, v = buckets[k]
+                    if k >> 1 in merged:
+                        # two sorted runs are merged in the linear time
+                        prevpins, prevv = merged[k >> 1]
+                        merged[k >> 1] = prevpins + pins, sorted(prevv + v)
+                    else:
+                        merged[k >> 1] = pins, v
+                buckets = merged
+
+            lower = []
+            upper = []
+            nbuckets = (maxvalue + (1<<searchbits) - 1) >> searchbits
+            for k in xrange(nbuckets):
+                # give up early when this level can't be the best (ties go to later levels)
+                if len(lower) + 2 * (nbuckets + 1) > best: break
+                upper.append(len(lower))
+                if k not in buckets: continue
+                pins, v = buckets[k]
+                count = v[-1] - v[0] if v else 0
+                block = [v[0], v[-1]] if v else []
+                if count > maxsearch:
+                    # split at largest gaps (later ones first) until the search gets short enough
+                    w = [(x - y, -j) for j, (x, y) in enumerate(zip(v, v[1:]))]
+                    heapq.heapify(w)
+                    while count > maxsearch:
+                        if len(lower) + len(pins) + len(block) // 2 + 2 * (nbuckets + 1) > best: break
+                        gap, j = heapq.heappop(w)
+                        gap, j = -gap, -j
+                        assert v[j+1] - v[j] == gap
+                        count -= gap
+                        block.append(v[j])
+                        block.append(v[j+1])
+                    if count > maxsearch: break # given up
+                    block.sort()
+                assert not block or (minkey <= block[0] and block[-1] < 0x7fff)
                 # (s, e) when s < 0x8000 is a range [s, e)
                 # (s, e) when s >= 0x8000 is a single pair s.t. invdata[e] = s & 0x7fff
                 block = [(block[i] - minkey, block[i+1] - minkey + 1)
@@ -226,27 +455,113 @@ def make_minimal_search(data, invdata, premap, maxsearch):
                             (0x8000 | (block[i] - minkey), data[block[i]] & 0xffff)
                          for i in xrange(0, len(block), 2)]
                 assert all(block[i] != block[i+1] for i in xrange(len(block) - 1))
+                lower += pins + block
             else:
-                block = []
-            upper.append(len(lower))
-            lower += block
-        upper.append(len(lower))
-        if best >= len(lower) + 2 * len(upper):
-            best = len(lower) + 2 * len(upper)
-            bestsearch = (searchbits, lower, upper)
+                upper.append(len(lower))
+                if best >= len(lower) + 2 * len(upper):
+                    best = len(lower) + 2 * len(upper)
+                    bestsearch = (searchbits, lower, upper)
     return bestsearch
 
+def simulate_search(data, maxvalue, searchbits, searchlower, searchupper, fulllinearsearch):
+    # returns a mapping from values to keys as found by the search tables,
+    # which is what the no-optimized `backward` returns (before undoing the premapping).
+    minkey = min(data)
+    found = {}
+    if fulllinearsearch:
+        for key in sorted(data):
+            if data[key] <= maxvalue: found.setdefault(data[key], key)
+        return found
+    for value in set(data.values()):
+        offset = value >> searchbits
+        if offset + 1 >= len(searchupper): continue
+        for s, e in searchlower[searchupper[offset]:searchupper[offset+1]]:
+            if s >= 0x8000:
+                key = (s & 0x7fff) + minkey
+                if e == (value & 0xffff) and (data.get(key, 0) >> 16) == (value >> 16): break
+            else:
+                key = next((i + minkey for i in xrange(s, e) if data.get(i + minkey) == value), None)
+                if key is not None: break
+        else:
+            continue
+        found[value] = key
+    return found
+
+def make_eytzinger_search(invdata):
+    # lays out sorted (code point, pointer) pairs in the Eytzinger (BFS) order of
+    # the complete binary search tree, where the node k has children 2k and 2k+1.
+    # the key of each node is stored as an absolute difference from its parent's key,
+    # where the root is considered as the right child of the virtual node 0 with the key 0.
+    # differences get smaller as the tree deepens, so the nodes [1,k16) use u32,
+    # [k16,k8) use u16 and [k8,n] use u8 for them.
+    pairs = sorted(invdata.items())
+    n = len(pairs)
+    nodes = [(0, None)] * (n + 1)
+    inorder = iter(pairs)
+    def fill(k):
+        if k <= n:
+            fill(2 * k)
+            nodes[k] = next(inorder)
+            fill(2 * k + 1)
+    fill(1)
+
+    deltas = [0]
+    for k in xrange(1, n + 1):
+        delta = nodes[k][0] - nodes[k // 2][0]
+        assert (delta > 0) == (k % 2 == 1)
+        deltas.append(abs(delta))
+
+    levels = n.bit_length()
+    k16 = k8 = 1
+    for level in xrange(levels):
+        maxdelta = max(deltas[1 << level:2 << level])
+        if maxdelta >= 0x10000: k16 = 2 << level
+        if maxdelta >= 0x100: k8 = 2 << level
+    k8 = max(k8, k16)
+    return levels, deltas, k16, k8, [ptr for _, ptr in nodes]
+
+def compress_deltas(values):
+    # encodes u16 values as a list of LEB128 varint tokens, each of which is the zigzag-encoded
+    # (wrapping) difference from the previous value shifted left by `runbits`, plus the number
+    # of following values with the same difference. returns the shortest `(runbits, bytes)`.
+    deltas = []
+    prev = 0
+    for v in values:
+        delta = (v - prev) & 0xffff
+        deltas.append(delta << 1 if delta < 0x8000 else ((0x10000 - delta) << 1) - 1)
+        prev = v
+
+    best = None
+    for runbits in xrange(5):
+        encoded = []
+        i = 0
+        while i < len(deltas):
+            n = 1
+            while i + n < len(deltas) and deltas[i+n] == deltas[i] and n < (1 << runbits):
+                n += 1
+            token = (deltas[i] << runbits) | (n - 1)
+            while token >= 0x80:
+                encoded.append(0x80 | (token & 0x7f))
+                token >>= 7
+            encoded.append(token)
+            i += n
+        if best is None or len(encoded) < len(best[1]):
+            best = runbits, encoded
+    return best
+
 def generate_single_byte_index(opts, crate, name):
     data = [None] * 128
     invdata = {}
     comments = []
-    for key, value in read_index(opts, crate, name, comments):
-        assert 0 <= key < 128 and 0 <= value < 0xffff and data[key] is None and value not in invdata
-        data[key] = value
-        invdata[value] = key
+    with phase('parse'):
+        for key, value in read_index(opts, crate, name, comments):
+            assert 0 <= key < 128 and 0 <= value < 0xffff and data[key] is None and value not in invdata
+            data[key] = value
+            invdata[value] = key
 
     # generate a trie with a minimal amount of data
-    triebits, trielower, trieupper = make_minimal_trie(invdata, lowerlimit=0x10000)
+    with phase('trie'):
+        triebits, trielower, trieupper = make_minimal_trie(invdata, lowerlimit=0x10000)
 
     # generate a bitmap for quickly rejecting invalid chars even in the unoptimized setting
     bitlen = 0
@@ -268,7 +583,7 @@ def generate_single_byte_index(opts, crate, name):
         trielowersz=len(trielower),
         trieuppersz=len(trieupper),
     )
-    with mkdir_and_open(crate, name) as f:
+    with phase('write'), mkdir_and_open(crate, name) as f:
         write_header(f, name, comments)
         write_fmt(f, args, '''\
            |
@@ -295,19 +610,16 @@ def generate_single_byte_index(opts, crate, name):
         write_fmt(f, args, '''\
            |]; // {trielowersz} entries
            |
-           |#[cfg(not(feature = "no-optimized-legacy-encoding"))]
-           |const BACKWARD_TABLE_UPPER: &'static [u16] = &[
         ''')
-        write_comma_separated(f, '    ', ['%d, ' % v for v in trieupper])
+        uppersz, upper = write_int_table(f, OPTIMIZED_CFG, 'BACKWARD_TABLE_UPPER', trieupper, 2)
         write_fmt(f, args, '''\
-           |]; // {trieuppersz} entries
            |
            |/// Returns the index pointer for code point `code` in this index.
            |#[inline]
            |#[cfg(not(feature = "no-optimized-legacy-encoding"))]
            |pub fn backward(code: u32) -> u8 {{
            |    let offset = (code >> {triebits}) as usize;
-           |    let offset = if offset < {trieuppersz} {{BACKWARD_TABLE_UPPER[offset] as usize}} else {{0}};
+           |    let offset = if offset < {trieuppersz} {{''' + upper('offset') + ''' as usize}} else {{0}};
            |    BACKWARD_TABLE_LOWER[offset + ((code & {triemask}) as usize)]
            |}}
            |
@@ -324,17 +636,37 @@ def generate_single_byte_index(opts, crate, name):
            |
            |#[cfg(test)]
            |single_byte_tests! {{
+        ''')
+        write_golden(f, dict((key + 0x80, value) for key, value in enumerate(data) if value is not None),
+                     dict((value, key + 0x80) for value, key in invdata.items()))
+        write_fmt(f, args, '''\
            |}}
         ''')
 
     forwardsz = 2 * len(data)
-    backwardsz = len(trielower) + 2 * len(trieupper)
+    backwardsz = len(trielower) + uppersz
     return forwardsz, backwardsz, 0
 
+# Big5 pointers decoded to two code points, which are missing from the index.
+BIG5_SPECIAL_POINTERS = [1133, 1135, 1164, 1166]
+
+# Big5 pointers below this are HKSCS additions, which are never encoded.
+BIG5_HKSCS_LIMIT = (0xa1 - 0x81) * 157
+
+# Forward table regions rarely used in practice, which can be stored compressed and
+# expanded on the first access with `--compress-cold-tables`. Regions are given as
+# `[lo, hi)` in (premapped) pointers, where `None` stands for the table boundary,
+# and should be at either end of the table.
+COLD_REGIONS = {
+    'jis0212': (None, None), # only used by EUC-JP
+    'big5': (None, BIG5_HKSCS_LIMIT), # HKSCS additions
+    'gb18030': ((0xf8 - 0x81) * 190, None), # lead bytes F8-FE, mostly the user-defined area
+}
+
 def generate_multi_byte_index(opts, crate, name):
     # some indices need an additional function for efficient mapping.
     premap = lambda i: i
-    premapcode = ''
+    premapcode = premapbackcode = ''
     if not opts.no_premapping:
         if name == 'euc-kr':
             def premap(i):
@@ -380,6 +712,8 @@ def generate_multi_byte_index(opts, crate, name):
                |        (125 - 4) * (190 - 96) + r * (96 - 12) + (c - dc)
                |    }
                |}
+            ''')
+            premapbackcode = dedent('''\
                |
                |#[cfg(feature = "no-optimized-legacy-encoding")]
                |fn premap_backward(code: u16) -> u16 {
@@ -436,6 +770,8 @@ def generate_multi_byte_index(opts, crate, name):
                |        _ => code - 3160,
                |    }
                |}
+            ''')
+            premapbackcode = dedent('''\
                |
                |#[cfg(feature = "no-optimized-legacy-encoding")]
                |fn premap_backward(code: u16) -> u16 {
@@ -469,6 +805,8 @@ def generate_multi_byte_index(opts, crate, name):
                |        _ => code - 742,
                |    }
                |}
+            ''')
+            premapbackcode = dedent('''\
                |
                |#[cfg(feature = "no-optimized-legacy-encoding")]
                |fn premap_backward(code: u16) -> u16 {
@@ -483,34 +821,41 @@ def generate_multi_byte_index(opts, crate, name):
     data = {}        # key => value
     invdata = {}     # (the first) value => key, with some exceptions
     dups = []        # any value that is not mapped in invdata
-    rawdups = []     # same to dups but a literal Rust code
+    dupranges = []   # same to dups but inclusive ranges of keys
     comments = []    # the comments in the index file
     morebits = False # True if the mapping needs SIP
-    for key, value in read_index(opts, crate, name, comments):
-        assert 0 <= key < 0xffff and 0 <= value < 0x110000 and value != 0xffff and key not in data
-        if value >= 0x10000:
-            assert (value >> 16) == 2
-            morebits = True
-        data[key] = value
-        if value not in invdata:
-            invdata[value] = key
-        else:
-            dups.append(key)
+    with phase('parse'):
+        for key, value in read_index(opts, crate, name, comments):
+            assert 0 <= key < 0xffff and 0 <= value < 0x110000 and value != 0xffff and key not in data
+            if value >= 0x10000:
+                assert (value >> 16) == 2
+                morebits = True
+            data[key] = value
+            if value not in invdata:
+                invdata[value] = key
+            else:
+                dups.append(key)
 
     if name == 'big5':
         # Big5 has four two-letter forward mappings, we use special entries for them
-        specialidx = [1133, 1135, 1164, 1166]
+        specialidx = BIG5_SPECIAL_POINTERS
         assert all(key not in data for key in specialidx)
         assert all(value not in invdata for value in xrange(len(specialidx)))
         for value, key in enumerate(specialidx):
             data[key] = value
             dups.append(key) # no consistency testing for them
 
-        # and HKSCS additions are entirely missing from the backward mapping
-        hkscslimit = (0xa1 - 0x81) * 157
-        for value, key in invdata.items():
-            if key < hkscslimit: del invdata[value]
-        rawdups.append('0...%d' % (hkscslimit - 1)) # no consistency testing for them
+        # and HKSCS additions are entirely missing from the backward mapping,
+        # but code points also mapped from outside of HKSCS should still be encoded
+        invdata = {}
+        dups = []
+        for key, value in sorted(data.items()):
+            if key < BIG5_HKSCS_LIMIT: continue
+            if value not in invdata:
+                invdata[value] = key
+            else:
+                dups.append(key)
+        dupranges.append((0, BIG5_HKSCS_LIMIT - 1)) # no consistency testing for them
 
         # there are also some duplicate entries where the *later* mapping is canonical
         swappedcanon = [0x2550, 0x255E, 0x2561, 0x256A, 0x5341, 0x5345]
@@ -524,8 +869,6 @@ def generate_multi_byte_index(opts, crate, name):
             else:
                 dups.append(key)
 
-        dups = [i for i in dups if i >= hkscslimit] # cleanup
-
     # JIS X 0208 index has two ranges [8272,8836) and [8836,11280) to support two slightly
     # different encodings EUC-JP and Shift_JIS; the default backward function would favor
     # the former, so we need a separate mapping for the latter.
@@ -552,6 +895,14 @@ def generate_multi_byte_index(opts, crate, name):
             else:
                 remap.append(0xffff)
 
+        # the optimized backward mapping has a separate trie for shift_jis pointers,
+        # which shares most blocks with the ordinary trie.
+        invdataremapped = {}
+        for value, key in invdata.items():
+            if REMAP_MIN <= key <= REMAP_MAX: key = remap[key - REMAP_MIN]
+            invdataremapped[value] = key
+
+    origdata = data
     newdata = {}
     for key, value in data.items():
         key = premap(key)
@@ -560,16 +911,59 @@ def generate_multi_byte_index(opts, crate, name):
     data = newdata
 
     # generate a trie and search index with a minimal amount of data
-    triebits, trielower, trieupper = make_minimal_trie(invdata, lowerlimit=0x10000)
-    searchbits, searchlower, searchupper = make_minimal_search(data, invdata, premap,
-            maxsearch=opts.max_backward_search_multibyte)
+    with phase('trie'):
+        if remap:
+            triebits, trielower, (trieupper, trieupperremapped) = \
+                    make_minimal_shared_trie([invdata, invdataremapped], lowerlimit=0x10000)
+        else:
+            triebits, trielower, trieupper = make_minimal_trie(invdata, lowerlimit=0x10000)
+    with phase('search'):
+        searchbits, searchlower, searchupper = make_minimal_search(data, invdata, premap,
+                maxsearch=opts.max_backward_search_multibyte)
     # if the search degenerated to the full linear search, use a special code for them
     fulllinearsearch = (searchupper == [0, 1])
 
     minkey = min(data)
     maxkey = max(data) + 1
+
+    # optionally split a rarely used region off the forward table and compress it,
+    # as long as it pays off (HKSCS additions for example are nearly random)
+    cold = None
+    hotlo, hothi = 0, maxkey - minkey
+    if opts.compress_cold_tables and name in COLD_REGIONS:
+        lo, hi = COLD_REGIONS[name]
+        lo = minkey if lo is None else max(lo, minkey)
+        hi = maxkey if hi is None else min(hi, maxkey)
+        assert lo == minkey or hi == maxkey
+        coldvalues = [data[key] & 0xffff if key in data else 0xffff for key in xrange(lo, hi)]
+        runbits, compressed = compress_deltas(coldvalues)
+        if len(compressed) < 2 * len(coldvalues):
+            cold = lo - minkey, hi - minkey, runbits, compressed
+            if lo == minkey:
+                hotlo = hi - minkey
+            else:
+                hothi = lo - minkey
+    forwardentry = 'forward_entry(%s)' if cold else 'FORWARD_TABLE[%s]'
+
+    # alternatively, sorted pairs can be searched in O(log n) time in the worst case.
+    # they are much larger than the search tables for the current indices though,
+    # so they are only used when they are no worse in both size and the worst case.
+    with phase('eytzinger'):
+        eytzlevels, eytzdeltas, eytzk16, eytzk8, eytzptrs = make_eytzinger_search(invdata)
+    eytzsz = 4 * eytzk16 + 2 * (eytzk8 - eytzk16) + (len(eytzdeltas) - eytzk8) + 2 * len(eytzptrs)
+    if fulllinearsearch:
+        searchworst = maxkey - minkey
+    else:
+        searchworst = max(sum(1 if lo >= 0x8000 else hi - lo for lo, hi in searchlower[start:end])
+                          for start, end in zip(searchupper, searchupper[1:]))
+    if opts.backward_search == 'auto':
+        searchsz = 4 * len(searchlower) + 2 * len(searchupper)
+        useeytzinger = eytzsz <= searchsz and eytzlevels < searchworst
+    else:
+        useeytzinger = (opts.backward_search == 'eytzinger')
+
     args = dict(
-        premapcode=premapcode,
+        premapcode=premapcode + ('' if useeytzinger else premapbackcode),
         maxvalue=max(invdata),
         dataoff=minkey,
         datasz=maxkey-minkey,
@@ -583,27 +977,109 @@ def generate_multi_byte_index(opts, crate, name):
         searchlowersz=len(searchlower),
         searchuppersz=len(searchupper),
         searchupperszm1=len(searchupper)-1,
+        eytzsz=len(eytzptrs)-1,
+        eytzk16=eytzk16,
+        eytzk8=eytzk8,
     )
+    if cold:
+        coldlo, coldhi, runbits, compressed = cold
+        args.update(
+            hotsz=hothi-hotlo,
+            coldlo=coldlo,
+            coldhi=coldhi,
+            coldsz=coldhi-coldlo,
+            compressedsz=len(compressed),
+            runbits=runbits,
+            runmask=(1<<runbits)-1,
+        )
     if remap:
         args.update(
             remapsz=len(remap),
             remapmin=REMAP_MIN,
             remapmax=REMAP_MAX,
         )
-    with mkdir_and_open(crate, name) as f:
+    with phase('write'), mkdir_and_open(crate, name) as f:
         write_header(f, name, comments)
+        write_fmt(f, args, cold, '''\
+           |
+           |use std::slice;
+           |use std::sync::Once;
+        ''')
         write_fmt(f, args, '''\
            |
            |#[allow(dead_code)] const X: u16 = 0xffff;
            |{premapcode}
-           |const FORWARD_TABLE: &'static [u16] = &[
-        ''')
-        write_comma_separated(f, '    ',
-            ['%s, ' % (data[key] & 0xffff if key in data else 'X')
-             for key in xrange(minkey, maxkey)])
-        write_fmt(f, args, '''\
-           |]; // {datasz} entries
         ''')
+        if hothi > hotlo:
+            write_fmt(f, args, '''\
+               |const FORWARD_TABLE: &'static [u16] = &[
+            ''')
+            write_comma_separated(f, '    ',
+                ['%s, ' % (data[key] & 0xffff if key in data else 'X')
+                 for key in xrange(minkey + hotlo, minkey + hothi)])
+            write_fmt(f, args, '''\
+               |]; // {n} entries
+            ''', n=hothi-hotlo)
+        if cold:
+            write_fmt(f, args, hothi > hotlo, '''\
+               |
+            ''')
+            write_fmt(f, args, '''\
+               |/// Entries [{coldlo}, {coldhi}) of the forward table as LEB128 varints, each of which is
+               |/// a zigzag-encoded difference from the previous entry shifted left by {runbits} bits
+               |/// plus the number of following entries with the same difference.
+               |const FORWARD_TABLE_COLD: &'static [u8] = &[
+            ''')
+            write_comma_separated(f, '    ', ['%d, ' % v for v in compressed])
+            write_fmt(f, args, '''\
+               |]; // {compressedsz} bytes, {coldsz} entries
+               |
+               |/// Returns `FORWARD_TABLE_COLD` expanded on the first call.
+               |fn forward_table_cold() -> &'static [u16] {{
+               |    static EXPAND: Once = Once::new();
+               |    static mut TABLE: *const u16 = 0 as *const u16;
+               |    EXPAND.call_once(|| {{
+               |        let mut table = Vec::with_capacity({coldsz});
+               |        let mut value = 0u16;
+               |        let mut token = 0u32;
+               |        let mut shift = 0;
+               |        for &b in FORWARD_TABLE_COLD {{
+               |            token |= ((b & 0x7f) as u32) << shift;
+               |            shift += 7;
+               |            if b & 0x80 != 0 {{ continue; }}
+               |            let zigzag = (token >> {runbits}) as u16;
+               |            let delta = (zigzag >> 1) ^ 0u16.wrapping_sub(zigzag & 1);
+               |            for _ in 0..(token & {runmask}) + 1 {{
+               |                value = value.wrapping_add(delta);
+               |                table.push(value);
+               |            }}
+               |            token = 0;
+               |            shift = 0;
+               |        }}
+               |        assert_eq!(table.len(), {coldsz});
+               |        unsafe {{ TABLE = Box::into_raw(table.into_boxed_slice()) as *const u16; }}
+               |    }});
+               |    unsafe {{ slice::from_raw_parts(TABLE, {coldsz}) }}
+               |}}
+               |
+               |#[inline]
+               |fn forward_entry(code: usize) -> u16 {{
+            ''')
+            if hothi == hotlo:
+                write_fmt(f, args, '''\
+                   |    forward_table_cold()[code]
+                ''')
+            elif coldlo == 0:
+                write_fmt(f, args, '''\
+                   |    if code < {coldhi} {{ forward_table_cold()[code] }} else {{ FORWARD_TABLE[code - {coldhi}] }}
+                ''')
+            else:
+                write_fmt(f, args, '''\
+                   |    if code < {coldlo} {{ FORWARD_TABLE[code] }} else {{ forward_table_cold()[code - {coldlo}] }}
+                ''')
+            write_fmt(f, args, '''\
+               |}}
+            ''')
         if morebits:
             bits = []
             for i in xrange(minkey, maxkey, 32):
@@ -638,9 +1114,9 @@ def generate_multi_byte_index(opts, crate, name):
            |    if code < {datasz} {{
         ''')
         write_fmt(f, args, morebits, '''\
-           |        (FORWARD_TABLE[code] as u32) | (((FORWARD_TABLE_MORE[code >> 5] >> (code & 31)) & 1) << 17)
+           |        (''' + (forwardentry % 'code') + ''' as u32) | (((FORWARD_TABLE_MORE[code >> 5] >> (code & 31)) & 1) << 17)
         ''', '''\
-           |        FORWARD_TABLE[code] as u32
+           |        ''' + (forwardentry % 'code') + ''' as u32
         ''')
         write_fmt(f, args, '''\
            |    }} else {{
@@ -656,14 +1132,36 @@ def generate_multi_byte_index(opts, crate, name):
         write_fmt(f, args, '''\
            |]; // {trielowersz} entries
            |
-           |#[cfg(not(feature = "no-optimized-legacy-encoding"))]
-           |const BACKWARD_TABLE_UPPER: &'static [u16] = &[
         ''')
-        write_comma_separated(f, '    ', ['%d, ' % v for v in trieupper])
-        write_fmt(f, args, '''\
-           |]; // {trieuppersz} entries
-        ''')
-        if not fulllinearsearch:
+        uppersz, upper = write_int_table(f, OPTIMIZED_CFG, 'BACKWARD_TABLE_UPPER', trieupper, 2)
+        if remap:
+            write_fmt(f, args, '''\
+               |
+            ''')
+            remappedsz, upperremapped = write_int_table(f, OPTIMIZED_CFG,
+                    'BACKWARD_TABLE_UPPER_REMAPPED', trieupperremapped, 2)
+        if useeytzinger:
+            for bits, deltas in [(32, eytzdeltas[:eytzk16]), (16, eytzdeltas[eytzk16:eytzk8]),
+                                 (8, eytzdeltas[eytzk8:])]:
+                write_fmt(f, args, '''\
+                   |
+                   |#[cfg(feature = "no-optimized-legacy-encoding")]
+                   |const BACKWARD_EYTZINGER_DELTAS{bits}: &'static [u{bits}] = &[
+                ''', bits=bits)
+                write_comma_separated(f, '    ', ['%d, ' % v for v in deltas])
+                write_fmt(f, args, '''\
+                   |]; // {n} entries
+                ''', n=len(deltas))
+            write_fmt(f, args, '''\
+               |
+               |#[cfg(feature = "no-optimized-legacy-encoding")]
+               |const BACKWARD_EYTZINGER_POINTERS: &'static [u16] = &[
+            ''')
+            write_comma_separated(f, '    ', ['%s, ' % ('X' if v is None else v) for v in eytzptrs])
+            write_fmt(f, args, '''\
+               |]; // {n} entries
+            ''', n=len(eytzptrs))
+        elif not fulllinearsearch:
             write_fmt(f, args, '''\
                |
                |#[cfg(feature = "no-optimized-legacy-encoding")]
@@ -674,16 +1172,13 @@ def generate_multi_byte_index(opts, crate, name):
             write_fmt(f, args, '''\
                |]; // {searchlowersz} entries
                |
-               |#[cfg(feature = "no-optimized-legacy-encoding")]
-               |const BACKWARD_SEARCH_UPPER: &'static [u16] = &[
-            ''')
-            write_comma_separated(f, '    ', ['%d, ' % v for v in searchupper])
-            write_fmt(f, args, '''\
-               |]; // {searchuppersz} entries
             ''')
+            searchuppersz, searchupperat = write_int_table(f, UNOPTIMIZED_CFG,
+                    'BACKWARD_SEARCH_UPPER', searchupper, 2)
         if remap:
             write_fmt(f, args, '''\
                |
+               |#[cfg(feature = "no-optimized-legacy-encoding")]
                |const BACKWARD_TABLE_REMAPPED: &'static [u16] = &[
             ''')
             write_comma_separated(f, '    ', ['%d, ' % v for v in remap])
@@ -697,7 +1192,7 @@ def generate_multi_byte_index(opts, crate, name):
            |#[cfg(not(feature = "no-optimized-legacy-encoding"))]
            |pub fn backward(code: u32) -> u16 {{
            |    let offset = (code >> {triebits}) as usize;
-           |    let offset = if offset < {trieuppersz} {{BACKWARD_TABLE_UPPER[offset] as usize}} else {{0}};
+           |    let offset = if offset < {trieuppersz} {{''' + upper('offset') + ''' as usize}} else {{0}};
            |    // BACKWARD_TABLE_LOWER stores the actual (pre-mapped) value
            |    // so we don't have to call premap_backward here.
            |    BACKWARD_TABLE_LOWER[offset + ((code & {triemask}) as usize)]
@@ -706,60 +1201,97 @@ def generate_multi_byte_index(opts, crate, name):
            |/// Returns the index pointer for code point `code` in this index.
            |#[cfg(feature = "no-optimized-legacy-encoding")]
            |pub fn backward(code: u32) -> u16 {{
-           |    // avoid mistaking a placeholder for the actual value
-           |    if code == X as u32 {{ return 0xffff; }}
-           |    let codelo = (code & 0xffff) as u16;
         ''')
-        retexpr = ('premap_backward(%s)' if premapcode else '%s') % ('(%s) + {dataoff}' if minkey != 0 else '%s')
-        if morebits:
+        if useeytzinger:
             write_fmt(f, args, '''\
-               |    let codehi = code >> 16;
-               |    #[inline] fn verify_and_map(codehi: u32, i: u16) -> Option<u16> {{
-               |        let hi = ((FORWARD_TABLE_MORE[i as usize >> 5] >> (i & 31)) & 1) << 1;
-               |        if hi != codehi {{ return None; }}
-               |        Some(''' + (retexpr % 'i') + ''')
+               |    // sorted (code point, pointer) pairs in the Eytzinger (BFS) order, where the node k
+               |    // has children 2k and 2k+1 and its key is stored as a difference from its parent's key.
+               |    let mut k = 1;
+               |    let mut key = 0;
+               |    let mut found = 0;
+               |    while k <= {eytzsz} {{
+               |        let delta = if k < {eytzk16} {{
+               |            BACKWARD_EYTZINGER_DELTAS32[k]
+               |        }} else if k < {eytzk8} {{
+               |            BACKWARD_EYTZINGER_DELTAS16[k - {eytzk16}] as u32
+               |        }} else {{
+               |            BACKWARD_EYTZINGER_DELTAS8[k - {eytzk8}] as u32
+               |        }};
+               |        key = if k & 1 != 0 {{ key + delta }} else {{ key - delta }};
+               |        if key == code {{ found = k; }}
+               |        k = 2 * k + (key < code) as usize;
                |    }}
+               |    BACKWARD_EYTZINGER_POINTERS[found]
+               |}}
             ''')
-            retifcorrect = 'if let Some(i_) = verify_and_map(codehi, %s) {{ return i_; }}'
         else:
-            retifcorrect = 'return %s;' % (retexpr % '%s')
-        write_fmt(f, args, not fulllinearsearch, '''\
-           |    let offset = (code >> {searchbits}) as usize;
-           |    let (start, end) = if offset < {searchupperszm1} {{
-           |        (BACKWARD_SEARCH_UPPER[offset], BACKWARD_SEARCH_UPPER[offset+1])
-           |    }} else {{
-           |        (0, 0)
-           |    }};
-           |    for &(s, e) in &BACKWARD_SEARCH_LOWER[(start as usize)..(end as usize)] {{
-           |        if s >= 0x8000 {{
-           |            if e == codelo {{
-           |                ''' + (retifcorrect % 's & 0x7fff') + '''
-           |            }}
-           |        }} else {{
-           |            for i in s..e {{
-           |                if FORWARD_TABLE[i as usize] == codelo {{
-           |                    ''' + (retifcorrect % 'i') + '''
-           |                }}
-           |            }}
-           |        }}
-           |    }}
-        ''', '''\
-           |    if code <= {maxvalue} {{
-           |        for (i, &v) in FORWARD_TABLE.iter().enumerate() {{
-           |            if v == codelo {{
-           |                ''' + (retifcorrect % 'i as u16') + '''
-           |            }}
-           |        }}
-           |    }}
-        ''')
-        write_fmt(f, args, '''\
-           |    X
-           |}}
-        ''')
+            write_fmt(f, args, '''\
+               |    // avoid mistaking a placeholder for the actual value
+               |    if code == X as u32 {{ return 0xffff; }}
+               |    let codelo = (code & 0xffff) as u16;
+            ''')
+            retexpr = ('premap_backward(%s)' if premapcode else '%s') % ('(%s) + {dataoff}' if minkey != 0 else '%s')
+            if morebits:
+                write_fmt(f, args, '''\
+                   |    let codehi = code >> 16;
+                   |    #[inline] fn verify_and_map(codehi: u32, i: u16) -> Option<u16> {{
+                   |        let hi = ((FORWARD_TABLE_MORE[i as usize >> 5] >> (i & 31)) & 1) << 1;
+                   |        if hi != codehi {{ return None; }}
+                   |        Some(''' + (retexpr % 'i') + ''')
+                   |    }}
+                ''')
+                retifcorrect = 'if let Some(i_) = verify_and_map(codehi, %s) {{ return i_; }}'
+            else:
+                retifcorrect = 'return %s;' % (retexpr % '%s')
+            searchrange = '' if fulllinearsearch else \
+                    '(%s, %s)' % (searchupperat('offset'), searchupperat('offset+1'))
+            write_fmt(f, args, not fulllinearsearch, '''\
+               |    let offset = (code >> {searchbits}) as usize;
+               |    let (start, end) = if offset < {searchupperszm1} {{
+               |        ''' + searchrange + '''
+               |    }} else {{
+               |        (0, 0)
+               |    }};
+               |    for &(s, e) in &BACKWARD_SEARCH_LOWER[(start as usize)..(end as usize)] {{
+               |        if s >= 0x8000 {{
+               |            if e == codelo {{
+               |                ''' + (retifcorrect % 's & 0x7fff') + '''
+               |            }}
+               |        }} else {{
+               |            for i in s..e {{
+               |                if ''' + (forwardentry % 'i as usize') + ''' == codelo {{
+               |                    ''' + (retifcorrect % 'i') + '''
+               |                }}
+               |            }}
+               |        }}
+               |    }}
+            ''', '''\
+               |    if code <= {maxvalue} {{
+               |        for (i, ''' + ('v) in (0..{datasz}).map(forward_entry)' if cold else '&v) in FORWARD_TABLE.iter()') + '''.enumerate() {{
+               |            if v == codelo {{
+               |                ''' + (retifcorrect % 'i as u16') + '''
+               |            }}
+               |        }}
+               |    }}
+            ''')
+            write_fmt(f, args, '''\
+               |    X
+               |}}
+            ''')
         write_fmt(f, args, name == 'jis0208', '''\
            |
            |/// Returns the index shift_jis pointer for code point `code`.
            |#[inline]
+           |#[cfg(not(feature = "no-optimized-legacy-encoding"))]
+           |pub fn backward_remapped(code: u32) -> u16 {{
+           |    let offset = (code >> {triebits}) as usize;
+           |    let offset = if offset < {trieuppersz} {{''' + (upperremapped('offset') if remap else '') + ''' as usize}} else {{0}};
+           |    BACKWARD_TABLE_LOWER[offset + ((code & {triemask}) as usize)]
+           |}}
+           |
+           |/// Returns the index shift_jis pointer for code point `code`.
+           |#[inline]
+           |#[cfg(feature = "no-optimized-legacy-encoding")]
            |pub fn backward_remapped(code: u32) -> u16 {{
            |    let value = backward(code);
            |    if {remapmin} <= value && value <= {remapmax} {{
@@ -769,52 +1301,139 @@ def generate_multi_byte_index(opts, crate, name):
            |    }}
            |}}
         ''')
-        write_fmt(f, args, '''\
-           |
-           |#[cfg(test)]
-           |multi_byte_tests! {{
-        ''')
-        write_fmt(f, args, remap, '''\
-           |    remap = [{remapmin}, {remapmax}],
-        ''')
-        if dups or rawdups:
-            write_fmt(f, args, '''\
-               |    dups = [
-            ''')
-            write_comma_separated(f, '        ', ['%s, ' % v for v in rawdups] + ['%d, ' % v for v in sorted(dups)])
+        # the no-optimized backward mapping searches the forward table and returns the first
+        # pointer found, which may differ from the optimized one; each gets its own tests then.
+        tests = [('test', dups, invdata)]
+        if not useeytzinger:
+            found = simulate_search(data, max(invdata), searchbits, searchlower, searchupper, fulllinearsearch)
+            unpremap = dict((premap(key), key) for key in origdata)
+            foundinvdata = dict((value, unpremap[key]) for value, key in found.items())
+            if foundinvdata != invdata:
+                dupset = set(dups)
+                for lo, hi in dupranges: dupset.update(xrange(lo, hi + 1))
+                founddups = dups + [key for key, value in origdata.items()
+                                    if foundinvdata.get(value) != key and key not in dupset]
+                tests = [('all(test, not(feature = "no-optimized-legacy-encoding"))', dups, invdata),
+                         ('all(test, feature = "no-optimized-legacy-encoding")', founddups, foundinvdata)]
+        for testcfg, testdups, testinvdata in tests:
             write_fmt(f, args, '''\
-               |    ]
+               |
+               |#[cfg({testcfg})]
+               |multi_byte_tests! {{
+            ''', testcfg=testcfg)
+            write_fmt(f, args, remap, '''\
+               |    remap = [{remapmin}, {remapmax}],
             ''')
-        else:
+            if testdups or dupranges:
+                write_fmt(f, args, '''\
+                   |    dups = [
+                ''')
+                write_comma_separated(f, '        ', ['%d...%d, ' % v for v in dupranges] +
+                                                     ['%d, ' % v for v in sorted(testdups)])
+                write_fmt(f, args, '''\
+                   |    ],
+                ''')
+            else:
+                write_fmt(f, args, '''\
+                   |    dups = [],
+                ''')
+            write_golden(f, origdata, testinvdata)
             write_fmt(f, args, '''\
-               |    dups = []
+               |}}
             ''')
-        write_fmt(f, args, '''\
-           |}}
-        ''')
 
-    forwardsz = 2 * (maxkey - minkey)
-    backwardsz = 2 * len(trielower) + 2 * len(trieupper)
-    backwardszslow = 2 * len(searchlower) + 4 * len(searchupper)
+    forwardsz = 2 * (hothi - hotlo) + (len(cold[3]) if cold else 0)
+    backwardsz = 2 * len(trielower) + uppersz
+    if useeytzinger:
+        backwardszslow = eytzsz
+    elif fulllinearsearch:
+        backwardszslow = 0
+    else:
+        backwardszslow = 4 * len(searchlower) + searchuppersz
     backwardmore = 0
     if morebits: backwardmore += 4 * ((maxkey - minkey + 31) // 32)
-    if remap: backwardmore += 2 * len(remap)
+    if remap:
+        backwardsz += remappedsz
+        backwardszslow += 2 * len(remap)
     return forwardsz, backwardsz + backwardmore, backwardszslow + backwardmore
 
+# The number of comparisons after the bucket lookup in the range index, and the maximum depth
+# of child buckets, which together decide the shape and size of the bucket tree.
+MAX_BUCKET_SCAN = 2
+MAX_BUCKET_DEPTH = 2
+
+def make_bucket_tree(keys, limit):
+    # maps pointers in [0, limit) to the index of the range, given sorted range starts `keys`.
+    # top-level buckets of `2**topshift` pointers, and child buckets of a quarter, an eighth etc.,
+    # each holds either the index of the range containing its first pointer or (if there are
+    # more than MAX_BUCKET_SCAN ranges starting inside) `0x8000 | offset` to `2**fanoutbits`
+    # child buckets. returns the smallest `(topshift, fanoutbits, depth, entries)`.
+    def nstarts(lo, shift):
+        return bisect.bisect_right(keys, lo + (1 << shift) - 1) - bisect.bisect_right(keys, lo)
+
+    best = None
+    for topshift in xrange(1, 17):
+        for fanoutbits in xrange(1, 5):
+            entries = []
+            def fill(lo, shift, n, depth):
+                start = len(entries)
+                entries.extend([None] * n)
+                maxdepth = depth
+                for j in xrange(n):
+                    ptr = lo + (j << shift)
+                    if ptr >= limit:
+                        entries[start + j] = 0
+                    elif nstarts(ptr, shift) <= MAX_BUCKET_SCAN:
+                        entries[start + j] = bisect.bisect_right(keys, ptr) - 1
+                    elif shift < fanoutbits or depth == MAX_BUCKET_DEPTH:
+                        return None
+                    else:
+                        entries[start + j] = 0x8000 | len(entries)
+                        childdepth = fill(ptr, shift - fanoutbits, 1 << fanoutbits, depth + 1)
+                        if childdepth is None: return None
+                        maxdepth = max(maxdepth, childdepth)
+                return maxdepth
+            depth = fill(0, topshift, ((limit - 1) >> topshift) + 1, 0)
+            if depth is None: continue
+            assert len(entries) <= 0x8000
+            if best is None or len(entries) < len(best[3]):
+                best = topshift, fanoutbits, depth, entries
+    return best
+
 def generate_multi_byte_range_lbound_index(opts, crate, name):
     data = []
     comments = []
-    for key, value in read_index(opts, crate, name, comments):
-        data.append((key, value))
+    with phase('parse'):
+        for key, value in read_index(opts, crate, name, comments):
+            data.append((key, value))
     assert data and data == sorted(data)
+    assert [value for key, value in data] == sorted(value for key, value in data)
 
     minkey, minvalue = data[0]
     maxkey, maxvalue = data[-1]
-    if data[0] != (0, 0):
+    # the last range is open-ended in both directions and handled separately,
+    # so that tables only cover the remaining ranges with a narrower type
+    data.pop()
+    if not data or data[0] != (0, 0):
         data.insert(0, (0, 0))
     maxlog2 = 0
     while 2**(maxlog2 + 1) <= len(data):
         maxlog2 += 1
+    tabletype, tablesize = narrowest_type(max(max(data)))
+    int_table_stats[0] += 2 * 4 * len(data)
+    int_table_stats[1] += 2 * tablesize * len(data)
+    int_table_stats[2] += 2 * tablesize * len(data)
+
+    # the forward direction (used by every four-byte sequence) goes through a bucket tree
+    # followed by at most MAX_BUCKET_SCAN comparisons. pointers past the start of
+    # the last range in tables don't need buckets.
+    keys = [key for key, value in data]
+    bucketlimit = keys[-1]
+    with phase('buckets'):
+        bucketshift, fanoutbits, bucketdepth, buckets = make_bucket_tree(keys, bucketlimit)
+    buckettype, bucketsize = narrowest_type(max(buckets))
+    print >>sys.stderr, '(%d-level buckets, at most %d comparisons)' % \
+            (bucketdepth + 1, MAX_BUCKET_SCAN),
 
     if name == 'gb18030-ranges':
         keyubound = 0x110000
@@ -831,36 +1450,50 @@ def generate_multi_byte_range_lbound_index(opts, crate, name):
         minvalue=minvalue,
         maxvalue=maxvalue,
         valueubound=valueubound,
+        nbuckets=len(buckets),
+        bucketshift=bucketshift,
+        fanoutbits=fanoutbits,
+        fanoutmask=(1<<fanoutbits)-1,
+        buckettype=buckettype,
+        bucketlimit=bucketlimit,
+        last=len(data) - 1,
+        tabletype=tabletype,
     )
-    with mkdir_and_open(crate, name) as f:
+    with phase('write'), mkdir_and_open(crate, name) as f:
         write_header(f, name, comments)
         write_fmt(f, args, '''\
            |
-           |const FORWARD_TABLE: &'static [u32] = &[
+           |const FORWARD_TABLE: &'static [{tabletype}] = &[
         ''')
         write_comma_separated(f, '    ', ['%d, ' % value for key, value in data])
         write_fmt(f, args, '''\
            |]; // {datasz} entries
            |
-           |const BACKWARD_TABLE: &'static [u32] = &[
+           |const BACKWARD_TABLE: &'static [{tabletype}] = &[
         ''')
         write_comma_separated(f, '    ', ['%d, ' % key for key, value in data])
         write_fmt(f, args, '''\
            |]; // {datasz} entries
            |
-           |fn search(code: u32, fromtab: &'static [u32], totab: &'static [u32]) -> u32 {{
-           |    let mut i = if code >= fromtab[{firstoff}] {{{firstdelta}}} else {{0}};
+           |const FORWARD_BUCKETS: &'static [{buckettype}] = &[
+        ''')
+        write_comma_separated(f, '    ', ['%d, ' % i for i in buckets])
+        write_fmt(f, args, '''\
+           |]; // {nbuckets} entries
+           |
+           |fn search(code: u32, fromtab: &'static [{tabletype}], totab: &'static [{tabletype}]) -> u32 {{
+           |    let mut i = if code >= fromtab[{firstoff}] as u32 {{{firstdelta}}} else {{0}};
         ''',
             firstoff=2**maxlog2 - 1,
             firstdelta=len(data) - 2**maxlog2 + 1)
         for i in xrange(maxlog2-1, -1, -1):
             write_fmt(f, args, '''\
-               |    if code >= fromtab[i{plusoff}] {{ i += {delta}; }}
+               |    if code >= fromtab[i{plusoff}] as u32 {{ i += {delta}; }}
             ''',
                 plusoff='+%d' % (2**i-1) if i > 0 else '',
                 delta=2**i)
         write_fmt(f, args, '''\
-           |    (code - fromtab[i-1]) + totab[i-1]
+           |    (code - fromtab[i-1] as u32) + totab[i-1] as u32
            |}}
            |
            |/// Returns the index code point for pointer `code` in this index.
@@ -876,7 +1509,33 @@ def generate_multi_byte_range_lbound_index(opts, crate, name):
            |    if code == 7457 {{ return 0xe7c7; }}
         ''')
         write_fmt(f, args, '''\
-           |    search(code, BACKWARD_TABLE, FORWARD_TABLE)
+           |    if code >= {maxkey} {{ return (code - {maxkey}) + {maxvalue}; }}
+           |    let i = if code < {bucketlimit} {{
+        ''')
+        write_fmt(f, args, bucketdepth > 0, '''\
+           |        let mut shift = {bucketshift};
+           |        let mut bucket = FORWARD_BUCKETS[(code >> shift) as usize];
+           |        while bucket >= 0x8000 {{
+           |            shift -= {fanoutbits};
+           |            let child = ((code >> shift) & {fanoutmask}) as usize;
+           |            bucket = FORWARD_BUCKETS[(bucket & 0x7fff) as usize + child];
+           |        }}
+        ''', '''\
+           |        let bucket = FORWARD_BUCKETS[(code >> {bucketshift}) as usize];
+        ''')
+        write_fmt(f, args, '''\
+           |        let mut i = bucket as usize;
+        ''')
+        for _ in xrange(MAX_BUCKET_SCAN):
+            write_fmt(f, args, '''\
+               |        if code >= BACKWARD_TABLE[i+1] as u32 {{ i += 1; }}
+            ''')
+        write_fmt(f, args, '''\
+           |        i
+           |    }} else {{
+           |        {last}
+           |    }};
+           |    (code - BACKWARD_TABLE[i] as u32) + FORWARD_TABLE[i] as u32
            |}}
            |
            |/// Returns the index pointer for code point `code` in this index.
@@ -891,6 +1550,7 @@ def generate_multi_byte_range_lbound_index(opts, crate, name):
            |    if code == 0xe7c7 {{ return 7457; }}
         ''')
         write_fmt(f, args, '''\
+           |    if code >= {maxvalue} {{ return (code - {maxvalue}) + {maxkey}; }}
            |    search(code, FORWARD_TABLE, BACKWARD_TABLE)
            |}}
            |
@@ -901,50 +1561,969 @@ def generate_multi_byte_range_lbound_index(opts, crate, name):
            |}}
         ''')
 
-    forwardsz = 4 * len(data)
-    backwardsz = 4 * len(data)
+    forwardsz = tablesize * len(data) + bucketsize * len(buckets)
+    backwardsz = tablesize * len(data)
     return forwardsz, backwardsz, backwardsz
 
+CRATES = [
+    ('singlebyte', 'Single-byte index tables for\n'
+                   '[rust-encoding](https://github.com/lifthrasiir/rust-encoding).'),
+    ('korean', 'Korean index tables for [rust-encoding](https://github.com/lifthrasiir/rust-encoding).'),
+    ('japanese', 'Japanese index tables for [rust-encoding](https://github.com/lifthrasiir/rust-encoding).'),
+    ('simpchinese', 'Simplified Chinese index tables for\n'
+                    '[rust-encoding](https://github.com/lifthrasiir/rust-encoding).'),
+    ('tradchinese', 'Traditional Chinese index tables for\n'
+                    '[rust-encoding](https://github.com/lifthrasiir/rust-encoding).'),
+]
+
 INDICES = [
-    ('singlebyte/armscii-8',       generate_single_byte_index),
-
-    ('singlebyte/ibm866',          generate_single_byte_index),
-    ('singlebyte/iso-8859-2',      generate_single_byte_index),
-    ('singlebyte/iso-8859-3',      generate_single_byte_index),
-    ('singlebyte/iso-8859-4',      generate_single_byte_index),
-    ('singlebyte/iso-8859-5',      generate_single_byte_index),
-    ('singlebyte/iso-8859-6',      generate_single_byte_index),
-    ('singlebyte/iso-8859-7',      generate_single_byte_index),
-    ('singlebyte/iso-8859-8',      generate_single_byte_index),
-    ('singlebyte/iso-8859-10',     generate_single_byte_index),
-    ('singlebyte/iso-8859-13',     generate_single_byte_index),
-    ('singlebyte/iso-8859-14',     generate_single_byte_index),
-    ('singlebyte/iso-8859-15',     generate_single_byte_index),
-    ('singlebyte/iso-8859-16',     generate_single_byte_index),
-    ('singlebyte/koi8-r',          generate_single_byte_index),
-    ('singlebyte/koi8-u',          generate_single_byte_index),
-    ('singlebyte/macintosh',       generate_single_byte_index),
-    ('singlebyte/windows-874',     generate_single_byte_index),
-    ('singlebyte/windows-1250',    generate_single_byte_index),
-    ('singlebyte/windows-1251',    generate_single_byte_index),
-    ('singlebyte/windows-1252',    generate_single_byte_index),
-    ('singlebyte/windows-1253',    generate_single_byte_index),
-    ('singlebyte/windows-1254',    generate_single_byte_index),
-    ('singlebyte/windows-1255',    generate_single_byte_index),
-    ('singlebyte/windows-1256',    generate_single_byte_index),
-    ('singlebyte/windows-1257',    generate_single_byte_index),
-    ('singlebyte/windows-1258',    generate_single_byte_index),
-    ('singlebyte/x-mac-cyrillic',  generate_single_byte_index),
-
-    ('tradchinese/big5',           generate_multi_byte_index),
-    ('korean/euc-kr',              generate_multi_byte_index),
-    ('simpchinese/gb18030',        generate_multi_byte_index),
-    ('japanese/jis0208',           generate_multi_byte_index),
-    ('japanese/jis0212',           generate_multi_byte_index),
-
-    ('simpchinese/gb18030-ranges', generate_multi_byte_range_lbound_index),
+    ('singlebyte/armscii-8',       generate_single_byte_index, 'ARMSCII-8'),
+
+    ('singlebyte/ibm866',          generate_single_byte_index, 'IBM code page 866.'),
+    ('singlebyte/iso-8859-2',      generate_single_byte_index, 'ISO 8859-2.'),
+    ('singlebyte/iso-8859-3',      generate_single_byte_index, 'ISO 8859-3.'),
+    ('singlebyte/iso-8859-4',      generate_single_byte_index, 'ISO 8859-4.'),
+    ('singlebyte/iso-8859-5',      generate_single_byte_index, 'ISO 8859-5.'),
+    ('singlebyte/iso-8859-6',      generate_single_byte_index, 'ISO 8859-6.'),
+    ('singlebyte/iso-8859-7',      generate_single_byte_index, 'ISO 8859-7.'),
+    ('singlebyte/iso-8859-8',      generate_single_byte_index,
+                                   'ISO 8859-8 (either visual or logical).'),
+    ('singlebyte/iso-8859-10',     generate_single_byte_index, 'ISO 8859-10.'),
+    ('singlebyte/iso-8859-13',     generate_single_byte_index, 'ISO 8859-13.'),
+    ('singlebyte/iso-8859-14',     generate_single_byte_index, 'ISO 8859-14.'),
+    ('singlebyte/iso-8859-15',     generate_single_byte_index, 'ISO 8859-15.'),
+    ('singlebyte/iso-8859-16',     generate_single_byte_index, 'ISO 8859-16.'),
+    ('singlebyte/koi8-r',          generate_single_byte_index, 'KOI8-R.'),
+    ('singlebyte/koi8-u',          generate_single_byte_index, 'KOI8-U.'),
+    ('singlebyte/macintosh',       generate_single_byte_index, 'MacRoman.'),
+    ('singlebyte/windows-874',     generate_single_byte_index, 'Windows code page 874.'),
+    ('singlebyte/windows-1250',    generate_single_byte_index, 'Windows code page 1250.'),
+    ('singlebyte/windows-1251',    generate_single_byte_index, 'Windows code page 1251.'),
+    ('singlebyte/windows-1252',    generate_single_byte_index, 'Windows code page 1252.'),
+    ('singlebyte/windows-1253',    generate_single_byte_index, 'Windows code page 1253.'),
+    ('singlebyte/windows-1254',    generate_single_byte_index, 'Windows code page 1254.'),
+    ('singlebyte/windows-1255',    generate_single_byte_index, 'Windows code page 1255.'),
+    ('singlebyte/windows-1256',    generate_single_byte_index, 'Windows code page 1256.'),
+    ('singlebyte/windows-1257',    generate_single_byte_index, 'Windows code page 1257.'),
+    ('singlebyte/windows-1258',    generate_single_byte_index, 'Windows code page 1258.'),
+    ('singlebyte/x-mac-cyrillic',  generate_single_byte_index, 'MacCyrillic.'),
+
+    ('tradchinese/big5',           generate_multi_byte_index, """\
+        |Big5 and HKSCS.
+        |
+        |From the Encoding Standard:
+        |
+        |> This matches the Big5 standard
+        |> in combination with the Hong Kong Supplementary Character Set and other common extensions.
+    """),
+    ('korean/euc-kr',              generate_multi_byte_index, """\
+        |KS X 1001 plus Unified Hangul Code.
+        |
+        |From the Encoding Standard:
+        |
+        |> This matches the KS X 1001 standard and the Unified Hangul Code,
+        |> more commonly known together as Windows Codepage 949.
+    """),
+    ('simpchinese/gb18030',        generate_multi_byte_index, """\
+        |GB 18030 two-byte area.
+        |
+        |From the Encoding Standard:
+        |
+        |> This matches the GB18030 standard for code points encoded as two bytes,
+        |> except `0xA3 0xA0` maps to U+3000 to be compatible with deployed content.
+    """),
+    ('japanese/jis0208',           generate_multi_byte_index, """\
+        |JIS X 0208 with common extensions.
+        |
+        |From the Encoding Standard:
+        |
+        |> This is the JIS X 0208 standard including formerly proprietary extensions from IBM and NEC.
+    """),
+    ('japanese/jis0212',           generate_multi_byte_index, """\
+        |JIS X 0212.
+        |
+        |From the Encoding Standard:
+        |
+        |> This is the JIS X 0212 standard.
+        |> It is only used by the euc-jp decoder due to lack of widespread support elsewhere.
+    """),
+
+    ('simpchinese/gb18030-ranges', generate_multi_byte_range_lbound_index, """\
+        |GB 18030 four-byte area.
+        |
+        |From the Encoding Standard:
+        |
+        |> This index works different from all others.
+        |> Listing all code points would result in over a million items
+        |> whereas they can be represented neatly in 207 ranges combined with trivial limit checks.
+        |> It therefore only superficially matches the GB18030 standard
+        |> for code points encoded as four bytes.
+    """),
+]
+
+def write_cargo_features(path, features):
+    # replaces the `[features]` section of given Cargo.toml, keeping everything else.
+    # `features` is a list of (feature, [dependent features]).
+    lines = ['[features]']
+    for feature, deps in features:
+        if len(deps) <= 1:
+            lines.append('%s = [%s]' % (feature, ''.join('"%s"' % dep for dep in deps)))
+        else:
+            lines.append('%s = [' % feature)
+            lines.extend('\t"%s",' % dep for dep in deps)
+            lines.append(']')
+    with open(path, 'rb') as f:
+        manifest = f.read()
+    manifest, count = re.subn(r'(?ms)^\[features\]\n.*?\n(?=\n\[|\Z)',
+                              lambda m: '\n'.join(lines) + '\n', manifest)
+    assert count == 1, 'no [features] section in %s' % path
+    with open(path, 'wb') as f:
+        f.write(manifest)
+
+def generate_crate_metadata():
+    # every index gets its own Cargo feature (enabled by default),
+    # so that unused tables can be left out of the build entirely.
+    topdir = os.path.join(os.path.dirname(__file__), '..', '..')
+    topfeatures = []
+    for crate, cratedoc in CRATES:
+        indices = [(index.partition('/')[2], doc) for index, _, doc in INDICES
+                   if index.partition('/')[0] == crate]
+
+        dirname = os.path.join(os.path.dirname(__file__), crate)
+        with open(os.path.join(dirname, 'lib.rs'), 'wb') as f:
+            write_fmt(f, {}, """\
+               |// This is a part of rust-encoding.
+               |//
+               |// Any copyright is dedicated to the Public Domain.
+               |// https://creativecommons.org/publicdomain/zero/1.0/
+               |//
+               |// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
+               |
+            """)
+            for line in dedent(cratedoc).splitlines():
+                print >>f, ('//! ' + line).rstrip()
+            write_fmt(f, {}, """\
+               |
+               |#![cfg_attr(test, feature(test))]
+               |
+               |#[cfg(test)]
+               |#[macro_use]
+               |extern crate encoding_index_tests;
+            """)
+            for index, doc in indices:
+                print >>f
+                for line in dedent(doc).splitlines():
+                    print >>f, ('/// ' + line).rstrip()
+                print >>f, '#[cfg(feature = "index-%s")]' % index
+                print >>f, 'pub mod %s;' % index.replace('-', '_')
+
+        write_cargo_features(os.path.join(dirname, 'Cargo.toml'), [
+            ('default', ['index-%s' % index for index, _ in indices]),
+            ('no-optimized-legacy-encoding', []),
+            ('exhaustive-tests', []),
+        ] + [('index-%s' % index, []) for index, _ in indices])
+        topfeatures += [('index-%s' % index, ['encoding-index-%s/index-%s' % (crate, index)])
+                        for index, _ in indices]
+
+    write_cargo_features(os.path.join(topdir, 'Cargo.toml'), [
+        ('default', [feature for feature, _ in topfeatures]),
+        ('no-optimized-legacy-encoding', ['encoding-index-%s/no-optimized-legacy-encoding' % crate
+                                          for crate, _ in CRATES]),
+    ] + topfeatures)
+
+# maps the name of each encoding in the Encoding Standard (lowercased) to
+# the corresponding item in `encoding::all` and the indices it requires.
+LABEL_ENCODINGS = {
+    'utf-8':          ('all::UTF_8', []),
+    'ibm866':         ('all::IBM866', ['ibm866']),
+    'iso-8859-2':     ('all::ISO_8859_2', ['iso-8859-2']),
+    'iso-8859-3':     ('all::ISO_8859_3', ['iso-8859-3']),
+    'iso-8859-4':     ('all::ISO_8859_4', ['iso-8859-4']),
+    'iso-8859-5':     ('all::ISO_8859_5', ['iso-8859-5']),
+    'iso-8859-6':     ('all::ISO_8859_6', ['iso-8859-6']),
+    'iso-8859-7':     ('all::ISO_8859_7', ['iso-8859-7']),
+    'iso-8859-8':     ('all::ISO_8859_8', ['iso-8859-8']),
+    'iso-8859-8-i':   ('all::whatwg::ISO_8859_8_I', ['iso-8859-8']),
+    'iso-8859-10':    ('all::ISO_8859_10', ['iso-8859-10']),
+    'iso-8859-13':    ('all::ISO_8859_13', ['iso-8859-13']),
+    'iso-8859-14':    ('all::ISO_8859_14', ['iso-8859-14']),
+    'iso-8859-15':    ('all::ISO_8859_15', ['iso-8859-15']),
+    'iso-8859-16':    ('all::ISO_8859_16', ['iso-8859-16']),
+    'koi8-r':         ('all::KOI8_R', ['koi8-r']),
+    'koi8-u':         ('all::KOI8_U', ['koi8-u']),
+    'macintosh':      ('all::MAC_ROMAN', ['macintosh']),
+    'windows-874':    ('all::WINDOWS_874', ['windows-874']),
+    'windows-1250':   ('all::WINDOWS_1250', ['windows-1250']),
+    'windows-1251':   ('all::WINDOWS_1251', ['windows-1251']),
+    'windows-1252':   ('all::WINDOWS_1252', ['windows-1252']),
+    'windows-1253':   ('all::WINDOWS_1253', ['windows-1253']),
+    'windows-1254':   ('all::WINDOWS_1254', ['windows-1254']),
+    'windows-1255':   ('all::WINDOWS_1255', ['windows-1255']),
+    'windows-1256':   ('all::WINDOWS_1256', ['windows-1256']),
+    'windows-1257':   ('all::WINDOWS_1257', ['windows-1257']),
+    'windows-1258':   ('all::WINDOWS_1258', ['windows-1258']),
+    'x-mac-cyrillic': ('all::MAC_CYRILLIC', ['x-mac-cyrillic']),
+    'gbk':            ('all::GBK', ['gb18030', 'gb18030-ranges']),
+    'gb18030':        ('all::GB18030', ['gb18030', 'gb18030-ranges']),
+    'big5':           ('all::BIG5_2003', ['big5']),
+    'euc-jp':         ('all::EUC_JP', ['jis0208', 'jis0212']),
+    'iso-2022-jp':    ('all::ISO_2022_JP', ['jis0208', 'jis0212']),
+    'shift_jis':      ('all::WINDOWS_31J', ['jis0208', 'jis0212']),
+    'euc-kr':         ('all::WINDOWS_949', ['euc-kr']),
+    'replacement':    ('all::whatwg::REPLACEMENT', []),
+    'utf-16be':       ('all::UTF_16BE', []),
+    'utf-16le':       ('all::UTF_16LE', []),
+    'x-user-defined': ('all::whatwg::X_USER_DEFINED', []),
+}
+
+def cfg_for_indices(indices):
+    # returns a `#[cfg]` attribute requiring all given (non-empty) indices
+    if len(indices) == 1:
+        return '#[cfg(feature = "index-%s")]' % indices[0]
+    return '#[cfg(all(%s))]' % ', '.join('feature = "index-%s"' % index for index in indices)
+
+def label_hash(label):
+    # FNV-1a over the ASCII-lowercased label; should match `lookup` in label_table.rs
+    h = 0x811c9dc5
+    for c in label:
+        c = ord(c)
+        if 0x41 <= c <= 0x5a: c |= 0x20
+        h = ((h ^ c) * 0x01000193) & 0xffffffff
+    return h
+
+def label_slot(h, disp, slotbits):
+    return (((h ^ disp) * 0x9e3779b1) & 0xffffffff) >> (32 - slotbits)
+
+def make_perfect_hash(hashes):
+    # a simple hash-and-displace scheme: the lower `dispbits` bits of the hash select
+    # a displacement which is xor-ed to the hash before the final mixing.
+    # we search displacements for larger buckets first, as they are harder to place.
+    # configurations with too few displacements can't be placed anyway, but they would have
+    # to exhaust every displacement before giving up. so we start from buckets of at most
+    # about 8 keys, and give up a bucket after `8 << slotbits` displacements.
+    assert len(set(hashes)) == len(hashes), 'label hash collision'
+    minslotbits = 1
+    while 2**minslotbits < len(hashes):
+        minslotbits += 1
+    mindispbits = 0
+    while (len(hashes) >> mindispbits) > 8:
+        mindispbits += 1
+    for slotbits in xrange(minslotbits, minslotbits + 2):
+        for dispbits in xrange(min(mindispbits, slotbits), slotbits + 1):
+            buckets = [[] for _ in xrange(1<<dispbits)]
+            for i, h in enumerate(hashes):
+                buckets[h & ((1<<dispbits)-1)].append(i)
+            slots = [None] * (1<<slotbits)
+            disps = [0] * (1<<dispbits)
+            placed = True
+            for bucket in sorted(xrange(len(buckets)), key=lambda b: -len(buckets[b])):
+                if not buckets[bucket]: break
+                for disp in xrange(min(8 << slotbits, 0x10000)): # displacements are u16
+                    cand = [label_slot(hashes[i], disp, slotbits) for i in buckets[bucket]]
+                    if len(set(cand)) == len(cand) and all(slots[j] is None for j in cand):
+                        break
+                else:
+                    placed = False # give up this configuration
+                    break
+                for i, j in zip(buckets[bucket], cand):
+                    slots[j] = i
+                disps[bucket] = disp
+            if placed:
+                return slotbits, dispbits, slots, disps
+    raise ValueError('cannot find a perfect hash for labels')
+
+def generate_label_table(opts):
+    encodings = read_encodings(opts)
+
+    labels = [] # (label, encoding id)
+    for encid, (name, enclabels) in enumerate(encodings):
+        assert name.lower() in LABEL_ENCODINGS, 'unknown encoding %s' % name
+        for label in enclabels:
+            label = str(label)
+            assert label == label.lower() and all(0x20 < ord(c) < 0x7f for c in label)
+            labels.append((label, encid + 1)) # 0 is reserved for empty slots
+
+    with phase('perfect hash'):
+        slotbits, dispbits, slots, disps = \
+                make_perfect_hash([label_hash(label) for label, _ in labels])
+
+    args = dict(
+        slotssz=len(slots),
+        slotshift=32 - slotbits,
+        dispsz=len(disps),
+        dispmask=(1<<dispbits)-1,
+        maxlen=max(len(label) for label, _ in labels),
+    )
+    path = os.path.join(os.path.dirname(__file__), '..', 'label_table.rs')
+    with phase('write'), open(path, 'wb') as f:
+        write_fmt(f, args, """\
+           |// AUTOGENERATED FROM encodings.json OF THE ENCODING STANDARD BY gen_index.py.
+           |// https://encoding.spec.whatwg.org/
+           |
+           |//! A perfect hash table for WHATWG encoding labels.
+           |
+           |use all;
+           |use types::EncodingRef;
+           |
+           |const LABELS: &'static [(&'static str, u8)] = &[
+        """)
+        write_comma_separated(f, '    ', ['("%s", %d), ' % (labels[i] if i is not None else ('', 0))
+                                         for i in slots])
+        write_fmt(f, args, """\
+           |]; // {slotssz} entries
+           |
+           |const DISPLACEMENTS: &'static [u16] = &[
+        """)
+        write_comma_separated(f, '    ', ['%d, ' % v for v in disps])
+        write_fmt(f, args, """\
+           |]; // {dispsz} entries
+           |
+           |#[inline]
+           |fn fold(b: u8) -> u8 {{
+           |    if b'A' <= b && b <= b'Z' {{ b | 0x20 }} else {{ b }}
+           |}}
+           |
+           |fn encoding(id: u8) -> Option<EncodingRef> {{
+           |    match id {{
+        """)
+        for encid, (name, _) in enumerate(encodings):
+            expr, indices = LABEL_ENCODINGS[name.lower()]
+            if indices:
+                print >>f, '        ' + cfg_for_indices(indices)
+            print >>f, '        %d => Some(%s as EncodingRef),' % (encid + 1, expr)
+        write_fmt(f, args, """\
+           |        _ => None
+           |    }}
+           |}}
+           |
+           |/// Returns an encoding from given (already trimmed) label, matched case-insensitively.
+           |/// Does not allocate and only compares against one candidate label.
+           |pub fn lookup(label: &[u8]) -> Option<EncodingRef> {{
+           |    if label.len() > {maxlen} {{ return None; }}
+           |    let mut h = 0x811c9dc5u32;
+           |    for &b in label {{
+           |        h = (h ^ fold(b) as u32).wrapping_mul(0x01000193);
+           |    }}
+           |    let disp = DISPLACEMENTS[(h & {dispmask}) as usize] as u32;
+           |    let (name, id) = LABELS[((h ^ disp).wrapping_mul(0x9e3779b1) >> {slotshift}) as usize];
+           |    if name.len() != label.len() {{ return None; }}
+           |    for (&a, &b) in name.as_bytes().iter().zip(label.iter()) {{
+           |        if a != fold(b) {{ return None; }}
+           |    }}
+           |    encoding(id)
+           |}}
+           |
+           |#[cfg(test)]
+           |mod tests {{
+           |    use super::{{LABELS, encoding, lookup}};
+           |
+           |    #[test]
+           |    fn test_all_labels() {{
+           |        for &(name, id) in LABELS {{
+           |            if id == 0 {{ continue; }}
+           |            let upper: Vec<u8> = name.bytes().map(|b| b.to_ascii_uppercase()).collect();
+           |            let expected = encoding(id).map(|e| e.name());
+           |            assert_eq!(lookup(name.as_bytes()).map(|e| e.name()), expected);
+           |            assert_eq!(lookup(&upper).map(|e| e.name()), expected);
+           |            assert!(lookup(&name.as_bytes()[1..]).map_or(true, |e| Some(e.name()) != expected));
+           |        }}
+           |        assert!(lookup(b"").is_none());
+           |    }}
+           |}}
+        """)
+
+    # assumes 64-bit pointers, so each slot takes 24 bytes plus the label itself
+    return 24 * len(slots) + sum(len(label) for label, _ in labels) + 2 * len(disps)
+
+# pointers for two-byte sequences, mirroring `map_two_bytes` and friends in src/codec.
+# returns None for sequences never valid, and True for sequences valid regardless of the index.
+
+def euc_kr_pointer(lead, trail):
+    if 0x81 <= lead <= 0xfe and 0x41 <= trail <= 0xfe:
+        return (lead - 0x81) * 190 + (trail - 0x41)
+
+def big5_pointer(lead, trail):
+    if 0x81 <= lead <= 0xfe and (0x40 <= trail <= 0x7e or 0xa1 <= trail <= 0xfe):
+        return (lead - 0x81) * 157 + trail - (0x40 if trail < 0x7f else 0x62)
+
+def gb18030_pointer(lead, trail):
+    if 0x81 <= lead <= 0xfe and (0x40 <= trail <= 0x7e or 0x80 <= trail <= 0xfe):
+        return (lead - 0x81) * 190 + trail - (0x40 if trail < 0x7f else 0x41)
+
+def euc_jp_pointer(lead, trail):
+    if 0xa1 <= lead <= 0xfe and 0xa1 <= trail <= 0xfe:
+        return (lead - 0xa1) * 94 + trail - 0xa1
+
+def shift_jis_pointer(lead, trail):
+    if (0x81 <= lead <= 0x9f or 0xe0 <= lead <= 0xfc) and \
+            (0x40 <= trail <= 0x7e or 0x80 <= trail <= 0xfc):
+        if 0xf0 <= lead <= 0xf9: return True # EUDC, mapped to the private use area
+        return (lead - (0x81 if lead < 0xa0 else 0xc1)) * 188 + trail - (0x40 if trail < 0x7f else 0x41)
+
+# valid ranges of GB 18030 four-byte pointers, as in `gb18030_ranges::forward`
+GB18030_FOUR_BYTE_RANGES = [(0, 39419), (189000, 1237575)]
+
+# transitions checking that the previous and current bytes form a pair assigned
+# in the k-th index are marked with the check `1 + k`; transitions completing
+# a GB 18030 four-byte sequence are marked with the following check.
+FOUR_BYTE_CHECK = 3
+
+# maps the name of each encoding in the Encoding Standard (lowercased) to
+# the name of its validator, the indices checked (with extra assigned pointers)
+# and the states of the decoder. each state is a list of (first byte, last byte,
+# next state, check) for accepted bytes, where the state 0 is the initial state.
+DFA_ENCODINGS = [
+    ('euc-kr', 'WINDOWS_949', [('korean/euc-kr', euc_kr_pointer, [])], [
+        [(0x00, 0x7f, 0, 0), (0x81, 0xfe, 1, 0)],
+        [(0x00, 0xff, 0, 1)],
+    ]),
+    ('big5', 'BIG5_2003', [('tradchinese/big5', big5_pointer, BIG5_SPECIAL_POINTERS)], [
+        [(0x00, 0x7f, 0, 0), (0x81, 0xfe, 1, 0)],
+        [(0x00, 0xff, 0, 1)],
+    ]),
+    ('gb18030', 'GB18030', [('simpchinese/gb18030', gb18030_pointer, [])], [
+        [(0x00, 0x80, 0, 0), (0x81, 0xfe, 1, 0)],
+        [(0x00, 0x2f, 0, 1), (0x30, 0x39, 2, 0), (0x3a, 0xff, 0, 1)],
+        [(0x81, 0xfe, 3, 0)],
+        [(0x30, 0x39, 0, FOUR_BYTE_CHECK)],
+    ]),
+    ('euc-jp', 'EUC_JP', [('japanese/jis0208', euc_jp_pointer, []),
+                          ('japanese/jis0212', euc_jp_pointer, [])], [
+        [(0x00, 0x7f, 0, 0), (0x8e, 0x8e, 1, 0), (0x8f, 0x8f, 2, 0), (0xa1, 0xfe, 3, 0)],
+        [(0xa1, 0xdf, 0, 0)],
+        [(0xa1, 0xfe, 4, 0)],
+        [(0x00, 0xff, 0, 1)],
+        [(0x00, 0xff, 0, 2)],
+    ]),
+    ('shift_jis', 'WINDOWS_31J', [('japanese/jis0208', shift_jis_pointer, [])], [
+        [(0x00, 0x80, 0, 0), (0x81, 0x9f, 1, 0), (0xa1, 0xdf, 0, 0), (0xe0, 0xfc, 1, 0)],
+        [(0x00, 0xff, 0, 1)],
+    ]),
+    ('utf-8', 'UTF_8', [], [
+        [(0x00, 0x7f, 0, 0), (0xc2, 0xdf, 1, 0), (0xe0, 0xe0, 4, 0), (0xe1, 0xec, 2, 0),
+         (0xed, 0xed, 5, 0), (0xee, 0xef, 2, 0), (0xf0, 0xf0, 6, 0), (0xf1, 0xf3, 3, 0),
+         (0xf4, 0xf4, 7, 0)],
+        [(0x80, 0xbf, 0, 0)],
+        [(0x80, 0xbf, 1, 0)],
+        [(0x80, 0xbf, 2, 0)],
+        [(0xa0, 0xbf, 1, 0)], # no overlong sequences
+        [(0x80, 0x9f, 1, 0)], # no surrogates
+        [(0x90, 0xbf, 2, 0)], # no overlong sequences
+        [(0x80, 0x8f, 2, 0)], # nothing beyond U+10FFFF
+    ]),
 ]
 
+def make_dfa(states):
+    # returns the byte classes and the transition table (state * nclasses + class)
+    # with the minimal number of byte classes.
+    REJECT = 0xff
+    assert len(states) <= 8
+    columns = []
+    for b in xrange(256):
+        column = []
+        for state in states:
+            t = REJECT
+            for lo, hi, next, check in state:
+                if lo <= b <= hi:
+                    assert t == REJECT
+                    t = next | (check << 3)
+            column.append(t)
+        columns.append(tuple(column))
+    # every validator should treat ASCII in the initial state as is
+    assert all(columns[b][0] == 0 for b in xrange(0x80))
+
+    uniqcolumns = []
+    classes = []
+    for column in columns:
+        if column not in uniqcolumns: uniqcolumns.append(column)
+        classes.append(uniqcolumns.index(column))
+    transitions = [column[state] for state in xrange(len(states)) for column in uniqcolumns]
+    return classes, len(uniqcolumns), transitions
+
+def generate_dfa_table(opts):
+    assigned = {} # index => set of assigned pointers
+    with phase('parse'):
+        for _, _, checks, _ in DFA_ENCODINGS:
+            for index, _, extra in checks:
+                if index in assigned: continue
+                crate, _, name = index.partition('/')
+                assigned[index] = set(key for key, _ in read_index(opts, crate, name, [])) | set(extra)
+
+    path = os.path.join(os.path.dirname(__file__), '..', 'dfa_table.rs')
+    totalsz = 0
+    with phase('write'), open(path, 'wb') as f:
+        write_fmt(f, {}, """\
+           |// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+           |// https://encoding.spec.whatwg.org/
+           |
+           |//! Table-driven validators for multi-byte encodings and UTF-8.
+           |//!
+           |//! Each validator is a DFA over byte classes, following the states of the corresponding decoder.
+           |//! A transition may additionally require the previous and current bytes to form a pair
+           |//! assigned in the index (checked with a per-lead-byte bitmap of trail bytes),
+           |//! or a GB 18030 four-byte sequence to be in the valid range.
+           |
+           |#![allow(dead_code)] // when every multi-byte index is disabled
+           |
+           |const REJECT: u8 = 0xff;
+           |const FOUR_BYTE_CHECK: u8 = {fourbyte};
+           |
+           |pub struct Dfa {{
+           |    /// The byte class of each byte.
+           |    classes: [u8; 256],
+           |    nclasses: usize,
+           |    /// `transitions[state * nclasses + class]` is either `REJECT`
+           |    /// or the next state in the lower 3 bits and the check in the upper bits.
+           |    transitions: &'static [u8],
+           |    /// `trails[trailrows[check - 1][lead - 0x80]]` is a bitmap of assigned trail bytes.
+           |    trailrows: &'static [[u8; 128]],
+           |    trails: &'static [[u32; 8]],
+           |}}
+           |
+           |impl Dfa {{
+           |    /// Returns the next state after `input[i]` in given state, or `None` if it is invalid.
+           |    /// `input[..i]` should have been already fed, as the current sequence is checked against it.
+           |    #[inline(always)] // otherwise `valid_up_to` gets noticeably slower
+           |    pub fn next(&self, state: usize, input: &[u8], i: usize) -> Option<usize> {{
+           |        let b = input[i];
+           |        let next = self.transitions[state * self.nclasses + self.classes[b as usize] as usize];
+           |        if next == REJECT {{ return None; }}
+           |        match next >> 3 {{
+           |            0 => {{}}
+           |            FOUR_BYTE_CHECK => {{
+           |                let ptr = (input[i-3] as u32 - 0x81) * 12600 + (input[i-2] as u32 - 0x30) * 1260 +
+           |                          (input[i-1] as u32 - 0x81) * 10 + (b as u32 - 0x30);
+           |                if !({fourbyteranges}) {{ return None; }}
+           |            }}
+           |            check => {{
+           |                let row = self.trailrows[check as usize - 1][(input[i-1] & 0x7f) as usize];
+           |                if (self.trails[row as usize][(b >> 5) as usize] >> (b & 31)) & 1 == 0 {{
+           |                    return None;
+           |                }}
+           |            }}
+           |        }}
+           |        Some((next & 7) as usize)
+           |    }}
+           |
+           |    /// Returns the length of the longest prefix of `input` which the corresponding encoding
+           |    /// can decode without errors, not counting a trailing incomplete sequence.
+           |    ///
+           |    /// This only uses the generated byte-class and trail-byte tables,
+           |    /// so it is much faster than actually decoding `input`.
+           |    /// The `valid_up_to` methods of the CJK encodings are thin wrappers around this.
+           |    pub fn valid_up_to(&self, input: &[u8]) -> usize {{
+           |        let mut state = 0;
+           |        let mut start = 0; // the start of the current sequence
+           |        for (i, &b) in input.iter().enumerate() {{
+           |            if state == 0 {{
+           |                if b < 0x80 {{ continue; }}
+           |                start = i;
+           |            }}
+           |            match self.next(state, input, i) {{
+           |                Some(next) => {{ state = next; }}
+           |                None => {{ return start; }}
+           |            }}
+           |        }}
+           |        if state == 0 {{ input.len() }} else {{ start }}
+           |    }}
+           |}}
+        """, fourbyte=FOUR_BYTE_CHECK,
+             fourbyteranges=' || '.join('(%d <= ptr && ptr <= %d)' % r if r[0] > 0 else 'ptr <= %d' % r[1]
+                                         for r in GB18030_FOUR_BYTE_RANGES))
+
+        for encname, static, checks, states in DFA_ENCODINGS:
+            classes, nclasses, transitions = make_dfa(states)
+
+            trails = []
+            trailrows = []
+            for index, pointer, _ in checks:
+                row = []
+                for lead in xrange(0x80, 0x100):
+                    bitmap = [0] * 8
+                    for trail in xrange(0x100):
+                        ptr = pointer(lead, trail)
+                        if ptr is True or (ptr is not None and ptr in assigned[index]):
+                            bitmap[trail >> 5] |= 1 << (trail & 31)
+                    if bitmap not in trails: trails.append(bitmap)
+                    row.append(trails.index(bitmap))
+                trailrows.append(row)
+            assert len(trails) <= 0x100
+
+            _, indices = LABEL_ENCODINGS[encname]
+            print >>f
+            if indices:
+                print >>f, cfg_for_indices(indices)
+            print >>f, 'pub static %s: Dfa = Dfa {' % static
+            print >>f, '    classes: ['
+            write_comma_separated(f, '        ', ['%d, ' % v for v in classes])
+            print >>f, '    ],'
+            print >>f, '    nclasses: %d,' % nclasses
+            print >>f, '    transitions: &['
+            for state in xrange(len(states)):
+                write_comma_separated(f, '        ',
+                    ['%d, ' % v for v in transitions[state*nclasses:(state+1)*nclasses]])
+            print >>f, '    ],'
+            print >>f, '    trailrows: &['
+            for row in trailrows:
+                print >>f, '        ['
+                write_comma_separated(f, '            ', ['%d, ' % v for v in row])
+                print >>f, '        ],'
+            print >>f, '    ],'
+            print >>f, '    trails: &['
+            for bitmap in trails:
+                print >>f, '        [%s],' % ', '.join('%#x' % v for v in bitmap)
+            print >>f, '    ],'
+            print >>f, '};'
+            totalsz += 256 + len(transitions) + 128 * len(trailrows) + 32 * len(trails)
+
+        write_fmt(f, {}, """\
+           |
+           |#[cfg(test)]
+           |mod tests {{
+           |    use super::Dfa;
+           |    #[allow(unused_imports)] use all;
+           |    use types::{{Encoding, DecoderTrap}};
+           |
+           |    // every sequence of `prefix` and two bytes should be validated as the decoder does
+           |    fn check_pairs(dfa: &Dfa, encoding: &Encoding, prefix: &[u8]) {{
+           |        let mut buf = prefix.to_vec();
+           |        for lead in 0..0x100 {{
+           |            for trail in 0..0x100 {{
+           |                buf.truncate(prefix.len());
+           |                buf.push(lead as u8);
+           |                buf.push(trail as u8);
+           |                let valid = encoding.decode(&buf, DecoderTrap::Strict).is_ok();
+           |                assert_eq!(dfa.valid_up_to(&buf) == buf.len(), valid, "{{:?}}", buf);
+           |            }}
+           |        }}
+           |    }}
+        """)
+        for encname, static, _, _ in DFA_ENCODINGS:
+            expr, indices = LABEL_ENCODINGS[encname]
+            write_fmt(f, {}, """\
+               |
+               |    #[test]{cfg}
+               |    fn test_{name}() {{
+               |        check_pairs(&super::{static}, {expr}, &[]);
+            """, cfg='\n    ' + cfg_for_indices(indices) if indices else '',
+                 name=static.lower(), static=static, expr=expr)
+            if encname == 'euc-jp':
+                write_fmt(f, {}, """\
+                   |        check_pairs(&super::{static}, {expr}, &[0x8f]); // JIS X 0212
+                """, static=static, expr=expr)
+            if encname == 'utf-8':
+                write_fmt(f, {}, """\
+                   |        // three- and four-byte sequences with restricted second bytes
+                   |        for &prefix in &[&[0xe0][..], &[0xed], &[0xf0], &[0xf4], &[0xf1, 0x80]] {{
+                   |            check_pairs(&super::{static}, {expr}, prefix);
+                   |        }}
+                """, static=static, expr=expr)
+            if encname == 'gb18030':
+                write_fmt(f, {}, """\
+                   |        // four-byte sequences, including the boundaries of valid ranges
+                   |        for b1 in 0x81..0xff {{
+                   |            for b2 in 0x30..0x3a {{
+                   |                for &b3 in &[0x81, 0x9a, 0xa4, 0xfe] {{
+                   |                    for b4 in 0x2f..0x3b {{
+                   |                        let buf = [b1 as u8, b2 as u8, b3, b4 as u8];
+                   |                        let valid = {expr}.decode(&buf, DecoderTrap::Strict).is_ok();
+                   |                        assert_eq!(super::{static}.valid_up_to(&buf) == 4, valid, "{{:?}}", buf);
+                   |                    }}
+                   |                }}
+                   |            }}
+                   |        }}
+                """, static=static, expr=expr)
+            write_fmt(f, {}, """\
+               |        assert_eq!(super::{static}.valid_up_to(b"ab"), 2);
+               |        assert_eq!(super::{static}.valid_up_to(b"ab\\xff"), 2);
+               |    }}
+            """, static=static)
+        write_fmt(f, {}, """\
+           |}}
+        """)
+
+    return totalsz
+
+def read_backward_index(opts, index):
+    # returns a mapping from code points to pointers, as `backward` of given index does
+    crate, _, name = index.partition('/')
+    backward = {}
+    for key, value in read_index(opts, crate, name, []):
+        if name == 'big5' and key < BIG5_HKSCS_LIMIT: continue
+        backward.setdefault(value, key)
+    return backward
+
+# maps items in `encoding::all` for single-byte encodings (except for ISO 8859-1) to their indices
+SINGLE_BYTE_ENCODINGS = [
+    ('ARMSCII_8', 'armscii-8'), ('IBM866', 'ibm866'), ('ISO_8859_2', 'iso-8859-2'),
+    ('ISO_8859_3', 'iso-8859-3'), ('ISO_8859_4', 'iso-8859-4'), ('ISO_8859_5', 'iso-8859-5'),
+    ('ISO_8859_6', 'iso-8859-6'), ('ISO_8859_7', 'iso-8859-7'), ('ISO_8859_8', 'iso-8859-8'),
+    ('ISO_8859_10', 'iso-8859-10'), ('ISO_8859_13', 'iso-8859-13'),
+    ('ISO_8859_14', 'iso-8859-14'), ('ISO_8859_15', 'iso-8859-15'),
+    ('ISO_8859_16', 'iso-8859-16'), ('KOI8_R', 'koi8-r'), ('KOI8_U', 'koi8-u'),
+    ('MAC_ROMAN', 'macintosh'), ('WINDOWS_874', 'windows-874'),
+    ('WINDOWS_1250', 'windows-1250'), ('WINDOWS_1251', 'windows-1251'),
+    ('WINDOWS_1252', 'windows-1252'), ('WINDOWS_1253', 'windows-1253'),
+    ('WINDOWS_1254', 'windows-1254'), ('WINDOWS_1255', 'windows-1255'),
+    ('WINDOWS_1256', 'windows-1256'), ('WINDOWS_1257', 'windows-1257'),
+    ('WINDOWS_1258', 'windows-1258'), ('MAC_CYRILLIC', 'x-mac-cyrillic'),
+]
+
+# non-ASCII code points directly encoded by every Japanese encoder
+JAPANESE_EXTRA_CODES = set([0xa5, 0x203e] + range(0xff61, 0xffa0))
+
+# lists encodings in `encoding::all` in the order of bits in `repertoire_table`,
+# roughly from the most compact ones. each entry has the item, indices it requires,
+# and a function returning the set of non-ASCII code points it can encode
+# given a function returning the backward mapping of each index.
+# the last two encodings can encode every code point except for the given set instead.
+REPERTOIRE_ENCODINGS = [
+    ('all::ASCII',        [], lambda b: set(), None),
+    ('all::ISO_8859_1',   [], lambda b: set(xrange(0x80, 0x100)), None),
+] + [
+    ('all::' + expr, [index], (lambda index: lambda b: set(b('singlebyte/' + index)))(index), None)
+    for expr, index in SINGLE_BYTE_ENCODINGS
+] + [
+    ('all::WINDOWS_949',  ['euc-kr'], lambda b: set(b('korean/euc-kr')), None),
+    ('all::EUC_JP',       ['jis0208', 'jis0212'],
+                          lambda b: JAPANESE_EXTRA_CODES | set(b('japanese/jis0208')), None),
+    ('all::WINDOWS_31J',  ['jis0208', 'jis0212'],
+                          lambda b: JAPANESE_EXTRA_CODES | set([0x80]) | set(b('japanese/jis0208')), None),
+    ('all::ISO_2022_JP',  ['jis0208', 'jis0212'],
+                          lambda b: JAPANESE_EXTRA_CODES | set(b('japanese/jis0208')), None),
+    # HZ can only encode GB 2312 characters
+    ('all::HZ',           ['gb18030', 'gb18030-ranges'],
+                          lambda b: set(code for code, ptr in b('simpchinese/gb18030').items()
+                                        if ptr // 190 >= 0x20 and ptr % 190 >= 0x60), None),
+    ('all::BIG5_2003',    ['big5'], lambda b: set(b('tradchinese/big5')), None),
+    ('all::GBK',          ['gb18030', 'gb18030-ranges'],
+                          lambda b: (set([0x20ac]) | set(b('simpchinese/gb18030'))) - set([0xe5e5]), None),
+    ('all::GB18030',      ['gb18030', 'gb18030-ranges'], None, set([0xe5e5])),
+    ('all::UTF_8',        [], None, set()),
+]
+
+def generate_repertoire_table(opts):
+    backwards = {}
+    def backward(index):
+        if index not in backwards:
+            backwards[index] = read_backward_index(opts, index)
+        return backwards[index]
+
+    # code point => bitset of encodings, only when it differs from `default`,
+    # the set of encodings without explicit repertoires (which may still miss some code points)
+    default = sum(1 << bit for bit, (_, _, encodable, _) in enumerate(REPERTOIRE_ENCODINGS)
+                  if encodable is None)
+    universal = sum(1 << bit for bit, (_, _, encodable, unencodable) in enumerate(REPERTOIRE_ENCODINGS)
+                    if encodable is None and not unencodable)
+    allbits = (1 << len(REPERTOIRE_ENCODINGS)) - 1
+    assert len(REPERTOIRE_ENCODINGS) <= 64
+    codesets = dict((code, allbits) for code in xrange(0x80))
+    with phase('parse'):
+        for bit, (_, _, encodable, unencodable) in enumerate(REPERTOIRE_ENCODINGS):
+            if encodable is None:
+                for code in unencodable:
+                    codesets[code] = codesets.get(code, default) & ~(1 << bit)
+            else:
+                for code in encodable(backward):
+                    if code < 0x80: continue # e.g. ARMSCII-8 has some ASCII punctuations
+                    codesets[code] = codesets.get(code, default) | (1 << bit)
+
+    # the trie maps each code point to the index to the unique bitsets,
+    # where the bitset 0 is `default` so that missing code points map to it
+    bitsets = [default] + sorted(set(codesets.values()) - set([default]))
+    bitsetidx = dict((bitset, i) for i, bitset in enumerate(bitsets))
+    assert len(bitsets) <= 0x100
+    with phase('trie'):
+        triebits, lower, upper = make_minimal_trie(
+            dict((code, bitsetidx[bitset]) for code, bitset in codesets.items()
+                 if bitset != default),
+            lowerlimit=0x10000)
+
+    args = dict(
+        nencodings=len(REPERTOIRE_ENCODINGS),
+        universal=universal,
+        allbits=allbits,
+        bitsetssz=len(bitsets),
+        triebits=triebits,
+        triemask=(1<<triebits)-1,
+        lowersz=len(lower),
+        uppersz=len(upper),
+    )
+    path = os.path.join(os.path.dirname(__file__), '..', 'repertoire_table.rs')
+    with phase('write'), open(path, 'wb') as f:
+        write_fmt(f, args, """\
+           |// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+           |// https://encoding.spec.whatwg.org/
+           |
+           |//! A trie from code points to the set of encodings which can encode them.
+           |
+           |use all;
+           |use types::EncodingRef;
+           |
+           |/// The number of encodings, which may be unavailable due to disabled indices.
+           |pub const NENCODINGS: usize = {nencodings};
+           |
+           |/// The set of every encoding.
+           |pub const ALL: u64 = {allbits:#x};
+           |
+           |/// The set of encodings which can encode every code point.
+           |pub const UNIVERSAL: u64 = {universal:#x};
+           |
+           |const BITSETS: &'static [u64] = &[
+        """)
+        write_comma_separated(f, '    ', ['%#x, ' % v for v in bitsets])
+        write_fmt(f, args, """\
+           |]; // {bitsetssz} entries
+           |
+           |const TABLE_LOWER: &'static [u8] = &[
+        """)
+        write_comma_separated(f, '    ', ['%d, ' % (v or 0) for v in lower])
+        write_fmt(f, args, """\
+           |]; // {lowersz} entries
+           |
+           |const TABLE_UPPER: &'static [u16] = &[
+        """)
+        write_comma_separated(f, '    ', ['%d, ' % v for v in upper])
+        write_fmt(f, args, """\
+           |]; // {uppersz} entries
+           |
+           |/// Returns the set of encodings which can encode code point `code`,
+           |/// where the `i`-th bit corresponds to `encoding(i)`.
+           |#[inline]
+           |pub fn lookup(code: u32) -> u64 {{
+           |    let offset = (code >> {triebits}) as usize;
+           |    let offset = if offset < {uppersz} {{TABLE_UPPER[offset] as usize}} else {{0}};
+           |    BITSETS[TABLE_LOWER[offset + ((code & {triemask}) as usize)] as usize]
+           |}}
+           |
+           |/// Returns the encoding for the `i`-th bit, if available.
+           |pub fn encoding(i: usize) -> Option<EncodingRef> {{
+           |    match i {{
+        """)
+        for bit, (expr, indices, _, _) in enumerate(REPERTOIRE_ENCODINGS):
+            if indices:
+                print >>f, '        ' + cfg_for_indices(indices)
+            print >>f, '        %d => Some(%s as EncodingRef),' % (bit, expr)
+        write_fmt(f, args, """\
+           |        _ => None
+           |    }}
+           |}}
+           |
+           |#[cfg(test)]
+           |mod tests {{
+           |    use std::char;
+           |    use super::{{NENCODINGS, lookup, encoding}};
+           |
+           |    #[test]
+           |    fn test_lookup() {{
+           |        let mut output = Vec::new();
+           |        for i in 0..NENCODINGS {{
+           |            let encoding = match encoding(i) {{ Some(encoding) => encoding, None => continue }};
+           |            let mut encoder = encoding.raw_encoder();
+           |            // every BMP code point and a sample of astral code points
+           |            let astral = (0x10000..0x110000).filter(|code| code % 31 == 0);
+           |            for code in (0..0xd800).chain(0xe000..0x10000).chain(astral) {{
+           |                let ch = char::from_u32(code).unwrap();
+           |                let mut buf = [0; 4];
+           |                output.clear();
+           |                let (_, err) = encoder.raw_feed(ch.encode_utf8(&mut buf), &mut output);
+           |                assert_eq!((lookup(code) >> i) & 1 == 1, err.is_none(),
+           |                           "{{}} {{:?}}", encoding.name(), ch);
+           |            }}
+           |        }}
+           |    }}
+           |}}
+        """)
+
+    return 8 * len(bitsets) + len(lower) + 2 * len(upper)
+
+# classes of bytes in single-byte encodings for `encoding::detect`, by the decoded general category
+DETECT_CLASSES = ['INVALID', 'CONTROL', 'LOWER', 'UPPER', 'LETTER', 'OTHER']
+
+def detect_class(code):
+    if code is None: return 'INVALID'
+    category = unicodedata.category(unichr(code))
+    if category == 'Cc': return 'CONTROL'
+    if category == 'Ll': return 'LOWER'
+    if category in ('Lu', 'Lt'): return 'UPPER'
+    if category in ('Lo', 'Lm'): return 'LETTER'
+    return 'OTHER'
+
+def generate_detect_table(opts):
+    singlebytes = [('all::ASCII', [], {}), ('all::ISO_8859_1', [], dict((i, 0x80 + i) for i in xrange(0x80)))]
+    with phase('parse'):
+        for expr, index in SINGLE_BYTE_ENCODINGS:
+            singlebytes.append(('all::' + expr, [index], dict(read_index(opts, 'singlebyte', index, []))))
+    # multi-byte encodings with the same decoder share the validator
+    multibytes = [(encname, static) for encname, static, _, _ in DFA_ENCODINGS] + [('gbk', 'GB18030')]
+
+    path = os.path.join(os.path.dirname(__file__), '..', 'detect_table.rs')
+    totalsz = 0
+    with phase('write'), open(path, 'wb') as f:
+        write_fmt(f, {}, """\
+           |// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+           |// https://encoding.spec.whatwg.org/
+           |
+           |//! Per-encoding byte and pair validity tables for the charset detector.
+           |
+           |#![allow(dead_code)] // when every single-byte index is disabled
+           |
+           |use all;
+           |use dfa_table::{{self, Dfa}};
+           |use types::EncodingRef;
+           |
+        """)
+        for i, name in enumerate(DETECT_CLASSES):
+            print >>f, 'pub const %s: u8 = %d;' % (name, i)
+        write_fmt(f, {}, """\
+           |
+           |pub enum Model {{
+           |    /// The class of each byte from 0x80 to 0xff, decoded as is.
+           |    SingleByte(&'static [u8; 128]),
+           |    /// The validator, where bytes are decoded as sequences.
+           |    MultiByte(&'static Dfa),
+           |}}
+           |
+           |/// Models of every encoding supported by the detector.
+           |pub static MODELS: &'static [(EncodingRef, Model)] = &[
+        """)
+        for expr, indices, forward in singlebytes:
+            if indices:
+                print >>f, '    ' + cfg_for_indices(indices)
+            print >>f, '    (%s as EncodingRef, Model::SingleByte(&[' % expr
+            write_comma_separated(f, '        ',
+                ['%s, ' % detect_class(forward.get(i)) for i in xrange(0x80)], width=100)
+            print >>f, '    ])),'
+            totalsz += 128
+        for encname, static in multibytes:
+            expr, indices = LABEL_ENCODINGS[encname]
+            if indices:
+                print >>f, '    ' + cfg_for_indices(indices)
+            print >>f, '    (%s as EncodingRef, Model::MultiByte(&dfa_table::%s)),' % (expr, static)
+        write_fmt(f, {}, """\
+           |];
+           |
+           |#[cfg(test)]
+           |mod tests {{
+           |    use super::{{MODELS, Model, INVALID}};
+           |    use types::DecoderTrap;
+           |
+           |    #[test]
+           |    fn test_single_byte_classes() {{
+           |        for &(encoding, ref model) in MODELS {{
+           |            if let Model::SingleByte(classes) = *model {{
+           |                for b in 0x80..0x100 {{
+           |                    let valid = encoding.decode(&[b as u8], DecoderTrap::Strict).is_ok();
+           |                    assert_eq!(classes[b - 0x80] != INVALID, valid, "{{}} {{:#x}}", encoding.name(), b);
+           |                }}
+           |            }}
+           |        }}
+           |    }}
+           |}}
+        """)
+
+    return totalsz
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('-f', '--flush-cache', action='store_true',
@@ -962,25 +2541,90 @@ def main():
                         metavar='MAX_SEARCH', default='0x200',
                         help='set the max search limit of the unoptimized backward mapping '
                              'for multi-byte indices [default: %(default)s]\n')
+    parser.add_argument('--backward-search', choices=['auto', 'ranges', 'eytzinger'],
+                        default='auto',
+                        help='set the unoptimized backward mapping for multi-byte indices; '
+                             'auto uses sorted pairs in the Eytzinger order only when they are '
+                             'smaller and faster in the worst case than ranges [default: %(default)s]')
+    parser.add_argument('--compress-cold-tables', action='store_true',
+                        help='compress rarely used regions of multi-byte forward tables and '
+                             'expand them on the first access; trades their first access '
+                             'for binary size')
     parser.add_argument('--no-premapping', action='store_true',
                         help='disable premapping; trades table size for decoder performance')
+    parser.add_argument('--profile', action='store_true',
+                        help='report the wall time and peak memory of each generation phase')
+    parser.add_argument('--profile-folded', metavar='PATH',
+                        help='write phase timings as folded stacks (implies --profile)')
+    parser.add_argument('--profile-cprofile', metavar='PATH',
+                        help='write cProfile statistics for the whole generation')
     parser.add_argument('filters', nargs='*',
                         help='substring of indices to regenerate')
     opts = parser.parse_args()
 
+    global profiler
+    if opts.profile or opts.profile_folded:
+        profiler = Profiler()
+    if opts.profile_cprofile:
+        import cProfile
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+
     totalsz = totalszslow = 0
-    for index, generate in INDICES:
+    for index, generate, _ in INDICES:
         crate, _, index = index.partition('/')
         if opts.filters and all(s not in index for s in opts.filters): continue
         if opts.func_filter and generate is not opts.func_filter: continue
         print >>sys.stderr, 'generating index %s...' % index,
-        forwardsz, backwardsz, backwardszslow = generate(opts, crate, index)
+        with phase(index):
+            forwardsz, backwardsz, backwardszslow = generate(opts, crate, index)
         totalsz += forwardsz + backwardsz
         totalszslow += forwardsz + backwardszslow
         print >>sys.stderr, '%d + %d (%d) = %d (%d) bytes.' % \
                 (forwardsz, backwardsz, backwardszslow,
                  forwardsz + backwardsz, forwardsz + backwardszslow)
     print >>sys.stderr, 'total %d (%d) bytes.' % (totalsz, totalszslow)
+    fixedsz, narrowsz, packedsz, npacked = int_table_stats
+    if fixedsz:
+        print >>sys.stderr, ('integer tables took %d bytes with the narrowest types (%d with fixed types) '
+                             'and %d bytes with %d bit-packed tables, each taking a division, '
+                             'a shift and a mask per lookup.' % (narrowsz, fixedsz, packedsz, npacked))
+
+    if not opts.func_filter and (not opts.filters or any(s in 'labels' for s in opts.filters)):
+        print >>sys.stderr, 'generating label table...',
+        with phase('labels'):
+            labelsz = generate_label_table(opts)
+        print >>sys.stderr, '%d bytes.' % labelsz
+
+    if not opts.func_filter and (not opts.filters or any(s in 'dfa' for s in opts.filters)):
+        print >>sys.stderr, 'generating validator tables...',
+        with phase('dfa'):
+            dfasz = generate_dfa_table(opts)
+        print >>sys.stderr, '%d bytes.' % dfasz
+
+    if not opts.func_filter and (not opts.filters or any(s in 'repertoire' for s in opts.filters)):
+        print >>sys.stderr, 'generating repertoire table...',
+        with phase('repertoire'):
+            repertoiresz = generate_repertoire_table(opts)
+        print >>sys.stderr, '%d bytes.' % repertoiresz
+
+    if not opts.func_filter and (not opts.filters or any(s in 'detect' for s in opts.filters)):
+        print >>sys.stderr, 'generating detector tables...',
+        with phase('detect'):
+            detectsz = generate_detect_table(opts)
+        print >>sys.stderr, '%d bytes.' % detectsz
+
+    with phase('metadata'):
+        generate_crate_metadata()
+
+    if opts.profile_cprofile:
+        cprofiler.disable()
+        cprofiler.dump_stats(opts.profile_cprofile)
+    if profiler is not None:
+        profiler.report(sys.stderr)
+        if opts.profile_folded:
+            with open(opts.profile_folded, 'w') as f:
+                profiler.write_folded(f)
 
 if __name__ == '__main__':
     main()
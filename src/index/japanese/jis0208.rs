@@ -828,1125 +828,1435 @@ pub fn forward(code: u16) -> u32 {
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 const BACKWARD_TABLE_LOWER: &'static [u16] = &[
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 80, 81, 137, 16, 8645, 78, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 62, X, X, X, X, X, X, X,
-    X, X, 3528, 7273, 2653, 2601, 3630, 3276, X, X, X, 2619, X, 2895, X, 7274,
-    X, 7275, X, X, X, X, X, X, X, 7716, X, 7715, X, X, X, X, X, 2127, X, X, X,
-    X, X, X, X, X, X, X, 7720, X, X, X, X, X, 2921, 4568, 2689, X, X, 4569, X,
-    3287, 4260, 3447, X, X, X, X, X, X, X, X, 4642, X, X, X, X, 4570, 7806,
-    2010, X, X, 4040, 1808, X, 5221, X, 2104, 1711, X, X, 5218, X, X, 4253,
-    5220, 1463, 5222, X, 5213, 5219, 5226, 2103, 5214, X, X, X, X, X, X, 4196,
-    X, 5431, 2537, 2279, 5429, X, X, X, X, 5430, X, 2843, X, X, X, 5428, X, X,
-    2458, X, X, X, X, 8393, X, 8394, X, X, X, 5433, 5432, 5437, 5057, X, X,
-    5056, 5055, 3852, X, 5064, X, X, X, X, 4005, X, 5058, X, X, X, X, X, 5060,
-    4022, X, 5059, X, X, X, X, X, X, X, 5061, 4687, X, X, X, 4689, X, 4691, X,
-    X, X, 8325, 2429, 4357, X, 4680, 4678, 4690, X, 4685, X, X, X, X, X, X, X,
-    X, X, 8324, X, X, X, 1887, 2202, 4942, 1747, X, X, 4943, X, 3126, X, X, X,
-    X, 4944, 4984, X, 4945, X, 4946, X, X, 4947, X, 4949, X, X, X, X, X, 1527,
-    1800, X, 4896, X, 4078, 3776, X, X, X, X, X, X, X, X, X, X, 1417, X, X, X,
-    X, 1498, X, X, X, 2492, 1632, X, X, 4313, X, X, 8313, X, X, 2716, 3439,
-    2324, 4607, 4608, X, 8487, X, 4298, X, X, 4334, 4610, X, X, X, 2251, X, X,
-    4609, X, 1706, X, 4889, 3572, 3727, 4090, X, X, X, X, X, 3576, X, X, 4898,
-    X, X, X, X, X, 1903, X, X, 4172, X, X, 4056, X, 4993, X, 4890, X, X, 8421,
-    X, 8422, X, X, X, 3672, X, 5653, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 5657, 5654, X, X, X, X, 2341, 2509, X, X, X, X, X, X, X, X, 5971, 5972,
-    X, X, X, X, X, X, X, 5974, X, X, X, X, X, X, X, X, 4314, X, X, 5889, X, X,
-    X, 1511, X, X, X, X, X, X, X, X, X, 5891, X, X, X, 5890, X, 5888, 3236, X,
-    X, X, 5637, X, X, X, X, X, X, X, X, 5635, 2234, X, 5634, X, X, X, X, X, X,
-    5640, X, X, X, X, 5507, X, X, X, 4229, X, X, X, X, X, 8476, X, 6009, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6010, 8477, 3660, X, 1818,
-    4319, X, X, X, X, X, X, X, 4042, 3339, X, X, X, X, 5824, 5826, X, X, X, X,
-    X, 3025, X, X, X, X, X, 5828, 5822, 5556, 5543, X, 5553, X, X, X, 5547, X,
-    X, X, X, X, X, 2844, 5557, X, X, 2932, X, X, X, X, X, X, 5555, 1814, X, X,
-    X, X, X, 5759, X, 8430, 2760, X, X, X, 4151, X, 5756, X, X, X, X, 5751, X,
-    5757, 8432, X, X, 4291, X, 3466, 3511, X, X, X, 6062, X, 6061, X, X, X, X,
-    X, 1557, X, X, X, X, X, 6070, 3737, 6064, X, 6066, X, X, 6068, 2849, X, X,
-    6069, 6067, 2569, X, 6080, X, X, X, X, X, X, X, 6087, X, 6085, X, 6086, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6088, 5917, X, X, X, X,
-    3078, 2467, 5919, X, X, X, X, 5918, 2823, 4662, X, X, X, X, X, X, 5920, X,
-    X, X, 5922, X, 5905, 5921, X, 8458, 5923, 5679, X, X, 5681, 5680, X, 4003,
-    X, X, 2693, 2613, 2479, X, 5682, X, X, X, X, X, X, X, 5684, 2822, X, 5683,
-    X, X, X, X, X, 5685, X, 4002, 3185, X, X, X, X, X, X, X, X, 4034, X, X,
-    5731, X, X, 5732, X, 1644, X, X, X, X, 3861, 4134, 5734, 2540, 2759, 5727,
-    5733, 1575, 8398, X, 3299, X, X, X, 4310, X, X, X, X, 2478, X, X, 3928, X,
-    X, X, 8399, X, 3976, X, X, X, 5453, 5448, X, X, 5451, X, 5450, 8400, 5070,
-    X, X, X, X, X, 3440, 2383, X, X, X, 2204, X, 3366, X, X, X, X, X, X, X,
-    1444, 2709, 2270, 4174, X, X, X, X, X, X, X, 5306, 1416, X, X, 2384, X, X,
-    X, 2841, X, X, X, X, X, X, X, X, X, X, 3371, X, X, 3717, 5312, 3069, 4950,
-    X, X, 4951, X, 3181, X, 1510, 2610, 1443, X, 3062, 1801, 2558, X, 2263, X,
-    X, X, X, X, 3453, X, 2632, 1802, 3267, 3363, 1433, 1904, 3938, X, 2571,
-    2727, 1982, X, 4631, 8318, X, X, X, X, X, 3724, X, X, X, X, 4632, X, 4633,
-    X, 4634, X, X, X, X, 4635, 3763, 2045, 1478, X, X, X, 3508, 439, 440, 441,
-    442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452, 453, 454, 455, 456,
-    457, 458, 459, 460, 461, X, X, X, X, 5, 27, 18, 19, X, 4259, X, X, X, X,
-    3887, X, 8284, X, 4421, X, X, 3265, X, X, X, 4422, 2063, X, X, X, 4423, X,
-    1846, 3211, X, 2608, 4424, X, X, 4425, 629, 630, 631, 632, 633, 634, 635,
-    636, 637, 638, 639, 640, 641, 642, 643, 644, X, 618, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 7324, 8577, X, 3962, 8581, X, 8579, X, 8575, X,
-    8576, X, X, X, X, X, X, 7194, X, X, 3629, 4285, X, X, X, X, 2651, X, X, X,
-    7195, X, X, X, X, 4137, 7197, X, 7196, X, X, 7200, 4168, 8564, X, X, X,
-    3403, 7311, X, X, 7314, 7312, X, 7317, X, X, 8566, X, 7318, 8568, X, X, X,
-    X, X, 7310, X, 8567, 7323, 1587, X, X, 7309, X, 6993, X, X, X, X, 6996, X,
-    6997, X, X, X, X, X, X, X, 2379, 3135, 6995, X, 2784, 3789, X, X, X, X, X,
-    6994, X, X, 2519, X, 3841, 6741, 3478, X, X, 1426, X, X, 6734, X, 6730,
-    3089, 6724, 6732, 6737, X, 3583, X, X, X, 1419, X, 6729, X, 6738, 3847, X,
-    X, X, X, X, 6486, X, 8511, X, X, X, X, 6487, 6488, 6489, X, 6490, 6491, X,
-    X, 6493, 6492, X, X, 6494, X, X, X, X, X, X, 6495, 6335, X, X, X, 6359,
-    6361, X, X, X, X, X, X, 6362, X, X, X, X, X, X, 3891, X, 6363, X, X, X, X,
-    X, X, X, X, 4107, X, 6252, 6253, 2812, X, X, X, X, X, 6254, X, 1738, X, X,
-    X, X, 6256, X, X, X, 2141, X, 1949, X, X, 6257, 2058, X, X, 6258, X, 3005,
-    3264, X, X, X, X, X, 8486, 6150, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 6151, 6154, X, X, X, X, 3691, X, X, X, X, 6829, X, X, 6830,
-    3799, 3723, 6833, X, X, X, X, X, X, X, X, 3194, 6843, X, 6839, X, X, 1672,
-    X, 2213, 2515, X, X, 3743, X, X, X, 2171, 3982, X, 6564, 6562, X, 2301, X,
-    2302, 1482, X, 2421, X, X, X, X, X, 3628, X, X, X, X, X, 6305, X, 6307, X,
-    X, X, X, 6310, X, 6311, X, 6308, 6309, X, X, 6306, 6304, X, X, X, X, 6298,
-    X, X, X, X, X, 6184, X, X, X, X, X, X, X, X, 8489, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 2768, X, X, 7003, X, 7004, 7002, X, 2217, X, 4167, X, X,
-    2522, 3578, X, X, X, 7007, X, 2945, X, 3229, X, X, 4157, X, 7010, X, X, X,
-    2237, X, 6753, X, X, X, X, X, X, X, X, X, X, X, 6731, X, X, X, X, 1778, X,
-    8520, X, X, X, 2813, 6742, X, 6747, 3090, X, X, 6743, 6701, X, 6691, X, X,
-    X, X, X, 6703, X, 6689, 3663, X, X, X, X, X, 4208, X, X, X, 6698, X, X, X,
-    X, X, X, X, 6720, X, X, 7283, X, X, X, X, 2701, X, 7282, X, 7281, X, 3174,
-    X, X, 2240, X, 2948, X, X, X, X, 3681, X, X, X, X, 2656, X, X, X, 1161,
-    1171, X, X, 1170, 1164, X, X, X, 1172, X, X, X, X, X, X, X, X, X, X, 1166,
-    X, X, X, X, 1174, X, X, X, X, 1523, X, 2371, 2835, X, X, X, X, X, X, X,
-    4708, 3449, X, X, X, 4709, X, 1411, X, X, X, X, X, X, X, X, X, 4465, X, X,
-    X, X, X, 4468, 4466, X, X, 1631, X, 3880, 4460, X, X, X, X, 4464, 2244, X,
-    X, 2483, 153, X, X, X, X, 33, X, 135, 136, 126, 125, 166, 167, X, 1210, X,
-    X, X, X, X, 71, 165, X, X, X, X, X, X, X, 163, X, X, 2803, X, X, X, X, X,
-    X, X, 4932, X, 3349, X, X, X, 1540, X, 4930, X, X, X, 4933, X, X, X, X, X,
-    X, X, 4934, X, 5111, 2100, X, X, X, 3766, 8364, X, 2393, 3782, 3295, 3802,
-    5112, X, X, 2745, 1541, X, 5113, X, X, X, 5114, X, 4123, X, X, 3729, X, X,
-    5117, 4771, X, 3596, X, X, 4774, X, X, X, X, X, X, X, X, 4775, X, X, X, X,
-    X, 4777, X, 4776, X, X, X, X, X, 4779, X, X, X, 2839, X, 3771, X, X, X, X,
-    X, X, 1872, 3577, X, X, X, X, X, X, X, X, 5129, 2497, 3973, 3974, X, X,
-    1597, 5134, 8366, X, 5410, X, 5408, 5411, 4254, 5409, X, X, X, X, 3004,
-    5412, X, X, 3119, X, X, 5413, X, X, X, X, 1875, X, 5415, X, 5414, X, X, X,
-    X, 2696, X, 5846, X, X, X, X, X, X, 5839, 3301, 5836, 3346, X, X, X, 5871,
-    X, X, X, 5833, X, 5832, X, 5841, X, X, X, 1472, 6569, X, 3227, X, X, X, X,
-    X, 3627, X, 3160, X, X, X, X, X, X, X, 6571, X, X, 6567, 6570, 6565, X,
-    6568, 3953, X, 6441, 6447, 6440, X, X, 2667, X, X, X, X, 3952, X, X, 2675,
-    X, X, 6443, 6455, X, X, 6451, X, 6454, X, 6452, 6456, 6450, X, 6424, 2964,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 80, 81, 137, 16, 10737, 78,
+    X, X, X, X, X, X, X, X, X, X, 7152, X, X, X, X, X, 7753, 3665, X, X, 7754,
+    7756, X, X, 7757, X, X, 1504, 2875, 2723, 1842, 7428, X, X, X, 3641, X,
+    7430, X, X, X, 4893, 10815, 3138, X, X, 3971, X, X, X, 3425, X, X, X, 155,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5142, 5148, 4907, 4335, X, X, X,
+    X, 3615, X, X, 4909, X, X, X, X, X, X, 3026, X, X, X, X, X, 2763, X, X, X,
+    6560, X, X, 2776, X, 3769, X, 6561, 6559, X, 1831, X, X, 6501, 6503, X,
+    4204, 6502, 6505, 6504, X, 4186, X, 6506, X, 3759, X, 1639, 3794, X, X,
+    6233, X, X, 3740, X, X, X, X, X, X, 3044, 6214, 2090, X, X, X, X, X, 1911,
+    1886, 2510, X, X, X, X, X, X, 6950, X, 6951, X, X, 6949, X, X, X, X, 7771,
+    X, 7772, 7773, X, 7774, X, 7775, 7776, 7777, X, X, 4234, 3558, X, X, X, X,
+    1514, X, 2980, 2559, X, X, X, X, 1879, X, 5563, X, 10752, 4082, 5538, 1878,
+    X, 5545, X, 10882, 10888, X, X, X, X, 2758, 5625, X, 5632, 2626, 1773, X,
+    X, 3209, X, X, 4693, X, 4702, 4695, X, X, 4699, 10798, X, 4700, 4696, X, X,
+    4729, 4810, X, X, 4821, X, X, 4822, 10805, 10804, X, X, 4015, X, X, 2800,
+    X, 7511, X, X, 7510, X, X, X, X, X, X, X, 3990, 3489, X, X, 3797, 3277, X,
+    X, X, X, 1967, 8281, 7329, 8584, 2316, X, X, 8587, 7379, X, X, X, X, 7380,
+    X, 7381, X, X, X, X, 7384, 7382, 7385, 7387, 3144, X, 7419, X, 3836, X, X,
+    X, X, X, X, 7422, 7420, 2318, X, 7421, 7439, 7437, 7438, X, 7440, X, 7441,
+    4305, 7442, 7443, X, 2954, 3692, X, X, X, 3510, 3296, X, X, 10837, X, 3399,
+    X, X, 5128, 1890, X, X, 7797, X, X, X, 7798, 7796, X, X, X, X, X, X, X, X,
+    62, X, X, X, X, X, X, X, X, X, 8403, X, X, X, X, X, X, 10926, 10927, X,
+    4320, X, X, 5901, X, 3002, X, 10757, X, 3170, 4294, 1451, X, X, X, X, X, X,
+    X, 4450, 1627, X, 7415, X, X, X, X, X, X, 7416, X, 2418, X, X, X, 7417,
+    7418, 1505, X, 7429, 3325, X, 4274, 3488, 7423, 4235, X, 2178, X, X, 4194,
+    X, X, 7280, 7279, X, 2313, X, 2338, 2475, X, X, X, X, X, X, X, 3314, X, X,
+    X, X, X, X, X, X, 5799, 10910, 5794, X, 10913, X, 5786, X, 7745, X, X, X,
+    X, X, X, 7746, X, X, 7747, 7748, X, X, X, 6765, X, X, X, X, 4370, 3479,
+    3842, 10995, X, 6778, X, X, 10829, X, X, X, X, X, X, X, X, 5024, 5021, X,
+    5023, X, 5660, 7628, X, X, X, X, X, X, X, X, 6385, 1899, X, X, X, 2469, X,
+    1592, 6035, X, 4184, X, X, 3920, 6036, X, X, 10819, 2215, 3768, 6716, X,
+    6704, X, 10990, 6713, X, X, X, 6723, X, 6708, X, X, 5017, X, X, X, X,
+    10826, X, 3941, X, X, X, X, X, X, 11032, X, X, X, 11034, X, X, 3540, 1726,
+    X, 5717, 5714, 4199, X, X, 10898, X, 3321, X, X, X, 3534, 5715, X, X, 3398,
+    X, X, X, X, X, X, X, 4713, X, X, 4710, X, 10799, 4879, 2099, X, 10811,
+    4006, 4878, X, 3452, 4882, X, 4881, 10812, X, 10813, X, X, 7702, X, X,
+    7701, X, X, X, X, X, 1588, X, X, X, 7699, 7762, 8631, 2340, X, 7763, X, X,
+    X, 5973, 4100, X, 3168, 7764, 7766, 7765, X, 1838, 7371, 4131, X, X, X, X,
+    X, X, 7383, 7373, X, X, 7376, X, 2786, 7071, X, X, X, X, X, X, X, 2330,
+    4431, 7072, X, X, X, 1843, X, X, X, X, X, X, X, X, 7500, X, X, X, 5750,
+    5752, X, 1529, X, X, 2287, 4341, X, 1720, X, 3825, 10903, 5986, X, 1646, X,
+    X, X, X, X, 5982, 10937, 2468, X, X, 3322, 5984, X, 4490, 10769, 3932,
+    3240, 4486, 2148, X, 4483, 4491, 4485, 4278, 4492, 4356, X, X, 3098, 2180,
+    X, X, X, X, X, 7576, X, X, X, X, X, X, 2209, X, 2762, X, X, 3220, 10911, X,
+    X, 5785, 6114, X, 10952, 6115, 3393, X, 1698, 2291, 6116, X, X, 6117, X, X,
+    6118, X, 1638, 4961, X, 4959, 4963, 4960, 3582, 5590, 2838, X, 4964, 10821,
+    X, 4261, X, 7572, X, X, X, 7574, X, X, X, X, X, X, X, X, 1898, 7573, 7596,
+    X, X, X, X, X, X, X, 1719, X, X, X, 7597, X, X, X, 4229, X, X, X, X, X,
+    10948, X, 6009, X, X, X, X, 4520, X, 4518, X, 3053, X, X, X, X, X, 4519,
+    4521, X, X, 11061, X, X, X, 2455, X, X, X, X, X, X, X, X, 7328, 1506, X, X,
+    4286, X, X, X, 7436, 7251, X, 7435, X, X, X, X, 11075, 7541, 7537, X, X,
+    7540, X, X, 11087, 1844, X, X, X, 7542, X, 7543, X, 10986, 4089, 6666,
+    1653, 1784, 6670, X, X, 6672, X, X, X, X, 2119, X, 4362, X, 5180, X, 10843,
+    X, X, 5186, X, 2346, X, 2956, X, 10842, 1461, 1991, X, 2272, X, X, 2721, X,
+    X, X, 5164, 5150, X, X, 10839, X, 5154, 10833, X, 5042, 5041, X, X, 5043,
+    X, X, X, X, 5044, X, 2991, 2634, X, 1692, 2367, 7630, 7629, 4046, X, X, X,
+    X, X, X, X, 7632, 7633, 7631, 7677, X, 7679, X, X, X, X, X, X, 1770, 7658,
+    1526, X, X, 7681, X, 2005, X, X, 7358, 7352, X, X, 7351, X, X, X, X, X, X,
+    X, 5037, 10831, 10832, 4299, X, 5038, 5035, X, X, 4364, X, X, X, X, X,
+    7734, 3176, 2426, X, X, 7738, X, X, 3988, X, X, X, X, X, X, X, X, 3050, X,
+    X, X, 1413, 1506, X, X, 4286, X, X, X, 7436, 7251, X, 7435, X, X, X, X,
+    8603, 2628, X, X, X, 7453, X, 7454, 2863, 7455, X, 4307, X, X, 7450, 7457,
+    7459, 7464, X, 4333, 8604, X, X, X, X, 5468, 7465, X, 8605, X, 7466, 7467,
+    X, 7158, X, X, 7161, 7160, X, 7159, X, X, 7163, 7162, X, 4127, X, X, 2175,
+    X, X, X, X, X, X, X, X, 7178, X, X, X, 3557, 3105, 7228, 1418, 4325, X, X,
+    X, 7233, X, X, X, X, X, X, 3166, X, 6840, 6834, X, X, X, X, X, 3251, X,
+    6851, X, 4051, X, X, X, 7354, X, X, 8593, X, 7357, X, X, X, X, X, X, X,
+    7778, 7779, X, X, X, X, X, 3387, X, 7386, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 1178, 1179, 661, X, X, 672, 663, X, X, 674, 662, X, X, 673, 664,
+    685, X, X, 1567, 4797, X, X, 4799, X, 4798, X, X, X, 4801, X, X, 3441,
+    1494, 1862, 8319, 3109, 1928, 4216, X, 4648, 1620, X, X, 4647, X, X, X,
+    1983, 4537, 1493, X, 2182, 2094, 2659, 3286, 1977, 2985, 2248, 8306, 2333,
+    4539, 4081, 3421, X, X, 7471, 11078, 7468, X, 7469, X, 7470, 7472, X, X, X,
+    11079, X, 11080, 7581, X, 7580, 7582, X, 7579, X, X, X, X, X, X, X, 7585,
+    11090, X, 1965, X, 4126, 3049, X, 6992, 11003, X, X, 2858, 3275, 2783, X,
+    X, X, 4649, X, 4122, X, X, X, X, X, X, X, X, X, X, X, X, 1780, X, X, X,
+    3619, X, 3781, 4489, X, 3933, X, 1619, X, X, X, 4493, 10770, 4571, 4009, X,
+    X, X, X, 2703, 3193, X, 4573, 3545, X, 10782, 4574, X, X, 7619, 7620, X,
+    7621, X, 7622, 7623, 7624, 7625, X, X, X, 7626, 7627, 4367, X, 7669, 7665,
+    7663, 7662, X, X, X, X, X, 7673, X, X, X, X, 4304, X, X, 2219, X, 11041,
+    11035, X, 11037, X, X, 7316, 11062, X, X, X, X, 2177, X, X, X, X, X, X,
+    7341, X, 2790, X, 10931, 5949, X, X, X, 2810, X, X, 5948, X, X, X, X,
+    10932, X, 4495, 3444, X, 4484, X, 2247, X, X, 2246, 4482, X, X, X, 10771,
+    2595, 1632, X, X, 4313, X, X, 10785, X, X, 2716, 3439, 2324, 4607, 4608, X,
+    10959, 2727, 1982, X, 4631, 10790, X, X, X, X, X, 3724, X, X, X, X, 4632,
+    4687, X, X, X, 4689, X, 4691, X, X, X, 10797, 2429, 4357, X, 4680, 4678,
+    4816, X, 2259, 1723, 4818, X, X, X, X, X, 4819, X, 10803, X, X, X, 123,
+    124, X, X, 121, 122, X, X, X, X, X, X, X, X, X, 11102, 7739, 7740, X, X,
+    7741, X, 7020, X, 7017, X, X, 11009, 7024, 2715, X, 2194, X, X, X, 3191, X,
+    10880, 3335, 3519, 1544, X, X, X, X, X, X, X, X, X, X, X, 1491, X, 6652, X,
+    X, 6643, X, 6642, X, 1832, X, 6644, X, 6645, 6646, X, X, 2366, 4270, 6630,
+    X, 4433, X, X, X, 6631, 3915, 1845, X, X, 3011, 2687, X, 3840, 2645, 6608,
+    X, 6609, X, X, X, 1615, X, 6616, 6611, X, X, X, 6612, X, X, 6543, X, X, X,
+    2940, X, 6544, X, 6545, X, X, X, 3878, 6546, 3684, X, 2711, X, X, 3616, X,
+    3742, 6500, 5246, X, X, X, X, X, X, 2124, X, X, X, X, 7049, 7051, X, X,
+    7052, 4108, X, 7088, 7089, 1893, X, 7091, 3638, 3164, X, X, 3746, 3412,
+    7087, X, 3986, 7106, X, 8542, 7108, 7110, X, 7111, X, X, X, X, X, X, X, X,
+    X, 6632, 2305, 6633, 3709, X, 6647, X, 6331, 4658, 6338, 6332, X, X, 6341,
+    X, X, X, X, X, X, X, 6347, 6308, 6309, X, X, 6306, 6304, X, X, X, X, 6298,
+    X, X, X, X, X, 1788, X, X, X, X, X, X, X, X, X, X, 4925, 4926, X, X, X, X,
+    5686, X, X, X, X, X, 5687, 5688, X, X, X, 5689, 2413, 3129, X, 2598, X, X,
+    2808, X, X, 5478, X, X, 3429, X, 5476, 3112, 5257, X, X, X, X, X, X, X,
+    5258, 5259, 3927, X, 5261, 5260, 2662, X, 2203, 5046, 4047, 3606, 5047, X,
+    2266, X, X, X, 1797, X, 3202, 2023, X, 4903, X, X, X, X, X, X, 4069, X,
+    4906, X, 4904, X, X, 4902, 3449, X, X, X, 4709, X, 1411, X, X, X, X, X, X,
+    X, X, X, 1659, X, X, X, X, X, 4765, 4627, X, X, X, X, 4629, 1626, 3991, X,
+    2441, 4630, X, X, 3064, X, X, 5211, X, 5212, X, X, 5201, 2535, X, 5205,
+    3155, 2273, 5187, 2840, X, 2462, X, X, X, X, 4988, X, X, 4989, X, X, X, X,
+    X, X, 3661, X, X, X, X, X, X, 5924, X, X, 8468, X, X, X, 8466, X, X, X, X,
+    X, X, X, 5989, X, 4243, X, X, 2809, 2998, X, X, X, X, X, X, X, X, X, X, X,
+    3760, X, X, 7784, X, 1840, 8599, 1839, 7391, X, 7392, X, 7393, 7394, X, X,
+    X, X, X, X, 10851, X, X, X, X, 3733, 5370, X, X, X, 4987, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, 8323, 8334, 2009, X, 3266, X, X, X, 2146, 4452, X,
+    X, X, 3575, 10758, X, X, X, 138, X, 139, X, X, X, X, X, X, X, X, X, X, X,
+    X, 3956, X, 4324, X, 4277, 2710, X, X, 6469, 8509, X, 6431, X, 3007, X,
+    6427, 6432, 6434, X, 6161, X, X, X, X, X, X, X, X, X, X, X, X, 6163, X,
+    5883, X, X, X, X, X, X, X, 3950, X, X, X, 5893, X, X, 1997, 5950, 5952, X,
+    5951, X, X, X, X, X, X, X, 5953, X, 1996, X, X, 5724, 5729, X, X, X, 2997,
+    3652, X, 3736, X, X, X, 1948, X, 5991, 4228, 8469, X, 4245, X, X, X, X, X,
+    X, 6571, X, X, 6567, 6570, 6565, X, 6568, 3953, X, 6252, 6253, 2812, X, X,
+    X, X, X, 6254, X, 1738, X, X, X, X, 6928, 4156, X, X, 6929, 6930, X, X,
+    3921, 6931, X, 2381, 1554, X, 7001, 2123, X, X, 2521, X, X, 2520, X, 4368,
+    7000, 6999, 3014, X, 1651, X, 3954, X, X, X, X, 2128, 2033, X, 6656, X,
+    1671, X, X, 6653, X, X, X, X, X, X, 3830, X, X, X, 2576, X, 6655, 6636, X,
+    X, X, X, X, X, 3379, X, X, X, X, X, X, X, X, 8595, X, X, X, X, X, X, X,
+    11024, X, X, X, X, X, 3385, X, X, 5438, X, 5434, 10864, 1693, 5435, 5436,
+    3718, X, X, X, X, 3824, 2109, 5460, X, 2015, 1543, 2280, 5461, X, 5462,
+    2712, 3073, 10873, 10754, 4661, 3037, 3036, 3157, 5477, 2807, 4102, 5479,
+    5480, 4207, 10876, X, X, X, 5485, X, X, 2281, X, 3624, 5511, 2136, 2110,
+    3460, 10881, X, 5509, X, 1447, X, X, X, X, 5512, 5514, X, 7703, X, X, 7700,
+    X, 7706, X, 7707, X, X, X, X, X, X, X, 4642, X, X, X, X, 4570, 7806, 2010,
+    X, X, 5031, X, X, X, X, X, X, X, X, X, 5033, X, 5034, X, 2563, 4874, X, X,
+    X, X, 1457, 4875, X, X, X, X, X, 4876, X, 1538, 3056, 2254, 2198, 2044, X,
+    X, 4664, 3196, 3195, 1984, 2729, 4665, 4663, 1633, 6563, 4552, 3980, 4553,
+    X, 4554, 4555, 2798, X, 2581, X, X, X, 8308, X, X, 8357, X, X, X, X, X, X,
+    X, X, 5024, 5021, X, 5023, X, 4852, X, 4851, X, 2327, X, 4853, 4855, 4854,
+    X, X, 4857, X, 4846, 4859, 4669, X, 4327, X, X, X, 3935, X, 3361, 2227,
+    2335, X, X, X, 4677, X, 4259, X, X, X, X, 3887, X, 8284, X, 4421, X, X,
+    3265, X, X, 4866, X, X, X, X, X, X, 3902, 4867, 8338, X, X, X, 1635, 4687,
+    X, X, X, 4689, X, 4691, X, X, X, 8325, 2429, 4357, X, 4680, 4678, 4575,
+    1705, X, X, X, 4576, 1980, X, 3521, 1593, 2679, X, X, 3666, 4577, X, 502,
+    503, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, X,
+    11068, X, X, X, 7367, 7365, X, 3189, X, 7369, X, X, X, X, X, 2670, X, 2609,
+    2622, X, 2717, X, 3697, X, 8322, X, 4660, 4546, X, 4547, X, X, 3543, 1566,
+    X, X, 4550, 2442, X, 4549, 2387, X, 4551, 8287, 1860, X, 8288, X, X, X, X,
+    X, 4453, 1452, X, X, 2225, 1861, 3849, 297, 298, 299, 300, 301, 302, 303,
+    304, 305, 306, 307, 308, 309, 310, 311, 312, 1148, 1149, 1150, 1151, 1152,
+    1153, 1154, 1155, 1156, 1157, X, X, X, X, X, X, 5129, 2497, 3973, 3974, X,
+    X, 1597, 5134, 8366, X, 2633, X, X, X, X, X, X, 4976, 4977, 2597, 2831,
+    3561, 2871, 3753, 3573, 4790, X, X, 3917, 4792, X, X, X, 4794, 4793, X,
+    4795, X, 4796, X, 2154, 2987, X, X, X, X, X, 2088, X, X, 4644, X, X, X, X,
+    4645, 1515, 1902, 4525, 4526, X, 1612, X, X, X, X, 4524, X, X, X, X, X, X,
+    5349, X, 4087, X, 2915, X, X, X, X, X, 5759, X, 8430, 2760, X, X, X, 4151,
+    X, 5756, X, 2282, 1783, X, X, X, X, X, X, 5510, 1775, 5516, X, X, X, X,
+    5906, X, X, X, 5898, X, 2074, X, X, X, X, 5904, 2134, 3190, 5845, 3598, X,
+    X, 5852, X, X, X, X, X, X, X, X, X, 3111, X, X, 2454, 5313, X, 5315, 5057,
+    X, X, 5056, 5055, 3852, X, 5064, X, X, X, X, 4005, X, 5058, X, 1636, 4918,
+    X, X, X, X, X, X, 2564, X, 4917, 2156, X, X, X, 5242, X, X, 5243, 2358,
+    5241, 5239, 5238, 5245, 5237, 5247, X, X, 8421, X, 8422, X, X, X, 3672, X,
+    5653, X, X, X, X, X, 6184, X, X, X, X, X, X, X, X, 8489, X, 4062, X, X, X,
+    X, 2764, X, X, X, X, X, X, X, X, X, 5755, 5753, X, 3804, X, X, X, 2469, X,
+    1592, 6035, X, 4184, X, X, 3920, 6036, X, X, 8347, 6004, X, X, 2377, X, X,
+    6007, X, X, X, X, X, X, X, 6008, X, 1765, X, 5805, 5810, 5811, X, X, X, X,
+    X, X, X, 3177, 3159, X, 5612, 5582, X, 5601, X, X, X, X, X, X, 5593, X, X,
+    5588, 5585, 3734, 3700, X, X, X, X, X, 3428, X, 4262, X, 5404, 2585, X, X,
+    5405, 3268, X, X, X, 5131, X, X, X, X, X, X, 1684, X, X, X, X, 8429, X, X,
+    X, X, X, X, 4181, 5749, X, X, X, 4229, X, X, X, X, X, 8476, X, 6009, X, X,
+    X, X, 6756, X, X, X, X, X, X, X, 6763, X, X, 6755, 6786, 6775, X, X, 6779,
+    X, X, 1585, X, 3546, X, 6780, 6783, X, X, X, 7212, X, X, X, 4606, 4605, X,
+    X, X, X, 7213, 6471, 7214, 7291, 7292, X, X, X, X, 3713, 2400, 2602, 7293,
+    X, 7294, 4233, 2668, 4119, 4273, 8590, X, X, X, X, 2177, X, X, X, X, X, X,
+    7341, X, 2790, X, 7020, X, 7017, X, X, 8537, 7024, 2715, X, 2194, X, X, X,
+    3191, X, 1552, X, 6663, 6662, X, X, X, X, 6668, 6664, 6667, X, X, X, X,
+    7330, X, X, X, 8274, X, X, 3550, X, 3436, X, X, 7269, X, X, 8551, X, X, X,
+    7270, X, X, X, X, X, X, 7680, 7678, 3208, X, X, X, X, X, X, X, 1166, X, X,
+    X, X, 1174, X, X, X, X, 4777, X, 4776, X, X, X, X, X, 4779, X, X, X, 3925,
+    X, X, X, 3100, X, X, X, X, 3327, X, 8336, 4843, 3989, X, X, X, X, X, 3726,
+    X, X, 4675, X, 1847, 4670, 4671, 4673, X, 1167, X, X, X, X, X, 1168, X, X,
+    X, X, X, X, X, X, X, 10875, X, X, X, X, X, X, 4487, 4496, X, X, 3057, X,
+    2197, X, 3631, X, 5960, 4419, 1518, X, X, 1769, 4420, 2917, 4639, 1933,
+    3879, X, X, X, X, 2796, X, X, 10982, X, 2824, 3029, 6459, X, X, 6461, 6462,
+    X, X, 6458, 6460, X, 5111, 2100, X, X, X, 3766, 10836, X, 2393, 3782, 3295,
+    3802, 5112, X, X, 7786, X, 7787, X, X, X, X, X, X, X, X, X, X, 7789, 10716,
+    10717, 10718, 10719, 10720, 10721, 10722, 10723, 10724, 10725, X, X, X, X,
+    X, X, 10956, X, X, X, X, X, X, X, 3738, X, 1609, X, X, X, X, 10823, X,
+    3034, 1853, X, 4994, 4049, X, X, X, 98, 97, X, X, X, X, X, X, X, X, 100,
+    99, X, X, 2885, X, X, X, X, X, 4811, 4814, X, 2098, X, X, X, X, 3400, 5354,
+    X, X, X, 5355, X, 3838, X, 3608, 2446, X, 5143, X, X, X, X, X, X, X, X,
+    5149, X, X, X, X, X, 2805, 5184, 3532, X, X, X, X, X, X, X, X, 5380, X, X,
+    X, 5381, 5343, X, X, 5748, X, X, X, X, 2999, X, 5745, X, 4211, X, X, 3499,
+    5739, 1694, 2362, X, 5515, X, 5531, 1756, X, X, 5529, 5533, X, 3461, X, X,
+    X, 2111, X, 5761, X, X, X, 5783, 2708, 2187, X, 5798, X, 5792, 3556, 5577,
+    3551, X, X, X, X, X, 8412, X, 5581, 5568, X, 2013, 5571, 2692, 2903, X,
+    5399, X, 2929, 3391, X, 3822, 5400, X, X, X, X, X, X, X, 6204, 4012, X, X,
+    X, 6203, X, X, 1484, 6162, X, X, X, X, 3898, X, X, X, X, X, X, 2685, 4267,
+    X, X, 6128, 3625, X, X, 4010, X, 1549, X, 1558, X, X, 6129, X, X, 6131, X,
+    X, X, 6130, 3463, X, X, X, 2938, 5664, X, 6132, 4074, 6090, 6091, 6092, X,
+    6093, X, X, 6089, X, X, X, X, X, X, X, X, 6638, 6637, 6640, X, X, 6639, X,
+    6641, 6619, X, X, 2854, X, 1670, X, 6620, 4284, X, 2548, X, X, 2644, X, X,
+    2516, X, X, 2001, 2953, 4361, 4055, 6572, 2965, X, X, X, X, X, 6865, X,
+    8528, X, X, X, X, X, 6885, 6889, 6884, 6978, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 187, 612, 613, 614, 615, 616, 617, 619, 620, 621, 622, 623,
+    624, 625, 626, 627, 628, X, 11081, 2949, X, X, 11082, 4128, X, X, 2950, X,
+    X, 7473, X, 3748, X, 4277, 2710, X, X, 6469, 10981, X, 6431, X, 3007, X,
+    6427, 6432, 6434, X, 5102, X, X, X, 10755, X, X, 5103, X, 1989, X, 5104, X,
+    5105, X, 7639, 3864, 7637, X, X, 7640, 7641, X, X, X, X, X, X, X, 7642,
+    7712, 7711, X, X, X, X, X, X, X, 7713, X, X, 1516, 7708, 7709, X, 8596, X,
+    X, X, 7367, 7365, X, 3189, X, 7369, X, X, X, X, X, 5897, 5902, X, X, 1579,
+    X, X, 10925, X, X, X, 4541, X, 8307, 3571, X, X, 3027, 4543, 4544, 3677,
+    2249, 4350, 4545, X, X, 11094, X, 7636, 11093, X, X, X, X, X, X, X, X, X,
+    X, 1664, 6817, 6818, X, X, X, 3542, X, X, 3961, X, 7260, X, 2594, X, X, X,
+    X, 7261, 2816, 8583, 7333, 7335, X, 8582, 2024, X, 3796, X, X, 2603, 4326,
+    X, 7331, 2437, 7395, X, 1841, 1744, 2317, 3687, X, 7397, 7396, X, X, X, X,
+    7398, X, X, 2619, X, 2895, X, 7274, X, 7275, X, X, X, X, X, X, X, 7326, X,
+    7325, X, X, X, X, X, X, 7685, X, 7686, X, X, X, X, X, X, X, 2043, X, X,
+    2147, X, X, X, X, X, X, 5341, X, 5345, X, X, X, 3699, 3458, X, X, 3516,
+    5697, 3735, X, 8423, X, 3756, X, X, 4092, X, X, X, 5698, 5482, 3459, 5419,
+    5423, X, 1926, X, 3610, X, X, X, X, 5484, X, 2755, 3701, 5268, X, 5269,
+    5270, 3156, X, X, X, 2206, X, X, 4106, X, X, X, 3975, 3426, 2577, X, X,
+    3063, 4225, X, X, X, X, X, X, 4985, X, 4986, 3531, 4807, X, 2417, X, X, X,
+    X, 2022, X, X, 3970, X, X, X, 4805, 4808, 4651, X, X, X, X, 4653, 4652, X,
+    2882, 1528, X, X, X, 1565, 4654, X, 376, 377, 378, 379, 380, 381, 382, 383,
+    384, 385, 386, 387, 388, 389, 390, 153, X, X, X, X, 33, X, 135, 136, 126,
+    125, 166, 167, X, 1210, X, X, 4301, 5983, X, X, X, X, X, X, X, 5985, X,
+    10936, X, X, 4866, X, X, X, X, X, X, 3902, 4867, 10810, X, X, X, 1635,
+    2493, 4938, X, X, 2261, 4939, 10817, 2533, 3125, X, 4940, 4941, 2501, 2262,
+    X, 4091, 10818, X, 2605, 4954, 1868, 3527, 4050, 4955, X, 4956, X, X, 3816,
+    X, X, X, 689, X, X, X, X, X, X, X, X, 679, X, X, X, X, 3867, X, X, X, 3530,
+    X, 3689, X, X, X, X, X, 4999, X, 5001, X, X, X, X, X, X, X, X, 3994, X, X,
+    4844, X, X, 4849, X, 4298, X, X, 4334, 4610, X, X, X, 2251, X, X, 4609, X,
+    1706, X, 1211, X, X, X, X, X, X, X, X, 162, X, X, 164, 70, 1215, X, 11096,
+    X, X, 7645, X, X, X, X, 7648, X, 11097, X, X, X, X, 3359, 4588, X, X, 3108,
+    X, X, 2428, 4589, 4590, 3023, X, 4587, 3683, 1936, X, X, X, X, X, X, X, X,
+    1678, X, 4488, 3416, X, X, 4061, X, X, 4871, X, 3172, X, 3406, 3133, 3814,
+    4872, 4873, 1594, X, 3725, 3121, 3179, 1981, X, X, 3555, 3212, X, 3649, X,
+    3993, X, 4643, X, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292,
+    293, 294, 295, 296, 176, X, 75, 76, X, X, X, X, X, X, X, 101, X, X, X, X,
+    4745, 4743, X, 4800, X, X, X, X, X, X, X, X, 4705, X, X, X, X, X, X, X,
+    4150, X, X, X, 5788, X, X, 5781, 3465, 8416, X, X, X, X, 2758, 5625, X,
+    5632, 2626, 1773, X, X, 3209, X, X, 5881, X, X, X, X, X, X, 5880, X, X, X,
+    X, X, X, 6449, 6457, X, 6465, 6464, X, X, 4037, X, X, 8510, X, 2824, 3029,
+    6459, X, X, 6461, 6462, X, X, 6458, 6460, X, 2544, X, X, X, 6201, 6196, X,
+    X, X, 6202, 6197, X, X, X, X, 3691, X, X, X, X, 6829, X, X, 6830, 3799,
+    3723, 6833, 6873, X, 6890, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 10795,
+    10806, 10807, 10828, 10867, 10883, 10885, 10928, 10934, 10957, 10965,
+    10966, 10967, 10969, 10973, 10976, 10985, 10996, 10998, 10999, 11008,
+    11016, 11018, 11019, 11022, 11050, 11057, 11073, 11085, 11086, 11088,
+    11101, X, X, 5809, X, X, X, 4182, 5804, X, X, 3397, X, X, 5806, X, 10914,
+    2452, X, X, 6120, X, X, 6119, X, X, 6121, 6122, 10955, 10953, X, 10954, X,
+    2740, X, 4972, X, X, 2990, X, X, X, 2741, X, X, X, 10822, X, 7600, X, 7601,
+    7602, X, X, X, 2321, 8619, X, X, 8620, X, 7603, 7604, 7646, X, X, X, X, X,
+    7649, X, X, 2242, 7647, X, X, X, X, 7650, 2339, 4066, X, X, 7710, X, X, X,
+    X, X, X, 8628, 3965, X, X, 7718, 3052, 7782, X, X, X, X, X, X, X, X, X, X,
+    7783, X, X, X, 11010, X, X, 7046, X, 2554, X, 7048, 7047, 3831, X, X, 7050,
+    2041, X, X, 2669, X, 3505, X, X, 10747, X, X, X, X, X, X, X, 4674, X, 1938,
+    2884, X, 3866, 4672, 4668, 2228, X, 1181, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 6867, 6923, 6925, X, X, 2212, 6913, X, 1442, X, X, X, X, X, X,
+    X, 6924, 6987, X, 8530, 2084, X, X, 6986, 3188, 1892, X, X, 6989, X, 6990,
+    X, 2782, 7034, 4191, X, X, X, X, 7037, X, 7040, X, X, 7038, 3780, X, X, X,
+    7496, X, X, 7497, X, 7498, X, X, 7499, X, X, X, X, 2888, X, X, 3784, 1545,
+    X, X, X, X, X, 3702, 10896, 1963, 3430, X, 5787, 5796, 1424, 1521, 10912,
+    X, 1622, X, 5789, 3113, 5780, 5782, 2288, 3676, X, 3772, X, 6046, 4241,
+    2112, 6047, X, 6045, 3719, 6048, X, 6049, X, 10951, 6749, 4053, X, X, X, X,
+    6752, X, X, 6745, 6748, X, 10748, X, X, X, 2081, 4619, X, 4620, X, X, 4621,
+    4622, 2596, X, X, X, 2252, 4103, 8296, X, 8302, 4497, X, X, 8300, 4498,
+    4502, 1455, X, X, X, X, X, 3901, 4438, 3967, 4439, X, 2243, 1480, 4029, X,
+    1971, X, X, 1972, 1973, 3355, 4257, X, X, 1778, X, 10992, X, X, X, 2813,
+    6742, X, 6747, 3090, X, X, 6743, 1586, 3051, X, 2176, X, 4193, X, 11020,
+    7248, 3395, X, X, X, 3095, 2592, 7249, 2896, X, X, X, X, X, X, X, 2897,
+    7332, 7334, X, X, 11060, 11058, X, 10929, X, 3590, X, X, X, X, 3468, 5914,
+    X, X, X, X, 5916, X, 4467, 10763, X, 10766, X, 4470, X, 4463, X, 10765,
+    1974, X, 1454, X, X, 7575, X, X, X, X, X, X, X, X, X, X, 7566, 7567, X,
+    2087, 7264, X, 7265, X, X, X, 3843, X, X, X, X, 1743, X, X, 7187, 7189,
+    3922, 7186, X, X, X, 7188, X, 7192, 7190, 1896, X, 7191, 7239, 7240, 7241,
+    3504, 3198, 1476, 7245, X, 7246, 7804, X, X, 3130, X, 7247, X, 6895, 6894,
+    6825, X, X, X, 6899, X, X, X, X, X, X, X, X, 3846, X, 7523, X, X, X, X,
+    7524, 7541, 7537, X, X, 7540, X, X, 8615, 1844, X, X, X, 7542, X, 7543, X,
+    3536, 2894, X, X, 3252, X, 2061, X, 7243, 4158, 1534, X, 3908, 1662, 7238,
+    2041, X, X, 2669, X, 3505, X, X, 8275, X, X, X, X, X, X, X, 7716, X, 7715,
+    X, X, X, X, X, 2127, 7790, 7791, 4309, 7788, X, X, 7792, 7793, X, X, 7795,
+    X, 7794, X, X, X, 7354, X, X, 11065, X, 7357, X, X, X, X, X, X, X, 3213, X,
+    X, 1634, X, X, X, X, X, X, 5466, 5467, 4099, X, 4045, 4033, 4007, 2448,
+    5469, X, 4197, 5282, 5283, 5287, 3457, 5284, 2274, 2975, X, X, 5301, 3685,
+    X, 3183, X, 5071, 5072, 3620, X, X, X, X, 5073, 4316, 4336, X, X, X, X,
+    5075, 3882, 4290, X, X, X, X, X, X, X, X, 1681, 4835, X, X, X, X, 2432,
+    3320, 5464, 4338, X, X, X, 3977, X, 3300, 5465, 1877, 1463, 5222, X, 5213,
+    5219, 5226, 2103, 5214, X, X, X, X, X, X, 4196, X, 1609, X, X, X, X, 8351,
+    X, 3034, 1853, X, 4994, 4049, X, X, X, 5384, 5383, X, X, X, X, X, 5351,
+    5385, 5373, X, X, 2500, 1596, 2925, 5116, 5115, 2101, 3153, X, 5121, 5119,
+    X, 5118, 4236, 2230, X, X, X, 3845, 5569, 3143, X, X, X, 5575, 3038, X,
+    5566, 5579, 5578, X, 3298, X, X, X, X, X, X, X, 1962, X, X, X, X, X, 1993,
+    5036, X, X, X, X, X, X, X, X, X, X, X, X, 5032, X, X, 5413, X, X, X, X,
+    1875, X, 5415, X, 5414, X, X, X, X, 5857, 5855, X, X, 5858, X, X, 5861, X,
+    X, X, 5854, 5723, X, 5722, 2070, X, X, 1610, X, X, 2376, 5716, 5718, X, X,
+    X, X, 6014, X, X, X, X, X, X, X, 1530, X, X, X, 2517, 3250, X, X, X, X, X,
+    6621, 6622, 1520, X, 6623, X, 1826, X, X, X, X, X, X, X, X, 3224, X, X,
+    3006, X, X, 3261, 3082, X, 6261, 6263, 6260, 6262, X, X, X, X, X, X, 2069,
+    2639, 2511, X, X, X, X, X, X, X, 6232, X, 2640, X, X, X, X, 6845, X, X,
+    6847, X, X, X, 6848, X, X, X, 6846, 6883, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 6881, 6954, X, X, X, 6957, X, 6956, X, X, X, 6959, X, X, 6958, X,
+    6960, 2944, 7006, X, 7011, 2238, 7008, 7009, 8533, 7005, X, X, X, 2979,
+    3518, X, X, 4271, X, X, X, 4355, X, X, X, 7015, 7026, 3310, X, 7025, 8535,
+    2649, X, 7058, 7059, X, X, 7060, X, X, 7061, 7062, X, X, X, X, X, 7584, X,
+    7587, X, X, 2008, 7586, X, X, X, 7588, 7598, X, X, X, 2900, X, X, X, X, X,
+    X, X, X, X, X, 7599, 7643, X, X, X, X, X, X, X, 7644, X, 4025, 2456, X,
+    2439, 3022, X, 3020, X, 7321, X, 7315, 7320, X, 4076, X, 3313, 7322, 7319,
+    X, X, X, 2222, X, 7781, X, X, X, X, X, X, X, X, X, X, 6151, 6154, X, X, X,
+    X, 6821, X, 6822, 2593, X, 6824, X, 3228, X, 2121, 1725, X, 8512, X, 6511,
+    2085, X, X, X, 3009, 1912, X, X, X, X, 6515, 6512, 6490, 6491, X, X, 6493,
+    6492, X, X, 6494, X, X, X, X, X, X, 6495, 6477, X, 6476, 6478, 6479, X,
+    6480, X, X, X, X, 6482, 6483, X, X, X, 1679, X, X, 2827, 6982, X, X, X, X,
+    X, X, X, X, 3146, X, X, 7577, X, X, X, X, 10901, X, X, X, X, X, X, 4181,
+    5749, X, X, X, 4511, 4514, 4510, 2385, X, 2724, X, X, X, X, X, X, 2092, X,
+    X, 3678, X, 7313, X, 2789, 11042, X, X, X, X, X, X, X, X, 2901, X, X, X,
+    5009, X, X, 2423, X, 3894, X, X, X, 4850, X, 3232, X, X, 1682, X, 2802, X,
+    X, X, 4893, 8343, 3138, X, X, 3971, X, X, X, 3425, X, X, X, 5026, X, X,
+    5027, X, X, X, X, X, X, X, X, X, 2902, X, X, 5025, 8358, X, 2372, 4820, X,
+    X, 4817, X, X, X, X, X, X, X, X, X, X, X, X, 2386, 4170, X, X, 5017, X, X,
+    X, X, 8354, X, 3941, X, X, X, X, X, X, 2047, X, X, X, X, X, X, X, X, X,
+    1850, X, X, X, X, X, X, 6542, X, X, X, 6541, X, X, X, X, X, 3103, X, X, X,
+    X, X, X, X, 3888, X, X, 6866, X, X, X, X, X, X, X, X, 6875, X, X, X, 6869,
+    1767, X, 3958, 6941, X, X, X, X, X, X, X, X, 8273, 6953, 6943, X, 6613, X,
+    3102, X, X, X, X, 6615, 6614, 6617, X, X, X, X, 6618, 6603, X, X, 3030, X,
+    6604, X, X, 6606, X, 6610, X, X, 6607, 6605, 3602, 3828, 6584, X, 6583,
+    2303, 4374, X, X, X, X, X, X, X, X, X, 6600, 2343, 6586, X, X, 6590, X, X,
+    X, 3307, 3855, 3010, X, X, X, X, 3161, 6594, X, 6595, 6591, X, X, X, X,
+    6592, X, 6593, X, X, X, X, 2304, 6596, X, X, 6599, 6598, X, X, X, 3983,
+    6602, X, X, X, X, X, X, 7123, X, X, X, 7122, 7125, X, 1966, X, 7129, 7141,
+    X, X, X, 7142, 7140, X, X, X, X, X, X, X, X, X, X, 4179, X, X, X, X, X,
+    5997, X, X, X, 6000, 2235, 1548, 6002, X, 2899, 5999, 5956, 5957, 5955, X,
+    X, X, X, X, X, 2614, X, X, 3517, 1998, X, X, 5995, 4283, 2028, 3757, 3613,
+    X, X, X, 5996, X, X, X, X, 5998, 2210, X, 5954, X, X, X, X, 2046, X, 3039,
+    X, 2348, X, X, X, X, 4054, X, X, 3762, 6240, 6241, 3248, X, 4268, X, X,
+    6243, 4155, X, X, 6220, X, 6219, 3043, 6216, X, X, 6218, X, X, 2674, 2851,
+    6217, 6164, X, X, 3500, X, X, 6165, X, X, 6166, X, 6170, 6168, 6169, X,
+    6167, 6114, X, 8480, 6115, 3393, X, 1698, 2291, 6116, X, X, 6117, X, X,
+    6118, X, 5849, X, 5848, 5850, X, X, X, X, X, 5853, X, X, X, X, X, 6303,
+    3773, X, 3671, 3472, X, 2031, 6302, 6300, X, 3686, 2772, 6281, 6282, 2686,
+    X, 3501, 6283, 8500, X, X, 3203, 8502, X, 6284, X, 3223, 1421, X, X, X, X,
+    X, X, 6250, X, X, X, X, X, X, X, X, 7132, 7133, 4192, X, X, X, X, 3484,
+    7171, 7173, X, X, X, X, X, X, X, X, X, X, X, X, 7174, X, 3899, X, 4043,
+    6762, 6761, X, 6757, 6758, X, 1525, X, X, X, X, 6760, 8525, X, X, X, X, X,
+    X, X, X, 6790, 6788, X, X, X, X, X, 7301, 7302, X, X, X, X, X, 7300, X, X,
+    7304, 7356, 3396, X, X, X, X, 7349, 7350, 7353, X, X, X, X, 7355, 8594, X,
+    7064, X, X, X, X, 3483, X, 7066, X, 3960, X, 7067, X, 7068, X, 6712, X, X,
+    X, 2910, X, 8517, X, X, 1917, X, 2034, X, 6707, X, 6374, 6373, 6372, X, X,
+    X, X, X, 6376, X, X, X, 6377, 2939, X, 6080, X, X, X, X, X, X, X, 6087, X,
+    6085, X, 6086, X, X, 4135, X, X, X, 3895, X, 6101, X, X, X, 6100, X, X, X,
+    6699, X, 6700, X, 1654, X, X, X, 1611, 6697, X, X, 8516, 2215, 3768, 6716,
+    X, 6704, X, 8518, 6713, X, X, X, 6723, X, 6708, X, X, 6733, X, 6728, X, X,
+    X, X, X, X, 2778, X, X, X, X, 8592, X, X, 1718, X, X, X, X, 7345, 7346,
+    3324, X, 7041, X, X, X, X, X, X, X, 7045, X, X, 7042, X, 7044, 7043, 7069,
+    X, X, X, X, 7070, X, X, X, X, 3535, X, X, X, X, X, 3316, X, 7687, X, 3688,
+    X, 7692, 7688, X, X, X, 6699, X, 6700, X, 1654, X, X, X, 1611, 6697, X, X,
+    10988, 3093, 7114, X, 7115, 3834, X, 11015, 1894, X, X, X, X, X, X, X, X,
+    4750, X, 4755, X, X, X, 4753, 4752, X, 2833, X, 4030, 4480, 4481, X, X, X,
+    X, X, X, X, X, 2635, 4494, 455, 456, 457, 458, 459, 460, 461, X, X, X, X,
+    5, 27, 18, 19, X, X, 3187, X, X, 5993, 10943, X, X, 10945, 10944, X, X, X,
+    10946, X, 4604, 4601, X, 4600, X, X, X, X, X, X, 4276, 10784, X, X, 2250,
+    10788, 4113, 3564, X, X, 3934, 4623, 10789, 4624, X, X, X, X, 4626, X,
+    4628, 4655, X, 10793, 2184, X, X, 4656, X, X, X, X, 1957, X, X, X, X,
+    11064, X, X, 1718, X, X, X, X, 7345, 7346, 3324, X, 6015, X, X, X, 10942,
+    X, X, 5994, X, X, X, X, X, 2190, X, 2093, X, X, 4580, 10783, X, 4312, X, X,
+    X, X, X, 2704, X, X, 8622, X, 7636, 8621, X, X, X, X, X, X, X, X, X, X,
+    5962, X, X, X, X, X, 6305, X, 6307, X, X, X, X, 6310, X, 6311, X, 3675, X,
+    X, 3707, X, X, X, X, 4246, 6044, 6042, 3255, 2919, X, X, 6073, X, 2543,
+    2364, X, X, 3470, 6074, X, 3332, X, X, 6076, X, 5816, X, X, X, 1820, X, X,
+    X, X, X, X, X, X, X, X, X, 7267, X, X, 11021, X, 5597, X, X, 4340, 5600, X,
+    X, 10886, X, X, 2845, 5599, X, X, X, 2091, 3106, 1665, X, X, X, X, 8277,
+    2682, X, X, 8295, 4474, X, X, 7269, X, X, 11023, X, X, X, 7270, X, X, X, X,
+    X, X, 89, 88, X, X, X, X, X, X, X, X, X, 4465, X, X, X, X, X, 4468, 345,
+    346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+    140, X, 156, 141, X, X, X, 157, 119, X, X, 120, X, X, X, X, 4749, X, 4751,
+    2733, 1522, X, X, 4754, X, X, X, X, 3869, X, X, 3497, X, 2105, X, 5235,
+    5230, X, 5236, X, 5015, X, X, 5016, 5010, 1710, 5011, 5020, 5019, 5018,
+    5014, X, X, X, 5013, 4816, X, 2259, 1723, 4818, X, X, X, X, X, 4819, X,
+    8331, X, X, X, 2718, 3442, X, X, X, 4888, X, X, X, X, 2260, X, X, 2974, X,
+    X, X, X, X, X, X, X, X, X, X, 5350, X, 5107, X, 3469, X, X, 5108, 5109, X,
+    5110, X, X, 5095, 5094, X, X, 3979, X, 5546, 5548, X, 5552, 5540, X, 3205,
+    X, X, X, X, 3462, 8381, X, X, X, X, X, X, 5347, X, 4011, X, X, X, X, X,
+    5348, 3562, 5097, X, 1940, 3293, 1499, 5098, 3859, 2271, X, X, 3243, X, X,
+    X, 3368, 4879, 2099, X, 8339, 4006, 4878, X, 3452, 4882, X, 4881, 8340, X,
+    8341, X, X, 2106, X, 3336, 5325, X, X, X, X, X, 3070, X, X, 5328, X, 8362,
+    X, X, X, 4120, 2186, 2205, X, 5099, X, X, X, 5100, X, 5106, 4884, X, 4883,
+    8342, X, 1595, X, 4885, 2734, 4887, 3200, X, 4886, X, 3872, X, 4667, X,
+    1920, 1729, X, X, X, 2326, 1919, 3352, 1508, 3494, 4071, 2256, 4224, 1792,
+    X, 4558, X, 4556, 4070, 4557, X, 3817, 4559, 4560, 4561, 3446, X, X, X,
+    2487, 4747, X, X, X, X, X, X, X, X, X, X, X, X, 3835, X, X, X, 3925, X, X,
+    X, 3100, X, X, X, X, 3327, X, 10808, 4843, 4884, X, 4883, 10814, X, 1595,
+    X, 4885, 2734, 4887, 3200, X, 4886, X, 3872, X, 3664, X, X, 3145, 1559,
+    2051, X, 2052, X, X, X, X, X, X, X, 1193, X, X, X, X, X, X, X, X, X, 1159,
+    1173, X, X, 1162, X, X, 4834, X, X, X, X, X, X, 1589, X, 3405, X, X, X, X,
+    5530, X, 1616, 5519, X, X, X, X, X, X, 5536, 5520, 5311, X, X, X, X, 3918,
+    X, 3318, X, X, X, X, 3067, X, X, X, 2397, 4311, X, X, X, 5676, 5677, X,
+    2507, X, X, X, 5678, 2388, X, X, 4499, X, X, X, X, 2145, 4148, X, 3947, X,
+    3853, 8402, 5463, 8376, X, X, X, 5209, X, X, 8375, X, X, X, X, 5207, 5210,
+    5202, 5206, 8346, X, 2605, 4954, 1868, 3527, 4050, 4955, X, 4956, X, X,
+    3816, X, X, X, 5340, X, X, 5337, 5344, X, X, X, X, 5314, X, X, X, 5709,
+    5708, X, X, X, X, X, X, X, X, X, X, X, 4732, 4737, X, 4733, X, 8285, X,
+    3170, 4294, 1451, X, X, X, X, X, X, X, 4450, 1627, X, X, 6937, 2781, 6935,
+    11001, X, X, 4206, 6932, X, X, 6934, 2942, 2913, X, 10751, X, X, 5426,
+    5424, 5425, X, X, X, X, 10859, 3270, X, X, 5457, 1542, X, X, X, 10863,
+    2684, X, 4017, 2431, X, X, X, X, 2753, 10861, 2920, 5439, X, X, 10868,
+    2931, X, 2754, X, X, X, 3245, X, X, X, X, X, 8304, 4523, X, X, X, 4522, X,
+    3893, X, X, X, X, 2818, X, X, 2562, X, 3632, 1865, X, 2424, X, X, X, 1903,
+    X, X, 4172, X, X, 4056, X, 4993, X, 4890, X, X, 5359, X, 5294, X, X, X,
+    5363, X, 5358, X, X, X, X, X, 2935, X, 1764, 2398, 2761, 5762, 2665, X, X,
+    X, X, 8490, X, X, X, X, X, X, 4247, 2292, X, X, 2168, 4059, X, X, X, 6143,
+    6145, 6146, X, X, 6142, X, X, X, X, X, X, 6676, 6685, 6686, X, X, X, 1420,
+    X, X, X, 3312, X, 3016, X, X, X, X, X, X, 7131, X, X, 7134, 7151, X, X,
+    7153, 7150, X, X, X, X, X, X, X, X, X, X, X, 5700, 5699, X, X, 5702, 2960,
+    X, X, X, X, 4024, X, 4280, X, X, 4018, X, 1641, 2505, X, X, 5809, X, X, X,
+    4182, 5804, X, X, 3397, X, X, 5806, X, 8442, 5670, X, X, 1816, 5672, X, X,
+    X, X, 5671, X, 5673, X, X, X, 5674, 5456, X, X, X, X, X, 5458, X, X, 5459,
+    X, X, X, X, X, X, 6181, X, X, X, 6183, 6213, 6212, X, X, X, 6813, X, 2472,
+    X, X, X, X, X, X, X, X, X, X, 3371, X, X, 3717, 5312, 3069, 1881, X, X,
+    3291, X, X, 5053, 5054, 2804, X, X, X, X, 3972, X, X, 5501, X, 5498, X, X,
+    5506, X, 5496, X, X, 5494, X, 5502, 5492, 1906, X, 5279, 5286, 2747, X, X,
+    X, X, 5280, 3607, X, X, X, X, X, 5684, 2822, X, 5683, X, X, X, X, X, 5685,
+    X, 2706, X, X, X, X, 3235, 1446, 5445, 8397, X, X, X, 5446, X, X, 5784, X,
+    X, X, 5790, X, X, X, X, X, X, X, 4372, 2567, 3236, X, X, X, 5637, X, X, X,
+    X, X, X, X, X, 5635, 2234, X, 5418, X, X, X, X, X, X, X, X, 1599, 5422, X,
+    X, X, X, 8452, X, X, X, X, 5892, X, X, X, X, X, 8451, 5835, 5834, 5840, X,
+    2914, X, 5831, X, 8443, X, X, X, X, X, 5843, X, 5586, X, 5594, X, X, X,
+    7803, X, X, 5591, 2284, 3329, 3075, 5589, X, 1942, X, X, X, 5394, 5393,
+    3623, 5396, 1994, X, X, X, 5398, 5397, X, 4362, X, 5180, X, 8371, X, X,
+    5186, X, 2346, X, 2956, X, 8370, 1461, 4944, 4984, X, 4945, X, 4946, X, X,
+    4947, X, 4949, X, X, X, X, X, 1444, 2709, 2270, 4174, X, X, X, X, X, X, X,
+    5974, X, X, X, X, X, X, X, X, 5908, X, X, X, 5909, X, X, X, 6577, X, X, X,
+    X, X, 6576, X, X, X, X, X, 6578, 6551, X, 6550, 6549, 3305, X, 6552, 2825,
+    X, 6553, X, X, X, 6554, 4347, 6555, 1830, X, X, 6527, X, X, X, X, X, 6528,
+    X, 4008, 4202, X, X, X, 7035, X, X, X, X, X, 2037, X, X, X, X, 7039, X,
+    6678, 6677, X, 6675, 6674, 3262, X, 3192, 6680, X, X, X, X, X, X, 8560, X,
+    X, X, 8562, X, X, 3540, 1726, X, 4232, X, X, X, X, X, X, 6936, X, X, X, X,
+    X, X, X, 6811, X, X, X, 3273, X, X, X, X, 1745, 7433, X, 7434, 7432, 2135,
+    X, 2410, 2792, 8602, X, X, 7283, X, X, X, X, 2701, X, 7282, X, 7281, X,
+    3174, X, X, 7218, X, X, 7217, 1661, X, X, 3563, 7219, 3658, X, 3402, X,
+    7220, 8561, 7308, X, X, 7305, 7307, X, X, X, X, X, X, X, X, 7303, X, 6947,
+    X, 6942, 6948, X, X, X, X, X, X, X, 6952, 7448, X, X, 6974, 1834, X, X, X,
+    X, X, X, 6975, X, X, 6976, X, 6977, 7032, X, X, X, 7021, X, 7031, 7033, X,
+    2173, 7029, 2309, X, 2590, X, X, 7075, X, X, 7077, X, X, X, 7076, 7078, X,
+    3985, 7079, 7080, X, 1785, X, X, X, 6739, X, X, 6721, X, X, X, 6726, 4213,
+    X, X, 1778, X, 8520, X, X, X, 2813, 6742, X, 6747, 3090, X, X, 6743, 6772,
+    X, X, X, 3657, X, X, 6782, 6774, X, 6776, X, X, X, X, X, 4160, X, 2004, X,
+    X, X, X, X, 3435, X, X, 7199, X, 1768, 7198, 7203, X, X, 7202, X, X, 7201,
+    3401, 7204, X, 4369, X, X, X, X, X, X, X, 6787, X, X, X, 4220, X, 6789,
+    6805, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6806, 6823, X, X, X, X, X,
+    6819, X, X, X, X, X, X, X, X, X, 6264, 2073, X, X, X, 1950, 4185, 2771, X,
+    X, X, X, X, X, X, X, X, X, 1469, X, X, X, X, 6857, X, 3308, X, 6854, X, X,
+    X, X, X, X, 3643, 2893, X, 6914, X, X, 6911, X, 3274, X, X, X, X, X, 6912,
+    6909, 2035, 2193, X, 3380, 6985, X, X, X, X, 2122, X, 2873, X, 6988, X,
+    3481, X, 6624, 6625, X, X, 6626, X, 6627, 2002, 5367, 6628, X, 2982, 6629,
+    2580, X, 3667, X, X, 6327, X, X, X, 3669, X, X, X, X, X, X, X, 3283, X, X,
+    X, 1766, X, X, X, X, 7347, X, 2380, 3096, X, X, 3331, X, X, X, X, X, 5759,
+    X, 10902, 2760, X, X, X, 4151, X, 5756, X, 7725, 7731, X, 7724, X, 7729, X,
+    X, X, X, X, X, X, X, 7730, 8335, 8356, 8395, 8411, 8413, 8456, 8462, 8485,
+    8493, 8494, 8495, 8497, 8501, 8504, 8513, 8524, 10759, 1860, X, 10760, X,
+    X, X, X, X, 4453, 1452, X, X, 2225, 1861, 3849, 6563, 4552, 3980, 4553, X,
+    4554, 4555, 2798, X, 2581, X, X, X, 10780, X, X, 7605, 7606, X, X, 7607, X,
+    X, X, 3682, 7609, X, 3765, 7610, 7608, 7661, 7660, 7659, X, X, 1428, X, X,
+    X, X, X, X, X, X, X, X, 6012, X, X, X, X, 6013, 2615, X, X, 8467, X, 5987,
+    X, X, X, X, 2097, X, X, 3706, 5988, X, 2673, 5772, X, X, 5777, X, X, 3464,
+    5775, X, X, X, X, 5769, X, 4263, X, 5527, X, 3634, X, X, X, X, X, X, X,
+    5535, X, 5522, 5318, X, X, 3068, X, X, X, X, 2625, 5323, X, X, 2749, X,
+    5317, 5322, 5070, X, X, X, X, X, 3440, 2383, X, X, X, 2204, X, 3366, X, X,
+    5513, X, 2996, X, X, X, 1734, 2361, X, X, 1733, 2396, X, X, 5814, X, 5808,
+    4080, X, X, X, 5803, X, 2539, 5827, X, X, X, 1777, 6269, 6268, X, 6272,
+    6265, X, 6273, 4238, X, 6274, X, 6275, 6242, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 2616, X, 8478, X, 6027, 6026, 6028, X, X, X, X, X, X, 6029, 6031,
+    6030, X, 5817, X, 5829, 1576, 3077, X, X, X, X, X, X, X, X, X, X, X, 10922,
+    5884, 3221, 5887, 5882, 6182, 10960, X, X, X, 3437, 2403, 1925, X, X, X, X,
+    X, X, X, X, 2153, 4741, 4739, 3058, 1921, 1985, X, 4736, X, 4467, 8291, X,
+    8294, X, 4470, X, 4463, X, 8293, 1974, X, 1454, X, X, 4912, X, X, X, 3815,
+    X, X, X, 4913, X, 4908, X, X, X, 5225, X, 3926, X, X, 5215, 5216, 5217, X,
+    X, 5224, X, 5223, 4958, X, 1793, 2060, 4957, X, X, X, 8348, X, X, 1803, X,
+    2837, 4962, 2444, 4782, 4780, 4778, 4781, X, X, X, X, 4783, X, X, X, X, X,
+    4784, X, 2137, X, X, 8303, X, X, X, 2460, 3752, 4508, X, X, X, X, X, 3137,
+    X, X, X, 4830, X, X, X, 4831, X, X, 5299, X, X, 3215, 5293, 5300, 5295,
+    5302, 5298, X, 5297, 3650, X, 5291, 3506, 1987, X, X, X, X, X, X, 1666,
+    5003, 5008, X, X, 5006, X, 3940, 2382, 2258, X, X, X, X, X, X, X, 8329, X,
+    X, X, X, X, X, 2209, X, 2762, X, X, 3220, 8439, X, X, 5785, 5584, X, X,
+    5587, X, X, X, X, 4180, 4021, X, X, X, 5592, 5602, X, 1431, X, X, 2025,
+    2958, X, 3823, X, X, X, 5406, 2477, 3234, X, 2502, 5182, 5133, X, X, X,
+    3587, X, X, 5132, X, X, 5130, X, 2345, X, 5136, 2836, X, X, X, X, 4901, X,
+    X, X, 3911, X, X, X, X, X, 2229, 4716, X, X, X, 3180, 4721, 2731, X, X, X,
+    X, X, 4718, X, X, 4109, 8314, 4611, X, 4001, X, 3317, X, 4141, X, 3910, X,
+    X, X, 4612, X, X, 3730, 5135, 5181, 5185, 4110, X, 5178, X, X, X, 3456,
+    5183, X, X, 5624, 8419, X, X, X, X, 5626, X, X, X, X, X, 8420, 1755, 1542,
+    X, X, X, 8391, 2684, X, 4017, 2431, X, X, X, X, 2753, 8389, 2920, 5138, X,
+    1687, 5158, 5160, 3244, X, X, 2357, 1621, 5152, 5163, 5162, 1992, X, 3110,
+    4937, X, X, 4935, X, 4936, X, X, X, X, X, X, X, X, X, X, X, 3749, 6529, X,
+    X, 2828, 7549, 7551, 7552, X, X, 7554, X, 2007, X, X, X, X, X, X, X, X,
+    11067, X, X, X, X, X, X, X, 4802, 1430, 2412, X, X, X, X, 2096, X, X, 3297,
+    X, 5252, X, 5250, 5240, 2159, X, 5251, X, 5255, 5254, 5256, 5253, 4973, X,
+    4974, X, 4105, X, X, X, 4975, X, X, X, X, 2011, X, X, 1811, 2465, X, X,
+    3533, X, X, X, X, X, 2108, X, X, X, 5750, 5752, X, 1529, X, X, 2287, 4341,
+    X, 1720, X, 3825, 8431, 5556, 5543, X, 5553, X, X, X, 5547, X, X, X, X, X,
+    X, 2844, 5557, 2994, X, 3995, X, X, X, X, X, X, 1732, X, 5362, 5357, X, X,
+    X, 5726, X, 3948, X, 5728, X, 5737, 8428, 5735, X, 5730, X, X, 2936, X,
+    5939, X, X, X, X, 3512, X, X, X, 2164, 5940, X, 4002, 3185, X, X, X, X, X,
+    X, X, X, 4034, X, X, 5731, X, 3271, X, 4129, 2575, 2433, X, X, X, X, X,
+    2375, X, X, 4026, 1724, 1690, 5289, 1960, 3184, 5285, X, X, 5288, 2275,
+    2972, X, 2748, 5296, 3621, X, X, 4198, X, X, X, X, 5663, 5662, 5665, 1908,
+    X, X, 2027, 1815, X, 5431, 2537, 2279, 5429, X, X, X, X, 5430, X, 2843, X,
+    X, X, 5428, 4145, X, X, 1806, X, X, 1560, 5175, X, 3597, 1422, X, X, X, X,
+    X, 2207, X, X, 5392, X, X, X, X, 5395, 8384, 3809, 5125, 2231, X, X, X, X,
+    X, X, 5126, 3851, 2690, X, X, 5127, 3754, X, 2740, X, 4972, X, X, 2990, X,
+    X, X, 2741, X, X, X, 8350, X, 4812, X, X, 2354, 8330, 3214, X, X, 4809,
+    3347, X, X, X, X, X, 2886, X, X, X, X, X, 2496, X, 2955, X, 3152, 4810, X,
+    X, 4821, X, X, 4822, 8333, 8332, X, X, 4015, X, X, 2800, X, 1979, X, X, X,
+    3881, 3123, 2054, 3404, X, X, X, 2150, X, X, X, 4717, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 4251, X, X, 7471, 8606, 7468, X, 7469, X, 7470, 7472, X,
+    X, X, 8607, X, 8608, 7474, 7758, 4085, X, 7475, X, 7476, X, 7477, 1746, X,
+    7479, X, 2876, X, X, 7284, X, 2788, X, X, X, X, X, 7287, 7285, X, X, X,
+    7286, 7340, X, X, X, X, X, X, X, X, X, X, X, 2080, X, 7342, X, 7007, X,
+    2945, X, 3229, X, X, 4157, X, 7010, X, X, X, 2237, X, 1584, 6661, 4303,
+    3162, X, X, 3795, X, 6673, X, 1652, 6671, X, 6669, 6660, 6681, X, 2306, X,
+    X, X, X, X, 3088, X, X, X, X, X, X, X, 2714, X, 6796, 6801, 3091, X, X,
+    6800, X, 6443, 6455, X, X, 6451, X, 6454, X, 6452, 6456, 6450, X, 6424,
+    2964, X, 3739, X, 1519, X, 2425, X, 4373, X, X, 6189, X, X, X, X, X, 6588,
+    6589, X, X, X, X, 2617, X, X, 6587, X, 2773, X, X, X, X, X, X, 6291, 6292,
+    X, 3394, X, X, 6293, X, 2344, X, 6033, X, 6032, X, X, 1822, X, 2870, X,
+    3411, X, 6034, 2937, 4289, X, 8475, 6005, 7805, X, X, X, X, 6003, 6006, X,
+    X, X, X, 5992, 5977, X, 1736, X, X, 5979, X, 8463, 5978, X, 5981, 5980, X,
+    X, X, X, 6507, X, X, X, X, X, 6510, X, X, 6509, 6508, X, 6236, X, 6237,
+    3644, X, 2852, 6234, X, 3260, X, X, 6235, X, X, X, 6814, 3605, X, X, X, X,
+    6815, 6816, 6826, X, X, X, 6820, 6852, X, X, 6863, X, X, 1657, X, 6859, X,
+    6864, X, X, X, 6860, X, 3086, 6547, X, X, X, X, X, 6548, X, X, X, X, X, X,
+    4323, 2892, 6524, X, X, X, X, 6525, X, X, 6526, X, 1854, X, X, X, X, 2967,
+    X, 2584, 7112, X, X, X, 1741, X, 7113, X, X, 7156, X, 2650, X, 7155, X, X,
+    X, X, X, 7157, X, X, X, 3253, 3552, X, X, X, X, X, X, X, 7560, X, X, X,
+    1948, X, 5991, 4228, 10941, X, 4245, X, X, X, X, X, X, 154, X, X, X, X, X,
+    X, X, X, X, X, X, 2860, 7210, X, 2550, 7211, 2240, X, 2948, X, X, X, X,
+    3681, X, X, X, X, 2656, X, X, X, 7698, X, X, 7696, X, 1782, X, 7695, 2555,
+    1606, X, X, X, 10993, X, 6771, X, 3848, 6766, 10994, 6727, X, X, X, X, X,
+    3694, 3897, X, 4582, X, 4223, 4583, X, X, X, 4584, X, 618, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 4068, 4728, X, X, 4738, 3024, X, 8328, 4740,
+    X, 2257, 4730, 3288, X, X, X, X, 5060, 4022, X, 5059, X, X, X, X, X, X, X,
+    5061, 3813, X, X, 4828, X, X, X, X, X, X, X, X, X, X, X, X, 4915, 4919,
+    4916, X, 1496, 4714, X, X, 4706, 4707, X, 2730, 4020, X, X, X, 4712, 4711,
+    X, 4215, X, 3570, X, X, X, X, X, X, X, X, X, X, 1790, X, X, 2471, 6468, X,
+    X, X, X, 6473, 6474, 10744, X, 6475, X, 6481, 3410, 11012, X, X, X, 11013,
+    X, X, X, X, X, 7098, 7099, 2311, 7097, X, X, 2458, X, X, X, X, 10865, X,
+    10866, X, X, X, 5433, 5432, 5437, 10870, X, 3299, X, X, X, 4310, X, X, X,
+    X, 2478, X, X, 3928, X, 7676, X, X, 7675, 7674, X, X, X, X, X, X, X, 3800,
+    7672, 1492, 8627, X, 7714, X, X, X, X, X, X, X, 7719, X, X, X, X, X, 11084,
+    X, 2221, X, X, X, 7517, X, X, X, 7518, 11098, X, X, X, 7671, X, 7667, X,
+    7668, 7664, 7670, X, 7666, 1757, X, X, 3516, 5697, 3735, X, 10895, X, 3756,
+    X, X, 4092, X, X, X, 5698, 4203, X, X, X, X, 5773, 5767, 5764, X, X, X,
+    4281, 5770, X, X, 10906, 2615, X, X, 10939, X, 5987, X, X, X, X, 2097, X,
+    X, 3706, 5988, X, 1976, X, X, X, 3992, 4516, X, 10777, X, 4258, X, X, X,
+    4517, X, 8609, 2949, X, X, 8610, 4128, X, X, 2950, X, X, 7473, X, 3748, X,
+    7165, X, 7164, 7166, X, X, X, X, 7167, X, X, X, X, X, X, 7615, X, X, X, X,
+    X, X, X, X, X, 3528, 7273, 2653, 2601, 3630, 3276, X, 6908, 6915, X, X, X,
+    X, X, 2089, X, X, 3163, X, 6921, X, X, 2648, X, 6961, X, X, 6962, X, X, X,
+    X, X, X, 6963, 2943, 3210, X, 1658, X, X, X, X, X, X, 3745, X, X, 1914, X,
+    8534, 3309, 1915, 6518, 2814, X, 7053, X, X, 2239, X, X, X, X, X, 7054, X,
+    8539, 1673, 7093, 4331, 3323, 4360, X, X, 2524, 7092, X, 3118, X, X, 7109,
+    3015, X, 3583, X, X, X, 1419, X, 6729, X, 6738, 3847, X, X, X, X, X, 6944,
+    X, X, X, X, 6945, 6946, X, X, X, X, 1608, X, X, X, X, X, X, X, 7759, 1927,
+    7760, 7761, 13, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 263,
+    264, 265, 266, 4537, 1493, X, 2182, 2094, 2659, 3286, 1977, 2985, 2248,
+    10778, 2333, 4539, 4081, 3421, X, 7480, X, X, 2071, X, X, X, X, 7481, 7485,
+    X, 7483, X, X, X, 5495, 5493, X, 1642, 5491, 5497, 5503, X, 10877, X, X, X,
+    X, 77, X, X, X, X, X, X, X, X, X, X, X, X, X, 6807, 2216, X, 3708, X, 6453,
+    X, X, 6448, X, X, X, 3008, 2117, X, 2642, X, X, 6442, X, X, X, X, X, X, X,
+    X, 3662, X, X, 2579, 6444, 6430, 2298, 4095, X, 3343, 6420, X, 8507, 6428,
+    X, 6417, 3225, X, 6422, 1438, 4083, 2406, X, 6399, 2853, X, 6401, X, X, X,
+    2775, 2365, X, X, X, X, 6400, 6378, X, 6380, X, X, 6379, X, X, X, X, 2211,
+    X, X, X, 3031, X, 6102, 6103, X, X, X, X, 6107, 6104, 6105, 6106, X, 6108,
+    X, X, X, 6665, X, X, 6692, X, X, X, 6688, X, X, X, 1833, 6690, 6719, X,
+    6718, X, X, X, X, X, X, 3646, 6725, X, 6736, X, X, X, 1742, X, 7185, X, X,
+    X, 2409, 7184, X, 7193, X, X, X, 7638, X, X, X, X, X, X, X, X, X, X, 1439,
+    8623, 7689, X, X, 3964, 4077, X, 3525, X, X, X, X, X, X, X, X, X, 7378, X,
+    X, 7306, X, X, X, 7733, X, X, X, X, X, 7732, X, X, X, X, X, X, 3280, 3178,
+    10920, X, X, X, 2918, X, X, X, 4098, X, X, X, X, 4533, X, X, 4532, 4535,
+    4534, X, X, 4536, 2009, X, 3266, X, X, X, 2146, 4452, X, X, X, 3575, 8286,
+    X, X, X, 2152, 2411, 3648, X, X, X, 4595, 4593, X, X, X, X, 3850, 4455, X,
+    X, X, 3693, X, 4295, X, 2832, 8289, 2482, X, 2530, 1629, X, X, 4894, X, X,
+    X, X, X, X, 4016, 8344, 2391, X, X, 2735, X, 3538, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 4681, 4571, 4009, X, X, X, X, 2703, 3193, X, 4573, 3545, X,
+    8310, 4574, X, X, 2495, 3818, X, X, 3698, X, X, X, X, 5048, 1870, X, X, X,
+    2995, X, X, 2933, 2077, X, X, X, X, X, X, 5508, X, 5305, X, 2160, X, 5310,
+    2445, 2328, X, X, X, X, X, X, 2637, 5292, 4217, X, 5022, 8355, X, X, X, X,
+    X, X, X, X, 5012, X, X, X, 1464, 2959, 8386, X, X, X, X, X, X, 5427, X,
+    8390, 2930, 1991, X, 2272, X, X, 2721, X, X, X, 5164, 5150, X, X, 8367, X,
+    5154, 1540, X, 4930, X, X, X, 4933, X, X, X, X, X, X, X, 4934, X, 2732, X,
+    4725, X, X, X, X, 4724, 4715, X, X, X, X, 3136, X, 1533, 2224, X, 2223,
+    1479, X, X, 4366, 4365, X, 2368, 1410, X, 4436, 4437, 73, X, 72, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 6010, 8477, 5986, X, 1646, X, X, X, X, X,
+    5982, 8465, 2468, X, X, 3322, 5984, X, 3949, 3611, 1946, X, 3388, X, X,
+    3272, X, 5738, X, X, X, X, 5736, 5532, X, 2756, X, X, X, 4870, 2233, 4227,
+    X, X, X, X, 5523, X, 3373, 5330, X, X, 3124, 5336, X, 5331, X, X, 5333, X,
+    X, X, X, X, 3792, 2744, 5082, 5081, 5077, X, X, X, X, 5083, 5084, X, X,
+    5085, X, X, X, 1429, 5524, X, X, 2283, X, X, X, 5526, X, 5525, X, 5521,
+    4240, 2395, 3216, 5321, X, 2973, X, 2276, 2887, 1573, 3035, 5319, 1916, X,
+    X, X, 5701, X, X, X, X, X, X, X, X, X, X, X, X, 8433, X, X, 1713, 4371,
+    5537, X, X, 5551, 1465, X, X, 5539, X, X, 4067, 5544, 2821, 3328, 5534,
+    5368, 5369, 3390, 5371, X, X, 2447, 5366, X, X, X, X, 1907, X, X, 5372,
+    2745, 1541, X, 5113, X, X, X, 5114, X, 4123, X, X, 3729, X, X, 5117, 1434,
+    2201, X, 2924, 1458, X, X, X, X, 4899, 4900, X, 4897, X, X, X, 3510, 3296,
+    X, X, 8365, X, 3399, X, X, 5128, 1890, X, X, 5550, X, X, X, X, X, X, 2909,
+    5560, 1772, 2162, X, X, X, 5793, X, X, X, X, X, X, 4052, X, X, 5791, 5795,
+    X, 5597, X, X, 4340, 5600, X, X, 8414, X, X, 2845, 5599, X, X, X, 5879, X,
+    X, X, X, X, X, X, 1645, X, X, X, 3467, 4041, X, 5800, X, X, X, X, X, X, X,
+    X, X, 3679, X, X, 5812, 5634, X, X, X, X, X, X, 5640, X, X, X, X, 5507, X,
+    X, X, 2666, X, X, X, X, 5976, X, 5975, X, X, X, X, X, 6486, X, 8511, X, X,
+    X, X, 6487, 6488, 6489, X, 2769, X, X, X, X, X, 6208, X, X, X, X, X, X,
+    3042, X, 1617, 4343, X, X, X, X, 3997, X, 3863, X, X, X, X, X, X, 1829, X,
+    6484, X, 6485, X, X, X, X, X, 6687, X, 6695, X, 6702, 6696, X, X, X, 6694,
     X, 6370, 6368, X, 6366, 1786, X, 2774, 6371, X, X, 6369, X, 6367, 6375, X,
-    X, 6374, 6373, 6372, X, X, X, X, X, 6376, X, X, X, 6377, 2939, X, 3522, X,
-    2977, 2434, X, X, X, 6259, X, X, X, X, X, X, X, X, X, 3261, 3082, X, 6261,
-    6263, 6260, 6262, X, X, X, X, X, X, 2069, 6162, X, X, X, X, 3898, X, X, X,
-    X, X, X, 2685, 4267, X, X, 6164, X, X, 3500, X, X, 6165, X, X, 6166, X,
-    6170, 6168, 6169, X, 6167, 5986, X, 1646, X, X, X, X, X, 5982, 8465, 2468,
-    X, X, 3322, 5984, X, X, X, 8468, X, X, X, 8466, X, X, X, X, X, X, X, 5989,
-    X, 1617, 4343, X, X, X, X, 3997, X, 3863, X, X, X, X, X, X, X, X, 2936, X,
-    5939, X, X, X, X, 3512, X, X, X, 2164, 5940, X, 4062, X, X, X, X, 2764, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 3026, X, X, X, X, X, 2763, X, X,
-    X, 6693, X, X, X, X, 1490, X, X, 6684, X, X, X, 6683, X, 6678, 6677, X,
-    6675, 6674, 3262, X, 3192, 6680, X, X, X, X, X, X, 6449, 6457, X, 6465,
-    6464, X, X, 4037, X, X, 2078, X, X, X, X, X, X, X, X, 6463, X, 6467, 6466,
-    6470, X, 6472, 6355, X, X, 6352, X, X, X, X, X, X, X, X, 6351, 2963, X,
-    6354, 6356, X, X, X, 6353, X, 6360, X, 6357, X, X, X, X, X, X, 6358, 6242,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 2616, X, X, 6245, 1489, X, X, X, X,
-    6248, X, X, X, 6246, 1649, 2113, 6247, 2293, 4059, X, X, X, 6143, 6145,
-    6146, X, X, 6142, X, X, X, X, X, X, X, X, X, X, X, X, X, 6148, 6149, X,
-    3304, X, 1852, X, X, X, 2144, X, 6991, X, X, X, X, 3959, X, X, 2976, X, X,
-    X, 1965, X, 4126, 3049, X, 6992, 8531, X, X, 2858, 3275, 2783, X, X, X,
-    7693, X, X, 7694, 3507, 7691, 7690, X, X, X, X, 1607, X, X, X, 7702, X, X,
-    7701, X, X, X, X, X, 1588, X, X, X, 7699, 2339, 4066, X, X, 7710, X, X, X,
-    X, X, X, 8628, 3965, X, X, 7718, 8627, X, 7714, X, X, X, X, X, X, X, 7719,
-    X, X, X, X, X, 1180, X, X, X, X, X, X, X, X, 1194, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, 1201, 1202, X, X, X, X, X, X, 1203, X, X, X,
-    X, X, X, 4895, X, X, 2491, X, 2490, X, X, X, X, 1434, 2201, X, 2924, 1458,
-    X, X, X, X, 4899, 4900, X, 4897, X, X, X, 2133, X, X, X, X, 5356, X, X, X,
-    X, X, X, X, X, X, 2464, 5353, X, 5352, X, X, X, X, 3589, X, X, 8382, 3498,
-    X, 4263, X, 5527, X, 3634, X, X, X, X, X, X, X, 5535, X, 5522, X, X, X,
-    1429, 5524, X, X, 2283, X, X, X, 5526, X, 5525, X, 5521, 5192, 2636, X,
-    5195, X, X, 5189, X, 4133, 4132, X, X, X, 5199, 5200, 1462, X, 8374, X, X,
-    X, 5188, X, X, X, X, 2055, 1415, X, X, X, 1807, 4816, X, 2259, 1723, 4818,
-    X, X, X, X, X, 4819, X, 8331, X, X, X, 4820, X, X, 4817, X, X, X, X, X, X,
-    X, X, X, X, X, X, 2386, 4170, X, X, X, X, 4511, 4514, 4510, 2385, X, 2724,
-    X, X, X, X, X, X, 2092, X, 4667, X, 1920, 1729, X, X, X, 2326, 1919, 3352,
-    1508, 3494, 4071, 2256, 4224, 3422, 2255, X, X, X, X, X, X, X, X, X, 2082,
-    X, 4676, X, 2040, 2657, 2865, 4447, X, 4445, X, 4446, 1935, X, X, 2352,
-    1677, X, 4444, 4443, 3862, X, X, X, X, 2481, 2480, 3131, 4448, 3812, 2984,
-    X, X, X, 23, 4449, 4451, 140, X, 156, 141, X, X, X, 157, 119, X, X, 120, X,
-    X, X, X, X, 1211, X, X, X, X, X, X, X, X, 162, X, X, 164, 70, 1215, X,
-    7676, X, X, 7675, 7674, X, X, X, X, X, X, X, 3800, 7672, 1492, 7677, X,
-    7679, X, X, X, X, X, X, 1770, 7658, 1526, X, X, 7681, X, 7386, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 8600, X, X, X, 4061, X, X, 4871, X, 3172, X, 3406, 3133, 3814, 4872,
-    4873, 1594, X, X, 2563, 4874, X, X, X, X, 1457, 4875, X, X, X, X, X, 4876,
-    X, 3912, X, 5092, 4337, X, X, X, X, 5093, 3885, 5096, 4418, 4434, X, 2553,
-    3562, 5097, X, 1940, 3293, 1499, 5098, 3859, 2271, X, X, 3243, X, X, X,
-    3368, 4769, X, X, X, X, X, 4768, 1728, X, X, 4770, X, X, X, X, 4773, X, X,
-    X, X, 4772, X, X, X, X, X, X, X, X, X, X, X, X, 3956, X, 4324, X, X, X, X,
-    X, 6756, X, X, X, X, X, X, X, 6763, X, X, 6755, 6715, X, X, X, X, X, X, X,
-    X, 3931, X, 6706, X, X, X, 1655, 2215, 3768, 6716, X, 6704, X, 8518, 6713,
-    X, X, X, 6723, X, 6708, X, X, 7284, X, 2788, X, X, X, X, X, 7287, 7285, X,
-    X, X, 7286, X, X, X, X, 7289, 7288, X, X, 2815, X, 7290, X, X, X, X, X,
-    7175, 7172, X, 7176, X, 2591, 7177, 1895, 2086, X, 8545, X, X, 2175, X, X,
-    X, X, X, X, X, X, 7178, X, X, X, 3557, 7256, 7255, 7253, 6271, 1837, X, X,
-    7221, X, 7258, 7257, X, X, X, X, 7259, X, 4159, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 4328, X, X, 8622, X, 7636, 8621, X, X, X, X, X, X, X, X,
-    X, X, 6012, X, X, X, X, 6013, X, X, X, X, 6014, X, X, X, X, X, X, X, 1530,
-    X, X, X, 6765, X, X, X, X, 4370, 3479, 3842, 8523, X, 6778, X, X, X, X, X,
-    X, X, X, X, 6784, X, X, X, X, X, X, 6785, X, 6537, X, X, X, X, X, X, 6538,
-    X, X, X, X, X, X, X, X, X, X, 2547, X, X, 4118, X, X, X, X, 6540, X, 3226,
-    X, 6539, 6378, X, 6380, X, X, 6379, X, X, X, X, 2211, X, X, X, 3031, X, X,
-    X, 6382, X, X, X, 3475, X, 6381, X, X, X, 6383, X, 3874, 3083, 2772, 6281,
-    6282, 2686, X, 3501, 6283, 8500, X, X, 3203, 8502, X, 6284, X, 3223, 6285,
-    X, X, X, X, X, 1978, X, 4542, 3256, 2556, X, X, X, X, 1825, 6215, X, 3581,
-    X, X, 2770, X, X, 3787, X, X, X, X, 2404, X, X, X, X, X, X, X, X, X, 3471,
-    X, X, 6221, X, X, X, X, 6222, 6016, X, 3786, 6017, X, X, 1789, 6018, X,
-    6019, X, X, X, X, 6020, X, 6022, 6023, 6021, X, X, X, 3810, 6025, 6024, X,
-    X, X, X, X, X, X, 6204, 4012, X, X, X, 6203, X, X, 1484, X, X, X, X, 6207,
-    X, X, X, X, X, X, X, X, 6206, X, X, 7014, X, 7012, X, X, 3239, X, X, X,
-    2946, 1835, 7013, X, 2878, X, X, 4271, X, X, X, 4355, X, X, X, 7015, 7026,
-    3310, X, 7025, 8535, 7034, 4191, X, X, X, X, 7037, X, 7040, X, X, 7038,
-    3780, X, X, X, X, X, X, 7035, X, X, X, X, X, 2037, X, X, X, X, 7039, X,
-    6754, X, X, X, X, 3342, X, X, X, X, X, 6759, 1503, X, X, X, X, X, X, X,
-    3103, X, X, X, X, X, X, X, 3888, X, X, 8589, X, X, X, 2455, X, X, X, X, X,
-    X, X, X, 7328, 2896, X, X, X, X, X, X, X, 2897, 7332, 7334, X, X, 8588,
-    8586, X, 7064, X, X, X, X, 3483, X, 7066, X, 3960, X, 7067, X, 7068, X,
-    7069, X, X, X, X, 7070, X, X, X, X, 3535, X, X, X, X, X, 6865, X, 8528, X,
-    X, X, X, X, 6885, 6889, 6884, X, 6891, X, X, X, 6893, 6892, X, X, X, X, X,
-    X, X, X, X, 6264, 2073, X, X, X, 1950, 4185, 6266, X, X, X, X, X, 6267, X,
-    X, X, 1517, X, X, X, X, 6270, 6182, 8488, X, X, X, 3437, 2403, 1925, X, X,
-    X, X, X, X, X, X, X, X, 3951, X, 3614, X, X, X, X, X, 3438, X, X, X, X,
-    2315, 2615, X, X, 8467, X, 5987, X, X, X, X, 2097, X, X, 3706, 5988, X, X,
-    6015, X, X, X, 8470, X, X, 5994, X, X, X, X, X, 2190, X, 6001, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5997, X, X, X, 6000, 2235,
-    1548, 6002, X, 2899, 5999, 4041, X, 5800, X, X, X, X, X, X, X, X, X, 3679,
-    X, X, 5812, 2188, X, X, X, X, X, 2695, X, 5802, X, X, X, 4244, 2289, X,
-    5815, 8407, 3141, X, X, 3886, X, 5505, X, X, X, 3761, X, X, X, 5504, 3651,
-    3978, 1812, X, 3000, 2663, X, X, X, 3340, X, 4149, X, X, 5500, 5499, X,
-    5586, X, 5594, X, X, X, 7803, X, X, 5591, 2284, 3329, 3075, 5589, X, 5584,
-    X, X, 5587, X, X, X, X, 4180, 4021, X, X, X, 5592, 5602, X, 5675, 2506,
-    2934, 2350, X, 3839, X, X, 3919, 4359, X, X, X, X, 2528, X, X, X, 2397,
-    4311, X, X, X, 5676, 5677, X, 2507, X, X, X, 5678, 5368, 5369, 3390, 5371,
-    X, X, 2447, 5366, X, X, X, X, 1907, X, X, 5372, X, 5365, 5376, X, 5375, X,
-    5374, X, X, X, 5377, X, X, 5379, 2806, X, 5562, 5541, 5561, X, 5554, 5542,
-    X, 5558, X, 5559, X, X, X, X, X, 5576, X, X, X, 3523, X, 5549, X, X, 5572,
-    X, X, X, 5574, X, 3345, 5257, X, X, X, X, X, X, X, 5258, 5259, 3927, X,
-    5261, 5260, 2662, X, 2927, 1667, 1689, 8378, 5262, X, 1440, X, X, X, 2957,
-    5263, X, 7084, 5264, 2132, 3882, 4290, X, X, X, X, X, X, X, X, 1681, 4835,
-    X, X, X, X, X, 3033, 4838, X, 3450, X, X, 3424, 3451, 3690, 3334, X, X, X,
-    2390, X, 3673, 5062, 3883, 5063, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    1804, 3884, 3586, 5065, 5066, X, 2267, 1805, 5067, 2185, 4171, 4144, 1871,
-    5069, 1414, 3801, 4701, X, 4697, X, X, 4692, 4698, 2389, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 4705, X, X, X, X, X, X, X, 2153, 4741, 4739, 3058,
-    1921, 1985, X, 4736, X, 2057, X, X, X, X, X, 1539, X, X, X, X, X, X, X, X,
-    X, 1659, X, X, X, X, X, 4765, X, 2817, 4761, X, 4759, X, 4760, X, 4762, X,
-    X, X, X, X, X, X, 2901, X, X, X, 5009, X, X, 2423, X, X, 5015, X, X, 5016,
-    5010, 1710, 5011, 5020, 5019, 5018, 5014, X, X, X, 5013, 4669, X, 4327, X,
-    X, X, 3935, X, 3361, 2227, 2335, X, X, X, 4677, X, X, 3538, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 4681, 8287, 1860, X, 8288, X, X, X, X, X, 4453,
-    1452, X, X, 2225, 1861, 3849, 3683, 1936, X, X, X, X, X, X, X, X, 1678, X,
-    4488, 3416, X, X, 8357, X, X, X, X, X, X, X, X, 5024, 5021, X, 5023, X,
-    4217, X, 5022, 8355, X, X, X, X, X, X, X, X, 5012, X, X, X, 5518, X, X, X,
-    3775, X, X, X, X, X, X, X, X, X, X, X, X, 5530, X, 1616, 5519, X, X, X, X,
-    X, X, 5536, 5520, 5179, 5177, X, 3065, X, X, X, 5167, 2463, X, X, X, X, X,
-    X, X, 3139, 5198, 8373, 3066, 5193, X, 5190, 5191, X, 2607, 5194, 5197, X,
-    X, X, X, 4218, 5655, X, X, X, X, 5607, X, X, X, X, X, X, X, 5658, X, X, X,
-    5659, X, X, X, X, X, X, 1524, X, 5661, 5330, X, X, 3124, 5336, X, 5331, X,
-    X, 5333, X, X, X, X, X, 3792, 3372, X, 5334, X, X, X, 4147, X, X, X, 4175,
-    1810, X, X, X, X, 8429, X, X, X, X, X, X, 4181, 5749, X, X, X, X, X, 5748,
-    X, X, X, X, 2999, X, 5745, X, 4211, X, X, 3499, 5739, 5456, X, X, X, X, X,
-    5458, X, X, 5459, X, X, X, X, X, X, 5460, X, 2015, 1543, 2280, 5461, X,
-    5462, 2712, 3073, 8401, 8282, 4661, 3037, 3036, 3157, 2744, 5082, 5081,
-    5077, X, X, X, X, 5083, 5084, X, X, 5085, X, X, X, 5088, 5086, X, 5087,
-    5089, X, 1571, 3367, 5090, X, 2157, 1683, 3593, X, 5091, 3568, 4728, X, X,
-    4738, 3024, X, 8328, 4740, X, 2257, 4730, 3288, X, X, X, X, X, X, X, X, X,
-    X, X, X, 4734, 4727, 1798, X, 1863, 1760, 4735, 4731, 8296, X, 8302, 4497,
-    X, X, 8300, 4498, 4502, 1455, X, X, X, X, X, 3901, 4501, X, X, X, X, 4500,
-    4504, X, X, X, 4503, X, 3357, X, X, X, 2487, 4747, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, 4750, X, 4755, X, X, X, 4753, 4752, X, 1609,
-    X, X, X, X, 8351, X, 3034, 1853, X, 4994, 4049, X, X, X, X, 3151, X, 1748,
-    X, X, 4996, 4998, 1848, X, 8352, 4995, 4997, X, 5000, X, 5265, X, X, X, X,
-    2992, X, X, X, 5266, X, X, X, 5267, 1905, 5268, X, 5269, 5270, 3156, X, X,
-    X, 2206, X, X, 4106, X, X, X, 3975, 4884, X, 4883, 8342, X, 1595, X, 4885,
-    2734, 4887, 3200, X, 4886, X, 3872, X, X, X, X, 2718, 3442, X, X, X, 4888,
-    X, X, X, X, 2260, X, X, 5604, X, X, 5611, X, X, X, X, 5617, 3750, 5623, X,
-    X, X, X, X, 5618, 5621, 5615, X, X, 3279, X, 3783, X, 5605, X, X, 5613,
-    2757, 1906, X, 5279, 5286, 2747, X, X, X, X, 5280, 3607, X, X, X, X, X, X,
-    4197, 5282, 5283, 5287, 3457, 5284, 2274, 2975, X, X, 5301, 3685, X, 3183,
-    X, 5472, X, X, X, X, 5475, X, X, 2908, X, X, X, X, 4226, 1450, 2413, 3129,
-    X, 2598, X, X, 2808, X, X, 5478, X, X, 3429, X, 5476, 3112, 3268, X, X, X,
-    5131, X, X, X, X, X, X, 1684, X, X, X, X, 5182, 5133, X, X, X, 3587, X, X,
-    5132, X, X, 5130, X, 2345, X, 5136, 4782, 4780, 4778, 4781, X, X, X, X,
-    4783, X, X, X, X, X, 4784, X, X, 4785, X, 4786, X, X, X, 4787, 4548, X,
-    2629, 2488, X, X, 1680, X, 2699, X, 3074, X, 2264, 2373, 2265, 1959, X, X,
-    5045, X, X, 2374, X, X, 2203, 5046, 4047, 3606, 5047, X, 2266, X, X, X,
-    1797, X, 3202, 2023, X, 1423, X, 5332, X, X, X, X, X, 5329, X, X, X, X,
-    1873, X, X, X, X, X, 1574, 8380, 5335, X, X, X, 4176, X, X, X, X, X, 2805,
-    5184, 3532, X, X, X, X, X, X, X, X, X, 4362, X, 5180, X, 8371, X, X, 5186,
-    X, 2346, X, 2956, X, 8370, 1461, 4807, X, 2417, X, X, X, X, 2022, X, X,
-    3970, X, X, X, 4805, 4808, 2382, 2258, X, X, X, X, X, X, X, 8329, X, X, X,
-    X, X, X, 5339, X, X, X, X, X, X, 3128, X, 5346, X, X, X, 5340, X, X, 5337,
-    5344, X, X, X, X, 5314, X, X, X, 5750, 5752, X, 1529, X, X, 2287, 4341, X,
-    1720, X, 3825, 8431, X, X, X, X, 4200, X, X, 1695, 2846, 5754, X, X, X, X,
-    X, X, 3280, 3178, 8448, X, X, X, 2918, X, X, X, 5875, X, 5877, X, X, X, X,
-    X, X, X, X, X, X, X, 5876, X, 5849, X, 5848, 5850, X, X, X, X, X, 5853, X,
-    X, X, X, X, X, 3418, X, 5847, X, 8444, X, X, X, 5851, X, X, X, X, X, X,
-    8454, 8455, X, 4320, X, X, 5901, X, 3002, X, X, X, X, X, X, 5897, 5902, X,
-    X, 1579, X, X, 8453, X, X, X, 6709, 3503, X, X, 6714, X, X, X, 6711, 3955,
-    6717, 1473, X, X, X, X, 6705, X, X, X, X, X, X, X, X, X, X, X, X, 5819, X,
-    X, 5825, X, X, 5823, X, 3392, X, X, 5830, 5820, X, X, X, X, X, 5821, 5797,
-    5532, X, 2756, X, X, X, 4870, 2233, 4227, X, X, X, X, 5523, X, 3373, 1694,
-    2362, X, 5515, X, 5531, 1756, X, X, 5529, 5533, X, 3461, X, X, X, 5879, X,
-    X, X, X, X, X, X, 1645, X, X, X, 3467, 1696, X, X, X, X, X, X, X, 1947, X,
-    X, X, 2599, 2399, X, X, 8515, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 6699, X, 6700, X, 1654, X, X, X, 1611, 6697, X, X, 8516, 6608, X, 6609,
-    X, X, X, 1615, X, 6616, 6611, X, X, X, 6612, X, X, X, 6613, X, 3102, X, X,
-    X, X, 6615, 6614, 6617, X, X, X, X, 6618, 6496, X, X, X, X, X, X, 6499,
-    6497, 6498, 2414, 2118, X, X, 3249, X, 3684, X, 2711, X, X, 3616, X, 3742,
-    6500, 5246, X, X, X, X, X, X, 1969, 6225, X, X, 6227, X, X, X, 6228, X,
-    3580, X, X, 6229, X, X, X, X, X, 6230, 6231, X, X, 2030, 1648, 3514, 3676,
-    X, 3772, X, 6046, 4241, 2112, 6047, X, 6045, 3719, 6048, X, 6049, X, 8479,
-    1468, X, X, 2811, 6054, X, 6051, 3554, 6050, X, X, X, X, X, X, 1885, 2134,
-    3190, 5845, 3598, X, X, 5852, X, X, X, X, X, X, X, X, X, X, X, X, X, 5857,
-    5855, X, X, 5858, X, X, 5861, X, X, X, 5854, 3556, 5577, 3551, X, X, X, X,
-    X, 8412, X, 5581, 5568, X, 2013, 5571, 2692, X, X, X, 3635, 5573, 2016, X,
-    5565, 5567, 5564, X, X, 4339, 1749, 5570, X, 5619, 5644, 5643, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 5649, X, 4329, X, X, X, X, X, X, 5652, 2064, X,
-    X, 5648, 5650, 4240, 2395, 3216, 5321, X, 2973, X, 2276, 2887, 1573, 3035,
-    5319, 1916, X, X, X, X, X, 2106, X, 3336, 5325, X, X, X, X, X, 3070, X, X,
-    5328, X, 8408, 3335, 3519, 1544, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    2995, X, X, 2933, 2077, X, X, X, X, X, X, 5508, X, 4088, 5633, 5620, X, X,
-    X, X, X, 2163, 1600, 1754, X, X, 5596, X, 8416, X, X, X, X, 2758, 5625, X,
-    5632, 2626, 1773, X, X, 3209, X, X, 2516, X, X, 2001, 2953, 4361, 4055,
-    6572, 2965, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 1930, 6575, X, X,
-    X, X, 7330, X, X, X, 8274, X, X, 3550, X, 3436, X, X, X, X, X, X, 3344, X,
-    7343, 8591, X, X, X, 3230, 7339, X, X, X, 4987, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 4215, X, 3570, X, X, X, X, X, X, X, X, X, X, 1790, X, 4531,
-    X, X, X, X, X, X, X, X, 4140, X, X, X, X, X, X, X, 4098, X, X, X, X, 4533,
-    X, X, 4532, 4535, 4534, X, X, 4536, 73, X, 72, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 1190, 1206,
-    1205, 1204, X, 8285, X, 3170, 4294, 1451, X, X, X, X, X, X, X, 4450, 1627,
-    X, 2009, X, 3266, X, X, X, 2146, 4452, X, X, X, 3575, 8286, X, X, X, 4717,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4732,
-    4737, X, 4733, X, 3844, 2989, X, 2582, 4968, 2738, 4969, 4970, 1460, 3127,
-    2869, X, 4971, 3496, 2739, X, 2740, X, 4972, X, X, 2990, X, X, X, 2741, X,
-    X, X, 8350, X, 5151, 5161, 5159, X, X, 5156, X, X, X, 5155, 4317, X, 5157,
-    X, X, 1991, X, 2272, X, X, 2721, X, X, X, 5164, 5150, X, X, 8367, X, 5154,
-    1497, X, X, 3231, X, X, X, X, X, X, X, X, X, X, 4788, X, 2353, X, 1456,
-    2881, X, X, X, X, X, 4789, 2200, X, X, 2336, X, 4791, 1902, 4525, 4526, X,
-    1612, X, X, X, X, 4524, X, X, X, X, X, X, X, X, 2621, X, 4529, 4528, 4527,
-    X, 4471, X, 4530, X, X, X, X, 2725, 96, 95, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 98, 97, X, X, X, X, X, X, X, X, 100, 99, X, X, 5017, X,
-    X, X, X, 8354, X, 3941, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 2620, 7555, 7556, 2320, X, X, X, X, 8617, X, 7368, X, X, X,
-    X, X, X, X, X, X, 7366, X, X, X, X, X, 8596, X, X, X, 7367, 7365, X, 3189,
-    X, 7369, X, X, X, X, X, 7557, X, X, 1721, X, X, X, 3618, 7558, 7559, X, X,
-    X, X, 3253, 3552, X, X, X, X, X, X, X, 7560, X, X, X, 2885, X, X, X, X, X,
-    4811, 4814, X, 2098, X, X, X, X, X, X, X, 4815, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 4251, X, X, X, X, X, X, X, 7799, X, X, X, X, X, X, 7800, 6255,
-    X, X, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385, 386, 387, 388, 389,
-    390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404,
-    405, 406, 517, 518, X, 519, 520, 521, 522, 523, 524, 525, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 1829, X, 6484, X, 6485, X,
-    X, X, X, X, 6303, 3773, X, 3671, 3472, X, 2031, 6302, 6300, X, 3686, 6297,
-    3257, 3474, X, 3473, X, 2435, X, X, X, X, X, X, 6321, X, X, 7118, X, X, X,
-    X, X, X, X, X, 7126, 7124, X, X, 7121, X, X, X, X, X, X, 7123, X, X, X,
-    7122, 7125, X, 1966, X, 7129, 7151, X, X, 7153, 7150, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 7156, X, 2650, X, 7155, X, X, X, X, X, 7157, X, X, X,
-    689, X, X, X, X, X, X, X, X, 679, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 3633, X, X, X, X, X, X, X, 4914, 3777, X, X, X, X, 1879,
-    X, 5563, X, 8280, 4082, 5538, 1878, X, 5545, X, 8410, X, X, 3979, X, 5546,
-    5548, X, 5552, 5540, X, 3205, X, X, X, X, 3462, 8372, 5196, X, X, X, X, X,
-    5204, 5203, X, X, X, 5208, X, X, X, 8376, X, X, X, 5209, X, X, 8375, X, X,
-    X, X, 5207, 5210, 5202, 5206, 4810, X, X, 4821, X, X, 4822, 8333, 8332, X,
-    X, 4015, X, X, 2800, X, X, X, 4824, 4825, 4823, X, 4827, X, X, X, X, X,
-    3595, X, X, 1481, 1792, X, 4558, X, 4556, 4070, 4557, X, 3817, 4559, 4560,
-    4561, 3446, X, X, X, 4565, 4563, 4564, 4562, 2416, 4566, 4115, 4297, X, X,
-    X, X, X, 4567, 8309, X, 4812, X, X, 2354, 8330, 3214, X, X, 4809, 3347, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4813, 4546, X,
-    4547, X, X, 3543, 1566, X, X, 4550, 2442, X, 4549, 2387, X, 4551, 6563,
-    4552, 3980, 4553, X, 4554, 4555, 2798, X, 2581, X, X, X, 8308, X, X, 5211,
-    X, 5212, X, X, 5201, 2535, X, 5205, 3155, 2273, 5187, 2840, X, X, X, X,
-    5225, X, 3926, X, X, 5215, 5216, 5217, X, X, 5224, X, 5223, 3813, X, X,
-    4828, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 2818, X, X, 2562, X,
-    3632, 1865, X, 2424, X, X, X, 5242, X, X, 5243, 2358, 5241, 5239, 5238,
-    5245, 5237, 5247, X, X, 1688, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    3647, 4455, X, X, X, 3693, X, 4295, X, 2832, 8289, 2482, X, 2530, 1629, X,
-    X, 5030, X, 5029, X, X, 5028, X, X, X, 3455, 5007, X, X, X, 5036, X, X, X,
-    X, X, X, X, X, X, X, X, X, 5032, X, X, 5814, X, 5808, 4080, X, X, X, 5803,
-    X, 2539, 5827, X, X, X, X, 1765, X, 5805, 5810, 5811, X, X, X, X, X, X, X,
-    3177, 3159, X, 1968, 3785, X, X, X, 2568, X, X, 2342, X, X, X, X, X, 4342,
-    X, 5817, X, 5829, 1576, 3077, X, X, X, X, X, X, X, X, X, X, X, 6160, X, X,
-    6159, X, X, 6161, X, X, X, X, X, X, X, X, X, X, X, X, 6163, X, 2236, X, X,
-    X, X, 6187, 3375, X, X, X, X, 6190, 1714, 6185, X, X, 3739, X, 1519, X,
-    2425, X, 4373, X, X, 6189, X, X, X, X, X, 2935, X, 1764, 2398, 2761, 5762,
-    2665, X, X, X, X, X, X, X, 2111, X, 5761, X, X, X, 5783, 2708, 2187, X,
-    5798, X, 5792, 2388, X, X, 4499, X, X, X, X, 2145, 4148, X, 3947, X, 3853,
-    8402, 5463, X, X, X, X, 2432, 3320, 5464, 4338, X, X, X, 3977, X, 3300,
-    5465, 1877, 1596, 2925, 5116, 5115, 2101, 3153, X, 5121, 5119, X, 5118,
-    4236, 2230, X, X, X, 2720, 5120, 3427, 2661, X, X, X, 3509, 5124, 5123, X,
-    X, X, X, 5122, X, 1431, X, X, 2025, 2958, X, 3823, X, X, X, 5406, 2477,
-    3234, X, 2502, 2842, X, X, X, X, X, X, 5407, X, 3946, X, X, 1590, 2503, X,
-    X, 2378, X, X, X, X, X, X, X, X, X, 6179, X, X, X, X, X, 6180, X, 2167,
-    2402, X, X, X, X, X, X, X, X, X, X, X, 1491, X, 6652, X, X, X, X, 6653, X,
-    X, X, X, X, X, 3830, X, X, X, 2576, X, 6655, 6594, X, 6595, 6591, X, X, X,
-    X, 6592, X, 6593, X, X, X, X, 2304, X, X, X, 6601, X, 6597, X, X, X, X,
-    3829, X, 4023, 3767, X, X, 7268, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 7269, X, X, 8551, X, X, X, 7270, X, X, X, X, X, X, 6735, X, 8519, 4188,
-    X, X, X, X, 4239, X, X, X, X, X, X, X, X, 3283, X, X, X, 1766, X, X, X, X,
-    7462, X, X, 4065, X, X, 7463, X, X, X, X, X, 7464, X, 4333, 8604, X, X, X,
-    X, 5468, 7465, X, 8605, X, 7466, 7467, X, 2072, 7207, 7208, 7209, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    2860, 7210, X, 2550, 7211, 8580, X, X, X, 2722, X, X, 8574, X, 7327, 3916,
-    X, X, 1555, X, X, X, X, 3797, 3277, X, X, X, X, 1967, 8281, 7329, 8584,
-    2316, X, X, 8587, 1506, X, X, 4286, X, X, X, 7436, 7251, X, 7435, X, X, X,
-    X, 8603, 7439, 7437, 7438, X, 7440, X, 7441, 4305, 7442, 7443, X, 2954,
-    3692, X, X, X, 4541, X, 8307, 3571, X, X, 3027, 4543, 4544, 3677, 2249,
-    4350, 4545, X, X, 1979, X, X, X, 3881, 3123, 2054, 3404, X, X, X, 2150, X,
-    X, X, 4893, 8343, 3138, X, X, 3971, X, X, X, 3425, X, X, X, X, X, 4894, X,
-    X, X, X, X, X, 4016, 8344, 2391, X, X, 2735, X, 8362, X, X, X, 4120, 2186,
-    2205, X, 5099, X, X, X, 5100, X, 5106, X, 2606, X, X, 8363, 3294, X, 1988,
-    5101, X, X, X, 3770, X, 3233, X, 4177, 5364, X, X, 5360, X, 5361, X, X, X,
-    X, X, 3071, 8383, X, X, X, 5359, X, 5294, X, X, X, 5363, X, 5358, X, X, X,
-    X, X, 5490, X, 3755, X, 5481, X, 5487, 5486, X, X, X, 2960, X, X, X, X,
-    4024, X, 4280, X, X, 4018, X, 1641, 2505, X, X, 2471, 6468, X, X, X, X,
-    6473, 6474, 8272, X, 6475, X, 6481, 3410, 6477, X, 6476, 6478, 6479, X,
-    6480, X, X, X, X, 6482, 6483, X, X, X, 7354, X, X, 8593, X, 7357, X, X, X,
-    X, X, X, X, 7356, 3396, X, X, X, X, 7349, 7350, 7353, X, X, X, X, 7355,
-    8594, X, 7116, X, X, X, 3311, X, X, X, X, 1562, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 7117, X, X, X, X, X, X, 6542, X, X, X, 6541, X, X, X, X, X,
-    X, X, 6543, X, X, X, 2940, X, 6544, X, 6545, X, X, X, 3878, 6546, 2294, X,
-    6384, X, X, X, X, 4269, X, X, X, X, X, X, X, 6386, X, X, 6387, X, 6388, X,
-    6389, X, 2512, X, 6390, 2114, X, X, 1953, X, 1826, X, X, X, X, X, X, X, X,
-    3224, X, X, 3006, X, X, X, 3667, X, X, 6327, X, X, X, 3669, X, X, X, X, X,
-    X, X, 6421, X, X, 2032, 3741, X, X, X, 3084, X, 4277, 2710, X, X, 6469,
-    8509, X, 6431, X, 3007, X, 6427, 6432, 6434, X, 2019, 2076, 6364, X, X, X,
-    X, X, 3873, X, 2891, X, 4057, X, X, 6365, X, 4248, X, X, 3655, X, 3045,
-    3591, X, X, 2676, X, X, X, 1441, 2337, X, 3923, 6249, X, X, 3999, X, X,
-    6251, X, X, X, 2962, 1550, 1623, 1421, X, X, X, X, X, X, 6250, X, X, X, X,
-    X, X, X, X, 5908, X, X, X, 5909, X, X, X, X, 3585, X, X, X, X, X, X, X,
-    5911, X, X, X, X, 5912, X, 5866, X, X, X, 8446, X, 8447, X, 5862, X, 5863,
-    X, X, X, 5867, X, 5865, X, X, X, 3805, X, X, 5873, X, 5870, 5869, X, 5872,
-    3529, 5874, 5598, X, X, X, X, X, X, 5595, X, X, X, X, X, X, 5583, X, X,
-    5612, 5582, X, 5601, X, X, X, X, X, X, 5593, X, X, 5588, 5585, 2705, 5271,
-    X, X, X, X, X, 2993, 7266, 3731, X, 2611, X, 2394, 5272, X, X, X, X, 3140,
-    X, 3860, X, X, 3182, X, X, 5275, X, X, 5273, X, 5447, X, X, 5452, X, X,
-    3539, X, 5449, X, X, X, X, X, X, X, X, X, X, X, X, 5454, X, X, 2707, 5455,
-    X, 4178, 3659, X, X, 2641, 2191, 3047, 6396, 6402, X, 8505, X, X, 6397,
-    2115, X, 6405, 6409, 2142, X, X, X, X, X, 6404, X, X, X, X, 6413, 8506, X,
-    2297, X, 1827, X, 6344, X, X, X, 6345, X, X, 6346, 6349, X, X, X, X, X, X,
-    X, X, X, X, X, 6348, 3751, X, X, X, X, 6350, 4321, 3930, 1888, X, X, X, X,
-    X, X, X, 6238, X, X, 3377, X, 6239, 2952, X, X, X, X, X, 4054, X, X, 3762,
-    6240, 6241, 3248, X, 4268, X, X, 6243, 6114, X, 8480, 6115, 3393, X, 1698,
-    2291, 6116, X, X, 6117, X, X, 6118, X, 2452, X, X, 6120, X, X, 6119, X, X,
-    6121, 6122, 8483, 8481, X, 8482, X, 2767, X, X, 6141, X, X, 6140, 6139,
-    3758, X, 1824, 2170, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6147, X, X,
-    6144, 2850, 2401, 5942, 5941, X, X, X, X, 5943, X, X, X, X, X, X, X, X, X,
-    X, 5944, X, X, X, 5945, X, X, X, X, X, X, X, X, X, 1867, X, 4928, 4927, X,
-    X, X, X, X, X, X, X, X, 4929, X, X, X, X, X, X, X, X, X, 2902, X, X, 5025,
-    8358, X, 2372, X, X, X, 5026, X, X, 5027, X, X, X, X, X, X, X, X, X, 5039,
-    X, X, 1849, 5040, X, X, 8361, X, 5042, 5041, X, X, 5043, X, X, X, X, 5044,
-    X, 2991, 2634, X, 2536, 5307, X, X, X, X, 2499, 5308, 1445, X, X, 5303, X,
-    X, X, X, 3298, X, X, X, X, X, X, X, 1962, X, X, X, X, X, 1993, 4937, X, X,
-    4935, X, 4936, X, X, X, X, X, X, X, X, X, X, 2493, 4938, X, X, 2261, 4939,
-    8345, 2533, 3125, X, 4940, 4941, 2501, 2262, X, 4091, 8316, 4113, 3564, X,
-    X, 3934, 4623, 8317, 4624, X, X, X, X, 4626, X, 4628, 4627, X, X, X, X,
-    4629, 1626, 3991, X, 2441, 4630, X, X, 3064, X, X, 5299, X, X, 3215, 5293,
-    5300, 5295, 5302, 5298, X, 5297, 3650, X, 5291, 1690, 5289, 1960, 3184,
-    5285, X, X, 5288, 2275, 2972, X, 2748, 5296, 3621, X, X, 6128, 3625, X, X,
-    4010, X, 1549, X, 1558, X, X, 6129, X, X, X, X, 6131, X, X, X, 6130, 3463,
-    X, X, X, 2938, 5664, X, 6132, 4074, 1909, X, 5946, X, X, X, X, 5947, X, X,
-    X, X, 2165, X, X, 3705, X, 8459, 5949, X, X, X, 2810, X, X, 5948, X, X, X,
-    X, 8460, X, 8457, X, 3590, X, X, X, X, 3468, 5914, X, X, X, X, 5916, X,
-    4282, X, 5913, X, 5915, 1580, X, 5910, X, X, X, X, X, X, X, 4758, 2138,
-    2538, X, 2026, X, X, X, 1601, X, X, X, X, X, X, X, X, X, X, 4198, X, X, X,
-    X, 5663, 5662, 5665, 1908, X, X, 2027, 1815, X, 5717, 5714, 4199, X, X,
-    8426, X, 3321, X, X, X, 3534, 5715, X, X, 5723, X, 5722, 2070, X, X, 1610,
-    X, X, 2376, 5716, 5718, X, X, X, X, 6038, X, 6043, X, X, 6041, 6040, 5391,
-    1697, 6039, X, 1467, X, 3675, X, X, 3707, X, X, X, X, 4246, 6044, 6042,
-    3255, 2919, X, X, 6920, X, 6922, X, X, X, X, X, X, 3744, X, X, 6918, X,
-    6923, 6925, X, X, 2212, 6913, X, 1442, X, X, X, X, X, X, X, 6924, 6954, X,
-    X, X, 6957, X, 6956, X, X, X, 6959, X, X, 6958, X, 6960, X, X, 2648, X,
-    6961, X, X, 6962, X, X, X, X, X, X, 6963, 2943, 1554, X, 7001, 2123, X, X,
-    2521, X, X, 2520, X, 4368, 7000, 6999, 3014, X, 1924, 4358, 1717, 2785, X,
-    X, X, X, X, 8532, X, X, 6998, X, X, X, 7698, X, X, 7696, X, 1782, X, 7695,
-    2555, 1606, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 2322, X, X, 7705,
-    7704, 7767, X, X, X, X, 7768, X, X, 7769, X, X, X, X, X, X, 7770, X, X, X,
-    X, 7771, X, 7772, 7773, X, 7774, X, 7775, 7776, 7777, X, X, 282, 283, 284,
-    285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299,
-    300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 311, 312, X, 9,
-    8647, 83, 79, 82, 84, 8646, 41, 42, 85, 59, 3, 60, 4, 30, 203, 204, 205,
-    206, 207, 208, 209, 210, 211, 212, 6, 7, 66, 64, 67, 8, 13, 252, 253, 254,
-    255, 256, 257, 258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269,
-    270, 271, 272, 273, 274, 275, 276, 277, 47, 34, 48, 32, X, 7511, X, X,
-    7510, X, X, X, X, X, X, X, 3990, 3489, X, X, X, X, X, X, 1551, X, X, 7512,
-    7509, X, X, 3808, 4209, 7513, X, X, 570, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 564, 565, 566, 567, 568, 569, 571, 572, 573, 574, 575, 576, 577,
-    578, 579, 580, X, 1692, 2367, 7630, 7629, 4046, X, X, X, X, X, X, X, 7632,
-    7633, 7631, X, 7634, X, X, 4013, X, X, X, 7635, X, 1970, X, X, X, X, X,
-    7753, 3665, X, X, 7754, 7756, X, X, 7757, X, X, X, X, X, X, X, X, X, X,
-    7755, 2332, 4086, 4014, 5068, X, 5703, 4038, 7801, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4915,
-    4919, 4916, X, 5102, X, X, X, 8283, X, X, 5103, X, 1989, X, 5104, X, 5105,
-    X, X, 5107, X, 3469, X, X, 5108, 5109, X, 5110, X, X, 5095, 5094, X, X,
-    5990, X, X, X, X, 6011, X, X, X, X, X, X, X, X, 1821, X, X, X, X, X, X, X,
-    X, X, X, X, X, 2542, X, X, 6866, X, X, X, X, X, X, X, X, 6875, X, X, X,
-    6869, X, X, X, 6877, X, X, X, X, X, X, 4205, 6880, X, 6871, X, X, 4234,
-    3558, X, X, X, X, 1514, X, 2980, 2559, X, X, X, X, 3876, X, 1535, X, X, X,
-    4306, 4210, X, 7452, X, 3420, X, X, X, X, 3338, X, X, 3197, 4459, X, X, X,
-    X, X, 1453, 3356, 2658, 2369, 4139, X, 3147, X, 1628, 8290, 4458, X, 4165,
-    4454, 4456, 2427, 4457, 4891, X, 1538, 3056, 2254, 2198, 2044, X, X, 4664,
-    3196, 3195, 1984, 2729, 4665, 4663, 1633, 3171, 2561, 2486, 1509, X, X,
-    1771, 2325, 2485, X, 4666, X, X, X, X, X, 89, 88, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 63, X, X, X, X, X, X, X,
-    X, X, 7378, X, X, 7306, X, X, X, X, X, X, X, 4304, X, X, 2219, X, 8569,
-    8563, X, 8565, X, X, 7316, 3144, X, 7419, X, 3836, X, X, X, X, X, X, 7422,
-    7420, 2318, X, 7421, 2195, X, X, X, X, X, X, X, X, X, X, 3890, 7424, 7426,
-    7425, 7427, 7474, 7758, 4085, X, 7475, X, 7476, X, 7477, 1746, X, 7479, X,
-    2876, X, X, X, 7480, X, X, 2071, X, X, X, X, 7481, 7485, X, 7483, X, X, X,
-    2461, 4657, X, X, X, X, 4031, 2370, 1937, 4142, 3055, 3696, 2630, X, X, X,
-    X, X, 2670, X, 2609, 2622, X, 2717, X, 3697, X, 8322, X, 4660, 4438, 3967,
-    4439, X, 2243, 1480, 4029, X, 1971, X, X, 1972, 1973, 3355, 4257, X, 4440,
-    X, X, 4441, X, X, 4442, X, X, X, 2864, X, X, X, X, X, X, 7735, X, X, X, X,
-    X, X, 7736, X, 7737, X, X, 4364, X, X, X, X, X, 7734, 3176, 2426, X, X,
-    7738, X, X, 1195, X, X, X, X, X, X, X, X, X, 175, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 159, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 1178, 1179, X, X, X, X, X, X, X, X, X, X, X, X, 1175, 1176, 1177,
-    X, 2833, X, 4030, 4480, 4481, X, X, X, X, X, X, X, X, 2635, 4494, X, X, X,
-    3619, X, 3781, 4489, X, 3933, X, 1619, X, X, X, 4493, 8298, 658, 669, 659,
-    670, X, X, X, X, X, X, X, X, 660, X, X, 671, 661, X, X, 672, 663, X, X,
-    674, 662, X, X, 673, 664, 685, X, X, 1929, 2988, 2565, 4143, 4952, X, X, X,
-    X, X, X, X, 1939, X, 2392, X, X, 1709, 1570, 2737, 1637, X, 4953, 4173, X,
-    X, X, X, X, 2672, 4636, 2660, X, 2986, X, 4638, 4637, 2728, 2226, 4640,
-    3695, X, X, 4641, X, X, X, 3725, 3121, 3179, 1981, X, X, 3555, 3212, X,
-    3649, X, 3993, X, 4643, X, 1459, X, 1412, X, X, X, X, X, 4905, X, X, X, X,
-    X, X, X, 4903, X, X, X, X, X, X, 4069, X, 4906, X, 4904, X, X, 4902, 8314,
-    4611, X, 4001, X, 3317, X, 4141, X, 3910, X, X, X, 4612, X, X, X, X, 7478,
-    X, X, 3493, X, 4613, 1795, 4060, X, 8315, X, 2726, 4614, 3924, 345, 346,
-    347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361,
-    362, 363, 364, X, X, X, X, X, X, X, 10, 11, 20, 21, X, 1181, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    3835, X, X, X, 4515, X, X, 2020, X, X, X, 4512, 4513, X, X, 3492, X, 3099,
-    X, 1976, X, X, X, 3992, 4516, X, 8305, X, 4258, X, X, X, 4517, X, 1496,
-    4714, X, X, 4706, 4707, X, 2730, 4020, X, X, X, 4712, 4711, X, X, X, 3398,
-    X, X, X, X, X, X, X, 4713, X, X, 4710, X, 8327, 1975, 1630, X, X, X, X, X,
-    X, X, X, X, 4892, X, 4036, 3837, 2245, X, X, X, X, X, 2834, 4252, X, X, X,
-    X, X, X, X, X, 3909, 65, 158, X, X, X, X, 68, 69, X, X, 160, 161, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 155, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 4719, 4138, X, 2732, X, 4725, X, X, X, X, 4724,
-    4715, X, X, X, X, 3136, X, 1638, 4961, X, 4959, 4963, 4960, 3582, 5590,
-    2838, X, 4964, 8349, X, 4261, X, 4965, X, X, 4967, X, 3289, 4966, X, 2916,
-    X, 2534, X, X, X, 3149, 2624, 4651, X, X, X, X, 4653, 4652, X, 2882, 1528,
-    X, X, X, 1565, 4654, X, 4655, X, 8321, 2184, X, X, 4656, X, X, X, X, 1957,
-    X, X, X, X, 4858, 4856, X, X, X, X, X, 2489, 2868, X, 3059, 4860, 2941,
-    1486, 3639, X, X, X, X, 3348, X, 4862, 4861, 4863, 4864, 4865, X, X, 5501,
-    X, 5498, X, X, 5506, X, 5496, X, X, 5494, X, 5502, 5492, X, 3271, X, 4129,
-    2575, 2433, X, X, X, X, X, 2375, X, X, 4026, 1724, 5138, X, 1687, 5158,
-    5160, 3244, X, X, 2357, 1621, 5152, 5163, 5162, 1992, X, 3110, 1761, X, X,
-    X, X, 2102, X, 5153, X, X, X, X, X, X, X, X, 3994, X, X, 4844, X, X, 4849,
-    X, X, X, 8337, 3868, X, X, X, X, 4848, 4842, 4845, 4847, X, X, 2355, X,
-    5071, 5072, 3620, X, X, X, X, 5073, 4316, 4336, X, X, X, X, 5075, 5074, X,
-    X, 1730, X, X, 5076, X, X, X, 5079, 5080, X, 5078, X, 3791, 4716, X, X, X,
-    3180, 4721, 2731, X, X, X, X, X, 4718, X, X, 4109, X, X, X, 2095, X, X,
-    4722, 4723, X, X, X, X, 4720, 4726, X, X, 1811, 2465, X, X, 3533, X, X, X,
-    X, X, 2108, X, X, X, 2903, X, 5399, X, 2929, 3391, X, 3822, 5400, X, X, X,
-    X, X, X, X, 4150, X, X, X, 5788, X, X, 5781, 3465, X, X, 5784, X, X, X,
-    5790, X, X, X, X, X, X, X, 4372, 2567, 4363, 5489, 2904, X, X, X, 5488, X,
-    X, 5483, X, X, X, X, X, 2208, X, X, X, 5495, 5493, X, 1642, 5491, 5497,
-    5503, X, 8405, X, X, X, X, 5906, X, X, X, 5898, X, 2074, X, X, X, X, 5904,
-    X, X, X, X, 4183, 5907, X, X, X, 7807, X, X, X, X, X, 2678, 5636, X, 5638,
-    5639, X, X, X, X, X, X, 5651, X, 5647, X, 5528, X, X, X, X, 5646, X, X, X,
-    X, 5645, X, X, 5642, X, X, X, X, 8461, 5969, X, X, X, 5968, 3281, 3584, X,
-    X, 2166, 5967, X, X, X, X, 5966, X, 4152, 4153, X, X, X, X, X, X, 5970,
-    1581, 4203, X, X, X, X, 5773, 5767, 5764, X, X, X, 4281, 5770, X, X, 8434,
-    X, 2673, 5772, X, X, 5777, X, X, 3464, 5775, X, X, X, X, 5769, X, 4243, X,
-    X, 2809, 2998, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    5755, 5753, X, 3804, X, X, X, 2469, X, 1592, 6035, X, 4184, X, X, 3920,
-    6036, X, X, 8347, 3419, 4154, 2290, 2848, X, X, X, 3238, 4625, X, 3303,
-    1669, 6037, X, X, X, 6814, 3605, X, X, X, X, 6815, 6816, 6826, X, X, X,
-    6820, 6823, X, X, X, X, X, 6819, X, X, X, X, X, X, X, X, X, 1850, X, X, X,
-    X, X, X, X, X, 4301, 5983, X, X, X, X, X, X, X, 5985, X, 8464, X, X, 6868,
-    X, X, X, X, X, X, X, X, X, X, 4162, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 6867, 6883, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6881, X,
-    X, 6882, X, X, X, 6887, 6888, X, 1701, X, 1913, X, X, 6886, X, 2214, X, X,
-    1502, 6566, X, X, X, X, X, X, X, X, X, 6573, X, 6574, X, X, 3502, X, X, X,
-    2000, X, X, X, 6585, 3600, X, X, 7218, X, X, 7217, 1661, X, X, 3563, 7219,
-    3658, X, 3402, X, 7220, 2681, X, X, X, 7222, X, X, 4075, 7237, 7224, 7225,
-    X, X, 3330, X, X, 7575, X, X, X, X, X, X, X, X, X, X, 7566, 7567, X, X,
-    7568, 7569, X, X, X, X, X, 7571, X, X, 7570, X, X, X, 2688, 7598, X, X, X,
-    2900, X, X, X, X, X, X, X, X, X, X, 7599, X, 7600, X, 7601, 7602, X, X, X,
-    2321, 8619, X, X, 8620, X, 7603, 7604, 7643, X, X, X, X, X, X, X, 7644, X,
-    4025, 2456, X, 2439, 3022, X, X, 8624, X, X, 7645, X, X, X, X, 7648, X,
-    8625, X, X, X, X, 4520, X, 4518, X, 3053, X, X, X, X, X, 4519, 4521, X, X,
-    X, X, X, 8304, 4523, X, X, X, 4522, X, 3893, X, X, X, X, 4745, 4743, X,
-    4800, X, X, X, X, X, X, X, X, X, X, X, X, 4748, X, X, X, X, X, 4742, X,
-    4746, X, X, 4744, 4507, X, X, X, X, 4509, X, X, X, X, X, X, X, 3968, X, X,
-    X, 2137, X, X, 8303, X, X, X, 2460, 3752, 4508, X, X, X, X, X, 154, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 1216,
-    X, 7703, X, X, 7700, X, 7706, X, 7707, X, X, X, X, X, X, X, 7712, 7711, X,
-    X, X, X, X, X, X, 7713, X, X, 1516, 7708, 7709, X, 7412, 7414, X, X, 7413,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 8630, 7739, 7740, X, X, 7741, X, 7415, X, X, X, X, X, X, 7416, X, 2418,
-    X, X, X, 7417, 7418, X, X, 3988, X, X, X, X, X, X, X, X, 3050, X, X, X,
-    1413, 2628, X, X, X, 7453, X, 7454, 2863, 7455, X, 4307, X, X, 7450, 7457,
-    7459, X, 7458, X, 7456, X, X, 7460, X, X, 7461, X, X, 3097, X, 1663, X,
-    7169, X, X, X, X, X, X, X, X, 7168, 2859, 7170, X, X, 2050, 7171, 7173, X,
-    X, X, X, X, X, X, X, X, X, X, X, 7174, X, 6908, 6915, X, X, X, X, X, 2089,
-    X, X, 3163, X, 6921, X, X, X, X, 6917, X, X, X, 3122, 6916, X, 6919, X, X,
-    X, X, 6910, X, 6658, X, 6659, X, 2604, 2049, 3282, X, X, X, 3526, X, X, X,
-    X, X, 1552, X, 6663, 6662, X, X, X, X, 6668, 6664, 6667, X, X, X, X, 8592,
-    X, X, 1718, X, X, X, X, 7345, 7346, 3324, X, 7344, X, X, X, X, X, X, X, X,
-    7348, X, X, X, X, X, X, 8560, X, X, X, 8562, X, X, 3540, 1726, X, 8561,
-    7308, X, X, 7305, 7307, X, X, X, X, X, X, X, X, 7303, X, 6969, X, X, X, X,
-    6971, 4222, X, 6970, 2857, X, 6972, X, X, 6973, X, X, 6974, 1834, X, X, X,
-    X, X, X, 6975, X, X, 6976, X, 6977, 2944, 7006, X, 7011, 2238, 7008, 7009,
-    8533, 7005, X, X, X, 2979, 3518, X, X, 3210, X, 1658, X, X, X, X, X, X,
-    3745, X, X, 1914, X, 8534, 3309, 3984, 1561, 1475, X, 3482, X, X, 7028, X,
-    X, X, X, 7027, X, 3547, X, 7032, X, X, X, 7021, X, 7031, 7033, X, 2173,
-    7029, 2309, X, 2590, X, X, 1897, X, X, X, X, X, X, 7530, X, 7531, X, 4617,
-    5666, 3716, X, X, 1500, X, 1436, X, X, X, X, X, X, X, 2527, 3963, 2819, X,
-    2087, 7264, X, 7265, X, X, X, 3843, X, X, X, X, 1743, X, X, X, X, X, X, X,
-    4160, X, 2004, X, X, X, X, X, 3435, X, X, 7589, X, 7591, 7590, X, X, X,
-    7592, 7594, 7593, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 470, 471, 472, 473, 474, 475, 476, 477, 478, 479, 480, 481, 482, 483,
-    484, X, 3664, X, X, 3145, 1559, 2051, X, 2052, X, X, X, X, X, X, X, 3278,
-    7565, 2053, X, X, 1676, X, X, 7564, X, X, 7562, X, 7563, X, 7561, 7581, X,
-    7580, 7582, X, 7579, X, X, X, X, X, X, X, 7585, 8618, X, X, X, X, X, X,
-    7584, X, 7587, X, X, 2008, 7586, X, X, X, 7588, 7646, X, X, X, X, X, 7649,
-    X, X, 2242, 7647, X, X, X, X, 7650, X, 7651, 7652, X, 7656, X, 2453, X, X,
-    X, X, 3169, X, X, X, X, 3359, 4588, X, X, 3108, X, X, 2428, 4589, 4590,
-    3023, X, 4587, X, X, X, X, 4592, X, 3969, X, X, X, X, 2323, X, X, 4591, X,
-    3894, X, X, X, 4850, X, 3232, X, X, 1682, X, 2802, X, X, X, X, 4852, X,
-    4851, X, 2327, X, 4853, 4855, 4854, X, X, 4857, X, 4846, 4859, 3448, X, X,
-    2866, 4578, X, 3865, 2971, 1787, X, 1794, 4579, X, X, 4581, X, X, 2093, X,
-    X, 4580, 8311, X, 4312, X, X, X, X, X, 2704, X, X, 4146, X, X, X, X, 5229,
-    X, X, 5233, X, X, X, 3101, X, 4318, 5234, X, X, 5231, X, 5228, X, 8377,
-    5227, 5232, X, X, X, X, X, 2886, X, X, X, X, X, 2496, X, 2955, X, 3152,
-    1881, X, X, 3291, X, X, 5053, 5054, 2804, X, X, X, X, 3972, X, X, 3187, X,
-    X, 5993, 8471, X, X, 8473, 8472, X, X, X, 8474, X, X, X, 5995, 4283, 2028,
-    3757, 3613, X, X, X, 5996, X, X, X, X, 5998, 1963, 3430, X, 5787, 5796,
-    1424, 1521, 8440, X, 1622, X, 5789, 3113, 5780, 5782, 2288, X, X, X, X, X,
-    X, X, X, 5799, 8438, 5794, X, 8441, X, 5786, X, 3219, X, X, 5776, X, 5765,
-    X, 5771, X, 5778, 1501, 5768, X, 5779, X, X, 2847, 8436, 2694, X, 3858, X,
-    2363, 8435, 5760, 5774, 3409, 8437, X, X, X, 1777, 6269, 6268, X, 6272,
-    6265, X, 6273, 4238, X, 6274, X, 6275, X, 8499, 4877, 6277, X, 6276, X, X,
-    X, 6278, 6279, X, 4250, 6280, X, 7504, 6214, 2090, X, X, X, X, X, 1911,
-    1886, 2510, X, X, X, X, X, X, 4155, X, X, 6220, X, 6219, 3043, 6216, X, X,
-    6218, X, X, 2674, 2851, 6217, 4289, X, 8475, 6005, 7805, X, X, X, X, 6003,
-    6006, X, X, X, X, 5992, 6004, X, X, 2377, X, X, 6007, X, X, X, X, X, X, X,
-    6008, X, 8478, X, 6027, 6026, 6028, X, X, X, X, X, X, 6029, 6031, 6030, X,
-    X, 2344, X, 6033, X, 6032, X, X, 1822, X, 2870, X, 3411, X, 6034, 2937,
-    5835, 5834, 5840, X, 2914, X, 5831, X, 8443, X, X, X, X, X, 5843, X, X,
-    5844, X, X, X, X, X, 1819, X, X, X, X, X, X, X, X, 5704, X, X, X, X, X, X,
-    2508, X, 4058, X, 5705, 5706, X, X, 1883, X, X, X, 5707, X, X, X, X, 2189,
-    X, X, 4237, X, 2017, X, 1603, X, X, X, X, X, X, X, X, X, X, 2047, X, X, X,
-    X, X, X, X, X, X, 3111, X, X, 2454, 5313, X, 5315, 5311, X, X, X, X, 3918,
-    X, 3318, X, X, X, X, 3067, X, X, X, 5709, 5708, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 2888, X, X, 3784, 1545, X, X, X, X, X, 3702, 8424, 8385,
-    X, 2278, 5421, X, X, 2360, 2751, X, 8388, 5420, X, 2752, X, 4073, 2359, X,
-    X, X, 1464, 2959, 8386, X, X, X, X, X, X, 5427, X, 8390, 2930, 3426, 2577,
-    X, X, 3063, 4225, X, X, X, X, X, X, 4985, X, 4986, 3531, X, 2462, X, X, X,
-    X, 4988, X, X, 4989, X, X, X, X, X, X, 5341, X, 5345, X, X, X, 3699, 3458,
-    X, X, X, X, X, X, 5338, X, 5342, X, X, X, 2107, X, X, X, 2430, X, 2282,
-    1783, X, X, X, X, X, X, 5510, 1775, 5516, X, X, X, X, X, X, 5513, X, 2996,
-    X, X, X, 1734, 2361, X, X, 1733, 2396, X, X, 6501, 6503, X, 4204, 6502,
-    6505, 6504, X, 4186, X, 6506, X, 3759, X, X, X, X, X, 6507, X, X, X, X, X,
-    6510, X, X, 6509, 6508, X, 1582, X, X, 3553, 6438, X, X, X, 6445, 6439,
-    6446, X, X, X, X, X, X, 6442, X, X, X, X, X, X, X, X, 3662, X, X, 2579,
-    6444, 6336, X, X, X, X, X, X, 6337, X, X, X, X, X, 6342, X, X, X, 6331,
-    4658, 6338, 6332, X, X, 6341, X, X, X, X, X, X, X, 6347, 2639, 2511, X, X,
-    X, X, X, X, X, 6232, X, 2640, X, X, X, X, X, 1639, 3794, X, X, 6233, X, X,
-    3740, X, X, X, X, X, X, 3044, 6090, 6091, 6092, X, 6093, X, X, 6089, X, X,
-    X, X, X, X, X, X, 6095, X, X, X, 6094, X, X, X, X, X, X, 6096, X, X, X, X,
-    6821, X, 6822, 2593, X, 6824, X, 3228, X, 2121, 1725, X, X, X, X, X, 6827,
-    X, X, X, X, 1722, X, 6832, X, X, 6828, 6831, 6772, X, X, X, 3657, X, X,
-    6782, 6774, X, 6776, X, X, X, X, X, 6786, 6775, X, X, 6779, X, X, 1585, X,
-    3546, X, 6780, 6783, X, X, X, 7532, X, 4104, X, X, X, 7533, 4195, X, 1537,
-    X, X, X, 2476, X, 7534, 1675, 7535, X, X, X, 7536, X, X, X, X, 7538, 7539,
-    X, 7298, X, 3353, 8558, 8559, 4000, 2065, X, X, X, X, X, 8556, 8557, X, X,
-    X, X, X, X, 7301, 7302, X, X, X, X, X, 7300, X, X, 7304, 7395, X, 1841,
-    1744, 2317, 3687, X, 7397, 7396, X, X, X, X, 7398, X, X, X, X, 1563, X, X,
-    X, X, X, X, 7401, X, 7400, 7399, X, 7402, X, 7158, X, X, 7161, 7160, X,
-    7159, X, X, 7163, 7162, X, 4127, X, X, X, 7165, X, 7164, 7166, X, X, X, X,
-    7167, X, X, X, X, X, X, 6581, X, X, X, X, 6579, X, X, 2872, X, 3828, 6584,
-    X, 6583, 2303, 4374, X, X, X, X, X, X, X, X, X, 6600, 3046, 3981, 2436, X,
-    X, X, X, X, X, X, X, 2514, 3350, X, 6398, 4292, 2406, X, 6399, 2853, X,
-    6401, X, X, X, 2775, 2365, X, X, X, X, 6400, 1753, X, X, X, X, 2877, 3827,
-    X, 6295, X, X, X, 3173, X, X, X, X, X, X, 6290, X, 6294, 6296, X, X, 2440,
-    X, X, X, X, X, X, 6181, X, X, X, 6183, 6213, 6212, X, X, X, 8492, X, X, X,
-    X, X, X, X, X, X, 2545, X, 4302, X, 2587, X, 2769, X, X, X, X, X, 6208, X,
-    X, X, X, X, X, 3042, X, X, 6210, 6209, X, X, X, X, X, X, 6211, X, X, X, X,
-    X, X, 8484, X, X, X, X, X, X, X, 3738, X, 6123, X, X, X, 6124, X, X, 7780,
-    6125, 6126, 6127, X, X, X, X, 2457, 5935, X, X, X, X, X, 5936, 3903, 3704,
-    X, X, 5937, 3626, X, X, X, X, X, 3302, X, X, X, X, X, 5938, 1668, X, 1956,
-    X, 4079, X, 4063, 3374, 2664, 1944, X, X, X, X, X, X, X, X, X, X, X, 3703,
-    X, 2551, X, X, X, X, 5711, X, 1817, X, X, 1591, X, 8425, 3559, 5710, 2285,
-    1542, X, X, X, 8391, 2684, X, 4017, 2431, X, X, X, X, 2753, 8389, 2920, X,
-    8279, X, X, 5426, 5424, 5425, X, X, X, X, 8387, 3270, X, X, 5457, 3506,
-    1987, X, X, X, X, X, X, 1666, 5003, 5008, X, X, 5006, X, 3940, 3939, X, X,
-    X, X, 8353, 3454, X, X, X, 5005, 2683, X, 5004, X, X, 1487, X, X, 5813, X,
-    X, X, X, 5801, X, X, X, X, 5807, X, X, 5809, X, X, X, 4182, 5804, X, X,
-    3397, X, X, 5806, X, 8442, 5511, 2136, 2110, 3460, 8409, X, 5509, X, 1447,
-    X, X, X, X, 5512, 5514, X, 2018, 2079, 8406, 1813, 1922, X, X, X, X, 5517,
-    X, X, 2438, 4028, X, 2466, 4145, X, X, 1806, X, X, 1560, 5175, X, 3597,
-    1422, X, X, X, X, X, X, X, 3730, 5135, 5181, 5185, 4110, X, 5178, X, X, X,
-    3456, 5183, X, X, 4230, 6075, X, X, X, X, X, 3080, X, X, X, X, X, X, 6081,
-    X, 6083, 6084, 3247, X, X, X, X, X, 6082, X, 6079, X, 6077, 6078, 2329,
-    3579, X, X, 5758, X, X, X, X, X, X, 4219, 5856, X, 5860, 3186, X, 5859, X,
-    5838, X, 8445, 7404, X, X, X, 5864, X, X, X, 5868, X, 5816, X, X, X, 1820,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 2140, X, X, X, 5842, X, X, 5837,
-    3001, X, X, 1758, 4371, 5537, X, X, 5551, 1465, X, X, 5539, X, X, 4067,
-    5544, 2821, 3328, 5534, X, X, 5550, X, X, X, X, X, X, 2909, 5560, 1772,
-    2162, X, X, X, 2666, X, X, X, X, 5976, X, 5975, X, X, X, X, X, 5977, X,
-    1736, X, X, 5979, X, 8463, 5978, X, 5981, 5980, X, X, X, X, 3480, 6794, X,
-    X, X, 3710, 6781, X, X, X, X, X, X, X, X, X, X, X, X, 2714, X, 6796, 6801,
-    3091, X, X, 6800, X, 3086, 6547, X, X, X, X, X, 6548, X, X, X, X, X, X,
-    4323, 6551, X, 6550, 6549, 3305, X, 6552, 2825, X, 6553, X, X, X, 6554,
-    4347, 6555, 1889, X, 6392, X, 4124, 2295, 6391, X, X, X, 6395, 4111, X,
-    3599, X, X, 3778, X, X, X, 2698, 6394, X, 2588, 2296, 2513, 1952, 3875,
-    6393, X, X, X, 3542, X, X, 3961, X, 7260, X, 2594, X, X, X, X, 7261, X,
-    7262, X, X, X, 7263, X, X, 3384, X, X, X, X, X, X, X, 8571, X, X, X, X, X,
-    3019, X, X, X, X, X, X, X, X, X, 7326, X, 7325, X, X, X, X, X, X, 2124, X,
-    X, X, X, 7049, 7051, X, X, 7052, 1915, 6518, 2814, X, 7053, X, X, 2239, X,
-    X, X, X, X, 7054, X, 8539, 3832, 2415, 2310, X, X, X, X, 3806, 1660, 3711,
-    7086, 1836, 2966, 7085, 7090, 3284, 4108, X, 7088, 7089, 1893, X, 7091,
-    3638, 3164, X, X, 3746, 3412, 7087, X, 3986, 3640, X, 2174, 7095, 7094, X,
-    3833, X, X, X, 2570, X, X, 3433, X, X, 8540, X, X, X, 8541, X, X, X, X, X,
-    7098, 7099, 2311, 7097, X, X, 7546, X, X, 7548, X, X, X, 7547, X, 7550,
-    7553, X, X, X, 7549, 7551, 7552, X, X, 7554, X, 2007, X, X, X, X, X, X, X,
-    X, 3146, X, X, 7577, X, X, X, X, 3490, X, X, X, X, X, X, 7578, X, X, X, X,
-    X, X, 7583, X, 7370, X, X, 7372, 8597, X, X, 8598, X, X, X, X, X, X, X, X,
-    1838, 7371, 4131, X, X, X, X, X, X, 7383, 7373, X, X, 7376, X, 2968, X,
-    7130, X, X, X, X, 2218, X, 7127, 7128, X, X, X, 4332, X, X, X, 3312, X,
-    3016, X, X, X, X, X, X, 7131, X, X, 7134, 3165, 3094, X, 3485, X, 7223,
-    1932, X, X, X, X, 7232, X, 7229, 7242, 3486, 3259, 7226, X, 3383, 3434,
-    7227, 7231, 2883, X, 3642, 3333, X, X, 2947, 7230, 3115, 7340, X, X, X, X,
-    X, X, X, X, X, X, X, 2080, X, 7342, X, 8590, X, X, X, X, 2177, X, X, X, X,
-    X, X, 7341, X, 2790, X, 2786, 7071, X, X, X, X, X, X, X, 2330, 4431, 7072,
-    X, X, X, X, X, X, X, X, X, X, X, 7073, 3790, 7074, X, 7082, X, X, X, 123,
-    124, X, X, 121, 122, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 3206, X, X, 7063, X, X, X, X, 7065, 1673, 7093, 4331,
-    3323, 4360, X, X, 2524, 7092, X, 3118, X, X, 7109, 3015, X, X, 3565, X,
-    3807, X, X, X, X, X, X, 7096, 2474, 2525, X, 2787, X, 6895, 6894, 6825, X,
-    X, X, 6899, X, X, X, X, X, X, X, X, X, 6896, X, X, X, X, 6897, X, X, 6898,
-    X, 6900, X, X, X, X, 1608, X, X, X, X, X, X, X, 7759, 1927, 7760, 7761,
-    7762, 8631, 2340, X, 7763, X, X, X, 5973, 4100, X, 3168, 7764, 7766, 7765,
-    X, 7484, X, X, 1774, 7482, 7486, X, X, X, X, 7487, X, 1449, X, 7488, 7489,
-    X, X, X, X, X, X, X, 2793, X, X, X, 7490, X, X, X, 4693, X, 4702, 4695, X,
-    X, 4699, 8326, X, 4700, 4696, X, X, 4729, X, X, 2422, 1708, X, X, X, X,
-    4694, X, X, X, 4704, 1495, 4703, X, 3263, X, 4920, X, X, 4922, X, X, 4923,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4925, 4926, X, X, X, X,
-    5622, X, 8418, 5627, 5631, X, X, 1995, X, X, X, X, X, X, X, X, X, X, X, X,
-    1923, 5629, X, X, X, X, X, 1880, 1961, 1731, X, X, X, X, X, X, X, X, X, X,
-    1762, 2820, 5304, 5309, X, 5305, X, 2160, X, 5310, 2445, 2328, X, X, X, X,
-    X, X, 2637, 5292, 4907, 4335, X, X, X, X, 3615, X, X, 4909, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 2356, X, X, X, X, X, 2149, X, X, X, X, X,
-    X, 4505, X, X, X, 8301, X, 2574, X, 3107, 3358, 2059, X, 4506, X, X, X, X,
-    1901, X, X, 2495, 3818, X, X, 3698, X, X, X, X, 5048, 1870, X, X, X, X,
-    5051, X, X, X, X, 3290, X, X, 5050, 5049, 5052, X, 3364, X, X, 1997, 5950,
-    5952, X, 5951, X, X, X, X, X, X, X, 5953, X, 2210, X, 5954, X, X, X, X,
-    2046, X, 3039, X, 2348, X, X, X, X, 6773, X, 3013, X, 6777, 2450, 2856,
-    2083, 4125, X, 4130, 2713, 8525, X, X, X, X, X, X, X, X, 6790, 6788, X, X,
-    X, X, X, 1700, 1427, X, X, X, X, 6654, 6657, 3617, X, 2855, X, 1651, X,
-    3954, X, X, X, X, 2128, 2033, X, 6656, X, 1671, X, X, 2880, 7276, X, 7277,
-    X, X, X, 7278, 4214, X, 2654, X, X, X, X, X, 7280, 7279, X, 2313, X, 2338,
-    2475, X, X, X, X, X, X, X, 7778, 7779, X, X, X, X, X, 3387, X, X, X, X,
-    2222, X, 7781, X, X, X, X, X, X, X, X, X, X, 7152, X, X, X, X, X, 7141, X,
-    X, X, 7142, 7140, X, X, X, X, X, X, X, X, X, X, 5962, X, X, X, X, X, X, X,
-    X, X, X, X, 5964, 5961, X, X, X, 4093, 5963, 5965, X, 4265, 3246, X, 5712,
-    X, X, X, X, X, 5720, X, 5713, X, X, X, X, 8427, 3134, X, 1945, 5721, X, X,
-    X, X, X, X, 2139, X, X, 1884, 5719, X, 1996, X, X, 5724, 5729, X, X, X,
-    2997, 3652, X, 3736, X, X, X, X, X, X, 5726, X, 3948, X, 5728, X, 5737,
-    8428, 5735, X, 5730, X, X, 6643, X, 6642, X, 1832, X, 6644, X, 6645, 6646,
-    X, X, 2366, 4270, X, 6648, 2826, X, X, X, 1583, 6649, 6650, X, X, X, X, X,
-    6651, X, 1604, X, X, X, 6519, 6520, X, X, X, 6521, X, 4201, X, X, X, X, X,
-    2643, X, 6523, 6522, X, X, X, X, X, X, X, X, X, X, 179, X, X, 178, X, 177,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 187, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 104, 105, 103, 106, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 6807, 2216, X, 1931, X, X, X, 6809, 4572, X, X, X, X, 1964, X,
-    4255, X, 2056, 6810, 6764, 6768, X, 3722, X, X, X, X, 6767, 2779, 2578,
-    6770, X, X, 2003, X, X, X, X, 8521, X, 6771, X, 3848, 6766, 8522, 6727, X,
-    X, X, X, X, 6588, 6589, X, X, X, X, 2617, X, X, 6587, X, 2343, 6586, X, X,
-    6590, X, X, X, 3307, 3855, 3010, X, X, X, X, 3161, 8508, X, 6425, 6419, X,
-    X, X, X, X, X, X, 6423, 2627, 1470, 6418, 6426, 6430, 2298, 4095, X, 3343,
-    6420, X, 8507, 6428, X, 6417, 3225, X, 6422, 1438, 4083, 2573, X, X, X,
-    3515, 6334, 6333, X, X, 6330, X, X, X, 4345, X, X, X, X, X, 6339, X, X,
-    6343, 6340, X, X, X, X, X, X, X, X, 5927, X, 3351, X, 5929, 5928, X, X,
-    5930, X, 5931, X, X, 2600, 3826, X, X, X, 4117, 5932, 5933, 3061, 2541,
-    5934, 4837, X, X, X, X, 1882, 5695, X, X, X, X, 5696, X, 3929, 4019, X, X,
-    X, 3516, 5697, 3735, X, 8423, X, 3756, X, X, 4092, X, X, X, 5698, 5416,
-    5417, 1876, X, X, 3569, 3217, 1955, 2504, 3072, X, X, 2691, 1425, X, X, X,
-    5418, X, X, X, X, X, X, X, X, 1599, 5422, X, X, X, X, 8452, X, X, X, X,
-    5892, X, X, X, X, X, 8451, X, X, X, X, 1578, X, X, X, X, 5895, 3871, X,
-    5894, X, X, X, 6577, X, X, X, X, X, 6576, X, X, X, X, X, 6578, X, 3201, X,
-    3601, X, X, X, X, X, 3306, X, X, X, X, 6582, X, 3708, X, 6453, X, X, 6448,
-    X, X, X, 3008, 2117, X, 2642, X, X, X, X, 8510, X, 2824, 3029, 6459, X, X,
-    6461, 6462, X, X, 6458, 6460, X, 4212, 1437, 6410, X, X, 1954, X, 6407, X,
-    X, X, X, X, 6408, X, X, 3476, 6406, 6403, X, 1699, 2981, X, X, 2169, X, X,
-    X, 6415, X, X, 3413, 7179, X, X, X, X, X, X, X, 7182, X, X, X, X, X, X, X,
-    X, X, X, X, X, 2557, X, X, 7181, 7180, 2125, 7183, X, 2408, 4315, 6926,
-    6927, 3092, X, X, X, X, X, X, X, X, X, 4231, X, X, X, X, 6928, 4156, X, X,
-    6929, 6930, X, X, 3921, 6931, X, 2381, 6978, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 1740, X, X, X, X, X, X, X, 6979, X, 6980, 6981, X, X,
-    7471, 8606, 7468, X, 7469, X, 7470, 7472, X, X, X, 8607, X, 8608, X, 8609,
-    2949, X, X, 8610, 4128, X, X, 2950, X, X, 7473, X, 3748, X, 3536, 2894, X,
-    X, 3252, X, 2061, X, 7243, 4158, 1534, X, 3908, 1662, 7238, 7239, 7240,
-    7241, 3504, 3198, 1476, 7245, X, 7246, 7804, X, X, 3130, X, 7247, X, 6947,
-    X, 6942, 6948, X, X, X, X, X, X, X, 6952, 7448, X, X, X, X, X, X, X, X,
-    1605, X, X, X, X, X, X, X, 6955, 2036, 2193, X, 3380, 6985, X, X, X, X,
-    2122, X, 2873, X, 6988, X, 3481, X, 6987, X, 8530, 2084, X, X, 6986, 3188,
-    1892, X, X, 6989, X, 6990, X, 2782, 7022, 7030, 7023, X, 7019, X, 3381,
-    7018, X, X, X, 7016, X, 4136, 2523, X, X, 7020, X, 7017, X, X, 8537, 7024,
-    2715, X, 2194, X, X, X, 3191, X, 6750, X, X, 3258, X, 6751, X, X, 4189,
-    6740, 1715, X, 6746, X, X, 6749, 4053, X, X, X, X, 6752, X, X, 6745, 6748,
-    X, 8276, X, X, X, 7528, 7527, X, 7529, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 3749, 6529, X, X, 2828, 7541, 7537, X, X, 7540, X,
-    X, 8615, 1844, X, X, X, 7542, X, 7543, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 7544, 7545, X, 2005, X, X, 7358, 7352, X, X, 7351, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 8595, X, X, X, X, X, X, X, 94, 93, X, X, X, 90,
-    X, X, 92, 91, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 29, X, X, X,
-    X, 28, X, X, 37, 38, X, X, 39, 40, X, X, 4912, X, X, X, 3815, X, X, X,
-    4913, X, 4908, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4068,
-    4618, X, 2923, 4615, 2021, X, 4616, 1796, X, X, X, X, X, X, X, X, X, X,
-    2081, 4619, X, 4620, X, X, 4621, 4622, 2596, X, X, X, 2252, 4103, 407, 408,
-    409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423,
-    424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436, 437, 438,
-    581, 582, 583, 584, 585, 586, 587, 588, 589, 590, 591, 592, 593, 594, 595,
-    596, 612, 613, 614, 615, 616, 617, 619, 620, 621, 622, 623, 624, 625, 626,
-    627, 628, X, 7657, 7654, 7653, 7655, X, X, X, 2130, X, X, X, X, X, X, X,
-    7661, 7660, 7659, X, X, 1428, X, X, X, X, X, X, X, X, X, X, 1664, 6817,
-    6818, X, X, X, X, X, X, 6813, X, 2472, X, X, X, X, X, X, X, X, X, X, 4179,
-    X, X, X, X, X, X, X, X, 3845, 5569, 3143, X, X, X, 5575, 3038, X, 5566,
-    5579, 5578, X, 3520, 5628, X, X, X, 5630, X, X, X, X, 8417, X, X, X, X, X,
-    X, 5624, 8419, X, X, X, X, 5626, X, X, X, X, X, 8420, 1755, 5318, X, X,
-    3068, X, X, X, X, 2625, 5323, X, X, 2749, X, 5317, 5322, X, X, 3622, X, X,
-    X, 5316, X, 2068, X, X, 1752, X, X, X, 5324, 8346, X, 2605, 4954, 1868,
-    3527, 4050, 4955, X, 4956, X, X, 3816, X, X, X, 4958, X, 1793, 2060, 4957,
-    X, X, X, 8348, X, X, 1803, X, 2837, 4962, 2444, 2987, X, X, X, X, X, 2088,
-    X, X, 4644, X, X, X, X, 4645, 1515, 1494, 1862, 8319, 3109, 1928, 4216, X,
-    4648, 1620, X, X, 4647, X, X, X, 1983, 1485, 3285, X, 2560, X, X, X, 4039,
-    2795, 2459, 2794, 1625, X, 3811, 4166, X, 4419, 1518, X, X, 1769, 4420,
-    2917, 4639, 1933, 3879, X, X, X, X, 2796, X, 4490, 8297, 3932, 3240, 4486,
-    2148, X, 4483, 4491, 4485, 4278, 4492, 4356, X, X, X, X, X, X, X, X, 2043,
-    X, X, 2147, X, X, X, X, X, X, 8379, X, X, X, X, 3733, 5370, X, X, X, X,
-    3943, X, X, X, 3370, X, X, X, 4032, X, 5290, 1598, 3269, X, X, 4266, X, X,
-    X, 6099, 6097, 6098, X, X, X, 1851, X, X, X, X, X, 4135, X, X, X, 3895, X,
-    6101, X, X, X, 6100, X, X, X, 1679, X, X, 2827, 6982, X, X, X, X, X, X, X,
-    X, X, X, X, X, 6983, X, X, X, 6984, X, X, X, X, X, X, X, 8552, X, X, X, X,
-    X, 3385, X, X, 7272, X, 7271, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    8323, 8334, 8335, 8356, 8395, 8411, 8413, 8456, 8462, 8485, 8493, 8494,
-    8495, 8497, 8501, 8504, 8513, 8524, 8526, 8527, 8536, 8544, 8546, 8547,
-    8550, 8578, 8585, 8601, 8613, 8614, 8616, 8629, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 5883, X, X, X, X, X, X, X, 3950, X, X, X, 5893,
-    X, X, 6733, X, 6728, X, X, X, X, X, X, 2778, X, X, X, X, 2646, X, X, X,
-    2549, X, X, X, X, 4097, X, X, 3798, X, X, 6744, 6679, X, X, X, X, 6682, X,
-    X, X, 3087, 2120, X, X, X, X, 1536, 6681, X, 2306, X, X, X, X, X, 3088, X,
-    X, X, X, X, X, X, 6811, X, X, X, 3273, X, X, X, X, X, 6812, X, X, X, X, X,
-    X, X, 3567, X, 1435, X, X, X, X, 7721, X, X, X, X, 7722, X, 7717, X, X, X,
-    7697, X, X, 7723, X, 3354, X, X, X, 7727, X, 7728, 7726, X, X, X, X, 1727,
-    X, X, X, 2131, 4603, 4242, X, X, X, 4599, X, X, X, 4604, 4601, X, 4600, X,
-    X, X, X, X, X, 4276, 8312, X, X, 2250, 313, 314, 315, 316, 317, 318, 319,
-    320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334,
-    335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 485, 486, X, 487, 488,
-    489, 490, 491, 492, 493, X, X, X, X, X, X, X, 502, 503, 504, 505, 506, 507,
-    508, 509, 510, 511, 512, 513, 514, 515, 516, X, 7572, X, X, X, 7574, X, X,
-    X, X, X, X, X, X, 1898, 7573, X, X, 3098, 2180, X, X, X, X, X, 7576, X, X,
-    X, X, X, X, 7615, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 7616,
-    X, 7617, X, X, X, X, 7618, 8626, X, X, X, 7671, X, 7667, X, 7668, 7664,
-    7670, X, 7666, 1757, X, X, 4367, X, 7669, 7665, 7663, 7662, X, X, X, X, X,
-    7673, X, X, X, X, 2152, 2411, 3648, X, X, X, 4595, 4593, X, X, X, X, 3850,
-    2799, 4602, 1759, 4596, 4594, 3054, X, X, X, X, X, X, X, 4598, X, 4597, 0,
-    1, 2, 22, X, 24, 25, 26, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 102, 107,
-    43, 44, X, X, X, X, X, X, X, 1191, X, 1192, X, 7745, X, X, X, X, X, X,
-    7746, X, X, 7747, 7748, X, X, X, X, 7751, 7749, 4351, X, 7750, X, 4308, X,
-    X, X, X, X, 7752, X, 4288, 7790, 7791, 4309, 7788, X, X, 7792, 7793, X, X,
-    7795, X, 7794, X, X, X, X, X, 7797, X, X, X, 7798, 7796, X, X, X, X, X, X,
-    X, X, 2347, X, X, X, X, 7595, X, X, 7596, X, X, X, X, X, X, X, 1719, X, X,
-    X, 7597, X, X, X, 4834, X, X, X, X, X, X, 1589, X, 3405, X, X, X, X, 4836,
-    X, 4832, X, X, 2867, X, X, X, 4840, X, X, X, X, 2677, X, 3292, X, 2268,
-    2742, X, X, 3728, X, X, 2743, X, X, X, X, 2719, X, X, X, X, X, 3365, 3942,
-    3408, X, X, 2269, X, 3819, X, X, X, 5668, X, X, X, 5667, X, 5669, X, X,
-    1643, X, 3218, X, 5670, X, X, 1816, 5672, X, X, X, X, 5671, X, 5673, X, X,
-    X, 5674, 8381, X, X, X, X, X, X, 5347, X, 4011, X, X, X, X, X, 5348, X, X,
-    X, X, X, X, 5349, X, 4087, X, 2915, X, X, X, X, X, 2207, X, X, 5392, X, X,
-    X, X, 5395, 8384, 3809, X, 1942, X, X, X, 5394, 5393, 3623, 5396, 1994, X,
-    X, X, 5398, 5397, X, 5580, 1712, X, X, X, X, X, X, X, 2420, X, X, X, 1564,
-    X, X, 5597, X, X, 4340, 5600, X, X, 8414, X, X, 2845, 5599, X, X, X, 1948,
-    X, 5991, 4228, 8469, X, 4245, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 7742, X, X, 2181, 7743, X, X, X, 7744, X, 2552, 3052,
-    7782, X, X, X, X, X, X, X, X, X, X, 7783, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 3760, X, X, 7784, X, 3892, 3315, 2351, X, 2319, 2702, X, 2879, X,
-    X, X, 7508, X, X, 7507, 4169, 1857, 3715, 3537, X, X, X, 2911, 4275, X,
-    2126, X, X, X, X, X, 3316, X, 7687, X, 3688, X, 7692, 7688, X, X, X, 7689,
-    X, X, 3964, 4077, X, 3525, X, X, X, X, X, X, X, X, X, 2983, X, 4348, 6855,
-    X, 6856, X, X, X, X, 6862, X, 2829, X, 6858, X, 6861, X, X, X, X, X, 6853,
-    6852, X, X, 6863, X, X, 1657, X, 6859, X, 6864, X, X, X, 6860, X, X, X, X,
-    X, 6857, X, 3308, X, 6854, X, X, X, X, X, X, 3643, 6872, X, X, X, 6876, X,
-    6879, 6878, X, X, X, 6870, X, X, X, X, 6873, X, 6890, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 5142, 5148, 5140, X, 3443, X, X, 5145, 3820, X, X,
-    5139, X, 5144, 4300, 2498, X, X, 6063, 6065, X, 3793, X, 2766, X, X, 6072,
-    X, X, 6071, X, X, X, X, 6073, X, 2543, 2364, X, X, 3470, 6074, X, 3332, X,
-    X, 6076, X, 6102, 6103, X, X, X, X, 6107, 6104, 6105, 6106, X, 6108, X, X,
-    X, 6109, X, 6110, X, X, X, 6111, X, 6112, X, 3680, 3431, 6113, 3653, 3779,
-    X, 6133, X, 1823, 3720, 6134, X, 6135, X, X, 6136, X, X, X, 4101, X, X, X,
-    4094, X, 3319, X, X, X, 3081, X, X, 6138, X, X, 2697, X, 2890, X, 3513, X,
-    6155, 3998, X, 6152, X, X, 6153, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    6158, X, X, X, X, 6157, 6156, 5956, 5957, 5955, X, X, X, X, X, X, 2614, X,
-    X, 3517, 1998, X, X, X, X, X, X, X, X, X, 5959, 3207, 5958, X, X, 4344,
-    3637, X, X, 6803, X, X, X, X, X, X, X, X, X, X, 4221, X, 6137, 6805, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 6806, 2572, X, X, X, X, X, 6722, X, X,
-    X, X, X, X, X, X, X, X, 3899, X, 4043, 6762, 6761, X, 6757, 6758, X, 1525,
-    X, X, X, X, 6760, 6719, X, 6718, X, X, X, X, X, X, 3646, 6725, X, 6736, X,
-    X, X, X, 1785, X, X, X, 6739, X, X, 6721, X, X, X, 6726, 4213, X, X, 3678,
-    X, 7313, X, 2789, 8570, X, X, X, X, X, X, X, X, X, 2314, X, X, X, X, X,
-    8572, 8573, X, X, X, X, X, 3987, X, 7041, X, X, X, X, X, X, X, 7045, X, X,
-    7042, X, 7044, 7043, X, X, X, 8538, X, X, 7046, X, 2554, X, 7048, 7047,
-    3831, X, X, 7050, 7055, X, X, 2473, X, X, X, X, X, X, 5403, X, 7056, X,
-    7057, X, 2649, X, 7058, 7059, X, X, 7060, X, X, 7061, 7062, X, X, X, X, X,
-    6849, X, X, X, 6850, X, X, X, X, X, X, X, X, X, X, 6845, X, X, 6847, X, X,
-    X, 6848, X, X, X, 6846, 6837, X, 3957, 6838, X, X, 6835, X, 6836, 6841,
-    6844, X, X, 6842, X, X, X, 6840, 6834, X, X, X, X, X, 3251, X, 6851, X,
-    4051, X, X, X, 7638, X, X, X, X, X, X, X, X, X, X, 1439, 8623, X, 7639,
-    3864, 7637, X, X, 7640, 7641, X, X, X, X, X, X, X, 7642, 7683, X, X, X, X,
-    X, X, 7684, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 7685, X, 7686, X, X,
-    X, X, X, X, X, 3213, X, X, 1634, X, X, X, X, X, X, X, X, X, X, 4749, X,
-    4751, 2733, 1522, X, X, 4754, X, X, X, X, 1569, X, X, 1866, 3541, 3937, X,
-    X, X, X, 4880, 3060, 4879, 2099, X, 8339, 4006, 4878, X, 3452, 4882, X,
-    4881, 8340, X, 8341, X, X, 8415, X, X, X, X, 5610, 5603, X, X, 5616, X,
-    5614, X, X, X, X, 5609, X, X, X, X, X, X, 5608, X, 3337, X, 3076, X, 5606,
-    5276, X, X, 5274, X, X, X, X, 5277, X, X, X, X, X, 3870, X, X, 1432, X, X,
-    X, X, 3821, X, X, 3732, X, X, 5278, X, 5281, 2746, 2836, X, X, X, X, 4901,
-    X, X, X, 3911, X, X, X, X, X, 2229, X, X, X, X, X, 4910, 4911, X, X, X, X,
-    X, 2736, X, X, X, 5384, 5383, X, X, X, X, X, 5351, 5385, 5373, X, X, 2500,
-    X, X, X, X, 5386, 5387, 5389, 5388, 5390, 1691, X, 2277, X, X, 3945, 2928,
-    4973, X, 4974, X, 4105, X, X, X, 4975, X, X, X, X, 2011, X, X, X, 2633, X,
-    X, X, X, X, X, 4976, 4977, 2597, 2831, 3561, 2871, 3753, 3573, 3989, X, X,
-    X, X, X, 3726, X, X, 4675, X, 1847, 4670, 4671, 4673, X, X, X, X, X, X, X,
-    4674, X, 1938, 2884, X, 3866, 4672, 4668, 2228, X, 1636, 4918, X, X, X, X,
-    X, X, 2564, X, 4917, 2156, X, X, X, 4931, X, X, X, X, X, 4924, 4921, X, X,
-    X, X, X, X, X, X, 2631, X, 2623, X, X, X, X, X, 4684, 4682, X, 4044, X,
-    4679, 4688, 4683, X, X, X, 4686, 2199, 4072, X, X, 2974, X, X, X, X, X, X,
-    X, X, X, X, X, 5350, X, X, X, X, X, X, X, X, X, 3389, X, X, X, X, X, X, X,
-    3944, 2583, 5327, X, 5326, X, X, 2907, X, X, X, 2161, X, X, X, 5320, 2750,
-    X, X, 3549, 3588, X, X, X, X, 5686, X, X, X, X, X, 5687, 5688, X, X, X,
-    5689, X, 5691, 5690, 5692, 1602, 3237, X, 5693, X, X, 2449, 1735, 5694, X,
-    X, 3417, 5378, X, X, X, X, 5382, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 5380, X, X, X, 5381, 5343, X, X, 4121, 6176, X, 3241, X, 3645,
-    X, 2048, X, X, X, 3222, 6177, 1999, X, X, X, 2961, X, X, X, X, X, X, X, X,
-    6178, X, X, X, 1742, X, 7185, X, X, X, 2409, 7184, X, 7193, X, X, X, X, X,
-    7187, 7189, 3922, 7186, X, X, X, 7188, X, 7192, 7190, 1896, X, 7191, 7291,
-    7292, X, X, X, X, 3713, 2400, 2602, 7293, X, 7294, 4233, 2668, 4119, 4273,
-    7295, 2039, X, X, X, X, 7296, 8554, 3386, X, 8553, 7299, 1779, 2862, 8555,
-    7297, 4112, X, 7388, 3021, X, X, X, 7389, X, 3889, 7390, 1702, X, X, X,
-    1531, X, 1840, 8599, 1839, 7391, X, 7392, X, 7393, 7394, X, X, X, X, X, X,
-    7514, X, X, X, X, 7516, 3175, 1750, 1751, 7515, X, X, X, X, 1858, 2179, X,
-    8611, 1859, X, X, 3414, X, X, 4293, X, 1483, X, X, X, X, X, X, X, X, 2312,
-    X, X, X, 4349, X, X, X, X, X, X, X, X, X, X, X, X, 7267, X, X, 8549, X,
-    4190, X, 6964, X, X, 3857, 3609, 6965, X, 6966, 2172, X, X, X, 1891, X, X,
-    X, 6967, X, X, 2518, 3604, 6968, X, 1739, X, X, X, X, X, 6687, X, 6695, X,
-    6702, 6696, X, X, X, 6694, X, X, X, X, 6665, X, X, 6692, X, X, X, 6688, X,
-    X, X, 1833, 6690, 6619, X, X, 2854, X, 1670, X, 6620, 4284, X, 2548, X, X,
-    2644, X, X, X, X, X, 2517, 3250, X, X, X, X, X, 6621, 6622, 1520, X, 6623,
-    X, 8512, X, 6511, 2085, X, X, X, 3009, 1912, X, X, X, X, 6515, 6512, X, X,
-    6513, X, X, X, 6516, X, 6517, 6514, X, X, X, 1512, X, X, 7199, X, 1768,
-    7198, 7203, X, X, 7202, X, X, 7201, 3401, 7204, X, X, X, X, X, X, X, X,
-    7205, X, X, X, X, 7206, X, X, 2331, 2041, X, X, 2669, X, 3505, X, X, 8275,
-    X, X, X, X, X, X, X, X, 3020, X, 7321, X, 7315, 7320, X, 4076, X, 3313,
-    7322, 7319, X, X, X, 4426, 3592, X, 1934, X, X, X, X, X, 3594, X, 3544,
-    2196, 3966, X, X, X, X, X, 6808, 4427, 2797, 4428, 1618, X, X, X, 2042,
-    2241, 4114, 180, 181, X, X, X, 36, 35, X, X, X, X, X, X, X, X, X, 176, X,
-    75, 76, X, X, X, X, X, X, X, 101, X, X, X, X, 3694, 3897, X, 4582, X, 4223,
-    4583, X, X, X, 4584, X, 3477, X, X, 4585, X, X, 2922, 2443, 2151, 4586,
-    2484, 2334, X, X, X, X, 4764, X, X, X, 1864, X, 4767, 4763, 4766, X, X, X,
-    X, X, X, X, 3867, X, X, X, 3530, X, 3689, X, X, X, X, X, 4487, 4496, X, X,
-    3057, X, 2197, X, 3631, X, 5960, X, 4495, 3444, X, 4484, X, 2247, X, X,
-    2246, 4482, X, X, X, 8299, 2595, 680, X, X, 675, 666, 687, X, X, 682, X, X,
-    677, 665, X, X, 681, 686, X, X, 676, 667, X, X, 683, 688, X, X, 678, 668,
-    X, X, 684, X, 7725, 7731, X, 7724, X, 7729, X, X, X, X, X, X, X, X, 7730,
-    X, X, X, 7733, X, X, X, X, X, 7732, X, X, X, X, X, X, 7680, 7678, 3208, X,
-    X, X, X, X, X, X, X, X, 4027, X, X, X, X, 4287, X, X, 7682, X, X, X, X, X,
-    1196, 1197, 1198, 1199, 1200, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 3314, X, X, X, X, X, X, X, X, 3846, X, 7523, X, X,
-    X, X, 7524, X, 7525, X, X, X, X, 7526, X, X, X, X, X, X, X, X, X, 6632,
-    2305, 6633, 3709, X, 6647, X, X, X, X, 6635, X, 3142, 3656, 2192, 6634,
-    3012, X, X, X, X, X, X, 3900, 1650, X, X, X, 6318, X, 6315, X, 6320, X, X,
-    6319, X, 3654, 4048, X, 2470, 6313, 6322, 6317, X, 6316, 6312, 8503, 6314,
-    6244, 2029, X, X, 4352, 3028, X, X, X, X, 6223, X, X, 1647, 3376, 3854, X,
-    X, X, X, 8496, X, X, X, X, X, X, 8498, X, 6224, X, X, 7075, X, X, 7077, X,
-    X, X, 7076, 7078, X, 3985, 7079, 7080, X, X, X, X, X, 7081, X, X, X, 7083,
-    X, X, X, X, 1704, 3360, X, 4369, X, X, X, X, X, X, X, 6787, X, X, X, 4220,
-    X, 6789, 6791, X, X, X, X, 6792, X, X, X, X, X, X, 6795, 6793, X, X, 1504,
-    2875, 2723, 1842, 7428, X, X, X, 3641, X, 7430, X, X, X, 1505, X, 7429,
-    3325, X, 4274, 3488, 7423, 4235, X, 2178, X, X, 4194, X, X, 7605, 7606, X,
-    X, 7607, X, X, X, 3682, 7609, X, 3765, 7610, 7608, X, 7612, X, X, 7611, X,
-    X, 7613, X, X, X, 7614, X, X, X, X, 1791, X, X, 4469, X, 4461, X, 8292,
-    4296, X, 2531, X, 4462, X, 4467, 8291, X, 8294, X, 4470, X, 4463, X, 8293,
-    1974, X, 1454, X, X, 5031, X, X, X, X, X, X, X, X, X, 5033, X, 5034, X, X,
-    X, X, X, X, X, X, 5037, 8359, 8360, 4299, X, 5038, 5035, X, X, 5900, X,
-    3636, 5896, 5899, 2765, X, 3714, X, X, 5903, X, 2586, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 3003, X, X, 6769, X, X, X, 6802, 3048, X, X, 6797,
-    6799, X, X, X, X, X, X, X, 6798, X, X, 5656, 5641, X, X, 6804, X, X, X, X,
-    X, 1788, X, X, X, X, X, X, X, X, X, X, X, 1584, 6661, 4303, 3162, X, X,
-    3795, X, 6673, X, 1652, 6671, X, 6669, 6660, 6596, X, X, 6599, 6598, X, X,
-    X, 3983, 6602, X, X, X, X, X, X, 6603, X, X, 3030, X, 6604, X, X, 6606, X,
-    6610, X, X, 6607, 6605, 3602, 3378, 6437, X, X, 6433, X, X, X, 3905, 1828,
-    X, X, 4084, X, X, 1471, X, X, 6436, X, 4322, X, X, X, X, X, X, 6435, X, X,
-    X, X, 2967, X, 2584, 7112, X, X, X, 1741, X, 7113, X, X, 3093, 7114, X,
-    7115, 3834, X, 8543, 1894, X, X, X, X, X, X, X, X, 7132, 7133, 4192, X, X,
-    X, X, 3484, 7137, X, X, X, X, X, X, X, X, X, X, X, X, 7135, 7136, 7138,
-    3105, 7228, 1418, 4325, X, X, X, 7233, X, X, X, X, X, X, 3166, X, X, 2652,
-    2861, X, X, 7235, 7234, X, 1488, 7236, X, X, 3774, X, 7244, X, 4232, X, X,
-    X, X, X, X, 6936, X, X, X, X, X, X, X, X, X, 6937, 2781, 6935, 8529, X, X,
-    4206, 6932, X, X, 6934, 2942, 2913, X, 8514, 4089, 6666, 1653, 1784, 6670,
-    X, X, 6672, X, X, X, X, 2119, X, X, X, X, X, X, X, 6676, 6685, 6686, X, X,
-    X, 1420, X, X, X, 7496, X, X, 7497, X, 7498, X, X, 7499, X, X, X, X, X, X,
-    X, 1843, X, X, X, X, X, X, X, X, 7500, X, X, X, 1532, X, X, X, X, X, X, X,
-    X, X, 3032, X, 4756, X, 4757, X, X, X, X, X, X, X, X, X, X, 1781, X, X, X,
-    X, 3869, X, X, 3497, X, 2105, X, 5235, 5230, X, 5236, X, X, X, 2158, X, X,
-    X, 1614, X, X, X, 5244, X, X, X, 1809, X, 2012, X, 5440, 5444, X, X, 1640,
-    5441, 5443, X, X, X, X, 5442, X, X, 2706, X, X, X, X, 3235, 1446, 5445,
-    8397, X, X, X, 5446, X, X, 6286, X, 6299, X, 6289, X, 1951, X, 6288, 6301,
-    X, X, X, 6287, X, 2773, X, X, X, X, X, X, 6291, 6292, X, 3394, X, X, 6293,
-    X, 6236, X, 6237, 3644, X, 2852, 6234, X, 3260, X, X, 6235, X, X, X, 2771,
-    X, X, X, X, X, X, X, X, X, X, 1469, X, X, X, X, 7100, 7101, X, 7103, 3104,
-    X, 7102, 1855, X, 7105, X, 7104, 7106, X, 8542, 7108, 7110, X, 7111, X, X,
-    X, X, X, X, X, X, X, 6412, X, X, X, X, X, 6414, X, X, X, 6411, X, X, X, X,
-    X, 2116, 3120, 6416, 3085, X, X, 6429, 2978, 6324, X, X, 3712, X, 6328,
-    3904, X, 3254, X, 6323, 6325, X, X, 6326, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 6329, X, X, 7139, X, 3382, X, X, 7144, 7148, 7145, 7143, X, 7146, X,
-    X, X, 7147, X, X, X, X, 7154, X, X, X, 7149, X, X, X, X, X, 2969, 1586,
-    3051, X, 2176, X, 4193, X, 8548, 7248, 3395, X, X, X, 3095, 2592, 7249, X,
-    X, 7252, X, X, 2700, 7250, 3018, 3017, X, 1477, X, 4272, 7254, X, 3747,
-    7374, X, 7375, X, X, X, X, X, X, X, 7377, X, X, X, X, X, 7379, X, X, X, X,
-    7380, X, 7381, X, X, X, X, 7384, 7382, 7385, 7387, 2912, 1856, X, X, 4161,
-    1674, 2655, 2220, X, 7446, X, 7445, 2526, 7447, 7444, X, X, 2451, X, X, X,
-    7451, 6874, X, X, 4659, X, 2906, 7449, X, X, X, 4649, X, 4122, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, 8320, X, X, 4650, X, 4279, X, 2253, X, X, X,
-    X, 2183, 1900, X, 4429, X, X, 4430, 4256, X, 4164, 3079, 4432, 2529, 3560,
-    X, 4435, X, X, 1533, 2224, X, 2223, 1479, X, X, 4366, 4365, X, 2368, 1410,
-    X, 4436, 4437, 1148, 1149, 1150, 1151, 1152, 1153, 1154, 1155, 1156, 1157,
-    X, X, X, X, X, X, 8634, 8635, 8636, 8637, 8638, 8639, 8640, 8641, 8642,
-    8643, X, X, X, X, X, X, 4802, 1430, 2412, X, X, X, X, 2096, X, X, 3242, X,
-    X, X, X, X, X, 4803, 4804, X, X, 4806, X, X, X, X, 3400, 5354, X, X, X,
-    5355, X, 3838, X, 3608, 2446, X, 2994, X, 3995, X, X, X, X, X, X, 1732, X,
-    5362, 5357, X, X, X, 5793, X, X, X, X, X, X, 4052, X, X, 5791, 5795, X, X,
-    X, X, X, X, X, 2209, X, 2762, X, X, 3220, 8439, X, X, 5785, 5477, 2807,
-    4102, 5479, 5480, 4207, 8404, X, X, X, 5485, X, X, 2281, X, 3624, 5482,
-    3459, 5419, 5423, X, 1926, X, 3610, X, X, X, X, 5484, X, 2755, 3701, 3154,
-    5137, X, X, X, 1941, 5147, 2926, 1572, 5141, 1685, 5146, X, X, X, 1990, X,
-    5143, X, X, X, X, X, X, X, X, 5149, X, X, X, X, X, 4999, X, 5001, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5002, X, X, X, X, X, X, 5466,
-    5467, 4099, X, 4045, 4033, 4007, 2448, 5469, X, X, 2612, X, X, 3996, X,
-    5471, 5474, 5473, X, 1874, X, X, 1943, X, 5470, 5125, 2231, X, X, X, X, X,
-    X, 5126, 3851, 2690, X, X, 5127, 3754, X, X, X, X, 3510, 3296, X, X, 8365,
-    X, 3399, X, X, 5128, 1890, X, X, 6057, X, X, X, 6052, 6053, X, 6056, 6055,
-    3764, X, X, 3041, 3040, X, 1910, X, X, 6058, X, X, X, X, X, 6059, X, X,
-    6060, X, X, 6933, X, 6938, X, X, 3856, X, X, 6940, X, 6939, X, X, X, 1767,
-    X, 3958, 6941, X, X, X, X, X, X, X, X, 8273, 6953, 6943, X, 6712, X, X, X,
-    2910, X, 8517, X, X, 1917, X, 2034, X, 6707, X, X, X, X, 1656, X, X, 2777,
-    X, 6710, X, X, X, 2407, X, X, 3432, 6636, X, X, X, X, X, X, 3379, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 6638, 6637, 6640, X, X, 6639, X,
-    6641, 4187, 4346, X, 2300, 6531, 2589, 6530, X, X, X, X, 6532, 2546, X, X,
-    X, 3150, X, 6533, X, X, 2299, X, 4096, 6534, 6535, X, X, 6536, X, X, X,
-    7405, X, X, X, 1448, X, X, 7403, X, 7407, 7406, X, X, X, X, X, X, 7409,
-    7408, 7410, X, 3491, X, X, X, 7411, X, X, X, 2091, 3106, 1665, X, X, X, X,
-    8277, 2682, X, X, 8295, 4474, X, 4479, 4477, X, X, 4472, X, X, 3116, 4475,
-    X, 4478, 4476, X, 3914, X, 4473, 1128, 1129, 1130, 1131, 1132, 1133, 1134,
-    1135, 1136, 1137, 1138, 1139, 1140, 1141, 1142, 1143, 1144, 1145, 1146,
-    1147, X, X, X, X, X, X, X, X, X, X, X, X, X, 7501, 3574, X, X, X, 7503,
-    1624, X, 7506, 7505, X, X, X, X, 1507, X, X, X, 2006, 1918, X, X, 7493, X,
-    X, 7492, X, 7491, X, X, 7036, X, 3913, X, X, X, X, X, 7494, 7495, X, X, X,
-    X, X, X, X, X, X, X, X, 5700, 5699, X, X, 5702, X, X, X, 5701, X, X, X, X,
-    X, X, X, X, X, X, X, X, 4990, X, X, X, 1869, 4991, X, X, 4992, X, X, X, X,
-    X, X, X, X, X, X, X, X, 1780, X, X, X, X, X, X, X, 7347, X, 2380, 3096, X,
-    X, 3331, X, X, X, X, X, 2062, 4249, X, 2075, X, 3167, 6580, X, 7431, 1703,
-    2898, X, X, X, X, 1745, 7433, X, 7434, 7432, 2135, X, 2410, 2792, 8602, X,
-    X, 7619, 7620, X, 7621, X, 7622, 7623, 7624, 7625, X, X, X, 7626, 7627, X,
-    5660, 7628, X, X, X, X, X, X, X, X, 6385, 1899, X, X, X, 4866, X, X, X, X,
-    X, X, 3902, 4867, 8338, X, X, X, 1635, 4868, X, X, X, X, 4163, 1707, X,
-    4646, 2671, 3132, 4869, 4116, X, X, X, 5249, X, X, 5248, X, X, X, X, X, X,
-    X, X, X, X, X, 3297, X, 5252, X, 5250, 5240, 2159, X, 5251, X, 5255, 5254,
-    5256, 5253, 4004, X, 3495, X, X, 2155, 3148, X, X, X, 4826, 4829, X, X, X,
-    X, X, X, X, X, X, 3137, X, X, X, 4830, X, X, X, 4831, X, X, 5401, 5402, X,
-    X, X, 3877, 4948, 2951, X, X, 3803, X, 2405, X, 3734, 3700, X, X, X, X, X,
-    3428, X, 4262, X, 5404, 2585, X, X, 5405, 2014, 4978, X, X, X, 1958, 4979,
-    X, 2067, X, 3524, 1613, X, 2494, 4980, 4983, 4982, 2066, X, 4981, X, 3407,
-    X, X, X, X, X, X, X, X, 3117, X, 5165, X, 5168, 5170, 8368, X, X, X, 2566,
-    8369, 5176, 3369, 5166, X, X, X, X, 5174, X, 1686, X, 5172, 5173, X, X,
-    5169, 5171, X, X, X, 2232, 4790, X, X, 3917, 4792, X, X, X, 4794, 4793, X,
-    4795, X, 4796, X, 2154, X, X, 1567, 4797, X, X, 4799, X, 4798, X, X, X,
-    4801, X, X, 3441, 4537, 1493, X, 2182, 2094, 2659, 3286, 1977, 2985, 2248,
-    8306, 2333, 4539, 4081, 3421, X, 2532, X, 4538, X, 4540, X, X, X, X, X,
-    3445, X, 1776, X, X, X, 1986, X, 4841, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 3925, X, X, X, 3100, X, X, X, X, 3327, X, 8336, 4843, 4571, 4009, X, X,
-    X, X, 2703, 3193, X, 4573, 3545, X, 8310, 4574, X, X, 4575, 1705, X, X, X,
-    4576, 1980, X, 3521, 1593, 2679, X, X, 3666, 4577, X, 4833, X, X, 3362, X,
-    X, X, X, X, 1799, X, X, X, X, 7802, 1568, 3936, X, X, 2801, 3423, X, X, X,
-    X, 2419, X, X, 4839, X, X, 5438, X, 5434, 8392, 1693, 5435, 5436, 3718, X,
-    X, X, X, 3824, 2109, 5439, X, X, 8396, 2931, X, 2754, X, X, X, 3245, X, X,
-    X, X, X, 3326, X, X, X, 1547, 2286, 5742, X, X, X, X, X, X, 2638, 5747, X,
-    5746, 5741, X, 5744, X, X, 1763, X, 5743, 3612, X, 3949, 3611, 1946, X,
-    3388, X, X, 3272, X, 5738, X, X, X, X, 5736, 3158, 5725, X, 1546, X, X, X,
-    X, X, X, X, X, X, X, X, X, 8433, X, X, 1713, X, X, 1556, X, X, 5763, X, X,
-    5766, X, X, X, 4264, X, X, X, 6191, X, X, X, 3896, X, 2970, 6193, X, X, X,
-    X, 6194, X, X, X, X, X, 6192, X, X, X, X, 1737, X, 6200, X, 6199, X, 2544,
-    X, X, X, 6201, 6196, X, X, X, 6202, 6197, X, X, X, X, 3721, 6195, X, X,
-    6198, X, X, X, X, X, 6205, X, X, X, X, X, 8449, X, X, X, 4330, 2889, X, X,
-    X, 1577, X, X, X, 5881, X, X, X, X, X, X, 5880, X, X, X, X, X, X, 3661, X,
-    X, X, X, X, X, 5924, X, X, 5925, X, X, X, X, X, X, X, X, X, X, 5926, X, X,
-    X, X, 6556, 6558, 6557, 3670, X, 3566, X, 4353, 3674, X, X, X, X, X, X,
-    6560, X, X, 2776, X, 3769, X, 6561, 6559, X, 1831, X, X, 1513, X, 4035,
-    2874, X, X, X, X, X, X, X, X, 2129, X, X, 2038, X, X, 3907, X, X, X, X, X,
-    7216, X, X, X, X, X, 6944, X, X, X, X, 6945, 6946, X, X, X, X, X, X, X, X,
-    X, X, 6950, X, 6951, X, X, 6949, X, X, X, X, 77, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 1193, X, X, X, X, X, X, X, X, X, 1159, 1173, X,
-    X, 1162, X, X, X, 1167, X, X, X, X, X, 1168, X, X, X, X, X, X, X, X, X,
-    8403, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    138, X, 139, X, X, X, X, X, X, X, X, X, X, X, X, 5818, X, X, X, X, 5878, X,
-    X, X, X, X, X, 3548, X, X, X, X, X, X, X, 6171, X, X, X, X, X, 6172, X, X,
-    X, X, X, X, X, X, X, 6173, X, X, 6174, 4064, 6175, X, X, X, 2618, X, X, X,
-    X, 2905, X, X, X, X, X, X, X, X, X, X, 3114, X, X, X, X, X, X, 7120, X, X,
-    X, 7119, X, 2308, 6906, 1474, X, X, X, X, 3788, X, X, 6907, X, X, X, X,
-    2893, X, 6914, X, X, 6911, X, 3274, X, X, X, X, X, 6912, 6909, 2035, 2143,
-    X, 6902, X, 6901, X, 2647, X, X, X, X, X, 2307, 5740, X, X, X, X, 6903,
-    2680, X, X, X, 1716, X, 6904, X, 1553, X, 2780, 6905, X, 6624, 6625, X, X,
-    6626, X, 6627, 2002, 5367, 6628, X, 2982, 6629, 2580, X, 6630, X, 4433, X,
-    X, X, 6631, 3915, 1845, X, X, 3011, 2687, X, 3840, 2645, 2892, 6524, X, X,
-    X, X, 6525, X, X, 6526, X, 1854, X, X, X, X, 1830, X, X, 6527, X, X, X, X,
-    X, 6528, X, 4008, 4202, X, X, X, 7362, X, X, X, 7363, X, X, X, X, X, X, X,
-    X, 7364, X, X, 7361, 7360, X, X, X, 2791, 3487, 7359, X, X, X, X, X, 8612,
-    X, 2221, X, X, X, 7517, X, X, X, 7518, 7519, 7520, X, 7522, 7521, X, X, X,
-    X, X, X, X, X, X, X, X, 8450, 5884, 3221, 5887, 5882, X, X, X, 5886, X, X,
-    X, X, 5885, 3415, 1466, 8278, X, X, X, X, 8490, X, X, X, X, X, X, 4247,
-    2292, X, X, 2168, X, X, 3668, X, 6186, X, X, X, X, X, 8491, X, 6188, X, X,
-    X, 7212, X, X, X, 4606, 4605, X, X, X, X, 7213, 6471, 7214, 3199, 2830,
-    3603, X, X, X, X, 7215, X, X, 3906, 3341, 2349, X, X, 3204, 2816, 8583,
-    7333, 7335, X, 8582, 2024, X, 3796, X, X, 2603, 4326, X, 7331, 2437, X, X,
-    4354, X, X, 7337, X, X, X, X, 7336, 7338, X, X, X, X, 1165, X, X, X, X, X,
-    X, X, X, X, 1169, X, X, X, X, X, X, 1160, X, X, X, 1163, X, X, X, X, X, X,
-    X, 87, 14, X, X, X, X, X, X, X, 74, 61, X, X, 12, X, 182, X, X, X, X, X, X,
-    X, X, X, X, 7785, 6226, X, X, 7107, 7502, X, X, 7786, X, 7787, X, X, X, X,
-    X, X, X, X, X, X, 7789, 86, 220, 221, 222, 223, 224, 225, 226, 227, 228,
-    229, 230, 231, 232, 233, 234, 235, 236, 237, 238, 239, 240, 241, 242, 243,
-    244, 245, 45, 31, 46, 15, 17,
-]; // 19977 entries
+    6070, 3737, 6064, X, 6066, X, X, 6068, 2849, X, X, 6069, 6067, 2569, X,
+    5824, 5826, X, X, X, X, X, 3025, X, X, X, X, X, 5828, 5822, 2551, X, X, X,
+    X, 5711, X, 1817, X, X, 1591, X, 8425, 3559, 5710, 2285, 3978, 1812, X,
+    3000, 2663, X, X, X, 3340, X, 4149, X, X, 5500, 5499, X, 3943, X, X, X,
+    3370, X, X, X, 4032, X, 5290, 1598, 3269, X, X, 5658, X, X, X, 5659, X, X,
+    X, X, X, X, 1524, X, 5661, 8398, X, 3299, X, X, X, 4310, X, X, X, X, 2478,
+    X, X, 3928, X, 1432, X, X, X, X, 3821, X, X, 3732, X, X, 5278, X, 5281,
+    2746, 1869, 4991, X, X, 4992, X, X, X, X, X, X, X, X, X, X, X, X, 10905, X,
+    X, 1713, 4289, X, 10947, 6005, 7805, X, X, X, X, 6003, 6006, X, X, X, X,
+    5992, 10980, X, 6425, 6419, X, X, X, X, X, X, X, 6423, 2627, 1470, 6418,
+    6426, 3210, X, 1658, X, X, X, X, X, X, 3745, X, X, 1914, X, 11006, 3309,
+    11036, X, X, X, 3403, 7311, X, X, 7314, 7312, X, 7317, X, X, 11038, X,
+    3418, X, 5847, X, 10916, X, X, X, 5851, X, X, X, X, X, X, 2620, 7555, 7556,
+    2320, X, X, X, X, 11089, X, 6712, X, X, X, 2910, X, 10989, X, X, 1917, X,
+    2034, X, 6707, X, 10846, X, X, X, 5188, X, X, X, X, 2055, 1415, X, X, X,
+    1807, 3139, 5198, 10845, 3066, 5193, X, 5190, 5191, X, 2607, 5194, 5197, X,
+    X, X, X, 1858, 2179, X, 11083, 1859, X, X, 3414, X, X, 4293, X, 10984, X,
+    6511, 2085, X, X, X, 3009, 1912, X, X, X, X, 6515, 6512, 7106, X, 11014,
+    7108, 7110, X, 7111, X, X, X, X, X, X, X, X, X, 8630, 7739, 7740, X, X,
+    7741, X, 7370, X, X, 7372, 8597, X, X, 8598, X, X, X, X, X, X, X, 11043, X,
+    X, X, X, X, 3019, X, X, 10871, X, 3976, X, X, X, 5453, 5448, X, X, 5451, X,
+    5450, 10872, 2388, X, X, 4499, X, X, X, X, 2145, 4148, X, 3947, X, 3853,
+    10874, 5463, 10879, 3141, X, X, 3886, X, 5505, X, X, X, 3761, X, X, X,
+    5504, 3651, 2018, 2079, 10878, 1813, 1922, X, X, X, X, 5517, X, X, 2438,
+    4028, X, 2466, 3556, 5577, 3551, X, X, X, X, X, 10884, X, 5581, 5568, X,
+    2013, 5571, 2692, 2551, X, X, X, X, 5711, X, 1817, X, X, 1591, X, 10897,
+    3559, 5710, 2285, 5835, 5834, 5840, X, 2914, X, 5831, X, 10915, X, X, X, X,
+    X, 5843, X, 7751, 7749, 4351, X, 7750, X, 4308, X, X, X, X, X, 7752, X,
+    4288, 86, 220, 221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232,
+    233, 234, 10768, X, 10774, 4497, X, X, 10772, 4498, 4502, 1455, X, X, X, X,
+    X, 3901, 10786, 4611, X, 4001, X, 3317, X, 4141, X, 3910, X, X, X, 4612, X,
+    X, 4027, X, X, X, X, 4287, X, X, 7682, X, X, X, X, X, 7175, 7172, X, 7176,
+    X, 2591, 7177, 1895, 2086, X, 11017, 11049, X, 3962, 11053, X, 11051, X,
+    11047, X, 11048, X, X, X, X, X, X, 6808, 4427, 2797, 4428, 1618, X, X, X,
+    2042, 2241, 4114, 96, 95, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    6088, 1468, X, X, 2811, 6054, X, 6051, 3554, 6050, X, X, X, X, X, X, 1885,
+    6022, 6023, 6021, X, X, X, 3810, 6025, 6024, X, X, X, X, X, X, X, 6348,
+    3751, X, X, X, X, 6350, 4321, 3930, 2978, 6324, X, X, 3712, X, 6328, 3904,
+    X, 3254, X, 6323, 6325, X, X, 6326, 6297, 3257, 3474, X, 3473, X, 2435, X,
+    X, X, X, X, X, 6321, X, X, 3668, X, 6186, X, X, X, X, X, 8491, X, 6188, X,
+    X, X, 6798, X, X, 5656, 5641, X, X, 6804, X, X, X, X, X, 8612, X, 2221, X,
+    X, X, 7517, X, X, X, 7518, 2476, X, 7534, 1675, 7535, X, X, X, 7536, X, X,
+    X, X, 7538, 7539, X, 2652, 2861, X, X, 7235, 7234, X, 1488, 7236, X, X,
+    3774, X, 7244, X, 6891, X, X, X, 6893, 6892, X, X, X, X, X, X, X, X, X,
+    6412, X, X, X, X, X, 6414, 1889, X, 6392, X, 4124, 2295, 6391, X, X, X,
+    6395, 4111, X, 3599, X, X, 2641, 2191, 3047, 6396, 6402, X, 8505, X, X,
+    6397, 2115, X, 6405, 6409, 2294, X, 6384, X, X, X, X, 4269, X, X, X, X, X,
+    X, X, 6386, 6356, X, X, X, 6353, X, 6360, X, 6357, X, X, X, X, X, X, 6358,
+    6336, X, X, X, X, X, X, 6337, X, X, X, X, X, 6342, X, X, 6382, X, X, X,
+    3475, X, 6381, X, X, X, 6383, X, 3874, 3083, 6335, X, X, X, 6359, 6361, X,
+    X, X, X, X, X, 6362, X, X, X, 6877, X, X, X, X, X, X, 4205, 6880, X, 6871,
+    X, X, 6937, 2781, 6935, 8529, X, X, 4206, 6932, X, X, 6934, 2942, 2913, X,
+    3201, X, 3601, X, X, X, X, X, 3306, X, X, X, X, 6582, X, 3522, X, 2977,
+    2434, X, X, X, 6259, X, X, X, X, X, X, X, 6421, X, X, 2032, 3741, X, X, X,
+    3084, 2142, X, X, X, X, X, 6404, X, X, X, X, 6413, 8506, X, 2297, X, 2767,
+    X, X, 6141, X, X, 6140, 6139, 3758, X, 1824, 2170, X, X, X, 1656, X, X,
+    2777, X, 6710, X, X, X, 2407, X, X, 3432, 2646, X, X, X, 2549, X, X, X, X,
+    4097, X, X, 3798, X, X, 6744, 6764, 6768, X, 3722, X, X, X, X, 6767, 2779,
+    2578, 6770, X, X, 2003, X, 1582, X, X, 3553, 6438, X, X, X, 6445, 6439,
+    6446, X, X, X, X, 7100, 7101, X, 7103, 3104, X, 7102, 1855, X, 7105, X,
+    7104, 3093, 7114, X, 7115, 3834, X, 8543, 1894, X, X, X, X, X, X, X, X,
+    2347, X, X, X, X, 7595, X, X, 4354, X, X, 7337, X, X, X, X, 7336, 7338, X,
+    X, X, X, 2670, X, 2609, 2622, X, 2717, X, 3697, X, 10794, X, 4660, 2382,
+    2258, X, X, X, X, X, X, X, 10801, X, X, X, X, X, X, 6735, X, 10991, 4188,
+    X, X, X, X, 4239, X, 4177, 5364, X, X, 5360, X, 5361, X, X, X, X, X, 3071,
+    10855, X, 7657, 7654, 7653, 7655, X, X, X, 2130, X, X, X, X, X, X, X, 94,
+    93, X, X, X, 90, X, X, 92, 91, 581, 582, 583, 584, 585, 586, 587, 588, 589,
+    590, 591, 592, 593, 594, 595, 596, X, 1840, 11071, 1839, 7391, X, 7392, X,
+    7393, 7394, X, X, X, X, X, X, 2834, 4252, X, X, X, X, X, X, X, X, 3909,
+    423, 424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436, 437,
+    438, 1144, 1145, 1146, 1147, X, X, X, X, X, X, X, X, X, X, X, X, X, 7544,
+    7545, X, 4159, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4328, 7683, X,
+    X, X, X, X, X, 7684, X, X, X, X, X, X, X, X, 87, 14, X, X, X, X, X, X, X,
+    5037, 8359, 8360, 4299, X, 5038, 5035, X, X, 2458, X, X, X, X, 8393, X,
+    8394, X, X, X, 5433, 5432, 5437, 5179, 5177, X, 3065, X, X, X, 5167, 2463,
+    X, X, X, X, X, X, X, 6148, 6149, X, 3304, X, 1852, X, X, X, 6709, 3503, X,
+    X, 6714, X, X, X, 6711, 3955, 6717, 1473, X, 4212, 1437, 6410, X, X, 1954,
+    X, 6407, X, X, X, X, X, 6408, X, 2890, X, 3513, X, 6155, 3998, X, 6152, X,
+    X, 6153, X, X, X, X, 6827, X, X, X, X, 1722, X, 6832, X, X, 6828, 6831,
+    6872, X, X, X, 6876, X, 6879, 6878, X, X, X, 6870, X, X, X, X, 1551, X, X,
+    7512, 7509, X, X, 3808, 4209, 7513, X, X, 8589, X, X, X, 2455, X, X, X, X,
+    X, X, X, X, 7328, 4112, X, 7388, 3021, X, X, X, 7389, X, 3889, 7390, 1702,
+    X, X, X, 1531, 2195, X, X, X, X, X, X, X, X, X, X, 3890, 7424, 7426, 7425,
+    7427, 2912, 1856, X, X, 4161, 1674, 2655, 2220, X, 7446, X, 7445, 2526,
+    7447, 7444, X, 7116, X, X, X, 3311, X, X, X, X, 1562, X, X, X, X, X, 7742,
+    X, X, 2181, 7743, X, X, X, 7744, X, 2552, 203, 204, 205, 206, 207, 208,
+    209, 210, 211, 212, 6, 7, 66, 64, 67, 8, 2369, 4139, X, 3147, X, 1628,
+    10762, 4458, X, 4165, 4454, 4456, 2427, 4457, 4891, X, 2451, X, X, X, 7451,
+    6874, X, X, 4659, X, 2906, 7449, X, X, X, 1464, 2959, 10858, X, X, X, X, X,
+    X, 5427, X, 10862, 2930, 10857, X, 2278, 5421, X, X, 2360, 2751, X, 10860,
+    5420, X, 2752, X, 4073, 2359, 10853, X, X, X, X, X, X, 5347, X, 4011, X, X,
+    X, X, X, 5348, 4318, 5234, X, X, 5231, X, 5228, X, 10849, 5227, 5232, X, X,
+    X, X, X, 1180, X, X, X, X, X, X, X, X, 1194, X, X, 8337, 3868, X, X, X, X,
+    4848, 4842, 4845, 4847, X, X, 2355, X, 4633, X, 4634, X, X, X, X, 4635,
+    3763, 2045, 1478, X, X, X, 3508, 4507, X, X, X, X, 4509, X, X, X, X, X, X,
+    X, 3968, X, X, 1929, 2988, 2565, 4143, 4952, X, X, X, X, X, X, X, 1939, X,
+    2817, 4761, X, 4759, X, 4760, X, 4762, X, X, X, X, X, X, X, 5959, 3207,
+    5958, X, X, 4344, 3637, X, X, 5990, X, X, X, X, 6011, X, X, X, X, X, X, X,
+    X, 5927, X, 3351, X, 5929, 5928, X, X, 3187, X, X, 5993, 8471, X, X, 8473,
+    8472, X, X, X, 8474, X, 2847, 8436, 2694, X, 3858, X, 2363, 8435, 5760,
+    5774, 3409, 8437, X, X, X, 6191, X, X, X, 3896, X, 2970, 6193, X, X, X, X,
+    6194, 3264, X, X, X, X, X, 8486, 6150, X, X, X, X, X, X, X, X, 3194, 6843,
+    X, 6839, X, X, 1672, X, 1604, X, X, X, 6519, 6520, X, X, X, 6521, X, 4201,
+    X, X, X, 2144, X, 6991, X, X, X, X, 3959, X, X, 2976, X, X, 1740, X, X, X,
+    X, X, X, X, 6979, X, 6980, 6981, X, X, 7003, X, 7004, 7002, X, 2217, X,
+    4167, X, X, 2522, 3578, X, X, 7014, X, 7012, X, X, 3239, X, X, X, 2946,
+    1835, 7013, X, 2878, 7055, X, X, 2473, X, X, X, X, X, X, 5403, X, 7056, X,
+    7057, X, 4208, X, X, X, 6698, X, X, X, X, X, X, X, 6720, X, X, 8515, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 6010, 10949, 6430, 2298, 4095, X, 3343,
+    6420, X, 10979, 6428, X, 6417, 3225, X, 6422, 1438, 4083, 1915, 6518, 2814,
+    X, 7053, X, X, 2239, X, X, X, X, X, 7054, X, 11011, 11052, X, X, X, 2722,
+    X, X, 11046, X, 7327, 3916, X, X, 1555, X, X, 10887, X, X, X, X, 5610,
+    5603, X, X, 5616, X, 5614, X, X, 7478, X, X, 3493, X, 4613, 1795, 4060, X,
+    10787, X, 2726, 4614, 3924, 1494, 1862, 10791, 3109, 1928, 4216, X, 4648,
+    1620, X, X, 4647, X, X, X, 1983, 4690, X, 4685, X, X, X, X, X, X, X, X, X,
+    10796, X, X, X, 159, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 4719, 4138,
+    1632, X, X, 4313, X, X, 8313, X, X, 2716, 3439, 2324, 4607, 4608, X, 8487,
+    1975, 1630, X, X, X, X, X, X, X, X, X, 4892, X, 4036, 3837, 2245, 407, 408,
+    409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 1128,
+    1129, 1130, 1131, 1132, 1133, 1134, 1135, 1136, 1137, 1138, 1139, 1140,
+    1141, 1142, 1143, 74, 61, X, X, 12, X, 182, X, X, X, X, X, X, X, X, X, X,
+    7720, X, X, X, X, X, 71, 165, X, X, X, X, X, X, X, 163, X, X, 1532, X, X,
+    X, X, X, X, X, X, X, 3032, X, 4756, X, 4495, 3444, X, 4484, X, 2247, X, X,
+    2246, 4482, X, X, X, 8299, 2595, 1900, X, 4429, X, X, 4430, 4256, X, 4164,
+    3079, 4432, 2529, 3560, X, 4435, X, X, 10987, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 6329, X, X, 6286, X, 6299, X, 6289, X, 1951, X, 6288, 6301, X, X,
+    X, 6287, 6266, X, X, X, X, X, 6267, X, X, X, 1517, X, X, X, X, 6270, 1888,
+    X, X, X, X, X, X, X, 6238, X, X, 3377, X, 6239, 2952, X, 6001, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 7324, 7374, X, 7375, X, X, X, X, X, X, X,
+    7377, X, X, X, X, X, 5920, X, X, X, 5922, X, 5905, 5921, X, 10930, 5923,
+    2772, 6281, 6282, 2686, X, 3501, 6283, 10972, X, X, 3203, 10974, X, 6284,
+    X, 3223, 6987, X, 11002, 2084, X, X, 6986, 3188, 1892, X, X, 6989, X, 6990,
+    X, 2782, 11033, 7308, X, X, 7305, 7307, X, X, X, X, X, X, X, X, 7303, X,
+    2847, 10908, 2694, X, 3858, X, 2363, 10907, 5760, 5774, 3409, 10909, X, X,
+    X, 2621, X, 4529, 4528, 4527, X, 4471, X, 4530, X, X, X, X, 2725, 2657,
+    2865, 4447, X, 4445, X, 4446, 1935, X, X, 2352, 1677, X, 4444, 4443, 3862,
+    0, 1, 2, 22, X, 24, 25, 26, 49, 50, 51, 52, 53, 54, 55, 56, 29, X, X, X, X,
+    28, X, X, 37, 38, X, X, 39, 40, X, X, 3398, X, X, X, X, X, X, X, 4713, X,
+    X, 4710, X, 8327, 3477, X, X, 4585, X, X, 2922, 2443, 2151, 4586, 2484,
+    2334, X, X, X, X, 4858, 4856, X, X, X, X, X, 2489, 2868, X, 3059, 4860,
+    4684, 4682, X, 4044, X, 4679, 4688, 4683, X, X, X, 4686, 2199, 4072, X, X,
+    4146, X, X, X, X, 5229, X, X, 5233, X, X, X, 3101, X, 3151, X, 1748, X, X,
+    4996, 4998, 1848, X, 8352, 4995, 4997, X, 5000, X, 3033, 4838, X, 3450, X,
+    X, 3424, 3451, 3690, 3334, X, X, X, 2390, X, 2093, X, X, 4580, 8311, X,
+    4312, X, X, X, X, X, 2704, X, X, 1804, 3884, 3586, 5065, 5066, X, 2267,
+    1805, 5067, 2185, 4171, 4144, 1871, 5069, 4004, X, 3495, X, X, 2155, 3148,
+    X, X, X, 4826, 4829, X, X, X, X, 5386, 5387, 5389, 5388, 5390, 1691, X,
+    2277, X, X, 3945, 2928, 2720, 5120, 3427, 2661, X, X, X, 3509, 5124, 5123,
+    X, X, X, X, 5122, X, 3844, 2989, X, 2582, 4968, 2738, 4969, 4970, 1460,
+    3127, 2869, X, 4971, 3496, 2739, 2353, X, 1456, 2881, X, X, X, X, X, 4789,
+    2200, X, X, 2336, X, 4791, 4636, 2660, X, 2986, X, 4638, 4637, 2728, 2226,
+    4640, 3695, X, X, 4641, X, X, 4040, 1808, X, 5221, X, 2104, 1711, X, X,
+    5218, X, X, 4253, 5220, 4965, X, X, 4967, X, 3289, 4966, X, 2916, X, 2534,
+    X, X, X, 3149, 2624, 1497, X, X, 3231, X, X, X, X, X, X, X, X, X, X, 4788,
+    X, 4531, X, X, X, X, X, X, X, X, 4140, X, X, X, X, X, 1527, 1800, X, 4896,
+    X, 4078, 3776, X, X, X, X, 5622, X, 8418, 5627, 5631, X, X, 1995, X, X, X,
+    X, 4183, 5907, X, X, X, 7807, X, X, X, X, X, 2678, 2329, 3579, X, X, 5758,
+    X, X, X, X, X, X, 4219, 5856, X, 5860, 3186, 3158, 5725, X, 1546, X, X, X,
+    X, X, X, X, X, X, X, X, X, 5819, X, X, 5825, 5679, X, X, 5681, 5680, X,
+    4003, X, X, 2693, 2613, 2479, X, 5682, X, X, 5900, X, 3636, 5896, 5899,
+    2765, X, 3714, X, X, 5903, X, 2586, X, 5675, 2506, 2934, 2350, X, 3839, X,
+    X, 3919, 4359, X, X, X, X, 2528, 5460, X, 2015, 1543, 2280, 5461, X, 5462,
+    2712, 3073, 8401, 8282, 4661, 3037, 3036, 3157, 8372, 5196, X, X, X, X, X,
+    5204, 5203, X, X, X, 5208, X, X, X, 3635, 5573, 2016, X, 5565, 5567, 5564,
+    X, X, 4339, 1749, 5570, X, 1423, X, 5332, X, X, X, X, X, 5329, X, X, X, X,
+    1873, X, 2606, X, X, 8363, 3294, X, 1988, 5101, X, X, X, 3770, X, 3233, X,
+    3263, X, 4920, X, X, 4922, X, X, 4923, X, X, X, X, X, X, 8454, 8455, X,
+    4320, X, X, 5901, X, 3002, X, 5649, X, 4329, X, X, X, X, X, X, 5652, 2064,
+    X, X, 5648, 5650, 5439, X, X, 8396, 2931, X, 2754, X, X, X, 3245, X, X, X,
+    X, X, 8449, X, X, X, 4330, 2889, X, X, X, 1577, X, 5619, 5644, 5643, X, X,
+    X, X, X, X, X, X, X, X, X, X, 4990, X, X, X, 2133, X, X, X, X, 5356, X, X,
+    X, X, X, X, X, 6173, X, X, 6174, 4064, 6175, X, X, X, 6705, X, X, X, X, X,
+    X, X, X, X, X, X, X, 5818, X, X, X, 6411, X, X, X, X, X, 2116, 3120, 6416,
+    3085, X, X, 6429, 3778, X, X, X, 2698, 6394, X, 2588, 2296, 2513, 1952,
+    3875, 6393, X, X, X, 6967, X, X, 2518, 3604, 6968, X, 1739, X, X, X, X, X,
+    7557, X, X, 1721, X, X, X, 3618, 7558, 7559, X, 1483, X, X, X, X, X, X, X,
+    X, 2312, X, X, X, 4349, X, 6896, X, X, X, X, 6897, X, X, 6898, X, 6900, X,
+    X, X, X, 1858, 2179, X, 8611, 1859, X, X, 3414, X, X, 4293, X, 2072, 7207,
+    7208, 7209, X, X, X, X, X, X, X, X, X, X, X, 8450, 5884, 3221, 5887, 5882,
+    2188, X, X, X, X, X, 2695, X, 5802, X, X, X, 4244, 2289, X, 5815, 5636, X,
+    5638, 5639, X, X, X, X, X, X, 5651, X, 5647, X, 5528, X, 8279, X, X, 5426,
+    5424, 5425, X, X, X, X, 8387, 3270, X, X, 5457, 1761, X, X, X, X, 2102, X,
+    5153, X, X, X, X, X, X, X, X, 3389, X, X, X, X, X, X, X, 6171, X, X, X, X,
+    X, 6172, X, X, 4094, X, 3319, X, X, X, 3081, X, X, 6138, X, X, 2697, X,
+    5865, X, X, X, 3805, X, X, 5873, X, 5870, 5869, X, 5872, 3529, 5874, 1963,
+    3430, X, 5787, 5796, 1424, 1521, 8440, X, 1622, X, 5789, 3113, 5780, 5782,
+    2288, 5598, X, X, X, X, X, X, 5595, X, X, X, X, X, X, 5583, X, 5365, 5376,
+    X, 5375, X, 5374, X, X, X, 5377, X, X, 5379, 2806, X, 5165, X, 5168, 5170,
+    8368, X, X, X, 2566, 8369, 5176, 3369, 5166, X, X, 5618, 5621, 5615, X, X,
+    3279, X, 3783, X, 5605, X, X, 5613, 2757, 5416, 5417, 1876, X, X, 3569,
+    3217, 1955, 2504, 3072, X, X, 2691, 1425, X, X, 1556, X, X, 5763, X, X,
+    5766, X, X, X, 4264, X, X, X, 2961, X, X, X, X, X, X, X, X, 6178, X, X, X,
+    8521, X, 6771, X, 3848, 6766, 8522, 6727, X, X, X, X, X, 7175, 7172, X,
+    7176, X, 2591, 7177, 1895, 2086, X, 8545, 3259, 7226, X, 3383, 3434, 7227,
+    7231, 2883, X, 3642, 3333, X, X, 2947, 7230, 3115, 7318, 8568, X, X, X, X,
+    X, 7310, X, 8567, 7323, 1587, X, X, 7309, X, 6969, X, X, X, X, 6971, 4222,
+    X, 6970, 2857, X, 6972, X, X, 6973, 3984, 1561, 1475, X, 3482, X, X, 7028,
+    X, X, X, X, 7027, X, 3547, X, 8514, 4089, 6666, 1653, 1784, 6670, X, X,
+    6672, X, X, X, X, 2119, X, 2019, 2076, 6364, X, X, X, X, X, 3873, X, 2891,
+    X, 4057, X, X, 6387, X, 6388, X, 6389, X, 2512, X, 6390, 2114, X, X, 1953,
+    X, 6133, X, 1823, 3720, 6134, X, 6135, X, X, 6136, X, X, X, 4101, X, 5866,
+    X, X, X, 8446, X, 8447, X, 5862, X, 5863, X, X, X, 5867, 4203, X, X, X, X,
+    5773, 5767, 5764, X, X, X, 4281, 5770, X, X, 8434, 5576, X, X, X, 3523, X,
+    5549, X, X, 5572, X, X, X, 5574, X, 3345, 5378, X, X, X, X, 5382, X, X, X,
+    X, X, X, X, X, X, X, X, 2322, X, X, 7705, 7704, 7767, X, X, X, X, 7768, X,
+    X, 7769, X, X, X, X, X, X, 7770, 267, 268, 269, 270, 271, 272, 273, 274,
+    275, 276, 277, 47, 34, 48, 32, X, 7412, 7414, X, X, 7413, X, X, X, X, X, X,
+    X, X, X, X, 5657, 5654, X, X, X, X, 2341, 2509, X, X, X, X, X, X, X, X,
+    5971, 5972, 1909, X, 5946, X, X, X, X, 5947, X, X, X, X, 2165, X, X, 3705,
+    5917, X, X, X, X, 3078, 2467, 5919, X, X, X, X, 5918, 2823, 4662, X, 5717,
+    5714, 4199, X, X, 8426, X, 3321, X, X, X, 3534, 5715, X, X, 3302, X, X, X,
+    X, X, 5938, 1668, X, 1956, X, 4079, X, 4063, 5925, X, X, X, X, X, X, X, X,
+    X, X, 5926, X, X, X, X, 8496, X, X, X, X, X, X, 8498, X, 6224, X, X, 3951,
+    X, 3614, X, X, X, X, X, 3438, X, X, X, X, 2315, 6123, X, X, X, 6124, X, X,
+    7780, 6125, 6126, 6127, X, X, X, X, 2457, 6081, X, 6083, 6084, 3247, X, X,
+    X, X, X, 6082, X, 6079, X, 6077, 6078, 3676, X, 3772, X, 6046, 4241, 2112,
+    6047, X, 6045, 3719, 6048, X, 6049, X, 8479, 6016, X, 3786, 6017, X, X,
+    1789, 6018, X, 6019, X, X, X, X, 6020, X, 1968, 3785, X, X, X, 2568, X, X,
+    2342, X, X, X, X, X, 4342, 3374, 2664, 1944, X, X, X, X, X, X, X, X, X, X,
+    X, 3703, X, 2612, X, X, 3996, X, 5471, 5474, 5473, X, 1874, X, X, 1943, X,
+    5470, 4318, 5234, X, X, 5231, X, 5228, X, 8377, 5227, 5232, X, X, X, X, X,
+    5490, X, 3755, X, 5481, X, 5487, 5486, X, X, X, 5751, X, 5757, 8432, X, X,
+    4291, X, 3466, 3511, X, X, X, 6062, X, 6061, X, X, X, X, X, 1557, X, X, X,
+    X, 6773, X, 3013, X, 6777, 2450, 2856, 2083, 4125, X, 4130, 2713, 6791, X,
+    X, X, X, 6792, X, X, X, X, X, X, 6795, 6793, X, X, 6903, 2680, X, X, X,
+    1716, X, 6904, X, 1553, X, 2780, 6905, X, 2302, 1482, X, 2421, X, X, X, X,
+    X, 3628, X, X, X, X, X, 6849, X, X, X, 6850, X, X, X, X, X, X, 7514, X, X,
+    X, X, 7516, 3175, 1750, 1751, 7515, 7519, 7520, X, 7522, 7521, X, X, X, X,
+    X, X, X, X, X, X, X, 6160, X, X, 6159, X, 5878, X, X, X, X, X, X, 3548, X,
+    X, X, X, X, X, X, 3471, X, X, 6221, X, X, X, X, 6222, 6182, 8488, X, X, X,
+    3437, 2403, 1925, X, X, X, X, X, X, X, X, 7073, 3790, 7074, X, 7082, X, X,
+    X, 7528, 7527, X, 7529, X, X, X, X, X, X, X, X, X, 7117, X, X, X, X, X, X,
+    2620, 7555, 7556, 2320, X, X, X, X, 8617, X, 7262, X, X, X, 7263, X, X,
+    3384, X, X, X, X, X, X, X, 8571, X, X, X, X, X, 3019, X, X, 7252, X, X,
+    2700, 7250, 3018, 3017, X, 1477, X, 4272, 7254, X, 3747, 8580, X, X, X,
+    2722, X, X, 8574, X, 7327, 3916, X, X, 1555, X, X, 7268, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 3003, X, X, 4301, 5983, X, X, X, X, X, X, X, 5985, X,
+    8464, X, X, 6057, X, X, X, 6052, 6053, X, 6056, 6055, 3764, X, X, 3041,
+    3040, 3419, 4154, 2290, 2848, X, X, X, 3238, 4625, X, 3303, 1669, 6037, X,
+    X, X, 6635, X, 3142, 3656, 2192, 6634, 3012, X, X, X, X, X, X, 7194, X, X,
+    3629, 4285, X, X, X, X, 2651, 1586, 3051, X, 2176, X, 4193, X, 8548, 7248,
+    3395, X, X, X, 3095, 2592, 7249, 8577, X, 3962, 8581, X, 8579, X, 8575, X,
+    8576, X, X, X, X, X, X, 7735, X, X, X, X, X, X, 7736, X, 7737, 8526, 8527,
+    8536, 8544, 8546, 8547, 8550, 8578, 8585, 8601, 8613, 8614, 8616, 8629, X,
+    X, 1897, X, X, X, X, X, X, 7530, X, 7531, X, 4617, 5666, 3716, 3278, 7565,
+    2053, X, X, 1676, X, X, 7564, X, X, 7562, X, 7563, X, 7561, 3490, X, X, X,
+    X, X, X, 7578, X, X, X, X, X, X, 7583, X, 7298, X, 3353, 8558, 8559, 4000,
+    2065, X, X, X, X, X, 8556, 8557, X, 2408, 4315, 6926, 6927, 3092, X, X, X,
+    X, X, X, X, X, X, 4231, 2379, 3135, 6995, X, 2784, 3789, X, X, X, X, X,
+    6994, X, X, 2519, X, 6648, 2826, X, X, X, 1583, 6649, 6650, X, X, X, X, X,
+    6651, X, 1827, X, 6344, X, X, X, 6345, X, X, 6346, 6349, X, X, X, X, 6983,
+    X, X, X, 6984, X, X, X, X, X, X, X, 3206, X, X, 7063, X, X, X, X, 7065,
+    3640, X, 2174, 7095, 7094, X, 3833, X, X, X, 2570, X, X, 3433, X, X, 7118,
+    X, X, X, X, X, X, X, X, 7126, 7124, X, X, 7121, 7137, X, X, X, X, X, X, X,
+    X, X, X, X, X, 7135, 7136, 7138, 3199, 2830, 3603, X, X, X, X, 7215, X, X,
+    3906, 3341, 2349, X, X, 3204, 7295, 2039, X, X, X, X, 7296, 8554, 3386, X,
+    8553, 7299, 1779, 2862, 8555, 7297, 7344, X, X, X, X, X, X, X, X, 7348, X,
+    X, X, X, X, X, 5129, 2497, 3973, 3974, X, X, 1597, 5134, 10838, X, 8624, X,
+    X, 7645, X, X, X, X, 7648, X, 8625, X, X, X, X, 10962, X, X, X, X, X, X,
+    4247, 2292, X, X, 2168, 10997, X, X, X, X, X, X, X, X, 6790, 6788, X, X, X,
+    X, X, 4592, X, 3969, X, X, X, X, 2323, X, X, 4591, X, 1195, X, X, X, X, X,
+    X, X, X, X, 175, X, X, X, X, 4748, X, X, X, X, X, 4742, X, 4746, X, X,
+    4744, 8316, 4113, 3564, X, X, 3934, 4623, 8317, 4624, X, X, X, X, 4626, X,
+    4628, 4501, X, X, X, X, 4500, 4504, X, X, X, 4503, X, 3357, X, X, X, 1727,
+    X, X, X, 2131, 4603, 4242, X, X, X, 4599, X, X, 5174, X, 1686, X, 5172,
+    5173, X, X, 5169, 5171, X, X, X, 2232, 2493, 4938, X, X, 2261, 4939, 8345,
+    2533, 3125, X, 4940, 4941, 2501, 2262, X, 4091, 2057, X, X, X, X, X, 1539,
+    X, X, X, X, X, X, X, X, X, 1867, X, 4928, 4927, X, X, X, 5249, X, X, 5248,
+    X, X, X, X, X, X, X, X, X, 5039, X, X, 1849, 5040, X, X, 5438, X, 5434,
+    8392, 1693, 5435, 5436, 3718, X, X, X, X, 3824, 2109, 3139, 5198, 8373,
+    3066, 5193, X, 5190, 5191, X, 2607, 5194, 5197, X, X, X, X, 4200, X, X,
+    1695, 2846, 5754, X, X, X, X, X, X, 1969, 6225, X, X, 6227, X, X, X, 6228,
+    X, 6015, X, X, X, 8470, X, X, 5994, X, X, X, X, X, 2190, X, 3219, X, X,
+    5776, X, 5765, X, 5771, X, 5778, 1501, 5768, X, 5779, X, 5562, 5541, 5561,
+    X, 5554, 5542, X, 5558, X, 5559, X, X, X, X, X, 5920, X, X, X, 5922, X,
+    5905, 5921, X, 8458, 5923, 1696, X, X, X, X, X, X, X, 1947, X, X, X, 2599,
+    2399, X, X, 5944, X, X, X, 5945, X, X, X, X, X, X, X, X, X, 5891, X, X, X,
+    5890, X, 5888, 3346, X, X, X, 5871, X, X, X, 5833, X, 5832, X, 5841, X, X,
+    X, 6339, X, X, 6343, 6340, X, X, X, X, X, X, X, X, 2557, X, X, 7181, 7180,
+    2125, 7183, X, 6754, X, X, X, X, 3342, X, X, X, X, X, 6759, 1503, X, X,
+    6868, X, X, X, X, X, X, X, X, X, X, 4162, X, X, 6920, X, 6922, X, X, X, X,
+    X, X, 3744, X, X, 6918, X, 6574, X, X, 3502, X, X, X, 2000, X, X, X, 6585,
+    3600, X, X, 6513, X, X, X, 6516, X, 6517, 6514, X, X, X, 1512, X, X, 2471,
+    6468, X, X, X, X, 6473, 6474, 8272, X, 6475, X, 6481, 3410, 2078, X, X, X,
+    X, X, X, X, X, 6463, X, 6467, 6466, 6470, X, 6472, 3378, 6437, X, X, 6433,
+    X, X, X, 3905, 1828, X, X, 4084, X, X, 1471, 8508, X, 6425, 6419, X, X, X,
+    X, X, X, X, 6423, 2627, 1470, 6418, 6426, 3046, 3981, 2436, X, X, X, X, X,
+    X, X, X, 2514, 3350, X, 6398, 4292, 6365, X, 4248, X, X, 3655, X, 3045,
+    3591, X, X, 2676, X, X, X, 1441, 6355, X, X, 6352, X, X, X, X, X, X, X, X,
+    6351, 2963, X, 6354, 2573, X, X, X, 3515, 6334, 6333, X, X, 6330, X, X, X,
+    4345, X, X, 6319, X, 3654, 4048, X, 2470, 6313, 6322, 6317, X, 6316, 6312,
+    8503, 6314, 1753, X, X, X, X, 2877, 3827, X, 6295, X, X, X, 3173, X, X, X,
+    6862, X, 2829, X, 6858, X, 6861, X, X, X, X, X, 6853, 2143, X, 6902, X,
+    6901, X, 2647, X, X, X, X, X, 2307, 5740, X, X, 6933, X, 6938, X, X, 3856,
+    X, X, 6940, X, 6939, X, X, X, 7362, X, X, X, 7363, X, X, X, X, X, X, X, X,
+    7755, 2332, 4086, 4014, 5068, X, 5703, 4038, 235, 236, 237, 238, 239, 240,
+    241, 242, 243, 244, 245, 45, 31, 46, 15, 17, 10773, X, 2574, X, 3107, 3358,
+    2059, X, 4506, X, X, X, X, 1901, X, X, 7589, X, 7591, 7590, X, X, X, 7592,
+    7594, 7593, X, X, X, X, 10924, X, X, X, X, 5892, X, X, X, X, X, 10923,
+    10964, X, X, X, X, X, X, X, X, X, 2545, X, 4302, X, 2587, X, 10834, X, X,
+    X, 4120, 2186, 2205, X, 5099, X, X, X, 5100, X, 5106, 4217, X, 5022, 10827,
+    X, X, X, X, X, X, X, X, 5012, X, X, X, 1161, 1171, X, X, 1170, 1164, X, X,
+    X, 1172, X, X, X, X, 4772, X, X, X, X, X, X, X, X, X, X, X, X, 8600, X, X,
+    X, 7638, X, X, X, X, X, X, X, X, X, X, 1439, 11095, 11099, X, 7714, X, X,
+    X, X, X, X, X, 7719, X, X, X, X, X, 1523, X, 2371, 2835, X, X, X, X, X, X,
+    X, 4708, 2799, 4602, 1759, 4596, 4594, 3054, X, X, X, X, X, X, X, 4598, X,
+    4597, 2369, 4139, X, 3147, X, 1628, 8290, 4458, X, 4165, 4454, 4456, 2427,
+    4457, 4891, X, X, 4271, X, X, X, 4355, X, X, X, 7015, 7026, 3310, X, 7025,
+    11007, 7318, 11040, X, X, X, X, X, 7310, X, 11039, 7323, 1587, X, X, 7309,
+    X, 5859, X, 5838, X, 10917, 7404, X, X, X, 5864, X, X, X, 5868, X, 9, 8647,
+    83, 79, 82, 84, 8646, 41, 42, 85, 59, 3, 60, 4, 30, 4455, X, X, X, 3693, X,
+    4295, X, 2832, 10761, 2482, X, 2530, 1629, X, X, 7546, X, X, 7548, X, X, X,
+    7547, X, 7550, 7553, X, X, X, 5886, X, X, X, X, 5885, 3415, 1466, 10750, X,
+    X, X, X, 1791, X, X, 4469, X, 4461, X, 8292, 4296, X, 2531, X, 4462, 391,
+    392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406,
+    65, 158, X, X, X, X, 68, 69, X, X, 160, 161, X, X, X, X, 4764, X, X, X,
+    1864, X, 4767, 4763, 4766, X, X, X, 1986, X, 4841, X, X, X, X, X, X, X, X,
+    X, X, X, 7267, X, X, 8549, X, 2308, 6906, 1474, X, X, X, X, 3788, X, X,
+    6907, X, X, X, X, 7721, X, X, X, X, 7722, X, 7717, X, X, X, 7697, 7801, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 3647, 313, 314, 315, 316, 317,
+    318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 8634, 8635, 8636,
+    8637, 8638, 8639, 8640, 8641, 8642, 8643, X, X, X, X, X, X, 8379, X, X, X,
+    X, 3733, 5370, X, X, X, 5646, X, X, X, X, 5645, X, X, 5642, X, X, X, X,
+    5966, X, 4152, 4153, X, X, X, X, X, X, 5970, 1581, 5935, X, X, X, X, X,
+    5936, 3903, 3704, X, X, 5937, 3626, X, X, X, 6601, X, 6597, X, X, X, X,
+    3829, X, 4023, 3767, X, X, 2643, X, 6523, 6522, X, X, X, X, X, X, X, X, X,
+    X, 2356, X, X, X, X, X, 3365, 3942, 3408, X, X, 2269, X, 3819, X, X, X,
+    5518, X, X, X, 3775, X, X, X, X, X, X, X, X, 1923, 5629, X, X, X, X, X,
+    1880, 8385, X, 2278, 5421, X, X, 2360, 2751, X, 8388, 5420, X, 2752, X,
+    4073, 2359, 3154, 5137, X, X, X, 1941, 5147, 2926, 1572, 5141, 1685, 5146,
+    X, X, X, 1990, 4931, X, X, X, X, X, 4924, 4921, X, X, X, X, X, X, X, X,
+    4734, 4727, 1798, X, 1863, 1760, 4735, 4731, 4618, X, 2923, 4615, 2021, X,
+    4616, 1796, X, X, X, X, X, X, X, X, 2631, X, 2623, X, X, X, X, X, 3453, X,
+    2632, 1802, 3267, 3363, 1433, 1904, 3938, X, 2571, 4769, X, X, X, X, X,
+    4768, 1728, X, X, 4770, X, X, X, X, 4773, 2727, 1982, X, 4631, 8318, X, X,
+    X, X, X, 3724, X, X, X, X, 4632, 8301, X, 2574, X, 3107, 3358, 2059, X,
+    4506, X, X, X, X, 1901, X, X, 2803, X, X, X, X, X, X, X, 4932, X, 3349, X,
+    X, X, 3140, X, 3860, X, X, 3182, X, X, 5275, X, X, 5273, X, 3673, 5062,
+    3883, 5063, X, X, X, X, X, X, X, X, X, X, X, X, 11072, X, X, X, 2422, 1708,
+    X, X, X, X, 4694, X, X, X, 4704, 1495, 4703, X, 4422, 2063, X, X, X, 4423,
+    X, 1846, 3211, X, 2608, 4424, X, X, 4425, 680, X, X, 675, 666, 687, X, X,
+    682, X, X, 677, 665, X, X, 681, 517, 518, X, 519, 520, 521, 522, 523, 524,
+    525, X, X, X, X, X, X, 4929, X, X, X, X, X, X, X, X, X, 5002, X, X, X, X,
+    X, X, 5964, 5961, X, X, X, 4093, 5963, 5965, X, 4265, 5930, X, 5931, X, X,
+    2600, 3826, X, X, X, 4117, 5932, 5933, 3061, 2541, 5934, 4282, X, 5913, X,
+    5915, 1580, X, 5910, X, X, X, X, X, X, X, 4758, 5875, X, 5877, X, X, X, X,
+    X, X, X, X, X, X, X, 5876, X, 3520, 5628, X, X, X, 5630, X, X, X, X, 8417,
+    X, X, X, X, 8461, 5969, X, X, X, 5968, 3281, 3584, X, X, 2166, 5967, 2401,
+    5942, 5941, X, X, X, X, 5943, X, X, X, X, X, X, X, X, 4314, X, X, 5889, X,
+    X, X, 1511, 3660, X, 1818, 4319, X, X, X, X, X, X, X, 4042, 3339, X, X, X,
+    6290, X, 6294, 6296, X, X, 2440, X, X, X, X, X, X, 1605, X, X, X, X, X, X,
+    X, 6955, 2036, 1924, 4358, 1717, 2785, X, X, X, X, X, 8532, X, X, 6998, X,
+    X, X, 7494, 7495, X, X, X, X, X, X, X, X, X, X, X, 6147, X, X, 6144, 2850,
+    6095, X, X, X, 6094, X, X, X, X, X, X, 6096, X, X, X, X, 3480, 6794, X, X,
+    X, 3710, 6781, X, X, X, X, X, 2062, 4249, X, 2075, X, 3167, 6580, X, 7431,
+    1703, 2898, 3876, X, 1535, X, X, X, 4306, 4210, X, 7452, X, 3420, X, X, X,
+    X, 5622, X, 10890, 5627, 5631, X, X, 1995, X, X, X, X, 1165, X, X, X, X, X,
+    X, X, X, X, 1169, X, X, 4824, 4825, 4823, X, 4827, X, X, X, X, X, 3595, X,
+    X, 1481, 3171, 2561, 2486, 1509, X, X, 1771, 2325, 2485, X, 4666, X, X, X,
+    X, X, 4910, 4911, X, X, X, X, X, 2736, X, X, X, 2839, X, 3771, X, X, X, X,
+    X, X, 1872, 3577, X, X, 8415, X, X, X, X, 5610, 5603, X, X, 5616, X, 5614,
+    X, X, 5823, X, 3392, X, X, 5830, 5820, X, X, X, X, X, 5821, 5797, 4837, X,
+    X, X, X, 1882, 5695, X, X, X, X, 5696, X, 3929, 4019, X, 5447, X, X, 5452,
+    X, X, 3539, X, 5449, X, X, X, X, X, X, 8484, X, X, X, X, X, X, X, 3738, X,
+    5859, X, 5838, X, 8445, 7404, X, X, X, 5864, X, X, X, 5868, X, 4088, 5633,
+    5620, X, X, X, X, X, 2163, 1600, 1754, X, X, 5596, X, 5410, X, 5408, 5411,
+    4254, 5409, X, X, X, X, 3004, 5412, X, X, 3119, 5140, X, 3443, X, X, 5145,
+    3820, X, X, 5139, X, 5144, 4300, 2498, X, X, 5609, X, X, X, X, X, X, 5608,
+    X, 3337, X, 3076, X, 5606, 2842, X, X, X, X, X, X, 5407, X, 3946, X, X,
+    1590, 2503, X, X, 2638, 5747, X, 5746, 5741, X, 5744, X, X, 1763, X, 5743,
+    3612, X, 8408, 3335, 3519, 1544, X, X, X, X, X, X, X, X, X, X, X, 1190,
+    1206, 1205, 1204, X, X, 3668, X, 6186, X, X, X, X, X, 10963, X, 6188, X, X,
+    X, 7478, X, X, 3493, X, 4613, 1795, 4060, X, 8315, X, 2726, 4614, 3924,
+    4479, 4477, X, X, 4472, X, X, 3116, 4475, X, 4478, 4476, X, 3914, X, 4473,
+    439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452, 453,
+    454, 658, 669, 659, 670, X, X, X, X, X, X, X, X, 660, X, X, 671, 485, 486,
+    X, 487, 488, 489, 490, 491, 492, 493, X, X, X, X, X, X, 1417, X, X, X, X,
+    1498, X, X, X, 2492, 1414, 3801, 4701, X, 4697, X, X, 4692, 4698, 2389, X,
+    X, X, X, X, X, 5454, X, X, 2707, 5455, X, 4178, 3659, X, X, 1487, X, X,
+    5813, X, X, X, X, 5801, X, X, X, X, 5807, 2138, 2538, X, 2026, X, X, X,
+    1601, X, X, X, X, X, X, X, X, 5704, X, X, X, X, X, X, 2508, 4363, 5489,
+    2904, X, X, X, 5488, X, X, 5483, X, X, X, X, X, 2208, 2705, 5271, X, X, X,
+    X, X, 2993, 7266, 3731, X, 2611, X, 2394, 5272, X, 5051, X, X, X, X, 3290,
+    X, X, 5050, 5049, 5052, X, 3364, X, X, 8399, X, 3976, X, X, X, 5453, 5448,
+    X, X, 5451, X, 5450, 8400, 5192, 2636, X, 5195, X, X, 5189, X, 4133, 4132,
+    X, X, X, 5199, 5200, 1462, 4950, X, X, 4951, X, 3181, X, 1510, 2610, 1443,
+    X, 3062, 1801, 2558, X, 2263, 4757, X, X, X, X, X, X, X, X, X, X, 1781, X,
+    X, X, X, 1574, 8380, 5335, X, X, X, 4176, X, X, X, X, X, 3326, X, X, X,
+    1547, 2286, 5742, X, X, X, X, 6038, X, 6043, X, X, 6041, 6040, 5391, 1697,
+    6039, X, 1467, 1821, X, X, X, X, X, X, X, X, X, X, X, X, 2542, X, X, 6063,
+    6065, X, 3793, X, 2766, X, X, 6072, X, X, 6071, X, X, 4266, X, X, X, 6099,
+    6097, 6098, X, X, X, 1851, X, X, X, 6693, X, X, X, X, 1490, X, X, 6684, X,
+    X, X, 6683, 6701, X, 6691, X, X, X, X, X, 6703, X, 6689, 3663, X, X, X, X,
+    3344, X, 7343, 8591, X, X, X, 3230, 7339, X, X, X, 1791, X, X, 4469, X,
+    4461, X, 10764, 4296, X, 2531, X, 4462, 4565, 4563, 4564, 4562, 2416, 4566,
+    4115, 4297, X, X, X, X, X, 4567, 10781, X, 3892, 3315, 2351, X, 2319, 2702,
+    X, 2879, X, X, X, 7508, X, X, 7507, 4169, 1857, 3715, 3537, X, X, X, 2911,
+    4275, X, 2126, X, X, X, X, X, 6486, X, 10983, X, X, X, X, 6487, 6488, 6489,
+    X, 5165, X, 5168, 5170, 10840, X, X, X, 2566, 10841, 5176, 3369, 5166, X,
+    X, 2091, 3106, 1665, X, X, X, X, 10749, 2682, X, X, 10767, 4474, X, 7458,
+    X, 7456, X, X, 7460, X, X, 7461, X, X, 3097, X, 1663, X, 2968, X, 7130, X,
+    X, X, X, 2218, X, 7127, 7128, X, X, X, 4332, 7147, X, X, X, X, 7154, X, X,
+    X, 7149, X, X, X, X, X, 2969, 2681, X, X, X, 7222, X, X, 4075, 7237, 7224,
+    7225, X, X, 3330, X, X, 3413, 7179, X, X, X, X, X, X, X, 7182, X, X, X, X,
+    10776, 4523, X, X, X, 4522, X, 3893, X, X, X, X, 3344, X, 7343, 11063, X,
+    X, X, 3230, 7339, X, X, X, 4693, X, 4702, 4695, X, X, 4699, 8326, X, 4700,
+    4696, X, X, 4729, 3448, X, X, 2866, 4578, X, 3865, 2971, 1787, X, 1794,
+    4579, X, X, 4581, X, 570, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    4813, 4655, X, 8321, 2184, X, X, 4656, X, X, X, X, 1957, X, X, X, X, 1569,
+    X, X, 1866, 3541, 3937, X, X, X, X, 4880, 3060, 4690, X, 4685, X, X, X, X,
+    X, X, X, X, X, 8324, X, X, X, 4815, X, X, X, X, X, X, X, X, X, X, X, X,
+    1175, 1176, 1177, X, X, 6319, X, 3654, 4048, X, 2470, 6313, 6322, 6317, X,
+    6316, 6312, 10975, 6314, 1924, 4358, 1717, 2785, X, X, X, X, X, 11004, X,
+    X, 6998, X, X, X, 2461, 4657, X, X, X, X, 4031, 2370, 1937, 4142, 3055,
+    3696, 2630, X, 1201, 1202, X, X, X, X, X, X, 1203, X, X, X, X, X, X, 5339,
+    X, X, X, X, X, X, 3128, X, 5346, 5088, 5086, X, 5087, 5089, X, 1571, 3367,
+    5090, X, 2157, 1683, 3593, X, 5091, 3568, 2941, 1486, 3639, X, X, X, X,
+    3348, X, 4862, 4861, 4863, 4864, 4865, X, X, 3622, X, X, X, 5316, X, 2068,
+    X, X, 1752, X, X, X, 5324, 5074, X, X, 1730, X, X, 5076, X, X, X, 5079,
+    5080, X, 5078, X, 3791, 4836, X, 4832, X, X, 2867, X, X, X, 4840, X, X, X,
+    X, 2677, X, 4604, 4601, X, 4600, X, X, X, X, X, X, 4276, 8312, X, X, 2250,
+    4466, X, X, 1631, X, 3880, 4460, X, X, X, X, 4464, 2244, X, X, 2483, 361,
+    362, 363, 364, X, X, X, X, X, X, X, 10, 11, 20, 21, X, X, 10940, X, X, X,
+    10938, X, X, X, X, X, X, X, 5989, X, 2137, X, X, 10775, X, X, X, 2460,
+    3752, 4508, X, X, X, X, X, 1196, 1197, 1198, 1199, 1200, X, X, X, X, X, X,
+    X, 5306, 1416, X, X, 2384, X, X, X, 2841, 8361, X, 5042, 5041, X, X, 5043,
+    X, X, X, X, 5044, X, 2991, 2634, X, 4889, 3572, 3727, 4090, X, X, X, X, X,
+    3576, X, X, 4898, X, X, 2464, 5353, X, 5352, X, X, X, X, 3589, X, X, 8382,
+    3498, X, 5111, 2100, X, X, X, 3766, 8364, X, 2393, 3782, 3295, 3802, 5112,
+    X, X, 2932, X, X, X, X, X, X, 5555, 1814, X, X, X, X, X, 5897, 5902, X, X,
+    1579, X, X, 8453, X, X, X, 1472, 6569, X, 3227, X, X, X, X, X, 3627, X,
+    3160, X, 6245, 1489, X, X, X, X, 6248, X, X, X, 6246, 1649, 2113, 6247,
+    2293, 6215, X, 3581, X, X, 2770, X, X, 3787, X, X, X, X, 2404, X, X, 6180,
+    X, 2167, 2402, X, X, X, X, X, X, X, X, X, X, 179, X, X, 178, X, 177, 629,
+    630, 631, 632, 633, 634, 635, 636, 637, 638, 639, 640, 641, 642, 643, 644,
+    X, 7600, X, 7601, 7602, X, X, X, 2321, 11091, X, X, 11092, X, 7603, 7604,
+    2339, 4066, X, X, 7710, X, X, X, X, X, X, 11100, 3965, X, X, 7718, 7762,
+    11103, 2340, X, 7763, X, X, X, 5973, 4100, X, 3168, 7764, 7766, 7765, X,
+    7298, X, 3353, 11030, 11031, 4000, 2065, X, X, X, X, X, 11028, 11029, X,
+    3520, 5628, X, X, X, 5630, X, X, X, X, 10889, X, X, X, X, 3338, X, X, 3197,
+    4459, X, X, X, X, X, 1453, 3356, 2658, 329, 330, 331, 332, 333, 334, 335,
+    336, 337, 338, 339, 340, 341, 342, 343, 344, 104, 105, 103, 106, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 7501, 3574, X, 7169, X, X, X, X, X, X, X, X,
+    7168, 2859, 7170, X, X, 2050, 3165, 3094, X, 3485, X, 7223, 1932, X, X, X,
+    X, 7232, X, 7229, 7242, 3486, 8564, X, X, X, 3403, 7311, X, X, 7314, 7312,
+    X, 7317, X, X, 8566, X, 4190, X, 6964, X, X, 3857, 3609, 6965, X, 6966,
+    2172, X, X, X, 1891, 7022, 7030, 7023, X, 7019, X, 3381, 7018, X, X, X,
+    7016, X, 4136, 2523, X, 6658, X, 6659, X, 2604, 2049, 3282, X, X, X, 3526,
+    X, X, X, X, 4304, X, X, 2219, X, 8569, 8563, X, 8565, X, X, 7316, 7364, X,
+    X, 7361, 7360, X, X, X, 2791, 3487, 7359, X, X, X, X, X, 10921, X, X, X,
+    4330, 2889, X, X, X, 1577, X, 4259, X, X, X, X, 3887, X, 10756, X, 4421, X,
+    X, 3265, X, X, 1500, X, 1436, X, X, X, X, X, X, X, 2527, 3963, 2819, X,
+    2038, X, X, 3907, X, X, X, X, X, 7216, X, X, X, X, X, 7799, X, X, X, X, X,
+    X, 7800, 6255, X, X, 7503, 1624, X, 7506, 7505, X, X, X, X, 1507, X, X, X,
+    2006, 1918, X, X, 7493, X, X, 7492, X, 7491, X, X, 7036, X, 3913, X, X,
+    3678, X, 7313, X, 2789, 8570, X, X, X, X, X, X, X, X, 7616, X, 7617, X, X,
+    X, X, 7618, 8626, X, X, X, 7671, X, 7667, X, 7668, 7664, 7670, X, 7666,
+    1757, X, X, 1563, X, X, X, X, X, X, 7401, X, 7400, 7399, X, 7402, X, 3565,
+    X, 3807, X, X, X, X, X, X, 7096, 2474, 2525, X, 2787, X, 6753, X, X, X, X,
+    X, X, X, X, X, X, X, 6731, X, X, 6769, X, X, X, 6802, 3048, X, X, 6797,
+    6799, X, X, X, X, 7409, 7408, 7410, X, 3491, X, X, X, 7411, X, X, X, 10792,
+    X, X, 4650, X, 4279, X, 2253, X, X, X, X, 2183, 4728, X, X, 4738, 3024, X,
+    10800, 4740, X, 2257, 4730, 3288, X, X, X, X, 1745, 7433, X, 7434, 7432,
+    2135, X, 2410, 2792, 11074, X, X, 10893, X, 10894, X, X, X, 3672, X, 5653,
+    X, X, X, X, X, 2921, 4568, 2689, X, X, 4569, X, 3287, 4260, 3447, X, X,
+    5030, X, 5029, X, X, 5028, X, X, X, 3455, 5007, X, X, X, 5495, 5493, X,
+    1642, 5491, 5497, 5503, X, 8405, X, X, X, X, 1578, X, X, X, X, 5895, 3871,
+    X, 5894, X, X, X, 2547, X, X, 4118, X, X, X, X, 6540, X, 3226, X, 6539,
+    6496, X, X, X, X, X, X, 6499, 6497, 6498, 2414, 2118, X, X, 3249, X, 6210,
+    6209, X, X, X, X, X, X, 6211, X, X, X, X, X, X, 6735, X, 8519, 4188, X, X,
+    X, X, 4239, X, 3476, 6406, 6403, X, 1699, 2981, X, X, 2169, X, X, X, 6415,
+    X, X, 6436, X, 4322, X, X, X, X, X, X, 6435, X, X, X, X, 7081, X, X, X,
+    7083, X, X, X, X, 1704, 3360, X, 3841, 6741, 3478, X, X, 1426, X, X, 6734,
+    X, 6730, 3089, 6724, 6732, 6737, 2572, X, X, X, X, X, 6722, X, X, X, X, X,
+    X, X, X, X, 6158, X, X, X, X, 6157, 6156, 6109, X, 6110, X, X, X, 6111, X,
+    6112, X, 3680, 3431, 6113, 3653, 3779, X, 5844, X, X, X, X, X, 1819, X, X,
+    X, X, X, X, X, X, 5799, 8438, 5794, X, 8441, X, 5786, X, 5580, 1712, X, X,
+    X, X, X, X, X, 2420, X, X, X, 1564, X, 4177, 5364, X, X, 5360, X, 5361, X,
+    X, X, X, X, 3071, 8383, X, 5151, 5161, 5159, X, X, 5156, X, X, X, 5155,
+    4317, X, 5157, X, X, 5604, X, X, 5611, X, X, X, X, 5617, 3750, 5623, X, X,
+    X, 5886, X, X, X, X, 5885, 3415, 1466, 8278, X, X, X, X, 6207, X, X, X, X,
+    X, X, X, X, 6206, X, X, 2378, X, X, X, X, X, X, X, X, X, 6179, X, X, X,
+    6765, X, X, X, X, 4370, 3479, 3842, 8523, X, 6778, X, X, 6882, X, X, X,
+    6887, 6888, X, 1701, X, 1913, X, X, 6886, X, 2213, 2515, X, X, 3743, X, X,
+    X, 2171, 3982, X, 6564, 6562, X, 2301, 4187, 4346, X, 2300, 6531, 2589,
+    6530, X, X, X, X, 6532, 2546, X, X, X, 8538, X, X, 7046, X, 2554, X, 7048,
+    7047, 3831, X, X, 7050, 3832, 2415, 2310, X, X, X, X, 3806, 1660, 3711,
+    7086, 1836, 2966, 7085, 7090, 3284, 8540, X, X, X, 8541, X, X, X, X, X,
+    7098, 7099, 2311, 7097, X, X, 7139, X, 3382, X, X, 7144, 7148, 7145, 7143,
+    X, 7146, X, X, X, 7532, X, 4104, X, X, X, 7533, 4195, X, 1537, X, X, X,
+    5751, X, 5757, 10904, X, X, 4291, X, 3466, 3511, X, X, X, 4515, X, X, 2020,
+    X, X, X, 4512, 4513, X, X, 3492, X, 3099, 4440, X, X, 4441, X, X, 4442, X,
+    X, X, 2864, X, X, X, X, X, 2149, X, X, X, X, X, X, 4505, X, X, X, 8320, X,
+    X, 4650, X, 4279, X, 2253, X, X, X, X, 2183, 2532, X, 4538, X, 4540, X, X,
+    X, X, X, 3445, X, 1776, X, X, X, 2095, X, X, 4722, 4723, X, X, X, X, 4720,
+    4726, X, X, 2158, X, X, X, 1614, X, X, X, 5244, X, X, X, 1809, X, 2699, X,
+    3074, X, 2264, 2373, 2265, 1959, X, X, 5045, X, X, 2374, X, 1459, X, 1412,
+    X, X, X, X, X, 4905, X, X, X, X, X, X, 3280, 3178, 8448, X, X, X, 2918, X,
+    X, X, 3891, X, 6363, X, X, X, X, X, X, X, X, 4107, X, 1910, X, X, 6058, X,
+    X, X, X, X, 6059, X, X, 6060, X, X, 4230, 6075, X, X, X, X, X, 3080, X, X,
+    X, X, X, X, 6581, X, X, X, X, 6579, X, X, 2872, X, 8499, 4877, 6277, X,
+    6276, X, X, X, 6278, 6279, X, 4250, 6280, X, 7504, 2337, X, 3923, 6249, X,
+    X, 3999, X, X, 6251, X, X, X, 2962, 1550, 1623, 6244, 2029, X, X, 4352,
+    3028, X, X, X, X, 6223, X, X, 1647, 3376, 3854, 3721, 6195, X, X, 6198, X,
+    X, X, X, X, 6205, X, X, X, X, X, 1700, 1427, X, X, X, X, 6654, 6657, 3617,
+    X, 2855, 6679, X, X, X, X, 6682, X, X, X, 3087, 2120, X, X, X, X, 1536,
+    6715, X, X, X, X, X, X, X, X, 3931, X, 6706, X, X, X, 1655, 6749, 4053, X,
+    X, X, X, 6752, X, X, 6745, 6748, X, 8276, X, X, X, 7195, X, X, X, X, 4137,
+    7197, X, 7196, X, X, 7200, 4168, 7256, 7255, 7253, 6271, 1837, X, X, 7221,
+    X, 7258, 7257, X, X, X, X, 7259, 2896, X, X, X, X, X, X, X, 2897, 7332,
+    7334, X, X, 8588, 8586, X, 6993, X, X, X, X, 6996, X, 6997, X, X, X, X, X,
+    X, X, 7205, X, X, X, X, 7206, X, X, 2331, 7272, X, 7271, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 2768, X, X, 4121, 6176, X, 3241, X, 3645, X, 2048, X,
+    X, X, 3222, 6177, 1999, 2452, X, X, 6120, X, X, 6119, X, X, 6121, 6122,
+    8483, 8481, X, 8482, X, 3418, X, 5847, X, 8444, X, X, X, 5851, X, X, X, X,
+    X, X, 3900, 1650, X, X, X, 6318, X, 6315, X, 6320, 6285, X, X, X, X, X,
+    1978, X, 4542, 3256, 2556, X, X, X, X, 1825, 6256, X, X, X, 2141, X, 1949,
+    X, X, 6257, 2058, X, X, 6258, X, 3005, 3580, X, X, 6229, X, X, X, X, X,
+    6230, 6231, X, X, 2030, 1648, 3514, 8492, X, X, X, X, X, X, X, X, X, 2545,
+    X, 4302, X, 2587, X, 8459, 5949, X, X, X, 2810, X, X, 5948, X, X, X, X,
+    8460, X, 5732, X, 1644, X, X, X, X, 3861, 4134, 5734, 2540, 2759, 5727,
+    5733, 1575, 2018, 2079, 8406, 1813, 1922, X, X, X, X, 5517, X, X, 2438,
+    4028, X, 2466, 1961, 1731, X, X, X, X, X, X, X, X, X, X, 1762, 2820, 5304,
+    5309, 3939, X, X, X, X, 8353, 3454, X, X, X, 5005, 2683, X, 5004, X, X,
+    5401, 5402, X, X, X, 3877, 4948, 2951, X, X, 3803, X, 2405, X, 8374, X, X,
+    X, 5188, X, X, X, X, 2055, 1415, X, X, X, 1807, 2392, X, X, 1709, 1570,
+    2737, 1637, X, 4953, 4173, X, X, X, X, X, 2672, 4771, X, 3596, X, X, 4774,
+    X, X, X, X, X, X, X, X, 4775, X, 4490, 8297, 3932, 3240, 4486, 2148, X,
+    4483, 4491, 4485, 4278, 4492, 4356, X, X, 3633, X, X, X, X, X, X, X, 4914,
+    3777, X, X, X, X, 4218, 5655, X, X, X, X, 5607, X, X, X, X, X, 6192, X, X,
+    X, X, 1737, X, 6200, X, 6199, X, 8457, X, 3590, X, X, X, X, 3468, 5914, X,
+    X, X, X, 5916, X, 4058, X, 5705, 5706, X, X, 1883, X, X, X, 5707, X, X, X,
+    X, 2189, X, X, 4237, X, 2017, X, 1603, X, X, X, X, 6556, 6558, 6557, 3670,
+    X, 3566, X, 4353, 3674, X, X, X, 3114, X, X, X, X, X, X, 7120, X, X, X,
+    7119, X, 6750, X, X, 3258, X, 6751, X, X, 4189, 6740, 1715, X, 6746, X, X,
+    6803, X, X, X, X, X, X, X, X, X, X, 4221, X, 6137, 1931, X, X, X, 6809,
+    4572, X, X, X, X, 1964, X, 4255, X, 2056, 6810, 6837, X, 3957, 6838, X, X,
+    6835, X, 6836, 6841, 6844, X, X, 6842, X, X, 6917, X, X, X, 3122, 6916, X,
+    6919, X, X, X, X, 6910, X, 2214, X, X, 1502, 6566, X, X, X, X, X, X, X, X,
+    X, 6573, 3150, X, 6533, X, X, 2299, X, 4096, 6534, 6535, X, X, 6536, X, X,
+    X, 2618, X, X, X, X, 2905, X, X, X, X, X, X, X, 8552, X, X, X, X, X, 3385,
+    X, X, 1513, X, 4035, 2874, X, X, X, X, X, X, X, X, 2129, X, 6812, X, X, X,
+    X, X, X, X, 3567, X, 1435, X, X, X, X, 7462, X, X, 4065, X, X, 7463, X, X,
+    X, X, X, 6184, X, X, X, X, X, X, X, X, 10961, X, 3151, X, 1748, X, X, 4996,
+    4998, 1848, X, 10824, 4995, 4997, X, 5000, X, 7612, X, X, 7611, X, X, 7613,
+    X, X, X, 7614, X, X, X, X, 10933, 5969, X, X, X, 5968, 3281, 3584, X, X,
+    2166, 5967, 2142, X, X, X, X, X, 6404, X, X, X, X, 6413, 10978, X, 2297, X,
+    2606, X, X, 10835, 3294, X, 1988, 5101, X, X, X, 3770, X, 3233, X, 7634, X,
+    X, 4013, X, X, X, 7635, X, 1970, X, X, X, X, X, 6865, X, 11000, X, X, X, X,
+    X, 6885, 6889, 6884, 7295, 2039, X, X, X, X, 7296, 11026, 3386, X, 11025,
+    7299, 1779, 2862, 11027, 7297, 2816, 11055, 7333, 7335, X, 11054, 2024, X,
+    3796, X, X, 2603, 4326, X, 7331, 2437, 7464, X, 4333, 11076, X, X, X, X,
+    5468, 7465, X, 11077, X, 7466, 7467, X, 10971, 4877, 6277, X, 6276, X, X,
+    X, 6278, 6279, X, 4250, 6280, X, 7504, 1767, X, 3958, 6941, X, X, X, X, X,
+    X, X, X, 10745, 6953, 6943, X, 2706, X, X, X, X, 3235, 1446, 5445, 10869,
+    X, X, X, 5446, X, X, 4541, X, 10779, 3571, X, X, 3027, 4543, 4544, 3677,
+    2249, 4350, 4545, X, 7484, X, X, 1774, 7482, 7486, X, X, X, X, 7487, X,
+    1449, X, 7488, 7489, X, X, X, X, X, X, X, 2793, X, X, X, 7490, X, X, X,
+    5726, X, 3948, X, 5728, X, 5737, 10900, 5735, X, 5730, X, X, 10809, 3868,
+    X, X, X, X, 4848, 4842, 4845, 4847, X, X, 2355, X, 7525, X, X, X, X, 7526,
+    X, X, X, X, X, X, X, X, X, 2983, X, 4348, 6855, X, 6856, X, 6537, X, X, X,
+    X, X, X, 6538, X, X, X, X, X, X, X, 6784, X, X, X, X, X, X, 6785, X, 6441,
+    6447, 6440, X, X, 2667, X, X, X, X, 3952, X, X, 2675, X, 2236, X, X, X, X,
+    6187, 3375, X, X, X, X, 6190, 1714, 6185, X, 3585, X, X, X, X, X, X, X,
+    5911, X, X, X, X, 5912, X, 5691, 5690, 5692, 1602, 3237, X, 5693, X, X,
+    2449, 1735, 5694, X, X, 3417, 5477, 2807, 4102, 5479, 5480, 4207, 8404, X,
+    X, X, 5485, X, X, 2281, X, 3624, 2927, 1667, 1689, 8378, 5262, X, 1440, X,
+    X, X, 2957, 5263, X, 7084, 5264, 2132, 2014, 4978, X, X, X, 1958, 4979, X,
+    2067, X, 3524, 1613, X, 2494, 4980, 4983, 3242, X, X, X, X, X, X, 4803,
+    4804, X, X, 4806, X, X, X, X, 5338, X, 5342, X, X, X, 2107, X, X, X, 2430,
+    X, 5102, X, X, X, 8283, X, X, 5103, X, 1989, X, 5104, X, 5105, X, 1638,
+    4961, X, 4959, 4963, 4960, 3582, 5590, 2838, X, 4964, 8349, X, 4261, X,
+    4785, X, 4786, X, X, X, 4787, 4548, X, 2629, 2488, X, X, 1680, X, 1976, X,
+    X, X, 3992, 4516, X, 8305, X, 4258, X, X, X, 4517, X, X, 3797, 3277, X, X,
+    X, X, 1967, 10753, 7329, 11056, 2316, X, X, 11059, 7356, 3396, X, X, X, X,
+    7349, 7350, 7353, X, X, X, X, 7355, 11066, X, 10950, X, 6027, 6026, 6028,
+    X, X, X, X, X, X, 6029, 6031, 6030, X, 4812, X, X, 2354, 10802, 3214, X, X,
+    4809, 3347, X, X, X, X, X, 1160, X, X, X, 1163, X, X, X, X, X, X, X, 3944,
+    2583, 5327, X, 5326, X, X, 2907, X, 3912, X, 5092, 4337, X, X, X, X, 5093,
+    3885, 5096, 4418, 4434, X, 2553, 4868, X, X, X, X, 4163, 1707, X, 4646,
+    2671, 3132, 4869, 4116, X, X, X, 1887, 2202, 4942, 1747, X, X, 4943, X,
+    3126, X, X, X, X, 2888, X, X, 3784, 1545, X, X, X, X, X, 3702, 8424, 8407,
+    3141, X, X, 3886, X, 5505, X, X, X, 3761, X, X, X, 5504, 3651, 5276, X, X,
+    5274, X, X, X, X, 5277, X, X, X, X, X, 3870, X, 3292, X, 2268, 2742, X, X,
+    3728, X, X, 2743, X, X, X, X, 2719, 1568, 3936, X, X, 2801, 3423, X, X, X,
+    X, 2419, X, X, 4839, X, X, 2161, X, X, X, 5320, 2750, X, X, 3549, 3588, X,
+    X, X, X, 2140, X, X, X, 5842, X, X, 5837, 3001, X, X, 1758, 3246, X, 5712,
+    X, X, X, X, X, 5720, X, 5713, X, X, X, X, 8427, 5511, 2136, 2110, 3460,
+    8409, X, 5509, X, 1447, X, X, X, X, 5512, 5514, X, 2536, 5307, X, X, X, X,
+    2499, 5308, 1445, X, X, 5303, X, X, X, 5668, X, X, X, 5667, X, 5669, X, X,
+    1643, X, 3218, X, 2012, X, 5440, 5444, X, X, 1640, 5441, 5443, X, X, X, X,
+    5442, X, 5265, X, X, X, X, 2992, X, X, X, 5266, X, X, X, 5267, 1905, 4982,
+    2066, X, 4981, X, 3407, X, X, X, X, X, X, X, X, 3117, X, 4833, X, X, 3362,
+    X, X, X, X, X, 1799, X, X, X, X, 7802, 3422, 2255, X, X, X, X, X, X, X, X,
+    X, 2082, X, 4676, X, 2040, 4565, 4563, 4564, 4562, 2416, 4566, 4115, 4297,
+    X, X, X, X, X, 4567, 8309, X, 470, 471, 472, 473, 474, 475, 476, 477, 478,
+    479, 480, 481, 482, 483, 484, X, 2314, X, X, X, X, X, 11044, 11045, X, X,
+    X, X, X, 3987, X, 5866, X, X, X, 10918, X, 10919, X, 5862, X, 5863, X, X,
+    X, 5867, 3264, X, X, X, X, X, 10958, 6150, X, X, X, X, X, X, X, X, 63, X,
+    X, X, X, X, X, X, X, X, 2902, X, X, 5025, 10830, X, 2372, 4958, X, 1793,
+    2060, 4957, X, X, X, 10820, X, X, 1803, X, 2837, 4962, 2444, 3939, X, X, X,
+    X, 10825, 3454, X, X, X, 5005, 2683, X, 5004, X, X, 7723, X, 3354, X, X, X,
+    7727, X, 7728, 7726, X, X, X, X, 7330, X, X, X, 10746, X, X, 3550, X, 3436,
+    X, X, 5624, 10891, X, X, X, X, 5626, X, X, X, X, X, 10892, 1755, 3246, X,
+    5712, X, X, X, X, X, 5720, X, 5713, X, X, X, X, 10899, 5977, X, 1736, X, X,
+    5979, X, 10935, 5978, X, 5981, 5980, X, X, X, X, 3619, X, 3781, 4489, X,
+    3933, X, 1619, X, X, X, 4493, 8298, 1485, 3285, X, 2560, X, X, X, 4039,
+    2795, 2459, 2794, 1625, X, 3811, 4166, X, X, 2641, 2191, 3047, 6396, 6402,
+    X, 10977, X, X, 6397, 2115, X, 6405, 6409, 2944, 7006, X, 7011, 2238, 7008,
+    7009, 11005, 7005, X, X, X, 2979, 3518, X, X, 2464, 5353, X, 5352, X, X, X,
+    X, 3589, X, X, 10854, 3498, X, 7651, 7652, X, 7656, X, 2453, X, X, X, X,
+    3169, X, X, X, X, 10968, X, X, X, X, X, X, 10970, X, 6224, X, X, 4894, X,
+    X, X, X, X, X, 4016, 10816, 2391, X, X, 2735, X, 7568, 7569, X, X, X, X, X,
+    7571, X, X, 7570, X, X, X, 2688, 7581, X, 7580, 7582, X, 7579, X, X, X, X,
+    X, X, X, 7585, 8618, X, 2314, X, X, X, X, X, 8572, 8573, X, X, X, X, X,
+    3987, X, 1965, X, 4126, 3049, X, 6992, 8531, X, X, 2858, 3275, 2783, X, X,
+    X, 7405, X, X, X, 1448, X, X, 7403, X, 7407, 7406, X, X, 2880, 7276, X,
+    7277, X, X, X, 7278, 4214, X, 2654, X, X, X, 7693, X, X, 7694, 3507, 7691,
+    7690, X, X, X, X, 1607, X, 7368, X, X, X, X, X, X, X, X, X, 7366, X, X, X,
+    X, 1574, 10852, 5335, X, X, X, 4176, X, X, X, X, X, 2481, 2480, 3131, 4448,
+    3812, 2984, X, X, X, 23, 4449, 4451, 57, 58, 102, 107, 43, 44, X, X, X, X,
+    X, X, X, 1191, X, 1192, 180, 181, X, X, X, 36, 35, X, X, X, X, X, X, X, X,
+    X, X, 7785, 6226, X, X, 7107, 7502, 80, 81, 137, 16, 8645, 78, X, X, X, X,
+    X, X, X, X, X, X, 1930, 6575, X, X, X, X, 7289, 7288, X, X, 2815, X, 7290,
+    X, X, X, X, X, 2207, X, X, 5392, X, X, X, X, 5395, 10856, 3809, 2927, 1667,
+    1689, 10850, 5262, X, 1440, X, X, X, 2957, 5263, X, 7084, 5264, 2132,
+    10848, X, X, X, 5209, X, X, 10847, X, X, X, X, 5207, 5210, 5202, 5206,
+    10844, 5196, X, X, X, X, X, 5204, 5203, X, X, X, 5208, X, X, X, 4426, 3592,
+    X, 1934, X, X, X, X, X, 3594, X, 3544, 2196, 3966, 686, X, X, 676, 667, X,
+    X, 683, 688, X, X, 678, 668, X, X, 684, 564, 565, 566, 567, 568, 569, 571,
+    572, 573, 574, 575, 576, 577, 578, 579, 580, X, 7370, X, X, 7372, 11069, X,
+    X, 11070, X, X, X, X, X, X, X, 4895, X, X, 2491, X, 2490, X, X, X, X, 1879,
+    X, 5563, X, 8280, 4082, 5538, 1878, X, 5545, X, 8410, 3372, X, 5334, X, X,
+    X, 4147, X, X, X, 4175, 1810, X, X, X, X, 2696, X, 5846, X, X, X, X, X, X,
+    5839, 3301, 5836, 3134, X, 1945, 5721, X, X, X, X, X, X, 2139, X, X, 1884,
+    5719, X, 5472, X, X, X, X, 5475, X, X, 2908, X, X, X, X, 4226, 1450, 1688,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 1216, X, 9, 10739, 83, 79, 82,
+    84, 10738, 41, 42, 85, 59, 3, 60, 4, 30,
+]; // 21946 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 0, 0, 0, 19890, 41, 8502, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 10529, 14857, 5775, 0, 8190, 14207, 999, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11988, 12821, 0, 368, 0, 21255, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21199, 17348, 2458, 16728, 0, 0, 0,
+    17896, 21800, 11883, 3526, 18370, 9388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 13118, 21654, 4128, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    9883, 6815, 15296, 0, 0, 0, 2550, 16365, 0, 18493, 0, 0, 0, 1983, 0, 0,
+    6508, 4023, 3887, 12840, 0, 12738, 16258, 0, 1508, 0, 9313, 21914, 0, 0, 0,
+    0, 0, 74, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    12805, 11942, 0, 0, 0, 0, 0, 0, 0, 0, 17332, 1202, 16712, 21784, 3962, 0,
+    0, 0, 0, 0, 11308, 3240, 11867, 0, 3510, 0, 6469, 0, 0, 0, 10333, 0, 18354,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 13102, 21638, 0, 0, 4112, 2534, 16349, 18477, 6492, 18154, 3871,
+    16242, 12789, 11926, 17316, 6229, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 18019, 0, 0, 0, 0, 0, 0, 18196, 0, 0, 0, 0, 0, 17007, 20877,
+    16019, 3050, 6822, 3106, 0, 17255, 1186, 17959, 4451, 0, 12327, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21396, 3141, 2397, 16696,
+    21768, 11292, 1950, 9468, 12885, 10317, 4620, 19371, 13086, 21622, 6971,
+    10110, 2518, 4068, 16333, 10139, 18461, 16109, 6476, 18138, 16226, 8270,
+    12773, 11910, 6443, 17300, 6213, 21380, 3125, 12869, 20013, 3752, 4604,
+    15340, 19382, 16620, 12372, 8344, 5523, 5431, 19355, 20804, 847, 7045,
+    2623, 13070, 13401, 10094, 1248, 19411, 3643, 8928, 2502, 2337, 6743,
+    21184, 18889, 2277, 10184, 2443, 17881, 13235, 9373, 13148, 4052, 15281,
+    10123, 16093, 15353, 18122, 12757, 4008, 8506, 17284, 16553, 4588, 15324,
+    1837, 16604, 12356, 13340, 4097, 2607, 1232, 1308, 19395, 3856, 17914,
+    18004, 2486, 2321, 17037, 6727, 21168, 3091, 4436, 2382, 10168, 16561,
+    13176, 2427, 17942, 17865, 16681, 17374, 4148, 9453, 13132, 16077, 1814,
+    12741, 10302, 8490, 19424, 8941, 6956, 9406, 16537, 8255, 15399, 4140,
+    15308, 6756, 6198, 4874, 6520, 1821, 12401, 12854, 17531, 16270, 3974,
+    16588, 16031, 19998, 3062, 8329, 20789, 13386, 13324, 2591, 1216, 8622,
+    20732, 3840, 8401, 8886, 17898, 3254, 17955, 6563, 5519, 8913, 17021, 9434,
+    7057, 13265, 8355, 21152, 21005, 4930, 13220, 6836, 18107, 16283, 3075,
+    3993, 12341, 5470, 2366, 13160, 18061, 2411, 20917, 4082, 2306, 17926,
+    6667, 6712, 6576, 18236, 7070, 5483, 10153, 21826, 10525, 13412, 17358,
+    19468, 1798, 8474, 17048, 93, 16449, 8284, 9390, 0, 20027, 0, 9438, 2725,
+    16529, 13607, 1724, 15406, 16738, 16634, 10287, 8582, 15383, 20930, 7464,
+    17515, 16572, 12386, 19982, 6925, 8313, 20774, 13370, 13308, 8871, 8652,
+    2575, 20716, 21137, 3824, 1866, 13678, 10853, 4973, 13205, 3985, 16745,
+    8385, 19937, 5455, 6547, 5537, 0, 2351, 10242, 5503, 5496, 18903, 5046,
+    2291, 11997, 15426, 18221, 19453, 1783, 10198, 17469, 8897, 7274, 2710,
+    9418, 16662, 13249, 20989, 16460, 8137, 7475, 4914, 18091, 10415, 18045,
+    20901, 6651, 6696, 13592, 20759, 6605, 18265, 10509, 5002, 13293, 8856,
+    10538, 17061, 2560, 2876, 8458, 77, 17191, 16513, 3281, 19145, 10271, 8566,
+    13895, 14003, 15367, 8829, 8520, 3292, 7448, 12027, 15456, 17499, 19966,
+    13549, 6909, 1851, 8297, 13354, 4958, 13190, 14569, 6532, 19438, 2738,
+    21913, 15419, 8636, 1768, 20700, 21121, 3808, 17454, 16647, 20974, 10837,
+    7304, 4899, 16375, 10792, 8369, 8784, 19921, 10226, 21078, 5030, 18205,
+    7258, 2694, 6864, 20886, 21019, 8121, 18075, 10444, 6681, 10399, 21854,
+    13577, 17543, 18029, 6938, 3762, 20744, 6590, 13903, 6635, 2633, 13691,
+    18250, 3266, 8711, 19130, 7084, 10493, 13988, 14269, 3300, 4986, 13277,
+    8840, 7433, 8666, 3375, 19951, 2860, 8442, 17221, 17175, 5060, 14033, 7375,
+    16497, 10255, 8550, 13879, 8813, 12011, 15440, 13648, 21106, 7330, 10822,
+    17483, 17120, 17384, 7229, 13533, 6893, 4942, 4884, 14553, 21897, 1752,
+    20684, 3792, 14580, 7183, 17438, 18916, 20958, 10777, 7288, 8768, 17250,
+    10211, 2659, 8151, 21063, 19905, 16473, 6848, 8105, 10428, 10383, 3330,
+    21838, 6619, 8695, 18279, 10477, 10552, 15523, 14253, 5732, 5015, 3359,
+    13562, 19115, 10580, 13973, 2844, 7418, 8427, 17075, 17205, 19159, 14017,
+    17160, 4173, 13424, 16481, 16818, 8534, 7360, 10625, 13864, 16388, 13674,
+    13632, 2752, 14328, 20039, 10806, 17414, 8798, 21091, 7213, 13517, 6877,
+    13488, 7315, 1736, 20668, 17105, 3776, 7167, 10457, 17422, 20080, 6951,
+    20942, 14538, 10761, 21047, 21882, 14387, 5088, 8753, 19889, 2062, 8724,
+    10367, 13468, 2888, 3314, 17554, 17235, 1905, 2785, 8679, 15468, 2644,
+    14593, 10461, 14047, 14237, 8090, 15508, 12461, 7095, 3343, 13957, 19100,
+    10565, 8411, 4157, 7344, 10609, 13848, 17398, 7197, 8165, 2829, 13472,
+    17089, 14522, 8224, 16870, 10745, 6408, 21031, 21866, 15587, 7403, 19092,
+    5864, 19785, 2687, 5072, 13452, 17145, 14221, 13941, 19478, 16803, 13717,
+    14720, 10593, 15550, 13659, 4187, 13832, 19172, 16854, 15571, 0, 2033,
+    7387, 18928, 2778, 103, 13617, 18290, 13502, 14854, 2671, 13436, 7492,
+    20653, 20065, 16787, 14372, 15534, 1876, 14417, 12432, 16771, 16416, 14401,
+    10679, 8738, 16846, 15564, 14356, 19874, 2047, 5789, 5759, 12410, 6353,
+    16755, 16830, 16400, 14340, 7484, 10638, 9163, 20092, 5547, 5554, 14868,
+    10352, 1890, 8075, 15493, 2075, 0, 12446, 5773, 12964, 5743, 9147, 2814,
+    2901, 10336, 12424, 17582, 8059, 5100, 14507, 11342, 8209, 9131, 2798,
+    14898, 17566, 6379, 14491, 11326, 14882, 19506, 14606, 10730, 17596, 6393,
+    19520, 14475, 6049, 11310, 3444, 16943, 17610, 6063, 9979, 19077, 5849,
+    19770, 17130, 14459, 3414, 3428, 14206, 13926, 11679, 16927, 7123, 12036,
+    12490, 5325, 12079, 19061, 14705, 2018, 3400, 5833, 13912, 13700, 19754,
+    14060, 19198, 18348, 14745, 14443, 2763, 19740, 7107, 11397, 20638, 9090,
+    12474, 20050, 4226, 19593, 3384, 19184, 10664, 18972, 7239, 19859, 161,
+    5817, 18334, 14729, 19577, 14429, 15478, 19843, 5158, 145, 9190, 7854,
+    12949, 5801, 8194, 18318, 19561, 5907, 2100, 19827, 11639, 5142, 7838,
+    12933, 8178, 19545, 5891, 19811, 12917, 9116, 15836, 16883, 5875, 11383,
+    6364, 1707, 19795, 15820, 5128, 7928, 11367, 12903, 15806, 15600, 11552,
+    1691, 15101, 11351, 15790, 11536, 11582, 19491, 14177, 15774, 10715, 6034,
+    9964, 11566, 11520, 14191, 11490, 13746, 15758, 9948, 11504, 11664, 12064,
+    18997, 11474, 13730, 15742, 9932, 11648, 2003, 15726, 19011, 11739, 9916,
+    20623, 9075, 9902, 4211, 4197, 15710, 15694, 5384, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 10689, 10649, 5368, 18957, 1627, 130, 9175, 5352, 15680, 12513, 16443,
+    9250, 7537, 19256, 20223, 20599, 18941, 5564, 1611, 9234, 7521, 20104, 116,
+    19240, 14663, 18303, 2085, 20207, 15666, 3482, 21683, 7505, 11624, 19530,
+    5652, 9101, 5668, 5684, 16429, 5700, 5636, 1597, 5620, 3468, 5113, 7913,
+    1581, 1676, 14911, 2173, 3452, 1565, 15086, 1551, 2157, 19604, 2143, 1718,
+    9035, 18590, 3004, 14162, 7133, 17623, 7565, 19620, 9051, 12613, 6076,
+    10700, 9992, 17639, 12599, 6019, 11692, 19636, 6092, 12049, 13713, 10008,
+    7729, 18982, 7937, 19038, 9787, 6106, 11708, 18796, 7743, 20132, 19652,
+    1988, 2913, 19054, 5946, 15623, 5575, 11724, 14073, 19211, 20608, 7759,
+    2929, 14618, 5962, 7799, 14634, 16955, 9060, 18810, 11410, 20146, 7815,
+    9887, 20162, 7599, 20274, 3664, 7252, 9203, 7831, 5337, 12091, 4238, 12498,
+    20178, 1147, 14674, 5170, 20584, 15849, 9219, 7866, 15637, 4453, 5589,
+    11595, 12107, 4254, 5186, 19225, 3493, 11467, 4771, 13800, 15865, 14648,
+    16304, 7882, 9710, 20192, 15651, 4469, 15055, 2112, 7590, 11609, 15879,
+    5605, 9798, 171, 7670, 16893, 5202, 9724, 18559, 13759, 14131, 7684, 3509,
+    12540, 5397, 15113, 7898, 4485, 12526, 21543, 19712, 15071, 2128, 16909,
+    12554, 9020, 5218, 9740, 12568, 5232, 18575, 2989, 14147, 7700, 4501, 7550,
+    6133, 19269, 1637, 9756, 12584, 5248, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15122,
+    6004, 6149, 678, 14753, 7714, 19023, 19285, 1653, 9772, 18781, 15138,
+    19301, 11751, 1669, 0, 0, 0, 0, 9262, 11767, 12196, 14773, 20236, 20117,
+    15152, 5710, 17781, 7146, 5915, 15168, 22, 5726, 19315, 17797, 7162, 9276,
+    1102, 9678, 18512, 5931, 14084, 1116, 17827, 15608, 10021, 4740, 14921,
+    19665, 7784, 19721, 13827, 0, 0, 9319, 2942, 15184, 20259, 18673, 7639,
+    17813, 18528, 14100, 1132, 11452, 4810, 4756, 14937, 14821, 19681, 11961,
+    3677, 14798, 13785, 16289, 4726, 7770, 14851, 3030, 20245, 19737, 9695,
+    3723, 21570, 446, 7625, 9335, 8989, 21695, 2958, 15200, 15040, 5973, 7575,
+    7655, 10057, 18602, 18544, 14116, 18728, 21528, 4826, 5306, 14807, 3732,
+    12966, 14953, 14837, 284, 12133, 19697, 3693, 11789, 3016, 17651, 9005,
+    2974, 1313, 7949, 6118, 15216, 1160, 5989, 1002, 2181, 15892, 18618, 21598,
+    3618, 11058, 663, 12982, 300, 1184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 455, 12149, 1926, 3709, 18766, 21556, 18822, 14322, 0, 0, 6761, 416,
+    1039, 316, 12165, 47, 432, 16966, 7611, 1055, 332, 12181, 12254, 197,
+    16982, 1071, 17766, 20286, 1087, 8959, 9663, 8975, 9857, 20519, 20535,
+    18714, 16922, 4514, 691, 18497, 18698, 17695, 17711, 270, 12119, 14684,
+    13812, 11421, 14700, 0, 0, 4779, 20577, 14766, 8588, 14993, 18658, 19328,
+    11437, 4795, 11946, 16200, 8604, 0, 0, 0, 14783, 13770, 9289, 6805, 15009,
+    4711, 21497, 805, 749, 5405, 15025, 21513, 5259, 15946, 0, 0, 0, 11775,
+    821, 5275, 4349, 8037, 20327, 9688, 18736, 1356, 520, 971, 20385, 11963,
+    6347, 10034, 3587, 5291, 15241, 4365, 21456, 11857, 8053, 18752, 1372,
+    9544, 987, 3040, 11254, 11979, 3742, 0, 0, 0, 0, 0, 0, 6160, 10050, 21583,
+    632, 9348, 14275, 2267, 3603, 4381, 9560, 4835, 12828, 16316, 21309, 7975,
+    10070, 14963, 1025, 0, 11043, 0, 0, 0, 0, 0, 12207, 478, 11192, 33, 15900,
+    9810, 648, 14291, 183, 1169, 5319, 4397, 1911, 21661, 3185, 4851, 359,
+    8945, 18684, 16332, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14081, 16810, 0, 0, 0, 0,
-    0, 0, 19408, 8710, 0, 18084, 13317, 0, 19469, 0, 2586, 1608, 8724, 9123,
-    12613, 10048, 0, 0, 9137, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18562, 0, 0, 0, 0,
-    8806, 16925, 5904, 0, 0, 5564, 14065, 13301, 8493, 0, 5341, 13284, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15008,
-    0, 8064, 14825, 8963, 5743, 14175, 936, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2321, 0,
-    0, 0, 17011, 0, 0, 19865, 1525, 19431, 5346, 8743, 8994, 2306, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -1955,63 +2265,6 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 14442, 967, 16778, 5278, 18052, 8652, 2554, 5377, 3893,
-    6213, 8435, 1576, 17275, 9091, 18530, 8774, 16893, 14473, 4200, 12924,
-    10021, 2491, 9028, 9961, 5532, 5309, 18981, 6777, 6105, 6042, 118, 19042,
-    10717, 16838, 10654, 14976, 14793, 331, 8931, 14143, 7664, 904, 8868,
-    14410, 18020, 9219, 8620, 8466, 2522, 16215, 3861, 16270, 243, 12774, 3756,
-    9059, 1553, 9156, 9396, 5406, 4168, 3781, 9989, 4229, 16000, 3804, 17661,
-    16866, 2746, 1701, 4480, 5500, 18949, 18110, 4601, 6073, 5692, 2471, 6010,
-    6167, 18824, 19073, 3693, 15126, 19010, 9333, 10685, 9247, 18763, 2683,
-    16028, 4323, 362, 6806, 2347, 299, 8899, 16122, 12897, 14111, 5918, 8285,
-    16246, 12805, 7523, 1638, 7632, 272, 872, 8836, 14378, 9187, 5437, 16183,
-    18886, 11191, 18655, 4260, 18258, 11889, 3829, 5594, 3923, 7546, 6243,
-    17305, 7569, 4511, 12954, 10774, 211, 3724, 15157, 815, 9364, 4136, 2714,
-    6837, 8316, 1669, 6448, 18316, 1730, 4448, 15512, 18231, 5468, 9309, 18917,
-    11983, 4569, 3984, 2439, 5978, 6135, 148, 10747, 17689, 6196, 18792, 3661,
-    4291, 7281, 16090, 4385, 14499, 7694, 12865, 7600, 840, 11098, 16325,
-    14346, 5128, 4044, 4542, 4627, 11217, 16300, 15218, 2376, 18138, 6868,
-    3598, 16385, 16151, 15245, 9426, 18854, 6479, 1761, 13548, 11159, 11857,
-    179, 19103, 17720, 783, 7312, 4104, 6416, 18284, 4416, 18199, 6895, 9483,
-    3504, 9277, 5159, 11248, 11951, 3952, 2407, 4820, 5946, 569, 12108, 3629,
-    14283, 5065, 15276, 7249, 3535, 16058, 4353, 5190, 12833, 14314, 476, 9543,
-    5096, 392, 4012, 7819, 15186, 3566, 720, 16353, 13516, 18635, 11047, 11127,
-    11825, 13170, 7850, 751, 13201, 19161, 4072, 19130, 9634, 4656, 596, 19181,
-    9603, 10867, 6384, 10836, 18167, 9451, 3472, 11919, 6273, 4788, 6304, 537,
-    12076, 1789, 11023, 4713, 5033, 12045, 7217, 4682, 19490, 4849, 19268,
-    19747, 444, 14649, 13576, 2037, 4739, 17335, 9511, 7186, 7787, 688, 19294,
-    13484, 11793, 2006, 7500, 7756, 12984, 15667, 13138, 9571, 420, 12137,
-    11075, 9715, 1975, 3409, 15305, 10804, 3440, 10960, 505, 8346, 2928, 3116,
-    10991, 9663, 7878, 5001, 18346, 625, 15542, 12013, 656, 11405, 14529,
-    15573, 7437, 11761, 7724, 15604, 7468, 2188, 1259, 15635, 6326, 1943,
-    19515, 16415, 6509, 3377, 1372, 19775, 6357, 19210, 19241, 3141, 11735,
-    11704, 10928, 3084, 17125, 4969, 11373, 17781, 7405, 2156, 7162, 1227,
-    1911, 3345, 10896, 3052, 17750, 11678, 5812, 1345, 17093, 7074, 17864,
-    13460, 11341, 7373, 2124, 1196, 7130, 1880, 3020, 7043, 12228, 11646, 7342,
-    13667, 17832, 13428, 7099, 17456, 11309, 1849, 13636, 2092, 6925, 0, 0, 0,
-    0, 5785, 1164, 4943, 11278, 16686, 13262, 19670, 18471, 2988, 7011, 12196,
-    19322, 1318, 1818, 9808, 5220, 13605, 11614, 13396, 6563, 17424, 4911,
-    16655, 19638, 17067, 18439, 13231, 6531, 13039, 17392, 10274, 17602, 2066,
-    14711, 4879, 16623, 1465, 18407, 2799, 4768, 15761, 6619, 1137, 14679,
-    1433, 13947, 2767, 15729, 3234, 13369, 2957, 11465, 13012, 17186, 12165,
-    17365, 15697, 13337, 14736, 14261, 9692, 11433, 1287, 15913, 15881, 15429,
-    15461, 9745, 8376, 15493, 9777, 3322, 12685, 19607, 19575, 10243, 7908,
-    13728, 17571, 18376, 19379, 13852, 7940, 16596, 10359, 13760, 14558, 13884,
-    2217, 1106, 7972, 1402, 10391, 3171, 13916, 10423, 3203, 15822, 12308,
-    15854, 0, 0, 0, 0, 12622, 3295, 12583, 17155, 12340, 12654, 12372, 17809,
-    0, 0, 17484, 6985, 19544, 5842, 12488, 17508, 13116, 17894, 5874, 11588,
-    10212, 2856, 13697, 16444, 1043, 16716, 6678, 6683, 19804, 19352, 9838,
-    12520, 17540, 13821, 17926, 2888, 12257, 16565, 10484, 6593, 14583, 65,
-    13069, 1495, 2829, 16476, 11525, 10328, 8526, 1075, 15791, 16748, 12282,
-    1017, 6715, 3264, 19836, 5248, 12552, 18676, 10302, 6954, 14039, 19699,
-    5635, 12457, 17958, 2649, 0, 0, 0, 0, 0, 0, 17020, 16508, 11557, 18500,
-    10111, 8998, 10149, 8558, 17216, 18703, 6747, 17990, 8406, 10181, 6647,
-    13790, 8590, 12744, 18614, 17631, 18582, 15379, 8159, 16534, 19726, 0,
-    17044, 13976, 10453, 11494, 14008, 12402, 0, 5604, 5662, 10561, 9868,
-    14889, 12426, 10593, 10514, 0, 15096, 9900, 17246, 14915, 18733, 8222,
-    2906, 15942, 9932, 10625, 14239, 14947, 2618, 16983, 15974, 0, 0, 0, 15406,
-    2246, 8001, 10080, 2278, 90, 14764, 16957, 8679, 10118, 0, 0, 15316, 15040,
-    8249, 12713, 8033, 13094, 15348, 19913, 15072, 5712, 8281, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -2040,10 +2293,258 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19455, 0, 0, 0, 0, 2653, 0, 14602, 14634, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8096, 19945, 8128, 0, 0, 0, 0, 32,
-]; // 2048 entries
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 376, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    16036, 0, 0, 1953, 7991, 14979, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16170, 12223, 11208, 15916, 9826,
+    14307, 0, 0, 0, 0, 0, 0, 0, 0, 21677,
+]; // 4095 entries
+
+#[cfg(not(feature = "no-optimized-legacy-encoding"))]
+const BACKWARD_TABLE_UPPER_REMAPPED: &'static [u16] = &[
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11988, 12821, 0, 368, 0, 21255, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21199, 17348, 2458, 16728, 0, 0, 0,
+    17896, 21800, 11883, 3526, 18370, 9388, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 13118, 21654, 4128, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    9883, 6815, 15296, 0, 0, 0, 2550, 3201, 0, 18493, 0, 0, 0, 1983, 0, 0,
+    6508, 4023, 3887, 12840, 0, 12738, 16258, 0, 1508, 0, 9313, 21914, 0, 0, 0,
+    0, 0, 74, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    12805, 11942, 0, 0, 0, 0, 0, 0, 0, 0, 17332, 1202, 16712, 21784, 3962, 0,
+    0, 0, 0, 0, 11308, 3240, 11867, 0, 3510, 0, 6469, 0, 0, 0, 10333, 0, 18354,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 13102, 21638, 0, 0, 4112, 2534, 16349, 18477, 6492, 18154, 3871,
+    16242, 12789, 11926, 17316, 6229, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 18019, 0, 0, 0, 0, 0, 0, 18196, 0, 0, 0, 0, 0, 17007, 20877,
+    16019, 3050, 6822, 3106, 0, 17255, 1186, 17959, 4451, 0, 12327, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21396, 3141, 18644, 16696,
+    21768, 11292, 1950, 9468, 12885, 10317, 4620, 19371, 13086, 21622, 401,
+    1969, 8007, 4068, 16333, 16186, 18461, 12239, 6476, 18138, 17664, 4697,
+    12773, 11910, 17751, 17300, 6213, 1326, 3125, 1430, 735, 3752, 11224,
+    15340, 19382, 15932, 12372, 18184, 5523, 5431, 19355, 9648, 847, 17839,
+    2623, 13070, 13401, 10094, 9842, 19411, 20504, 8928, 2502, 8023, 6743,
+    17680, 18889, 2277, 1342, 2443, 17881, 6333, 9373, 13148, 4052, 15281,
+    10123, 16093, 15353, 6259, 1446, 4008, 11240, 12692, 16553, 4588, 6275,
+    1837, 1462, 12356, 13340, 4097, 2607, 12708, 1308, 18835, 3856, 6291,
+    18004, 11801, 2321, 17037, 6727, 21168, 3091, 4436, 2382, 10168, 16561,
+    13176, 1478, 12724, 239, 16681, 17374, 4148, 9453, 602, 16077, 1814, 12741,
+    10302, 8490, 19424, 8941, 6956, 18851, 16537, 8255, 15399, 4140, 15308,
+    6756, 6198, 4874, 6520, 1821, 12401, 12854, 17531, 16270, 3974, 16588,
+    16031, 19998, 3062, 8329, 20789, 13386, 13324, 2591, 1216, 8622, 20732,
+    3840, 11817, 20865, 17898, 3254, 17955, 1494, 5519, 255, 17021, 9434, 7057,
+    13265, 8355, 21152, 21005, 4930, 13220, 6836, 18107, 16283, 6774, 3993,
+    20562, 5470, 2366, 13160, 18061, 3916, 20917, 4082, 2306, 17926, 618, 6790,
+    6576, 18236, 7070, 60, 21482, 21826, 10525, 13412, 17358, 19468, 1798,
+    8474, 17048, 93, 16449, 8284, 9390, 0, 20027, 0, 9438, 2725, 16529, 13607,
+    1724, 15406, 16738, 16634, 10287, 8582, 3932, 20930, 7464, 17515, 16572,
+    12386, 19982, 3948, 21279, 790, 13370, 13308, 4334, 8652, 2575, 20716,
+    21137, 3824, 1866, 13678, 10853, 3226, 20312, 3985, 16745, 8385, 21295,
+    5455, 6547, 563, 0, 505, 16005, 21263, 5496, 18903, 5046, 2291, 1011,
+    15426, 956, 19453, 1783, 10198, 17469, 8897, 7274, 2710, 9418, 16662,
+    13249, 20989, 16460, 8137, 7475, 4914, 18091, 10415, 18045, 20901, 6651,
+    15989, 20370, 3572, 6605, 3171, 10509, 5002, 13293, 8856, 345, 17061,
+    15226, 2876, 8458, 77, 17191, 16513, 3281, 19145, 940, 8566, 13895, 17737,
+    15367, 8829, 8520, 3292, 924, 12027, 10993, 17499, 10977, 21754, 21738,
+    1851, 8297, 13354, 4958, 13190, 12315, 6532, 19438, 2738, 21913, 15419,
+    8636, 1768, 21722, 21121, 3808, 17454, 16647, 20974, 10837, 7304, 4899,
+    1936, 10792, 8369, 8784, 19921, 10226, 21078, 5030, 18205, 7258, 2694,
+    6864, 20886, 21019, 8121, 18075, 10444, 6681, 10399, 21854, 13577, 21610,
+    18029, 6938, 3762, 20744, 6590, 13903, 12299, 2633, 13691, 21441, 3266,
+    8711, 11842, 7084, 10493, 13988, 14269, 3300, 4986, 13277, 21706, 7433,
+    8666, 3375, 19951, 2860, 8442, 17221, 17175, 5060, 14033, 7375, 12283,
+    12267, 7017, 7001, 8813, 9513, 2204, 7033, 21106, 20490, 9529, 11081,
+    17120, 17384, 7229, 2220, 11097, 4942, 4884, 14553, 21897, 1752, 2236,
+    3792, 14580, 7183, 17438, 9870, 11113, 10777, 7288, 8768, 1546, 10211,
+    2659, 8151, 2252, 11129, 16473, 6848, 8105, 10428, 10383, 3330, 209, 6619,
+    8695, 18279, 10477, 10552, 15523, 14253, 5732, 5015, 11145, 13562, 19115,
+    6429, 13973, 2844, 7418, 8427, 12678, 17205, 19159, 14017, 17160, 225,
+    16994, 16481, 18448, 21335, 7360, 10625, 13864, 16388, 13674, 13632, 18877,
+    14328, 20039, 10806, 17414, 8798, 21091, 7213, 13517, 6877, 13488, 7315,
+    1736, 20668, 17105, 9601, 7167, 10457, 17422, 20080, 6951, 4526, 14538,
+    11161, 21351, 21882, 588, 5088, 8753, 19889, 2062, 20548, 10367, 13468,
+    5417, 3314, 17554, 17235, 1905, 2785, 704, 15468, 7960, 19341, 10858,
+    14047, 9617, 8090, 15508, 13056, 7095, 3343, 4542, 463, 10565, 759, 4157,
+    7344, 10609, 13848, 17398, 4303, 8165, 2829, 13472, 17089, 14522, 8224,
+    16870, 10745, 6408, 21031, 21866, 15587, 11177, 19092, 5864, 10937, 2687,
+    5072, 13452, 16155, 21230, 13941, 10080, 16803, 13717, 14720, 10593, 15550,
+    18629, 4187, 8230, 16213, 16854, 15571, 0, 2033, 15958, 18928, 2778, 103,
+    386, 3629, 13502, 14854, 2671, 13436, 7492, 20653, 4682, 16787, 14372,
+    12993, 1876, 14417, 12432, 16771, 16416, 14401, 10679, 8738, 16846, 15564,
+    14356, 1415, 2047, 5789, 5759, 12410, 6353, 16755, 20339, 16400, 14340,
+    7484, 10638, 21367, 20092, 5547, 5554, 3902, 720, 18169, 9633, 6318, 9302,
+    0, 6244, 5773, 12964, 5743, 10874, 2814, 834, 12616, 12424, 17582, 8059,
+    5100, 14507, 11342, 20850, 9131, 533, 14898, 17566, 6379, 4558, 11326,
+    14882, 19506, 14606, 10730, 17596, 6393, 19520, 14475, 6049, 11310, 3444,
+    16943, 17610, 6063, 9979, 19077, 775, 4319, 3211, 14459, 3414, 3428, 14206,
+    13926, 11679, 16927, 7123, 12036, 21246, 5325, 12079, 19061, 14705, 2018,
+    3400, 5833, 13912, 13700, 19754, 14060, 19198, 18348, 8246, 14443, 20297,
+    19740, 15253, 17270, 20638, 9090, 12474, 20050, 4226, 19593, 3384, 19184,
+    10664, 18972, 7239, 15974, 161, 5817, 18334, 14729, 19577, 21468, 15478,
+    19843, 5158, 145, 9190, 7854, 12949, 5801, 8194, 18318, 19561, 5907, 2100,
+    19827, 11639, 5142, 7838, 12933, 8178, 20459, 13009, 19811, 12917, 9116,
+    15836, 16883, 5875, 11383, 6364, 1707, 19795, 17974, 5128, 7928, 11367,
+    12903, 15806, 15600, 11552, 1691, 15101, 11351, 15790, 11536, 11582, 19491,
+    14177, 15774, 10715, 6034, 9964, 11566, 11520, 14191, 11490, 13746, 15758,
+    9948, 21411, 20355, 12064, 18997, 11474, 13730, 10890, 12632, 11648, 3557,
+    15726, 19011, 11739, 9916, 20623, 9075, 9902, 3156, 4197, 15710, 9483,
+    5384, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10689, 17722, 5368, 18957, 1627, 130,
+    9175, 11020, 15680, 12513, 16443, 9250, 7537, 19256, 20223, 20599, 18941,
+    5564, 1611, 9234, 7521, 20104, 116, 19240, 14663, 18303, 2085, 20207,
+    15666, 3482, 21683, 7505, 11624, 19530, 5652, 9101, 5668, 5684, 16429,
+    5700, 5636, 1597, 5620, 3468, 5113, 7913, 1581, 1676, 14911, 2173, 3452,
+    1565, 15086, 1551, 2157, 19604, 2143, 1718, 9035, 18590, 3004, 909, 7133,
+    17623, 7565, 19620, 9051, 12900, 6173, 10700, 9992, 17639, 12599, 10962,
+    11692, 19636, 549, 12049, 13713, 10008, 7729, 11827, 7937, 19038, 9787,
+    6106, 11708, 18796, 4635, 20132, 4574, 1988, 2913, 19054, 5946, 15623,
+    5575, 11724, 9361, 491, 20608, 7759, 2929, 14618, 15269, 7799, 14634,
+    16955, 9060, 18810, 11410, 20146, 7815, 9887, 20162, 7599, 20274, 3664,
+    7252, 9203, 7831, 5337, 12091, 4238, 12498, 20178, 1147, 14674, 5170,
+    20584, 15849, 9219, 7866, 15637, 4453, 5589, 11595, 12107, 4254, 5186,
+    19225, 20396, 11467, 4771, 13800, 15865, 14648, 16304, 7882, 9710, 20192,
+    15651, 4469, 15055, 2112, 7590, 6986, 15879, 20475, 9798, 171, 7670, 16893,
+    5202, 9724, 18559, 13759, 14131, 7684, 3509, 12540, 5397, 15113, 7898,
+    13025, 12526, 1294, 19712, 15071, 2128, 17990, 12554, 9020, 21427, 10906,
+    12568, 16124, 18575, 1531, 14147, 7700, 4501, 7550, 6133, 4410, 1637,
+    12648, 12584, 5248, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15122, 6004, 6149, 678,
+    14753, 7714, 19023, 19285, 1653, 9772, 18781, 15138, 9499, 11751, 11036, 0,
+    0, 0, 0, 9262, 6189, 12196, 14773, 20236, 20117, 15152, 5710, 17781, 7146,
+    5915, 15168, 22, 5726, 19315, 17797, 7162, 9276, 1102, 9678, 18512, 5931,
+    11265, 1116, 17827, 15608, 10021, 4740, 14921, 19665, 7784, 19721, 13827,
+    0, 0, 9319, 2942, 15184, 20259, 18673, 7639, 17813, 18528, 14100, 1132,
+    11452, 4810, 4756, 4651, 14821, 19681, 11961, 3677, 14798, 13785, 6414,
+    4726, 7770, 14851, 6458, 2190, 19737, 9695, 3723, 21570, 446, 7625, 9335,
+    8989, 21695, 2958, 20412, 18433, 5973, 573, 13041, 10057, 1384, 10922,
+    16140, 5446, 21215, 4426, 5306, 11067, 3732, 12966, 11281, 12664, 20819,
+    862, 4667, 20428, 11789, 21321, 17851, 9005, 1400, 1313, 7949, 6303, 15216,
+    4864, 20835, 1002, 8612, 15892, 18618, 21598, 2474, 21816, 663, 12982, 300,
+    1184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 455, 12149, 11899, 3709,
+    18766, 21556, 18822, 14322, 0, 0, 6761, 416, 1039, 316, 12165, 47, 432,
+    16966, 18863, 878, 332, 12181, 12254, 197, 16982, 1071, 17766, 20286,
+    20444, 1263, 3542, 8975, 9857, 20519, 20535, 18714, 16922, 4514, 691,
+    18497, 18698, 17695, 17711, 270, 12119, 14684, 11005, 9571, 14700, 0, 0,
+    4779, 20577, 14766, 8588, 14993, 18658, 19328, 11437, 894, 11946, 16200,
+    8604, 0, 0, 0, 10947, 13770, 9289, 6805, 15009, 4711, 21497, 805, 749,
+    5405, 15025, 1279, 5259, 15946, 0, 0, 0, 11775, 821, 5275, 18386, 8037,
+    20327, 9688, 18736, 1356, 520, 971, 20385, 11963, 3658, 16049, 3587, 5291,
+    4039, 4365, 21456, 11857, 8053, 9587, 1372, 9544, 987, 3040, 11254, 11979,
+    3742, 0, 0, 0, 0, 0, 0, 6160, 10050, 21583, 632, 9348, 14275, 2267, 3603,
+    18402, 16065, 4835, 12828, 16316, 21309, 7975, 10070, 14963, 1025, 0, 1516,
+    0, 0, 0, 0, 0, 12207, 478, 11192, 33, 15900, 9810, 18418, 14291, 183, 1169,
+    5319, 4397, 1911, 21661, 3185, 4851, 359, 8945, 18684, 16332, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 3114, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16667, 0, 0, 4257, 4273, 4289, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 21930, 12223, 11208, 15916, 9826, 14307, 0, 0, 0, 0, 0, 0, 0, 0, 16,
+]; // 4095 entries
 
 #[cfg(feature = "no-optimized-legacy-encoding")]
 const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
@@ -2383,6 +2884,7 @@ const BACKWARD_SEARCH_UPPER: &'static [u16] = &[
     1572, 1572, 1572, 1573, 1575,
 ]; // 65 entries
 
+#[cfg(feature = "no-optimized-legacy-encoding")]
 const BACKWARD_TABLE_REMAPPED: &'static [u16] = &[
     10744, 10745, 10746, 10747, 10748, 10749, 10750, 10751, 10752, 10753,
     10754, 10755, 10756, 10757, 10758, 10759, 10760, 10761, 10762, 10763,
@@ -2447,11 +2949,11 @@ const BACKWARD_TABLE_REMAPPED: &'static [u16] = &[
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u16 {
-    let offset = (code >> 5) as usize;
-    let offset = if offset < 2048 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = (code >> 4) as usize;
+    let offset = if offset < 4095 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
     // BACKWARD_TABLE_LOWER stores the actual (pre-mapped) value
     // so we don't have to call premap_backward here.
-    BACKWARD_TABLE_LOWER[offset + ((code & 31) as usize)]
+    BACKWARD_TABLE_LOWER[offset + ((code & 15) as usize)]
 }
 
 /// Returns the index pointer for code point `code` in this index.
@@ -2484,6 +2986,16 @@ pub fn backward(code: u32) -> u16 {
 
 /// Returns the index shift_jis pointer for code point `code`.
 #[inline]
+#[cfg(not(feature = "no-optimized-legacy-encoding"))]
+pub fn backward_remapped(code: u32) -> u16 {
+    let offset = (code >> 4) as usize;
+    let offset = if offset < 4095 {BACKWARD_TABLE_UPPER_REMAPPED[offset] as usize} else {0};
+    BACKWARD_TABLE_LOWER[offset + ((code & 15) as usize)]
+}
+
+/// Returns the index shift_jis pointer for code point `code`.
+#[inline]
+#[cfg(feature = "no-optimized-legacy-encoding")]
 pub fn backward_remapped(code: u32) -> u16 {
     let value = backward(code);
     if 8272 <= value && value <= 8835 {
@@ -2537,5 +3049,371 @@ multi_byte_tests! {
         11077, 11078, 11079, 11080, 11081, 11082, 11083, 11084, 11085, 11086,
         11087, 11088, 11089, 11090, 11091, 11092, 11093, 11094, 11095, 11096,
         11097, 11098, 11099, 11100, 11101, 11102, 11103,
+    ],
+    golden = [
+        0xf7deec2d06477726, 0xfac40ec40ac72144, // forward & backward hash
+        // 7326 valid code points in 4245 runs
+        167, 2, 7, 2, 2, 1, 1, 1, 32, 1, 31, 1, 665, 17, 1, 7, 7, 17, 1, 7, 55,
+        1, 14, 64, 1, 1, 7102, 1, 4, 1, 2, 2, 2, 2, 2, 2, 3, 2, 9, 1, 1, 2, 7,
+        1, 199, 1, 18, 1, 10, 1, 9, 1, 52, 10, 6, 10, 22, 4, 62, 1, 1, 1, 43,
+        1, 1, 2, 3, 2, 2, 1, 5, 1, 8, 1, 2, 4, 4, 1, 1, 6, 1, 1, 5, 2, 7, 1,
+        20, 1, 13, 2, 4, 2, 2, 2, 22, 2, 2, 2, 29, 1, 25, 1, 82, 1, 333, 20,
+        140, 4, 8, 1, 2, 2, 2, 2, 2, 2, 2, 3, 2, 1, 2, 3, 2, 1, 2, 2, 2, 2, 2,
+        2, 2, 2, 2, 2, 2, 1, 2, 1, 8, 1, 84, 2, 16, 2, 8, 2, 8, 2, 3, 1, 2, 2,
+        31, 1, 21, 2, 57, 1, 1, 1, 39, 1, 2, 1, 1, 1, 2448, 4, 1, 17, 7, 1, 1,
+        1, 33, 83, 7, 4, 2, 86, 4, 4, 306, 2, 6, 1, 106, 5, 90, 1, 9, 1, 6, 1,
+        3, 1, 9, 2, 2, 2, 3, 1, 10, 1, 4, 1, 13, 2, 2, 1, 3, 1, 5, 1, 35, 4,
+        15, 2, 12, 3, 2, 1, 34, 1, 8, 1, 6706, 2, 1, 1, 3, 5, 1, 2, 1, 2, 2, 6,
+        4, 1, 2, 1, 4, 1, 1, 1, 1, 1, 2, 1, 3, 2, 3, 1, 1, 2, 1, 2, 2, 1, 2, 2,
+        1, 1, 5, 1, 1, 3, 5, 5, 3, 3, 2, 1, 14, 1, 1, 1, 10, 1, 1, 1, 1, 1, 2,
+        2, 1, 5, 1, 1, 2, 2, 1, 2, 2, 2, 1, 2, 1, 5, 1, 3, 1, 1, 2, 4, 1, 1, 2,
+        1, 2, 1, 3, 1, 5, 3, 1, 1, 1, 2, 2, 2, 1, 3, 4, 6, 3, 3, 1, 1, 1, 3, 7,
+        2, 1, 1, 1, 1, 3, 2, 3, 2, 3, 2, 1, 1, 5, 2, 2, 5, 8, 1, 1, 2, 17, 2,
+        3, 1, 1, 1, 1, 3, 1, 2, 5, 1, 2, 2, 5, 5, 1, 1, 1, 3, 1, 6, 10, 1, 5,
+        2, 2, 1, 1, 2, 4, 2, 2, 1, 3, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 1,
+        1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 2, 9, 1, 1, 3, 5, 2, 8, 1, 2, 3, 4, 2, 2,
+        2, 1, 2, 2, 1, 2, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 3, 8, 2, 3, 1, 1, 2, 1,
+        1, 1, 1, 3, 2, 5, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 3,
+        2, 1, 6, 1, 6, 8, 1, 2, 1, 6, 1, 1, 2, 2, 4, 5, 2, 4, 2, 3, 1, 1, 1, 8,
+        1, 6, 1, 3, 1, 1, 1, 1, 3, 1, 1, 4, 1, 2, 1, 4, 1, 7, 1, 3, 1, 2, 1, 3,
+        3, 17, 2, 4, 4, 1, 1, 6, 1, 3, 1, 2, 1, 3, 2, 2, 1, 1, 1, 1, 1, 3, 2,
+        1, 1, 1, 1, 3, 1, 4, 1, 1, 1, 1, 1, 5, 2, 5, 2, 3, 1, 1, 1, 4, 3, 1, 1,
+        4, 1, 8, 1, 1, 3, 1, 1, 1, 1, 4, 1, 1, 1, 8, 1, 7, 1, 4, 1, 2, 3, 2, 3,
+        1, 12, 1, 1, 1, 1, 1, 1, 5, 1, 1, 1, 5, 1, 1, 2, 2, 7, 2, 1, 3, 4, 3,
+        1, 3, 1, 1, 1, 2, 2, 2, 2, 1, 2, 1, 5, 1, 3, 1, 1, 3, 1, 2, 1, 1, 1, 1,
+        3, 1, 5, 3, 8, 5, 2, 5, 3, 2, 1, 1, 3, 8, 1, 4, 3, 2, 2, 4, 2, 1, 2, 1,
+        2, 2, 2, 3, 2, 1, 3, 2, 2, 1, 1, 2, 2, 1, 3, 1, 2, 2, 1, 2, 1, 2, 2, 1,
+        1, 5, 1, 6, 2, 1, 1, 1, 2, 3, 1, 1, 1, 2, 1, 2, 6, 7, 2, 2, 1, 2, 4, 1,
+        1, 4, 1, 1, 1, 4, 1, 2, 1, 4, 3, 3, 2, 4, 7, 7, 1, 1, 1, 3, 1, 3, 3, 3,
+        1, 3, 2, 1, 1, 6, 2, 2, 2, 2, 1, 2, 1, 2, 5, 1, 1, 1, 1, 2, 2, 3, 1, 2,
+        1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 4, 1, 2, 1, 1, 3, 1, 1, 1,
+        4, 1, 3, 1, 2, 10, 2, 1, 1, 2, 3, 3, 5, 2, 4, 4, 1, 1, 2, 4, 3, 1, 2,
+        2, 1, 2, 2, 1, 2, 5, 1, 4, 1, 1, 1, 1, 1, 4, 4, 3, 3, 1, 1, 1, 6, 2, 1,
+        3, 4, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1, 4, 8, 1, 2, 2, 1, 3, 1,
+        2, 1, 1, 1, 14, 1, 2, 1, 1, 1, 1, 1, 4, 2, 4, 2, 1, 2, 3, 2, 1, 1, 1,
+        2, 2, 1, 4, 1, 6, 2, 4, 7, 5, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 5, 2,
+        12, 2, 3, 1, 1, 6, 1, 1, 2, 3, 10, 9, 1, 1, 1, 1, 2, 5, 1, 2, 1, 1, 4,
+        7, 1, 1, 2, 1, 4, 1, 1, 1, 1, 3, 1, 1, 3, 3, 1, 2, 1, 13, 1, 8, 1, 1,
+        1, 5, 2, 1, 1, 1, 3, 3, 3, 2, 1, 3, 1, 1, 1, 3, 3, 1, 3, 1, 1, 9, 1, 5,
+        1, 1, 2, 2, 2, 1, 2, 2, 1, 2, 2, 4, 1, 3, 3, 1, 3, 1, 1, 2, 3, 14, 1,
+        8, 2, 2, 2, 1, 2, 3, 2, 3, 1, 7, 1, 2, 1, 1, 1, 4, 1, 1, 2, 7, 2, 3, 1,
+        1, 1, 23, 2, 1, 1, 1, 1, 4, 2, 4, 1, 1, 1, 3, 3, 5, 1, 2, 1, 3, 1, 2,
+        2, 4, 2, 5, 1, 23, 2, 1, 1, 1, 1, 2, 2, 1, 2, 1, 3, 12, 3, 1, 4, 7, 6,
+        1, 1, 1, 1, 5, 1, 13, 2, 1, 1, 12, 1, 5, 1, 1, 1, 2, 1, 3, 2, 18, 1, 1,
+        1, 3, 2, 7, 1, 2, 1, 10, 1, 1, 3, 2, 1, 13, 1, 5, 1, 1, 2, 1, 1, 1, 1,
+        1, 1, 9, 1, 9, 1, 1, 1, 1, 1, 10, 1, 8, 1, 3, 1, 1, 3, 7, 1, 3, 1, 1,
+        1, 5, 1, 5, 2, 2, 1, 4, 1, 4, 1, 11, 1, 1, 1, 2, 1, 8, 1, 5, 1, 1, 1,
+        5, 1, 3, 4, 4, 1, 5, 1, 2, 1, 1, 1, 3, 2, 1, 2, 2, 1, 1, 1, 2, 1, 10,
+        1, 1, 1, 1, 2, 5, 2, 2, 1, 1, 2, 2, 2, 3, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2,
+        1, 1, 1, 3, 1, 2, 1, 6, 3, 4, 1, 2, 1, 6, 2, 2, 1, 4, 1, 1, 1, 4, 1, 2,
+        1, 3, 4, 7, 1, 7, 1, 2, 3, 2, 2, 20, 1, 2, 1, 5, 2, 1, 1, 7, 1, 12, 1,
+        1, 3, 5, 1, 1, 1, 3, 1, 2, 1, 12, 1, 2, 1, 2, 3, 2, 1, 2, 1, 3, 3, 1,
+        1, 5, 1, 2, 2, 2, 1, 16, 1, 2, 1, 1, 2, 1, 1, 3, 1, 1, 1, 2, 2, 3, 2,
+        9, 1, 3, 1, 3, 1, 3, 1, 2, 1, 5, 1, 4, 3, 2, 2, 4, 1, 2, 1, 2, 2, 8, 2,
+        5, 2, 1, 1, 2, 4, 3, 1, 3, 1, 6, 1, 1, 1, 4, 1, 1, 1, 2, 1, 3, 1, 4, 1,
+        4, 1, 1, 1, 13, 1, 3, 1, 4, 1, 1, 2, 8, 1, 2, 1, 2, 1, 3, 2, 4, 4, 2,
+        1, 2, 1, 3, 1, 1, 1, 2, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 3, 2, 1, 1, 2, 4,
+        2, 5, 2, 1, 5, 4, 1, 1, 5, 4, 1, 6, 3, 3, 2, 4, 2, 1, 5, 5, 1, 2, 1, 1,
+        1, 1, 6, 2, 2, 4, 2, 5, 1, 5, 1, 2, 3, 4, 4, 1, 3, 1, 2, 1, 2, 1, 1, 2,
+        1, 1, 2, 1, 1, 1, 4, 1, 1, 1, 1, 4, 2, 3, 1, 4, 1, 3, 4, 5, 1, 2, 1, 5,
+        1, 2, 1, 2, 1, 1, 1, 1, 1, 5, 3, 2, 1, 3, 1, 5, 1, 6, 3, 2, 1, 7, 1, 2,
+        1, 1, 1, 4, 2, 1, 2, 4, 2, 1, 1, 8, 2, 1, 1, 1, 2, 10, 1, 4, 1, 3, 1,
+        1, 1, 1, 1, 5, 1, 7, 1, 6, 1, 1, 1, 1, 1, 2, 2, 4, 1, 3, 1, 5, 1, 5, 2,
+        5, 1, 3, 2, 4, 1, 2, 1, 16, 1, 7, 1, 3, 1, 3, 1, 1, 1, 18, 1, 18, 1, 7,
+        2, 32, 3, 2, 2, 6, 1, 1, 2, 3, 1, 5, 2, 9, 1, 1, 1, 2, 1, 2, 1, 16, 2,
+        13, 1, 1, 2, 9, 1, 11, 1, 7, 1, 1, 1, 3, 1, 1, 1, 3, 1, 7, 1, 1, 1, 2,
+        1, 1, 1, 10, 2, 2, 5, 1, 4, 1, 1, 3, 4, 2, 1, 1, 1, 4, 2, 1, 1, 1, 1,
+        2, 1, 1, 1, 5, 1, 2, 1, 1, 1, 1, 3, 1, 3, 1, 1, 5, 1, 1, 7, 1, 1, 2, 5,
+        7, 1, 1, 1, 2, 4, 1, 2, 5, 2, 1, 6, 1, 1, 2, 1, 3, 1, 1, 3, 3, 1, 2, 1,
+        1, 3, 1, 2, 1, 6, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 3, 2, 1, 2,
+        1, 8, 1, 3, 1, 1, 1, 1, 2, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 4, 1,
+        3, 1, 6, 10, 3, 2, 1, 1, 1, 2, 1, 5, 1, 1, 1, 1, 8, 1, 1, 2, 2, 2, 6,
+        1, 1, 2, 1, 1, 4, 1, 2, 1, 18, 1, 3, 2, 2, 1, 12, 1, 4, 1, 1, 2, 1, 2,
+        4, 1, 1, 1, 2, 3, 1, 3, 1, 1, 6, 1, 1, 1, 17, 1, 6, 2, 6, 3, 2, 1, 1,
+        2, 4, 2, 3, 2, 1, 1, 9, 1, 3, 1, 2, 1, 2, 1, 2, 8, 3, 1, 2, 1, 4, 1, 1,
+        1, 24, 1, 8, 2, 1, 1, 1, 1, 1, 2, 8, 1, 12, 1, 2, 2, 1, 1, 3, 1, 2, 1,
+        11, 1, 1, 1, 2, 1, 3, 2, 3, 1, 12, 1, 4, 1, 9, 1, 1, 1, 8, 4, 1, 2, 11,
+        1, 2, 2, 2, 1, 1, 2, 2, 1, 4, 1, 1, 2, 2, 1, 1, 1, 1, 4, 2, 1, 2, 1, 2,
+        5, 1, 1, 3, 1, 1, 2, 3, 2, 2, 1, 4, 2, 4, 1, 4, 1, 2, 3, 1, 1, 7, 1, 5,
+        1, 1, 1, 1, 2, 2, 1, 2, 3, 4, 1, 2, 1, 2, 3, 1, 1, 4, 1, 1, 1, 5, 2, 1,
+        1, 7, 1, 1, 4, 13, 5, 1, 8, 1, 1, 1, 2, 2, 1, 2, 1, 4, 1, 5, 3, 2, 1,
+        1, 1, 3, 1, 5, 2, 3, 1, 1, 1, 7, 4, 8, 3, 4, 3, 4, 2, 2, 1, 2, 1, 3, 2,
+        1, 1, 1, 5, 4, 2, 2, 1, 3, 2, 1, 2, 1, 3, 1, 3, 1, 2, 1, 1, 1, 2, 4, 5,
+        1, 3, 1, 6, 2, 1, 3, 1, 1, 1, 3, 3, 1, 1, 3, 1, 1, 1, 1, 1, 2, 2, 1, 2,
+        3, 1, 1, 1, 2, 1, 3, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1,
+        2, 2, 3, 2, 3, 2, 1, 5, 2, 2, 1, 1, 3, 1, 1, 1, 2, 1, 2, 7, 1, 2, 1, 3,
+        3, 4, 3, 3, 4, 1, 1, 2, 6, 3, 2, 2, 4, 2, 2, 1, 1, 1, 2, 2, 5, 1, 1, 1,
+        6, 2, 8, 4, 2, 3, 1, 1, 3, 1, 6, 1, 4, 2, 3, 1, 2, 1, 2, 1, 1, 1, 1, 1,
+        14, 3, 1, 1, 2, 2, 2, 1, 1, 3, 2, 2, 3, 7, 3, 1, 1, 1, 8, 1, 6, 3, 2,
+        1, 3, 2, 1, 1, 2, 1, 1, 1, 2, 1, 3, 2, 2, 1, 1, 2, 1, 4, 2, 6, 1, 2, 4,
+        1, 1, 1, 9, 1, 1, 3, 3, 5, 4, 1, 1, 1, 1, 2, 2, 2, 3, 2, 2, 1, 2, 2, 1,
+        2, 7, 5, 1, 1, 3, 2, 7, 3, 9, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 4, 1,
+        1, 3, 2, 7, 5, 1, 2, 1, 3, 4, 2, 1, 1, 2, 1, 1, 2, 3, 3, 1, 1, 3, 1, 4,
+        2, 3, 3, 5, 2, 3, 1, 3, 1, 3, 1, 2, 1, 4, 4, 2, 1, 1, 1, 2, 2, 1, 5, 4,
+        1, 1, 1, 2, 3, 2, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 1, 2, 4, 1, 5, 6, 1, 3,
+        1, 4, 1, 2, 1, 3, 1, 1, 2, 2, 1, 1, 1, 1, 3, 9, 1, 2, 1, 1, 1, 1, 2, 1,
+        1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 2, 8, 2, 1, 18, 1, 2, 1, 11, 1, 1, 1,
+        1, 3, 1, 1, 1, 5, 7, 3, 1, 3, 1, 5, 1, 1, 3, 2, 1, 3, 1, 1, 4, 1, 3, 1,
+        3, 3, 1, 3, 3, 1, 2, 1, 3, 3, 5, 3, 1, 1, 1, 2, 4, 1, 1, 1, 2, 1, 2, 1,
+        2, 1, 1, 1, 2, 1, 4, 1, 5, 1, 2, 1, 4, 1, 2, 1, 2, 1, 1, 3, 1, 3, 4, 2,
+        6, 8, 2, 2, 1, 1, 7, 1, 4, 2, 4, 1, 3, 1, 3, 1, 1, 3, 4, 1, 2, 6, 1, 2,
+        1, 6, 2, 3, 1, 3, 2, 2, 10, 4, 1, 1, 1, 1, 1, 3, 6, 2, 1, 2, 4, 3, 2,
+        1, 4, 1, 7, 1, 5, 1, 7, 2, 2, 1, 3, 1, 10, 1, 2, 3, 9, 1, 2, 2, 1, 2,
+        4, 1, 1, 1, 4, 1, 10, 3, 1, 1, 2, 1, 3, 1, 3, 2, 2, 2, 4, 1, 2, 1, 4,
+        2, 2, 1, 1, 2, 2, 1, 3, 1, 1, 1, 2, 1, 3, 5, 1, 1, 1, 6, 5, 1, 1, 2, 5,
+        1, 2, 1, 1, 1, 2, 2, 1, 1, 2, 1, 5, 2, 1, 1, 3, 1, 3, 2, 5, 1, 1, 1, 5,
+        1, 4, 1, 5, 3, 3, 1, 11, 1, 6, 1, 1, 1, 3, 1, 2, 2, 4, 1, 9, 1, 1, 1,
+        3, 2, 6, 1, 1, 1, 3, 1, 3, 1, 3, 1, 11, 1, 9, 1, 7, 1, 6, 1, 1, 1, 5,
+        1, 6, 1, 1, 1, 1, 1, 8, 1, 4, 1, 9, 2, 1, 1, 4, 1, 2, 2, 5, 2, 3, 1, 1,
+        1, 1, 2, 1, 1, 1, 1, 6, 1, 1, 2, 4, 2, 2, 1, 1, 1, 5, 2, 3, 1, 1, 1, 3,
+        1, 1, 1, 5, 4, 2, 2, 4, 1, 2, 1, 1, 2, 1, 1, 1, 1, 3, 1, 2, 2, 1, 1, 4,
+        1, 18, 1, 3, 2, 5, 2, 5, 3, 2, 1, 4, 6, 1, 1, 2, 2, 5, 1, 2, 1, 4, 3,
+        1, 1, 3, 5, 3, 2, 3, 2, 2, 1, 5, 1, 3, 1, 1, 1, 1, 2, 1, 2, 9, 2, 3, 3,
+        2, 1, 1, 1, 1, 2, 5, 1, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 1, 1, 3, 3, 1, 2,
+        6, 1, 1, 1, 2, 2, 3, 1, 1, 4, 4, 2, 2, 1, 2, 1, 4, 1, 1, 1, 1, 1, 4, 3,
+        2, 5, 2, 2, 3, 1, 8, 2, 4, 1, 1, 2, 2, 2, 1, 2, 1, 1, 1, 2, 3, 3, 6, 1,
+        1, 3, 3, 2, 1, 2, 4, 3, 1, 1, 2, 3, 4, 2, 2, 1, 1, 4, 4, 1, 1, 1, 3, 1,
+        2, 1, 4, 1, 1, 1, 3, 3, 2, 1, 1, 6, 4, 3, 2, 2, 1, 1, 3, 1, 6, 1, 1, 2,
+        2, 3, 4, 1, 2, 1, 4, 4, 3, 1, 2, 1, 1, 1, 3, 1, 4, 1, 2, 1, 3, 1, 1, 1,
+        3, 2, 2, 1, 1, 2, 1, 1, 2, 1, 2, 1, 1, 1, 12, 1, 2, 2, 1, 2, 2, 1, 5,
+        1, 2, 1, 6, 1, 1, 4, 1, 10, 2, 1, 4, 2, 1, 1, 1, 3, 4, 4, 3, 1, 1, 3,
+        6, 3, 1, 5, 2, 1, 2, 1, 1, 3, 1, 1, 2, 1, 1, 1, 1, 1, 4, 1, 2, 1, 4, 4,
+        1, 1, 2, 1, 2, 1, 2, 1, 1, 9, 3, 1, 2, 1, 1, 5, 1, 1, 1, 1, 4, 1, 1, 2,
+        5, 1, 1, 1, 1, 1, 1, 2, 3, 1, 4, 1, 1, 1, 2, 1, 1, 2, 2, 3, 3, 1, 2, 1,
+        5, 1, 3, 2, 1, 4, 1, 1, 4, 2, 2, 1, 1, 1, 3, 1, 3, 4, 1, 2, 3, 1, 1, 1,
+        2, 2, 3, 1, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 3, 5, 1, 2, 2, 1, 4,
+        14, 1, 2, 2, 6, 1, 2, 2, 6, 3, 6, 1, 1, 1, 3, 2, 2, 2, 2, 5, 1, 1, 1,
+        1, 4, 2, 1, 5, 4, 1, 2, 2, 1, 1, 3, 1, 3, 1, 12, 1, 1, 2, 6, 2, 1, 1,
+        1, 1, 1, 1, 7, 1, 1, 1, 3, 2, 2, 1, 3, 1, 1, 1, 1, 2, 1, 1, 3, 3, 4, 1,
+        1, 3, 1, 1, 1, 2, 2, 2, 1, 1, 7, 1, 1, 1, 1, 4, 1, 1, 1, 1, 2, 1, 1, 2,
+        1, 2, 1, 1, 4, 3, 1, 1, 3, 1, 6, 2, 2, 1, 6, 2, 5, 2, 2, 2, 2, 1, 2, 5,
+        2, 1, 6, 4, 4, 3, 1, 2, 1, 1, 1, 1, 5, 1, 3, 1, 1, 1, 2, 1, 3, 1, 1, 1,
+        10, 1, 8, 3, 3, 2, 1, 3, 1, 3, 5, 1, 1, 2, 1, 3, 3, 3, 1, 3, 2, 3, 2,
+        2, 7, 1, 3, 1, 2, 1, 2, 2, 2, 1, 2, 2, 3, 1, 6, 1, 6, 1, 2, 2, 1, 1, 6,
+        1, 2, 2, 1, 1, 1, 1, 3, 1, 2, 5, 1, 1, 2, 1, 4, 2, 3, 2, 3, 1, 4, 2, 2,
+        1, 1, 1, 4, 1, 6, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 4, 3, 5, 3, 2, 1, 1,
+        1, 1, 1, 2, 2, 1, 3, 5, 3, 2, 1, 1, 1, 4, 2, 1, 3, 2, 1, 6, 1, 1, 3, 2,
+        1, 12, 2, 5, 1, 1, 2, 3, 1, 4, 1, 6, 2, 4, 1, 5, 3, 3, 1, 8, 2, 1, 1,
+        6, 1, 4, 1, 3, 1, 1, 2, 6, 1, 1, 1, 1, 1, 4, 1, 4, 1, 2, 1, 5, 3, 13,
+        1, 1, 1, 6, 2, 2, 2, 2, 1, 1, 1, 3, 1, 1, 1, 15, 2, 8, 2, 4, 1, 7, 1,
+        3, 1, 6, 1, 1, 3, 1, 1, 3, 1, 10, 1, 4, 4, 2, 2, 4, 1, 3, 1, 1, 1, 2,
+        1, 1, 1, 1, 1, 2, 2, 4, 1, 1, 1, 3, 1, 1, 4, 1, 1, 2, 2, 4, 1, 3, 2, 3,
+        2, 1, 1, 3, 2, 2, 2, 1, 1, 2, 3, 1, 1, 7, 2, 1, 1, 5, 1, 5, 1, 5, 2, 3,
+        1, 1, 5, 1, 1, 2, 3, 2, 2, 4, 2, 4, 1, 1, 2, 3, 3, 1, 1, 1, 1, 2, 1, 3,
+        1, 11, 2, 2, 1, 3, 1, 20, 1, 6, 1, 1, 1, 1, 2, 2, 1, 3, 1, 7, 2, 15, 1,
+        2, 2, 5, 5, 11, 1, 1, 1, 4, 1, 1, 1, 2, 1, 1, 5, 1, 1, 5, 1, 1, 1, 4,
+        2, 1, 2, 6, 1, 2, 2, 2, 3, 2, 1, 1, 1, 3, 2, 2, 1, 1, 2, 2, 1, 2, 3, 5,
+        2, 8, 1, 2, 1, 2, 1, 1, 1, 4, 8, 1, 1, 2, 2, 3, 2, 1, 1, 6, 1, 1, 1, 1,
+        1, 1, 3, 1, 1, 3, 3, 1, 1, 2, 1, 1, 1, 4, 3, 1, 1, 16, 1, 6, 2, 5, 1,
+        4, 1, 1, 1, 1, 1, 2, 2, 5, 1, 3, 3, 6, 2, 1, 2, 1, 1, 2, 1, 1, 2, 2, 1,
+        2, 2, 19, 2, 1, 1, 6, 2, 1, 1, 2, 2, 1, 1, 1, 2, 4, 1, 2, 3, 11, 1, 1,
+        2, 3, 1, 1, 1, 4, 1, 1, 2, 2, 1, 1, 2, 15, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+        3, 1, 3, 1, 4, 3, 3, 2, 2, 1, 1, 2, 2, 1, 2, 2, 4, 1, 2, 1, 2, 1, 1, 1,
+        1, 1, 1, 3, 1, 1, 2, 3, 1, 1, 1, 6, 8, 1, 1, 5, 7, 1, 1, 1, 3, 3, 1, 1,
+        1, 3, 1, 5, 1, 1, 1, 5, 8, 3, 1, 1, 1, 1, 4, 1, 6, 1, 2, 2, 7, 1, 1, 1,
+        2, 2, 2, 1, 7, 1, 3, 1, 2, 2, 2, 1, 3, 1, 7, 3, 1, 1, 9, 1, 2, 2, 5, 1,
+        1, 1, 3, 2, 1, 1, 2, 1, 2, 1, 4, 1, 4, 1, 2, 1, 3, 2, 2, 1, 2, 1, 1, 1,
+        2, 1, 1, 2, 3, 1, 1, 2, 4, 1, 1, 3, 7, 2, 13, 1, 2, 1, 2, 1, 1, 1, 2,
+        2, 5, 2, 1, 2, 3, 1, 2, 1, 5, 1, 1, 1, 1, 3, 10, 1, 1, 2, 7, 2, 4, 2,
+        5, 1, 5, 2, 1, 1, 3, 1, 14, 1, 3, 1, 2, 2, 2, 1, 4, 1, 1, 1, 6, 4, 3,
+        1, 3, 1, 1, 1, 1, 1, 3, 3, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1, 5, 1, 9, 1, 1,
+        2, 5, 1, 6, 1, 1, 1, 1, 1, 3, 1, 6, 4, 2, 1, 13, 2, 2, 1, 2, 1, 3, 3,
+        2, 1, 6, 2, 1, 2, 1, 1, 1, 1, 1, 2, 3, 1, 3, 1, 2, 1, 3, 1, 1, 1, 1, 1,
+        1, 1, 3, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 3, 6, 3, 3, 1, 3, 1, 1, 1, 11,
+        1, 13, 1, 4, 1, 6, 1, 10, 1, 7, 1, 3, 2, 7, 1, 3, 2, 7, 1, 3, 2, 3, 1,
+        3, 1, 6, 1, 17, 5, 3, 1, 4, 4, 12, 1, 2, 1, 3, 1, 9, 1, 3, 1, 1, 1, 17,
+        1, 7, 1, 3, 1, 6, 1, 4, 1, 5, 1, 4, 1, 4, 2, 1, 1, 4, 1, 4, 1, 15, 1,
+        5, 1, 9, 2, 1, 1, 2, 1, 1, 1, 6, 2, 2, 1, 2, 1, 5, 1, 1, 4, 1, 1, 2, 1,
+        1, 1, 14, 1, 6, 1, 3, 1, 1, 1, 4, 1, 4, 2, 3, 1, 5, 1, 8, 1, 3, 1, 4,
+        1, 7, 1, 4, 1, 2, 1, 1, 1, 4, 2, 4, 1, 1, 1, 1, 1, 1, 2, 1, 1, 7, 2, 4,
+        3, 4, 3, 6, 1, 3, 1, 1, 2, 1, 2, 6, 1, 6, 1, 2, 1, 10, 1, 12, 1, 1, 1,
+        1, 2, 2, 1, 1, 1, 2, 2, 3, 7, 5, 3, 2, 2, 5, 1, 5, 2, 1, 1, 1, 1, 1, 1,
+        1, 2, 4, 1, 1, 1, 8, 1, 1, 1, 4, 1, 3, 2, 1, 3, 4, 1, 10, 1, 3, 1, 9,
+        1, 1, 1, 4, 1, 4, 1, 2, 1, 1, 2, 3, 1, 2, 1, 4, 1, 3, 3, 1, 1, 7, 1, 1,
+        1, 1, 1, 4, 1, 1, 1, 1, 1, 4, 3, 6, 1, 2, 2, 9, 3, 2, 2, 12, 1, 11, 2,
+        3, 3, 1, 1, 4, 2, 3, 3, 2, 2, 4, 1, 1, 2, 6, 2, 4, 2, 8, 2, 7, 1, 11,
+        1, 4, 1, 1, 1, 5, 1, 1, 1, 2, 1, 1, 2, 1, 2, 8, 1, 2, 1, 1, 1, 1, 1,
+        10, 1, 18, 1, 8, 2, 7, 1, 1, 1, 2, 1, 1, 1, 5, 3, 2, 2, 3, 1, 3, 1, 7,
+        1, 1, 1, 2, 1, 1, 1, 4, 1, 2, 2, 2, 1, 3, 1, 2, 1, 5, 1, 4, 1, 1, 3, 1,
+        1, 24, 1, 2, 2, 2, 2, 3, 1, 3, 5, 3, 1, 4, 1, 1, 1, 19, 1, 3, 4, 1, 3,
+        1, 3, 4, 2, 4, 2, 2, 1, 2, 1, 7, 1, 4, 1, 5, 1, 1, 1, 18, 2, 2, 1, 4,
+        1, 8, 1, 12, 1, 12, 1, 4, 1, 4, 1, 7, 1, 3, 1, 1, 2, 2, 2, 1, 1, 4, 1,
+        1, 3, 3, 3, 8, 1, 1, 3, 6, 3, 2, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2,
+        3, 1, 1, 2, 1, 1, 2, 2, 2, 5, 3, 2, 1, 3, 7, 1, 1, 1, 2, 5, 1, 1, 1, 1,
+        2, 1, 4, 5, 2, 1, 1, 1, 1, 4, 1, 3, 1, 1, 1, 2, 2, 2, 1, 3, 6, 1, 2, 1,
+        3, 2, 1, 3, 2, 2, 1, 1, 2, 1, 5, 1, 2, 1, 5, 1, 1, 1, 5, 1, 5, 3, 1, 1,
+        2, 2, 2, 3, 3, 2, 1, 1, 1, 1, 2, 1, 2, 1, 4, 1, 1, 2, 2, 2, 1, 1, 2, 1,
+        3, 2, 5, 1, 6, 1, 1, 3, 5, 1, 1, 1, 1, 2, 1, 1, 7, 1, 1, 1, 1, 1, 17,
+        4, 1, 1, 2, 1, 8, 1, 3, 1, 6, 1, 6, 1, 3, 3, 3, 1, 5, 1, 3, 1, 1, 1, 3,
+        1, 4, 2, 4, 4, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 5, 1, 1, 1, 3, 1, 3, 2,
+        1, 2, 1, 1, 1, 2, 1, 2, 1, 2, 4, 1, 1, 7, 1, 7, 1, 1, 1, 3, 1, 2, 4, 4,
+        1, 2, 2, 2, 1, 1, 1, 1, 1, 2, 1, 4, 1, 3, 2, 3, 2, 1, 2, 1, 1, 1, 3, 1,
+        1, 2, 1, 3, 1, 3, 1, 1, 1, 3, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 3, 1, 2,
+        14, 1, 2, 3, 3, 3, 2, 1, 13, 2, 1, 1, 1, 1, 3, 1, 5, 2, 18, 2, 5, 1, 1,
+        1, 1, 2, 1, 1, 2, 1, 13, 1, 4, 2, 11, 1, 2, 1, 2, 1, 12, 1, 1, 1, 4, 1,
+        6, 2, 2, 1, 2, 1, 2, 1, 2, 1, 1, 3, 1, 1, 7, 1, 5, 1, 9, 1, 2, 3, 5, 2,
+        1, 1, 1, 1, 1, 1, 3, 3, 3, 1, 8, 1, 5, 1, 9, 1, 5, 1, 1, 2, 10, 2, 3,
+        3, 10, 1, 1, 1, 5, 1, 4, 1, 5, 1, 8, 1, 14, 1, 6, 1, 6, 2, 2, 1, 2, 1,
+        1, 1, 5, 1, 1, 1, 4, 1, 4, 2, 4, 3, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 8, 1,
+        3, 1, 1, 2, 4, 1, 5, 1, 4, 1, 1, 1, 1, 1, 2, 1, 3, 2, 3, 2, 4, 2, 2, 1,
+        5, 1, 12, 2, 3, 1, 2, 1, 4, 1, 8, 1, 3, 1, 5, 1, 6, 1, 2, 2, 6, 1, 12,
+        1, 3, 3, 3, 1, 9, 1, 1, 1, 1, 1, 1, 2, 5, 3, 6, 1, 2, 1, 1, 3, 2, 1, 2,
+        4, 1, 1, 2, 1, 2, 1, 4, 1, 9, 1, 2, 1, 4, 3, 2, 2, 4, 1, 2, 3, 4, 1, 6,
+        1, 1, 1, 8, 2, 2, 1, 3, 1, 1, 1, 2, 1, 5, 2, 2, 5, 7, 1, 1, 1, 5, 2, 2,
+        1, 2, 1, 6, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 3, 1, 10, 1, 4, 1, 7, 1,
+        2, 1, 1, 2, 5, 1, 2, 4, 1, 1, 2, 2, 13, 1, 2, 2, 4, 1, 3, 6, 1, 2, 2,
+        1, 2, 1, 3, 4, 6, 1, 9, 3, 5, 1, 1, 1, 4, 1, 3, 1, 1, 1, 2, 2, 2, 1, 1,
+        1, 1, 1, 1, 2, 3, 1, 9, 2, 1, 4, 6, 1, 9, 2, 3, 3, 5, 1, 3, 1, 4, 1, 3,
+        3, 1, 2, 1, 2, 1, 1, 1, 1, 1, 3, 1, 1, 3, 2, 1, 2, 1, 5, 1, 3, 2, 2, 1,
+        1, 1, 2, 5, 1, 1, 3, 4, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 3, 1, 1, 1, 6,
+        2, 1, 1, 2, 1, 1, 1, 4, 2, 1, 1, 3, 1, 6, 1, 1, 2, 2, 1, 11, 2, 1, 2,
+        1, 3, 1, 4, 1, 1, 1, 1, 6, 1, 7, 1, 1, 1, 4, 1, 1, 1, 1, 2, 2, 2, 4, 1,
+        11, 2, 3, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 4, 1, 4, 1, 1, 8, 1, 2, 1, 3,
+        1, 2, 1, 3, 1, 7, 2, 2, 1, 1, 2, 1, 1, 1, 2, 2, 1, 13, 1, 2, 1, 3, 3,
+        2, 1, 3, 1, 5, 1, 2, 2, 8, 1, 6, 1, 5, 1, 3, 4, 2, 1, 7, 1, 1, 1, 1, 1,
+        3, 1, 2, 2, 11, 2, 4, 4, 2, 1, 8, 2, 1, 2, 3, 1, 1, 1, 1, 1, 6, 2, 3,
+        2, 6, 1, 6, 1, 1, 1, 8, 1, 2, 3, 5, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 1, 1,
+        2, 2, 1, 3, 1, 1, 2, 1, 2, 1, 2, 2, 1, 1, 2, 2, 3, 5, 1, 3, 2, 1, 1, 1,
+        1, 2, 1, 4, 1, 3, 1, 3, 1, 3, 1, 1, 1, 3, 1, 1, 3, 1, 1, 4, 1, 7, 1, 2,
+        1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 3, 3, 2, 1, 1, 2, 1, 3,
+        2, 1, 6, 3, 3, 8, 2, 1, 3, 1, 2, 1, 1, 3, 2, 4, 1, 2, 5, 1, 1, 2, 2, 1,
+        3, 5, 1, 4, 2, 1, 1, 2, 3, 2, 1, 1, 1, 5, 1, 2, 3, 1, 2, 2, 1, 3, 1,
+        11, 1, 5, 1, 3, 1, 5, 4, 2, 2, 1, 2, 7, 8, 1, 2, 1, 2, 1, 2, 1, 3, 7,
+        1, 2, 2, 3, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 3, 1, 2, 2, 1, 3, 2, 2, 1, 2,
+        1, 2, 1, 1, 1, 6, 1, 5, 1, 2, 2, 3, 3, 6, 1, 8, 1, 2, 2, 1, 3, 2, 1, 4,
+        1, 2, 1, 2, 2, 2, 1, 1, 1, 1, 3, 1, 2, 2, 1, 1, 1, 2, 1, 3, 2, 1, 1, 4,
+        1, 1, 3, 2, 2, 2, 2, 7, 2, 1, 2, 2, 1, 2, 1, 8, 1, 1, 3, 1, 1, 2, 2, 4,
+        3, 1, 1, 1, 3, 1, 3, 1, 1, 4, 2, 153, 1, 1, 1, 1, 1, 10, 1, 1, 1, 4, 3,
+        1, 2, 2, 2, 2, 1, 6, 2, 6, 5, 2, 1, 1, 1, 1, 1, 2, 1, 1, 3, 8, 2, 1, 4,
+        1, 1, 1, 1, 1, 1, 5, 1, 5, 1, 2, 2, 2, 1, 1, 2, 3, 2, 4, 2, 2, 1, 3, 1,
+        1, 2, 3, 1, 3, 1, 3, 2, 3, 1, 1, 1, 5, 1, 1, 2, 10, 2, 4, 1, 2, 1, 1,
+        1, 4, 1, 2, 1, 5, 1, 1, 2, 3, 2, 1, 4, 4, 2, 3, 1, 1, 1, 2, 1, 1, 3, 2,
+        1, 4, 1, 6, 1, 10, 1, 2, 1, 4, 1, 1, 1, 1, 1, 6, 1, 3, 1, 7, 1, 3, 1,
+        1, 1, 1, 1, 3, 2, 1, 2, 5, 1, 6, 2, 1, 3, 1, 2, 1, 1, 3, 3, 4, 4, 1, 1,
+        1, 2, 6, 1, 2, 1, 1, 1, 1, 2, 1, 1, 3, 2, 2, 1, 3, 2, 1, 2, 1, 1, 1, 2,
+        1, 1, 5, 1, 8, 2, 1, 1, 5, 1, 1, 1, 7, 1, 2, 3, 1, 2, 2, 1, 2, 2, 9, 1,
+        1, 1, 2, 1, 3, 1, 3, 2, 4, 1, 2, 6, 15, 2, 7, 1, 5, 1, 5, 1, 1, 1, 1,
+        1, 5, 1, 4, 1, 7, 1, 4, 1, 2, 1, 1, 2, 1, 3, 9, 1, 5, 2, 4, 1, 2, 1, 1,
+        2, 2, 1, 3, 3, 4, 2, 1, 2, 4, 1, 1, 1, 4, 1, 3, 1, 1, 1, 4, 1, 1, 2, 2,
+        1, 2, 2, 3, 2, 6, 1, 2, 1, 1, 1, 2, 1, 1, 1, 2, 4, 1, 1, 3, 1, 1, 2, 3,
+        1, 3, 1, 1, 1, 4, 3, 4, 2, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 5, 2, 5, 3, 1,
+        1, 2, 2, 2, 1, 1, 4, 1, 3, 1, 1, 1, 1, 3, 3, 2, 2, 1, 2, 9, 4, 1, 1, 4,
+        1, 1, 5, 6, 1, 6, 1, 16, 3, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2,
+        2, 2, 1, 2, 3, 3, 5, 1, 12, 1, 1, 1, 4, 1, 6, 1, 3, 1, 1, 1, 5, 2, 4,
+        3, 1, 1, 1, 1, 1, 1, 4, 2, 1, 1, 1, 1, 7, 1, 11, 4, 2, 1, 1, 1, 1, 2,
+        1, 2, 1, 1, 1, 1, 1, 3, 3, 1, 5, 1, 1, 2, 4, 3, 5, 6, 2, 1, 4, 1, 7, 3,
+        3, 1, 6, 1, 4, 1, 2, 1, 3, 1, 1, 2, 1, 3, 1, 2, 6, 1, 4, 1, 3, 2, 4, 2,
+        1, 1, 5, 1, 9, 1, 16, 1, 1, 1, 1, 1, 3, 2, 2, 1, 5, 1, 1, 1, 1, 2, 3,
+        1, 4, 1, 2, 1, 3, 1, 3, 3, 1, 1, 5, 1, 1, 2, 5, 1, 3, 1, 7, 1, 3, 1, 3,
+        1, 1, 1, 2, 1, 1, 1, 1, 1, 4, 1, 2, 1, 1, 1, 3, 1, 2, 2, 8, 1, 1, 1, 3,
+        4, 1, 1, 1, 2, 3, 1, 1, 1, 5, 2, 2, 1, 3, 4, 4, 1, 12, 1, 1, 1, 6, 2,
+        1, 1, 4, 1, 3, 1, 2, 1, 3, 2, 8, 1, 1, 2, 4, 1, 8, 1, 3, 1, 5, 3, 2, 1,
+        2, 1, 1, 5, 1, 1, 3, 1, 1, 1, 1, 2, 7, 1, 1, 1, 6, 1, 4, 1, 3, 1, 4, 1,
+        2, 1, 2, 1, 1, 1, 11, 1, 4, 1, 1, 1, 3, 2, 1, 2, 2, 1, 1, 1, 2, 1, 1,
+        1, 2, 3, 1, 1, 2, 2, 4, 1, 2, 2, 1, 1, 15, 1, 1, 1, 5, 1, 7, 1, 2, 2,
+        5, 1, 10, 1, 1, 3, 1, 2, 1, 1, 4, 1, 1, 1, 4, 1, 5, 2, 7, 1, 7, 1, 2,
+        2, 1, 1, 4, 4, 2, 1, 4, 1, 1, 1, 1, 4, 8, 1, 4, 4, 1, 1, 9, 1, 6, 1, 1,
+        1, 3, 1, 2, 2, 1, 1, 5, 2, 2, 1, 2, 1, 1, 1, 1, 2, 7, 1, 1, 1, 1, 5, 1,
+        3, 8, 2, 6, 1, 7, 1, 3, 1, 1, 2, 4, 1, 6, 2, 6, 2, 3, 2, 12, 1, 1, 3,
+        2, 1, 3, 1, 3, 2, 2, 2, 7, 1, 2, 2, 2, 1, 7, 1, 10, 1, 1, 2, 14, 1, 13,
+        2, 1, 1, 3, 2, 4, 1, 1, 1, 1, 2, 7, 1, 3, 1, 5, 1, 7, 1, 1, 1, 14, 3,
+        6, 1, 1, 1, 13, 2, 4, 3, 3, 2, 5, 1, 13, 1, 1, 2, 1, 1, 1, 1, 1, 2, 5,
+        1, 4, 1, 1, 1, 2, 2, 4, 1, 4, 1, 2, 4, 8, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2,
+        1, 1, 3, 2, 1, 3, 2, 5, 1, 1, 1, 1, 1, 8, 1, 3, 1, 10, 1, 2, 1, 3, 1,
+        3, 1, 9, 1, 1, 2, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 5, 2, 2, 1, 2, 1, 1, 1,
+        1, 1, 3, 1, 5, 1, 1, 1, 1, 1, 6, 1, 2, 1, 10, 1, 17, 1, 2, 1, 8, 1, 3,
+        1, 3, 1, 6, 2, 1, 1, 2, 1, 3, 1, 1, 2, 3, 1, 4, 1, 1, 1, 13, 1, 14, 1,
+        2, 1, 3, 2, 1, 1, 1, 1, 2, 1, 6, 1, 1, 1, 5, 3, 1, 1, 3, 2, 10, 3, 3,
+        1, 9, 1, 4, 1, 2, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 5, 2, 4, 2, 3, 1, 1,
+        1, 1, 1, 1, 2, 2, 3, 4, 1, 2, 1, 4, 1, 1, 1, 2, 1, 1, 1, 5, 3, 1, 2, 5,
+        1, 2, 1, 1, 1, 4, 1, 3, 2, 1, 1, 4, 1, 3, 1, 1, 1, 6, 1, 2, 1, 1, 2, 2,
+        2, 1, 1, 7, 1, 1, 5, 9, 1, 4, 2, 2, 2, 2, 2, 1, 1, 1, 1, 6, 1, 9, 4, 2,
+        2, 2, 3, 3, 1, 1, 1, 2, 1, 2, 1, 1, 1, 3, 1, 1, 2, 8, 3, 6, 1, 4, 2,
+        10, 1, 1, 1, 2, 1, 5, 1, 1, 2, 7, 2, 8, 1, 7, 3, 3, 1, 1, 1, 3, 1, 2,
+        1, 1, 1, 2, 1, 1, 1, 2, 1, 6, 2, 1, 1, 1, 1, 2, 3, 1, 2, 3, 1, 3, 1, 2,
+        3, 1, 1, 6, 1, 4, 2, 1, 2, 1, 1, 2, 1, 2, 2, 6, 1, 2, 1, 1, 2, 17, 1,
+        7, 1, 1, 2, 5, 1, 2, 2, 12, 1, 3, 1, 7, 1, 1, 2, 4, 1, 1, 1, 1, 1, 1,
+        1, 1, 1, 1, 2, 2, 3, 2, 1, 1, 1, 1, 1, 3, 1, 1, 1, 4, 1, 2, 1, 3, 1, 1,
+        2, 1, 2, 2, 3, 4, 1, 4, 1, 1, 1, 7, 3, 1, 2, 5, 1, 2, 1, 1, 1, 1, 2, 2,
+        1, 2, 1, 1, 4, 1, 4, 5, 1, 2, 1, 5, 1, 1, 2, 1, 1, 1, 1, 2, 2, 3, 1, 1,
+        1, 1, 1, 2, 1, 1, 1, 3, 1, 1, 2, 1, 6, 3, 2, 2, 1, 1, 1, 6, 1, 2, 1, 1,
+        2, 2, 1, 1, 1, 2, 1, 3, 3, 1, 1, 2, 1, 3, 1, 3, 3, 1, 5, 1, 1, 1, 2, 3,
+        1, 1, 2, 2, 1, 1, 1, 2, 3, 1, 1, 3, 1, 1, 3, 1, 1, 2, 1, 4, 1, 1, 1, 1,
+        1, 3, 1, 1, 2, 1, 3, 1, 1, 2, 2, 4, 1, 1, 1, 2, 2, 6, 1, 5, 1, 4, 1, 2,
+        1, 7, 1, 2, 1, 1, 2, 3, 1, 2, 1, 1, 1, 1, 3, 2, 1, 6, 1, 4, 2, 2, 4, 1,
+        1, 2, 1, 5, 1, 1, 2, 2, 1, 6, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 2, 2,
+        156, 1, 2, 1, 4, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 4, 1, 4,
+        1, 6, 2, 7, 3, 11, 3, 1, 1, 5, 1, 2, 1, 3, 2, 1, 3, 5, 1, 3, 1, 4, 2,
+        1, 3, 4, 10, 1, 3, 1, 3, 2, 3, 1, 6, 2, 2, 1, 1, 2, 2, 2, 1, 1, 1, 6,
+        3, 1, 1, 1, 1, 1, 3, 1, 1, 3, 1, 2, 1, 2, 1, 3, 1, 5, 4, 6, 2, 1, 2, 1,
+        2, 1, 1, 1, 2, 1, 3, 1, 1, 77, 1, 1, 2, 3, 1, 1, 1, 2, 2, 1, 2, 1, 2,
+        9, 1, 3, 1, 4, 1, 14, 1, 9, 1, 4, 1, 10, 1, 6, 1, 3, 1, 3, 1, 8, 2, 2,
+        1, 6, 1, 3, 2, 1, 1, 1, 1, 1, 1, 1, 1, 4, 1, 1, 2, 3, 1, 3, 1, 1, 1, 6,
+        1, 2, 1, 8, 3, 4, 2, 12, 3, 10, 1, 5, 1, 3, 2, 12, 1, 1, 1, 2, 4, 1, 1,
+        3, 1, 4, 1, 3, 1, 5, 2, 2, 2, 13, 1, 1, 1, 1, 1, 5, 1, 4, 1, 2, 2, 1,
+        1, 2, 2, 1, 1, 3, 1, 1, 2, 4, 1, 7, 1, 8, 3, 2, 3, 12, 1, 6, 2, 1, 1,
+        1, 4, 1, 1, 2, 1, 8, 1, 3, 1, 2, 2, 7, 1, 12, 1, 2, 4, 4, 1, 1, 1, 3,
+        2, 1, 1, 5, 4, 3, 1, 1, 3, 1, 1, 6, 1, 2, 2, 4, 1, 3, 1, 4, 2, 1, 1, 2,
+        2, 2, 1, 1, 3, 2, 1, 2, 3, 8, 1, 4, 1, 2, 1, 1, 4, 54, 2, 1, 2, 3, 1,
+        3, 2, 4, 6, 4, 1, 2, 3, 2, 1, 2, 1, 1, 2, 8, 1, 2, 1, 2, 1, 5, 1, 7, 1,
+        2, 2, 2, 3, 1, 1, 1, 2, 3, 1, 2, 4, 2, 1, 2, 2, 1, 1, 1, 2, 4, 1, 1, 5,
+        1, 5, 1, 2, 2, 7, 3, 1, 6, 1, 2, 2, 2, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 1,
+        1, 1, 1, 3, 1, 10, 1, 2, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 3, 3, 3, 2,
+        1, 2, 4, 1, 1, 1, 2, 1, 6, 2, 1, 1, 2, 4, 1, 1, 1, 17, 1, 2, 1, 1, 1,
+        1, 1, 4, 1, 1, 1, 3, 1, 2, 1, 8, 1, 8, 1, 3, 1, 12, 1, 2, 1, 2, 2, 1,
+        1, 3, 1, 4, 1, 7, 1, 1, 1, 5, 1, 4, 1, 15, 1, 2, 1, 3, 1, 13, 1, 5, 1,
+        2, 1, 1, 1, 22, 6, 3, 1, 1, 1, 1, 1, 1, 1, 9, 2, 1, 1, 3, 2, 1, 1, 5,
+        2, 1, 1, 1, 2, 9, 1, 4, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 4, 1, 4, 1, 5,
+        1, 1, 1, 5, 2, 3, 1, 4, 2, 2, 1, 1, 1, 5, 2, 4, 4, 1, 7, 4, 3, 1, 6, 1,
+        1, 1, 5, 5, 2, 6, 2, 5, 1, 2, 1, 6, 1, 3, 1, 2, 2, 1, 2, 2, 2, 8, 1,
+        10, 1, 2, 1, 7, 1, 2, 1, 1, 2, 1, 1, 2, 2, 3, 2, 2, 2, 1, 1, 2, 1, 1,
+        2, 5, 1, 1, 3, 2, 1, 3, 1, 1, 1, 1, 2, 9, 1, 5, 2, 5, 1, 1, 1, 2, 1, 1,
+        1, 2, 1, 8, 1, 1, 1, 1, 2, 1, 1, 1, 3, 10, 1, 5, 1, 9, 1, 1, 1, 21, 2,
+        1, 2, 1, 1, 1, 1, 1, 1, 6, 1, 3, 1, 2, 1, 1, 2, 2, 1, 4, 2, 4, 5, 2, 1,
+        2, 1, 3, 1, 8, 2, 7, 3, 2, 2, 1, 4, 1, 2, 1, 1, 2, 2, 1, 2, 2, 1, 2, 1,
+        4, 2, 8, 1, 3, 1, 2, 1, 1, 1, 6, 1, 1, 2, 3, 2, 3, 1, 11, 1, 1, 1, 1,
+        1, 4, 1, 6, 1, 1, 1, 13, 1, 7, 1, 1, 2, 2, 1, 9, 1, 2, 1, 4, 3, 1, 1,
+        8, 1, 9, 1, 2, 1, 1, 1, 7, 2, 4, 3, 4, 2, 2, 1, 2, 2, 2, 1, 15, 1, 10,
+        1, 3, 1, 8, 1, 2, 2, 3, 3, 6, 1, 9, 1, 5, 1, 3, 2, 1, 1, 1, 1, 6, 1, 2,
+        2, 2, 1, 8, 3, 6, 2, 2, 1, 1, 1, 1, 1, 7, 1, 5, 1, 4, 1, 1, 1, 4, 4, 1,
+        1, 245, 1, 8, 1, 1, 2, 3, 1, 1, 3, 3, 1, 1, 4, 1, 1, 1, 2, 6, 1, 1, 4,
+        1, 2, 4, 1, 4, 1, 6, 1, 1, 2, 1, 1, 4, 1, 3, 1, 2, 1, 1, 2, 6, 3, 1, 1,
+        3, 1, 4, 2, 2, 1, 54, 1, 4, 1, 6, 1, 1, 1, 3, 2, 2, 1, 8, 1, 3, 2, 1,
+        1, 1, 1, 6, 3, 1, 2, 10, 5, 2, 5, 3, 1, 1, 1, 3, 1, 1, 2, 1, 4, 1, 1,
+        2, 1, 7, 2, 1, 1, 1, 2, 1, 3, 4, 2, 1, 3, 1, 3, 2, 1, 2, 1, 3, 2, 1, 1,
+        4, 4, 1, 1, 1, 4, 1, 2, 3, 2, 2, 4, 1, 1, 1, 4, 2, 1, 3, 2, 2, 1, 1, 2,
+        5, 2, 4, 1, 1, 2, 4, 1, 1, 1, 3, 2, 1, 1, 1, 1, 4, 1, 3, 1, 1, 3, 1, 1,
+        2, 3, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 5, 1, 2, 1, 2, 1, 5, 1, 1, 2,
+        4, 2, 1, 1, 1, 2, 3, 3, 1, 1, 1, 2, 3, 1, 1, 1, 1, 2, 2, 2, 2, 1, 2, 1,
+        1, 1, 1, 3, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 3, 1, 2, 1, 4, 2, 1, 1, 4, 1,
+        2, 3, 4, 1, 1, 1, 1, 2, 7, 1, 3, 1, 3, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1,
+        5, 2, 14, 1, 2, 1, 1, 1, 2, 1, 7, 1, 8, 1, 16, 2, 3, 2, 1, 2, 4, 1, 3,
+        1, 1, 3, 1, 2, 1, 1, 3, 1, 2, 5, 3, 2, 1, 1, 6, 1, 2, 1, 7, 2, 6, 1, 2,
+        2, 2, 3, 8, 1, 4, 5, 4, 2, 1, 2, 2, 1, 2, 1, 6, 1, 1, 1, 3, 1, 3, 3, 1,
+        2, 51, 1, 1, 1, 4, 1, 1, 1, 4, 1, 12, 2, 1, 1, 20, 2, 2, 1, 2, 1, 6, 1,
+        1, 1, 1, 3, 2, 1, 1, 1, 7, 3, 4, 1, 1, 1, 3, 2, 1, 1, 3, 1, 1, 3, 3, 1,
+        4, 2, 1, 2, 2, 1, 2, 2, 3, 1, 1, 1, 14, 2, 3, 1, 2, 1, 3, 1, 1, 2, 3,
+        3, 2, 1, 1, 1, 62, 4, 4, 1, 6, 1, 2, 1, 3, 3, 4, 2, 7, 1, 4, 1, 2, 3,
+        1, 1, 7, 3, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 10, 2, 2, 2, 5, 1, 2,
+        1, 3, 1, 1, 1, 3, 1, 8, 2, 2, 2, 5, 1, 14, 1, 2, 1, 4, 1, 6, 1, 6, 1,
+        1, 1, 1, 2, 1, 1, 7, 2, 6, 1, 1, 1, 2, 2, 3, 1, 2, 1, 1, 2, 3, 3, 60,
+        1, 4, 1, 2, 1, 7, 1, 3, 1, 3, 1, 3, 1, 10, 1, 1, 1, 1, 2, 3, 2, 2, 1,
+        1, 2, 2, 2, 2, 1, 3, 2, 1, 3, 1, 1, 2, 1, 2, 1, 3, 1, 10, 1, 17, 1, 1,
+        1, 4, 1, 2, 2, 1, 1, 1, 4, 3, 2, 1, 2, 8, 2, 4, 5, 7, 3, 1, 1, 2, 1, 3,
+        1, 1, 1, 20, 1, 2, 1, 1, 2, 13, 1, 10, 2, 1, 3, 2, 2, 7, 2, 7, 1, 1, 2,
+        1, 2, 2, 1, 2, 1, 4, 1, 1, 1, 4, 1, 5, 1, 2, 2, 4, 1, 1, 2, 1, 1, 1, 1,
+        4, 1, 5, 4, 3, 1, 7, 3, 2, 1, 10, 1, 3, 1, 1, 1, 1, 3, 1, 2, 2, 1, 1,
+        4, 5, 1, 5, 1, 2, 2, 7, 4, 1, 1, 6, 3, 2, 1, 7, 3, 9, 1, 4, 1, 2, 1, 5,
+        1, 6, 1, 14, 1, 1, 1, 108, 1, 1, 1, 1, 1, 1, 2, 3, 1, 2, 2, 1, 1, 12,
+        1, 2, 4, 4, 1, 3, 1, 2, 1, 5, 1, 3, 1, 3, 1, 2, 1, 1, 1, 1, 3, 14, 1,
+        2, 2, 1, 1, 2, 1, 1, 1, 1, 1, 7, 2, 7, 1, 2, 3, 1, 2, 2, 1, 6, 2, 2, 2,
+        1, 1, 7, 1, 12, 1, 1, 1, 5, 1, 10, 1, 9, 1, 4, 1, 1, 1, 3, 1, 2, 1, 1,
+        1, 3, 1, 1, 2, 5, 2, 1, 1, 1, 1, 8, 1, 3, 1, 5, 1, 12, 1, 6, 1, 1, 1,
+        2, 1, 5, 3, 2, 1, 27, 3, 2, 1, 86, 1, 2, 2, 3, 1, 1, 1, 1, 1, 6, 1, 2,
+        2, 4, 3, 1, 1, 1, 1, 5, 1, 1, 1, 5, 2, 2, 2, 2, 1, 10, 5, 1, 2, 4, 1,
+        7, 7, 1, 1, 3, 2, 1, 4, 1, 1, 4, 1, 2, 1, 6, 1, 4, 1, 1, 2, 1, 1, 1, 3,
+        9, 2, 5, 1, 4, 1, 1, 1, 10, 2, 10, 1, 14, 1, 2, 1, 11, 2, 2, 2, 2, 1,
+        1, 1, 10, 5, 2, 2, 2, 1, 1, 1, 5, 1, 3, 2, 21, 1, 7, 1, 6, 2, 2, 1,
+        22920, 1, 178, 1, 49, 32, 1235, 94, 129, 6,
     ]
 }
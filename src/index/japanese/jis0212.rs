@@ -1794,12 +1794,10 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
 ]; // 28 entries
 
 #[cfg(feature = "no-optimized-legacy-encoding")]
-const BACKWARD_SEARCH_UPPER: &'static [u16] = &[
-    0, 2, 3, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 5, 6, 7, 8, 10,
-    11, 12, 13, 14, 15, 16, 17, 18, 19, 21, 22, 23, 24, 25, 26, 27, 27, 27, 27,
-    27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
-    27, 28,
-]; // 65 entries
+const BACKWARD_SEARCH_UPPER: &'static [u32] = &[
+    103910464, 138546275, 138547332, 275977348, 518435178, 760859184,
+    935159575, 935194491, 935194491, 935194491, 30273403,
+]; // 65 entries, 6 5-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
@@ -1820,7 +1818,7 @@ pub fn backward(code: u32) -> u16 {
     let codelo = (code & 0xffff) as u16;
     let offset = (code >> 10) as usize;
     let (start, end) = if offset < 64 {
-        (BACKWARD_SEARCH_UPPER[offset], BACKWARD_SEARCH_UPPER[offset+1])
+        (((BACKWARD_SEARCH_UPPER[offset / 6] >> (offset % 6 * 5)) & 0x1f), ((BACKWARD_SEARCH_UPPER[(offset+1) / 6] >> ((offset+1) % 6 * 5)) & 0x1f))
     } else {
         (0, 0)
     };
@@ -1842,5 +1840,348 @@ pub fn backward(code: u32) -> u16 {
 
 #[cfg(test)]
 multi_byte_tests! {
-    dups = []
+    dups = [],
+    golden = [
+        0xaee2b89fb7807f1c, 0x3dccd4269c534a84, // forward & backward hash
+        // 6067 valid code points in 3969 runs
+        161, 1, 2, 1, 1, 1, 2, 2, 3, 2, 8, 1, 1, 1, 4, 17, 1, 6, 1, 31, 1, 28,
+        2, 13, 1, 8, 2, 32, 2, 47, 78, 16, 24, 1, 209, 1, 16, 4, 1, 1, 166, 3,
+        1, 3, 1, 1, 1, 3, 25, 7, 17, 1, 7, 5, 51, 11, 1, 2, 66, 11, 1, 2, 7350,
+        1, 11, 1, 11487, 1, 1, 2, 6, 1, 5, 1, 12, 1, 3, 2, 3, 1, 2, 1, 2, 3, 4,
+        1, 10, 2, 2, 1, 2, 1, 9, 1, 8, 1, 1, 1, 6, 1, 4, 2, 10, 2, 3, 1, 5, 1,
+        13, 1, 8, 2, 5, 1, 17, 1, 9, 1, 9, 1, 12, 1, 9, 2, 4, 3, 5, 1, 6, 1, 1,
+        1, 1, 1, 1, 1, 7, 4, 1, 2, 4, 1, 2, 2, 5, 1, 2, 3, 1, 1, 20, 1, 2, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 5, 2, 1, 2, 5, 1, 1, 1,
+        1, 1, 1, 1, 6, 2, 2, 1, 6, 1, 1, 1, 1, 1, 2, 1, 5, 4, 2, 2, 2, 2, 1, 2,
+        3, 2, 1, 1, 1, 1, 1, 1, 1, 3, 2, 1, 1, 2, 3, 2, 18, 1, 4, 1, 1, 1, 1,
+        4, 1, 2, 3, 2, 1, 2, 1, 3, 1, 1, 2, 1, 9, 1, 3, 1, 1, 1, 13, 1, 1, 1,
+        9, 2, 1, 3, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 3, 2, 2, 4, 3, 1,
+        4, 1, 6, 1, 1, 1, 1, 2, 1, 1, 5, 1, 4, 3, 2, 2, 3, 1, 1, 1, 1, 1, 2, 3,
+        3, 1, 1, 1, 5, 2, 1, 2, 2, 2, 2, 1, 2, 1, 2, 2, 15, 1, 1, 2, 1, 1, 3,
+        1, 3, 3, 1, 3, 1, 1, 4, 2, 1, 5, 7, 1, 4, 2, 8, 2, 2, 1, 2, 1, 2, 2, 2,
+        1, 4, 1, 1, 1, 1, 1, 2, 2, 3, 1, 3, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 5,
+        1, 1, 2, 3, 1, 3, 1, 3, 1, 4, 1, 2, 3, 2, 4, 1, 1, 6, 1, 1, 1, 1, 4, 4,
+        1, 3, 2, 3, 2, 1, 1, 1, 1, 1, 3, 2, 2, 8, 1, 7, 1, 4, 1, 3, 1, 1, 1, 1,
+        2, 6, 1, 4, 1, 1, 1, 23, 1, 4, 2, 6, 1, 2, 1, 9, 1, 4, 1, 3, 1, 1, 1,
+        9, 1, 10, 1, 1, 1, 1, 1, 1, 2, 2, 1, 5, 1, 6, 1, 1, 3, 1, 1, 2, 1, 5,
+        1, 3, 1, 2, 1, 8, 1, 3, 3, 2, 1, 9, 2, 2, 1, 12, 2, 1, 2, 1, 1, 9, 1,
+        5, 1, 8, 2, 2, 1, 6, 1, 8, 1, 3, 1, 11, 1, 1, 2, 1, 1, 1, 1, 2, 3, 4,
+        1, 7, 1, 8, 3, 6, 1, 1, 1, 2, 1, 4, 1, 1, 1, 6, 1, 1, 4, 1, 1, 1, 1, 7,
+        4, 7, 2, 5, 3, 1, 2, 1, 1, 2, 1, 3, 1, 1, 1, 1, 1, 3, 1, 2, 1, 1, 1, 2,
+        1, 1, 1, 4, 2, 4, 1, 3, 1, 2, 3, 1, 1, 3, 2, 2, 1, 1, 2, 8, 1, 2, 1, 6,
+        3, 4, 1, 1, 1, 4, 1, 2, 2, 1, 2, 5, 1, 1, 3, 1, 3, 2, 1, 1, 1, 2, 1, 6,
+        3, 3, 1, 8, 2, 12, 1, 1, 1, 5, 1, 1, 1, 1, 1, 6, 2, 4, 1, 6, 1, 4, 1,
+        4, 1, 3, 2, 5, 1, 4, 2, 4, 1, 3, 1, 3, 1, 2, 1, 5, 2, 3, 1, 2, 1, 1, 2,
+        1, 2, 1, 1, 2, 1, 2, 1, 4, 1, 9, 1, 2, 2, 1, 1, 4, 1, 2, 2, 1, 1, 5, 2,
+        13, 1, 12, 1, 16, 1, 6, 1, 6, 1, 5, 2, 1, 1, 4, 1, 1, 1, 2, 2, 13, 2,
+        2, 1, 5, 1, 1, 1, 14, 1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 5, 1, 10,
+        1, 1, 1, 1, 1, 1, 1, 2, 2, 3, 1, 3, 1, 3, 2, 5, 1, 2, 1, 1, 1, 4, 2, 1,
+        2, 2, 2, 2, 1, 5, 1, 1, 3, 3, 1, 6, 1, 3, 1, 2, 2, 17, 1, 9, 1, 1, 1,
+        2, 1, 6, 1, 5, 1, 1, 4, 3, 1, 2, 2, 2, 3, 6, 1, 20, 2, 6, 1, 2, 2, 4,
+        3, 3, 1, 5, 1, 1, 2, 2, 1, 2, 2, 6, 1, 1, 2, 2, 1, 1, 2, 2, 1, 1, 1,
+        24, 1, 1, 2, 3, 1, 1, 1, 5, 2, 1, 4, 2, 1, 11, 2, 8, 1, 4, 1, 12, 1, 1,
+        1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 2, 3, 3, 2, 2, 1, 2, 1, 3, 1, 6, 1,
+        12, 1, 8, 1, 5, 1, 2, 1, 1, 1, 2, 6, 6, 1, 18, 1, 3, 1, 2, 1, 1, 1, 1,
+        1, 1, 1, 1, 3, 1, 3, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 4, 1, 9, 1, 1,
+        4, 2, 1, 2, 1, 3, 1, 1, 1, 1, 2, 2, 1, 14, 2, 2, 1, 2, 2, 8, 1, 3, 2,
+        2, 3, 6, 4, 1, 3, 3, 1, 1, 1, 3, 1, 6, 1, 6, 1, 3, 5, 1, 2, 8, 1, 2, 2,
+        1, 1, 1, 1, 2, 5, 2, 1, 1, 1, 3, 1, 4, 2, 9, 2, 4, 1, 2, 1, 1, 1, 4, 1,
+        3, 1, 4, 2, 1, 1, 2, 1, 1, 4, 3, 2, 1, 1, 1, 2, 3, 2, 8, 3, 5, 2, 5, 2,
+        4, 1, 15, 1, 2, 1, 1, 2, 2, 1, 1, 5, 1, 3, 1, 1, 1, 4, 1, 1, 2, 1, 1,
+        1, 8, 1, 7, 2, 1, 1, 1, 2, 1, 4, 1, 1, 5, 3, 2, 1, 11, 1, 4, 1, 9, 2,
+        3, 1, 2, 1, 5, 1, 7, 2, 2, 1, 2, 1, 1, 2, 1, 1, 3, 1, 2, 1, 4, 2, 1, 1,
+        4, 3, 3, 2, 3, 2, 2, 2, 13, 1, 2, 3, 5, 2, 5, 1, 4, 1, 6, 1, 5, 1, 9,
+        1, 2, 2, 1, 2, 4, 1, 9, 1, 1, 1, 2, 1, 2, 2, 15, 1, 3, 1, 2, 3, 5, 4,
+        1, 2, 1, 2, 3, 1, 1, 1, 6, 1, 2, 3, 3, 1, 2, 1, 7, 2, 9, 1, 5, 1, 1, 1,
+        3, 1, 4, 2, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1, 3, 2, 6, 1, 9, 1, 17,
+        2, 4, 2, 5, 3, 8, 1, 3, 1, 1, 2, 3, 1, 6, 2, 2, 1, 1, 2, 8, 1, 3, 1, 2,
+        1, 11, 2, 5, 1, 1, 1, 1, 3, 1, 1, 1, 1, 7, 1, 1, 1, 1, 1, 2, 1, 2, 2,
+        2, 1, 1, 2, 14, 2, 1, 1, 3, 1, 2, 1, 1, 1, 7, 1, 4, 1, 2, 1, 5, 4, 2,
+        1, 3, 1, 2, 1, 1, 1, 4, 1, 1, 2, 3, 1, 1, 1, 2, 1, 4, 1, 10, 3, 3, 2,
+        2, 1, 6, 2, 1, 2, 1, 1, 2, 1, 8, 1, 3, 1, 7, 3, 3, 2, 10, 1, 4, 2, 2,
+        2, 1, 1, 2, 1, 2, 1, 19, 2, 1, 2, 3, 1, 3, 1, 4, 1, 8, 1, 4, 1, 1, 1,
+        1, 1, 5, 1, 9, 1, 2, 2, 2, 1, 12, 1, 4, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1,
+        3, 1, 1, 4, 1, 4, 1, 4, 3, 1, 1, 2, 1, 1, 2, 3, 1, 4, 1, 1, 1, 1, 1, 6,
+        1, 10, 1, 1, 1, 3, 1, 4, 1, 4, 1, 3, 1, 6, 2, 6, 1, 2, 2, 6, 1, 14, 1,
+        1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 7, 1, 6, 1, 3, 1, 8, 1, 9, 2, 5, 1, 3, 1,
+        7, 1, 9, 1, 5, 2, 12, 4, 1, 1, 2, 1, 1, 1, 3, 1, 3, 1, 1, 2, 1, 2, 1,
+        1, 17, 2, 2, 2, 1, 1, 1, 2, 4, 1, 2, 1, 1, 1, 3, 2, 11, 1, 1, 1, 6, 5,
+        5, 1, 14, 1, 1, 1, 2, 1, 8, 1, 14, 1, 10, 1, 6, 2, 3, 1, 2, 1, 2, 1, 1,
+        2, 1, 1, 1, 1, 1, 1, 2, 2, 34, 2, 1, 1, 5, 2, 3, 3, 3, 1, 2, 1, 3, 2,
+        4, 4, 9, 2, 1, 1, 4, 1, 2, 1, 10, 1, 1, 2, 1, 2, 2, 1, 3, 1, 7, 1, 1,
+        2, 4, 1, 14, 1, 1, 1, 6, 1, 4, 1, 5, 1, 16, 1, 2, 2, 1, 1, 12, 1, 4, 1,
+        6, 1, 4, 1, 16, 2, 1, 2, 3, 1, 5, 1, 2, 1, 4, 1, 3, 1, 1, 1, 2, 2, 2,
+        1, 1, 1, 1, 1, 6, 1, 3, 1, 3, 1, 5, 4, 1, 1, 5, 1, 2, 1, 2, 1, 8, 2, 3,
+        2, 1, 1, 1, 1, 4, 1, 1, 1, 7, 4, 3, 1, 1, 1, 3, 2, 6, 1, 3, 1, 4, 1, 1,
+        1, 1, 1, 3, 2, 9, 1, 3, 1, 3, 1, 2, 1, 1, 1, 7, 2, 6, 1, 3, 1, 4, 1,
+        14, 2, 6, 1, 6, 1, 5, 1, 4, 1, 1, 2, 2, 1, 6, 2, 7, 1, 5, 1, 3, 1, 2,
+        1, 8, 1, 10, 1, 1, 1, 4, 2, 4, 1, 1, 1, 2, 2, 1, 1, 9, 1, 1, 5, 1, 1,
+        15, 1, 10, 1, 2, 1, 19, 1, 1, 2, 2, 1, 1, 1, 1, 1, 4, 1, 1, 1, 9, 3, 6,
+        1, 4, 2, 1, 1, 2, 2, 1, 2, 6, 1, 1, 1, 6, 1, 5, 1, 22, 1, 3, 3, 5, 1,
+        10, 1, 2, 2, 3, 4, 3, 1, 2, 2, 1, 1, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 1,
+        2, 3, 2, 1, 1, 5, 1, 2, 1, 3, 1, 3, 1, 2, 1, 4, 1, 2, 2, 2, 1, 7, 1, 2,
+        1, 1, 2, 2, 1, 1, 1, 2, 2, 10, 1, 3, 1, 1, 1, 6, 1, 5, 2, 4, 1, 1, 1,
+        2, 1, 3, 2, 2, 3, 6, 1, 11, 1, 2, 3, 1, 1, 4, 5, 9, 1, 2, 2, 5, 3, 1,
+        4, 2, 2, 2, 1, 3, 1, 1, 1, 10, 1, 2, 1, 2, 1, 5, 2, 2, 2, 1, 1, 4, 1,
+        4, 1, 8, 1, 5, 1, 1, 1, 10, 1, 6, 3, 2, 1, 4, 1, 2, 1, 1, 2, 5, 1, 3,
+        1, 5, 1, 9, 1, 12, 2, 2, 1, 3, 1, 1, 1, 1, 1, 3, 1, 2, 1, 1, 1, 1, 1,
+        2, 1, 4, 2, 3, 1, 1, 2, 2, 1, 7, 2, 5, 1, 3, 1, 2, 1, 3, 1, 1, 1, 3, 4,
+        2, 2, 4, 2, 3, 1, 1, 1, 1, 2, 3, 1, 2, 1, 12, 1, 2, 1, 2, 1, 3, 2, 4,
+        1, 4, 1, 2, 1, 1, 1, 3, 5, 1, 2, 1, 1, 2, 1, 1, 1, 3, 1, 7, 2, 4, 2, 3,
+        3, 1, 1, 7, 1, 3, 2, 2, 1, 20, 1, 1, 1, 11, 1, 5, 1, 5, 1, 2, 2, 2, 3,
+        1, 2, 6, 1, 1, 1, 4, 2, 3, 2, 3, 2, 1, 2, 4, 1, 2, 1, 1, 1, 2, 1, 10,
+        2, 2, 1, 3, 3, 11, 2, 5, 1, 6, 4, 1, 2, 2, 1, 1, 1, 1, 1, 2, 2, 1, 1,
+        17, 1, 1, 2, 2, 1, 11, 1, 1, 1, 6, 1, 3, 1, 1, 2, 3, 1, 1, 1, 1, 1, 13,
+        1, 3, 1, 4, 3, 1, 1, 5, 1, 3, 3, 1, 1, 1, 1, 3, 1, 1, 1, 7, 1, 8, 1, 1,
+        1, 3, 1, 6, 1, 2, 1, 15, 4, 21, 1, 1, 1, 10, 1, 2, 2, 2, 1, 3, 2, 4, 1,
+        9, 1, 6, 2, 3, 1, 15, 1, 7, 1, 1, 1, 7, 2, 5, 2, 5, 2, 1, 1, 2, 1, 2,
+        1, 2, 1, 1, 1, 16, 2, 2, 1, 7, 2, 2, 1, 2, 1, 4, 4, 1, 1, 3, 2, 2, 1,
+        3, 3, 3, 1, 2, 1, 9, 2, 5, 2, 3, 1, 2, 2, 2, 1, 3, 2, 1, 1, 2, 1, 1, 1,
+        2, 1, 2, 1, 5, 1, 3, 2, 3, 2, 3, 1, 5, 1, 1, 1, 6, 3, 13, 1, 3, 1, 3,
+        1, 2, 1, 5, 1, 2, 1, 1, 3, 6, 1, 3, 1, 4, 1, 4, 1, 1, 1, 5, 2, 1, 1, 2,
+        2, 15, 2, 5, 1, 1, 1, 1, 1, 3, 1, 5, 1, 1, 1, 1, 1, 1, 2, 3, 2, 4, 2,
+        4, 1, 7, 1, 1, 1, 11, 1, 3, 1, 1, 4, 5, 4, 1, 3, 1, 1, 9, 1, 5, 2, 6,
+        1, 1, 1, 7, 1, 1, 1, 7, 3, 6, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1,
+        1, 3, 1, 6, 1, 9, 3, 4, 1, 4, 4, 1, 1, 1, 2, 3, 1, 1, 1, 12, 2, 3, 2,
+        2, 1, 2, 1, 4, 1, 1, 1, 3, 1, 3, 1, 1, 1, 2, 1, 3, 3, 4, 1, 3, 2, 1, 1,
+        2, 1, 1, 1, 2, 2, 2, 1, 3, 1, 2, 1, 4, 1, 2, 1, 8, 1, 1, 2, 5, 1, 3, 1,
+        1, 1, 6, 1, 1, 1, 1, 1, 10, 2, 6, 1, 3, 1, 14, 1, 2, 1, 3, 1, 3, 1, 4,
+        1, 7, 1, 2, 1, 2, 1, 4, 1, 2, 1, 2, 1, 2, 1, 7, 1, 3, 3, 10, 1, 2, 1,
+        5, 2, 4, 1, 1, 1, 3, 1, 1, 1, 1, 1, 6, 1, 16, 1, 1, 1, 1, 2, 3, 1, 4,
+        3, 3, 1, 3, 2, 3, 1, 3, 2, 2, 2, 6, 2, 2, 4, 1, 1, 2, 4, 1, 1, 1, 2, 1,
+        1, 3, 1, 1, 1, 6, 1, 4, 2, 3, 1, 1, 1, 1, 1, 2, 1, 5, 3, 1, 2, 3, 2, 8,
+        3, 6, 1, 1, 1, 1, 3, 1, 2, 1, 3, 10, 3, 2, 1, 1, 1, 6, 4, 2, 2, 3, 1,
+        8, 1, 3, 2, 2, 1, 5, 1, 3, 2, 1, 2, 4, 1, 3, 1, 1, 2, 4, 1, 6, 1, 3, 1,
+        8, 1, 2, 2, 1, 1, 11, 2, 9, 1, 1, 1, 6, 1, 4, 1, 5, 1, 2, 1, 3, 1, 1,
+        1, 16, 1, 10, 1, 6, 1, 1, 2, 3, 1, 7, 2, 7, 1, 8, 1, 5, 1, 1, 1, 5, 1,
+        1, 1, 4, 1, 5, 1, 2, 1, 9, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 20, 3, 2,
+        1, 5, 3, 2, 1, 1, 2, 1, 1, 2, 2, 8, 1, 4, 1, 1, 1, 2, 1, 4, 1, 4, 1, 9,
+        1, 1, 1, 3, 2, 1, 1, 26, 1, 4, 1, 3, 1, 1, 1, 7, 2, 3, 2, 1, 3, 1, 1,
+        7, 1, 3, 1, 4, 2, 4, 1, 1, 1, 5, 1, 2, 1, 1, 2, 2, 1, 15, 1, 2, 5, 2,
+        1, 3, 4, 5, 1, 1, 1, 1, 1, 1, 1, 13, 1, 1, 1, 1, 1, 1, 1, 4, 1, 1, 1,
+        1, 1, 3, 2, 3, 1, 3, 1, 8, 1, 9, 1, 2, 1, 3, 1, 2, 3, 1, 1, 2, 1, 2, 1,
+        2, 2, 7, 1, 2, 1, 1, 4, 2, 2, 3, 2, 4, 3, 8, 1, 2, 2, 5, 2, 1, 1, 2, 2,
+        25, 1, 1, 1, 1, 1, 2, 1, 2, 1, 6, 1, 2, 1, 3, 1, 4, 1, 8, 1, 3, 1, 7,
+        4, 1, 2, 2, 1, 3, 3, 7, 2, 3, 2, 12, 1, 4, 1, 3, 1, 1, 1, 8, 1, 3, 2,
+        1, 1, 2, 1, 1, 1, 1, 1, 7, 2, 1, 1, 1, 1, 8, 1, 2, 1, 8, 1, 4, 2, 10,
+        1, 2, 1, 8, 2, 1, 1, 1, 1, 1, 1, 8, 1, 1, 2, 1, 1, 11, 1, 1, 1, 3, 1,
+        4, 1, 2, 1, 2, 1, 3, 1, 3, 1, 7, 1, 1, 1, 1, 1, 2, 1, 3, 1, 2, 2, 5, 2,
+        2, 2, 3, 1, 1, 3, 2, 2, 4, 1, 8, 1, 2, 1, 2, 1, 6, 1, 1, 1, 10, 1, 2,
+        1, 1, 1, 2, 2, 1, 1, 1, 1, 5, 1, 9, 1, 1, 3, 5, 1, 5, 1, 3, 3, 2, 1, 8,
+        3, 6, 1, 1, 2, 2, 1, 3, 1, 3, 3, 5, 2, 6, 1, 2, 1, 4, 1, 3, 3, 9, 2, 4,
+        2, 2, 2, 1, 1, 5, 3, 5, 1, 3, 1, 2, 1, 5, 1, 3, 1, 2, 2, 2, 1, 5, 2, 4,
+        1, 3, 1, 6, 1, 3, 1, 2, 1, 4, 1, 3, 1, 1, 1, 4, 1, 2, 1, 6, 1, 3, 1, 2,
+        1, 1, 1, 4, 1, 7, 2, 3, 1, 2, 1, 17, 1, 3, 1, 3, 2, 1, 2, 4, 2, 2, 3,
+        1, 1, 7, 2, 3, 2, 4, 2, 4, 1, 2, 1, 9, 1, 3, 1, 6, 1, 1, 1, 2, 2, 6, 1,
+        2, 1, 5, 1, 1, 1, 5, 1, 2, 1, 1, 2, 3, 1, 3, 2, 1, 1, 1, 1, 6, 1, 5, 1,
+        6, 3, 3, 1, 1, 1, 4, 1, 1, 2, 3, 2, 3, 1, 10, 2, 1, 1, 1, 1, 2, 1, 1,
+        1, 4, 1, 1, 2, 10, 1, 3, 1, 1, 1, 1, 1, 4, 1, 1, 1, 1, 2, 1, 1, 9, 3,
+        1, 1, 10, 2, 1, 2, 3, 1, 2, 1, 16, 1, 1, 1, 1, 1, 13, 1, 3, 1, 6, 1, 1,
+        4, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 6, 1, 1, 1, 1, 2, 1, 1, 3, 1, 1, 1,
+        15, 1, 2, 1, 2, 1, 3, 2, 1, 1, 1, 1, 6, 1, 11, 3, 5, 2, 1, 1, 7, 1, 2,
+        1, 2, 1, 23, 1, 6, 2, 1, 1, 3, 1, 1, 1, 7, 2, 11, 1, 5, 1, 4, 1, 9, 2,
+        1, 1, 1, 3, 17, 1, 1, 1, 7, 1, 2, 1, 1, 1, 3, 1, 1, 1, 4, 1, 3, 1, 1,
+        1, 3, 2, 6, 1, 4, 1, 1, 1, 1, 2, 1, 1, 2, 1, 3, 1, 5, 2, 3, 1, 1, 1, 5,
+        1, 3, 1, 3, 1, 25, 1, 3, 1, 4, 1, 10, 1, 3, 1, 2, 1, 1, 2, 7, 2, 2, 2,
+        1, 1, 3, 1, 1, 4, 2, 1, 4, 3, 3, 2, 4, 1, 10, 1, 7, 1, 1, 1, 15, 1, 5,
+        1, 5, 1, 6, 1, 6, 1, 5, 2, 2, 1, 1, 1, 7, 1, 3, 3, 1, 1, 3, 2, 1, 1, 2,
+        3, 27, 1, 1, 2, 10, 1, 1, 1, 1, 1, 6, 1, 3, 1, 1, 1, 1, 2, 8, 1, 1, 1,
+        1, 2, 10, 1, 2, 2, 2, 1, 1, 2, 2, 1, 2, 1, 4, 2, 18, 1, 1, 3, 3, 1, 1,
+        2, 2, 2, 2, 2, 5, 1, 3, 1, 16, 2, 4, 1, 3, 2, 2, 3, 2, 1, 1, 3, 1, 1,
+        3, 1, 4, 2, 4, 4, 5, 3, 4, 2, 5, 1, 8, 1, 1, 2, 1, 1, 15, 1, 3, 1, 9,
+        2, 6, 1, 4, 1, 3, 1, 2, 2, 2, 1, 4, 3, 5, 1, 9, 1, 8, 1, 2, 1, 11, 1,
+        4, 1, 2, 1, 1, 1, 2, 1, 6, 2, 3, 4, 2, 1, 5, 2, 7, 2, 5, 2, 6, 1, 1, 1,
+        6, 2, 7, 1, 2, 1, 3, 2, 13, 5, 2, 1, 8, 1, 6, 1, 4, 2, 2, 1, 2, 1, 18,
+        1, 6, 1, 1, 4, 1, 1, 3, 1, 7, 1, 21, 1, 8, 5, 3, 2, 2, 1, 14, 1, 1, 1,
+        10, 1, 1, 1, 1, 3, 6, 1, 8, 1, 3, 3, 2, 2, 4, 1, 1, 1, 4, 1, 2, 1, 1,
+        1, 1, 1, 1, 1, 7, 1, 16, 1, 6, 1, 4, 1, 1, 1, 4, 1, 5, 1, 7, 2, 4, 1,
+        1, 1, 12, 2, 1, 2, 6, 1, 4, 3, 2, 1, 6, 2, 6, 1, 2, 1, 2, 2, 1, 1, 27,
+        1, 5, 1, 1, 1, 6, 3, 9, 1, 3, 1, 2, 1, 2, 1, 1, 1, 4, 1, 6, 1, 3, 1, 4,
+        1, 3, 2, 7, 3, 1, 1, 8, 3, 2, 1, 1, 2, 3, 1, 1, 1, 1, 1, 1, 1, 2, 1, 4,
+        1, 2, 1, 2, 2, 1, 1, 5, 2, 2, 2, 2, 1, 4, 1, 4, 1, 3, 2, 4, 1, 7, 1,
+        12, 1, 4, 2, 2, 1, 2, 1, 9, 1, 2, 1, 5, 1, 1, 1, 2, 1, 8, 2, 1, 1, 6,
+        1, 5, 1, 13, 2, 5, 2, 2, 1, 3, 1, 1, 2, 1, 1, 3, 1, 1, 1, 4, 2, 4, 2,
+        4, 1, 3, 1, 1, 1, 2, 2, 3, 1, 4, 2, 2, 1, 4, 2, 1, 1, 5, 1, 9, 1, 2, 1,
+        1, 1, 3, 1, 1, 1, 4, 4, 5, 2, 1, 1, 1, 2, 1, 2, 1, 1, 5, 1, 1, 1, 2, 1,
+        3, 2, 1, 1, 1, 2, 7, 1, 1, 1, 2, 1, 1, 1, 1, 2, 3, 1, 1, 3, 1, 1, 2, 2,
+        3, 2, 1, 1, 7, 1, 1, 1, 1, 1, 2, 2, 1, 1, 5, 2, 2, 1, 1, 2, 2, 1, 2, 2,
+        2, 1, 2, 1, 3, 1, 3, 1, 1, 1, 2, 2, 1, 1, 10, 2, 1, 1, 1, 3, 1, 1, 1,
+        3, 2, 1, 2, 1, 2, 1, 6, 1, 8, 2, 8, 1, 1, 1, 1, 10, 7, 1, 6, 1, 2, 2,
+        1, 2, 3, 1, 1, 1, 3, 2, 4, 1, 5, 1, 4, 1, 3, 3, 2, 1, 1, 2, 2, 2, 13,
+        2, 3, 3, 1, 1, 5, 4, 5, 3, 1, 1, 2, 3, 1, 1, 2, 1, 1, 4, 2, 2, 1, 2, 2,
+        1, 3, 1, 1, 1, 3, 1, 8, 2, 2, 1, 3, 1, 2, 1, 4, 1, 1, 2, 2, 2, 4, 1, 3,
+        1, 1, 2, 3, 1, 4, 1, 5, 3, 2, 1, 6, 1, 11, 1, 3, 2, 8, 2, 2, 1, 2, 1,
+        1, 2, 4, 1, 6, 1, 2, 1, 3, 4, 2, 1, 3, 2, 5, 1, 1, 1, 1, 1, 4, 1, 6, 2,
+        1, 1, 13, 1, 1, 1, 7, 6, 2, 1, 3, 1, 10, 1, 1, 2, 1, 1, 3, 1, 2, 1, 5,
+        1, 1, 1, 15, 1, 5, 1, 4, 3, 2, 1, 1, 1, 5, 1, 1, 2, 7, 1, 4, 1, 2, 3,
+        2, 1, 2, 1, 4, 1, 1, 2, 1, 1, 7, 1, 6, 1, 1, 3, 2, 2, 1, 1, 1, 1, 2, 1,
+        2, 2, 1, 2, 2, 1, 1, 4, 4, 1, 1, 2, 2, 1, 3, 1, 4, 2, 1, 1, 2, 3, 1, 1,
+        3, 2, 1, 3, 3, 3, 9, 1, 3, 1, 5, 1, 4, 2, 7, 3, 1, 1, 2, 1, 12, 1, 3,
+        1, 6, 2, 7, 1, 5, 3, 1, 2, 1, 7, 1, 1, 2, 1, 15, 1, 3, 1, 3, 1, 3, 1,
+        1, 2, 1, 1, 5, 1, 4, 1, 6, 1, 5, 1, 1, 1, 3, 1, 3, 2, 4, 1, 2, 1, 2, 1,
+        3, 1, 5, 1, 3, 1, 3, 1, 3, 1, 1, 2, 1, 1, 1, 2, 1, 1, 5, 1, 5, 1, 4, 3,
+        4, 3, 2, 1, 3, 2, 3, 1, 2, 2, 3, 1, 2, 3, 2, 1, 3, 2, 4, 1, 1, 3, 1, 1,
+        1, 1, 2, 1, 2, 1, 1, 1, 3, 1, 1, 3, 5, 1, 2, 1, 2, 1, 3, 1, 7, 2, 6, 3,
+        3, 1, 4, 1, 2, 1, 4, 1, 2, 1, 3, 2, 1, 1, 3, 1, 8, 1, 4, 1, 5, 1, 7, 2,
+        2, 1, 3, 1, 4, 3, 3, 1, 1, 1, 3, 1, 1, 1, 3, 2, 2, 1, 3, 1, 2, 1, 9, 2,
+        2, 1, 3, 2, 2, 1, 11, 1, 3, 3, 9, 2, 1, 1, 4, 1, 1, 1, 11, 2, 2, 2, 3,
+        1, 1, 1, 3, 1, 9, 1, 1, 1, 1, 2, 1, 2, 3, 1, 1, 1, 3, 1, 11, 1, 3, 1,
+        11, 1, 4, 1, 4, 1, 3, 1, 4, 3, 1, 1, 2, 1, 3, 1, 3, 2, 2, 4, 7, 1, 1,
+        1, 1, 1, 7, 3, 2, 1, 1, 1, 3, 2, 1, 2, 4, 1, 3, 3, 2, 1, 1, 1, 3, 1, 7,
+        2, 2, 2, 2, 2, 3, 2, 5, 1, 5, 1, 3, 1, 9, 1, 1, 1, 1, 3, 4, 1, 1, 1, 1,
+        1, 3, 1, 3, 1, 2, 2, 5, 1, 1, 1, 1, 1, 4, 3, 3, 2, 3, 1, 1, 1, 2, 1, 3,
+        1, 2, 2, 10, 1, 1, 1, 1, 1, 6, 1, 6, 1, 1, 2, 1, 1, 12, 2, 4, 1, 1, 4,
+        1, 1, 2, 2, 4, 1, 6, 2, 1, 1, 3, 1, 1, 1, 2, 1, 3, 1, 2, 1, 6, 1, 1, 1,
+        2, 2, 1, 1, 4, 1, 4, 1, 1, 1, 3, 1, 2, 2, 1, 1, 1, 1, 2, 1, 4, 2, 1, 1,
+        3, 1, 6, 1, 3, 1, 5, 2, 3, 1, 1, 2, 1, 1, 4, 1, 3, 1, 5, 1, 2, 1, 2, 1,
+        5, 1, 3, 1, 1, 1, 1, 2, 3, 2, 2, 3, 9, 2, 1, 2, 3, 1, 8, 2, 2, 1, 2, 2,
+        1, 2, 4, 1, 1, 1, 2, 1, 2, 1, 7, 1, 2, 1, 5, 1, 1, 1, 1, 1, 2, 2, 3, 2,
+        4, 2, 2, 1, 9, 1, 1, 1, 2, 1, 8, 1, 6, 1, 1, 1, 3, 1, 1, 2, 9, 1, 2, 1,
+        2, 1, 1, 1, 2, 1, 9, 1, 12, 2, 1, 2, 4, 1, 2, 1, 6, 1, 1, 2, 8, 1, 12,
+        1, 10, 1, 3, 1, 3, 1, 1, 3, 1, 5, 2, 1, 8, 1, 1, 3, 5, 1, 6, 1, 6, 1,
+        10, 1, 3, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 3, 1, 12, 1, 4, 1, 4, 1, 1,
+        2, 4, 1, 4, 1, 2, 1, 1, 1, 4, 1, 6, 1, 2, 2, 1, 1, 2, 2, 3, 4, 4, 1, 2,
+        1, 2, 1, 1, 1, 9, 1, 1, 2, 1, 3, 12, 1, 1, 1, 7, 1, 1, 2, 2, 3, 1, 1,
+        1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 1, 2, 9, 1, 1, 1, 4, 1, 4, 2, 1, 1, 3, 1,
+        4, 1, 1, 2, 1, 1, 2, 2, 11, 1, 3, 1, 6, 3, 1, 1, 3, 6, 2, 1, 1, 1, 3,
+        1, 1, 1, 3, 2, 1, 1, 1, 1, 6, 1, 2, 2, 8, 2, 7, 1, 4, 1, 9, 1, 1, 1, 5,
+        1, 9, 1, 5, 2, 2, 3, 2, 1, 4, 1, 2, 3, 3, 1, 1, 1, 3, 3, 1, 1, 1, 2, 2,
+        1, 8, 1, 2, 1, 1, 1, 9, 1, 13, 1, 3, 3, 5, 1, 1, 3, 2, 1, 6, 2, 4, 1,
+        2, 1, 3, 1, 2, 1, 3, 1, 10, 3, 1, 2, 5, 2, 4, 1, 3, 1, 1, 1, 3, 1, 1,
+        2, 1, 2, 7, 1, 1, 1, 2, 1, 5, 1, 7, 1, 1, 2, 3, 1, 1, 3, 1, 2, 1, 1, 2,
+        3, 3, 1, 4, 2, 5, 2, 7, 2, 2, 1, 8, 1, 2, 2, 1, 1, 8, 5, 5, 3, 8, 1, 1,
+        1, 8, 1, 2, 2, 3, 2, 1, 1, 3, 1, 3, 2, 2, 2, 5, 1, 7, 1, 7, 2, 3, 1, 1,
+        1, 4, 2, 2, 1, 6, 2, 3, 2, 1, 1, 3, 1, 2, 1, 8, 1, 4, 2, 1, 1, 6, 1, 1,
+        1, 1, 1, 5, 1, 6, 1, 1, 2, 2, 1, 5, 1, 2, 2, 3, 1, 4, 1, 5, 1, 2, 1, 4,
+        2, 2, 1, 2, 1, 3, 1, 3, 1, 2, 1, 1, 1, 2, 2, 156, 5, 3, 2, 2, 1, 7, 1,
+        2, 2, 7, 3, 3, 1, 1, 4, 6, 1, 3, 1, 11, 4, 10, 1, 1, 1, 1, 3, 4, 2, 4,
+        1, 4, 2, 3, 1, 3, 1, 2, 1, 6, 1, 7, 1, 2, 2, 2, 1, 4, 1, 5, 2, 11, 1,
+        3, 1, 3, 1, 1, 1, 2, 1, 3, 1, 1, 2, 2, 1, 7, 1, 2, 3, 7, 2, 1, 1, 2, 3,
+        1, 1, 1, 2, 1, 1, 6, 4, 3, 1, 1, 1, 5, 1, 1, 1, 1, 1, 3, 2, 1, 1, 1, 2,
+        1, 1, 1, 1, 1, 1, 3, 1, 27, 1, 3, 1, 1, 1, 6, 1, 3, 1, 3, 1, 11, 1, 6,
+        1, 5, 1, 13, 1, 1, 1, 7, 2, 3, 1, 12, 2, 14, 1, 4, 1, 1, 1, 2, 1, 1, 2,
+        1, 2, 7, 1, 12, 2, 1, 1, 1, 2, 2, 1, 2, 2, 3, 1, 4, 1, 7, 1, 10, 3, 3,
+        1, 1, 1, 1, 1, 3, 1, 2, 1, 4, 1, 3, 1, 4, 1, 4, 1, 1, 1, 8, 1, 1, 1, 2,
+        1, 1, 1, 5, 1, 4, 1, 8, 2, 5, 3, 3, 1, 1, 1, 7, 1, 9, 1, 2, 3, 4, 1, 2,
+        1, 1, 1, 5, 1, 1, 1, 2, 1, 2, 1, 3, 1, 11, 1, 3, 1, 1, 1, 6, 1, 7, 1,
+        1, 1, 4, 2, 2, 2, 5, 1, 1, 1, 3, 1, 1, 2, 2, 1, 2, 1, 6, 2, 3, 3, 2, 2,
+        1, 2, 3, 1, 1, 2, 2, 1, 11, 1, 3, 2, 4, 2, 2, 1, 3, 2, 5, 1, 9, 1, 1,
+        1, 5, 1, 8, 4, 4, 1, 2, 2, 1, 1, 4, 1, 5, 1, 3, 1, 2, 1, 3, 1, 5, 1, 6,
+        1, 6, 1, 1, 1, 1, 3, 1, 2, 2, 1, 1, 2, 3, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1,
+        2, 4, 2, 1, 2, 2, 4, 3, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 6,
+        1, 9, 1, 4, 1, 4, 1, 5, 1, 1, 1, 1, 1, 3, 1, 1, 1, 2, 1, 1, 1, 6, 2, 5,
+        2, 1, 2, 5, 2, 1, 2, 15, 1, 1, 3, 1, 2, 9, 3, 1, 1, 2, 1, 3, 1, 2, 1,
+        1, 2, 4, 3, 2, 1, 5, 2, 2, 1, 1, 5, 24, 1, 7, 1, 4, 1, 1, 2, 1, 1, 1,
+        1, 1, 1, 6, 1, 4, 1, 1, 2, 2, 2, 1, 3, 8, 2, 1, 1, 2, 2, 16, 3, 6, 1,
+        1, 1, 5, 3, 2, 1, 8, 1, 10, 1, 1, 1, 11, 1, 1, 2, 2, 1, 4, 1, 4, 1, 3,
+        1, 4, 1, 1, 1, 3, 1, 3, 1, 21, 1, 9, 1, 11, 1, 1, 2, 1, 1, 2, 1, 1, 1,
+        1, 2, 3, 1, 1, 3, 1, 1, 3, 1, 3, 2, 1, 1, 2, 1, 5, 1, 2, 2, 1, 1, 1, 1,
+        3, 2, 3, 1, 3, 1, 12, 2, 1, 1, 8, 1, 7, 1, 1, 3, 4, 1, 1, 1, 2, 1, 5,
+        1, 2, 2, 1, 1, 1, 1, 4, 2, 3, 1, 2, 1, 3, 1, 8, 1, 10, 1, 2, 1, 4, 4,
+        4, 1, 2, 2, 1, 1, 4, 2, 3, 1, 4, 1, 1, 1, 1, 1, 11, 1, 1, 1, 3, 4, 1,
+        1, 2, 2, 3, 1, 2, 3, 1, 1, 8, 1, 6, 1, 8, 5, 2, 1, 2, 1, 2, 7, 1, 1, 6,
+        1, 3, 1, 9, 3, 1, 1, 1, 1, 1, 1, 3, 2, 2, 1, 1, 2, 2, 1, 3, 1, 4, 1, 4,
+        1, 1, 2, 1, 1, 2, 1, 1, 1, 5, 1, 6, 1, 1, 3, 3, 4, 2, 1, 4, 1, 2, 2, 2,
+        1, 9, 1, 1, 1, 4, 2, 5, 1, 1, 1, 4, 1, 5, 1, 2, 1, 5, 1, 2, 2, 3, 2, 7,
+        2, 1, 3, 5, 2, 1, 1, 2, 1, 2, 1, 5, 1, 1, 1, 12, 1, 1, 1, 1, 1, 1, 2,
+        2, 3, 3, 1, 11, 2, 2, 4, 3, 1, 2, 5, 4, 1, 2, 1, 2, 1, 5, 3, 2, 1, 13,
+        1, 4, 1, 3, 1, 4, 1, 1, 1, 1, 1, 1, 1, 4, 1, 4, 3, 4, 1, 3, 1, 1, 3, 1,
+        3, 5, 3, 1, 1, 1, 1, 11, 2, 2, 1, 1, 1, 2, 1, 1, 1, 3, 1, 2, 1, 1, 1,
+        1, 1, 18, 1, 1, 2, 6, 2, 1, 1, 3, 1, 2, 3, 2, 2, 4, 1, 4, 2, 1, 1, 1,
+        1, 4, 1, 5, 2, 1, 2, 6, 2, 1, 3, 1, 1, 2, 1, 1, 1, 7, 1, 10, 1, 4, 1,
+        3, 1, 2, 2, 9, 1, 1, 2, 8, 1, 7, 7, 1, 2, 3, 1, 2, 1, 1, 1, 1, 3, 4, 1,
+        1, 1, 2, 1, 3, 1, 4, 3, 2, 1, 3, 1, 8, 2, 1, 1, 6, 3, 3, 1, 6, 2, 2, 2,
+        1, 1, 2, 1, 2, 3, 5, 2, 1, 1, 3, 1, 1, 1, 4, 1, 1, 1, 4, 1, 1, 1, 1, 1,
+        2, 1, 2, 3, 4, 1, 1, 3, 3, 5, 1, 2, 8, 1, 4, 2, 1, 1, 1, 1, 2, 1, 4, 1,
+        1, 1, 4, 1, 1, 1, 1, 1, 2, 4, 2, 1, 2, 1, 3, 2, 1, 1, 1, 1, 1, 1, 2, 2,
+        3, 1, 4, 1, 7, 1, 7, 1, 1, 1, 4, 1, 23, 1, 1, 3, 2, 2, 7, 1, 1, 1, 15,
+        1, 2, 2, 1, 1, 9, 5, 2, 3, 7, 1, 2, 1, 8, 1, 7, 3, 3, 1, 1, 1, 9, 1, 4,
+        1, 6, 3, 5, 2, 1, 3, 1, 1, 3, 1, 5, 3, 7, 3, 2, 1, 3, 2, 3, 1, 1, 1, 1,
+        1, 2, 2, 2, 1, 5, 1, 2, 1, 4, 1, 2, 3, 4, 3, 7, 1, 2, 1, 1, 1, 2, 1, 1,
+        1, 4, 4, 11, 1, 3, 1, 2, 1, 3, 2, 5, 2, 2, 2, 4, 1, 10, 1, 3, 4, 4, 1,
+        23, 5, 12, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 2, 1, 2, 1, 3, 1, 1, 1, 4,
+        2, 1, 1, 7, 1, 1, 2, 1, 2, 8, 1, 1, 1, 1, 1, 1, 1, 1, 1, 4, 2, 2, 1, 5,
+        1, 1, 1, 5, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 3, 2, 4, 1, 2, 3, 3, 2, 3,
+        1, 3, 1, 1, 1, 13, 3, 1, 3, 2, 3, 2, 1, 2, 1, 4, 1, 3, 2, 1, 1, 3, 2,
+        1, 1, 5, 1, 7, 1, 1, 1, 4, 2, 3, 1, 2, 2, 3, 1, 2, 1, 4, 1, 2, 1, 1, 3,
+        6, 1, 1, 3, 1, 1, 5, 1, 1, 1, 12, 1, 3, 1, 3, 3, 5, 1, 2, 1, 5, 2, 3,
+        2, 5, 1, 10, 1, 1, 2, 13, 1, 2, 1, 6, 1, 4, 1, 5, 5, 1, 1, 4, 1, 4, 3,
+        4, 1, 4, 1, 4, 1, 9, 1, 8, 1, 1, 2, 2, 1, 1, 1, 2, 1, 2, 2, 5, 1, 1, 1,
+        1, 1, 4, 2, 6, 1, 1, 2, 152, 2, 3, 2, 6, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1,
+        1, 1, 2, 2, 3, 1, 1, 1, 1, 5, 2, 1, 1, 1, 2, 3, 1, 5, 1, 1, 2, 4, 1, 2,
+        1, 7, 2, 3, 1, 4, 1, 1, 2, 5, 1, 1, 2, 7, 1, 20, 2, 10, 2, 2, 1, 1, 1,
+        3, 1, 5, 2, 2, 1, 3, 1, 3, 1, 6, 1, 3, 1, 2, 2, 1, 1, 2, 1, 1, 2, 5, 2,
+        1, 1, 1, 1, 5, 1, 8, 1, 4, 1, 3, 1, 73, 1, 3, 1, 2, 1, 1, 1, 16, 1, 2,
+        1, 1, 1, 3, 1, 4, 1, 2, 2, 3, 1, 8, 3, 5, 1, 4, 2, 2, 1, 2, 1, 2, 1, 1,
+        1, 1, 1, 1, 2, 3, 1, 4, 4, 1, 1, 3, 1, 2, 1, 2, 2, 1, 1, 1, 1, 10, 2,
+        1, 1, 4, 1, 3, 3, 1, 1, 8, 1, 3, 1, 2, 3, 4, 1, 5, 1, 2, 1, 1, 1, 9, 4,
+        2, 2, 9, 1, 1, 1, 2, 4, 3, 1, 2, 2, 9, 1, 1, 3, 4, 1, 6, 4, 2, 2, 6, 1,
+        2, 2, 1, 3, 7, 3, 6, 2, 5, 1, 6, 1, 1, 1, 2, 1, 4, 2, 1, 2, 3, 1, 4, 1,
+        1, 1, 3, 2, 4, 1, 1, 1, 4, 2, 4, 2, 1, 2, 2, 1, 7, 1, 1, 1, 2, 1, 7, 1,
+        11, 1, 4, 2, 1, 2, 5, 1, 1, 2, 5, 1, 1, 1, 4, 2, 6, 2, 5, 3, 5, 1, 1,
+        2, 1, 1, 1, 1, 1, 2, 3, 3, 5, 4, 2, 1, 5, 2, 1, 1, 3, 1, 7, 1, 1, 5, 2,
+        1, 4, 2, 6, 1, 55, 1, 2, 2, 2, 3, 14, 2, 1, 1, 5, 1, 1, 2, 4, 1, 3, 2,
+        1, 1, 2, 1, 1, 2, 1, 1, 10, 1, 2, 2, 3, 1, 5, 1, 2, 1, 3, 2, 4, 1, 2,
+        1, 3, 1, 1, 1, 3, 1, 3, 1, 11, 1, 2, 1, 12, 3, 1, 2, 1, 1, 3, 2, 2, 1,
+        7, 1, 3, 2, 7, 1, 14, 1, 1, 1, 4, 1, 3, 2, 4, 1, 3, 1, 3, 1, 4, 1, 11,
+        1, 2, 1, 2, 2, 1, 1, 1, 1, 4, 1, 1, 3, 1, 1, 4, 3, 2, 1, 10, 1, 1, 3,
+        1, 1, 6, 2, 4, 3, 1, 2, 3, 1, 5, 1, 2, 1, 1, 3, 2, 2, 1, 1, 5, 1, 5, 1,
+        3, 2, 3, 1, 1, 1, 7, 3, 3, 3, 1, 1, 4, 1, 2, 1, 3, 1, 1, 3, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 4, 2, 1, 1, 2, 1, 1, 2, 1, 2, 1, 2,
+        5, 1, 3, 2, 6, 1, 3, 1, 3, 1, 1, 3, 5, 1, 2, 1, 2, 1, 5, 1, 6, 1, 4, 3,
+        5, 1, 1, 1, 1, 2, 3, 1, 3, 1, 2, 1, 1, 3, 2, 1, 5, 1, 2, 1, 4, 1, 1, 1,
+        3, 3, 1, 4, 2, 1, 4, 3, 1, 1, 2, 2, 1, 1, 13, 2, 2, 1, 1, 2, 3, 1, 5,
+        2, 3, 2, 1, 6, 5, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 4, 1, 2, 1, 1, 3, 1, 1,
+        2, 2, 1, 1, 1, 3, 2, 5, 4, 1, 1, 5, 3, 2, 1, 1, 2, 1, 3, 1, 1, 1, 1, 1,
+        1, 1, 2, 2, 2, 2, 1, 2, 3, 1, 1, 6, 2, 2, 2, 2, 2, 3, 1, 1, 3, 4, 3, 4,
+        5, 1, 3, 1, 1, 8, 3, 2, 2, 3, 1, 4, 1, 1, 1, 5, 2, 3, 2, 1, 2, 2, 1, 3,
+        1, 2, 1, 3, 1, 1, 1, 1, 4, 1, 5, 1, 4, 2, 4, 1, 1, 2, 1, 1, 1, 1, 3, 2,
+        2, 1, 3, 1, 1, 1, 1, 1, 2, 3, 1, 1, 1, 1, 1, 8, 1, 1, 1, 3, 2, 1, 1, 5,
+        1, 4, 1, 3, 1, 2, 2, 6, 4, 1, 1, 2, 2, 1, 1, 1, 2, 8, 2, 1, 2, 15, 3,
+        6, 3, 2, 1, 1, 2, 1, 1, 3, 1, 5, 2, 1, 1, 1, 2, 2, 1, 1, 3, 1, 2, 1, 1,
+        3, 1, 2, 1, 1, 4, 5, 1, 1, 2, 1, 1, 1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1,
+        2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 8, 3, 3, 1, 6, 1, 2, 4, 1, 5, 5, 1, 5, 1,
+        2, 1, 1, 2, 2, 1, 3, 2, 15, 5, 1, 1, 3, 2, 1, 1, 3, 2, 3, 3, 5, 3, 7,
+        1, 14, 2, 1, 4, 6, 1, 1, 1, 1, 1, 3, 1, 1, 1, 2, 1, 1, 1, 1, 1, 8, 1,
+        3, 1, 2, 1, 2, 1, 1, 1, 1, 1, 4, 1, 2, 1, 1, 3, 1, 2, 16, 2, 243, 2, 4,
+        1, 5, 1, 3, 1, 3, 3, 14, 3, 1, 1, 4, 1, 2, 1, 1, 2, 7, 1, 1, 1, 3, 1,
+        2, 1, 1, 1, 6, 1, 1, 2, 1, 1, 4, 4, 5, 2, 2, 4, 3, 1, 1, 1, 54, 2, 3,
+        1, 1, 3, 5, 1, 4, 1, 1, 1, 3, 4, 1, 2, 3, 1, 16, 1, 1, 1, 1, 3, 8, 1,
+        12, 1, 5, 1, 6, 2, 1, 2, 1, 4, 4, 1, 7, 1, 4, 1, 3, 1, 2, 1, 1, 1, 4,
+        3, 2, 1, 4, 2, 3, 1, 6, 1, 15, 1, 7, 1, 5, 1, 1, 1, 2, 3, 9, 1, 5, 1,
+        1, 1, 8, 1, 7, 2, 1, 1, 3, 1, 16, 2, 1, 1, 3, 3, 4, 1, 8, 1, 1, 1, 13,
+        1, 1, 1, 6, 1, 3, 2, 5, 1, 1, 2, 1, 2, 7, 1, 3, 1, 2, 1, 3, 1, 4, 1, 2,
+        3, 2, 1, 1, 1, 1, 2, 8, 1, 11, 3, 1, 2, 3, 2, 2, 1, 9, 1, 1, 1, 2, 2,
+        2, 2, 1, 3, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 1, 2, 1, 3, 1, 2, 2, 1, 2, 3,
+        1, 1, 1, 2, 1, 2, 2, 1, 10, 1, 1, 1, 2, 1, 2, 2, 1, 1, 12, 1, 2, 1, 2,
+        2, 5, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 2, 4, 1, 2, 3, 1, 2, 1,
+        1, 8, 1, 5, 1, 2, 1, 2, 1, 6, 3, 2, 2, 1, 2, 7, 2, 1, 2, 3, 1, 1, 1,
+        62, 1, 1, 2, 1, 1, 3, 1, 2, 2, 1, 2, 3, 1, 2, 1, 2, 1, 2, 1, 3, 1, 20,
+        1, 1, 1, 1, 3, 2, 1, 8, 1, 2, 1, 11, 1, 4, 2, 8, 1, 3, 3, 2, 3, 2, 1,
+        2, 1, 3, 2, 3, 1, 5, 5, 3, 4, 3, 2, 4, 3, 4, 2, 5, 1, 3, 2, 1, 2, 1, 3,
+        58, 1, 1, 1, 1, 1, 6, 1, 9, 3, 2, 1, 3, 2, 2, 1, 1, 1, 3, 1, 5, 1, 9,
+        2, 4, 2, 1, 1, 1, 1, 8, 1, 2, 3, 3, 1, 3, 2, 3, 1, 3, 2, 3, 3, 6, 2, 3,
+        2, 4, 1, 7, 1, 1, 1, 1, 3, 2, 1, 5, 2, 4, 1, 1, 2, 1, 1, 8, 1, 2, 1, 2,
+        1, 2, 3, 1, 1, 2, 1, 2, 1, 1, 1, 6, 1, 76, 1, 1, 1, 1, 2, 2, 1, 1, 3,
+        2, 1, 1, 1, 2, 2, 1, 1, 1, 1, 2, 1, 1, 1, 5, 1, 1, 1, 1, 1, 2, 3, 3, 2,
+        3, 1, 3, 2, 1, 1, 1, 1, 2, 1, 5, 2, 1, 1, 3, 2, 2, 1, 1, 7, 2, 2, 1, 4,
+        1, 1, 1, 1, 3, 1, 2, 1, 1, 2, 3, 1, 5, 1, 4, 1, 1, 1, 5, 3, 1, 1, 1, 2,
+        2, 1, 10, 1, 2, 2, 8, 3, 3, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 5, 4,
+        1, 1, 1, 1, 3, 5, 2, 3, 4, 1, 3, 1, 1, 1, 2, 3, 1, 5, 1, 2, 2, 7, 2, 1,
+        1, 2, 1, 3, 3, 4, 2, 2, 2, 1, 2, 1, 1, 5, 2, 5, 1, 1, 1, 6, 2, 4, 1, 1,
+        1, 5, 1, 1, 1, 2, 2, 3, 1, 3, 1, 3, 4, 2, 1, 1, 2, 1, 1, 8, 1, 3, 1, 1,
+        1, 4, 1, 1, 3, 1, 1, 1, 1, 3, 2, 2, 5, 6, 1, 3, 3, 5, 1, 3, 1, 1, 3, 3,
+        2, 3, 3, 2, 2, 1, 1, 1, 1, 2, 5, 3, 1, 4, 4, 2, 1, 1, 1, 1, 1, 2, 1, 1,
+        1, 3, 1, 106, 1, 11, 1, 4, 1, 1, 1, 8, 1, 8, 1, 5, 1, 5, 2, 3, 3, 16,
+        2, 1, 3, 5, 1, 1, 2, 4, 2, 1, 1, 1, 1, 2, 1, 8, 2, 10, 1, 2, 2, 1, 1,
+        3, 3, 4, 1, 5, 2, 3, 2, 1, 1, 4, 2, 1, 1, 3, 1, 2, 2, 3, 2, 1, 4, 8, 1,
+        8, 1, 1, 1, 1, 1, 2, 1, 3, 1, 3, 1, 2, 1, 2, 1, 3, 1, 3, 1, 1, 2, 9, 4,
+        2, 1, 3, 3, 4, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 9, 1, 3, 1, 4, 1,
+        2, 1, 3, 1, 1, 3, 2, 2, 2, 1, 2, 2, 92, 3, 3, 1, 1, 4, 1, 1, 6, 2, 6,
+        1, 1, 1, 2, 1, 2, 1, 5, 1, 3, 1, 3, 1, 1, 3, 2, 3, 16, 1, 1, 1, 2, 1,
+        9, 1, 9, 1, 4, 1, 2, 1, 4, 3, 1, 3, 2, 1, 2, 1, 6, 1, 2, 2, 5, 1, 5, 4,
+        1, 1, 1, 2, 1, 3, 3, 1, 2, 1, 3, 1, 3, 2, 3, 1, 1, 2, 1, 1, 2, 1, 1, 2,
+        1, 2, 1, 1, 1, 1, 1, 5, 11, 1, 1, 4, 1, 1, 2, 2, 9, 2, 3, 5, 1, 1, 1,
+        1, 4, 1, 2, 1, 17, 4, 1, 1, 1, 2, 6, 1, 2, 3, 1, 1, 24504, 1,
+    ]
 }
@@ -2,6 +2,8 @@
 //
 // Any copyright is dedicated to the Public Domain.
 // https://creativecommons.org/publicdomain/zero/1.0/
+//
+// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
 
 //! Japanese index tables for [rust-encoding](https://github.com/lifthrasiir/rust-encoding).
 
@@ -16,6 +18,7 @@ extern crate encoding_index_tests;
 /// From the Encoding Standard:
 ///
 /// > This is the JIS X 0208 standard including formerly proprietary extensions from IBM and NEC.
+#[cfg(feature = "index-jis0208")]
 pub mod jis0208;
 
 /// JIS X 0212.
@@ -24,5 +27,5 @@ pub mod jis0208;
 ///
 /// > This is the JIS X 0212 standard.
 /// > It is only used by the euc-jp decoder due to lack of widespread support elsewhere.
+#[cfg(feature = "index-jis0212")]
 pub mod jis0212;
-
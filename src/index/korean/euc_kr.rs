@@ -4607,5 +4607,303 @@ pub fn backward(code: u32) -> u16 {
 
 #[cfg(test)]
 multi_byte_tests! {
-    dups = []
+    dups = [],
+    golden = [
+        0x5dab56cc6213a925, 0x9862cc41b56f8d65, // forward & backward hash
+        // 17048 valid code points in 3387 runs
+        161, 1, 2, 1, 2, 2, 1, 1, 2, 2, 1, 5, 1, 5, 1, 4, 6, 1, 9, 1, 6, 2, 5,
+        2, 6, 1, 9, 1, 6, 2, 5, 1, 18, 1, 20, 2, 9, 3, 4, 1, 6, 4, 6, 3, 6, 2,
+        18, 2, 351, 1, 8, 1, 7, 4, 1, 1, 179, 17, 1, 7, 7, 17, 1, 7, 55, 1, 14,
+        64, 1, 1, 7107, 1, 2, 2, 2, 2, 2, 2, 3, 2, 9, 1, 1, 2, 7, 1, 56, 1, 10,
+        1, 1, 4, 39, 1, 86, 1, 5, 1, 9, 1, 2, 1, 10, 2, 3, 1, 4, 1, 39, 2, 6,
+        4, 1, 10, 6, 10, 22, 10, 56, 1, 1, 1, 43, 1, 1, 2, 3, 2, 2, 1, 3, 1, 1,
+        1, 8, 1, 2, 2, 1, 1, 4, 1, 1, 6, 1, 1, 5, 2, 6, 2, 20, 1, 13, 2, 2, 2,
+        4, 2, 22, 2, 2, 2, 17, 1, 11, 1, 108, 1, 333, 15, 5, 15, 25, 26, 26,
+        26, 22, 4, 8, 64, 70, 1, 13, 2, 1, 7, 8, 2, 2, 2, 4, 2, 2, 2, 4, 3, 2,
+        1, 2, 4, 51, 2, 7, 2, 12, 1, 1, 1, 33, 1, 1, 1, 29, 2, 1, 3, 1, 4, 1,
+        2, 2450, 4, 4, 10, 1, 3, 43, 83, 13, 86, 58, 94, 113, 29, 67, 28, 3, 1,
+        256, 5, 3, 67, 4, 2, 2, 1, 2, 1, 1, 1, 2, 3, 6690, 2, 1, 1, 3, 5, 1, 1,
+        3, 1, 2, 3, 1, 2, 4, 1, 14, 1, 4, 1, 5, 2, 1, 1, 6, 2, 1, 1, 5, 1, 1,
+        3, 6, 1, 1, 2, 3, 3, 11, 1, 1, 1, 5, 1, 2, 2, 6, 1, 3, 1, 3, 1, 1, 1,
+        2, 2, 1, 1, 1, 3, 1, 2, 2, 1, 2, 1, 2, 1, 2, 2, 1, 3, 1, 1, 2, 4, 7, 1,
+        3, 1, 5, 2, 2, 1, 2, 1, 2, 2, 1, 1, 6, 6, 3, 1, 1, 1, 3, 3, 10, 1, 1,
+        1, 3, 2, 3, 1, 5, 1, 7, 3, 1, 5, 29, 1, 4, 1, 1, 1, 1, 1, 1, 1, 1, 2,
+        5, 1, 2, 3, 4, 5, 3, 1, 3, 4, 12, 1, 5, 2, 2, 1, 2, 1, 3, 1, 3, 2, 1,
+        1, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 4, 1, 1, 1, 2, 1, 1, 1,
+        16, 2, 5, 2, 8, 1, 2, 3, 4, 2, 3, 1, 2, 1, 1, 2, 2, 1, 2, 1, 2, 1, 1,
+        3, 12, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 7, 1, 3, 1, 2, 1, 1, 1, 1, 1,
+        3, 2, 3, 1, 2, 2, 1, 1, 1, 2, 1, 1, 1, 2, 1, 3, 1, 4, 13, 1, 7, 1, 3,
+        3, 5, 1, 5, 1, 4, 1, 1, 1, 8, 1, 14, 3, 1, 1, 7, 1, 4, 1, 7, 1, 3, 1,
+        6, 2, 18, 2, 4, 2, 1, 1, 1, 1, 6, 1, 6, 1, 3, 2, 4, 1, 1, 1, 3, 2, 3,
+        1, 3, 1, 6, 1, 1, 1, 5, 1, 11, 1, 1, 1, 3, 3, 2, 1, 1, 1, 2, 1, 8, 1,
+        12, 1, 1, 1, 8, 1, 7, 1, 4, 1, 2, 1, 1, 1, 3, 2, 1, 7, 1, 4, 3, 1, 9,
+        1, 5, 1, 2, 1, 1, 8, 2, 1, 3, 4, 3, 1, 3, 1, 5, 1, 3, 1, 2, 1, 4, 1, 2,
+        1, 1, 1, 8, 1, 4, 1, 4, 1, 1, 1, 9, 2, 5, 1, 6, 1, 1, 1, 2, 1, 1, 3,
+        14, 3, 2, 1, 14, 2, 4, 1, 1, 3, 2, 1, 2, 1, 2, 1, 2, 3, 1, 1, 3, 1, 2,
+        1, 5, 1, 5, 1, 6, 2, 3, 2, 3, 1, 1, 1, 5, 6, 7, 1, 3, 1, 2, 4, 6, 1, 1,
+        1, 4, 1, 1, 1, 3, 1, 7, 2, 4, 1, 2, 1, 2, 1, 7, 1, 1, 1, 3, 1, 3, 3, 3,
+        1, 3, 2, 8, 1, 3, 2, 2, 2, 4, 3, 18, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+        3, 1, 4, 1, 2, 2, 1, 2, 1, 1, 1, 3, 2, 3, 14, 1, 1, 1, 2, 1, 1, 2, 2,
+        2, 5, 1, 2, 1, 4, 1, 1, 2, 4, 3, 1, 1, 6, 2, 1, 1, 6, 1, 4, 1, 9, 1, 5,
+        3, 1, 2, 2, 4, 2, 1, 3, 4, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 5, 1, 1, 1, 6,
+        3, 2, 2, 1, 1, 5, 1, 1, 1, 4, 1, 14, 1, 4, 1, 1, 1, 4, 2, 4, 2, 6, 1,
+        13, 1, 7, 1, 4, 4, 1, 1, 6, 1, 1, 2, 3, 1, 5, 5, 3, 5, 1, 5, 4, 1, 10,
+        2, 3, 3, 1, 6, 9, 1, 1, 1, 1, 2, 5, 1, 2, 1, 1, 1, 7, 1, 4, 2, 1, 2, 1,
+        1, 3, 1, 5, 1, 1, 1, 6, 1, 22, 1, 1, 1, 6, 1, 1, 1, 1, 1, 5, 3, 2, 1,
+        5, 1, 5, 1, 1, 1, 1, 1, 19, 1, 3, 1, 2, 2, 6, 1, 4, 1, 4, 1, 2, 2, 2,
+        1, 3, 2, 23, 1, 3, 1, 2, 1, 4, 2, 3, 1, 7, 1, 9, 1, 1, 2, 6, 1, 1, 1,
+        11, 1, 18, 1, 1, 1, 3, 1, 8, 1, 5, 1, 1, 1, 8, 1, 3, 1, 2, 1, 7, 1, 4,
+        1, 24, 1, 3, 1, 3, 1, 1, 2, 1, 2, 13, 3, 1, 2, 9, 1, 1, 4, 1, 1, 22, 1,
+        1, 1, 12, 1, 5, 1, 1, 1, 2, 1, 3, 2, 24, 2, 7, 1, 2, 1, 10, 1, 2, 1,
+        23, 1, 2, 1, 1, 1, 1, 1, 28, 1, 20, 1, 2, 1, 8, 1, 17, 1, 30, 1, 6, 1,
+        1, 1, 5, 1, 7, 1, 13, 1, 2, 1, 3, 1, 8, 2, 2, 1, 1, 1, 15, 1, 8, 2, 8,
+        2, 3, 1, 2, 1, 1, 1, 4, 2, 2, 1, 1, 1, 6, 1, 8, 1, 4, 1, 2, 1, 10, 1,
+        4, 1, 1, 1, 4, 1, 2, 1, 2, 2, 1, 2, 15, 1, 2, 1, 1, 1, 3, 1, 3, 1, 1,
+        1, 4, 1, 6, 1, 5, 1, 5, 1, 2, 1, 7, 1, 12, 1, 1, 2, 31, 1, 3, 2, 2, 1,
+        2, 1, 16, 2, 15, 1, 3, 1, 2, 1, 1, 2, 1, 1, 3, 1, 1, 1, 2, 2, 1, 3, 19,
+        1, 2, 1, 2, 1, 2, 1, 2, 1, 4, 3, 2, 2, 4, 1, 15, 2, 3, 1, 1, 1, 2, 1,
+        2, 2, 1, 1, 3, 1, 2, 2, 1, 1, 16, 1, 3, 1, 2, 1, 1, 1, 4, 1, 1, 1, 3,
+        1, 9, 1, 8, 1, 1, 2, 8, 2, 4, 1, 4, 1, 6, 2, 2, 1, 2, 1, 3, 1, 1, 1, 6,
+        1, 2, 1, 1, 1, 1, 1, 2, 2, 4, 2, 4, 1, 6, 2, 2, 1, 9, 3, 1, 1, 17, 1,
+        4, 3, 2, 2, 1, 1, 5, 1, 4, 1, 1, 3, 1, 2, 2, 1, 5, 1, 6, 1, 5, 1, 2, 3,
+        4, 4, 2, 2, 1, 1, 2, 1, 5, 1, 1, 1, 4, 1, 2, 5, 4, 2, 3, 1, 4, 1, 4, 3,
+        5, 1, 8, 1, 2, 2, 1, 1, 11, 1, 2, 1, 3, 1, 12, 1, 1, 1, 2, 1, 4, 1, 2,
+        1, 2, 1, 1, 1, 4, 2, 1, 2, 4, 2, 1, 2, 8, 1, 1, 1, 1, 1, 1, 1, 1, 1, 9,
+        1, 2, 1, 3, 1, 1, 1, 1, 1, 13, 1, 6, 1, 2, 2, 2, 2, 4, 1, 3, 1, 12, 1,
+        5, 1, 4, 1, 4, 1, 2, 1, 16, 1, 7, 1, 3, 1, 43, 1, 7, 2, 8, 1, 28, 2, 1,
+        1, 4, 1, 2, 1, 20, 1, 4, 1, 2, 1, 27, 1, 3, 1, 1, 2, 9, 1, 19, 1, 21,
+        1, 2, 1, 12, 2, 2, 2, 1, 2, 1, 1, 1, 2, 1, 1, 3, 2, 4, 1, 1, 1, 4, 2,
+        3, 1, 2, 1, 1, 1, 1, 1, 8, 1, 1, 3, 1, 2, 2, 1, 3, 1, 1, 8, 5, 5, 5, 1,
+        1, 1, 1, 1, 2, 4, 1, 2, 5, 2, 1, 6, 4, 1, 3, 1, 1, 3, 2, 1, 6, 2, 1, 2,
+        1, 6, 1, 2, 1, 2, 5, 2, 1, 1, 1, 1, 6, 1, 2, 1, 2, 5, 1, 3, 1, 1, 4, 1,
+        2, 1, 10, 1, 3, 1, 8, 1, 6, 5, 1, 3, 4, 2, 1, 1, 2, 1, 1, 2, 2, 1, 3,
+        1, 5, 1, 4, 1, 1, 1, 1, 2, 6, 1, 2, 1, 1, 1, 7, 1, 22, 2, 15, 1, 7, 1,
+        1, 2, 4, 1, 1, 1, 1, 1, 1, 2, 1, 1, 3, 1, 1, 1, 24, 1, 6, 1, 7, 1, 6,
+        2, 3, 1, 1, 1, 4, 1, 1, 1, 9, 1, 5, 2, 2, 1, 2, 1, 1, 2, 1, 1, 13, 1,
+        1, 1, 33, 2, 3, 1, 24, 1, 2, 1, 2, 1, 23, 1, 3, 1, 17, 1, 2, 1, 1, 1,
+        7, 1, 13, 1, 1, 1, 1, 2, 15, 1, 4, 1, 3, 1, 6, 2, 2, 2, 2, 4, 2, 1, 2,
+        1, 2, 4, 2, 1, 5, 2, 3, 2, 2, 1, 5, 1, 4, 1, 4, 1, 2, 1, 1, 1, 1, 1, 7,
+        1, 5, 1, 1, 1, 5, 1, 2, 1, 1, 1, 4, 1, 1, 2, 3, 2, 1, 1, 4, 1, 8, 1, 9,
+        1, 1, 3, 14, 3, 2, 3, 1, 4, 5, 1, 2, 1, 2, 1, 4, 1, 5, 1, 1, 1, 2, 1,
+        1, 1, 3, 1, 5, 2, 3, 1, 1, 1, 7, 4, 5, 1, 3, 1, 5, 3, 5, 1, 2, 1, 2, 1,
+        3, 2, 3, 2, 1, 2, 8, 1, 6, 1, 2, 2, 2, 2, 5, 1, 2, 1, 5, 1, 4, 1, 1, 1,
+        1, 3, 1, 2, 2, 1, 3, 1, 6, 2, 1, 1, 7, 1, 3, 1, 4, 1, 1, 1, 11, 1, 1,
+        1, 1, 1, 1, 1, 7, 2, 1, 1, 1, 1, 6, 1, 3, 2, 1, 5, 2, 2, 5, 1, 1, 1, 2,
+        1, 2, 3, 3, 1, 1, 1, 2, 3, 3, 3, 4, 3, 4, 1, 1, 2, 6, 3, 3, 1, 6, 1, 1,
+        1, 1, 1, 3, 1, 5, 1, 1, 1, 6, 2, 8, 4, 6, 1, 10, 1, 9, 1, 7, 1, 1, 1,
+        15, 1, 2, 1, 3, 1, 5, 2, 2, 2, 3, 1, 1, 2, 1, 1, 4, 1, 17, 3, 9, 1, 2,
+        1, 1, 1, 2, 1, 3, 1, 3, 1, 4, 4, 2, 3, 1, 2, 1, 2, 20, 1, 3, 1, 2, 2,
+        6, 1, 1, 1, 3, 2, 3, 2, 2, 2, 2, 1, 8, 1, 1, 3, 1, 1, 1, 1, 3, 2, 7, 1,
+        1, 1, 9, 1, 8, 1, 1, 1, 2, 3, 14, 2, 1, 1, 2, 1, 2, 3, 5, 1, 4, 1, 1,
+        2, 3, 3, 5, 1, 4, 2, 3, 1, 7, 1, 8, 1, 3, 1, 2, 1, 4, 1, 1, 2, 2, 1, 1,
+        1, 2, 2, 1, 3, 6, 1, 1, 1, 2, 2, 3, 1, 1, 1, 2, 3, 2, 2, 2, 1, 2, 1, 1,
+        1, 5, 2, 5, 2, 2, 2, 7, 1, 3, 1, 1, 2, 2, 1, 3, 3, 9, 1, 2, 1, 1, 1, 1,
+        2, 1, 1, 3, 1, 3, 1, 3, 1, 3, 1, 4, 1, 3, 5, 26, 1, 11, 1, 3, 3, 1, 1,
+        1, 1, 2, 2, 6, 2, 1, 1, 1, 3, 1, 3, 3, 1, 3, 1, 4, 1, 1, 1, 8, 1, 3, 1,
+        1, 2, 2, 1, 1, 1, 7, 4, 5, 3, 1, 1, 1, 1, 5, 1, 4, 1, 21, 1, 2, 1, 4,
+        1, 2, 1, 2, 1, 2, 2, 3, 1, 4, 2, 6, 2, 2, 1, 1, 2, 2, 1, 15, 1, 5, 1,
+        3, 1, 3, 1, 2, 2, 4, 1, 4, 3, 2, 2, 1, 2, 1, 3, 1, 4, 1, 2, 15, 4, 1,
+        1, 1, 1, 3, 1, 6, 2, 1, 1, 5, 1, 1, 1, 7, 1, 25, 1, 3, 1, 10, 2, 1, 2,
+        10, 1, 2, 1, 2, 2, 4, 1, 17, 2, 5, 1, 3, 1, 4, 1, 2, 2, 3, 1, 3, 1, 4,
+        2, 2, 1, 5, 1, 3, 1, 1, 1, 2, 1, 4, 3, 2, 1, 1, 4, 21, 1, 3, 1, 1, 1,
+        8, 2, 5, 1, 3, 2, 5, 1, 11, 2, 5, 1, 1, 2, 21, 1, 1, 1, 4, 1, 1, 2, 4,
+        1, 5, 1, 9, 2, 12, 1, 3, 1, 25, 1, 7, 1, 8, 1, 5, 1, 8, 3, 13, 1, 8, 3,
+        6, 1, 3, 1, 5, 2, 5, 1, 1, 2, 1, 1, 1, 1, 8, 1, 5, 1, 2, 2, 1, 1, 2, 1,
+        2, 2, 3, 1, 1, 1, 3, 1, 1, 1, 6, 2, 2, 3, 4, 1, 5, 1, 1, 1, 5, 1, 3, 1,
+        1, 1, 3, 1, 19, 1, 4, 1, 5, 1, 6, 3, 2, 1, 6, 4, 1, 1, 2, 2, 5, 1, 2,
+        1, 4, 3, 1, 1, 4, 2, 6, 1, 3, 2, 2, 1, 5, 2, 4, 1, 1, 2, 1, 2, 5, 1, 3,
+        2, 1, 1, 1, 1, 4, 1, 3, 2, 5, 1, 1, 1, 1, 2, 2, 1, 1, 1, 2, 2, 1, 1, 3,
+        2, 2, 2, 6, 1, 1, 1, 2, 2, 3, 1, 3, 1, 5, 2, 2, 1, 2, 1, 4, 1, 8, 1, 2,
+        1, 1, 2, 1, 2, 2, 2, 3, 1, 2, 1, 5, 4, 1, 1, 6, 2, 1, 2, 1, 1, 1, 4, 1,
+        3, 8, 3, 4, 1, 1, 2, 4, 1, 1, 3, 2, 1, 1, 1, 3, 2, 5, 4, 4, 1, 1, 1, 3,
+        1, 9, 1, 1, 1, 1, 3, 4, 6, 1, 1, 2, 2, 3, 2, 1, 3, 1, 1, 9, 1, 2, 3, 4,
+        1, 1, 2, 4, 3, 4, 1, 2, 1, 1, 1, 8, 1, 2, 1, 3, 3, 4, 1, 1, 1, 2, 1, 5,
+        1, 1, 2, 1, 1, 12, 1, 2, 1, 2, 2, 2, 1, 5, 1, 9, 1, 1, 3, 2, 4, 1, 1,
+        1, 3, 2, 1, 4, 2, 1, 1, 1, 1, 6, 2, 1, 1, 3, 1, 1, 3, 6, 3, 1, 5, 2, 1,
+        2, 1, 1, 1, 3, 1, 2, 1, 8, 1, 2, 1, 4, 4, 1, 1, 2, 1, 5, 1, 1, 2, 13,
+        1, 1, 3, 1, 1, 1, 1, 1, 1, 3, 1, 2, 2, 7, 1, 1, 1, 1, 1, 3, 2, 2, 1, 1,
+        1, 1, 1, 2, 1, 1, 2, 17, 2, 2, 1, 2, 3, 5, 1, 5, 1, 10, 6, 5, 1, 2, 1,
+        11, 1, 2, 1, 2, 3, 1, 4, 4, 1, 2, 1, 19, 2, 2, 2, 9, 2, 7, 1, 4, 1, 8,
+        2, 2, 2, 2, 4, 4, 1, 5, 1, 1, 2, 1, 2, 24, 1, 8, 1, 8, 1, 1, 1, 3, 1,
+        9, 1, 3, 2, 2, 1, 5, 1, 1, 1, 1, 2, 4, 2, 4, 1, 1, 3, 1, 1, 1, 2, 13,
+        2, 3, 1, 1, 1, 1, 1, 4, 1, 2, 1, 1, 2, 1, 1, 4, 2, 6, 2, 5, 1, 3, 1, 6,
+        2, 5, 1, 4, 1, 7, 2, 3, 1, 20, 1, 8, 1, 12, 1, 1, 1, 10, 1, 8, 3, 1, 1,
+        1, 2, 3, 1, 1, 4, 4, 1, 2, 1, 1, 3, 5, 1, 1, 3, 27, 1, 5, 2, 8, 1, 1,
+        1, 6, 1, 5, 1, 6, 1, 5, 1, 1, 1, 7, 3, 2, 1, 23, 1, 1, 1, 16, 1, 1, 1,
+        1, 1, 2, 1, 7, 1, 6, 1, 1, 1, 3, 1, 1, 1, 4, 2, 1, 1, 1, 1, 17, 1, 2,
+        3, 2, 1, 6, 1, 3, 1, 2, 1, 6, 2, 4, 2, 5, 1, 1, 1, 9, 1, 20, 1, 3, 1,
+        4, 1, 3, 2, 8, 1, 4, 1, 5, 2, 15, 1, 7, 1, 6, 2, 15, 1, 6, 2, 26, 1, 4,
+        1, 8, 1, 5, 1, 1, 1, 5, 1, 3, 1, 9, 2, 1, 1, 14, 1, 7, 1, 2, 2, 7, 2,
+        4, 1, 1, 1, 1, 1, 14, 1, 1, 6, 3, 1, 7, 1, 4, 2, 2, 1, 3, 1, 3, 2, 1,
+        1, 2, 2, 11, 1, 1, 1, 5, 1, 15, 2, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 2, 1,
+        1, 1, 3, 2, 4, 1, 1, 1, 1, 1, 2, 3, 1, 3, 2, 1, 15, 2, 27, 1, 6, 1, 1,
+        1, 1, 1, 15, 1, 16, 1, 2, 2, 5, 1, 1, 3, 11, 1, 1, 1, 4, 1, 1, 1, 2, 1,
+        2, 4, 7, 1, 1, 1, 2, 1, 2, 1, 1, 1, 3, 1, 3, 1, 2, 2, 2, 3, 1, 4, 3, 1,
+        3, 1, 1, 5, 2, 3, 15, 1, 2, 1, 4, 1, 4, 2, 1, 5, 1, 2, 1, 1, 4, 2, 1,
+        1, 6, 1, 1, 1, 1, 1, 3, 1, 5, 3, 1, 1, 2, 1, 2, 1, 2, 3, 2, 1, 23, 2,
+        4, 1, 5, 1, 1, 1, 1, 1, 2, 1, 6, 1, 1, 1, 1, 2, 7, 1, 2, 2, 1, 2, 1, 1,
+        1, 2, 2, 1, 23, 2, 1, 1, 6, 1, 2, 1, 2, 2, 1, 1, 1, 1, 5, 1, 2, 3, 5,
+        1, 5, 1, 1, 3, 2, 3, 2, 1, 1, 1, 1, 1, 25, 1, 2, 1, 2, 1, 10, 1, 2, 5,
+        3, 1, 3, 1, 1, 1, 6, 3, 3, 1, 2, 1, 6, 1, 1, 2, 2, 1, 2, 1, 1, 1, 1, 1,
+        1, 5, 27, 1, 1, 3, 3, 3, 1, 4, 4, 3, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1,
+        1, 1, 3, 4, 2, 5, 1, 2, 1, 8, 1, 1, 1, 2, 2, 1, 2, 7, 1, 3, 1, 2, 2, 2,
+        2, 6, 1, 21, 1, 5, 1, 5, 2, 1, 1, 2, 1, 2, 1, 4, 2, 3, 1, 1, 1, 4, 1,
+        3, 1, 7, 1, 1, 2, 3, 1, 1, 2, 1, 1, 2, 1, 1, 2, 26, 1, 4, 1, 3, 1, 5,
+        2, 1, 2, 3, 1, 8, 1, 1, 1, 2, 2, 10, 1, 1, 2, 7, 2, 4, 2, 5, 1, 6, 1,
+        1, 1, 15, 1, 2, 1, 2, 2, 1, 2, 2, 2, 2, 1, 1, 1, 8, 2, 1, 1, 9, 1, 1,
+        3, 2, 1, 2, 1, 3, 1, 4, 2, 1, 1, 3, 1, 2, 1, 11, 2, 2, 1, 6, 2, 1, 1,
+        1, 1, 5, 1, 4, 1, 1, 4, 6, 1, 10, 1, 4, 1, 4, 3, 2, 1, 4, 1, 1, 2, 2,
+        1, 1, 1, 12, 1, 2, 1, 3, 2, 2, 1, 1, 1, 3, 1, 1, 1, 3, 1, 2, 1, 1, 6,
+        3, 1, 3, 2, 6, 1, 7, 1, 6, 1, 13, 1, 3, 2, 6, 1, 4, 1, 5, 1, 7, 1, 4,
+        1, 7, 1, 3, 2, 7, 1, 4, 1, 3, 1, 3, 1, 5, 3, 6, 1, 2, 1, 6, 3, 1, 1, 3,
+        1, 3, 3, 14, 1, 2, 1, 3, 1, 8, 2, 3, 1, 1, 1, 17, 1, 7, 1, 3, 1, 6, 1,
+        4, 1, 2, 1, 12, 2, 3, 1, 2, 1, 4, 1, 9, 1, 5, 1, 16, 1, 1, 2, 1, 1, 1,
+        1, 1, 1, 5, 1, 2, 1, 2, 1, 1, 1, 5, 4, 1, 1, 2, 1, 1, 1, 14, 1, 6, 1,
+        4, 2, 4, 1, 2, 1, 1, 1, 4, 1, 5, 1, 2, 1, 9, 1, 4, 1, 7, 2, 3, 1, 2, 1,
+        1, 1, 4, 2, 4, 1, 1, 1, 1, 1, 1, 2, 9, 1, 5, 3, 5, 2, 12, 2, 1, 3, 5,
+        1, 9, 1, 10, 1, 14, 1, 1, 2, 2, 1, 1, 1, 2, 2, 3, 2, 1, 2, 1, 1, 5, 3,
+        3, 1, 5, 1, 5, 2, 1, 1, 1, 1, 1, 1, 1, 2, 4, 1, 1, 1, 8, 1, 6, 1, 3, 1,
+        2, 2, 32, 1, 4, 1, 4, 1, 2, 1, 16, 1, 1, 1, 1, 1, 9, 1, 1, 1, 6, 1, 1,
+        1, 7, 1, 7, 1, 14, 2, 2, 2, 12, 1, 11, 1, 4, 3, 7, 1, 3, 3, 10, 2, 6,
+        2, 4, 2, 10, 1, 1, 1, 4, 1, 16, 1, 1, 1, 5, 1, 1, 1, 2, 1, 2, 1, 1, 2,
+        8, 1, 1, 2, 1, 1, 1, 1, 2, 1, 5, 1, 1, 3, 6, 1, 7, 1, 1, 1, 3, 1, 4, 2,
+        5, 1, 6, 1, 1, 1, 6, 2, 1, 2, 1, 1, 6, 1, 2, 1, 3, 2, 1, 1, 2, 4, 2, 2,
+        2, 1, 9, 1, 1, 1, 3, 2, 2, 1, 1, 1, 1, 3, 1, 1, 9, 1, 7, 1, 4, 3, 2, 2,
+        1, 1, 1, 3, 1, 3, 2, 4, 1, 1, 1, 1, 4, 3, 1, 2, 6, 1, 9, 1, 1, 1, 1, 4,
+        1, 3, 1, 1, 1, 2, 2, 3, 4, 1, 14, 1, 3, 2, 3, 1, 1, 1, 1, 1, 12, 1, 3,
+        1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 5, 1, 1, 1, 2, 1, 3, 1, 3, 1, 1,
+        1, 6, 1, 3, 1, 4, 1, 4, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 2, 2, 1, 7, 1, 8,
+        1, 9, 1, 2, 1, 12, 1, 3, 1, 2, 1, 1, 2, 3, 1, 3, 1, 1, 2, 1, 1, 2, 2,
+        3, 4, 3, 2, 1, 1, 12, 1, 4, 1, 2, 1, 1, 1, 1, 2, 4, 1, 1, 3, 4, 1, 2,
+        2, 3, 1, 4, 2, 4, 2, 1, 1, 1, 1, 4, 1, 6, 2, 2, 2, 2, 2, 1, 1, 11, 1,
+        7, 1, 5, 1, 5, 3, 1, 1, 2, 2, 2, 3, 3, 1, 2, 1, 1, 1, 5, 1, 4, 1, 1, 2,
+        2, 2, 1, 1, 6, 1, 13, 1, 1, 1, 1, 1, 5, 1, 1, 1, 3, 1, 12, 1, 11, 1, 5,
+        4, 1, 1, 1, 1, 20, 1, 6, 1, 9, 1, 1, 1, 3, 1, 3, 1, 10, 1, 2, 1, 4, 1,
+        2, 1, 3, 1, 1, 1, 5, 1, 2, 4, 5, 1, 1, 2, 6, 1, 1, 1, 2, 1, 26, 1, 11,
+        1, 4, 1, 2, 2, 2, 1, 1, 1, 1, 1, 7, 1, 3, 1, 4, 2, 1, 2, 1, 1, 1, 2, 2,
+        1, 6, 1, 3, 1, 1, 1, 3, 1, 3, 1, 1, 1, 2, 1, 2, 1, 3, 2, 1, 1, 18, 1,
+        1, 1, 8, 1, 13, 2, 1, 1, 1, 1, 3, 1, 12, 1, 13, 1, 5, 1, 1, 1, 2, 1, 4,
+        1, 13, 1, 4, 2, 11, 1, 5, 1, 12, 1, 6, 1, 6, 2, 2, 1, 2, 1, 7, 2, 2, 1,
+        23, 1, 3, 2, 5, 2, 1, 1, 3, 1, 3, 3, 3, 1, 14, 1, 15, 1, 18, 3, 4, 1,
+        5, 1, 1, 1, 16, 1, 9, 1, 13, 1, 13, 2, 2, 1, 12, 1, 4, 1, 5, 1, 4, 3,
+        2, 1, 5, 1, 11, 1, 3, 1, 1, 1, 16, 3, 4, 1, 3, 1, 4, 2, 2, 1, 1, 1, 23,
+        1, 3, 1, 2, 1, 5, 1, 5, 1, 5, 1, 12, 1, 7, 1, 19, 3, 13, 1, 3, 1, 1, 2,
+        5, 3, 6, 1, 5, 2, 2, 5, 1, 1, 4, 1, 2, 1, 4, 1, 12, 1, 4, 1, 1, 1, 11,
+        3, 1, 1, 20, 2, 2, 1, 3, 1, 2, 1, 1, 1, 5, 1, 3, 5, 7, 3, 5, 2, 2, 1,
+        2, 1, 6, 1, 4, 1, 1, 2, 1, 1, 17, 1, 4, 1, 4, 1, 2, 1, 2, 1, 1, 1, 6,
+        1, 2, 1, 1, 2, 1, 1, 2, 2, 13, 1, 2, 1, 4, 2, 3, 3, 1, 2, 5, 1, 2, 1,
+        3, 2, 8, 1, 9, 2, 6, 1, 1, 1, 4, 1, 3, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1,
+        2, 1, 3, 1, 9, 2, 1, 1, 2, 1, 6, 1, 9, 2, 3, 2, 10, 1, 9, 2, 1, 1, 2,
+        2, 11, 1, 1, 1, 3, 1, 1, 2, 2, 1, 1, 1, 4, 1, 2, 1, 1, 1, 6, 1, 2, 2,
+        4, 1, 15, 1, 1, 1, 7, 1, 1, 1, 2, 1, 1, 1, 5, 1, 5, 2, 11, 1, 12, 1, 2,
+        1, 1, 3, 1, 4, 1, 1, 1, 1, 9, 1, 11, 1, 1, 1, 6, 1, 7, 1, 9, 1, 3, 1,
+        3, 1, 4, 2, 1, 1, 2, 1, 2, 1, 3, 1, 11, 1, 3, 1, 2, 1, 3, 1, 7, 2, 2,
+        1, 1, 2, 1, 1, 8, 1, 13, 1, 3, 1, 4, 1, 29, 1, 10, 1, 11, 1, 2, 1, 5,
+        1, 2, 2, 17, 3, 3, 1, 8, 2, 18, 1, 3, 1, 7, 1, 6, 1, 15, 1, 5, 1, 8, 1,
+        2, 1, 1, 2, 6, 1, 5, 1, 1, 1, 6, 1, 2, 3, 5, 1, 4, 1, 11, 1, 11, 1, 7,
+        3, 6, 1, 19, 1, 2, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1, 1, 2, 1, 3, 1, 2, 5,
+        4, 3, 8, 2, 1, 3, 2, 1, 1, 1, 3, 2, 7, 5, 9, 1, 13, 1, 2, 2, 3, 1, 1,
+        1, 1, 1, 3, 1, 2, 3, 2, 1, 2, 1, 5, 1, 14, 2, 3, 1, 8, 1, 3, 1, 1, 1,
+        9, 2, 3, 2, 1, 2, 2, 1, 1, 2, 1, 3, 7, 1, 2, 2, 10, 1, 1, 1, 1, 1, 2,
+        2, 1, 2, 1, 1, 4, 2, 2, 1, 2, 1, 4, 1, 6, 1, 13, 2, 10, 1, 5, 1, 1, 3,
+        1, 1, 1, 1, 7, 1, 2, 2, 1, 1, 5, 1, 5, 2, 2, 1, 1, 1, 2, 2, 10, 1, 1,
+        2, 8, 1, 2, 1, 7, 3, 1, 1, 2, 1, 8, 1, 2, 1, 5, 1, 9, 1, 2, 1, 3, 1, 2,
+        1, 1, 1, 2, 2, 153, 1, 1, 1, 1, 1, 17, 1, 3, 1, 3, 2, 20, 2, 2, 1, 1,
+        1, 1, 1, 2, 1, 1, 1, 1, 1, 11, 1, 2, 1, 1, 1, 1, 1, 1, 1, 5, 1, 5, 1,
+        3, 1, 5, 1, 3, 2, 8, 1, 5, 2, 3, 1, 3, 1, 3, 1, 4, 1, 1, 1, 1, 1, 3, 1,
+        1, 2, 9, 3, 7, 1, 1, 1, 4, 1, 8, 1, 2, 1, 3, 2, 1, 1, 1, 2, 2, 1, 2, 1,
+        3, 1, 4, 1, 1, 2, 20, 1, 5, 1, 2, 1, 6, 1, 1, 1, 3, 1, 2, 1, 3, 1, 11,
+        1, 1, 1, 1, 1, 3, 1, 16, 2, 1, 2, 3, 1, 5, 3, 4, 4, 1, 1, 1, 2, 9, 1,
+        4, 1, 1, 1, 3, 2, 2, 1, 3, 2, 4, 1, 1, 2, 1, 1, 5, 1, 8, 2, 7, 1, 1, 1,
+        11, 2, 2, 1, 2, 1, 2, 2, 11, 1, 2, 1, 3, 1, 4, 1, 4, 1, 2, 4, 1, 1, 13,
+        1, 1, 2, 7, 1, 5, 1, 1, 1, 3, 1, 9, 1, 4, 1, 12, 1, 2, 1, 1, 2, 2, 2,
+        15, 2, 4, 1, 4, 2, 6, 3, 4, 2, 7, 1, 1, 1, 4, 1, 10, 1, 1, 2, 2, 1, 2,
+        1, 4, 1, 10, 1, 1, 1, 4, 1, 2, 4, 1, 1, 3, 1, 6, 1, 10, 1, 6, 1, 3, 1,
+        1, 1, 1, 2, 1, 1, 2, 1, 5, 2, 5, 3, 1, 1, 6, 1, 1, 2, 1, 1, 1, 2, 4, 1,
+        8, 2, 1, 2, 1, 1, 8, 3, 8, 3, 1, 1, 6, 1, 4, 1, 1, 1, 17, 1, 10, 1, 1,
+        1, 7, 2, 1, 2, 3, 1, 1, 1, 5, 1, 12, 1, 1, 2, 3, 1, 6, 2, 2, 1, 1, 1,
+        5, 2, 2, 1, 2, 4, 1, 1, 1, 1, 3, 3, 1, 3, 1, 1, 17, 2, 1, 2, 1, 1, 3,
+        1, 2, 2, 1, 1, 3, 3, 9, 1, 11, 2, 2, 5, 3, 1, 13, 1, 16, 1, 2, 1, 3, 1,
+        1, 1, 2, 3, 1, 2, 6, 1, 6, 1, 1, 2, 4, 1, 1, 2, 32, 1, 3, 1, 3, 1, 13,
+        2, 3, 1, 7, 1, 1, 1, 5, 1, 3, 1, 6, 3, 17, 1, 3, 1, 3, 1, 3, 2, 1, 1,
+        6, 1, 2, 1, 5, 1, 12, 1, 1, 1, 3, 4, 1, 1, 4, 1, 3, 1, 5, 2, 5, 1, 1,
+        3, 26, 1, 2, 1, 4, 1, 6, 1, 4, 1, 11, 1, 13, 1, 3, 1, 5, 1, 1, 1, 2, 1,
+        4, 2, 2, 1, 5, 1, 4, 1, 21, 1, 3, 1, 4, 1, 2, 1, 4, 1, 16, 1, 5, 1, 2,
+        2, 2, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 3, 1, 8, 1, 17, 1, 1, 1,
+        5, 1, 7, 1, 20, 1, 1, 2, 2, 2, 1, 1, 3, 1, 2, 1, 1, 1, 1, 1, 6, 2, 1,
+        1, 13, 1, 1, 1, 1, 1, 1, 1, 5, 1, 4, 1, 4, 1, 5, 1, 9, 1, 4, 3, 2, 1,
+        22, 1, 2, 1, 7, 1, 1, 1, 2, 1, 6, 1, 10, 1, 1, 3, 4, 2, 9, 1, 6, 1, 7,
+        1, 3, 3, 5, 1, 6, 2, 6, 2, 3, 2, 12, 1, 2, 2, 3, 1, 2, 1, 3, 2, 2, 1,
+        11, 2, 2, 1, 18, 1, 17, 1, 14, 1, 1, 1, 3, 2, 5, 2, 1, 2, 7, 1, 17, 1,
+        16, 1, 1, 1, 6, 1, 15, 2, 4, 1, 29, 1, 3, 1, 8, 1, 4, 1, 1, 1, 3, 1, 4,
+        1, 8, 1, 16, 1, 1, 1, 1, 2, 4, 1, 15, 1, 1, 1, 1, 1, 49, 1, 6, 1, 1, 1,
+        7, 1, 6, 1, 1, 1, 11, 1, 1, 1, 1, 1, 9, 1, 10, 1, 17, 1, 2, 1, 16, 1,
+        6, 1, 9, 1, 27, 1, 11, 1, 2, 1, 2, 1, 6, 1, 1, 1, 2, 1, 6, 1, 25, 1, 2,
+        2, 13, 1, 4, 1, 4, 1, 4, 1, 5, 1, 5, 2, 4, 2, 3, 1, 1, 1, 1, 1, 1, 1,
+        3, 3, 4, 1, 2, 1, 4, 1, 1, 1, 4, 1, 6, 2, 1, 2, 5, 1, 2, 1, 1, 1, 4, 1,
+        3, 2, 6, 1, 12, 1, 8, 1, 12, 2, 12, 1, 4, 2, 3, 1, 2, 2, 1, 1, 1, 1, 6,
+        1, 10, 3, 2, 1, 4, 1, 9, 1, 8, 1, 1, 2, 4, 2, 11, 1, 4, 1, 11, 1, 1, 1,
+        2, 1, 5, 1, 2, 1, 26, 1, 4, 1, 5, 1, 7, 1, 12, 1, 1, 1, 1, 1, 2, 2, 3,
+        1, 3, 1, 3, 1, 2, 1, 10, 1, 7, 2, 7, 1, 7, 1, 2, 1, 2, 1, 17, 1, 16, 1,
+        16, 1, 3, 1, 7, 1, 1, 2, 4, 1, 1, 1, 1, 1, 1, 1, 4, 1, 2, 3, 2, 1, 1,
+        1, 1, 1, 3, 1, 1, 1, 4, 1, 2, 1, 3, 1, 2, 1, 1, 1, 3, 2, 20, 1, 3, 2,
+        5, 1, 2, 1, 1, 1, 1, 2, 2, 1, 2, 1, 3, 2, 1, 4, 1, 1, 3, 1, 11, 1, 1,
+        1, 4, 2, 5, 1, 1, 1, 2, 1, 5, 1, 1, 2, 1, 4, 1, 1, 1, 1, 5, 1, 1, 1, 6,
+        1, 2, 1, 1, 2, 2, 1, 1, 1, 2, 1, 3, 1, 1, 1, 1, 1, 2, 1, 3, 1, 4, 2, 4,
+        1, 4, 2, 2, 2, 1, 2, 2, 1, 4, 3, 1, 1, 3, 1, 1, 3, 1, 1, 9, 1, 1, 1, 3,
+        1, 1, 2, 1, 3, 1, 1, 2, 1, 7, 1, 2, 2, 6, 1, 5, 1, 7, 1, 7, 1, 4, 2, 8,
+        1, 1, 1, 1, 1, 9, 1, 5, 1, 2, 2, 3, 1, 2, 1, 5, 1, 2, 1, 9, 1, 5, 1, 1,
+        2, 2, 1, 3, 1, 156, 1, 7, 1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 1, 8, 1, 4, 1,
+        6, 1, 8, 2, 13, 2, 7, 1, 7, 1, 1, 1, 16, 2, 1, 3, 4, 6, 2, 2, 2, 2, 1,
+        3, 2, 3, 1, 6, 2, 2, 1, 1, 6, 1, 1, 1, 6, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1,
+        1, 3, 1, 2, 1, 6, 1, 6, 3, 6, 2, 1, 2, 1, 1, 2, 1, 5, 1, 2, 1, 77, 1,
+        1, 1, 4, 1, 4, 1, 2, 2, 2, 1, 13, 1, 4, 1, 14, 1, 9, 1, 4, 1, 10, 1, 6,
+        1, 3, 1, 7, 1, 4, 2, 2, 1, 11, 1, 1, 1, 3, 1, 1, 1, 4, 1, 6, 1, 3, 1,
+        22, 1, 4, 2, 13, 1, 11, 1, 5, 1, 4, 1, 12, 1, 1, 1, 2, 4, 14, 1, 5, 2,
+        19, 1, 1, 1, 10, 1, 5, 1, 2, 1, 2, 1, 28, 3, 19, 1, 9, 4, 4, 1, 12, 1,
+        11, 1, 12, 1, 2, 1, 2, 1, 4, 1, 1, 1, 3, 1, 8, 4, 5, 5, 6, 2, 1, 2, 4,
+        1, 3, 1, 4, 2, 1, 1, 2, 2, 4, 2, 3, 1, 3, 2, 14, 1, 1, 1, 2, 1, 56, 2,
+        6, 1, 2, 1, 1, 1, 4, 1, 1, 4, 15, 1, 2, 1, 8, 1, 2, 1, 2, 1, 17, 1, 3,
+        2, 1, 1, 2, 1, 1, 1, 4, 1, 1, 1, 3, 1, 2, 4, 1, 2, 1, 1, 2, 1, 1, 1, 1,
+        3, 2, 2, 1, 1, 1, 2, 2, 7, 10, 1, 2, 2, 2, 1, 2, 1, 3, 1, 1, 1, 2, 2,
+        4, 1, 2, 2, 1, 2, 1, 2, 1, 3, 3, 1, 2, 3, 1, 2, 1, 1, 5, 1, 3, 3, 2, 1,
+        2, 1, 1, 2, 1, 1, 1, 2, 1, 6, 2, 2, 1, 1, 4, 1, 1, 1, 3, 1, 3, 1, 8, 2,
+        2, 1, 1, 1, 1, 1, 4, 3, 3, 1, 2, 1, 8, 1, 8, 1, 19, 1, 2, 1, 6, 1, 4,
+        1, 7, 1, 7, 1, 4, 1, 15, 1, 2, 1, 3, 1, 13, 1, 5, 1, 4, 1, 22, 6, 3, 1,
+        15, 1, 6, 2, 1, 1, 8, 1, 1, 2, 14, 1, 1, 1, 1, 1, 1, 1, 4, 1, 9, 1, 14,
+        2, 1, 2, 1, 1, 2, 2, 10, 1, 6, 1, 1, 1, 1, 7, 5, 2, 3, 2, 5, 1, 3, 1,
+        2, 1, 10, 1, 23, 1, 2, 3, 4, 1, 6, 1, 21, 1, 5, 1, 4, 2, 4, 1, 3, 1,
+        13, 1, 3, 1, 2, 1, 3, 1, 1, 3, 25, 1, 2, 1, 1, 1, 11, 1, 1, 1, 2, 1, 1,
+        1, 3, 1, 22, 1, 2, 2, 1, 1, 18, 1, 2, 1, 2, 1, 17, 1, 5, 1, 13, 1, 3,
+        1, 7, 1, 11, 1, 7, 1, 1, 1, 3, 5, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 24, 1,
+        1, 2, 1, 1, 6, 1, 6, 1, 18, 1, 6, 1, 6, 1, 1, 1, 13, 1, 7, 1, 1, 1, 3,
+        1, 8, 1, 3, 1, 4, 2, 2, 1, 18, 1, 13, 1, 12, 1, 2, 1, 2, 1, 17, 1, 13,
+        1, 19, 1, 12, 1, 5, 1, 9, 1, 2, 1, 11, 1, 12, 2, 8, 1, 33, 1, 1, 1,
+        247, 1, 8, 1, 2, 1, 5, 1, 1, 1, 3, 1, 1, 4, 3, 1, 10, 3, 2, 1, 4, 1, 3,
+        1, 9, 2, 10, 1, 2, 1, 9, 3, 5, 1, 4, 2, 57, 1, 4, 1, 8, 1, 3, 1, 3, 1,
+        8, 1, 3, 2, 1, 1, 1, 1, 6, 3, 2, 1, 10, 5, 2, 3, 5, 1, 5, 1, 2, 1, 1,
+        4, 4, 1, 7, 2, 3, 2, 1, 2, 5, 2, 2, 2, 1, 2, 6, 1, 3, 2, 1, 1, 6, 1, 5,
+        1, 3, 1, 4, 2, 2, 4, 1, 1, 1, 4, 6, 2, 2, 1, 1, 2, 5, 2, 4, 3, 4, 2, 1,
+        1, 3, 2, 1, 1, 1, 1, 4, 1, 5, 2, 9, 1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 8,
+        1, 8, 1, 1, 1, 6, 1, 3, 1, 4, 1, 1, 1, 3, 1, 8, 1, 4, 1, 5, 1, 1, 1, 2,
+        2, 6, 1, 3, 1, 6, 1, 2, 1, 2, 1, 16, 1, 1, 1, 1, 1, 16, 1, 7, 1, 2, 1,
+        1, 1, 24, 1, 4, 1, 7, 1, 8, 1, 22, 1, 2, 1, 4, 1, 3, 5, 1, 2, 1, 1, 1,
+        1, 1, 1, 3, 4, 3, 2, 20, 1, 2, 1, 7, 2, 1, 1, 10, 1, 5, 3, 5, 1, 3, 1,
+        1, 1, 3, 1, 6, 1, 1, 1, 3, 1, 3, 1, 56, 1, 6, 1, 1, 1, 18, 1, 2, 1, 19,
+        2, 2, 1, 1, 2, 10, 3, 4, 1, 7, 3, 4, 1, 5, 2, 1, 1, 3, 1, 2, 1, 4, 1,
+        5, 1, 1, 1, 7, 1, 28, 1, 3, 1, 1, 3, 3, 2, 1, 1, 2, 1, 62, 1, 2, 1, 3,
+        1, 7, 1, 2, 1, 3, 3, 2, 1, 1, 2, 4, 1, 7, 1, 14, 3, 2, 1, 3, 1, 3, 1,
+        1, 1, 13, 1, 3, 1, 13, 1, 1, 1, 6, 1, 5, 2, 9, 1, 17, 1, 4, 1, 5, 2, 8,
+        1, 2, 1, 1, 1, 7, 1, 7, 1, 1, 1, 2, 2, 3, 1, 2, 1, 2, 1, 3, 2, 61, 1,
+        15, 1, 26, 2, 3, 1, 12, 1, 8, 1, 43, 1, 12, 1, 2, 1, 6, 1, 10, 1, 4, 5,
+        9, 1, 4, 1, 5, 1, 20, 1, 30, 1, 2, 1, 13, 1, 11, 1, 2, 1, 26, 1, 12, 1,
+        13, 1, 3, 1, 36, 1, 2, 1, 1, 1, 2, 1, 15, 1, 12, 1, 8, 1, 11, 1, 1, 1,
+        13, 1, 141, 1, 1, 1, 1, 1, 9, 2, 1, 1, 18, 1, 17, 1, 10, 1, 1, 1, 18,
+        1, 21, 1, 11, 1, 2, 2, 10, 1, 5, 1, 54, 1, 5, 1, 4, 1, 15, 1, 18, 1,
+        26, 1, 5, 3, 31, 1, 3, 1, 86, 1, 3, 1, 3, 1, 1, 1, 18, 2, 3, 1, 5, 1,
+        1, 1, 5, 1, 14, 2, 5, 1, 2, 1, 4, 1, 9, 2, 2, 1, 2, 1, 3, 1, 2, 2, 1,
+        1, 9, 1, 11, 1, 18, 2, 5, 1, 4, 1, 12, 1, 26, 1, 14, 2, 2, 1, 3, 1, 12,
+        1, 1, 1, 5, 1, 2, 1, 1, 1, 10, 1, 21, 1, 2, 1, 4, 1, 6, 1, 3171, 11172,
+        8540, 268, 1269, 94, 129, 4, 1, 2,
+    ]
 }
@@ -2,6 +2,8 @@
 //
 // Any copyright is dedicated to the Public Domain.
 // https://creativecommons.org/publicdomain/zero/1.0/
+//
+// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
 
 //! Korean index tables for [rust-encoding](https://github.com/lifthrasiir/rust-encoding).
 
@@ -17,5 +19,5 @@ extern crate encoding_index_tests;
 ///
 /// > This matches the KS X 1001 standard and the Unified Hangul Code,
 /// > more commonly known together as Windows Codepage 949.
+#[cfg(feature = "index-euc-kr")]
 pub mod euc_kr;
-
@@ -5560,5 +5560,29 @@ pub fn backward(code: u32) -> u16 {
 multi_byte_tests! {
     dups = [
         6555,
+    ],
+    golden = [
+        0xb7e17f5fffc6c4fa, 0xcd774bc43c342fea, // forward & backward hash
+        // 23939 valid code points in 207 runs
+        164, 1, 2, 2, 7, 2, 5, 1, 31, 1, 8, 2, 6, 3, 1, 2, 4, 2, 3, 1, 1, 2, 1,
+        1, 4, 1, 17, 1, 7, 1, 15, 1, 24, 1, 3, 1, 4, 1, 29, 1, 98, 1, 1, 1, 1,
+        1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 28, 1, 87, 1, 15, 1, 101, 1, 1, 3, 13,
+        1, 183, 17, 1, 7, 7, 17, 1, 7, 55, 1, 14, 64, 1, 1, 6637, 1, 464, 1, 2,
+        4, 1, 2, 2, 2, 7, 2, 9, 1, 1, 2, 1, 1, 5, 1, 112, 1, 86, 1, 1, 1, 3, 1,
+        12, 1, 10, 1, 62, 12, 4, 10, 22, 4, 2, 4, 110, 1, 6, 1, 1, 1, 3, 1, 4,
+        1, 2, 4, 2, 1, 1, 1, 1, 5, 2, 1, 5, 4, 5, 1, 10, 1, 3, 1, 5, 1, 13, 2,
+        2, 4, 6, 2, 37, 1, 3, 1, 11, 1, 25, 1, 82, 1, 333, 10, 10, 40, 100, 76,
+        4, 36, 13, 15, 3, 3, 10, 2, 16, 2, 8, 2, 8, 2, 3, 1, 2, 2, 18, 4, 31,
+        2, 2, 1, 54, 1, 1, 1, 2110, 1, 2, 1, 3, 1, 2, 2, 10, 1, 15, 1, 2, 1, 3,
+        1, 4, 1, 2, 2, 3, 1, 14, 1, 293, 12, 4, 4, 1, 19, 5, 2, 2, 9, 20, 1, 2,
+        83, 7, 4, 2, 86, 5, 3, 6, 37, 246, 10, 7, 1, 113, 1, 234, 2, 12, 3, 2,
+        1, 34, 1, 9, 1, 2, 2, 2, 1, 113, 1, 43, 1, 298, 1, 111, 1, 11, 1, 765,
+        1, 85, 1, 96, 2, 14, 1, 147, 1, 218, 1, 287, 1, 113, 1, 885, 1, 264, 1,
+        471, 1, 116, 1, 4, 1, 43, 1, 248, 1, 373, 1, 20, 1, 193, 1, 5, 1, 82,
+        1, 16, 1, 441, 1, 50, 1, 2, 1, 4, 2, 1, 2, 20, 1, 3, 1, 22, 2, 703, 1,
+        39, 5, 111, 7, 148, 1, 81, 20902, 16474, 1509, 1, 390, 1, 90, 2, 30,
+        13, 33, 1, 3, 5, 1, 7, 1, 4, 2, 4, 2, 8, 1, 7, 1, 16, 2, 14, 1, 4295,
+        1, 76, 1, 27, 1, 81, 1, 9, 1, 26, 4, 1, 1, 1, 2, 3, 1, 6, 3, 1, 2, 2,
+        3, 1030, 2, 1, 18, 4, 10, 1, 4, 1, 14, 1, 4, 149, 94, 129, 6,
     ]
 }
@@ -9,7 +9,7 @@
 // Identifier: f963aaa1653f630c523e7b04729fb4e4458f35806c45eb5c179445623138f0c0
 // Date: 2016-01-20
 
-const FORWARD_TABLE: &'static [u32] = &[
+const FORWARD_TABLE: &'static [u16] = &[
     0, 128, 165, 169, 178, 184, 216, 226, 235, 238, 244, 248, 251, 253, 258,
     276, 284, 300, 325, 329, 334, 364, 463, 465, 467, 469, 471, 473, 475, 477,
     506, 594, 610, 712, 716, 730, 930, 938, 962, 970, 1026, 1104, 1106, 8209,
@@ -28,10 +28,10 @@ const FORWARD_TABLE: &'static [u32] = &[
     59244, 59336, 59367, 59413, 59417, 59423, 59431, 59437, 59443, 59452,
     59460, 59478, 59493, 63789, 63866, 63894, 63976, 63986, 64016, 64018,
     64021, 64025, 64034, 64037, 64042, 65074, 65093, 65107, 65112, 65127,
-    65132, 65375, 65510, 65536,
-]; // 208 entries
+    65132, 65375, 65510,
+]; // 207 entries
 
-const BACKWARD_TABLE: &'static [u32] = &[
+const BACKWARD_TABLE: &'static [u16] = &[
     0, 0, 36, 38, 45, 50, 81, 89, 95, 96, 100, 103, 104, 105, 109, 126, 133,
     148, 172, 175, 179, 208, 306, 307, 308, 309, 310, 311, 312, 313, 341, 428,
     443, 544, 545, 558, 741, 742, 749, 750, 805, 819, 820, 7922, 7924, 7925,
@@ -50,19 +50,66 @@ const BACKWARD_TABLE: &'static [u32] = &[
     33471, 33484, 33485, 33490, 33497, 33501, 33505, 33513, 33520, 33536,
     33550, 37845, 37921, 37948, 38029, 38038, 38064, 38065, 38066, 38069,
     38075, 38076, 38078, 39108, 39109, 39113, 39114, 39115, 39116, 39265,
-    39394, 189000,
-]; // 208 entries
+    39394,
+]; // 207 entries
 
-fn search(code: u32, fromtab: &'static [u32], totab: &'static [u32]) -> u32 {
-    let mut i = if code >= fromtab[127] {81} else {0};
-    if code >= fromtab[i+63] { i += 64; }
-    if code >= fromtab[i+31] { i += 32; }
-    if code >= fromtab[i+15] { i += 16; }
-    if code >= fromtab[i+7] { i += 8; }
-    if code >= fromtab[i+3] { i += 4; }
-    if code >= fromtab[i+1] { i += 2; }
-    if code >= fromtab[i] { i += 1; }
-    (code - fromtab[i-1]) + totab[i-1]
+const FORWARD_BUCKETS: &'static [u16] = &[
+    33076, 33108, 33116, 30, 33132, 33140, 33156, 42, 42, 42, 42, 42, 42, 42,
+    42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+    42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42,
+    42, 42, 42, 42, 42, 42, 42, 42, 42, 33164, 33180, 33196, 33212, 33220,
+    33252, 83, 84, 84, 33260, 33268, 99, 101, 101, 101, 101, 101, 101, 101,
+    101, 101, 101, 101, 101, 101, 101, 101, 33284, 113, 113, 33308, 124, 124,
+    126, 127, 33332, 134, 135, 136, 136, 137, 139, 139, 139, 139, 139, 139,
+    141, 143, 144, 144, 145, 145, 146, 147, 147, 147, 147, 147, 147, 147, 148,
+    148, 149, 149, 149, 149, 33348, 153, 153, 154, 154, 154, 156, 33356, 159,
+    160, 160, 33364, 33380, 168, 168, 168, 168, 168, 169, 171, 171, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173, 173,
+    173, 173, 173, 173, 173, 33388, 185, 186, 186, 186, 186, 186, 186, 186,
+    186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186,
+    186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 186, 187, 33412, 198,
+    198, 198, 198, 198, 198, 198, 33428, 204, 205, 1, 1, 33084, 4, 5, 33092,
+    33100, 14, 1, 1, 2, 3, 3, 3, 3, 4, 5, 6, 6, 6, 6, 7, 7, 7, 9, 9, 10, 10,
+    12, 13, 13, 14, 15, 16, 17, 19, 20, 21, 21, 21, 21, 21, 21, 33124, 29, 29,
+    30, 30, 21, 22, 24, 26, 28, 29, 29, 29, 32, 32, 33, 35, 35, 35, 35, 35, 35,
+    35, 35, 35, 35, 35, 33148, 39, 35, 35, 35, 37, 37, 37, 37, 39, 39, 39, 39,
+    40, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 42, 33172, 42, 43, 44, 45, 46,
+    46, 46, 47, 33188, 51, 51, 51, 51, 51, 51, 51, 47, 47, 47, 47, 49, 50, 50,
+    51, 52, 52, 52, 52, 52, 33204, 55, 57, 52, 52, 53, 54, 55, 55, 55, 55, 57,
+    57, 57, 59, 59, 61, 61, 61, 61, 61, 61, 33228, 33236, 71, 74, 33244, 61,
+    61, 61, 62, 62, 62, 63, 64, 65, 65, 66, 67, 68, 70, 71, 71, 76, 76, 76, 77,
+    78, 78, 78, 79, 79, 79, 79, 82, 82, 83, 83, 83, 86, 86, 86, 86, 86, 86, 88,
+    90, 91, 33276, 96, 97, 97, 99, 99, 99, 93, 93, 94, 94, 95, 96, 96, 96, 101,
+    101, 101, 101, 33292, 105, 33300, 112, 101, 102, 103, 104, 105, 105, 105,
+    105, 106, 107, 108, 109, 109, 110, 111, 111, 113, 113, 33316, 118, 33324,
+    122, 124, 124, 113, 114, 114, 115, 116, 116, 117, 118, 118, 119, 120, 120,
+    120, 120, 121, 122, 127, 127, 127, 128, 130, 130, 33340, 134, 131, 131,
+    131, 131, 131, 132, 133, 134, 150, 150, 150, 150, 152, 152, 152, 153, 156,
+    156, 156, 158, 158, 158, 158, 158, 160, 160, 160, 160, 160, 161, 161,
+    33372, 161, 161, 161, 162, 163, 163, 165, 165, 165, 166, 167, 168, 168,
+    168, 168, 168, 173, 173, 173, 33396, 176, 33404, 181, 184, 173, 173, 173,
+    173, 173, 173, 173, 175, 178, 179, 179, 179, 179, 180, 180, 181, 189, 190,
+    191, 33420, 198, 198, 198, 198, 192, 194, 194, 195, 195, 195, 197, 198,
+    198, 198, 198, 198, 33436, 204, 204, 204, 198, 198, 199, 200, 200, 202,
+    204, 204,
+]; // 676 entries
+
+fn search(code: u32, fromtab: &'static [u16], totab: &'static [u16]) -> u32 {
+    let mut i = if code >= fromtab[127] as u32 {80} else {0};
+    if code >= fromtab[i+63] as u32 { i += 64; }
+    if code >= fromtab[i+31] as u32 { i += 32; }
+    if code >= fromtab[i+15] as u32 { i += 16; }
+    if code >= fromtab[i+7] as u32 { i += 8; }
+    if code >= fromtab[i+3] as u32 { i += 4; }
+    if code >= fromtab[i+1] as u32 { i += 2; }
+    if code >= fromtab[i] as u32 { i += 1; }
+    (code - fromtab[i-1] as u32) + totab[i-1] as u32
 }
 
 /// Returns the index code point for pointer `code` in this index.
@@ -70,7 +117,23 @@ fn search(code: u32, fromtab: &'static [u32], totab: &'static [u32]) -> u32 {
 pub fn forward(code: u32) -> u32 {
     if (code > 39419 && code < 189000) || code > 1237575 { return 0xffffffff; }
     if code == 7457 { return 0xe7c7; }
-    search(code, BACKWARD_TABLE, FORWARD_TABLE)
+    if code >= 189000 { return (code - 189000) + 65536; }
+    let i = if code < 39394 {
+        let mut shift = 7;
+        let mut bucket = FORWARD_BUCKETS[(code >> shift) as usize];
+        while bucket >= 0x8000 {
+            shift -= 3;
+            let child = ((code >> shift) & 7) as usize;
+            bucket = FORWARD_BUCKETS[(bucket & 0x7fff) as usize + child];
+        }
+        let mut i = bucket as usize;
+        if code >= BACKWARD_TABLE[i+1] as u32 { i += 1; }
+        if code >= BACKWARD_TABLE[i+1] as u32 { i += 1; }
+        i
+    } else {
+        206
+    };
+    (code - BACKWARD_TABLE[i] as u32) + FORWARD_TABLE[i] as u32
 }
 
 /// Returns the index pointer for code point `code` in this index.
@@ -78,6 +141,7 @@ pub fn forward(code: u32) -> u32 {
 pub fn backward(code: u32) -> u32 {
     if code < 128 { return 0xffffffff; }
     if code == 0xe7c7 { return 7457; }
+    if code >= 65536 { return (code - 65536) + 189000; }
     search(code, FORWARD_TABLE, BACKWARD_TABLE)
 }
 
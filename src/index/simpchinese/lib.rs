@@ -2,6 +2,8 @@
 //
 // Any copyright is dedicated to the Public Domain.
 // https://creativecommons.org/publicdomain/zero/1.0/
+//
+// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
 
 //! Simplified Chinese index tables for
 //! [rust-encoding](https://github.com/lifthrasiir/rust-encoding).
@@ -18,6 +20,7 @@ extern crate encoding_index_tests;
 ///
 /// > This matches the GB18030 standard for code points encoded as two bytes,
 /// > except `0xA3 0xA0` maps to U+3000 to be compatible with deployed content.
+#[cfg(feature = "index-gb18030")]
 pub mod gb18030;
 
 /// GB 18030 four-byte area.
@@ -29,5 +32,5 @@ pub mod gb18030;
 /// > whereas they can be represented neatly in 207 ranges combined with trivial limit checks.
 /// > It therefore only superficially matches the GB18030 standard
 /// > for code points encoded as four bytes.
+#[cfg(feature = "index-gb18030-ranges")]
 pub mod gb18030_ranges;
-
@@ -50,21 +50,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 357 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    182, 0, 229, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 79, 293,
-    64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 143,
-]; // 129 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    60031158, 0, 0, 0, 0, 0, 20709376, 33061, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    37486592,
+]; // 129 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 129 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 129 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -81,4 +78,10 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xbcb2f9d3fef87b89, 0x2023d2e33e4f77c5, // forward & backward hash
+        // 94 valid code points in 11 runs
+        40, 2, 2, 3, 113, 1, 10, 1, 15, 1, 1141, 38, 3, 5, 2, 39, 1, 2, 6793,
+        1, 17, 1,
+    ]
 }
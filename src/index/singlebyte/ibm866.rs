@@ -59,22 +59,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 480 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 177, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 416, 64, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 145, 0, 0, 0, 103, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 241, 353, 305,
-]; // 151 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    46399488, 0, 0, 0, 0, 16990208, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    145, 52736, 0, 0, 0, 92660224, 305,
+]; // 151 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 151 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 151 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -91,4 +87,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x2744d888837fd451, 0x3024619f69efbacd, // forward & backward hash
+        // 128 valid code points in 33 runs
+        160, 1, 3, 1, 11, 1, 6, 1, 841, 1, 2, 1, 2, 1, 6, 1, 1, 64, 1, 1, 2, 1,
+        2, 1, 6, 1, 7351, 1, 258, 2, 741, 1, 1, 1, 9, 1, 3, 1, 3, 1, 3, 1, 3,
+        1, 7, 1, 7, 1, 7, 1, 7, 1, 19, 29, 19, 1, 3, 1, 3, 1, 3, 1, 3, 4, 12,
+        1,
+    ]
 }
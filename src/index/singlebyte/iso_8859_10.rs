@@ -53,21 +53,17 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 370 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 191, 127, 64, 306, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 247,
-]; // 129 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    50069504, 80248959, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64749568,
+]; // 129 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 129 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 129 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -84,4 +80,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x76dcb7b8b4d4eccb, 0xca1e6eff7d9cead3, // forward & backward hash
+        // 128 valid code points in 36 runs
+        128, 33, 6, 1, 5, 1, 2, 1, 6, 1, 9, 6, 2, 1, 1, 1, 1, 4, 2, 4, 1, 1, 1,
+        6, 1, 6, 2, 1, 1, 1, 1, 4, 2, 4, 1, 1, 1, 5, 1, 2, 2, 2, 6, 2, 2, 4, 2,
+        4, 8, 2, 4, 4, 2, 2, 6, 3, 2, 2, 8, 2, 3, 4, 18, 2, 4, 6, 6, 2, 9, 2,
+        7830, 1,
+    ]
 }
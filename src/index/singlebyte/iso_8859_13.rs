@@ -53,21 +53,17 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 376 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 64, 249, 128, 312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 189,
-]; // 129 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    16777216, 81854713, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 49545216,
+]; // 129 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 129 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 129 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -84,4 +80,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xff2814839296754a, 0xd7bf543702e6a94e, // forward & backward hash
+        // 128 valid code points in 40 runs
+        128, 33, 1, 3, 1, 2, 1, 1, 1, 4, 1, 4, 1, 3, 1, 1, 1, 4, 5, 3, 2, 1, 9,
+        1, 1, 4, 3, 1, 2, 1, 4, 3, 2, 1, 9, 1, 1, 4, 3, 1, 3, 2, 2, 4, 4, 2, 4,
+        2, 2, 4, 8, 2, 6, 2, 2, 2, 6, 2, 3, 2, 4, 6, 5, 2, 8, 2, 2, 2, 4, 2, 8,
+        2, 6, 2, 5, 6, 7834, 1, 2, 3,
+    ]
 }
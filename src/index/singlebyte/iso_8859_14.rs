@@ -57,21 +57,17 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 480 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 352, 416, 194, 76, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 256, 140,
-    64, 288,
-]; // 124 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    92274688, 20022688, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 16849152, 288,
+]; // 124 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 124 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 124 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -88,4 +84,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xca9bbe894a4ab17b, 0x4de2964322b36423, // forward & backward hash
+        // 128 valid code points in 25 runs
+        128, 33, 2, 1, 3, 1, 1, 1, 3, 2, 7, 1, 9, 16, 1, 6, 1, 6, 1, 17, 1, 6,
+        1, 6, 1, 1, 10, 2, 20, 2, 82, 5, 7305, 2, 6, 2, 18, 2, 32, 2, 20, 2, 8,
+        2, 8, 2, 20, 6, 108, 2,
+    ]
 }
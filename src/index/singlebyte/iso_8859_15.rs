@@ -48,7 +48,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 258 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 130, 194, 0, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -79,4 +79,10 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xc45b0dc20d90f364, 0xb229ed3be217bc08, // forward & backward hash
+        // 128 valid code points in 12 runs
+        128, 36, 1, 1, 1, 1, 1, 11, 1, 3, 1, 3, 3, 65, 82, 2, 12, 2, 22, 1, 4,
+        2, 7981, 1,
+    ]
 }
@@ -56,21 +56,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 438 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 64, 374, 221, 310, 0, 0, 124, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 159, 0, 247,
-]; // 131 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    16777216, 81378166, 32505856, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    41680896, 126464,
+]; // 131 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 131 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 131 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -87,4 +84,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xf587e3792fd31fb8, 0x64c8ece3fc025cc, // forward & backward hash
+        // 128 valid code points in 34 runs
+        128, 33, 6, 1, 1, 1, 1, 1, 1, 1, 2, 2, 4, 2, 3, 1, 4, 3, 1, 1, 1, 10,
+        2, 3, 1, 1, 2, 4, 2, 4, 1, 1, 1, 10, 2, 3, 1, 1, 2, 4, 2, 1, 2, 6, 4,
+        2, 2, 2, 6, 2, 39, 4, 11, 4, 6, 2, 4, 2, 14, 2, 6, 7, 153, 4, 7681, 2,
+        141, 1,
+    ]
 }
@@ -48,7 +48,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 256 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 135, 32, 151, 48, 72, 208, 87, 165, 179, 195, 0,
     119, 102, 224, 240, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 111, 57,
@@ -76,4 +76,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x5a090e5f582a7c2e, 0xcc3810ad6b38be36, // forward & backward hash
+        // 128 valid code points in 45 runs
+        128, 33, 3, 1, 2, 2, 4, 1, 2, 1, 3, 1, 3, 1, 8, 2, 1, 1, 2, 1, 1, 1, 1,
+        1, 1, 2, 4, 2, 1, 2, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1,
+        2, 4, 2, 1, 2, 2, 1, 1, 2, 4, 6, 4, 6, 6, 4, 29, 2, 2, 2, 2, 4, 2, 2,
+        7, 2, 2, 2, 2, 4, 2, 8, 8, 4, 7, 6, 328, 1, 16, 2, 1, 1, 1, 1,
+    ]
 }
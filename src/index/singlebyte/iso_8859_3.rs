@@ -45,7 +45,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 184 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 80, 88, 96, 104, 112,
     51, 141, 43, 133, 125, 148, 156, 164, 35, 59, 0, 172, 0, 12, 20, 0, 28, 0,
     0, 0, 0, 176, 0, 64, 0, 118, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -75,4 +75,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x93c679efbfb14afe, 0xeface363d667eabe, // forward & backward hash
+        // 121 valid code points in 29 runs
+        128, 33, 2, 2, 2, 2, 4, 1, 2, 1, 1, 4, 1, 2, 4, 1, 2, 3, 1, 1, 2, 9, 1,
+        4, 1, 2, 1, 4, 2, 4, 1, 1, 2, 9, 1, 4, 1, 2, 1, 4, 11, 4, 16, 6, 2, 4,
+        8, 2, 2, 2, 38, 4, 12, 2, 13, 2, 347, 2,
+    ]
 }
@@ -48,7 +48,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 260 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 120, 182, 136, 198, 89, 46, 104, 230, 152, 16, 244,
     217, 74, 26, 62, 166, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 207, 34,
@@ -76,4 +76,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x1802d120770d2b44, 0x13b52de0362800c, // forward & backward hash
+        // 128 valid code points in 40 runs
+        128, 33, 3, 1, 2, 2, 4, 1, 1, 2, 3, 1, 3, 1, 8, 6, 2, 1, 1, 1, 1, 2, 5,
+        5, 1, 3, 2, 1, 1, 6, 2, 1, 1, 1, 1, 2, 5, 5, 1, 3, 3, 2, 2, 2, 6, 2, 2,
+        4, 2, 4, 8, 2, 4, 4, 2, 2, 6, 3, 2, 2, 8, 2, 3, 4, 8, 2, 8, 2, 4, 6, 6,
+        2, 9, 2, 328, 1, 17, 1, 1, 1,
+    ]
 }
@@ -52,7 +52,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 297 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 233, 128, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -83,4 +83,9 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x1e345d9152d1ea82, 0xe969848276edff8e, // forward & backward hash
+        // 128 valid code points in 8 runs
+        128, 33, 6, 1, 5, 1, 851, 12, 1, 66, 1, 12, 1, 2, 7350, 1,
+    ]
 }
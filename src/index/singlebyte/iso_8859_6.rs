@@ -44,7 +44,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 179 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 0, 0, 95, 127, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     147, 63, 32,
@@ -72,4 +72,9 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x91305e9368673575, 0xedc5f2761a0d7a6d, // forward & backward hash
+        // 83 valid code points in 8 runs
+        128, 33, 3, 1, 8, 1, 1374, 1, 14, 1, 3, 1, 1, 26, 5, 19,
+    ]
 }
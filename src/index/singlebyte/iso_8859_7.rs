@@ -52,21 +52,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 352 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 143, 288, 128, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 202, 0, 228,
-]; // 131 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    16777216, 0, 0, 0, 75570688, 128, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 52953088,
+    116736,
+]; // 131 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 131 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 131 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -83,4 +80,10 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xcd0c863d943616e3, 0x6f3783ee79adc2ab, // forward & backward hash
+        // 125 valid code points in 18 runs
+        128, 33, 2, 1, 2, 4, 1, 3, 2, 4, 3, 1, 3, 1, 1, 1, 700, 1, 9, 3, 1, 3,
+        1, 1, 1, 20, 1, 44, 7238, 1, 2, 2, 146, 1, 2, 1,
+    ]
 }
@@ -48,7 +48,7 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 267 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
+const BACKWARD_TABLE_UPPER: &'static [u8] = &[
     0, 0, 203, 139, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -79,4 +79,9 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xe2a262f86d7a984, 0x943d5351c11cf54, // forward & backward hash
+        // 92 valid code points in 9 runs
+        128, 33, 1, 8, 1, 15, 1, 4, 24, 1, 31, 1, 1240, 27, 6691, 2, 7, 1,
+    ]
 }
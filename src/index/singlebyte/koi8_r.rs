@@ -62,22 +62,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 545 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 314, 82, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 481, 64, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    82313216, 82, 0, 0, 0, 17023488, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 282, 370, 0, 0, 243, 0, 0, 0, 0, 0,
-    0, 0, 146, 418, 210,
-]; // 151 entries
+    97137664, 63700992, 0, 0, 109650944, 210,
+]; // 151 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 151 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 151 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -94,4 +90,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x193ba7b633cf95fe, 0x2994b8d1a791873a, // forward & backward hash
+        // 128 valid code points in 31 runs
+        160, 1, 8, 1, 6, 1, 1, 1, 4, 1, 63, 1, 777, 1, 14, 64, 1, 1, 7623, 2,
+        45, 1, 27, 2, 186, 2, 478, 1, 1, 1, 9, 1, 3, 1, 3, 1, 3, 1, 3, 1, 7, 1,
+        7, 1, 7, 1, 7, 1, 19, 29, 19, 1, 3, 1, 3, 1, 3, 1, 3, 4, 12, 1,
+    ]
 }
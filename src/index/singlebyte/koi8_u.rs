@@ -64,22 +64,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 592 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 361, 162, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 528, 64, 144, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    378535936, 162, 0, 0, 0, 67649536, 144, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 329, 417, 0, 0, 96, 0, 0, 0, 0,
-    0, 0, 0, 226, 465, 290,
-]; // 151 entries
+    0, 437593088, 100663296, 0, 0, 487819264, 290,
+]; // 151 entries, 3 10-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 151 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 151 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 10)) & 0x3ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -96,4 +92,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x59feca0da11e989e, 0xb30489580484dcca, // forward & backward hash
+        // 128 valid code points in 43 runs
+        160, 1, 8, 1, 6, 1, 1, 1, 4, 1, 63, 1, 777, 1, 2, 1, 1, 2, 6, 1, 1, 64,
+        1, 1, 2, 1, 1, 2, 6, 1, 49, 2, 7559, 2, 45, 1, 27, 2, 186, 2, 478, 1,
+        1, 1, 9, 1, 3, 1, 3, 1, 3, 1, 3, 1, 7, 1, 7, 1, 7, 1, 7, 1, 19, 3, 1,
+        1, 2, 5, 2, 4, 1, 1, 2, 5, 21, 1, 3, 1, 3, 1, 3, 1, 3, 4, 12, 1,
+    ]
 }
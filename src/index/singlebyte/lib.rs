@@ -2,6 +2,8 @@
 //
 // Any copyright is dedicated to the Public Domain.
 // https://creativecommons.org/publicdomain/zero/1.0/
+//
+// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
 
 //! Single-byte index tables for
 //! [rust-encoding](https://github.com/lifthrasiir/rust-encoding).
@@ -12,88 +14,114 @@
 #[macro_use]
 extern crate encoding_index_tests;
 
-
 /// ARMSCII-8
+#[cfg(feature = "index-armscii-8")]
 pub mod armscii_8;
 
 /// IBM code page 866.
+#[cfg(feature = "index-ibm866")]
 pub mod ibm866;
 
 /// ISO 8859-2.
+#[cfg(feature = "index-iso-8859-2")]
 pub mod iso_8859_2;
 
 /// ISO 8859-3.
+#[cfg(feature = "index-iso-8859-3")]
 pub mod iso_8859_3;
 
 /// ISO 8859-4.
+#[cfg(feature = "index-iso-8859-4")]
 pub mod iso_8859_4;
 
 /// ISO 8859-5.
+#[cfg(feature = "index-iso-8859-5")]
 pub mod iso_8859_5;
 
 /// ISO 8859-6.
+#[cfg(feature = "index-iso-8859-6")]
 pub mod iso_8859_6;
 
 /// ISO 8859-7.
+#[cfg(feature = "index-iso-8859-7")]
 pub mod iso_8859_7;
 
 /// ISO 8859-8 (either visual or logical).
+#[cfg(feature = "index-iso-8859-8")]
 pub mod iso_8859_8;
 
 /// ISO 8859-10.
+#[cfg(feature = "index-iso-8859-10")]
 pub mod iso_8859_10;
 
 /// ISO 8859-13.
+#[cfg(feature = "index-iso-8859-13")]
 pub mod iso_8859_13;
 
 /// ISO 8859-14.
+#[cfg(feature = "index-iso-8859-14")]
 pub mod iso_8859_14;
 
 /// ISO 8859-15.
+#[cfg(feature = "index-iso-8859-15")]
 pub mod iso_8859_15;
 
 /// ISO 8859-16.
+#[cfg(feature = "index-iso-8859-16")]
 pub mod iso_8859_16;
 
 /// KOI8-R.
+#[cfg(feature = "index-koi8-r")]
 pub mod koi8_r;
 
 /// KOI8-U.
+#[cfg(feature = "index-koi8-u")]
 pub mod koi8_u;
 
 /// MacRoman.
+#[cfg(feature = "index-macintosh")]
 pub mod macintosh;
 
 /// Windows code page 874.
+#[cfg(feature = "index-windows-874")]
 pub mod windows_874;
 
 /// Windows code page 1250.
+#[cfg(feature = "index-windows-1250")]
 pub mod windows_1250;
 
 /// Windows code page 1251.
+#[cfg(feature = "index-windows-1251")]
 pub mod windows_1251;
 
 /// Windows code page 1252.
+#[cfg(feature = "index-windows-1252")]
 pub mod windows_1252;
 
 /// Windows code page 1253.
+#[cfg(feature = "index-windows-1253")]
 pub mod windows_1253;
 
 /// Windows code page 1254.
+#[cfg(feature = "index-windows-1254")]
 pub mod windows_1254;
 
-/// Windows code page 1254.
+/// Windows code page 1255.
+#[cfg(feature = "index-windows-1255")]
 pub mod windows_1255;
 
 /// Windows code page 1256.
+#[cfg(feature = "index-windows-1256")]
 pub mod windows_1256;
 
 /// Windows code page 1257.
+#[cfg(feature = "index-windows-1257")]
 pub mod windows_1257;
 
 /// Windows code page 1258.
+#[cfg(feature = "index-windows-1258")]
 pub mod windows_1258;
 
 /// MacCyrillic.
+#[cfg(feature = "index-x-mac-cyrillic")]
 pub mod x_mac_cyrillic;
-
@@ -132,4 +132,13 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x798c1e28385c1c65, 0xccf0115561135649, // forward & backward hash
+        // 128 valid code points in 43 runs
+        160, 4, 1, 1, 1, 6, 1, 4, 2, 5, 1, 2, 3, 17, 1, 6, 1, 5, 2, 17, 1, 12,
+        2, 1, 49, 1, 32, 2, 36, 1, 25, 1, 307, 2, 16, 6, 203, 1, 22, 1, 7250,
+        2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 9, 1, 103, 1, 117, 1, 223, 1, 3,
+        1, 8, 1, 1, 1, 8, 1, 3, 1, 12, 1, 28, 1, 23, 1, 3, 2, 868, 1, 54068, 1,
+        513, 2,
+    ]
 }
@@ -58,21 +58,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 495 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 126, 63, 368, 431, 0, 0, 0, 0, 0, 186, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 306, 0, 216, 0, 261,
-]; // 133 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    33030144, 113172543, 0, 48758784, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    80216064, 110592, 261,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -89,4 +86,14 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xbaa006838bf9b184, 0x694106b6fd1eef54, // forward & backward hash
+        // 128 valid code points in 59 runs
+        129, 1, 1, 1, 4, 1, 7, 1, 7, 1, 7, 1, 3, 1, 1, 4, 1, 4, 1, 2, 2, 5, 2,
+        1, 5, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 4, 2, 1, 2, 2, 1, 1, 2, 1, 1, 1,
+        2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 4, 2, 1, 2, 2, 1, 1, 2, 4, 6, 4, 6, 6,
+        4, 29, 2, 2, 2, 2, 4, 2, 2, 7, 2, 2, 2, 2, 4, 2, 8, 8, 4, 7, 6, 328, 1,
+        16, 2, 1, 1, 1, 1, 7477, 2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 113, 1,
+        117, 1,
+    ]
 }
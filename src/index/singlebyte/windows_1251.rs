@@ -56,21 +56,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 401 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 104, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 337, 64, 164, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 274, 0, 184, 0, 229,
-]; // 133 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    27262976, 0, 0, 0, 0, 16949760, 164, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 71827456,
+    94208, 229,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -87,4 +84,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xf655e2e3baef444f, 0xcddfd1834f76bfef, // forward & backward hash
+        // 128 valid code points in 24 runs
+        152, 1, 7, 1, 3, 1, 1, 2, 1, 1, 1, 4, 1, 2, 3, 3, 3, 1, 837, 12, 1, 66,
+        1, 12, 1, 2, 48, 2, 7041, 2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 113,
+        1, 105, 1, 11, 1,
+    ]
 }
@@ -56,21 +56,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 449 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 321, 385, 0, 258, 192, 0, 0, 0, 0, 58, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    84148224, 67633537, 192, 15204352, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 133, 0, 212, 0, 88,
-]; // 133 entries
+    34865152, 108544, 88,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -87,4 +84,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x78c4b27cf0da71cc, 0x5b9038dd2f8f1f88, // forward & backward hash
+        // 128 valid code points in 21 runs
+        129, 1, 11, 1, 1, 2, 12, 1, 2, 96, 82, 2, 12, 2, 22, 1, 4, 2, 19, 1,
+        307, 1, 21, 1, 7478, 2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 113, 1,
+        117, 1,
+    ]
 }
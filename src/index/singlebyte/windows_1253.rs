@@ -54,21 +54,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 392 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 63, 0, 0, 0, 193, 0, 0, 0, 0, 0, 0, 0, 328, 127, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 268, 0, 147, 0, 223,
-]; // 133 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    16515072, 0, 193, 0, 85983232, 127, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    70254592, 75264, 223,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -85,4 +82,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x3d2886299137ea02, 0x97a3bc260b14227a, // forward & backward hash
+        // 125 valid code points in 28 runs
+        129, 1, 6, 1, 1, 1, 1, 5, 7, 1, 1, 1, 1, 5, 2, 7, 1, 4, 1, 4, 1, 3, 3,
+        1, 1, 1, 212, 1, 497, 3, 1, 3, 1, 1, 1, 20, 1, 44, 7236, 3, 2, 3, 1, 3,
+        1, 3, 3, 1, 9, 1, 8, 2, 113, 1, 117, 1,
+    ]
 }
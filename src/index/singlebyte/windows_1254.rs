@@ -58,21 +58,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 486 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 358, 422, 123, 173, 230, 0, 0, 0, 0, 58, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    93847552, 45414310, 230, 15204352, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 295, 0, 250, 0, 88,
-]; // 133 entries
+    77332480, 128000, 88,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -89,4 +86,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x7a8c8a035e98b03a, 0x1811908d98d0aa02, // forward & backward hash
+        // 128 valid code points in 25 runs
+        129, 1, 11, 4, 12, 2, 1, 48, 1, 12, 2, 17, 1, 12, 2, 1, 30, 2, 16, 2,
+        32, 2, 10, 4, 22, 1, 25, 1, 307, 1, 21, 1, 7478, 2, 3, 3, 1, 3, 1, 3,
+        3, 1, 9, 1, 8, 2, 113, 1, 117, 1,
+    ]
 }
@@ -58,21 +58,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 492 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 292, 173, 0, 0, 409, 0, 0, 0, 0, 58, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    428, 356, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    76546048, 173, 409, 15204352, 0, 0, 0, 93542400, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 229, 0, 87, 0, 132,
-]; // 133 entries
+    60030976, 44544, 132,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -89,4 +86,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xfca072f021ec2930, 0x88952ea632d2446c, // forward & backward hash
+        // 117 valid code points in 28 runs
+        129, 1, 8, 1, 1, 5, 9, 1, 1, 8, 1, 5, 1, 15, 1, 5, 23, 1, 31, 1, 154,
+        1, 307, 1, 21, 1, 723, 10, 1, 9, 12, 27, 5, 5, 6681, 2, 3, 2, 3, 3, 1,
+        3, 1, 3, 3, 1, 9, 1, 8, 2, 111, 1, 1, 1, 117, 1,
+    ]
 }
@@ -57,27 +57,20 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 441 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 0, 0, 0, 101, 277, 184, 0, 0, 315, 0, 389, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    268, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 409, 215, 370, 69, 242, 338, 132, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    0, 26476544, 94485, 161280, 389, 0, 0, 137216, 0, 0, 0, 0, 0, 0, 0, 0,
+    97103769, 88728645, 132, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 152, 32, 0, 0, 0, 301, 0, 0, 0,
-    62,
-]; // 266 entries
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    8466432, 0, 301, 31744,
+]; // 266 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 5) as usize;
-    let offset = if offset < 266 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 266 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 31) as usize)]
 }
 
@@ -94,4 +87,13 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xd10234162b15d4b8, 0xf905f155a8b64fc4, // forward & backward hash
+        // 128 valid code points in 43 runs
+        160, 1, 1, 8, 1, 15, 1, 4, 24, 1, 8, 1, 1, 1, 4, 5, 2, 2, 4, 1, 2, 1,
+        1, 1, 1, 2, 85, 2, 62, 1, 307, 1, 837, 1, 14, 1, 3, 1, 1, 26, 5, 19,
+        38, 1, 4, 1, 7, 1, 1, 1, 8, 1, 6, 1, 16, 1, 5, 1, 10, 1, 3, 1, 2, 1,
+        16, 1, 6457, 4, 3, 2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 113, 1, 117,
+        1,
+    ]
 }
@@ -58,21 +58,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 493 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 366, 303, 64, 429, 0, 0, 0, 0, 0, 125, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 243, 0, 153, 0, 198,
-]; // 133 entries
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    95944704, 112492847, 0, 32768000, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    63700992, 78336, 198,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -89,4 +86,13 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x74697db35a332701, 0xc3e1c3ed5bf2e369, // forward & backward hash
+        // 126 valid code points in 55 runs
+        129, 1, 1, 1, 4, 1, 1, 1, 1, 1, 3, 1, 7, 1, 1, 1, 1, 1, 2, 2, 1, 3, 1,
+        4, 1, 15, 1, 4, 5, 3, 2, 1, 9, 1, 1, 4, 3, 1, 2, 1, 4, 3, 2, 1, 9, 1,
+        1, 4, 3, 1, 3, 2, 2, 4, 4, 2, 4, 2, 2, 4, 8, 2, 6, 2, 2, 2, 6, 2, 3, 2,
+        4, 6, 5, 2, 8, 2, 2, 2, 4, 2, 8, 2, 6, 2, 5, 6, 328, 1, 17, 1, 1, 1,
+        7479, 2, 3, 3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 113, 1, 117, 1,
+    ]
 }
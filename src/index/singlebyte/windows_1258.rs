@@ -60,21 +60,18 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 563 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 435, 499, 172, 110, 239, 0, 0, 0, 0, 297, 64, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    114032640, 28924403, 239, 77856768, 64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 372, 0, 193, 0, 327,
-]; // 133 entries
+    97517568, 98816, 327,
+]; // 133 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 6) as usize;
-    let offset = if offset < 133 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 133 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 63) as usize)]
 }
 
@@ -91,4 +88,12 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0x8f7d317e215dd552, 0x9f98c0a1b61f45fa, // forward & backward hash
+        // 128 valid code points in 40 runs
+        129, 1, 8, 1, 2, 4, 9, 1, 2, 2, 1, 35, 1, 8, 1, 3, 1, 1, 1, 2, 1, 7, 2,
+        4, 1, 8, 1, 3, 1, 1, 1, 2, 1, 7, 2, 1, 2, 2, 12, 2, 64, 2, 36, 1, 25,
+        1, 13, 2, 13, 2, 277, 1, 21, 1, 35, 2, 1, 1, 5, 1, 25, 1, 7407, 2, 3,
+        3, 1, 3, 1, 3, 3, 1, 9, 1, 8, 2, 112, 2, 117, 1,
+    ]
 }
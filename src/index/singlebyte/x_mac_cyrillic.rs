@@ -56,27 +56,20 @@ const BACKWARD_TABLE_LOWER: &'static [u8] = &[
 ]; // 388 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
-const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 0, 0, 0, 254, 0, 293, 0, 0, 0, 0, 119, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 324, 177, 356, 0, 81, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+const BACKWARD_TABLE_UPPER: &'static [u32] = &[
+    0, 66584576, 150016, 0, 119, 0, 0, 0, 0, 0, 84934656, 182449, 81, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 222, 209, 0, 0, 0, 65, 0, 0, 42, 284, 0, 0,
-    0, 0, 0, 0, 145, 0, 105, 32,
-]; // 276 entries
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 54901760, 0, 65,
+    145450, 0, 38010880, 8442368,
+]; // 276 entries, 3 9-bit entries per word
 
 /// Returns the index pointer for code point `code` in this index.
 #[inline]
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 pub fn backward(code: u32) -> u8 {
     let offset = (code >> 5) as usize;
-    let offset = if offset < 276 {BACKWARD_TABLE_UPPER[offset] as usize} else {0};
+    let offset = if offset < 276 {((BACKWARD_TABLE_UPPER[offset / 3] >> (offset % 3 * 9)) & 0x1ff) as usize} else {0};
     BACKWARD_TABLE_LOWER[offset + ((code & 31) as usize)]
 }
 
@@ -93,4 +86,11 @@ pub fn backward(code: u32) -> u8 {
 
 #[cfg(test)]
 single_byte_tests! {
+    golden = [
+        0xc984fa99bc4261cb, 0xe16499bfd5ec983b, // forward & backward hash
+        // 128 valid code points in 31 runs
+        160, 1, 2, 1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 2, 3, 2, 4, 1, 59, 1, 154, 1,
+        622, 12, 1, 66, 1, 12, 1, 2, 48, 2, 7041, 2, 3, 2, 2, 3, 1, 1, 1, 1, 3,
+        1, 133, 1, 105, 1, 11, 1, 227, 1, 19, 1, 3, 1, 41, 1, 23, 1, 3, 2,
+    ]
 }
@@ -3,16 +3,128 @@
 // See README.md and LICENSE.txt for details.
 
 //! Macros and utilities for testing indices.
+//!
+//! The index tests are driven by "golden vectors" generated by `gen_index.py`:
+//! the set of code points with a backward mapping, as a run-length-encoded list,
+//! and hashes of both forward and backward mappings.
+//! This allows checking every valid code point and a sample of invalid ones
+//! without calling `backward` for all 0x110000 code points.
+//! The exhaustive scan is still available with the `exhaustive-tests` feature
+//! of each index crate.
+
+/// A hash of the index mapping, compared against the hash computed by `gen_index.py`.
+///
+/// This is a 64-bit FNV-1a hash over the little endian representation of
+/// each pair of `u32`s, added in the increasing order of the first item.
+pub struct MappingHash(u64);
+
+impl MappingHash {
+    pub fn new() -> MappingHash {
+        MappingHash(0xcbf29ce484222325)
+    }
+
+    pub fn add(&mut self, from: u32, to: u32) {
+        for &v in &[from, to] {
+            for shift in &[0, 8, 16, 24] {
+                self.0 = (self.0 ^ ((v >> *shift) & 0xff) as u64).wrapping_mul(0x100000001b3);
+            }
+        }
+    }
+
+    pub fn finish(&self) -> u64 {
+        self.0
+    }
+}
+
+/// Expands a run-length-encoded list of valid code points
+/// (alternating numbers of invalid and valid code points, starting from 0)
+/// into a list of inclusive ranges.
+pub fn valid_ranges(runs: &[u32]) -> Vec<(u32, u32)> {
+    assert!(runs.len() % 2 == 0);
+    let mut ranges = Vec::with_capacity(runs.len() / 2);
+    let mut next = 0;
+    for run in runs.chunks(2) {
+        let start = next + run[0];
+        next = start + run[1];
+        ranges.push((start, next - 1));
+    }
+    ranges
+}
+
+/// Calls `f` with a deterministic sample of code points outside of `ranges`:
+/// both neighbors of each range, and 16 code points from each 4096 code points.
+pub fn sample_invalid<F: FnMut(u32)>(ranges: &[(u32, u32)], mut f: F) {
+    let is_valid = |code: u32| {
+        ranges.binary_search_by(|&(start, end)| {
+            if end < code {
+                ::std::cmp::Ordering::Less
+            } else if start > code {
+                ::std::cmp::Ordering::Greater
+            } else {
+                ::std::cmp::Ordering::Equal
+            }
+        }).is_ok()
+    };
+
+    for &(start, end) in ranges {
+        if start > 0 && !is_valid(start - 1) { f(start - 1); }
+        if end < 0x10ffff && !is_valid(end + 1) { f(end + 1); }
+    }
+
+    let mut seed: u32 = 1;
+    for stratum in 0..0x110 {
+        for _ in 0..16 {
+            seed = seed.wrapping_mul(1103515245).wrapping_add(12345);
+            let code = (stratum << 12) | ((seed >> 16) & 0xfff);
+            if !is_valid(code) { f(code); }
+        }
+    }
+}
 
 /// Makes a common test suite for single-byte indices.
 #[macro_export]
 macro_rules! single_byte_tests {
-    () => (
+    (
+        golden = [$forwardhash:expr, $backwardhash:expr, $($valid:expr),* $(,)*]
+    ) => (
         mod tests {
             extern crate test;
             use super::{forward, backward};
 
+            static VALID: &'static [u32] = &[$($valid),*];
+
+            #[test]
+            fn test_golden() {
+                let mut hash = $crate::MappingHash::new();
+                for i in 0x80..0x100 {
+                    let i = i as u8;
+                    let j = forward(i);
+                    if j != 0xffff {
+                        hash.add(i as u32, j as u32);
+                        assert_eq!(backward(j as u32), i);
+                    }
+                }
+                assert_eq!(hash.finish(), $forwardhash);
+
+                let ranges = $crate::valid_ranges(VALID);
+                let mut hash = $crate::MappingHash::new();
+                for &(start, end) in &ranges {
+                    for i in start..(end+1) {
+                        let j = backward(i);
+                        assert!(j != 0, "backward({}) should be valid", i);
+                        hash.add(i, j as u32);
+                        assert_eq!(forward(j) as u32, i);
+                    }
+                }
+                assert_eq!(hash.finish(), $backwardhash);
+
+                $crate::sample_invalid(&ranges, |i| {
+                    assert!(backward(i) == 0, "backward({}) should be invalid", i);
+                });
+            }
+
             #[test]
+            #[cfg(feature = "exhaustive-tests")]
             fn test_correct_table() {
                 for i in 0x80..0x100 {
                     let i = i as u8;
@@ -63,12 +175,49 @@ macro_rules! single_byte_tests {
 /// Makes a common test suite for multi-byte indices.
 #[macro_export]
 macro_rules! multi_byte_tests {
-    (@shared dups=[$($dups:pat),* $(,)*]) => ( // internal macro
+    (
+        @shared dups=[$($dups:pat),*],
+        golden=[$forwardhash:expr, $backwardhash:expr, $($valid:expr),*]
+    ) => ( // internal macro
         fn in_dups(i: u16) -> bool {
             match i { $($dups => true,)* _ => false }
         }
 
+        static VALID: &'static [u32] = &[$($valid),*];
+
+        #[test]
+        fn test_golden() {
+            let mut hash = $crate::MappingHash::new();
+            for i in 0..0x10000 {
+                let i = i as u16;
+                let j = forward(i);
+                if j == 0xffff { continue; }
+                hash.add(i as u32, j as u32);
+                if in_dups(i) { continue; }
+                assert_eq!(backward(j), i);
+            }
+            assert_eq!(hash.finish(), $forwardhash);
+
+            let ranges = $crate::valid_ranges(VALID);
+            let mut hash = $crate::MappingHash::new();
+            for &(start, end) in &ranges {
+                for i in start..(end+1) {
+                    let j = backward(i);
+                    assert!(j != 0xffff, "backward({}) should be valid", i);
+                    hash.add(i, j as u32);
+                    if in_dups(j) { continue; }
+                    assert_eq!(forward(j), i);
+                }
+            }
+            assert_eq!(hash.finish(), $backwardhash);
+
+            $crate::sample_invalid(&ranges, |i| {
+                assert!(backward(i) == 0xffff, "backward({}) should be invalid", i);
+            });
+        }
+
         #[test]
+        #[cfg(feature = "exhaustive-tests")]
         fn test_correct_table() {
             for i in 0..0x10000 {
                 let i = i as u16;
@@ -108,25 +257,27 @@ macro_rules! multi_byte_tests {
     );
 
     (
-        dups = [$($dups:pat),* $(,)*]
+        dups = [$($dups:pat),* $(,)*],
+        golden = [$($golden:expr),* $(,)*]
     ) => (
         mod tests {
             extern crate test;
             use super::{forward, backward};
 
-            multi_byte_tests!(@shared dups=[$($dups),*]);
+            multi_byte_tests!(@shared dups=[$($dups),*], golden=[$($golden),*]);
         }
     );
 
     (
         remap = [$remap_min:expr, $remap_max:expr],
-        dups = [$($dups:pat),* $(,)*]
+        dups = [$($dups:pat),* $(,)*],
+        golden = [$($golden:expr),* $(,)*]
     ) => (
         mod tests {
             extern crate test;
             use super::{forward, backward, backward_remapped};
 
-            multi_byte_tests!(@shared dups=[$($dups),*]);
+            multi_byte_tests!(@shared dups=[$($dups),*], golden=[$($golden),*]);
 
             static REMAP_MIN: u16 = $remap_min;
             static REMAP_MAX: u16 = $remap_max;
@@ -1909,1268 +1909,1387 @@ pub fn forward(code: u16) -> u32 {
 const BACKWARD_TABLE_LOWER: &'static [u16] = &[
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
     X, X, X, X, X, X, X, 19757, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19217, X, 11702, 11714, 11721,
-    6237, 11707, 11700, 6236, 11703, 6240, 11706, X, 6235, X, 6230, X, 6245,
-    11716, 6246, 11720, X, 11718, 11722, 6243, 11710, 11698, X, 11712, 6234,
-    11717, 6229, 11719, X, 15729, 15727, 15725, X, 15731, X, 15730, 9298, 9293,
-    X, 9295, 9297, X, X, 15732, 16351, X, X, 16350, 16349, X, 16352, 16345, X,
-    16346, 16354, 16347, X, 9676, 16356, X, 19727, X, X, 17012, 19728, 17444,
-    X, X, X, 18104, 18103, X, 18516, 5768, 11985, 7270, X, X, X, 8214, 14717,
-    X, 19729, 15356, X, 9431, 16537, X, 17445, 18105, 5769, 15964, 15963,
-    15966, X, 16561, X, 9779, 10056, 17034, 19775, 10057, 17033, 17458, 17457,
-    10274, X, 17808, 10435, 18118, 10739, 18518, X, 18768, 18767, 11374, 6887,
-    6888, 13442, X, 8657, 5775, 6173, 9461, 9073, X, X, 15414, X, X, X, X, X,
-    X, X, 15976, 9454, X, 15978, X, 9455, X, X, 9457, 15981, X, 15973, X,
-    15979, X, X, X, X, 15975, X, 9218, X, 9221, 9223, 9222, X, X, 9219, 9220,
-    X, 16240, 16239, 9604, 16241, X, 16242, 9605, X, X, X, 16812, 16810, 17258,
-    X, 16808, 16809, 9897, 16805, 16813, 16807, 16811, 18218, 10617, 10692,
-    18414, 18413, 18412, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 11202, 11203, X, X, X, X, X, X, 13227, X, 7621,
-    7641, 7640, X, 7629, 19391, 13245, 13241, 13238, 13256, 7624, 7616, X, X,
-    13243, 8077, 7620, 13251, X, 7642, 7639, 13247, 13230, X, X, 12713, X,
-    8690, 8260, 8689, 9112, X, 5926, 11375, 5927, 5928, X, X, 12005, 11672, X,
-    11673, 6178, X, 11670, 6177, X, 6180, 11671, 6182, 6181, 11674, 6179, X, X,
-    19708, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19048, X, X, X, 7947, 13681, X, X, X, X, X, X, X, X,
-    8425, 8419, 14372, 8428, 14378, 14381, 8421, 8422, 14375, 8420, 14384,
-    8426, 14385, X, 14380, 8427, X, 14369, 8424, 14370, 12564, 7061, 12546, X,
-    12551, 7054, 7065, 12549, 7049, 7059, 7064, 12556, X, 7060, 7063, X, X,
-    12559, 7055, 12550, X, X, X, 12562, 12563, X, 7057, 12561, 7053, 7068, X,
-    12553, 15713, 15718, X, 15714, X, 15717, 9291, X, 9644, 9290, 19201, 15710,
-    15716, X, 9289, 15715, X, 15712, X, 9287, X, X, X, X, X, X, 16341, 18959,
-    16343, 16338, 9672, 16340, 13175, 13174, 7545, X, 7544, 7543, 7547, 7542,
-    X, X, 13774, 13771, 8016, 13770, 13775, X, 8018, 13773, 8015, 8017, 13772,
-    19260, 14452, 19701, 14453, 14454, X, X, X, X, 8924, 8932, 9315, 15753,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19217, X, 11383, 5802, 11387,
+    X, 11391, 11388, X, X, 11385, 5788, 5790, 5803, X, 5792, 11377, 5795, 5793,
+    5794, 11393, 11390, 11381, 5791, X, X, 11378, 5789, X, X, X, 11386, X, X,
+    18658, 18762, 19629, X, 18831, 18930, 10890, 18940, 5643, X, 6505, 6506,
+    19632, X, 6837, X, X, X, X, 10032, 5644, X, 6507, 7240, 8601, 5645, X,
+    7739, 9035, 11338, 13395, 13392, X, 7750, 13391, 7748, 7751, 13394, 13402,
+    7249, 7749, 13400, 13399, 7753, X, X, X, X, X, X, X, 19666, 14035, 19159,
+    X, X, 14036, 8196, X, 14042, X, X, 9926, 16837, 16835, 16834, X, 16840, X,
+    16839, 16838, X, 16833, 9925, 16832, X, 16836, 9927, X, X, 17296, X, 17300,
+    17297, 17299, 17298, 17295, 17301, 17304, 17302, 17303, 10205, 15668,
+    15669, X, X, 16299, X, 16294, 16291, 16298, X, X, X, 16300, X, X, 9637,
+    16297, 16293, X, X, 16292, 16296, 16295, 9636, X, X, 16860, 16855, 16853,
+    16862, 16854, X, 11029, 11030, 11031, 11032, 11033, 11034, 11035, 11036,
+    11037, 11038, 11039, 11040, 11041, 11042, 11043, 11044, 11045, 11046,
+    11047, 11048, X, X, X, X, X, X, X, 11261, 11262, 10955, 10956, X, 8451,
+    14407, 8447, 8448, 8454, 8442, 5212, 8440, 14401, X, X, X, X, X, 8449, X,
+    X, 14410, X, X, X, 8899, 8894, X, 15093, 15089, X, 15083, 8888, 8884,
+    15092, 8006, 13741, 7529, X, X, X, X, 8471, X, 8915, 8914, 15114, X, 9292,
+    9675, X, 17364, 18489, 18640, 5538, 5717, X, 5718, 11415, 5853, 5856, X,
+    11413, 11411, 5855, 11414, 11416, 6057, 6058, X, X, 11800, 6342, 6343,
+    11801, 6341, 19275, X, 6702, 12145, 6701, 6699, 6700, 7107, 7105, X, X,
+    12603, 7106, 12602, X, 7095, 13176, X, X, 7552, 7553, X, X, 6879, 12390, X,
+    12385, 12382, X, X, 12389, X, X, 6881, 6882, 12388, 12387, 12386, 12383,
+    12384, 12391, 6880, X, X, X, X, X, X, X, X, 7282, X, 7288, 10277, 10275,
+    10276, X, X, X, X, 17809, 17810, 10437, X, 10436, 18120, 18121, 18119, X,
+    18519, 18520, X, X, 5776, 11469, 6174, X, 11999, 6537, 6536, 12000, X, X,
+    12403, 6892, 17463, 10285, 17469, 10284, X, 17470, 17467, 10281, 17468,
+    17461, 10282, 10280, 17814, 17465, X, X, 17471, X, X, 17811, X, X, X,
+    10442, 10440, 17813, X, 17815, 17812, 10441, 10438, 10439, 14783, 8677, X,
+    14790, 14794, 14786, 14782, X, 14781, X, X, X, 14792, 14784, 14788, 8678,
+    X, 8676, 14796, 8674, 14793, X, 15436, X, X, X, X, X, 9089, 15428, 9476,
+    15438, 12911, 7330, 12910, 12909, X, 7329, X, 13498, X, 13500, 13493,
+    13494, 7816, 13495, 7817, 13499, 13496, 13497, 7818, X, 8256, 8257, X,
+    14134, X, X, X, 14805, 14806, X, 15448, 9109, 7354, 12922, 7829, X, 14153,
+    8701, X, 9122, 9815, 10108, 10301, 18138, 5933, 6556, X, X, 7355, 13520,
+    8272, X, 9123, 15459, 16019, X, X, X, X, 5934, 8273, 14823, 9124, 5935,
+    14162, 8281, 14191, 14199, 14202, 8279, 14170, 14195, 14171, 14185, 8292,
+    14181, 8289, 19071, 14182, 14159, X, 14196, X, X, 8298, 14193, 14183,
+    14204, 14178, 14860, X, 14207, 8296, 14176, 14188, 8299, 16659, 16640,
+    16646, 16650, 16644, 16664, 16661, 16658, 9821, 9822, 9826, 16637, 16665,
+    9825, 16655, X, X, 16653, X, X, X, 16656, 17132, 17113, 17118, 17131,
+    17117, 17109, 17114, X, 10112, X, 9245, 9246, 16290, 9635, 9634, 16289, X,
+    17311, X, 17678, 17680, 17679, 10381, 10380, 10379, X, 10706, 18439, X,
+    10705, 18597, 18596, X, 10845, 18798, 7941, 15051, X, X, X, 15670, 16307,
+    X, X, 9640, 16312, 16311, 9638, 16306, 16310, 9639, X, X, X, X, X, X,
+    16873, X, 9938, X, 16868, 9934, X, 16865, 16871, 16874, X, 9939, X, 16870,
+    16867, 16875, 18275, 18280, 18282, 18285, 18269, X, 18289, 18290, 18283,
+    18287, 18278, X, 18464, 18467, X, 10709, X, 18466, 18471, 18469, 10710,
+    18460, 18450, 18449, 10712, 18462, 18463, 18459, 18451, X, 18456, 18286,
+    10390, X, X, X, 18295, 18294, 18297, 18296, 10631, X, X, 18474, X, 18476,
+    18475, 10714, 18628, X, 18737, 18738, 10818, 18876, 18901, 10886, X, 14365,
+    16883, 17348, 18045, 15056, X, 17349, 5076, 5079, 5080, 5083, 5084, X, X,
+    X, X, 5124, 5125, 5128, 5129, 5126, 5127, 5052, 5037, 5038, 5039, X, 5041,
+    5042, 5043, 5044, X, 5085, 5086, 5087, 5088, 5089, 5090, 5130, 5187, 5188,
+    11254, 5121, 11255, 5185, X, X, X, X, X, X, X, 18996, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 5342, 5343, 5344, 5345, 5346, 5347, 5348,
+    5349, 5350, 5351, 5352, 5353, 5354, 5355, 5356, 6606, 6602, X, X, X, X, X,
+    X, X, X, X, X, 12073, X, 7025, 7003, X, 7019, X, 7024, 12513, 12512, 12517,
+    12518, 7006, X, 7015, X, X, X, 7028, X, 6698, X, 12601, 7104, 19268, X,
+    7550, 7549, 7548, 8019, 8020, 13776, 8933, 9680, 5543, 11332, 5611, 11356,
+    19270, 19272, 11418, 5866, X, X, X, 6340, X, X, X, X, 14455, 9315, 15753,
     9310, 9314, X, 16379, 16377, 16376, 16378, 16375, X, X, 10400, X, 18061,
     18062, X, 18317, 18494, 10854, 10942, X, 6363, 6070, X, 19311, 6712, 19312,
-    19314, X, 5554, 5617, 16928, X, X, 10227, 16930, 16929, 9975, 16927, 16931,
-    17380, 17376, 17378, X, 17373, 17374, X, 17377, 17375, 10401, X, X, 10404,
-    10403, 10402, 10552, 18065, 10553, 17742, 10644, 18318, 10645, 10728,
-    16940, 16939, 9989, 9990, 17749, 19414, X, 5626, 19254, X, X, X, 13873, X,
-    X, X, 8089, 8088, 14535, X, 17388, 10648, 18650, 5627, X, 7165, X, 7654,
-    7653, 13874, 13875, 8528, 14572, 14577, 14557, X, 14574, 14554, X, X,
-    14561, 14562, 8548, 14581, 14579, X, 14550, 14584, X, 14585, 14587, 8552,
-    8544, X, 13274, 14558, 14576, 14559, 8541, 8557, 14583, 8555, 8551, 14548,
-    5751, 5750, 6127, 11368, X, X, 11454, X, X, 19127, X, 11460, 11461, 5908,
-    5909, 11457, 5904, X, 11455, X, 11459, 5905, X, 5900, X, 5901, 19522, 5907,
-    11456, 5899, 6128, 5902, 14608, 14618, 8568, 14628, 8581, 8572, 14615,
-    8571, 14606, 14620, 14640, 8163, 9027, 14623, 15273, 14625, 14639, 8578,
-    14616, 8566, 8582, 9405, 14605, X, 14630, 19091, X, 19033, 14629, X, X, X,
-    19135, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 6200, 8357, X, X, 8792, 17926, 18183, X, 18182, 18396,
-    18397, 18395, 18564, 10754, 6212, 6980, 6979, 7432, 7431, 13031, 13032,
-    13030, X, 7430, 13649, X, 13650, 13646, 7916, 13647, X, 13648, X, X, X, X,
-    14318, 16802, 16777, 16790, X, 9889, X, 16769, X, 16767, 16801, X, 16799,
-    16798, 16781, 16780, 16770, 9891, X, 16776, 16786, 16797, 9894, 16804, X,
-    10182, 9896, 9890, 16774, X, 16783, 16766, 16768, 18191, X, X, X, X, X, X,
-    X, 18197, 18402, 18407, 10691, 18409, X, 10685, X, 18405, 18411, 10690,
-    10686, X, 10687, 18401, 18408, 10689, 18406, 10688, 18400, 18404, 18403, X,
-    18399, 6588, X, 6982, 7438, X, X, 13664, X, 13665, 7924, X, 8382, 14345,
-    14344, 8386, 8381, 14346, 8383, 8385, 8384, 8380, X, X, X, 8832, X, X,
-    15025, 15023, X, 15024, 15022, 11485, 5944, 11483, 11486, 11484, X, X, X,
-    11694, X, 6218, X, 6219, 11696, 6216, 11695, 11693, 6217, 6215, X, X, X, X,
-    X, X, 12050, 12053, 6592, 12052, 12051, X, 6591, 14352, X, X, 14351, 8395,
-    8391, 8392, 14347, 14349, 14350, 8387, 8389, X, 8393, 8388, X, X, 15028,
-    15026, 15027, 8834, 8835, X, 15029, 8833, 9224, X, 9226, 9225, X, 15632, X,
-    5236, X, 5237, X, X, X, X, X, X, X, X, X, 5239, X, X, X, 5240, X, X, X,
-    5241, X, X, X, 5242, X, X, X, 5234, X, X, X, 15992, X, X, X, X, 9798, 9803,
-    9796, 16603, 16594, 16606, 16598, 16604, 9804, 9797, 16591, 16597, 16607,
-    16600, 16605, 16593, X, X, 16601, 9799, 16599, X, 9801, 16595, 12921,
-    12919, 7339, X, X, 7341, 7344, X, 7347, X, 7349, X, X, X, X, X, X, X, X, X,
-    X, 13516, 7823, X, 13507, 13509, X, 13510, X, 13518, 13514, 13512, 12467,
-    12458, X, 6929, 12466, 6933, 6931, 6926, 12450, X, 12465, 12454, 12457,
-    12470, 19010, 6946, 12464, 6938, 12459, 12469, 12456, 12460, 12463, X, X,
-    12448, 12468, 12462, 19289, X, 12447, X, 17293, X, 17292, 19447, 10374,
-    17978, 17979, 10622, X, X, 18920, 7449, 8414, 8413, 15045, 15047, 8858,
-    15046, 8857, 8859, 15048, X, X, X, 15657, 15659, 15658, X, 15661, X, X,
-    5201, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19192, X, 7016, X, X, X, X, 12506, 7009, 12507, 19022,
-    7030, X, 7021, 7000, 7001, 12526, 7472, X, 7014, 7013, 12508, 7017, 13058,
-    7008, 12519, 7023, 7022, 7012, 12511, 12520, X, 12505, 7011, 12097, 12085,
-    12100, X, 19148, 12087, 6650, 6664, 6646, 6663, 6655, 6660, 6644, 12086,
-    12092, 6659, 12104, 6661, X, 6651, X, X, 12094, 12091, 6649, X, 12084,
-    6662, 12099, 6654, 12101, 6665, 9284, 15099, 15108, 8904, X, 8908, 15098,
-    15104, 15109, 15094, 8906, 15102, X, X, 15106, 15112, 15096, 15105, X,
-    8905, 15111, X, X, X, 15097, X, X, X, 9288, 15711, 9286, 9285, 10938,
-    11354, 19054, 5720, 11355, 5863, X, 5861, 5862, 5864, X, 6054, 6053, X,
-    11551, 6055, X, X, 11552, 11798, X, 11799, X, 6334, 6336, 6338, 6335, 6339,
-    6337, 19266, X, X, 6526, 6868, 12371, 6869, 6867, X, 6866, 12823, 7271, X,
-    19730, 7272, 7273, X, X, X, 7771, 13414, 7770, X, X, X, X, X, 14060, 7772,
-    8215, 14718, 8628, 8629, 6172, 6171, X, X, X, 11998, 19779, X, 6535, 6534,
-    X, 6891, 19561, 12398, 12401, 12399, X, 6889, 6890, X, 19781, 12397, 12400,
-    X, 7305, X, X, X, 12862, 12864, 12863, 7302, 8667, 9460, X, X, 9456, X,
-    9458, 9459, X, 9788, 15980, 15974, 9462, X, 15977, X, X, X, X, X, 16579,
-    16574, X, X, 16584, 9786, 16576, 9790, 16582, 16573, 16570, 16585, 7316,
-    7312, 7317, X, X, X, X, X, 13487, 13480, X, 8247, 13479, X, 7802, 7809,
-    7806, 7812, 7811, 7807, X, 13473, 13476, X, 13475, 7803, 13477, 13486,
-    7804, 13474, 13483, 13484, 12904, 12902, X, 13488, X, 14129, 14130, 14799,
-    14800, 8681, 8682, 14798, 14801, 14797, 8680, X, 9106, X, 8683, 15444, X,
-    9480, 16000, 9481, X, 9805, 16613, 16611, 16612, 17086, 17085, 17084,
-    18843, 18844, 10794, 5929, X, 6554, 14148, 9120, 10107, 17097, 5930, X,
-    7353, 7352, 14149, 19723, X, X, 16631, 5931, 6924, X, X, 14150, 14151,
-    14152, 9121, 9814, 5932, X, 6555, 12443, 14162, X, 14191, 14199, 14202,
-    8279, 14170, 14195, 14171, 14185, 8292, 14181, 8289, 19071, 14182, X, X,
-    14196, X, X, 8298, 14193, 14183, 14204, 14178, 14860, X, 14207, 8296,
-    14176, 14188, 8299, 17102, 17126, 17128, 17101, 10111, 17130, 17122, 10118,
-    17129, 17115, 10120, 17107, 16660, 17123, 17120, 17103, 17134, 10114, X, X,
-    10115, 17105, 17121, X, 17133, 17124, 17111, 10117, 10113, 17125, 17112,
-    17135, 15516, 15508, 9145, 15502, 15529, 9146, 15526, 15527, 15503, 9151,
-    15518, X, 15512, 15519, 15506, X, 15531, 15523, 15517, 15501, 9147, 15524,
-    X, 9150, 15528, X, 15522, 9144, 15520, X, 15514, 9142, 14231, 8310, 8311,
-    X, X, X, X, X, X, 14239, 8742, 14902, 14908, 14903, 14904, 18958, 14909, X,
-    8744, X, 8736, 8743, 14901, 14228, 8739, 8737, 14907, 14906, 8738, 8740,
-    14905, 8735, 16704, 16716, 16705, X, 16711, X, 9841, 9847, 16717, X, X,
-    9843, X, 9853, 9848, 16719, 16713, 9844, 16706, 9854, 16707, 16708, 9855,
-    9852, 9531, X, 9842, 16720, 9856, X, 9849, 16718, 14955, 8778, 14962,
-    14961, 8785, X, 8786, 14963, 8780, 14960, 8784, 14965, 14956, X, 14958,
-    8781, 14954, 14957, 14964, 8782, 14966, X, X, X, X, X, 8783, X, 9185,
-    15570, 15576, 15568, 18562, 10753, 18563, 18691, 18690, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19322, X, X,
-    X, X, X, 19286, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19123, X, X, X, X, X, X, 15982, X, X, 15983, X, 9463,
-    15985, 15984, X, X, X, 16589, 16590, 16586, X, 16587, 9794, 9795, 16588, X,
-    10071, X, X, 10067, 10072, 10068, 10070, 17480, 10291, 17477, 17475, X, X,
-    X, X, 17827, 10447, 10448, 10444, X, 10445, X, 17823, 17821, X, 17825,
-    10450, 17826, 17819, 17818, 17822, 17820, 10446, 17824, 18129, 10581,
-    10580, 18130, X, 15633, 16244, X, 16243, 19755, X, 9898, 9899, 16814, 9900,
-    X, 17261, X, 17259, X, 17260, 10194, X, 17631, 10511, X, X, X, 10195, 6595,
-    X, 7447, 13038, X, X, 13671, 9229, X, 16248, X, 9606, 16246, 9607, 9608,
-    16247, 9609, X, 16816, X, 9905, 9902, 9907, 16818, 9903, 16817, 9906, X, X,
-    9904, X, 17264, 17266, X, X, 10197, 17265, 10198, 17263, 15640, 15644,
-    15641, 15639, 15643, 9231, X, 19178, 16252, X, 16250, 9612, X, 9611, 16251,
-    9613, X, X, X, X, 16821, X, X, 16820, 9911, 16819, 17267, X, 17269, 17271,
-    17270, X, 5115, 5114, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5108,
-    5107, X, X, X, X, X, X, X, X, 5117, 5116, X, X, 15204, X, X, 15779, X,
-    8959, 9345, 16400, 15784, 15783, 15785, X, X, 15782, 9346, X, 9352, 9349,
-    X, 9350, 15777, 15780, 15790, 9358, 9356, X, 15781, 13842, 9343, 15787,
-    12706, 7180, 19461, X, X, 12705, 12700, X, 12701, 7188, 7199, 12691, X,
-    12692, 12702, 12693, X, 12688, 12682, 12683, 12696, 12690, X, 19539, 7181,
-    7185, 12704, 12684, 7197, 7193, 19315, X, 17845, 17861, 17854, 10459,
-    10460, 17858, X, 17846, 10455, 10457, 17841, 17849, 17843, X, 17859, 17857,
-    17842, 17850, X, X, X, 18147, 10461, 17851, 10588, 10590, 10587, X, 18152,
-    18144, 18142, 10122, X, 17149, 17148, 17153, 17140, 10126, X, 10130, 17147,
-    17154, 10131, 17150, X, X, X, X, 10123, 10125, 17528, 17526, X, X, 17533,
-    17530, 17534, X, 17519, 17527, 17538, 17160, 17523, 14916, 14915, 14917,
-    8746, 14914, 14913, 14919, X, 15552, 15550, X, 15551, 16127, 16125, X, X,
-    16126, 16703, 17173, 17174, 10317, X, 17888, 18162, 10599, X, 18381, 18547,
-    10747, X, 18682, 18852, 6960, 7408, 7409, 13002, 13001, 13614, X, 7890,
-    7888, 7885, 7889, 7887, 7886, X, X, 8331, 14266, X, 8774, 8333, 8338,
-    14268, 8340, 8339, 8342, 14267, 14264, 8336, 8332, 8334, 14265, 8341,
-    10330, X, 17919, X, X, X, X, X, X, 18914, 6199, 6577, 6965, 6964, X, 7414,
-    X, 13008, 7412, 13009, 7413, X, X, 13627, 13623, X, X, 7895, 13626, 13625,
-    13624, 7896, 10170, 10168, 10169, 10334, 10167, 17209, 16755, 10333, 10335,
-    X, 10492, 10493, X, 18181, X, 10800, 10799, 6207, X, X, 11482, 7426, X, X,
-    11480, 11478, X, 11481, X, X, 11690, 11687, 8819, X, X, X, X, 8828, 15002,
-    X, 14991, 8826, 15001, 8822, 15019, 8827, 15017, 15005, 15015, 8824, 14992,
-    15018, 15013, X, 15020, 8816, X, X, 8831, 8821, X, X, 14998, X, 11185,
-    11186, 11187, 11188, 11189, 11190, 11191, 11192, 11193, 11194, 11195,
-    11196, 11197, 11198, 11199, 11200, X, 11174, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19396, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5034,
-    5047, X, 5049, 5051, 5055, 5056, 5059, 5060, 5063, 5064, 5067, 5068, 5071,
-    5072, 5075, 5190, 5290, 5291, 5292, 5293, 5294, 5295, 5296, 5297, 5298,
-    5299, 5300, 5301, 5302, 5303, 5304, 5305, 5306, 5307, 5308, 5309, 5310,
-    5311, 5312, 5313, 5314, 5315, 10963, 5181, 10964, X, 5122, 19031, X, X, X,
+    19314, X, 5554, 5617, 19261, 15186, 8952, 8953, 19363, 15183, 15772, 9321,
+    8053, X, 15185, 9328, 15177, X, 9322, X, 9327, 15172, 15176, 15173, 15179,
+    8957, 9320, 8951, X, 15758, 15181, X, 9326, X, 9329, X, 17804, X, 18113,
+    18116, 18112, 10568, 18114, 18115, 18117, 10569, 10571, 10570, 18339,
+    19756, 18341, X, 18340, X, X, 19759, 18517, X, X, 18766, 18835, 5774, X,
+    19774, 11668, 6531, 11997, 12405, 12406, X, X, 12874, 12876, 7309, X,
+    12878, 12881, 12879, X, X, X, 12880, 12877, 12873, 7310, 12882, 12875, X,
+    X, X, X, 13458, 7793, 13467, 7790, X, 13460, 7794, X, 17220, 10342, 17626,
+    17623, 17627, 17614, 17610, 17624, 17940, 17612, X, 10345, X, 10344, 17222,
+    10346, 17620, 17622, 10343, 17625, 17603, X, 17606, X, X, X, X, X, X, X, X,
+    11282, X, X, X, 11283, X, 11284, 11285, X, 11286, X, X, X, X, X, X, 11287,
+    11288, X, X, X, X, X, X, 11289, X, 7497, 13088, 7510, 7505, 13096, 7494, X,
+    X, X, 7493, X, X, X, X, X, X, X, X, X, X, 13080, 13081, 13701, X, X, X,
+    7967, 7970, 13712, 7990, 13715, 15713, 15718, X, 15714, X, 15717, 9291, X,
+    9644, 9290, 19201, 15710, 15716, X, 9289, 15715, X, 15712, X, 9287, X, X,
+    X, X, X, X, 16341, 18959, 16343, 16338, 9672, 16340, 10547, X, X, 10548, X,
+    18058, 19691, 18314, 18313, X, X, 18490, 18491, 18641, 18752, X, 5539,
+    5540, X, 5541, 5610, 5719, 11417, 5859, 5860, X, 6051, 6052, 6050, 6049, X,
+    6331, 12170, 12167, 12168, 12169, 12171, 6707, X, X, 12612, 12611, X, 7119,
+    X, 7118, 19297, X, X, X, X, 7570, 13194, X, 7569, 7571, 7568, X, X, X, X,
+    8028, 13193, X, 6870, X, 12373, 12374, 12375, X, 6877, 12372, 6873, 12376,
+    6874, X, X, X, X, 12826, 12830, 12828, 12827, X, 12831, X, X, X, 12832,
+    12833, 12825, X, 12824, 19736, 7275, 6172, 6171, X, X, X, 11998, 19779, X,
+    6535, 6534, X, 6891, 19561, 12398, 12401, 12399, X, 6889, 6890, X, 19781,
+    12397, 12400, X, 7305, X, X, X, 12862, 12864, 12863, 7302, 9461, 9073, X,
+    X, 15414, X, X, X, X, X, X, X, 15976, 9454, X, 15978, X, 9455, X, X, 9457,
+    15981, X, 15973, 9081, 15979, X, X, X, X, 15975, X, 10496, 10504, 17945,
+    10507, X, 17941, 17951, 10509, X, X, X, 17937, X, 17944, X, 19573, 19683,
+    X, X, X, 18200, 18214, 18202, 18209, 17936, 18207, 18190, 18212, 10616,
+    18194, 18211, 10802, X, 18693, 10801, 10803, X, X, X, 18788, 18789, 10837,
+    18787, X, 18859, 18858, 18860, 10864, 18861, 10863, 18862, 18890, 18893,
+    18892, 10873, 18891, X, X, 19406, 10883, 10881, 10882, 10888, 6588, X,
+    6982, 7438, X, X, 13664, X, 13665, 7924, X, 8382, 14345, 14344, 8386, 8381,
+    14346, 8383, 8385, 8384, 8380, X, X, X, 8832, X, X, 15025, 15023, X, 15024,
+    15022, 17254, X, X, 17256, X, 17257, 10193, 17253, 10192, 17255, 10189,
+    10190, 10191, 16806, X, X, 10352, 17630, 17628, 17629, 10350, 10353, 10351,
+    X, X, X, 17953, 17954, 10510, X, 18217, 18219, 11485, 5944, 11483, 11486,
+    11484, X, X, X, 11694, X, 6218, X, 6219, 11696, 6216, 11695, 11693, 6217,
+    6215, X, X, X, X, X, X, 12050, 12053, 6592, 12052, 12051, X, 6591, 6590, X,
+    6594, 12054, 6593, X, X, X, X, X, 12503, 6984, 6985, 6986, 12504, 12500,
+    6983, 12501, X, 12502, 12499, X, X, X, 7445, X, X, 7442, 13036, 7443, 7446,
+    13037, 14352, X, X, 14351, 8395, 8391, 8392, 14347, 14349, 14350, 8387,
+    8389, X, 8393, 8388, X, X, 15028, 15026, 15027, 8834, 8835, X, 15029, 8833,
+    9224, X, 9226, 9225, X, 15632, X, 10896, 10897, 10898, 10899, 10900, 10901,
+    10902, 10903, 10904, 10905, X, X, X, X, X, X, X, X, X, X, 10906, 10907,
+    10908, 10909, 10910, 10911, 10912, 10913, 10914, 10915, X, X, 6398, X,
+    6396, 19387, 6420, 6412, 6406, 6394, 11862, 6405, 6395, 6413, 6422, 12203,
+    6410, 11858, 6400, 6403, 6404, 19389, 6418, 6419, 6417, 6411, 6415, 6401,
+    6740, X, X, 19014, 6433, X, 6431, 11879, 11875, 11882, 6430, 6437, 11877,
+    11873, 6436, 11880, 6429, 11881, 6432, 6434, 11885, 11884, 11876, 6428,
+    6427, 6435, X, X, 19428, X, X, X, 12230, 12236, X, 6767, 8543, 19482,
+    14551, 8556, X, 14567, 14547, X, 8549, 14571, 14555, 8550, 14564, 8540,
+    8125, 14573, 13909, 14552, X, 19472, 14578, 8545, 14575, 8542, 14569, 8553,
+    14560, 14589, X, X, X, X, 11294, X, X, X, X, X, X, 11302, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19246, X, X, X, X, X, X, X, X,
+    X, X, X, 19016, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19154,
+    X, X, X, 5725, 5726, 11360, X, 5869, X, X, 19308, 11566, X, 6066, X, 11567,
+    X, X, 6356, X, X, 11821, 6354, 6353, 11820, 6351, 11822, 6352, 6355, X,
+    6706, X, 6708, 13225, 13825, X, 13223, 13814, 7599, 7606, 7610, 13217,
+    13809, 13221, 7595, 13811, 13224, 13813, 13213, X, 8041, X, 13211, 13212,
+    7605, X, X, 7604, 13215, 7609, 13219, 7602, 13216, 19504, 7607, 7614, 7634,
+    7618, 8062, 13248, 7619, X, 7615, 7630, 7625, 7623, 13236, 7635, 13233,
+    13246, 13242, 13836, 13835, X, X, X, X, X, X, X, X, X, X, X, 13231, 13852,
+    X, 14807, X, X, 15449, X, 9484, X, 9810, 16617, 16616, X, 17089, X, X, X,
+    18353, X, X, 5924, 11669, 12004, 6911, 12424, X, 12914, X, X, X, 7336,
+    12913, 7337, 11473, X, X, 11682, 11683, 11677, X, 19294, X, X, 11681, 6186,
+    X, 6187, 11678, 11676, 11675, 11679, 6185, 11680, 12445, X, X, X, 12016,
+    6559, 12015, 12017, X, 6558, 12022, 6562, 15493, 15462, 15481, X, 15461, X,
+    X, 15479, 15488, 15486, 15474, 15469, 15467, X, 15468, 15487, 15498, 15476,
+    9132, X, 15471, X, 15491, X, 9135, 15470, 15464, 15480, 9139, X, X, 9127,
+    18365, 18364, 18141, 18359, 17511, 18368, 18357, 18362, X, 18366, 18356, X,
+    18536, 10666, 18363, X, X, 18672, 18537, 18535, 18533, 18534, 18538, X,
+    10795, 18670, 18668, 18673, 18671, X, 18674, 10796, 10314, 16081, 17518,
+    17531, 17525, 17522, 17517, 17516, 17537, X, 17521, 17520, 10312, 17529, X,
+    10311, X, X, 10313, 17524, 17536, X, 17865, 17866, X, 10465, 17863, 10462,
+    17871, X, 10466, 17873, 14916, 14915, 14917, 8746, 14914, 14913, 14919, X,
+    15552, 15550, X, 15551, 16127, 16125, X, X, 16126, 16703, 17173, 17174,
+    10317, X, 17888, 18162, 10599, X, 18381, 18547, 10747, X, 18682, 18852,
+    14263, 14262, 8330, X, 14940, 14941, 14939, X, X, 8769, 8768, X, 9178,
+    9177, X, 16147, 16723, 16721, 16722, 9859, 17198, 17197, X, 17571, 17570,
+    17569, 17905, X, 18912, 6194, 6959, X, 19224, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19403, X, X,
+    6264, X, 6629, 12074, X, 11731, 6634, X, 12075, 6630, 6633, 6632, 6631,
+    6628, X, X, X, 12537, X, 7041, 12540, 7039, 19079, X, X, 12536, 7042, 7040,
+    7043, 12538, 12539, 8885, 15086, 15088, X, 15091, 19162, 8890, X, 8897,
+    8891, X, X, 15081, 8892, 8893, 15084, 8898, X, 15082, 15087, 8889, 15080,
+    8895, 8887, X, X, X, 8886, 15085, 15090, X, 8896, 11410, 5858, 5857, 5854,
+    5852, 11412, X, X, X, X, 6047, X, X, 6044, 11545, 11548, 11547, X, 6038,
+    6046, X, X, 6043, 11544, 11542, 6042, X, X, X, 6037, 6040, X, 14649, 14656,
+    14658, 14664, 19608, 8598, 14644, X, 8590, 19610, 14659, 8595, 14665, 8586,
+    19614, 14662, X, 14646, 14663, 14645, X, 8600, X, 14657, 8587, 14666, X,
+    8592, 14650, 8597, 14661, 14677, X, 14674, 15333, 9038, 8604, X, X, X,
+    14679, 14678, X, 15336, 15334, 9415, X, 9039, 15335, 15911, X, X, X, X,
+    9416, 15910, 15919, 15918, 15916, X, 15915, 15912, 15913, 7754, 14694,
+    9763, 10428, 10735, 18764, 5757, X, 11979, 5213, X, X, 12363, X, 12364, X,
+    X, X, X, X, 12809, 12810, 7755, 7756, X, X, X, 14046, X, 14697, 14696,
+    14695, 14721, 9057, 8641, 8634, X, 8639, 8632, 14726, 8640, 14725, 8636,
+    8631, 8637, 14729, 15361, 15363, X, X, X, X, X, X, X, X, X, 8635, X, X,
+    15358, 9055, 15364, 9056, 8225, X, 14089, 14091, 14093, 8224, X, X, 8222,
+    X, 14090, 8223, 14092, 8221, X, X, 14759, 14750, 14753, 14757, 8661, 14755,
+    X, 14754, 14751, 14752, 8659, 14758, 8658, X, 8663, 8662, 8667, 9460, X, X,
+    9456, X, 9458, 9459, X, 9788, 15980, 15974, 9462, X, 15977, X, X, X, X, X,
+    16579, 16574, X, X, 16584, 9786, 16576, 9790, 16582, 16573, 16570, 16585,
+    6899, 12415, 6897, 12413, 6902, 6898, 6903, 6901, 12414, 6900, 7315, 7314,
+    12900, 7323, 12893, 12899, 7319, 12892, 12898, 12896, 7318, 7320, 12895,
+    7313, 12894, 7324, 7321, 7325, 7322, 12891, 12890, 12897, 17480, 10291,
+    17477, 17475, X, X, X, X, 17827, 10447, 10448, 10444, X, 10445, X, 17823,
+    17821, X, 17825, 10450, 17826, 17819, 17818, 17822, 17820, 10446, 17824,
+    18129, 10581, 10580, 18130, X, 7441, 7439, 7440, 7444, X, X, X, X, X, 7925,
+    13668, 7933, 13667, X, 13670, 7929, 13669, 8394, 7927, 7930, 7926, 7931,
+    7932, 7928, X, X, X, 13666, 8390, 14348, X, 5432, 5433, 5434, 5435, 5436,
+    5437, 5438, 5439, 5440, 5441, 5442, 5443, 5444, 5445, 5446, 5447, 5448,
+    5449, 5450, 5451, 5452, 5453, 5454, 5455, 5456, 5457, 5458, 5459, 5460,
+    5461, 5462, 5463, 15071, 19361, X, 15070, 15065, 8868, 15057, 8866, 15060,
+    8877, 15063, X, 15067, 8870, 8867, 15069, 15068, 8875, X, 15061, X, 9256,
+    15681, X, 15678, 9257, X, 9255, X, 15685, 15682, 15675, 6645, 6656, 6653,
+    12089, 6657, 12095, 12096, 6652, 6658, 6648, X, X, X, X, 6647, 12088, X, X,
+    X, X, X, X, 12093, X, X, X, X, X, X, X, 12103, X, 7175, 7168, 7171, 19431,
+    7174, X, 12675, X, 7169, 12673, 19434, 7173, X, X, 7170, X, 12676, 7172, X,
+    X, X, X, 19141, X, 13262, 7661, 13261, 13263, 7660, 7665, 12674, 15229,
+    15255, X, 8996, 15246, 15262, 8994, 15238, 8979, 15240, 15254, 8988, 15233,
+    8992, 8982, 15242, 15232, 15226, X, 15252, 8989, 15261, 15227, 8986, X,
+    15248, X, 8987, 15234, 15245, 15241, 15243, 12289, 12290, X, 7207, 7211,
+    12721, 7210, 7208, 7209, X, 13313, 7695, 8136, X, 8134, 8135, 13948, X, X,
+    8999, 5641, X, 11367, 19518, 5749, X, X, 11370, X, X, 5752, 11369, 13967,
+    13961, X, 8160, 8168, 13957, 13950, 13951, X, 13953, 8143, 13966, X, 8157,
+    8166, 19562, 19462, 13968, 13992, 13984, 8139, 13990, 8151, X, 8149, 19216,
+    13996, 8148, 13974, 13962, 13972, 8171, 10011, 10018, 16982, 16974, 10013,
+    X, 16978, 16977, 16983, 10019, X, 10014, 10017, 16976, 10021, 10015, 10022,
+    10009, 16980, X, 16972, X, X, 17419, 19565, X, 10254, 17416, 17418, X,
+    10252, 17414, 16497, 16498, 16493, 9755, 9756, 16492, 16507, 16502, 9749,
+    9746, 16501, 16499, X, X, 9752, 16503, 9747, X, 9748, X, 16500, 9750,
+    16496, X, 16505, 9753, 16508, 16509, 9754, 19106, X, 10024, 11975, 11971,
+    11974, X, 11970, 6520, 11973, 19121, 6517, 6516, 19652, 6519, 11976, 11972,
+    X, X, X, X, 6847, 6850, 12354, 12353, 12352, 6844, 12361, 12351, X, 6846,
+    12794, X, 12358, 12356, 16527, X, X, X, 17007, X, 10430, 10429, X, X,
+    10736, 5766, 11983, X, 19711, 7763, 15348, 9046, 10947, X, 11665, 11666, X,
+    X, 11984, 6523, 6524, X, X, 6522, 19713, X, 15547, 16122, 16124, 16123, X,
+    9840, X, X, X, 9839, X, 10137, 17170, 17172, 17171, X, X, 10316, X, X, X,
+    17887, 17886, X, 18161, 10598, X, X, 10674, 18546, 18545, 18163, X, X,
+    18167, X, 18168, 10602, 18169, 18166, X, 18164, 10605, 10601, 18170, X,
+    10603, 10600, X, X, X, 10675, X, X, 10676, 18383, 18382, 18385, 18386, X,
+    10677, 18548, 18553, 15577, X, 15567, 15572, 15578, 15575, 15574, 15573, X,
+    15566, 15571, X, X, 15569, X, 9563, 9560, 16167, 16172, 16174, 16171,
+    16164, 16166, 16176, 16173, 16168, 16177, 16165, 16175, 9561, 9567, 9565,
+    18562, 10753, 18563, 18691, 18690, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19322, X, X, X, X, X, 19286, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19392, 19419, X, 19006, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19735, X, X, X, 11389, X, X,
-    X, X, X, X, X, X, X, 11379, 11499, X, 5968, 5955, X, X, 11500, 5952, X,
-    5970, X, 5960, X, 5959, 11488, 5963, 5958, 11493, 11501, 19133, 16324,
-    10220, 5533, 5694, 5709, 5704, X, 5699, 5698, 5705, 5703, 5696, 5710, 5697,
-    5693, 5708, 5707, 5706, 5695, X, 5702, 19136, X, 5701, X, X, 5711, 5700, X,
-    19179, X, 12222, X, 12223, X, 6758, 12668, X, 7163, 7164, 12667, X, X,
-    19410, X, 7649, X, 7645, X, 13257, 7652, 7651, 7644, 7647, 7650, 7646, X,
-    X, 13870, 7643, 8084, 19416, 8106, 13905, X, 8117, 13900, X, 13927, 8113,
-    13919, 13932, 13894, 13899, 13893, X, 8112, 13912, 14568, 13895, 8116,
-    13904, 13928, 8111, 13901, 13898, 13915, 8114, 8104, 8126, 13918, 13917, X,
-    X, 9831, 16680, 17532, X, X, X, X, X, 17138, 10127, 17142, 17139, 17146,
-    17152, 17141, X, 17161, 10124, 17155, 17144, 17156, 17151, 17158, 17143,
-    10129, 10128, 17145, 17159, 17137, 17157, 10860, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 6189, 12480, 6955, 13604, 13602, X, X, 13603,
-    14244, 14245, 14918, 14243, X, 14912, 14263, 14262, 8330, X, 14940, 14941,
-    14939, X, X, 8769, 8768, X, 9178, 9177, X, 16147, 16723, 16721, 16722,
-    9859, 17198, 17197, X, 17571, 17570, 17569, 17905, X, 18912, 6194, 6959, X,
-    19245, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19593, X, X, 12535, 12541, X, X, X, X, X, X, 7961,
-    7478, 13072, 13074, 13073, 13075, 7479, X, X, 7958, X, 7959, 7960, X, 8431,
-    14388, X, 14387, 14389, 14390, 8432, X, 8430, 9950, 16902, 16900, 16898,
-    16897, 9952, 16896, 9953, X, X, X, X, 16894, 16895, 9949, 9954, 9951, X, X,
-    16893, X, 10221, X, 17360, 17358, 17363, 17361, X, 17359, 17362, X, X,
-    6860, 6861, 6858, 6859, X, 12368, X, X, 12369, 6857, X, X, X, X, 12814, X,
-    7262, 7263, 19714, 7766, 12820, X, 7268, 7266, 12821, 12816, 7265, 7264,
-    7259, 12819, 14743, 18956, X, 14740, 14735, 14737, 14738, 14731, X, 8648,
-    X, X, 8647, X, 8643, 14734, X, 8650, X, 8651, 14733, 14736, 14744, 8645,
-    8646, 14742, 14732, X, X, X, 15373, 9059, 17042, 17043, X, X, 10278, 10279,
-    X, 10572, X, X, 10787, 5777, X, X, X, X, X, 12404, X, X, X, X, X, X, 12872,
-    7308, X, X, X, X, X, 7938, 10066, X, 10069, X, X, X, X, 10286, 17065, X,
-    17817, X, 17816, X, 18128, 10577, 10578, 18527, 18344, X, 18526, X, 18838,
-    18906, 5916, X, X, 6175, X, 12003, 6539, X, 7441, 7439, 7440, 7444, X, X,
-    X, X, X, 7925, 13668, 7933, 13667, X, 13670, 7929, 13669, 8394, 7927, 7930,
-    7926, 7931, 7932, 7928, X, X, X, 13666, 8390, 14348, X, 10896, 10897,
-    10898, 10899, 10900, 10901, 10902, 10903, 10904, 10905, X, X, X, X, X, X,
-    X, X, X, X, 10906, 10907, 10908, 10909, 10910, 10911, 10912, 10913, 10914,
-    10915, X, X, 6398, X, 6396, 19387, 6420, 6412, 6406, 6394, 11862, 6405,
-    6395, 6413, X, 12203, X, 11858, 6400, 6403, 6404, 19389, 6418, 6419, 6417,
-    6411, 6415, 6401, 6740, X, X, 19014, 13882, X, X, X, 8535, 19345, 14537,
-    8532, 8533, 8531, 14542, 14541, 14538, 8537, X, X, 14540, 8096, X, X,
-    14544, 14539, 8534, 8530, 8536, 14543, X, X, X, 8977, X, 15222, 15825,
-    16436, X, X, 9720, 19494, 16451, 9724, 9727, 16422, X, 9723, X, 16449,
-    16450, 16440, 16439, 16431, X, X, 16441, 16448, 16447, X, 9718, 9716,
-    16433, 16430, X, 16427, 16446, 9726, 12306, 12309, X, 12312, 12301, X, X,
-    12315, 12318, 12320, 12298, 6805, 6810, 12726, 6826, 12313, 12321, 12305,
-    12297, X, X, X, 12753, 6813, 12310, 12302, 12304, 6818, X, 12307, 6812,
-    12294, 9007, 15316, 9011, 9018, X, 15277, 15852, 15286, X, 9005, 9023,
-    9020, 9008, 15296, 15281, 9021, 15298, 9015, 9017, 9000, X, 15300, 15292,
-    15279, 9016, 15308, 15311, 15288, 15299, 19641, 9006, 9388, 13997, 8176,
-    14005, 14003, X, 14004, 8174, X, 14008, X, X, 19607, 19617, X, 14001,
-    13999, 8175, 14002, 14006, X, X, X, 8177, X, X, X, 14009, X, X, X, X, X,
-    19013, 11616, 6121, 11617, 11621, 6120, X, 11625, 11620, 11623, 6113, 6114,
-    6115, 6116, X, 6123, X, 11619, 6118, 6124, X, 11618, 11624, X, 6117, 11622,
-    6119, 6112, 17754, 17396, X, X, X, 10409, X, 17753, 18077, X, 18076, 17762,
-    10559, X, 18080, 18081, 18075, 18079, X, 18074, X, X, X, X, 18323, 18078,
-    10652, 10650, 18321, X, X, X, 19503, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19500, X, X, X, 5725, 5726,
-    11360, X, 5869, X, X, 19308, 11566, X, 6066, X, 11567, X, X, 6356, X, X,
-    11821, 6354, 6353, 11820, 6351, 11822, 6352, 6355, X, 6706, X, 6708, 8058,
-    8498, X, 13826, 13831, 13819, 8508, X, 8499, 8057, 13817, 13832, X, 8507,
-    8055, 8492, 13829, X, 8059, 13821, 13815, 8049, 13818, X, 13827, X, 8491,
-    8496, 8046, 13828, X, 8494, 14525, 14520, X, 14508, X, X, X, X, X, X, X,
-    15207, X, 15192, 15203, X, 15210, 8966, 8081, 15208, 8961, X, X, X, 8960,
-    15215, X, 15193, 15206, 15194, 15205, 8964, 6122, X, 19456, X, X, X, X,
+    X, 19123, X, X, X, X, X, X, 15982, X, X, 15983, X, 9463, 15985, 15984, X,
+    5214, X, 16589, 16590, 16586, X, 16587, 9794, 9795, 16588, X, 10071, X, X,
+    10067, 10072, 10068, 10070, 17074, 10083, 17068, 10078, 17081, 10082,
+    10075, 17075, 10086, 17073, X, X, 17077, X, X, X, 17473, 17479, 10292,
+    17482, 10287, 10288, 17474, 17481, 17476, 10293, 10290, X, 17472, X, 10289,
+    17478, 14809, 14822, 14814, X, 14808, 8694, 8700, 14819, X, 14812, X, 8697,
+    X, X, 8695, 14820, 8692, 8691, 14815, 8696, 8271, X, 14818, 14810, 8693,
+    8698, 8699, X, X, X, X, 9118, 12467, 12458, X, 6929, 12466, 6933, 6931,
+    6926, 12450, X, 12465, 12454, 12457, 12470, 19010, 6946, 12464, 6938,
+    12459, 12469, 12456, 12460, 12463, X, X, 12448, 12468, 12462, 19289, X,
+    12447, X, 18919, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19276, X, X, 10244, 10241, X, 17393,
+    17397, 17401, 19499, X, X, 17758, 17755, 17764, X, 17763, 17761, 17756, X,
+    10412, X, X, X, X, X, 17757, 10411, 9998, 17760, 10410, 17765, 17759,
+    12316, X, 12319, X, X, 6809, X, 6821, 12291, 6823, 6807, 6827, 12317,
+    12293, 6824, 12747, 11940, 6811, 6806, 12300, 12292, 6825, 6817, 12311,
+    6822, 6820, 12303, 6814, 12295, 6815, 6816, 12296, 15876, 9025, 9010,
+    15276, 19546, 15305, 9014, 15302, 15315, 15282, 15291, X, X, 15313, 15303,
+    9009, X, X, 15289, 9003, 9001, 9019, 19411, X, 15287, 15284, 15285, X,
+    15309, X, 15314, 15312, 18761, 18759, 18830, 10856, 10870, 18905, 18884, X,
+    18904, 18950, 18951, 5642, X, X, X, X, 5910, 11462, X, X, 11648, X, 6154,
+    X, 6157, 19139, 11649, X, 6155, 6156, 19595, X, 13589, 13585, X, 13596, X,
+    X, 13592, 13584, X, 13586, 7867, 13597, X, X, X, X, 8312, 14237, X, X, X,
+    14233, 14235, 14230, 14229, 14227, X, 14234, 14236, 14232, X, 5033, 11257,
+    5099, 5184, 5189, 5100, 11256, 5053, 5054, 5101, 5133, 5025, 5134, 5028,
+    5180, 5258, 5259, 5260, 5261, 5262, 5263, 5264, 5265, 5266, 5267, 5031,
+    5030, 5139, 5141, 5140, 5032, 19017, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19588, 19592, X, X,
+    X, 19581, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19584, 19590,
+    19591, X, X, X, X, X, X, X, 19688, 19530, 19291, X, X, X, X, X, X, X, X, X,
+    X, 19529, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19379,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19390, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, 19327, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19647, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19750, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19780, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 5172, 5170, 5173, 5171, X, X, 5174, 5175, 5177, 5176, X,
+    X, X, X, X, X, 19277, 11562, X, 11557, 11559, 11561, 11558, 6064, 11555, X,
+    11556, 6061, 6062, 11560, 11563, 6063, 11564, X, X, X, X, X, X, 19612,
+    11815, X, 11809, 6367, 6368, 11828, X, X, 6717, 12181, 6720, 6716, 6722,
+    6718, 6719, 6721, X, X, X, 7126, 7125, 7124, X, X, X, 13203, 7583, 7586,
+    7584, X, 13202, 7589, X, 7585, 13204, 10780, 18645, X, 18646, 18647, X, X,
+    18928, 5621, 11364, 5733, X, 5877, 5878, 5876, X, 5879, 6086, 6085, X,
+    11854, 6389, 6388, X, X, 12637, 7611, 7612, X, X, X, 8060, 18496, 18495,
+    18498, 10781, 10729, 18649, 18497, X, X, 18648, 10783, 10782, 10821, 18754,
+    18824, 5625, X, X, 13866, 16405, 10945, X, 5883, 11610, 6109, 6107, X,
+    6108, X, 11870, 6423, 6757, 7196, 7203, 7186, 7198, 12695, 7200, 7183, X,
+    7182, 12681, X, 12685, 7191, 12703, 12694, 12686, 7195, 7192, X, 7184,
+    7187, X, X, X, X, X, X, X, X, 19467, X, X, 14210, 14213, 8306, X, 14211, X,
+    14222, 14220, 14215, 14217, 14219, 8303, X, X, X, X, X, X, X, 14892, 14898,
+    14888, 14894, 8723, 14890, 8729, X, X, 8728, X, 18452, 10711, 18458, X,
+    18457, X, 18453, 18465, X, 18454, 18615, 18468, 18470, 18461, 18455, 18616,
+    18618, 18612, 10772, X, 18625, 18623, 10773, 18622, 18621, 18614, 18611,
+    18617, 18626, 18613, 18619, 17712, 17711, X, X, X, X, 18739, 10851, X,
+    18877, 18902, X, X, X, 8863, 16315, 16316, X, 16884, 8864, X, 10391, 17713,
+    X, 18478, 10715, 18479, 18477, 18740, X, 18818, X, 19313, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19034, 19380, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19731, 19466, 19541, X, X, X, X, 19230, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19346, X, X, X, X, X, X, X, X, 6220, X, X, X, X, 5519, X, 5561, 11320, X,
+    5562, 11339, 5945, 11697, X, X, 10926, X, 5520, 5563, X, 5656, 11340, X, X,
+    10927, 15073, 15074, 8881, 8880, 15412, X, X, 9263, 9264, 9265, 9267,
+    15687, 15688, 9266, X, X, X, 9654, X, 9655, 19080, X, 17723, 18309, 18308,
+    18637, X, 5510, X, X, X, 5680, 16326, X, 9669, 16330, 9661, 9665, 16329, X,
+    9664, 9660, 9663, 9658, 9668, 16331, 16327, 9667, 16325, 9666, 16332,
+    16328, 9280, X, 9670, 16334, 9662, 9659, X, X, X, X, 16899, 16901, 11792,
+    11785, X, 11788, X, 6330, 6321, 11795, 11793, 19222, 6326, 6324, 11784,
+    6323, 11782, 11781, 6322, 6320, 6329, 6325, 6317, X, 11789, X, 6681, 19227,
+    6688, 12136, 6680, 12128, 12124, X, 17791, 10423, 17790, 17789, 17787,
+    17788, 10656, 18099, 18509, 18832, X, 5649, X, 11371, 5753, 11372, X, X, X,
+    11464, 11465, X, X, X, X, 11656, X, X, 11652, X, 11651, 19674, X, 15337,
+    9041, 9040, 19243, X, 15342, X, 9417, 9042, X, 19680, 9044, 15343, 8607,
+    9043, 15339, 15341, 15338, 19682, 15340, 19678, X, X, 15930, X, X, 15929,
+    15926, 9420, 16519, 9423, 9428, 9429, 15939, 9426, 15934, 9427, 9047,
+    15941, 9424, X, X, 19716, 16529, X, 16528, 16536, 16530, 16535, 16532,
+    9766, 16534, X, X, 9767, X, 9768, X, 16533, 16531, X, X, 19097, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19047, 19025, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19342, X, 10929, 5527, 5571, X, 5784,
+    5786, 5785, X, 5946, X, X, 6226, 6227, 6600, 6601, X, X, X, X, 6999, X, X,
+    14368, 19304, X, 18485, 5503, X, X, X, X, X, 5233, X, X, X, X, X, X, X,
+    5232, X, X, X, X, X, X, X, 5231, X, X, X, X, X, X, X, 5230, X, X, X, 17830,
+    X, 10449, 17831, 18530, 10827, 18771, 5918, 6542, 6541, 12418, 6905, 19538,
+    X, 12417, 12908, X, 7328, 13489, 12907, X, X, X, 7815, 13492, 13490, 13491,
+    7814, X, 15633, 16244, X, 16243, 19755, X, 9898, 9899, 16814, 9900, X,
+    17261, X, 17259, X, 17260, 10194, X, 17631, 10511, X, 10950, X, 10195,
+    6595, X, 7447, 13038, X, X, 13671, 7934, 8396, 14353, 14355, 8398, 8397,
+    8399, 8400, 14354, 8838, 8839, 8837, 9227, 8836, 15030, X, X, X, 9228,
+    16245, 16815, 9901, 10196, 17632, 17636, 10356, 17633, 10357, 10355, 17637,
+    10358, 17635, 9229, X, 16248, X, 9606, 16246, 9607, 9608, 16247, 9609, X,
+    16816, X, 9905, 9902, 9907, 16818, 9903, 16817, 9906, X, X, 9904, X, 17264,
+    17266, X, X, 10197, 17265, 10198, 17263, 9610, 10515, 6987, X, X, X, 9910,
+    X, 10804, 6988, 13672, X, 14358, X, 14360, X, 14359, X, 15038, 15035, 8845,
+    X, 8846, 15036, 15037, X, 15637, 15642, 9230, 15636, 15638, 15645, 10199,
+    17268, 17647, 10360, 17645, 17648, 10361, X, 17643, X, 17646, 17644, 17641,
+    10362, 17642, X, X, X, X, 17961, X, X, 17963, 17962, X, 18222, X, 18223, X,
+    19329, X, 18417, 18700, 6992, 7939, 7940, 13673, 8404, 8405, 14361, 8406,
+    X, 8850, X, 8852, 15040, 15041, 15039, 8847, 8848, 8851, 8849, 19401, X,
+    15648, 9233, 9234, X, X, 16261, 9616, 16256, 16255, X, 5115, 5114, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 5108, 5107, X, X, X, X, X, X, X, X,
+    5117, 5116, X, X, 15204, X, X, 15779, X, 8959, 9345, 16400, 15784, 15783,
+    15785, X, X, 15782, 9346, X, 9352, 9349, X, 9350, 15777, 15780, 15790,
+    9358, 9356, X, 15781, 13842, 9343, 15787, 6122, X, 19456, X, X, X, X,
     19455, X, X, 6460, X, 11889, 6440, X, 6450, 6451, 6443, 6461, 6445, 11897,
     6456, 11892, 6446, 11907, 11908, 11900, 11893, 6459, 11905, 6454, 6452,
-    18324, X, 18320, 18322, 10651, X, X, X, 18500, 18501, 10730, 18499, X, X,
-    X, 18654, 10785, 18652, 18653, 18757, X, X, 10855, 18828, 18826, 18827,
-    18829, X, X, 19502, 18929, X, 12975, 12961, 7386, 7383, 12973, X, 12976,
-    12962, 7384, 7381, X, X, X, X, 7862, 13569, 7861, X, 13572, 13575, 7858,
-    7856, 13564, 13573, 13571, 13568, 13576, 13577, 13579, 13580, 13563, 5940,
-    12475, X, 12983, 12984, X, X, X, 14224, X, 18376, 18777, 5941, 6952, 12476,
-    X, X, X, 13581, 7864, X, 14226, 14225, 8309, X, 8734, 16109, 9517, X, 9518,
-    X, X, 11141, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 11135, 11136, 11137,
-    11138, 11139, 11140, 11142, 11143, 11144, 11145, 11146, 11147, 11148,
-    11149, 11150, 11151, 13047, 13045, 13057, 13063, 13064, 7464, X, X, 13686,
-    13061, 13044, 13062, X, 7474, 13067, 7473, 13043, X, 13051, 13068, 7469,
-    7468, 7465, 7470, X, X, 7456, X, X, 7457, X, X, 18658, 18762, 19629, X,
-    18831, 18930, 10890, 18940, 5643, X, 6505, 6506, 19632, X, 6837, X, X, X,
-    X, 10032, 5644, X, 6507, 7240, 8601, 5645, X, 7739, 9035, 11338, 14044,
-    14037, 8190, 14041, 14040, 8191, 8197, X, 8198, 14043, 8188, 14034, 14032,
-    14038, 14031, 8195, 14033, 14039, 14045, 8189, 8194, 8192, 8193, X, X,
-    19669, 8187, X, X, X, X, 8613, 8619, 8621, 19715, 14704, X, X, X, X, 15350,
-    9050, 15354, 9049, 15351, 9048, X, 14703, 14710, 15353, X, 9051, 15355,
-    15352, 15349, X, X, 15936, 15940, 15942, 15938, 15937, 15935, 9425, 6532,
-    6533, 11996, X, 12396, 12395, 6883, 6886, 6885, 6884, 12392, 12394, 12393,
-    X, X, 12851, 7291, 12855, 12854, 12853, 12849, 7290, 7294, 7297, X, X,
-    7298, 12850, 12852, 7296, 7295, 7293, 14103, X, X, X, 14099, 14105, 8233,
-    13451, 14100, 8231, 14097, 8238, 14101, 8237, 14102, 8239, 8234, X, 8235,
-    X, 8236, X, 8232, X, 14104, X, X, X, X, X, X, X, 5036, 5035, 5029, X, X, X,
-    X, X, X, X, X, X, X, 5098, X, X, 5097, X, X, X, X, X, 5102, X, X, X, X,
-    19042, X, X, X, X, 19239, X, X, X, X, X, X, X, X, X, X, X, X, X, 19662, X,
-    X, X, X, X, X, X, X, 19099, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 6587, X, X, 13663, 14343, 16238, 17952, X, X,
-    11049, 11050, 11051, 11052, 11053, 11054, 11055, 11056, 11057, 11058,
-    11059, 11060, 11061, 11062, 11063, 11064, 11065, 11066, 11067, 11068,
-    11069, 11070, 11071, 11072, 11073, 11074, 11075, 11076, 11077, 11078,
-    11079, 6627, X, 7034, X, 7032, 7033, X, X, X, X, 9652, 10932, 5674, X, X,
-    X, 5811, 11394, 19058, 19067, X, 19004, 5979, 5980, 19059, 11504, X, X,
-    11726, 6255, 11727, X, 10944, 6074, 19328, 6073, 6715, X, 12619, X, 7581,
-    7853, 7582, 7580, 8037, X, 15166, 8946, 9317, 19331, 11316, 11429, X,
-    11576, 6075, 11575, 6076, X, 19074, 6370, 11830, 11829, 6369, 14494, 8510,
-    8511, 14496, 14498, 14497, X, 15189, X, 15188, 8958, 15190, X, 15774, 9339,
-    X, 9691, X, 9977, 10228, 9978, X, 5622, X, X, X, 11593, X, X, 11855, 6391,
-    6390, 10946, 11334, 6761, 19425, X, 5630, 5739, X, 5885, 5884, X, X, 5886,
-    5887, 11444, 11443, 11611, 6110, 11614, 11613, 11612, 11615, X, X, X, X,
-    6426, 11878, 11874, 11883, X, X, 12430, 6915, 6916, 12432, X, 12426, 12429,
-    12438, 12436, X, 6917, 12442, 6920, 12439, 12431, 12428, X, X, 14139,
-    12437, 6912, 12440, 12425, 12434, 6914, 6919, 12435, 6923, 6921, X, 18418,
-    X, 18576, X, 18795, X, X, X, X, X, X, X, 6990, X, X, 16822, 17274, X, 6991,
-    X, X, 9232, X, 16823, 10363, 17653, 10517, X, 18224, 18225, X, 5166, X,
-    5167, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19377, X, X, 5828, X, 5834, 5830, X, 5836, 11403, 5833,
-    5823, 5826, 5829, 5825, 5832, 5835, 5824, 5827, 5831, 5837, 19138, X, X, X,
-    X, 11523, 11520, X, 6005, 11521, 5993, 5995, 6019, 13112, 13131, 7524,
-    19195, 13137, 7518, 7520, 13120, 13115, 7076, 7519, 13117, 13132, 13136,
-    13127, X, 13129, X, X, X, 13107, X, X, X, X, 13722, X, 13731, 13730, 8002,
-    13723, X, 14596, 14594, 14593, X, 14592, 14591, 8558, 14595, 8997, 15264,
-    15266, 8998, 15265, 9384, X, 9383, 15842, X, X, 16453, 16452, 16454, X, X,
-    9728, X, 16967, 10004, X, 17404, 10247, 13314, X, 13342, X, 7729, 7717,
-    7728, 7707, 13326, 13344, 13336, 7708, 7702, 13350, X, 13343, 13345, 7710,
-    7718, 13347, 13324, 13341, 13329, 13349, 7723, 7699, 7721, 13334, 13332,
-    13333, 7712, 13328, 9739, 9736, 9731, 9734, 16471, X, 15855, 16466, 16469,
-    16486, 16474, 16464, 16970, 16488, 16468, 16482, X, X, X, 19582, 16973,
-    10020, X, X, 10008, X, X, 10012, 16975, 16981, 16979, 10010, 10031, 16984,
-    16990, X, 16988, 10027, 10026, 10023, 16986, X, X, X, 10029, 10028, 10025,
-    X, 16989, 16985, 16987, X, 10030, X, X, X, 10260, 17423, X, 10257, 10258,
-    17425, 10259, 17422, 7251, X, X, 12796, 19677, 12792, X, 12795, 12806,
-    12797, 7252, 12355, X, 7248, 7250, 19003, X, X, X, X, 13401, 13390, 13388,
-    19665, 13389, X, 13396, X, 13397, 13393, 7752, 13398, 8209, 14052, 8203,
-    8205, 14056, X, 14053, 14050, X, X, X, X, X, 14713, X, 14702, 8620, 8623,
-    8622, 8627, 8626, 14714, 14712, 14705, 14709, X, 8624, 14711, 14707, 14715,
-    14706, 8625, 16560, 16556, 16557, 16554, X, 16551, X, 9778, 9775, 16550,
-    16552, X, 9777, 16558, X, 10054, X, 19176, 17028, 17023, 10053, X, X,
-    10051, X, 17030, 10052, 17026, 17027, 17024, 17031, 17449, 12405, 12406, X,
-    X, 12874, 12876, 7309, X, 12878, 12881, 12879, X, X, X, 12880, 12877,
-    12873, 7310, 12882, 12875, X, X, X, X, 13458, 7793, 13467, 7790, X, 13460,
-    7794, X, 10496, 10504, 17945, 10507, X, 17941, 17951, 10509, X, X, X,
-    17937, X, 17944, X, 19573, 19683, X, X, X, 18200, 18214, 18202, 18209,
-    17936, 18207, 18190, 18212, 10616, 18194, 18211, 18934, 18935, 18933,
-    18943, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 19301, X, X, X, 5544, X, 5612, 11419, X, X, 11553, X, 11554,
-    X, 6056, X, X, X, 13777, 8021, X, 14456, X, X, X, 9963, 5545, 5565, 5613,
-    11357, 5721, X, 6060, 6059, 7588, 7587, X, X, 19030, 13807, 13806, 19334,
-    8040, 8038, 8039, 13808, 8489, 14480, 8490, 14479, X, X, 15755, X, X, 9319,
-    15167, 9318, X, 8947, X, 16923, 16381, 9971, 16922, 17741, 11440, 11436,
-    11438, 5880, 11435, 11442, 11437, X, X, X, X, X, X, 6093, 6102, 6100,
-    11603, 11600, 11608, 6098, 11609, X, 6091, 11606, X, 6097, 11602, 11601,
-    6095, 11607, 6096, 6393, 6433, X, 6431, 11879, 11875, 11882, 6430, 6437,
-    11877, 11873, 6436, 11880, 6429, 11881, 6432, 6434, 11885, 11884, 11876,
-    6428, 6427, 6435, X, X, 19428, X, X, X, 12230, 12236, X, 6767, 15804, 9371,
-    9379, X, 15833, 9380, 15805, 15839, 15826, 15832, 9377, 19470, X, 15829, X,
-    15836, X, 9382, X, 9376, 15822, 15809, 15841, 15806, 15834, 9373, X, 15816,
-    X, 15817, 9372, 9369, 11937, 6130, 6153, 6144, 11632, 6133, 6148, 11640,
-    6131, 6132, 11935, 11633, 6139, 6150, 11647, 11634, 6137, X, 6142, 11915,
-    6151, 11641, 6141, X, 6152, 6129, 11638, 6134, 11642, 11936, X, X, 6202, X,
-    6205, 6204, 6203, X, X, 11685, X, 12039, X, 12041, 6578, X, X, 6580, 12038,
-    12040, 6579, 12043, 12042, 12044, X, X, X, X, X, X, X, X, 5113, 5112, X, X,
-    X, 5105, X, X, 5109, 5106, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19050, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19558, 19568, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19690, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 19376, X, X, 19125, X, 7490, X, 19126, X, X, 5514, 5532, 5603, 5602,
-    X, 5604, X, X, X, X, X, X, 6276, X, 6275, 6277, X, 19130, X, 6643, X, X, X,
-    7048, 7521, 13126, 13108, 13122, 7522, 13124, 19193, 13130, X, 13134, X, X,
-    13125, 13113, 13121, X, 13135, 13133, 13123, 13118, 13111, 13727, 13109,
-    7526, 13116, 7527, 7523, 13106, 13128, 13114, 19129, X, 19469, 15815, X,
-    15811, 15807, 15827, 15824, 9370, X, X, 15831, 15814, 9381, 15821, X, X,
-    15810, 15820, 9378, 15840, X, 15837, 15823, 15808, 19491, 19452, 15828,
-    15830, 9374, 15818, 15813, 11939, 6485, 11926, 11928, 6483, 6488, 11929,
-    11942, X, 6804, 6494, 19098, 6472, 11941, X, 11945, 11925, 11947, 11932,
-    6481, 11921, 6480, 6498, 6487, X, 11919, 12299, 6493, 6497, 11933, 11938,
-    X, 13589, 13585, X, 13596, X, X, 13592, 13584, X, 13586, 7867, 13597, X, X,
-    X, X, 8312, 14237, X, X, X, 14233, 14235, 14230, 14229, 14227, X, 14234,
-    14236, 14232, X, 5316, 5317, 5318, 5319, 5320, 5321, 5322, 5323, 5324,
-    5325, 5326, 5327, 5328, 5329, 5330, 5331, 5332, 5333, 5334, 5335, 5336,
-    5337, 5338, 5339, 5340, 5341, 5057, 5045, 5058, 5153, X, 5573, 5572, 11322,
-    5574, 5580, X, 5575, 5576, 11324, 11323, 5578, 5579, X, 5577, X, X, X, X,
-    X, X, 5662, 5663, 5664, 5665, 5661, 5668, 11346, X, 11342, 10958, 5669,
-    5685, 5689, 5688, X, 11511, X, X, 6271, X, X, 10935, X, X, 11327, 19108,
-    5691, 5690, 5821, 5822, 11512, 5991, 19109, 5992, X, 6272, 6273, 6274, X,
-    6641, 12079, X, 19111, 7045, 11769, X, 6667, 6301, X, X, X, X, X, X, X,
-    6668, 12109, X, X, 12115, 19350, X, X, 6674, 12113, 12119, X, 12110, 12114,
-    12116, 12118, 12112, X, 12111, 12106, 12107, 19362, X, 13746, X, X, 13751,
-    13749, 8012, X, 13761, X, 19236, 13752, X, 13754, 13742, 14439, 14437,
-    8480, 8478, 14447, 14438, 14448, 14444, 14436, 14450, 14435, 14442, 8477,
-    8476, 8475, 14440, 17368, X, 17634, 17739, X, X, 18059, 18060, X, 10551, X,
-    18315, X, 10643, X, 18316, X, 18493, 10726, X, 10725, 18492, 10779, 19288,
-    18642, X, X, 10939, X, 5547, 5868, 11424, 13225, 13825, X, 13223, 13814,
-    7599, 7606, 7610, 13217, 13809, 13221, 7595, 13811, 13224, 13813, 13213, X,
-    8041, X, 13211, 13212, 7605, X, X, 7604, 13215, 7609, 13219, 7602, 13216,
-    X, 7607, 13845, 8073, X, 8071, 12647, 13838, X, 14529, 13839, 8066, 8079,
-    14501, X, 8075, 8076, 13840, 13863, 14500, 13848, 13843, 8078, 13849,
-    13846, X, 19395, 8083, X, X, X, X, X, X, 18257, 18263, 18261, 18255, 18266,
-    X, 18254, X, 10628, 18262, X, X, X, 18258, 10627, 18265, X, X, 18264, X, X,
-    X, X, 18442, 18441, X, X, 19212, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 10965, X, X, 8086, 8087,
-    13869, 13872, 8085, 13867, 13871, X, 13868, X, 8527, 19415, X, 14534, X, X,
-    8971, 15218, 9706, 9361, 15791, 9362, 9363, 15793, 15792, 15794, 16407, X,
-    X, 16406, 19476, 19475, 19769, 19667, 13890, 8109, 13930, 13906, 13908, X,
+    10003, 16951, 9996, 9999, 16959, 16947, 16962, X, 16958, X, X, X, 10240,
+    17403, 10245, 10246, X, X, X, 10239, 17402, X, 17399, 17400, 10243, 17394,
+    17398, 10242, X, 17395, X, X, 6202, X, 6205, 6204, 6203, X, X, 11685, X,
+    12039, X, 12041, 6578, X, X, 6580, 12038, 12040, 6579, 12043, 12042, 12044,
+    X, X, X, X, X, X, X, X, 5113, 5112, X, X, X, 5105, X, X, 5109, 5106, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19050, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 19558, 19568, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 19690, X, X, X, X, X, X, X, X, X, X, X, X, X, 19376, X, X, 19125, X,
+    7490, X, 19126, X, X, 5514, 5532, 5603, 5602, X, 5604, X, X, X, X, X, X,
+    6276, X, 6275, 6277, X, 19130, X, 6643, X, X, X, 7048, 11769, X, 6667,
+    6301, X, X, X, X, X, X, X, 6668, 12109, X, X, 12115, 19350, X, X, 6674,
+    12113, 12119, X, 12110, 12114, 12116, 12118, 12112, X, 12111, 12106, 12107,
+    7535, 7531, 13170, 13154, 13157, X, 7539, 13167, 13159, 7532, 7540, X,
+    13164, 13162, X, X, 13147, 13168, 13156, 13151, X, 13141, 13169, 13153,
+    13140, X, 7538, 13158, 13171, 13155, 13143, 13148, 12609, 7115, X, X, X, X,
+    7555, 7554, X, X, X, 13178, 13182, 13184, 7556, 13187, 19283, 7560, 13189,
+    X, 7562, X, 7558, 7566, 19284, 7563, 13180, 7557, X, 13179, 13177, 13191,
+    6372, 11584, X, 11586, 11585, 11832, X, X, 11581, X, 6084, 6082, X, 11580,
+    11582, 11588, X, 6081, X, 11583, 11592, 6374, X, 11589, 6083, X, 11587,
+    11590, X, 6373, X, 6375, 11440, 11436, 11438, 5880, 11435, 11442, 11437, X,
+    X, X, X, X, X, 6093, 6102, 6100, 11603, 11600, 11608, 6098, 11609, X, 6091,
+    11606, X, 6097, 11602, 11601, 6095, 11607, 6096, 6393, 15219, 8972, 16408,
+    X, 5628, 5738, X, 6424, 11871, X, 12224, 6759, 7655, X, 13876, 8090, 8529,
+    X, 15795, 15796, X, 19418, 16941, 10236, 18825, 5629, X, 11872, 6425, 6760,
+    X, 12225, 19476, 19475, 19769, 19667, 13890, 8109, 13930, 13906, 13908, X,
     13921, 13920, 13888, 8120, 8122, 13896, 13903, 13911, 8121, 13902, 13914,
     13933, X, 13922, X, X, X, X, X, X, X, X, 10952, 5430, X, 5428, 5429, 5431,
     X, 5123, X, X, X, X, X, X, X, X, X, X, X, 5427, X, X, X, X, X, X, 5681,
     5682, X, 5818, 11510, 11734, 11735, X, 6639, 12543, 7485, 7484, 13694,
     13693, X, X, 5511, 5595, 5683, X, 7486, 11307, X, 11348, 5684, X, 11400,
-    11329, X, 11350, 11351, X, X, X, X, 5843, 5847, 11407, X, 5845, 5844,
-    11406, 5846, 5842, X, X, 5841, 11408, X, X, X, X, X, X, 6034, X, X, 6031,
-    X, 8981, 15260, 8995, 15244, X, 15263, X, X, 15228, 15249, 8984, 8993,
-    8991, 15230, 15251, 8990, X, X, 8983, 15247, X, X, X, X, 15257, X, X, X, X,
-    X, X, 7942, 14364, 15054, X, 8861, 15052, X, X, 15053, X, X, X, 15671,
-    15672, 9249, 9247, 15673, 9248, 16305, X, 16308, 16302, 16309, 16301,
-    16303, X, 16304, 18022, 18017, 18036, X, 18019, 18033, 18024, 18040, 18020,
-    10531, 18018, 18025, 18026, X, X, X, 18273, X, 18271, X, 18276, X, 18288,
-    18279, 18272, 18268, 18281, 18274, 18277, 18270, 18284, 18267, 18044, X,
-    18735, 8415, X, X, X, X, 17346, X, X, X, 10869, 8416, 9643, 10213, 18736,
-    8417, X, 16314, 9941, 16881, 16882, X, 9940, X, 17347, 10217, 10215, 10216,
-    10214, 17710, 18301, 10635, X, 10634, 18483, 18482, 10717, 10718, X, X,
-    10776, 18633, 10775, X, 18748, 18749, 18747, 18746, 10853, X, 18820, 18821,
-    18822, 10852, 18879, 18882, 18881, 18880, X, X, 18953, X, 10929, 5527,
-    5571, X, 5784, 5786, 5785, X, 5946, X, X, 6226, 6227, 6600, 6601, X, X, X,
-    X, 6999, X, X, 14368, 19304, X, 18485, 5503, X, X, X, X, X, 5233, X, X, X,
-    X, X, X, X, 5232, X, X, X, X, X, X, X, 5231, X, X, X, X, X, X, X, 5230, X,
-    X, X, 16610, 10090, 17083, X, X, 10294, X, 17829, 17828, 10583, 18351, X,
-    18529, 10826, 11470, X, X, 6540, 6176, X, X, 12416, X, X, 12906, 12901,
-    12905, 12903, 7327, 10102, X, 10101, 10099, 17091, 17094, 10098, 17095, X,
-    10105, 17093, X, 17092, 10299, X, 10300, 17490, 17488, 17489, X, X, 17837,
-    X, 17836, 10454, 18137, 10585, 18136, X, 18354, 18531, 10744, 7846, X,
-    7838, 13528, 13533, 13550, 13556, 7851, 13529, 13541, 13547, 7841, X, X,
-    13558, 13551, 13554, X, X, X, X, X, X, X, X, 19679, X, X, X, 7840, X,
-    14174, 16659, 16640, 16646, 16650, 16644, 16664, 16661, 16658, 9821, 9822,
-    9826, 16637, 16665, 9825, 16655, X, X, 16653, X, X, X, 16656, 17132, 17113,
-    17118, 17131, 17117, 17109, 17114, X, 10112, X, 18448, X, 18444, 18447,
-    10708, X, X, 18445, 18446, X, 18440, 18443, 10707, X, X, X, 10769, 18608,
-    18603, 18607, X, 18610, 18606, X, 18602, X, 10771, 18605, 18609, 10770,
-    18600, 17338, 17325, 17334, 17335, X, 17333, X, X, X, X, 17696, 17698,
-    17701, X, X, 17695, X, 10387, 17703, 17694, 17704, X, 17700, 17702, 17706,
-    17699, 17707, 17697, 17693, 10388, X, 17705, 15055, X, 8862, 16313, X, X,
-    16877, 16878, 16876, 17343, 17342, 10212, 17709, 17344, 17708, X, X, 18043,
-    10536, 10538, 18042, X, X, 10537, X, 18291, 18293, 18292, 18473, 10713, X,
-    10817, 17354, X, 18635, X, 18903, X, X, X, X, X, X, X, X, X, X, X, 11210,
-    11212, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19256, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19325, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19468, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 11204, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19337, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19576, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19336, 15073, 15074, 8881, 8880, 15412, X, X, 9263, 9264, 9265, 9267,
-    15687, 15688, 9266, X, X, X, 9654, X, 9655, 19080, X, 17723, 18309, 18308,
-    18637, X, 5510, X, X, X, 5680, 10639, 10638, 10640, 18310, X, 18487, 18486,
-    X, 10721, 10723, 10722, 18488, 10778, 18751, X, X, X, 10819, X, 18750,
-    18823, X, X, 11313, X, X, 5713, 5712, X, 5840, 5839, 11405, 7088, X, X,
-    7089, 19218, 7091, X, X, X, 7090, X, X, X, 12589, 12590, X, X, X, X, 12596,
-    X, 13145, 7530, 13755, 13144, 13163, X, X, 7536, X, 13161, X, 11667, 6168,
-    X, 6525, X, 6863, 6864, 6865, 13413, 12822, 7269, X, X, 7769, 13412, 19722,
-    X, 14059, 8213, X, 14058, 8212, X, X, 14716, 9430, 15946, 15943, 15944,
-    15945, X, 10147, 17567, 17902, X, 18687, 6192, 12998, 7405, 7883, 14935,
-    14934, 9542, 16146, 9543, 17192, 10322, X, X, X, 10887, 6193, 12037, 12999,
-    X, X, 7884, X, 13611, 13612, X, 14261, 18782, 10861, X, 18857, 18856,
-    18855, 18888, X, 18932, 18913, 10879, 6198, 7411, X, X, X, X, X, 8787, X,
-    X, X, X, X, X, X, 9568, X, X, 16744, X, X, 5215, 5216, 5217, 5218, 5219,
-    5220, 5221, 5222, 5229, 5228, 5227, 5226, 5225, 5224, 5223, X, X, X, X,
-    5235, 5238, X, X, X, X, X, X, X, X, X, X, 19241, X, X, X, X, 19566, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19220, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19457, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19521, X, 19144, X, X, X, X, X, X, X, X, X, X, X, X, 19700, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19114, X, X, X, X, X, X, X,
-    X, X, X, X, X, 19131, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 5046, 5048, X, X, X, 5091, 5092, X, X, 5093, 5094, X, X, 11824,
-    11825, 11826, X, 6364, 6365, 11823, 6366, X, X, X, 6714, 12179, X, 12618,
-    7123, X, 12617, X, 7577, 13200, 7578, 13201, X, 19323, X, 8036, X, X, X,
-    19670, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 18999, 19427, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19320, X, 9671, 16342, X, X,
-    9674, 16344, 9673, 16337, 16339, X, X, X, X, 9958, 16905, X, 9957, 16906,
-    9956, 16904, 9955, 16903, X, 10224, 10223, 17732, 17734, 19204, 17733,
-    10395, 10396, 15134, 8926, 8930, 15135, 8931, 8927, 8928, 8925, 8929, 9301,
-    13769, 9302, 9300, X, 9299, 16357, 9679, 16917, 16918, 19265, X, 10398,
-    10550, X, 5542, X, 5865, X, X, X, X, 19207, 14478, X, X, 15165, 15164, X,
-    8945, X, 9316, 15754, 9681, 16380, 9970, X, 10727, 18644, 10943, X, X, X,
-    11827, X, 12180, 7579, 13805, 8488, X, X, X, 10226, X, X, 15415, X, 9083,
-    15410, X, 9082, 15400, X, 15402, 9075, 15407, 15406, 15409, 9080, 15404,
-    15403, X, X, 9079, 9074, 15405, 9077, 15411, 15413, X, 15408, 15401, 9078,
-    X, X, 19357, X, X, X, X, X, X, X, X, X, X, 19663, X, 19358, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19132, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19578, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19321, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 18991, 18990, 18972, 18981,
-    18963, 18974, 18983, 18965, 18978, 18987, 18969, 18980, 18989, 18971,
-    18975, 18984, 5528, 5582, X, 5581, 5671, 5670, 5806, 5805, 5807, 5804, X,
-    5976, 5975, 5977, X, X, X, X, 6249, X, 6248, 6250, X, 6624, X, X, 12527, X,
-    7475, X, X, 13691, 8885, 15086, 15088, X, 15091, X, 8890, X, 8897, 8891, X,
-    X, 15081, 8892, 8893, 15084, 8898, X, 15082, 15087, 8889, 15080, 8895,
-    8887, X, X, X, 8886, 15085, 15090, X, 8896, 11792, 11785, X, 11788, X,
-    6330, 6321, 11795, 11793, 19222, 6326, 6324, 11784, 6323, 11782, 11781,
-    6322, 6320, 6329, 6325, 6317, X, 11789, X, 6681, 19227, 6688, 12136, 6680,
-    12128, 12124, X, 12811, 7758, X, X, 8199, 8200, X, 5760, 5761, 11467, 6165,
-    6164, 6852, 12365, 14047, 5762, 5763, 5764, 5765, X, X, X, 6166, 6167,
-    11664, 11663, X, X, 6521, 11982, 11980, 14730, X, 5772, 6170, X, 6529,
-    19115, 12380, 12381, 7278, X, X, 14071, 8217, 8642, 10050, 17022, 17801,
-    18111, 5773, 19747, X, X, 11995, 11990, 11992, 11994, 11993, 11991, 6530,
-    X, X, 19453, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 6589, X, 11376, X, 5432, 5433, 5434, 5435, 5436,
-    5437, 5438, 5439, 5440, 5441, 5442, 5443, 5444, 5445, 5446, 5447, 5448,
-    5449, 5450, 5451, 5452, 5453, 5454, 5455, 5456, 5457, 5458, 5459, 5460,
-    5461, 5462, 5463, 16890, 9946, 16888, X, 16889, 16887, 16886, X, X, 16891,
-    9944, X, X, 17356, 17357, X, 15677, 17355, 9947, 10393, 17721, 17722, X,
-    10636, 10637, 18307, 18306, 10720, 10719, 18636, X, 5504, 14398, X, 14413,
-    14391, 14400, 8452, 8453, 8445, 14409, 8455, 14396, 14395, 14393, 14411,
-    8443, 14405, 14394, 8446, 14403, 8441, 14399, 14406, 14408, X, X, 14412,
-    8450, 14392, 8444, 14397, X, 8439, 11410, 5858, 5857, 5854, 5852, 11412, X,
-    X, X, X, 6047, X, X, 6044, 11545, 11548, 11547, X, 6038, 6046, X, X, 6043,
-    11544, 11542, 6042, X, X, X, 6037, 6040, X, 14649, 14656, 14658, 14664,
-    19608, 8598, 14644, X, 8590, 19610, 14659, 8595, 14665, 8586, 19614, 14662,
-    X, 14646, 14663, 14645, X, 8600, X, 14657, 8587, 14666, X, 8592, 14650,
-    8597, 14661, 10734, 18660, 18659, 18661, 5754, 12346, 7247, 7747, 13387,
-    5755, 11373, 5650, X, X, 11466, X, X, X, 11662, 11660, 11661, 11658, 6163,
-    11659, X, X, X, X, 19124, 11977, X, 6518, 16527, X, X, X, 17007, X, 10430,
-    10429, X, X, 10736, 5766, 11983, X, 19711, 7763, 15348, 9046, 10947, X,
-    11665, 11666, X, X, 11984, 6523, 6524, X, X, 6522, 19713, X, 14930, 14926,
-    14929, 14927, 8758, 14921, 8753, X, X, X, 15555, 9162, 9165, X, 15557, X,
-    9173, 15556, 9167, X, 9529, 15558, X, 9172, 15554, 9174, X, X, X, 9163, X,
-    19616, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19734, X, X, 11507, X, X, 5982, 5981, 19076, X, 5985,
-    5983, 5984, X, X, X, 6262, X, 6261, 11732, 11729, 11730, X, 11728, 6263,
-    6259, 6258, X, 6260, 6257, 19077, X, X, X, 14161, 19364, X, X, X, X, 14859,
-    X, 14881, 8656, 14864, 19555, 14862, 14841, 8706, 14857, 14877, 14853,
-    8714, 14876, 14851, 8293, 14867, 14852, 14874, 8713, 8705, X, 14830, 17495,
-    X, 17497, 17496, 17502, 17507, 17494, 17501, 17506, 10306, X, 17504, X,
-    10304, 17505, 10302, 10305, 17856, 17510, X, X, 10458, X, 17848, 17852,
-    17844, 17847, X, 17855, 10456, 17860, 17853, 9509, 16087, 16106, 16078,
-    16079, 16102, 9510, 16107, 9512, 16108, 16092, 15504, 16098, 16091, 16100,
-    16097, X, X, X, 16082, 9507, 16105, 9508, 16080, 9511, 16678, 16099, 16104,
-    X, 19055, X, X, 19310, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19766, X, X, X, 11308, X, 5601, X, X,
-    X, X, X, 11402, X, X, X, 11513, 11514, X, X, 11737, 19116, 11738, X, 12081,
-    12080, 12083, 12082, 6642, X, 13079, 7047, 12544, 7046, 6669, X, 6671,
-    6670, 12108, 12117, X, X, X, X, X, X, X, X, 6673, X, X, X, X, X, X, 12105,
-    12579, X, 12578, 12583, 12574, X, 12577, 12576, X, 12580, 14445, 8472,
-    8479, X, 14433, X, 14443, 14432, 14441, 8473, 14446, 14434, 8474, 14449, X,
-    X, X, X, X, 19244, X, 15118, 8920, 8919, 8921, 15130, 15120, 15126, 15115,
-    15129, 15128, 15132, 11565, 6206, 7567, X, X, 5548, 5724, 5723, 5722, X, X,
-    6065, X, X, 7117, X, 14467, 5549, 5550, 5551, 5615, X, X, 6705, X, 12166,
-    X, X, X, 8026, 5552, 11333, 8045, 8042, 13812, X, 13214, X, 7597, X, X, X,
-    X, X, X, X, X, X, 8050, 8054, 13816, 8495, 8052, 13820, 8056, 14481, 13822,
-    8497, 8048, 8051, 13823, X, 13824, 13830, 14505, 14532, 14514, 14515,
-    14506, 14526, 14517, 14527, 14519, X, 8515, 15191, 8518, 8516, 14531,
-    14522, 14518, X, X, 14507, 8968, 14521, 8523, 14513, 19394, 14512, 19408,
-    X, X, 8517, 8513, 15212, 14546, 14816, 15225, 16419, X, X, 10238, 10558,
-    5633, X, 5742, 5743, 5741, 5744, 5740, X, X, 5893, X, 11452, 5892, 5894, X,
-    X, 11447, 11446, 11449, 11448, 11451, 5891, 11445, 11450, 10003, 16951,
-    9996, 9999, 16959, 16947, 16962, X, 16958, X, X, X, 10240, 17403, 10245,
-    10246, X, X, X, 10239, 17402, X, 17399, 17400, 10243, 17394, 17398, 10242,
-    X, 17395, X, X, 7882, 7876, X, 7877, X, 13606, X, X, 7874, X, 13607, 7879,
-    X, X, 13605, 7878, X, X, 8325, X, 8327, X, X, 14248, 8326, 8315, 8319, X,
-    8765, 14924, 9545, 9555, 9551, 9552, 9548, 16148, 9547, 16154, 16151, X,
-    9554, X, 9549, 9550, 16725, X, 16727, 16726, X, 16728, 9860, 16724, X, X,
-    10153, 17199, 10150, 10154, 10152, 10151, 17572, X, 19556, X, X, X, X, X,
-    X, X, X, X, 19764, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19444, X, X, X, X, X, X, X, X, X, X, X, X, 6479, 6495, 11922, 6486, X,
-    11943, 6471, X, 6474, 11934, X, 11920, 11924, 6482, 6484, 11927, 6491,
-    6477, 6475, 6476, 6490, 15876, 9025, 9010, 15276, 19546, 15305, 9014,
-    15302, 15315, 15282, 15291, X, X, 15313, 15303, 9009, X, X, 15289, 9003,
-    9001, 9019, 19411, X, 15287, 15284, 15285, X, 15309, X, 15314, 15312,
-    13367, X, 13371, X, 13360, X, 13365, X, X, 7735, 7736, 13370, 13358, 13354,
-    13372, X, 13362, X, X, 13366, X, X, X, 13356, X, 8172, 8173, 14010, 8179,
-    X, 13998, 14007, 15914, 15917, 15920, X, X, 16516, 16513, 16514, 9757,
-    16512, 16518, 16517, 16515, X, 16992, 16993, 10034, X, 10035, 16991, X,
-    10262, 17426, 10261, 10424, X, 10425, 10564, 18101, 18100, 18335, 18510,
-    11981, X, X, X, X, X, X, 12366, 12367, X, 19705, 6856, 6854, 19704, 6855,
-    6853, X, X, X, X, 7254, X, X, X, X, 7258, 7257, 12812, 7256, 7255, X,
-    12813, 7287, 12844, 12838, 12836, X, 7285, 13432, 7280, 12841, 12845,
-    12847, 12843, 12837, 7286, 12842, 12840, 7279, 12848, 7289, 12846, 7283,
-    12839, X, 7284, 7281, X, X, X, 19012, X, X, X, 19495, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19228,
-    19397, X, X, X, 8418, 14366, 14367, 10928, 5501, X, 5566, X, X, 6223, 5502,
-    11312, 5526, X, X, 5567, 5569, 11321, 5570, 5568, X, X, X, 5783, X, 6224,
-    X, X, 6225, 6599, 7488, 5512, 19069, 5531, 5288, 5599, X, 5598, 5597, 5687,
-    5686, X, 11349, 11401, X, X, X, 6270, 6267, 6269, 6268, X, X, 6640, X, X,
-    7965, X, 5513, X, 5600, X, 9693, 9700, 16401, 9698, 9692, X, 9699, X,
-    16398, 9980, 9694, X, 9701, 9979, 16397, 16396, X, 9703, X, 9704, X, 16395,
-    16394, 9981, 16404, 9697, 16402, X, X, X, X, 19744, X, X, X, 19745, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19510, X, X,
-    X, X, X, X, X, X, X, X, 6407, 11867, 11860, 6402, 6421, 11856, 11863,
-    11865, 11868, 6416, X, 11864, 11857, 6414, 11861, X, 11869, 6399, X, 11866,
-    6409, 6408, 11859, 6397, 6764, 12227, 12232, 19660, 6770, 6762, 12231,
-    6765, 6768, X, X, 12234, X, 6763, 12239, 6766, X, 6769, 12228, 12233,
-    12237, 12229, 12226, X, X, 12238, 12235, X, X, X, X, X, 12531, 12532, 7037,
-    19552, 12533, 19061, 12530, 7038, 7036, 7035, 12534, 19062, 13071, 19063,
-    X, 19065, 13692, X, X, 14386, 15072, X, X, X, 9262, 9653, 16322, 19589,
-    15701, 15695, 15692, X, X, 13702, 15698, X, 15691, 15697, 15696, X, 15693,
-    19174, 9278, 19175, X, X, X, 9277, X, X, X, 9279, 15699, 9657, 15700, X, X,
-    X, 16333, X, 11906, X, 11904, 11896, 11888, 11895, 6447, X, 6453, X, 6441,
-    11899, 11898, 11890, X, 6455, 11902, 11891, 6458, 11909, 6442, X, 6449,
-    11894, 11903, 6457, X, 6444, 6448, X, 11901, 5634, 5895, X, 6462, X, 11910,
-    X, X, 12282, X, X, X, 12707, 12709, X, 12708, X, 12710, 7691, 13305, 12711,
-    19505, 13304, 13306, 13307, 13936, 8128, 13937, 13939, 8129, 8127, 13938,
-    12751, X, 12745, 12754, 12752, 7231, 12737, 7216, 7215, 7223, 7229, 12749,
-    7228, 12734, 7696, X, 12758, 12733, 12728, 7221, 7233, 7214, 19543, 12741,
-    12746, X, X, X, X, X, X, X, 19366, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19446, X, X, X, X, X, X, X, X, 12162,
-    12155, 12161, 12154, 12156, 12150, 12148, X, 12163, 12160, 12146, X, 6704,
-    12158, 12159, X, 12157, 12149, 12147, 6703, 12153, 12151, X, X, 12152,
-    12164, 6372, 11584, X, 11586, 11585, 11832, X, X, 11581, X, 6084, 6082, X,
-    11580, 11582, 11588, X, 6081, X, 11583, 11592, 6374, X, 11589, 6083, X,
-    11587, 11590, X, 6373, X, 6375, 12215, 6745, 6756, 12208, X, X, X, 6748,
-    7145, 6742, X, 12205, 12212, 12204, 12207, 12211, 12640, 6755, X, 12216,
-    12217, 12219, 6741, X, X, X, X, X, X, X, X, X, 19011, 19531, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19262, X, X, X, X, X, X,
-    X, X, X, X, X, 19171, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19551, X, X, X, X, X, X, X, X, X, X, X, 19460, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19093, X, X, X, X, X, X, X,
-    X, X, X, X, 7730, 13315, 13319, X, 7711, 7709, X, X, 7700, 13317, 13316,
-    7720, X, 13322, 7714, X, 13340, 13352, 7697, 13337, 13330, 7732, 9743,
-    9733, 16485, 16465, 9735, 16477, 9742, 9737, 16475, 16971, 16481, 16487,
-    16480, 16463, 16478, 16489, 16491, 9732, 16490, 9738, 9744, X, X, X, 16484,
-    9740, 16479, X, 16467, 16472, X, 16483, 16497, 16498, 16493, 9755, 9756,
-    16492, 16507, 16502, 9749, 9746, 16501, 16499, X, X, 9752, 16503, 9747, X,
-    9748, X, 16500, 9750, 16496, X, 16505, 9753, 16508, 16509, 9754, 19106, X,
-    X, 7448, 13039, X, 13674, X, 8407, X, 8410, 8408, 14363, X, 8412, X, 8409,
-    X, X, 8411, X, 8854, X, 15043, X, X, 15044, 16265, X, 8853, 8855, 8856, X,
-    5024, 5026, 5027, 5104, X, 10959, 10960, 10961, 5073, 5074, 5069, 5070,
-    5077, 5078, 5081, 5082, 5065, 5066, 5186, X, 5061, 5062, X, X, X, X, X, X,
-    X, 5095, 5096, X, 13717, 13703, 13709, 13711, 13699, 13714, 7969, 13698,
-    19161, 7976, 7992, 7988, 13700, 7982, X, X, 7989, 7985, 7981, X, 13707, X,
-    X, X, X, X, 7987, X, X, X, 14402, 8006, 13741, 7529, X, X, X, X, 8471, X,
-    8915, 8914, 15114, X, 9292, 9675, X, 17364, 18489, 18640, 5538, 5717, X,
-    5718, 11415, 5853, 5856, X, 11413, 11411, 5855, 11414, 11416, 11804, 6345,
-    11812, 11810, 11803, 11816, 11819, 11814, 11807, 6347, 11813, 6348, 11808,
-    11811, 11802, 11806, 11818, 6349, X, 6350, X, 11805, 11817, 6344, 6346, X,
-    19287, X, X, X, X, X, 19257, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19037, X, X, X, X, X, 19235, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5136,
-    11300, X, X, X, X, X, X, X, 19066, X, X, X, X, X, X, X, X, X, X, 19026, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 19150, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 11258, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19726, X, X, 19725, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19021, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19191, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19654, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19388, 19307, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19290, X, X, X,
-    X, X, X, X, X, 19295, X, X, X, X, X, X, X, X, X, 19443, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5182, X, X, X, X, 5138,
-    X, X, X, 5145, 5158, 15071, 19361, X, 15070, 15065, 8868, 15057, 8866,
-    15060, 8877, 15063, X, 15067, X, 8867, 15069, 15068, 8875, X, 15061, X,
-    9256, 15681, X, 15678, 9257, X, 9255, X, 15685, 15682, 15675, 13102, 7512,
-    X, 7498, 7495, 13093, 7492, 19156, 13099, 19090, 7499, 13103, X, 13083,
-    13097, 7502, 13084, 13087, 13092, 19219, X, 7503, 7501, 7513, X, X, X, X,
-    7508, 19146, 7496, 7648, 19203, X, 10397, 18057, 10546, X, X, 18639, 18638,
-    10820, X, 5535, 5605, X, X, 6035, X, X, X, X, 12120, X, X, X, X, 8004,
-    8005, 19206, 14431, 8910, 15113, 15719, 6057, 6058, X, X, 11800, 6342,
-    6343, 11801, 6341, 19275, X, 6702, 12145, 6701, 6699, 6700, 7107, 7105, X,
-    X, 12603, 7106, 12602, X, 7095, 13176, X, X, 7552, 7553, X, X, 17447, X,
-    17800, 19445, X, 10433, X, 17798, 17799, X, 18107, 18110, 18108, 18109,
-    18338, X, X, 10660, 18663, 18765, X, X, 18833, 18834, 10871, 5771, 6878, X,
-    14070, X, 10609, 10611, X, 18174, 10610, 18172, 10484, 18173, 10608, 10679,
-    10681, 18391, 10680, 18390, X, 18559, 10751, 18558, 10752, 18556, 18555,
-    18560, 18561, 18689, X, 18557, X, X, 18783, 18780, 18781, 9191, X, 9197,
-    9194, X, X, X, 16189, 9580, 9578, X, 16190, X, 9581, 9579, 16188, 16187, X,
-    9876, 16186, 9874, 9873, 16752, 9582, 9875, 16753, 9878, 16754, 9877,
-    10166, 17210, 10165, 14329, 14321, 14336, 14324, 14334, 14341, 14333, 8378,
-    X, 8374, 14322, X, 14328, 8376, X, 14327, 8377, 8379, 14330, X, 8371, 8372,
-    14342, 14340, X, 14339, 14325, X, 14337, X, 8375, X, 11152, 11153, 11154,
-    11155, 11156, 11157, 11158, 11159, 11160, 11161, 11162, 11163, 11164,
-    11165, 11166, 11167, 11168, 11169, 11170, 11171, 11172, 11173, 11175,
-    11176, 11177, 11178, 11179, 11180, 11181, 11182, 11183, 11184, 7952, X,
-    13689, 13682, X, 7949, X, 13690, X, X, X, 13680, 13683, 7948, 13684, X,
-    19490, 7951, 13688, X, 13678, 13677, 7953, X, 7954, 7950, 7955, 13676,
-    13687, 13685, 13679, X, 8033, 8034, X, 8035, 14473, 14475, 14477, 8486,
-    8485, 8032, 14476, 14474, X, 15158, X, X, 15156, 15162, 8942, 15163, 15160,
-    8943, 15157, 15155, 15161, 9311, 15751, 15159, 9313, 15752, 9312, 15178,
-    19368, 9325, 15757, X, X, X, 19371, X, 15762, 9685, 15756, 16393, 15771,
-    9333, X, 9331, 9683, 15768, 15764, 9337, X, 16384, X, X, X, 9335, 15763, X,
-    16382, X, 15767, 9982, 19404, 9987, 16935, 16937, 19405, 9984, X, 16938,
-    16934, X, 16936, 9985, 9988, X, 16933, 9983, 9986, 10230, 16403, 10229, X,
-    X, 10235, 17384, X, 10233, 10234, 17387, 17383, 10231, 17381, 13289, 7669,
-    7690, 7680, X, 7684, 7683, 13267, X, 13296, 13302, 13294, 13301, X, X,
-    13282, 13268, 13300, 13284, 7672, 7685, X, 13293, 7678, X, X, X, 13292,
-    13269, 7686, X, 7688, 12288, 19515, 12719, 12718, 12716, X, 12715, 12720,
-    12717, X, X, 7693, 7694, X, X, 8133, 13945, X, 13946, 13947, X, X, X,
-    14602, 14603, 14601, X, 14599, 14600, 8563, 15272, 15849, 13967, 13961, X,
-    8160, 8168, 13957, 13950, 13951, X, 13953, 8143, 13966, X, 8157, 8166,
-    19562, 19462, 13968, 13992, 13984, 8139, 13990, 8151, X, 8149, 19216,
-    13996, 8148, 13974, 13962, 13972, 8171, 17771, 17774, 17775, 17776, 17779,
-    X, 17417, 17770, 10415, 17777, 17781, 17773, X, X, X, 18084, 10561, 18087,
-    10562, 18095, 18086, 18083, X, 18085, 18089, 18092, 18091, 18094, 18082, X,
-    10560, 18090, 8182, 7741, 19642, X, 8181, 14016, 14015, X, 14013, 14014, X,
-    14017, 14669, 14668, 14672, X, 14671, 14670, 9036, 15332, X, 15331, 9037,
-    15330, 15908, X, 15909, 9414, X, 16510, 16511, X, 17166, 17169, X, 10134,
-    X, 17543, X, X, 17546, X, 17540, 17542, X, X, 17541, 17544, 17545, 17167,
-    17539, X, X, 10469, 17879, 17882, 17884, 17877, 17878, 17881, 17883, 10470,
-    10468, 10143, X, 17181, 17549, 17563, 17558, 17560, 17548, 10318, X, 17547,
-    10321, 10320, X, 17562, 17554, 17551, 17557, X, 17550, X, 17552, 17561,
-    17559, X, 10319, 17566, 17564, 17555, 17565, 17556, X, 19224, X, X, X, X,
+    5838, 11404, X, X, 6023, 11532, X, 11531, X, X, 6021, 6024, X, 19182,
+    11530, 19181, 6022, 19177, X, X, X, X, X, 11760, X, 11761, 6300, X, X, X,
+    X, 6666, 12126, 6690, X, 6685, X, X, X, X, X, 7093, 12594, X, 7092, X, X,
+    12592, X, 7081, X, 7086, X, 12591, 12588, 12593, 7082, 12587, X, 7085,
+    7083, X, 12595, 7084, 11804, 6345, 11812, 11810, 11803, 11816, 11819,
+    11814, 11807, 6347, 11813, 6348, 11808, 11811, 11802, 11806, 11818, 6349,
+    X, 6350, X, 11805, 11817, 6344, 6346, X, 19287, X, X, X, X, X, 19257, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19403, X, X, 6264, X, 6629, 12074, X, 11731, 6634, X, 12075, 6630, 6633,
-    6632, 6631, 6628, X, X, X, 12537, X, 7041, 12540, 7039, 19079, X, X, 12536,
-    7042, 7040, 7043, 12538, 12539, 16326, X, 9669, 16330, 9661, 9665, 16329,
-    X, 9664, 9660, 9663, 9658, 9668, 16331, 16327, 9667, 16325, 9666, 16332,
-    16328, 9280, X, 9670, 16334, 9662, 9659, X, X, X, X, 16899, 16901, 12126,
-    6690, X, 6685, X, X, X, X, X, 7093, 12594, X, 7092, X, X, 12592, X, 7081,
-    X, 7086, X, 12591, 12588, 12593, 7082, 12587, X, 7085, 7083, X, 12595,
-    7084, 13181, X, 7559, 13190, 7564, 13186, 13185, 7565, 13183, 7561, X, X,
-    X, X, 13192, X, 13188, 13792, 13799, 13788, 8024, 13784, 13800, 13778,
-    13797, 13795, 13789, X, 13798, 13791, X, 13783, 12193, 12623, 12194, 6734,
-    12197, 12187, 6733, 12189, X, 12190, 19102, X, 12192, 6729, X, X, 7130, X,
-    18960, 12188, 12184, 7131, X, X, 12198, 7127, 12621, 12191, X, 12620,
-    12186, 12195, 12665, 12653, 7151, 12646, 12643, 12644, 7152, 12659, 12666,
-    7154, 12650, 12649, 7162, 7161, 7147, 7153, 7156, 12662, X, X, 12656, 7150,
-    12641, 12664, 12655, 12657, 12661, X, X, X, X, X, 19602, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19653, X, X,
-    X, X, X, 19269, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19618, X, X, X, X, X, 19432, 19433, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19250, X, X, X,
-    X, X, X, X, 11274, X, 11275, X, X, 11276, X, 11277, X, 11278, X, X, X, X,
-    X, X, X, 11279, X, X, X, X, X, 11280, X, 11281, X, 7051, X, 12566, 12554,
-    12558, 7056, 7067, 12555, 7062, 12560, 12567, 13094, X, 12565, 7069, 7050,
-    12557, 12548, X, 7058, X, X, 12547, X, X, 12552, X, X, X, X, X, 19709, X,
+    19037, X, X, X, X, X, 19235, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 5136, 11300, X, X, X, X, X, X, X, 19066,
+    X, X, X, X, X, X, X, X, X, X, 19026, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 19150, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 11258, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19726, X, X, 19725, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19021, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19191, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19654, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19388, 19307, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19290, X, X, X, X, X, X, X, X, 19295, X, X, X,
+    X, X, X, X, X, X, 19443, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 5182, X, X, X, X, 5138, X, X, X, 5145, 5158, 13047,
+    13045, 13057, 13063, 13064, 7464, X, X, 13686, 13061, 13044, 13062, X,
+    7474, 13067, 7473, 13043, X, 13051, 13068, 7469, 7468, 7465, 7470, X, X,
+    7456, X, X, 7457, X, X, 14021, 14028, X, 8184, 14027, 14024, 19649, 8186,
+    19643, 19644, X, 14026, 19650, X, 14020, 14022, 14025, 14023, 8185, 14029,
+    8183, 8603, X, X, 14676, 14675, 14673, X, 8606, 8605, 17428, 17430, 17434,
+    17795, X, 17793, X, X, 19694, X, 10427, 17792, X, X, X, 10565, X, X, X, X,
+    10658, 18512, 10657, 18514, 18511, 18513, 10786, 18763, 5756, 11978, 12807,
+    12808, 19738, X, X, X, 14063, 14065, 14061, 14062, X, X, 14066, 14068,
+    14069, 14064, 14067, 8216, X, X, 14722, X, 14727, 14719, 14723, X, 19741,
+    14728, 14724, 8630, 8638, X, 8633, 14720, 12858, X, X, 7300, 7299, X, 7303,
+    7301, X, 7304, 12861, 12856, 12857, 12860, 12859, X, X, X, X, X, X, X,
+    13445, 13446, 13444, X, 13443, 7785, X, X, X, X, 5191, X, 5119, X, X, X,
+    5192, X, X, X, X, X, X, X, X, X, X, X, X, 11259, X, X, X, X, X, X, X, X, X,
+    19340, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19400, X, X, X, X, X, X, X, X, X, 19348, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19771, X, X, X, X, X, X, X, X,
+    19465, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 19137, X, X, X, X, X, X, X, X, 19407, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19420, X, X, X, X, X, X, X, X,
+    11213, X, X, X, X, 19761, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 19534, X, X, X, X, X, X, X, X, X, X, X, X, X, 19073, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19520, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19153, 19223, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 19267, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19185, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19209, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19051, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19681, X, 19249, X, X, X, X, X, X, X, X, X, X, X, X, X, 19673, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19248, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19501, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19229, X, X, X, X, X, X, X, X, X, X, X, X, X, 19458, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 11295, X, X, X, 11297, X, X, X, X, X, X,
+    11296, X, X, X, X, 19528, 19187, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19155, X, X, X, X, X, X, X, 19532,
+    19238, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 19671, X, X, X, X, X, X, X, X, 19658, 19105, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19194, X, X, X, X, X, X, X, X,
+    X, 5103, 10951, X, X, X, X, X, X, 5120, 5205, 5137, X, X, X, X, X, 5040, X,
+    X, X, X, X, X, X, X, 16065, 16066, 16053, 16052, 16048, 9502, X, 9494,
+    16068, 16067, 14829, 16045, 16049, 16043, X, 16062, 16047, X, 16069, 16040,
+    16038, 16050, 16060, 16055, 9504, 18669, X, X, 18773, X, X, 18845, 18846,
+    18847, X, X, 18941, 18931, 11476, 6573, X, 6948, X, 12960, 12959, 7379,
+    7852, 13562, X, X, 13561, X, 8300, 8721, X, 8720, 8722, 17862, 17535,
+    17875, 17864, X, 10463, 17870, X, 17872, 17867, 17874, 17869, 17868, 10464,
+    X, X, 18154, 18155, X, 18157, 10595, 10596, 18158, 18156, X, 18153, X,
+    18371, 18374, 18370, X, 10671, 6190, X, 6957, 6958, 12481, X, X, 12482,
+    6956, X, 7399, X, 7397, X, 7396, 7403, 7395, 7404, 12997, 7401, X, 7398,
+    7402, 7400, 7394, X, X, 7881, X, 7875, 13608, 7880, 6960, 7408, 7409,
+    13002, 13001, 13614, X, 7890, 7888, 7885, 7889, 7887, 7886, X, X, 8331,
+    14266, X, 8774, 8333, 8338, 14268, 8340, 8339, 8342, 14267, 14264, 8336,
+    8332, 8334, 14265, 8341, 18782, 10861, X, 18857, 18856, 18855, 18888, X,
+    18932, 18913, 10879, 6198, 7411, X, X, X, X, X, 8787, X, X, X, X, X, X, X,
+    9568, X, X, 16744, X, X, 5215, 5216, 5217, 5218, 5219, 5220, 5221, 5222,
+    5229, 5228, 5227, 5226, 5225, 5224, 5223, X, X, X, X, 5235, 5238, X, X, X,
+    X, X, X, X, X, X, X, 19241, X, X, X, X, 19566, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19220, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19457, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19521, X,
+    19144, X, X, X, X, X, X, X, X, X, X, X, X, 19700, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19114, X, X, X, X, X, X, X, X, X, X, X,
+    X, 19131, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5046,
+    5048, X, X, X, 5091, 5092, X, X, 5093, 5094, X, X, 11824, 11825, 11826, X,
+    6364, 6365, 11823, 6366, X, X, X, 6714, 12179, X, 12618, 7123, X, 12617, X,
+    7577, 13200, 7578, 13201, X, 19323, X, 8036, X, X, X, 19503, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19500,
+    X, X, X, 6732, 7128, 6738, 7129, 12199, 12622, 6731, 7133, 6737, 6736,
+    6735, 7132, 12200, 7134, 6730, X, 12185, X, X, X, X, X, X, X, X, X, X, X,
+    X, 7590, 12215, 6745, 6756, 12208, X, X, X, 6748, 7145, 6742, X, 12205,
+    12212, 12204, 12207, 12211, 12640, 6755, X, 12216, 12217, 12219, 6741, X,
+    X, X, X, X, X, X, X, X, 19011, 19531, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 19262, X, X, X, X, X, X, X, X, X, X, X,
+    19171, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19551, X, X, X, X, X, X, X, X, X, X, X, 19460, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19093, X, X, X, X, X, X, X, X, X, X,
+    X, 7730, 13315, 13319, X, 7711, 7709, X, X, 7700, 13317, 13316, 7720, X,
+    13322, 7714, X, 13340, 13352, 7697, 13337, 13330, 7732, 9407, 15877, 15860,
+    15887, 9402, X, 9392, 15880, X, 15884, 15889, 15878, 15866, 9395, 9398,
+    9406, 9401, X, 15869, 15293, 19577, X, 15865, 15888, 9397, X, 9400, 15890,
+    9389, 15879, 15853, 15885, 13997, 8176, 14005, 14003, X, 14004, 8174, X,
+    14008, X, X, 19607, 19617, X, 14001, 13999, 8175, 14002, 14006, X, X, X,
+    8177, X, X, X, 14009, X, X, X, X, X, 19013, 11616, 6121, 11617, 11621,
+    6120, X, 11625, 11620, 11623, 6113, 6114, 6115, 6116, X, 6123, X, 11619,
+    6118, 6124, X, 11618, 11624, X, 6117, 11622, 6119, 6112, 9993, 16946, X,
+    16957, 9995, 16964, X, 16953, X, 16948, 19298, X, 16965, 16944, 16955, X,
+    10002, 16960, 16966, 16954, 9994, 16956, 16945, 10001, X, X, 16963, 16950,
+    9997, 19496, 16952, 16949, 12306, 12309, X, 12312, 12301, X, X, 12315,
+    12318, 12320, 12298, 6805, 6810, 12726, 6826, 12313, 12321, 12305, 12297,
+    X, X, X, 12753, 6813, 12310, 12302, 12304, 6818, X, 12307, 6812, 12294,
+    14608, 14618, 8568, 14628, 8581, 8572, 14615, 8571, 14606, 14620, 14640,
+    8163, 9027, 14623, 15273, 14625, 14639, 8578, 14616, 8566, 8582, 9405,
+    14605, X, 14630, 19091, X, 19033, 14629, X, X, X, 19495, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19228,
+    19397, X, X, X, 11389, X, X, X, X, X, X, X, X, X, 11379, 11499, X, 5968,
+    5955, X, X, 11500, 5952, X, 5970, X, 5960, X, 5959, 11488, 5963, 5958,
+    11493, 11501, 5689, 5688, X, 11511, X, X, 6271, X, X, 10935, X, X, 11327,
+    19108, 5691, 5690, 5821, 5822, 11512, 5991, 19109, 5992, X, 6272, 6273,
+    6274, X, 6641, 12079, X, 19111, 7045, 11329, X, 11350, 11351, X, X, X, X,
+    5843, 5847, 11407, X, 5845, 5844, 11406, 5846, 5842, X, X, 5841, 11408, X,
+    X, X, X, X, X, 6034, X, X, 6031, X, 8981, 15260, 8995, 15244, X, 15263, X,
+    X, 15228, 15249, 8984, 8993, 8991, 15230, 15251, 8990, X, X, 8983, 15247,
+    X, X, X, X, 15257, X, X, X, X, X, X, 7942, 14364, 15054, X, 8861, 15052, X,
+    X, 15053, X, X, X, 15671, 15672, 9249, 9247, 15673, 9248, 16305, X, 16308,
+    16302, 16309, 16301, 16303, X, 16304, 18022, 18017, 18036, X, 18019, 18033,
+    18024, 18040, 18020, 10531, 18018, 18025, 18026, X, X, X, 18273, X, 18271,
+    X, 18276, X, 18288, 18279, 18272, 18268, 18281, 18274, 18277, 18270, 18284,
+    18267, 18044, X, 18735, 8415, X, X, X, X, 17346, X, X, X, 10869, 8416,
+    9643, 10213, 18736, 8417, X, 16314, 9941, 16881, 16882, X, 9940, X, 17347,
+    10217, 10215, 10216, 10214, 17710, 17354, X, 18635, X, 18903, X, X, X, X,
+    X, X, X, X, X, X, X, 11210, 11212, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 19256, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19325, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19468, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 11204, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19337, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19576, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19336, 5507, 5521, 19068, X, X, X, X, X,
+    X, X, X, X, X, 19070, X, X, 7477, 7957, X, 8879, 19369, 11306, 5588, X,
+    5677, 5675, 5676, X, X, 6256, X, X, 6860, 6861, 6858, 6859, X, 12368, X, X,
+    12369, 6857, X, X, X, X, 12814, X, 7262, 7263, 19714, 7766, 12820, X, 7268,
+    7266, 12821, 12816, 7265, 7264, 7259, 12819, 14072, X, 14084, X, 14073,
+    14074, X, X, 14082, 14081, 14078, 7779, 8219, 14076, 14079, 8220, 14080,
+    14077, X, X, X, X, X, X, X, 14741, X, 14745, 8649, X, 15371, 8652, 12402,
+    6893, X, X, 7306, 12867, 12865, 12871, 7307, 12866, 12870, 12868, 12869, X,
+    X, 13447, 13449, X, 7786, X, 13448, 7787, 8228, 8227, 8226, 14094, X, X, X,
+    X, 14762, 8664, 10443, X, X, 10575, X, 18127, X, 18126, 18124, 18123,
+    18125, X, 10574, 10576, X, X, 10661, X, X, 18343, 18342, X, X, 18521, X,
+    18523, 18525, 18524, 18522, X, X, 10741, 9092, 15442, 9098, 15423, X, X,
+    15439, 15420, X, 15441, 15424, X, 9105, 9102, 15440, 15434, 9088, 9096,
+    9095, X, 9094, 9100, X, 15421, 9101, 15435, 9097, 9087, 15437, 9090, 9091,
+    9099, 9107, 9108, 15445, 15446, X, 15447, 16008, X, 16009, 9483, 16006,
+    16005, 16007, 16004, 9809, 16615, 9807, 9808, 17088, 10091, 17087, 17340,
+    X, 17485, 17486, 10295, X, 10296, 10092, 17833, 17834, 18134, 12011, 12444,
+    6925, X, X, 12924, 19523, X, 7358, X, 7356, 7357, 7359, X, X, 12923, X, X,
+    13525, 13522, 13524, 7830, 7832, 7831, 13521, 7833, 13523, X, 14154, 14155,
+    X, 14156, 8278, 14180, 14205, 14173, 14166, 14177, X, 14165, 14163, 8274,
+    14197, 14172, 14200, X, 14201, 8282, 8287, 8283, 8291, 14192, 8284, 14184,
+    14168, X, 8276, 14160, 14194, 14203, 14167, 8290, 14208, 14179, 17102,
+    17126, 17128, 17101, 10111, 17130, 17122, 10118, 17129, 17115, 10120,
+    17107, 16660, 17123, 17120, 17103, 17134, 10114, X, X, 10115, 17105, 17121,
+    X, 17133, 17124, 17111, 10117, 10113, 17125, 17112, 17135, 8727, 14897,
+    8730, 8731, 14887, 14900, 8732, 8726, 8725, 14896, 8733, 14886, 14889,
+    14899, 14895, X, X, 15532, 15521, 8724, X, X, X, X, 9148, 15509, 15530,
+    15510, 9143, X, 15507, X, 18724, 18729, 18719, 18722, 10816, 18726, X,
+    18733, 18620, X, 18720, 18730, 18734, 18725, 18718, 18728, X, 18727, 18732,
+    18731, 18624, 18723, 18717, 18721, 10847, 10848, 18716, X, 18815, 18806,
+    18814, 8865, X, 17352, 17351, 17350, 17714, X, X, 17718, 17717, 17716,
+    17715, 10392, 18046, 18299, 10632, 18298, 18480, 18631, 18630, 10774,
+    18629, 18743, 18742, 18741, X, X, 9251, X, 16885, 10218, X, 19480, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19117, X, X, X, X, 7780, X, 13433, X, X, 13426, 13428, 13430, X, 13431,
-    13429, 7781, X, 13434, X, 13427, X, X, X, X, X, X, X, X, X, 14075, 8218,
-    14083, X, 8808, 8797, X, 14978, X, X, 8802, X, 14979, 8795, 8794, X, 8805,
-    8804, 8803, 8801, 8806, 14976, 8796, 8798, 8800, X, X, 9192, 9195, X, 9199,
-    9193, 9198, 9196, X, 5357, 5358, X, 5359, 5360, 5361, 5362, 5363, 5364,
-    5365, X, X, X, X, X, X, X, 5366, 5367, 5368, 5369, 5370, 5371, 5372, 5373,
-    5374, 5375, 5376, 5377, 5378, 5379, 5380, 13066, 13054, X, 7460, X, 13059,
-    13065, 7459, 13052, 7463, 13056, 13049, 7461, 13053, 7466, 7471, X, 13070,
-    X, 13048, X, 7467, X, 13069, X, X, 7462, 13055, 7458, 13050, 13046, 13060,
-    6645, 6656, 6653, 12089, 6657, 12095, 12096, 6652, 6658, 6648, X, X, X, X,
-    6647, 12088, X, X, X, X, X, X, 12093, X, X, X, X, X, X, X, 12103, X, 7175,
-    7168, 7171, 19431, 7174, X, 12675, X, 7169, 12673, 19434, 7173, X, X, 7170,
-    X, 12676, 7172, X, X, X, X, 19141, X, 13262, 7661, 13261, 13263, 7660,
-    7665, 12674, 15812, 9375, X, 9368, X, 15835, 15838, 15819, 16432, X, X, X,
-    19684, X, X, X, X, X, 16424, X, 16420, 9725, X, X, 9714, 9719, 9715, 16434,
-    16445, 9713, 16426, 16435, 6499, 6492, 6478, 6468, X, 6473, X, 11923, 6469,
-    11946, X, 11917, 11916, 11930, 11918, 6496, 7212, 6489, 11931, 6470, X,
-    6819, X, X, X, 11944, X, X, X, X, X, X, 19049, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19724, X, X, X, X, X, X,
-    X, 19437, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19570, X, X, X, X, X, X, X, X, 19149, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6191, X, 13609, X, 13610,
-    14933, 15559, 16145, 10148, 17578, 17586, 17577, 10325, 10327, 17582,
-    10326, 17583, X, 17588, 17916, X, 10486, 17913, X, 17917, X, X, 10483,
-    17915, 10488, X, 10485, X, 17914, X, 10487, 17918, 10482, X, X, X, 19765,
+    X, X, X, 19374, 19092, X, 19560, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19205, X, X, X, 11304, 5499,
+    X, 5522, X, 11311, 5523, 19128, X, 5564, X, 5657, 5659, 5658, X, X, 5780,
+    5781, X, X, 6221, X, 6998, 5496, 11206, X, 11305, 5500, 5525, 5524, 5679,
+    X, X, 5817, X, X, 11398, X, X, 5987, 5988, 5986, 5989, 11508, 11509, X, X,
+    X, X, X, X, 19078, X, X, X, 19081, X, 6266, 11733, X, 6265, X, 16388, 9973,
+    16924, X, 16385, 16387, 9974, 9690, 9972, 9689, 9976, 16389, 9686, X, X,
+    19378, X, X, 19375, X, X, 17379, X, 17371, X, X, X, X, X, 16932, 17372,
+    9982, 19404, 9987, 16935, 16937, 19405, 9984, X, 16938, 16934, X, 16936,
+    9985, 9988, X, 16933, 9983, 9986, 10230, 16403, 10229, X, X, 10235, 17384,
+    X, 10233, 10234, 17387, 17383, 10231, 17381, 12706, 7180, 19461, X, X,
+    12705, 12700, X, 12701, 7188, 7199, 12691, X, 12692, 12702, 12693, X,
+    12688, 12682, 12683, 12696, 12690, X, 19539, 7181, 7185, 12704, 12684,
+    7197, 7193, 19315, X, 14175, X, 8275, 8295, X, 14190, 8297, X, 14186, 8286,
+    8280, 8288, 8277, 8294, 14187, 14169, 14189, 14164, 14198, X, X, 19041, X,
+    X, X, X, 14206, X, X, X, X, 19184, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, 19349, X, X, X, X, X, X, 12772, 12773, 12774, 7238,
+    X, 7234, 12763, 19598, 12771, 12776, 7239, X, 12761, 12767, 12760, 12770,
+    19599, 19600, 12766, 7235, 7237, 12775, X, 12759, 12762, 12768, 19601,
+    6511, 11655, 6162, 11653, 6161, 11657, 11654, X, X, 11963, 12338, 11961,
+    11968, X, 6512, X, 6515, 11969, 11965, X, 11966, X, 11960, 6514, 11962,
+    6513, 11967, X, 11964, X, X, 12342, 9421, 15925, 19685, 9419, X, 15927,
+    15924, 15921, 15928, 15922, 15923, 9418, X, X, X, X, 16997, X, 16523, X,
+    16522, 16524, X, 16994, 9760, X, 16520, X, 9758, X, 9762, 9761, 17797,
+    10432, 10566, X, 17438, 10567, X, X, X, 10659, 18337, X, 10738, 18515,
+    10737, 19719, 18662, 10823, 10824, X, X, 18946, 10948, X, 6862, 12370, X,
+    8210, 8211, 5767, 5913, 11468, 7292, 13441, X, 13439, 13435, 7782, X,
+    13436, 7783, 13437, 13438, 13440, X, 7784, X, X, 14088, 19352, 14087,
+    14086, 14085, X, X, X, X, 14749, 8653, X, 14746, 14748, X, 8654, 14103, X,
+    X, X, 14099, 14105, 8233, 13451, 14100, 8231, 14097, 8238, 14101, 8237,
+    14102, 8239, 8234, 8240, 8235, X, 8236, X, 8232, X, 14104, X, X, X, X, X,
+    X, X, 5036, 5035, 5029, X, X, X, X, X, X, X, X, X, X, 5098, X, X, 5097, X,
+    X, X, X, X, 5102, X, X, X, X, 19042, X, X, X, X, 19239, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19662, X, X, X, X, X, X, X, X, 19099, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6587, X, X,
+    13663, 14343, 16238, 17952, X, X, 11049, 11050, 11051, 11052, 11053, 11054,
+    11055, 11056, 11057, 11058, 11059, 11060, 11061, 11062, 11063, 11064,
+    11065, 11066, 11067, 11068, 11069, 11070, 11071, 11072, 11073, 11074,
+    11075, 11076, 11077, 11078, 11079, 19044, 5210, 8878, 5211, X, 5505, X,
+    5583, 5808, 6251, 19046, 5506, 5586, 5584, 5585, X, X, 5809, X, X, X, 5978,
+    6253, 6252, 6254, X, X, X, 7031, X, X, X, 14161, 19364, X, X, X, X, 14859,
+    X, 14881, 8656, 14864, 19555, 14862, 14841, 8706, 14857, 14877, 14853,
+    8714, 14876, 14851, 8293, 14867, 14852, 14874, 8713, 8705, X, 14830, 17106,
+    17116, 17127, 17108, 17110, X, 10310, 17104, 10119, 10303, 10110, X, X, X,
+    X, 10116, 10307, 17508, X, 17498, 17493, 17499, 17509, 17513, 17512, 10309,
+    10308, X, X, 17500, 17514, 17503, 15516, 15508, 9145, 15502, 15529, 9146,
+    15526, 15527, 15503, 9151, 15518, X, 15512, 15519, 15506, X, 15531, 15523,
+    15517, 15501, 9147, 15524, X, 9150, 15528, X, 15522, 9144, 15520, X, 15514,
+    9142, 12989, 7390, 7391, 12993, 19763, X, X, X, 7866, 13582, X, 7871,
+    13598, 7870, 13600, X, X, 13588, 7868, 13599, X, 13583, 7869, 13595, 13591,
+    13593, 13587, 13594, X, X, 7865, 13590, 8756, 9166, X, 9164, 9168, 9170,
+    9161, 9175, 9171, X, 9169, 15553, X, X, X, X, 9536, X, 9532, X, X, X, 9539,
+    X, 16130, 9540, 16142, 16135, 9525, 16143, 16137, 9535, 17575, X, 17574, X,
+    17573, 10323, 17906, 17907, 10480, 17908, 10481, X, X, 10607, X, 10606,
+    18387, X, X, 10678, 18388, 18554, 10749, 10750, X, 18688, X, 10835, X, X,
+    X, X, 19347, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19449, X, X, X, 5544, X, 5612, 11419, X, X, 11553, X,
+    11554, X, 6056, X, X, X, 13777, 8021, X, 14456, X, X, X, 9963, 5545, 5565,
+    5613, 11357, 5721, X, 6060, 6059, 14478, X, X, 15165, 15164, X, 8945, X,
+    9316, 15754, 9681, 16380, 9970, X, 10727, 18644, 10943, X, X, X, 11827, X,
+    12180, 7579, 13805, 8488, X, X, X, 10226, X, X, 12713, X, 8690, 8260, 8689,
+    9112, X, 5926, 11375, 5927, 5928, X, X, 12005, 11672, X, 11673, 6178, X,
+    11670, 6177, X, 6180, 11671, 6182, 6181, 11674, 6179, X, X, 19708, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19509, X, X, X, X, 8047, X, X, X, 8506, 15169, 14492, X, 14484,
-    15168, X, 14488, 14490, X, X, 14487, X, 8505, X, 14486, 8509, X, X, X,
-    15184, X, X, 8504, 8949, 15209, 13850, X, X, X, 15216, 15201, 8967, 15788,
-    9340, X, 15214, 15213, 8969, 15775, 9341, 15776, X, 15197, 15198, 15195,
-    15200, 15196, 15217, 8963, 9342, 8965, 8970, X, 15199, X, 15211, 12250,
-    12242, 12263, 12279, 6783, 12252, 12270, X, 12244, 12277, 12278, 12281,
-    12272, 12257, 12265, 6789, 6776, 6784, 6796, 6773, 6775, X, X, 19459,
-    12249, 6793, 6786, 12275, 12246, 6795, 6790, 12255, 17766, 10731, 5635,
-    5745, 5896, 6125, 6463, 6464, X, X, 6797, X, X, 12712, X, X, X, X, 8559, X,
-    19506, X, 15968, 9729, 10248, 5636, X, 5897, X, X, 11912, 6465, 13327,
-    7701, 13321, 13351, 7703, 13331, 7733, X, 7727, 13320, 7724, 7722, 7731,
-    13338, 7726, 12735, 13339, 7725, 13346, 7698, 13335, 7716, 13323, 7715, X,
-    7713, 7705, 7704, 13949, 13348, X, X, 13034, 7920, 13656, X, 7919, 7921,
-    13661, 7923, 13658, 13659, 13651, 7922, 13662, X, X, 13653, X, 13654,
-    13652, 7918, X, 13660, 13655, 13657, X, X, X, 14332, X, 14331, 19332,
-    19630, X, X, 19008, X, 16778, 17225, X, 17230, 10179, 10181, 17236, 10175,
-    17251, 17242, 17231, 17232, 17241, X, 10188, 17240, 17224, 17239, 17227,
-    17252, 10187, 10185, 17228, X, 17247, X, 5268, 5269, 5270, 5271, 5272,
-    5273, 5274, 5275, 5276, 5277, X, X, X, X, X, X, 10916, 10917, 10918, 10919,
-    10920, 10921, 10922, 10923, 10924, 10925, X, X, X, X, X, X, 10394, 17728,
-    17729, 10541, X, 17730, 17726, 17731, 17727, 10222, X, X, X, 18054, 18056,
-    10544, 18055, 10543, 10542, X, X, X, X, 10545, 18311, 18312, X, 19464, X,
-    X, X, X, X, X, X, X, X, X, X, 19640, X, X, X, X, 12698, 7201, 12699, X,
-    12687, 7190, 7202, X, 12680, 19100, 12689, 12697, X, 12679, 15269, X,
-    15845, 15844, 9385, 15843, 15846, 16455, X, X, 16456, 16457, X, 16968,
-    10005, 10249, 17767, X, 10653, 11335, X, 6800, 12285, 7206, X, X, 7692, X,
-    8132, 13944, X, 8561, 8144, 8140, 13982, 8146, 8150, 8145, 8154, 13986,
+    X, 19048, X, X, X, 11308, X, 5601, X, X, X, X, X, 11402, X, X, X, 11513,
+    11514, X, X, 11737, 19116, 11738, X, 12081, 12080, 12083, 12082, 6642, X,
+    13079, 7047, 12544, 7046, 6027, 11533, 19190, 19208, X, 11534, 19186, 6029,
+    X, 11536, 6025, 11537, 11535, 6028, 6030, 6033, 6032, 6026, 11538, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 19474, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19441, X, 19052, X, X, X, X, X, X, X, X, X, X, X, X, 19020,
+    X, X, 6616, 6604, X, X, 12058, 12066, X, 6603, 6611, 6623, X, 12072, 12070,
+    12065, X, X, X, 6605, 6014, 19513, X, X, 11528, 11522, 5997, 5999, 11527,
+    6006, 11517, 6018, 6020, 5994, 6011, 19158, 11515, 6017, X, 6002, X, 6012,
+    6013, 11516, 6010, 6008, X, 6009, 6015, 11524, 5996, X, 7166, 12672, 12670,
+    12671, 7167, 12669, X, X, X, X, 7657, 7658, 13258, 7659, 7656, 13877,
+    19421, 13878, 14536, X, X, 8974, 8973, X, X, 16942, 17389, X, 17751, 17750,
+    18070, 14572, 14577, 14557, X, 14574, 14554, X, X, 14561, 14562, 8548,
+    14581, 14579, X, 14550, 14584, X, 14585, 14587, 8552, 8544, X, 13274,
+    14558, 14576, 14559, 8541, 8557, 14583, 8555, 8551, 14548, 15848, 15847,
+    15850, 16461, 16460, 9730, 16462, X, 10007, 16969, X, 17406, 17768, 18502,
+    X, 5640, 5748, 5747, X, 6466, 11337, 11366, 5898, X, 11453, 11627, 11628,
+    6467, X, 11914, X, 6803, 8144, 8140, 13982, 8146, 8150, 8145, 8154, 13986,
     13977, X, 19776, 13959, 8159, 8153, 13971, 8137, 13983, 13976, 8141, 13965,
     8156, 13994, 13995, X, 8138, 13981, 8158, 13969, 13955, 13956, 8162, 13960,
-    17415, 17410, X, X, 16476, 17411, 10253, 17407, X, 10250, 17420, 10251,
-    17408, 17409, 17413, 10256, X, 10255, X, X, 17412, 10418, 17772, 17778,
-    10419, 17769, 10416, 10413, 17780, 10417, X, 10414, 6160, 6159, 6158,
-    11650, X, X, X, 6509, X, 6510, 11959, X, 12334, X, 12337, 6839, 12335, X,
-    6838, 12336, 6840, X, 12781, 12780, 12779, 7241, X, 13374, 13375, 7740,
-    13373, 13376, 19674, X, 15337, 9041, 9040, 19243, X, 15342, X, 9417, 9042,
-    X, 19680, 9044, 15343, 8607, 9043, 15339, 15341, 15338, 19682, 15340,
-    19678, X, X, X, X, X, 15929, 15926, 9420, 16519, 17797, 10432, 10566, X,
-    17438, 10567, X, X, X, 10659, 18337, X, 10738, 18515, 10737, 19719, 18662,
-    10823, 10824, X, X, 18946, 10948, X, 6862, 12370, X, 8210, 8211, 5767,
-    5913, 11468, 19770, 8655, 14747, X, X, X, 19767, X, 15387, X, 15380, 15381,
-    X, 9066, 9064, 9065, 15389, X, 15388, 15385, 15384, 15383, 15382, 15386,
-    15379, X, 15962, X, 15965, 19772, X, X, 19657, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19226, X, X, X,
-    11304, 5499, X, 5522, X, 11311, 5523, 19128, X, 5564, X, 5657, 5659, 5658,
-    X, X, 5780, 5781, X, X, 6221, X, 6998, 5496, 11206, X, 11305, 5500, 5525,
-    5524, 19085, X, 8436, 8437, 8435, X, 8434, X, X, 15075, X, 15076, X, X, X,
-    15690, 9268, 15689, X, 9656, 16892, 9948, X, 17724, 10540, 10933, 5530,
-    5592, 11326, X, 5593, 5594, 19180, 12568, 12569, 7070, 7071, X, X, 13105,
-    7514, 7516, 13104, 7515, 13719, 7994, X, X, X, X, 8456, 8457, 14414, X,
-    8901, X, 8900, X, 15709, 16336, 16335, X, 18883, 5534, 13139, X, 7537,
-    19237, 13152, 13149, 7533, X, X, 13166, 7534, X, 13150, 13146, X, X, 13165,
-    X, X, X, X, X, X, 8007, 13748, X, 13745, 13762, 13750, 13763, X, 8009,
-    15138, 15142, 15137, X, 8935, X, 15140, 8936, 15146, 15145, 15144, 19280,
-    X, 15149, X, X, X, X, 15737, 15739, 9306, 15740, X, 15735, X, 15734, 15744,
-    X, 15742, 9305, 15745, 15736, 7593, X, 12624, 7591, X, X, X, X, 7594, X, X,
-    X, X, X, X, X, 13209, 13218, 8043, 19356, 7596, 7601, 8044, 13220, 7608,
-    13810, 13210, 7600, 7603, 7598, 13208, 13222, 8065, X, 13858, 13841, 13855,
-    14499, 8068, 13859, 13862, 8067, 13844, 13861, 13860, 8069, 13837, 8064,
-    8072, X, 8070, 13857, X, 13847, 8074, 13864, 13856, 13865, 8082, 8080,
-    13854, 13853, X, 13851, 10407, X, X, 18072, 18073, X, 10557, X, 18071,
-    10649, X, 18651, 10784, 18755, 18756, X, 5631, X, 5888, 5889, 6111, X,
-    11886, 6771, 7176, 7666, X, X, 7491, X, 8100, 8101, 16444, 9722, 9721, X,
-    16438, X, 16421, 16423, 16425, 16443, 16437, 9717, X, 16428, X, 16442, X,
-    X, X, X, X, X, 16429, X, X, X, X, X, X, X, 10000, 16961, 12316, X, 12319,
-    X, X, 6809, X, 6821, 12291, 6823, 6807, 6827, 12317, 12293, 6824, 12747,
-    11940, 6811, 6806, 12300, 12292, 6825, 6817, 12311, 6822, 6820, 12303,
-    6814, 12295, 6815, 6816, 12296, 15297, 15851, X, 15304, 19574, X, X, X, X,
-    X, X, X, X, X, 15283, 15861, 15871, 9391, 15870, 15882, 9393, 15868, X,
-    15872, 9404, X, 15863, 9396, 19575, 15875, 16470, 9408, 14648, 14655, X,
-    14647, 8589, 8596, 8594, 8591, 8599, 8588, 14654, X, 8593, X, 8178, X,
-    14660, X, 14652, X, X, X, X, X, 14653, X, X, 15324, X, 9031, X, X, 10838,
-    18792, 10840, X, 18791, 18793, 10839, 18863, X, 18915, X, X, X, X, X, X,
-    6597, X, X, X, 8844, X, 15635, X, 16249, 9908, X, X, 6598, X, 18966, 18977,
-    18986, 18968, 18973, 18982, 18964, 18979, 18988, 18970, 18976, 18985,
-    18967, 5243, 5244, 5246, 5245, 5255, 5256, 5257, 5050, X, X, X, X, X, X, X,
-    X, X, X, X, 19542, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19027, X, X, X, X, X, X, X, X, X, X, X, X, 19533, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 19497, X, X, X, X, X, X, X, X, X, X,
-    X, X, 19687, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19477, X, X, X, X, X, X, X, X, 19579, X, X, X, X, 19024, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19281, X, X,
-    X, X, X, X, 19264, X, X, X, X, X, X, X, X, X, X, X, X, X, 19056, X, X, X,
-    X, X, X, X, X, X, X, X, X, 19702, X, X, X, X, X, 19675, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 11314, 14598, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 19367, X, X, X, X, X, X, X, X, X, X, X, X, X, 19481, X,
-    12273, 6779, 6792, 19498, 12268, 12258, 6785, 12256, 6778, 12251, 6788,
-    12264, 12245, 12247, X, X, X, X, 19007, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19057, X, X, X, X, X, X,
-    19000, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19511, X, X, X, X, X, X, X, 5390, 5391, 5392, 5393, 5394, 5395,
-    5396, 5397, 5398, 5399, 5400, 5401, 5402, 5403, 5404, 5405, 5406, 5407,
-    5408, 5409, 5410, 5411, 5412, 5413, 5414, 5415, 5416, 5508, 5509, 11208,
-    5529, X, X, 5589, 5590, 5591, 11396, 5678, 19075, 11347, X, 5815, X, 11397,
-    5813, 5814, 11395, X, X, 5816, 5812, X, X, X, X, 11505, 6575, 11506, X,
-    15770, 15761, X, 9336, X, X, 9330, 16383, 9684, 15769, 9332, 9334, 15766,
-    9338, 15765, 15760, 15759, 9682, 15773, 16386, 16925, 9687, X, 16392, X,
-    16390, X, 16926, X, 9688, 16391, 10405, 17385, X, 17386, 17382, X, 10232,
-    17743, X, 17746, X, X, 17747, 17745, 17748, 10406, 17744, X, X, 18069,
-    10555, 18068, 18067, 18066, 10554, 10556, X, 18319, 10647, 10646, 19384, X,
+    9739, 9736, 9731, 9734, 16471, X, 15855, 16466, 16469, 16486, 16474, 16464,
+    16970, 16488, 16468, 16482, X, X, X, 19582, 16973, 10020, X, X, 10008, X,
+    X, 10012, 16975, 16981, 16979, 10010, 15895, 15903, X, X, 15902, 15900, X,
+    15906, 9412, 15897, 15904, X, 9410, X, X, 15892, 15894, 9411, 15891, 15907,
+    19604, 15898, X, X, 16495, 9751, 19621, X, 16506, 16504, 9745, 16494,
+    10734, 18660, 18659, 18661, 5754, 12346, 7247, 7747, 13387, 5755, 11373,
+    5650, X, X, 11466, X, X, X, 11662, 11660, 11661, 11658, 6163, 11659, X, X,
+    X, X, 19124, 11977, X, 6518, 11981, X, X, X, X, X, X, 12366, 12367, X,
+    19705, 6856, 6854, 19704, 6855, 6853, X, X, X, X, 7254, X, X, X, X, 7258,
+    7257, 12812, 7256, 7255, X, 12813, 14730, X, 5772, 6170, X, 6529, 19115,
+    12380, 12381, 7278, X, X, 14071, 8217, 8642, 10050, 17022, 17801, 18111,
+    5773, 19747, X, X, 11995, 11990, 11992, 11994, 11993, 11991, 6530, X, X,
+    19453, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 6589, X, 11376, X, 5144, 5147, X, X, X, X, 5142, 5143, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19606,
+    19210, X, X, X, X, X, X, X, 19247, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19773, X, X, X, X, X, X, 19631, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    5135, X, X, X, X, X, X, X, X, 19032, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 5917, X, 6904, 12764, 7326, X, X, 7813,
+    14127, 14128, 9114, X, 9119, 15454, X, X, 15453, 15455, 9116, 15452, 9117,
+    15458, 15457, 15456, X, 9115, X, X, X, X, X, 16015, X, 16018, 9490, 16017,
+    9489, 9485, 9486, 9487, 16014, 16013, 12451, 6939, 6934, 6927, 6932, 6928,
+    6947, 12449, 12941, 6935, X, X, 12461, 12090, X, X, X, X, X, X, X, X,
+    12944, 7374, X, 12928, X, 12939, 12935, X, 12954, X, 17293, X, 17292,
+    19447, 10374, 17978, 17979, 10622, X, X, 18920, 7449, 8414, 8413, 15045,
+    15047, 8858, 15046, 8857, 8859, 15048, X, X, X, 15657, 15659, 15658, X,
+    15661, X, X, 5201, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19192, X, 12071, 12061, 6619, 6610, 6618,
+    12056, X, 12068, X, 12059, 6614, 12060, X, 12055, 6621, 6608, 6617, 6607,
+    X, 12057, 12062, X, 12069, 6615, 6612, 12064, 6620, 12067, 12063, 6609,
+    6622, 6613, 6016, 11526, 6004, 6001, X, 11519, 6000, 11529, 6003, X, 6007,
+    X, X, X, 5998, 11525, X, X, X, X, 11518, X, X, X, X, X, X, X, X, X, X, X,
+    19646, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19710,
+    X, X, X, X, X, X, X, X, X, X, X, X, 13286, X, 13270, 13271, 13275, X,
+    13290, 13287, X, 13280, 13279, 7675, 13283, 13298, 13266, X, 13299, 13285,
+    13303, 13291, 7674, 11911, X, 12283, 6798, 12284, X, 6799, X, 12714, 7205,
+    7204, X, 13312, 13310, 13311, 13309, X, 13308, X, X, 13940, 13943, 8131,
+    13941, 8130, 13942, X, 14597, X, X, 15267, 15268, 13314, X, 13342, X, 7729,
+    7717, 7728, 7707, 13326, 13344, 13336, 7708, 7702, 13350, X, 13343, 13345,
+    7710, 7718, 13347, 13324, 13341, 13329, 13349, 7723, 7699, 7721, 13334,
+    13332, 13333, 7712, 13328, 10016, X, 15867, X, 9390, 15862, 9394, 15854,
+    9022, 15858, 19399, 15883, 15859, 15857, 9399, X, 15881, X, 15856, 15874,
+    15873, 15886, 15864, 9403, X, X, X, X, X, 19567, 16473, 19580, 14648,
+    14655, 14651, 14647, 8589, 8596, 8594, 8591, 8599, 8588, 14654, X, 8593, X,
+    8178, X, 14660, X, 14652, X, X, X, X, X, 14653, X, X, 15324, X, 9031, X, X,
+    7448, 13039, X, 13674, X, 8407, X, 8410, 8408, 14363, X, 8412, X, 8409, X,
+    X, 8411, X, 8854, X, 15043, X, X, 15044, 16265, X, 8853, 8855, 8856, X,
+    5166, X, 5167, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19377, X, X, 5828, X, 5834, 5830, X, 5836,
+    11403, 5833, 5823, 5826, 5829, 5825, 5832, 5835, 5824, 5827, 5831, 5837,
+    19138, X, X, X, X, 11523, 11520, X, 6005, 11521, 5993, 5995, 6019, 6669, X,
+    6671, 6670, 12108, 12117, X, X, X, X, X, X, X, X, 6673, X, X, X, X, X, X,
+    12105, 12579, X, 12578, 12583, 12574, X, 12577, 12576, X, 12580, 13139, X,
+    7537, 19237, 13152, 13149, 7533, 13142, X, 13166, 7534, X, 13150, 13146, X,
+    X, 13165, X, X, X, X, X, X, 8007, 13748, X, 13745, 13762, 13750, 13763, X,
+    8009, 13181, X, 7559, 13190, 7564, 13186, 13185, 7565, 13183, 7561, X, X,
+    X, X, 13192, X, 13188, 13792, 13799, 13788, 8024, 13784, 13800, 13778,
+    13797, 13795, 13789, X, 13798, 13791, X, 13783, 11591, X, X, X, X, X, X, X,
+    X, 11852, 11839, 11837, 11851, 11846, 6727, 6376, 11847, 11850, 6723,
+    11849, 6377, 6382, 6380, 11840, X, 11835, 11842, 6387, 11853, 6724, 11843,
+    X, 10055, 17025, X, 17032, 17029, X, X, X, 17453, X, X, 17450, X, 10273, X,
+    17454, 17456, 17455, 17451, 17452, X, X, 17806, X, 10434, X, 17803, 17805,
+    17802, 17807, X, 6977, X, 6978, X, 12492, X, 12494, 12496, X, 6975, 12495,
+    X, X, 6976, X, X, X, X, X, 13642, 12491, 13018, 13027, 13025, 13020, 13021,
+    13026, 13028, 7428, X, 13023, 15006, 15010, X, 15014, 8823, 14997, 14995,
+    15007, X, X, X, X, 15004, 15003, X, 15008, 15011, X, 15016, X, X, X, 15599,
+    X, 9207, 15609, 15601, 9212, 9216, 15618, 15626, 15611, 17233, 17246,
+    19615, 17248, 17223, 10180, X, 17249, X, X, 17237, X, 10184, 17234, X, X,
+    10186, 17243, X, X, X, 10178, 17229, 17244, X, 17238, 16771, 17245, 17226,
+    X, 10183, X, 5268, 5269, 5270, 5271, 5272, 5273, 5274, 5275, 5276, 5277, X,
+    X, X, X, X, X, 10916, 10917, 10918, 10919, 10920, 10921, 10922, 10923,
+    10924, 10925, X, X, X, X, X, X, 10394, 17728, 17729, 10541, X, 17730,
+    17726, 17731, 17727, 10222, X, X, X, 18054, 18056, 10544, 18055, 10543,
+    10542, X, X, X, X, 10545, 18311, 18312, X, 19464, X, X, X, X, X, X, X, X,
+    X, X, X, 19640, X, X, X, X, 12698, 7201, 12699, X, 12687, 7190, 7202, X,
+    12680, 19100, 12689, 12697, X, 12679, 17766, 10731, 5635, 5745, 5896, 6125,
+    6463, 6464, X, X, 6797, X, X, 12712, X, X, X, X, 8559, X, 19506, X, 15968,
+    9729, 10248, 5636, X, 5897, X, X, 11912, 6465, 12751, X, 12745, 12754,
+    12752, 7231, 12737, 7216, 7215, 7223, 7229, 12749, 7228, 12734, 7696, X,
+    12758, 12733, 12728, 7221, 7233, 7214, 19543, 12741, 12746, X, X, X, X, X,
+    X, X, 19366, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19446, X, X, X, X, X, X, X, X, 12162, 12155, 12161, 12154,
+    12156, 12150, 12148, X, 12163, 12160, 12146, X, 6704, 12158, 12159, X,
+    12157, 12149, 12147, 6703, 12153, 12151, X, X, 12152, 12164, 7588, 7587, X,
+    X, 19030, 13807, 13806, 19334, 8040, 8038, 8039, 13808, 8489, 14480, 8490,
+    14479, X, X, 15755, X, X, 9319, 15167, 9318, X, 8947, X, 16923, 16381,
+    9971, 16922, 17741, 14494, 8510, 8511, 14496, 14498, 14497, X, 15189, X,
+    15188, 8958, 15190, X, 15774, 9339, X, 9691, X, 9977, 10228, 9978, X, 5622,
+    X, X, X, 11593, X, X, 11855, 6391, 6390, 16940, 16939, 9989, 9990, 17749,
+    19414, X, 5626, 19254, X, X, X, 13873, X, X, X, 8089, 8088, 14535, X,
+    17388, 10648, 18650, 5627, X, 7165, X, 7654, 7653, 13874, 13875, 8528,
+    8106, 13905, X, 8117, 13900, X, 13927, 8113, 13919, 13932, 13894, 13899,
+    13893, X, 8112, 13912, 14568, 13895, 8116, 13904, 13928, 8111, 13901,
+    13898, 13915, 8114, 8104, 8126, 13918, 13917, X, X, 7882, 7876, X, 7877, X,
+    13606, X, X, 7874, X, 13607, 7879, X, X, 13605, 7878, X, X, 8325, X, 8327,
+    X, X, 14248, 8326, 8315, 8319, X, 8765, 14924, 8337, 8335, 8776, 8775,
+    8773, 8777, X, 8771, 8772, X, 8770, X, 14942, X, X, 15563, X, 9180, 9181,
+    9179, X, 15562, X, 15564, X, 16150, 16152, X, 9553, 16153, 9546, 16149,
+    10330, X, 17919, X, X, X, X, X, X, 18914, 6199, 6577, 6965, 6964, X, 7414,
+    X, 13008, 7412, 13009, 7413, X, X, 13627, 13623, X, X, 7895, 13626, 13625,
+    13624, 7896, 9191, X, 9197, 9194, X, X, X, 16189, 9580, 9578, X, 16190, X,
+    9581, 9579, 16188, 16187, X, 9876, 16186, 9874, 9873, 16752, 9582, 9875,
+    16753, 9878, 16754, 9877, 10166, 17210, 10165, 10836, 10862, 18786, 18889,
+    X, 10880, 6213, 6585, X, 8814, X, 10613, 6214, 6981, 7917, 8370, 10338,
+    6586, X, 12498, 12497, 13033, 19341, 7435, 7433, 7437, 13035, X, 7436,
+    7434, X, X, 5278, 5279, 5280, 5281, 5282, 5283, 5284, 5285, 5286, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19199, X, X, X, X,
+    X, X, X, X, X, X, 7450, X, X, 15050, X, 15049, X, 9242, 9243, 15663, X,
+    16283, 16843, X, X, 9630, 9928, 16841, X, 16844, 9929, X, 17306, 16842,
+    10386, 17685, X, 17683, 17690, X, 17682, 17681, 10385, 10383, 10382, X, X,
+    X, X, X, X, X, X, 17688, 18007, 18013, 10529, 18008, X, 18011, 18015,
+    10530, 18010, X, 18002, X, 11112, 11113, 11114, 11115, 11116, 11117, 11118,
+    11119, 11120, 11121, 11122, 11123, 11124, 11125, 11126, 11127, 11128,
+    11129, 11130, 11131, 11132, 11133, 11134, X, X, X, X, X, 10962, 10953,
+    10954, X, 6305, 11774, X, 6307, X, 6306, X, 11775, 6304, 6303, 11765, X,
+    11764, X, 11762, 11767, 11766, 11763, 11772, 11773, 11770, 11768, 6302, X,
+    X, X, 11771, 6308, 11776, X, X, 6526, 6868, 12371, 6869, 6867, X, 6866,
+    12823, 7271, X, 19730, 7272, 7273, X, X, X, 7771, 13414, 7770, X, X, X, X,
+    X, 14060, 7772, 8215, 14718, 8628, 8629, 19770, 8655, 14747, X, X, X,
+    19767, X, 15387, X, 15380, 15381, X, 9066, 9064, 9065, 15389, X, 15388,
+    15385, 15384, 15383, 15382, 15386, 15379, X, 15962, 15967, 15965, 19772, X,
+    X, 19657, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19226, X, X, X, 8418, 14366, 14367, 10928, 5501, X,
+    5566, X, X, 6223, 5502, 11312, 5526, X, X, 5567, 5569, 11321, 5570, 5568,
+    X, X, X, 5783, X, 6224, X, X, 6225, 6599, 19085, X, 8436, 8437, 8435, X,
+    8434, X, X, 15075, X, 15076, X, X, X, 15690, 9268, 15689, X, 9656, 16892,
+    9948, X, 17724, 10540, 10933, 5530, 5592, 11326, X, 5593, 5594, 10639,
+    10638, 10640, 18310, X, 18487, 18486, X, 10721, 10723, 10722, 18488, 10778,
+    18751, X, X, X, 10819, X, 18750, 18823, X, X, 11313, X, X, 5713, 5712, X,
+    5840, 5839, 11405, 12140, 12123, X, 6683, 12133, 6686, 6689, X, 6684,
+    12137, 6687, X, 7087, 12143, 12125, X, X, 12127, 12134, 12138, 12142,
+    12139, 12132, 12135, X, 19234, 12129, 6691, 12131, 12130, 12141, 6682,
+    7551, X, 8934, 15136, 9303, 9304, X, 15733, 9964, 17366, 17367, X, 10642,
+    18753, 11315, 5614, X, 5546, X, 11359, 11358, X, X, X, X, 5867, 11421,
+    11422, 11420, X, 11423, X, 19727, X, X, 17012, 19728, 17444, X, X, X,
+    18104, 18103, X, 18516, 5768, 11985, 7270, X, X, X, 8214, 14717, X, 19729,
+    15356, X, 9431, 16537, X, 17445, 18105, 5769, 15964, 15963, 15966, X,
+    16561, X, 9779, 10056, 17034, 19775, 10057, 17033, 17458, 17457, 10274, X,
+    17808, 10435, 18118, 10739, 18518, X, 18768, 18767, 11374, 6887, 6888,
+    13442, X, 8657, 5775, 6173, 8668, 14774, X, 14777, 14765, 14770, 14764,
+    8670, X, 14768, X, X, X, 14766, 8669, X, 14773, 14772, 14769, 14771, 14767,
+    9076, 14776, 8666, 14775, X, X, X, X, X, X, X, 5156, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5159, 7952, X, 13689,
+    13682, X, 7949, X, 13690, X, X, X, 13680, 13683, 7948, 13684, X, 19490,
+    7951, 13688, X, 13678, 13677, 7953, X, 7954, 7950, 7955, 13676, 13687,
+    13685, 13679, X, 8033, 8034, X, 8035, 14473, 14475, 14477, 8486, 8485,
+    8032, 14476, 14474, X, 15158, X, 19305, 15156, 15162, 8942, 15163, 15160,
+    8943, 15157, 15155, 15161, 9311, 15751, 15159, 9313, 15752, 9312, 14493,
+    15170, 19365, X, 8502, 14485, 14489, 8948, 8493, 14482, 14483, 8950, 8501,
+    8503, 8500, 14491, X, X, 15174, 15175, 15180, 9324, 15187, X, 8956, X,
+    8955, 15182, 19383, 9323, 15171, 8954, 14525, 14520, X, 14508, X, X, X, X,
+    X, X, X, 15207, X, 15192, 15203, X, 15210, 8966, 8081, 15208, 8961, X, X,
+    X, 8960, 15215, X, 15193, 15206, 15194, 15205, 8964, 7956, 13887, 19448,
+    8538, 15224, 15223, X, X, 5632, 5890, 11887, 6439, X, 6438, X, 12240,
+    12241, X, 12677, 12678, 7177, 7178, X, 7179, 13265, X, X, 7668, X, 8103, X,
+    8102, 15825, 16436, X, X, 9720, 19494, 16451, 9724, 9727, 16422, X, 9723,
+    X, 16449, 16450, 16440, 16439, 16431, X, X, 16441, 16448, 16447, X, 9718,
+    9716, 16433, 16430, X, 16427, 16446, 9726, 11939, 6485, 11926, 11928, 6483,
+    6488, 11929, 11942, X, 6804, 6494, 19098, 6472, 11941, X, 11945, 11925,
+    11947, 11932, 6481, 11921, 6480, 6498, 6487, X, 11919, 12299, 6493, 6497,
+    11933, 11938, X, 9833, 10830, 5942, X, X, X, 12477, 6576, 12479, 12478,
+    6953, X, 12985, X, 12992, 7388, 12990, 12988, X, 12995, 12986, 12987, 7389,
+    X, 7393, X, X, 12996, 7392, 12994, 12991, 8316, 14923, 8760, 8755, X, X,
+    8750, X, 8766, 8751, X, 8747, 8762, 8759, 8761, X, 8752, 8757, 8748, 8749,
+    14931, 14928, 14920, 14925, X, 8763, 14932, 8764, 8754, X, X, 14922, 9545,
+    9555, 9551, 9552, 9548, 16148, 9547, 16154, 16151, X, 9554, X, 9549, 9550,
+    16725, X, 16727, 16726, X, 16728, 9860, 16724, X, X, 10153, 17199, 10150,
+    10154, 10152, 10151, 17572, X, 19245, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19593, X, X, 12535,
+    12541, X, X, X, X, X, X, 7961, 7478, 13072, 13074, 13073, 13075, 7479, X,
+    X, 7958, X, 7959, 7960, X, 8431, 14388, X, 14387, 14389, 14390, 8432, X,
+    8430, 15701, 15695, 15692, X, X, 13702, 15698, X, 15691, 15697, 15696, X,
+    15693, 19174, 9278, 19175, X, X, X, 9277, X, X, X, 9279, 15699, 9657,
+    15700, X, X, X, 16333, X, 11906, X, 11904, 11896, 11888, 11895, 6447, X,
+    6453, X, 6441, 11899, 11898, 11890, X, 6455, 11902, 11891, 6458, 11909,
+    6442, X, 6449, 11894, 11903, 6457, X, 6444, 6448, X, 11901, 17754, 17396,
+    X, X, X, 10409, X, 17753, 18077, X, 18076, 17762, 10559, X, 18080, 18081,
+    18075, 18079, X, 18074, X, X, X, X, 18323, 18078, 10652, 10650, 18321, X,
+    X, X, 19053, X, X, X, X, 19695, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19113, X, X, X, X, X, X, X, X, X, 11201, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19429,
+    19430, 19536, X, X, X, X, X, X, 19019, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19422, X, X, X, X, X, X, X,
+    19777, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 19163, X, X, X, X, X, X, X, X, 12545, 7066, X, X, 13086, 19140, 7509,
+    13100, 7507, 7504, 13091, 7500, 13095, 7511, 13085, 13090, 13089, 7052,
+    7506, 13098, X, 13101, 13082, X, 7984, X, 13260, 13264, X, 7662, 13259,
+    7664, 19436, 7663, X, 13885, X, 13880, X, 8091, 8095, 8092, 13883, 13886,
+    19438, 8093, X, 8094, 8099, 14545, 13884, 8097, 13881, 13879, X, 8098, X,
     13515, 13519, 7824, 7828, 13508, X, 13517, X, 7826, X, 7825, 13513, 13511,
     X, 7822, 7827, X, X, X, X, X, X, X, X, 8266, 14147, X, X, 14145, 8268, X,
-    9923, X, X, 16827, 17281, X, 16829, 9920, 16830, 17284, 17282, 17283,
-    17288, 10373, 17287, 17290, 17289, 17286, 17285, X, 10203, X, X, X, X,
-    17660, X, 17659, 10372, 10370, 10371, 18894, X, 10875, X, 18921, 10876,
-    18922, 18923, 18937, 18936, 10891, 18947, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 19686, X, X, X, X, X, X, X, X, X, X, X, X,
-    19263, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19165, X,
-    X, 19572, X, X, X, X, X, X, X, X, X, X, 7112, 19278, 7111, X, 12604, 7108,
-    12606, 19279, 7113, 12607, X, X, 7116, X, 7114, 12608, 12165, 12610, X,
-    7110, X, 7109, X, 12605, 11591, X, X, X, X, X, X, X, X, 11852, 11839,
-    11837, 11851, 11846, 6727, 6376, 11847, 11850, 6723, 11849, 6377, 6382,
-    6380, 11840, X, 11835, 11842, 6387, 11853, 6724, 11843, X, 17804, X, 18113,
-    18116, 18112, 10568, 18114, 18115, 18117, 10569, 10571, 10570, 18339,
-    19756, 18341, X, 18340, X, X, 19759, 18517, X, X, 18766, 18835, 5774, X,
-    19774, 11668, 6531, 11997, 7788, X, 13455, 13468, 13456, 13453, 7792, X,
-    7789, X, 13459, 13462, 7791, 13463, 7795, 13464, 13454, 13461, 13465,
-    13457, 13452, 13450, X, X, 13466, X, X, 14098, X, X, X, X, 11290, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19479, X, X, X, 8468, 14429, 14417, 14426, X, X, 14416, X, X, 8464, X,
-    8466, X, 14421, X, 14430, X, X, 15101, 8902, 15107, X, X, 8907, 15103,
-    15110, 15095, 8909, 8903, 15100, 10547, X, X, 10548, X, 18058, 19691,
-    18314, 18313, X, X, 18490, 18491, 18641, 18752, X, 5539, 5540, X, 5541,
-    5610, 5719, 11417, 5859, 5860, X, 6051, 6052, 6050, 6049, X, 6331, 15748,
-    9309, 9307, 8938, X, X, 16373, 16371, 16372, 15746, 16921, 9969, 16920,
-    17369, 17370, 16374, 17740, X, 5553, 5727, 5871, 11425, 5870, X, 6357,
-    8484, 19300, 5616, 5728, 6709, 8031, 10941, 19261, 15186, 8952, 8953,
-    19363, 15183, 15772, 9321, 8053, X, 15185, 9328, 15177, X, 9322, X, 9327,
-    15172, 15176, 15173, 15179, 8957, 9320, 8951, X, 15758, 15181, X, 9326, X,
-    9329, X, 14109, 14106, 13472, X, 8242, X, 18961, 14108, X, X, X, X, X, X,
-    14780, X, 8671, 14778, 8672, 14779, 8673, X, X, X, 9084, 15419, 15416,
-    15418, 9085, 9086, 15417, 17074, 10083, 17068, 10078, 17081, 10082, 10075,
-    17075, 10086, 17073, X, X, 17077, X, X, X, 17473, 17479, 10292, 17482,
-    10287, 10288, 17474, 17481, 17476, 10293, 10290, X, 17472, X, 10289, 17478,
-    9114, X, 9119, 15454, X, X, 15453, 15455, 9116, 15452, 9117, 15458, 15457,
-    15456, X, 9115, X, X, X, X, X, 16015, X, 16018, 9490, 16017, 9489, 9485,
-    9486, 9487, 16014, 16013, 12946, X, 12936, X, 12945, 12930, 12934, 12957,
-    7377, 12949, 12940, 7361, 12955, 12926, X, 12948, X, 7376, 7371, 12925,
-    7369, 7368, 7373, 12947, 7365, 7372, 12453, 14158, 12942, X, X, 12932,
-    16071, 9500, X, 9499, 16026, 9503, 16064, 16036, 16056, 16030, 16044,
-    16039, 9495, 9496, 16058, 16075, 16072, 16063, X, 19550, X, X, X, X, X, X,
-    X, 16027, X, 9492, 16651, X, 17309, X, 10377, 17674, 17675, 10378, X,
-    17673, X, 17995, 17994, 17997, 10526, 17996, X, 18251, 18253, 18252, X, X,
-    18434, 18437, 18435, 18436, 18593, 10767, X, X, X, 18703, 18704, 18260,
-    18604, X, X, 18601, X, 18598, X, 18599, 10768, 18709, 18711, 18714, 18710,
-    18715, X, 18708, X, 18706, X, 10813, 18712, 10815, 10814, 18707, 18713, X,
-    X, X, X, 18803, 10846, 10389, 10532, X, X, X, X, X, 17326, 18041, 18032,
-    10534, 18028, 10535, X, X, 18037, 18031, 18021, 10533, 18034, 18029, 18030,
-    X, 18016, 18023, 18038, X, 18035, X, 18027, X, 18039, 18817, 18875, X, X,
-    18952, 7945, X, 15674, X, 9641, X, X, X, 16880, 16879, X, 17345, X, X, X,
-    10539, 10630, 18627, 18945, X, X, X, 7946, 9250, X, 9642, X, 19480, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19374, 19092, X, 19560, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19205, X, X, X, 19107, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19484, X, X, X, 13505, X, X, 7821, 13504, 13506, X, 7820, X, X, X,
-    X, 14136, 14137, 14135, 8259, X, X, X, 8687, X, 8688, X, 9111, X, 15451,
-    15450, 9110, X, 10761, X, 10760, 18698, 18699, 10841, 18794, X, 10874, X,
-    6989, 8403, 15647, 15646, 16254, 16253, X, X, 10200, 17273, 17272, 17651,
-    17649, 17652, 17650, X, X, 10516, 17964, 17965, 17966, 18226, X, 18227,
-    18228, 18419, 10698, X, 10697, X, 18578, 18577, 10762, 19039, X, X, 10805,
-    10842, 10865, 18864, 18916, 18917, X, X, X, X, X, X, X, X, X, X, X, 11303,
-    X, X, X, X, X, X, X, X, X, X, 11298, X, X, X, X, X, X, X, X, X, X, 19292,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19196, X,
-    X, X, X, X, X, X, X, X, X, X, 19493, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19634, X, X, X, X, X, X, X, X, X, X, 19547, 19740,
+    17275, X, 17280, 17276, 17279, 10201, X, 17070, 17278, 17277, X, 10366,
+    10364, 10367, 10365, 17654, 17655, 17656, 10368, X, X, X, 17970, 10519,
+    17968, X, 10520, 17967, 17969, 10518, 18229, 18422, 18230, 18231, X, 10619,
+    X, 18421, X, X, 18420, X, 18579, 18918, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 6994, X, X, X, 6995, 17987, X, 17986, 17989, 17984, 17982, X, 17988,
+    X, 18244, 18242, 10623, 18241, 18247, 18245, X, 10624, 18240, 18238, X,
+    18239, 10626, 18243, 10625, 18246, 18425, 18431, X, X, 18426, 10703, 18432,
+    16850, X, 16856, 19535, X, 16851, 17320, 16852, 16863, X, X, X, X, X, X, X,
+    16859, 9933, 16858, 16857, X, 16861, X, X, X, X, 17312, 17315, X, X, 17314,
+    X, 11080, 11081, 11082, 11083, 11084, 11085, 11086, 11087, 11088, 11089,
+    11090, 11091, 11092, 11093, 11094, 11095, 11096, 11097, 11098, 11099,
+    11100, 11101, 11102, 11103, 11104, 11105, 11106, 11107, 11108, 11109,
+    11110, 11111, 9651, X, 10930, X, X, X, X, 11318, 11211, 5672, 5673, X, X,
+    5810, X, 11503, X, 6626, 6625, 12529, 12528, 7476, 10931, 5587, 11325, X,
+    X, X, X, X, 11725, X, 5729, 11427, X, 6071, 11573, X, 12178, 6713, X, 8944,
+    5555, X, 19317, X, 5872, X, X, 8487, 5556, 5618, 5619, X, 5731, 5730, X,
+    11428, 5873, X, 11574, X, 6072, 15178, 19368, 9325, 15757, X, X, X, 19371,
+    X, 15762, 9685, 15756, 16393, 15771, 9333, X, 9331, 9683, 15768, 15764,
+    9337, X, 16384, X, X, X, 9335, 15763, X, 16382, X, 15767, 15209, 13850, X,
+    X, X, 15216, 15201, 8967, 15788, 9340, X, 15214, 15213, 8969, 15775, 9341,
+    15776, X, 15197, 15198, 15195, 15200, 15196, 15217, 8963, 9342, 8965, 8970,
+    X, 15199, X, 15211, 14546, 14816, 15225, 16419, X, X, 10238, 10558, 5633,
+    X, 5742, 5743, 5741, 5744, 5740, X, X, 5893, X, 11452, 5892, 5894, X, X,
+    11447, 11446, 11449, 11448, 11451, 5891, 11445, 11450, 16444, 9722, 9721,
+    X, 16438, X, 16421, 16423, 16425, 16443, 16437, 9717, X, 16428, X, 16442,
+    X, X, X, X, X, X, 16429, X, X, X, X, X, X, X, 10000, 16961, 6499, 6492,
+    6478, 6468, X, 6473, X, 11923, 6469, 11946, X, 11917, 11916, 11930, 11918,
+    6496, 7212, 6489, 11931, 6470, X, 6819, X, X, X, 11944, X, X, X, X, X, X,
+    19049, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 19724, X, X, X, X, X, X, X, 19437, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19570, X, X, X, X, X, X, X, X,
+    19149, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 6191, X, 13609, X, 13610, 14933, 15559, 16145, 10148, 16736, 16741,
+    9864, X, 9861, 16737, X, 17206, 10158, 10156, 10159, 10157, 17205, 17202,
+    17201, X, 17204, X, X, 17203, 17589, 10329, 17580, 17579, X, 10324, 17585,
+    17584, 17576, 17587, 17581, 10328, 7419, 7416, 13012, 7422, 13015, 7424,
+    7417, X, X, X, X, 13631, 13634, 7898, X, 7908, 7904, 13632, X, X, 7912,
+    7905, 7910, 7900, X, 7897, 7899, 7911, 13633, 7903, 7906, 7902, 16204,
+    16201, 16202, 9590, 16203, 16198, 16199, 9587, X, 9588, 16200, 9589, X,
+    16763, X, 16764, 16761, 16762, 9880, 16760, X, X, X, X, X, 17215, 17212,
+    17214, 10174, 17218, 10173, 17216, 16802, 16777, 16790, X, 9889, X, 16769,
+    X, 16767, 16801, X, 16799, 16798, 16781, 16780, 16770, 9891, X, 16776,
+    16786, 16797, 9894, 16804, X, 10182, 9896, 9890, 16774, X, 16783, 16766,
+    16768, 18201, X, X, 10615, X, X, 18216, 18203, X, 18208, 18210, 18188,
+    18213, 18199, 18204, 18192, 18196, 18215, 18206, 18189, 18193, 18195,
+    18205, X, 10614, 18198, X, 19316, X, X, X, X, 11330, X, X, 11539, X, X, X,
+    10937, X, 11777, 12121, 12585, 7077, X, 19627, 17735, X, 10641, 5536, 5714,
+    11352, X, 5848, 5849, X, 6309, X, X, 19213, 15134, 8926, 8930, 15135, 8931,
+    8927, 8928, 8925, 8929, 9301, 13769, 9302, 9300, X, 9299, 16357, 9679,
+    16917, 16918, 19265, X, 10398, 10550, X, 5542, X, 5865, X, X, X, X, 19207,
+    6710, X, 12174, 12176, 12173, 12177, 6711, 7122, 12613, X, 12615, 7120,
+    12616, 7121, 12614, X, 12172, 13195, 13198, 13199, 13196, 7575, 7574, 7572,
+    7573, 13197, X, X, X, X, 7576, X, 9058, X, 15959, 15960, 9439, X, 19753,
+    15958, 15961, 9441, 9438, 15954, 15951, 15956, 15953, 9445, 15955, X,
+    19754, 15957, 9443, X, 19758, X, X, 9776, 16555, X, 16549, 16553, 16559,
+    17042, 17043, X, X, 10278, 10279, X, 10572, X, X, 10787, 5777, X, X, X, X,
+    X, 12404, X, X, X, X, X, X, 12872, 7308, X, X, X, X, X, 7938, 12411, 12412,
+    X, X, 12883, 12889, X, X, 12887, 7311, 12885, X, 12886, 12888, X, X, X,
+    12884, 7796, X, 13469, 7798, 13471, 7797, 13470, X, X, X, X, X, 14107,
+    8241, 9464, 15991, X, 9472, X, X, 15994, 15989, 9471, 9475, 15988, X, 9469,
+    X, 15998, 9466, 15997, 15996, 9478, 15750, 9465, X, 15995, 15986, X, 9479,
+    15993, 9467, X, X, X, X, 5118, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19525, 19527, X, X, 11344, X, 5666,
+    5667, 5660, X, X, 11341, 11343, X, X, X, X, X, X, 5799, 11382, 5796, 5800,
+    11392, 11380, 5797, 11384, X, X, X, 5798, X, 5801, X, 5787, 7488, 5512,
+    19069, 5531, 5288, 5599, X, 5598, 5597, 5687, 5686, X, 11349, 11401, X, X,
+    X, 6270, 6267, 6269, 6268, X, X, 6640, X, X, 7965, X, 5513, X, 5600, X,
+    9693, 9700, 16401, 9698, 9692, X, 9699, X, 16398, 9980, 9694, X, 9701,
+    9979, 16397, 16396, X, 9703, X, 9704, X, 16395, 16394, 9981, 16404, 9697,
+    16402, X, X, X, X, 19744, X, X, X, 19745, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19510, X, X, X, X, X, X, X, X, X, X,
+    6407, 11867, 11860, 6402, 6421, 11856, 11863, 11865, 11868, 6416, X, 11864,
+    11857, 6414, 11861, X, 11869, 6399, X, 11866, 6409, 6408, 11859, 6397,
+    10946, 11334, 6761, 19425, X, 5630, 5739, X, 5885, 5884, X, X, 5886, 5887,
+    11444, 11443, 11611, 6110, 11614, 11613, 11612, 11615, X, X, X, X, 6426,
+    11878, 11874, 11883, X, X, 8703, X, X, X, 14839, X, X, X, X, X, X, 14835,
+    14873, 14834, 9138, 15499, X, X, 15482, X, X, 15460, 15490, 9130, 15475,
+    15485, 9133, 15478, 9131, 15463, 18146, 18143, X, X, 18148, 18150, 10591,
+    10593, X, 18149, 10594, 10592, 18151, 19086, X, X, X, 10589, X, X, X, X, X,
+    10665, 18355, 18361, 10667, 18145, 18360, X, 18367, 18358, 10122, X, 17149,
+    17148, 17153, 17140, 10126, X, 10130, 17147, 17154, 10131, 17150, X, X, X,
+    X, 10123, 10125, 17528, 17526, X, X, 17533, 17530, 17534, X, 17519, 17527,
+    17538, 17160, 17523, 10860, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 6189, 12480, 6955, 13604, 13602, X, X, 13603, 14244, 14245, 14918,
+    14243, X, 14912, 10748, X, 18550, X, 18549, 18552, 18551, X, 18686, X,
+    10798, 18685, 18683, X, 18684, X, X, X, 10832, 10831, 18778, 18779, 10833,
+    X, 18853, 18854, 10872, X, 10878, X, 18911, 18942, 16159, 9566, 9562,
+    16160, 16162, 16161, 16169, 16170, X, 9564, X, 9559, X, X, 16163, X, 16742,
+    9862, X, 16733, 9863, 9866, 16738, X, 16735, 9865, X, X, 16739, 16740,
+    16734, 16743, 12487, 12485, 6968, 12484, 6973, 6970, 6967, X, 6974, X,
+    6969, 6972, X, 6971, 12486, X, 6966, X, X, X, 7421, 13011, 13017, 7418,
+    7425, X, 7420, 13014, 13016, 7423, 13010, 13013, 14320, 14316, 14319, 8368,
+    14317, 8369, X, X, 14495, 8813, 8812, X, 8811, X, 14989, 14990, X, X,
+    15594, 15596, 9206, 9203, X, 9205, 9204, 15595, 15593, X, X, X, X, X, 6195,
+    X, 7892, 7891, 14943, 14944, X, 9182, 16729, 9556, 16730, 17200, 6196, X,
+    12483, 6962, 6961, X, 13003, 7410, 13004, 13617, X, 13616, X, 13615, X, X,
+    5464, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19417, X, 11702, 11714, 11721, 6237, 11707, 11700,
+    6236, 11703, 6240, 11706, X, 6235, X, 6230, X, 6245, 11716, 6246, 11720, X,
+    11718, 11722, 6243, 11710, 11698, X, 11712, 6234, 11717, 6229, 11719, X,
+    15729, 15727, 15725, X, 15731, X, 15730, 9298, 9293, X, 9295, 9297, X, X,
+    15732, 16351, X, X, 16350, 16349, X, 16352, 16345, X, 16346, 16354, 16347,
+    X, 9676, 16356, X, 11667, 6168, X, 6525, X, 6863, 6864, 6865, 13413, 12822,
+    7269, X, X, 7769, 13412, 19722, X, 14059, 8213, X, 14058, 8212, X, X,
+    14716, 9430, 15946, 15943, 15944, 15945, X, 14930, 14926, 14929, 14927,
+    8758, 14921, 8753, X, X, X, 15555, 9162, 9165, X, 15557, X, 9173, 15556,
+    9167, X, 9529, 15558, X, 9172, 15554, 9174, X, X, X, 9163, X, 19381, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19029, X, 5967, 11502, 11489, 5965, 11492, X, X, 11494,
-    X, 6241, 11711, 11723, 6233, X, 11724, 6228, 6238, X, X, 6231, 11705, 6239,
-    11704, 11708, 11715, 11713, 6247, 6242, 11699, 11701, 6244, 6232, 6016,
-    11526, 6004, 6001, X, 11519, 6000, 11529, 6003, X, 6007, X, X, X, 5998,
-    11525, X, X, X, X, 11518, X, X, X, X, X, X, X, X, X, X, X, 19646, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19710, X, X, X, X, X, X,
-    X, X, X, X, X, X, 13286, X, 13270, 13271, 13275, X, 13290, 13287, X, 13280,
-    13279, 7675, 13283, 13298, 13266, X, 13299, 13285, 13303, 13291, 7674,
-    8560, X, X, 15270, 15271, 9386, 9387, 16459, 16458, 17405, 18655, 5637,
-    11336, 5746, X, 6126, 11626, X, 6801, 8562, 5638, X, 12286, 6802, 12287, X,
-    10006, 5639, 19517, X, 11913, X, 16675, 9506, 9828, 16685, 16681, X, 16679,
-    16674, 16689, X, X, X, 9832, X, 16670, 16682, 16683, 16673, 16672, 16686,
-    X, 16676, 16671, 16677, X, 16688, 16669, 16687, 16684, 9830, 9829, 10467,
-    17880, 17876, 18159, 10597, X, 18160, X, X, 18378, 10672, 18380, 10673,
-    18377, 18379, 10746, X, 18544, 10745, 18681, 18680, X, 18679, X, X, 18848,
-    18849, 18851, 18850, X, 11477, 5943, 17892, 10471, 17899, X, X, 18384,
-    10478, 17553, 17890, 10474, 17891, 17896, X, X, 10476, 10477, 17889, 17898,
-    17900, 17893, 17895, 17897, 17894, 17901, 10473, 10479, 10475, X, 10472,
-    18165, X, 10604, 15577, X, 15567, 15572, 15578, 15575, 15574, 15573, X,
-    15566, 15571, X, X, 15569, X, 9563, 9560, 16167, 16172, 16174, 16171,
-    16164, 16166, 16176, 16173, 16168, 16177, 16165, 16175, 9561, 9567, 9565,
-    12487, 12485, 6968, 12484, 6973, 6970, 6967, X, 6974, X, 6969, 6972, X,
-    6971, 12486, X, 6966, X, X, X, 7421, 13011, 13017, 7418, 7425, X, 7420,
-    13014, 13016, 7423, 13010, 13013, 16204, 16201, 16202, 9590, 16203, 16198,
-    16199, 9587, X, 9588, 16200, 9589, X, 16763, X, 16764, 16761, 16762, 9880,
-    16760, X, X, X, X, X, 17215, 17212, 17214, 10174, 17218, 10173, 17216,
-    9881, 9893, 9886, 16775, 16791, 16785, 9892, 16765, 10177, 16793, 16796,
-    9888, X, 16779, 9895, 9885, X, X, X, 9884, 16789, 16795, 9882, X, 16772,
-    16794, X, X, 16773, X, X, X, 5251, 5252, 5254, 5253, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19585, 19164, X,
-    X, 19571, X, X, 11497, X, 5961, X, X, 5964, 5949, 5973, 11490, X, X, 11709,
-    5947, 5969, 5948, 5956, 5957, 11495, 11491, 5962, 5954, 11487, 5950, 11498,
-    5971, 5974, 5953, 5966, 5972, 5951, 11496, 6014, 19513, X, X, 11528, 11522,
-    5997, 5999, 11527, 6006, 11517, 6018, 6020, 5994, 6011, 19158, 11515, 6017,
-    X, 6002, X, 6012, 6013, 11516, 6010, 6008, X, 6009, 6015, 11524, 5996, X,
-    7166, 12672, 12670, 12671, 7167, 12669, X, X, X, X, 7657, 7658, 13258,
-    7659, 7656, 13877, 19421, 13878, 14536, X, X, 8974, 8973, X, X, 16942,
-    17389, X, 17751, 17750, 18070, 15229, 15255, X, 8996, 15246, 15262, 8994,
-    15238, 8979, 15240, 15254, 8988, 15233, 8992, 8982, 15242, 15232, 15226, X,
-    15252, 8989, 15261, 15227, 8986, X, 15248, X, 8987, 15234, 15245, 15241,
-    15243, 5903, 5906, X, X, X, 11645, 11643, 11630, 6140, 11637, 6135, 11631,
-    X, 11639, 19188, 11636, 6138, 11635, 6145, 11644, 6147, X, 6149, X, 11629,
-    19524, 6136, 11646, X, 6143, 6146, X, 9833, 10830, 5942, X, X, X, 12477,
-    6576, 12479, 12478, 6953, X, 12985, X, 12992, 7388, 12990, 12988, X, 12995,
-    12986, 12987, 7389, X, 7393, X, X, 12996, 7392, 12994, 12991, 8756, 9166,
-    X, 9164, 9168, 9170, 9161, 9175, 9171, X, 9169, 15553, X, X, X, X, 9536, X,
-    9532, X, X, X, 9539, X, 16130, 9540, 16142, 16135, 9525, 16143, 16137,
-    9535, 14270, 8345, X, X, 14269, 8344, X, X, X, 14271, 8343, X, 14946,
-    14949, 14947, 14948, 14952, 14945, 14953, 14950, 14951, 9184, 15565, X, X,
-    9183, X, 16158, 16156, X, X, 9557, 14970, 14969, 14974, 8788, X, 14971,
-    14967, 14972, 14973, 8789, 8791, X, X, 15582, 15581, X, 15579, 15580, 9187,
-    9189, 9186, 9188, 16184, 16185, 16180, X, 16181, 9570, 9575, 9569, 9576,
-    9571, 13019, 7427, 7429, 13022, 13029, 13024, X, X, 7913, 13645, 13637,
-    13643, 13644, 7914, X, 13636, 13638, 12488, 13640, 13641, 13639, 8365, X,
-    X, X, 14309, 16756, 14310, 14307, X, 8367, 14306, 15602, 15620, 15617,
-    15612, 15598, 15597, 15606, 15625, 9215, 15628, 15604, 15608, 9595, X, X,
-    X, X, X, 9603, 9598, 16237, 16234, 16210, 9593, X, X, X, 9592, 9599, X, X,
-    X, 19692, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19664, X, X, X, X, 19473, 7681, X, 13913, 13935, 13924,
-    8123, 19751, 8118, 13907, 8119, 13923, X, 13916, 13929, 8115, 13889, 13931,
-    8105, 13897, 8108, 8107, X, 8124, X, 13891, 13925, 13926, 8110, 15848,
-    15847, 15850, 16461, 16460, 9730, 16462, X, 10007, 16969, X, 17406, 17768,
-    18502, X, 5640, 5748, 5747, X, 6466, 11337, 11366, 5898, X, 11453, 11627,
-    11628, 6467, X, 11914, X, 6803, 13978, 13975, 13958, 8167, 13988, 13985,
-    13993, 8142, 13973, 8170, X, 13980, X, X, 8152, 8155, X, 13979, 8169,
-    13963, 13318, X, X, 13989, 13987, 13991, X, X, 19545, X, X, X, 19053, X, X,
-    X, X, 19695, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 19113, X, X, X, X, X, X, X, X, X, 11201, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19429, 19430, 19536, X, X, X,
-    X, X, X, 19019, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19422, X, X, X, X, X, X, X, 19777, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19163, X, X, X, X, X,
-    X, X, X, 12545, 7066, X, X, 13086, 19140, 7509, 13100, 7507, 7504, 13091,
-    7500, 13095, 7511, 13085, 13090, 13089, 7052, 7506, 13098, X, 13101, 13082,
-    X, 7984, X, 13260, 13264, X, 7662, 13259, 7664, 19436, 7663, X, 13885, X,
-    13880, X, 8091, 8095, 8092, 13883, 13886, 19438, 8093, X, 8094, 8099,
-    14545, 13884, 8097, 13881, 13879, X, 8098, X, 17839, X, 17840, 17838, X,
-    10586, X, 18139, 18140, X, 18532, 18667, 18772, 5936, 6184, X, 10109, 5937,
-    X, 13526, 14157, X, 10834, 11471, X, X, X, 11472, 11474, 5938, 11475,
-    15493, 15462, 15481, X, 15461, X, X, 15479, X, 15486, 15474, 15469, 15467,
-    X, 15468, 15487, 15498, 15476, 9132, X, 15471, X, 15491, X, 9135, 15470,
-    15464, 15480, 9139, X, X, 9127, 18669, X, X, 18773, X, X, 18845, 18846,
-    18847, X, X, 18941, 18931, 11476, 6573, X, 6948, X, 12960, 12959, 7379,
-    7852, 13562, X, X, 13561, X, 8300, 8721, X, 8720, 8722, 18372, 10670,
-    10669, 10668, 18373, 18543, 18541, X, 18540, 18369, 18542, 18375, 18539, X,
-    18677, 18643, 18675, 10797, 18676, 18678, X, 18776, 10828, 18775, 18774,
-    10829, X, 10859, 18886, 18909, 18908, 18910, 8316, 14923, 8760, 8755, X, X,
-    8750, X, 8766, 8751, X, 8747, 8762, 8759, 8761, X, 8752, 8757, 8748, 8749,
-    14931, 14928, 14920, 14925, X, 8763, 14932, 8764, 8754, X, X, 14922, 17575,
-    X, 17574, X, 17573, 10323, 17906, 17907, 10480, 17908, 10481, X, X, 10607,
-    X, 10606, 18387, X, X, 10678, 18388, 18554, 10749, 10750, X, 18688, X,
-    10835, X, X, X, X, 19347, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19449, X, X, X, 6696, 6693, 6695, 6697,
-    6694, 12598, 12144, X, 19372, X, 12600, 12599, 7100, X, 7096, X, X, 7097,
-    7099, 7101, 7098, X, 7103, 7102, X, X, X, X, X, 7546, 6710, X, 12174,
-    12176, 12173, 12177, 6711, 7122, 12613, X, 12615, 7120, 12616, 7121, 12614,
-    X, 12172, 13195, 13198, 13199, 13196, 7575, 7574, 7572, 7573, 13197, X, X,
-    X, X, 7576, X, 10055, 17025, X, 17032, 17029, X, X, X, 17453, X, X, 17450,
-    X, 10273, X, 17454, 17456, 17455, 17451, 17452, X, X, 17806, X, 10434, X,
-    17803, 17805, 17802, 17807, X, 17220, 10342, 17626, 17623, 17627, 17614,
-    17610, 17624, 17940, 17612, X, 10345, X, 10344, 17222, 10346, 17620, 17622,
-    10343, 17625, 17603, X, 17606, X, X, X, X, X, X, X, X, 11282, X, X, X,
-    11283, X, 11284, 11285, X, 11286, X, X, X, X, X, X, 11287, 11288, X, X, X,
-    X, X, X, 11289, X, 7497, 13088, 7510, 7505, 13096, 7494, X, X, X, 7493, X,
-    X, X, X, X, X, X, X, X, X, 13080, 13081, 13701, X, X, X, 7967, 7970, 13712,
-    7990, 13715, 7528, X, 8912, X, 8913, 8911, X, 5537, X, 5606, 5608, 5607,
-    11331, 5609, 5715, 11353, X, 5716, X, X, X, X, X, 5850, 5851, X, X, X,
-    11409, X, 6036, X, 12327, X, X, 6836, X, X, 19596, X, 12330, X, 6828, 6831,
-    6833, 6835, 6832, 12326, 12325, X, 6830, 12328, 12329, X, 12322, 6834, X,
-    6829, X, X, 19623, 12324, X, 9838, 16697, 16699, X, 9836, 16691, 16695, X,
-    16698, 9834, 9837, 16701, 16693, 16694, 16700, 16692, 16696, 9835, 17163,
-    X, 17162, 10133, 17168, 10135, X, X, 10132, 17164, 10136, 17165, X, 19746,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19233, X, X, X, X,
-    X, X, X, X, X, X, 13954, 8164, X, X, X, 14634, 14633, 14607, 8569, X,
-    14632, 14610, 14611, X, 8579, 14641, 8574, 14631, X, 14604, 8580, 8570,
-    14619, 14609, 18093, 18096, 18088, 18325, 18326, 18330, 18331, X, 18328,
-    18329, 18327, 19594, 10654, X, X, X, X, 10732, 18506, X, X, 18503, 18504,
-    18505, 10733, X, 18657, 18656, X, 18760, 10822, 18758, 6511, 11655, 6162,
-    11653, 6161, 11657, 11654, X, X, 11963, 12338, 11961, 11968, X, 6512, X,
-    6515, 11969, 11965, X, 11966, X, 11960, 6514, 11962, 6513, 11967, X, 11964,
-    X, X, 12342, 16521, 16525, X, 9759, 19360, 17001, 10038, 10263, 10039,
-    10036, 16998, 16996, X, 16999, X, 17002, 10037, 17000, 16995, X, X, 17429,
-    17432, 17794, 17427, X, 18102, 17433, X, 10426, 17431, 10264, 19738, X, X,
-    X, 14063, 14065, 14061, 14062, X, X, 14066, 14068, 14069, 14064, 14067,
-    8216, X, X, 14722, X, 14727, 14719, 14723, X, 19741, 14728, 14724, 8630,
-    8638, X, 8633, 14720, 8225, X, 14089, 14091, 14093, 8224, X, X, 8222, X,
-    14090, 8223, 14092, 8221, X, X, 14759, 14750, 14753, 14757, 8661, 14755, X,
-    14754, 14751, 14752, 8659, 14758, 8658, X, 8663, 8662, 10065, 9791, 16581,
-    16571, 9789, 16575, 9793, 16572, 16577, 9792, 16580, 16583, X, X, X, X,
-    17061, 17062, 17046, 17053, 17051, X, X, 10063, 17058, 16578, X, 17049, X,
-    17059, 10062, 17048, 7805, 13481, 7810, 7800, 7808, 13478, 7799, 13482, X,
-    X, 13485, X, X, X, 14126, 14117, 8244, 14124, 14121, 14113, 14122, 8246,
-    14114, X, 14110, X, X, 8679, 14119, X, 8243, 14125, 14132, 14133, 14131, X,
-    8686, 14803, 14802, 14804, 8685, 8684, X, X, 16001, 16003, X, 9482, 16002,
-    16614, 9806, 17484, X, 17483, 10451, 17832, 10453, 10452, 18133, 18352,
-    10664, 5919, 12419, 6906, 7354, 12922, 7829, X, 14153, 8701, X, 9122, 9815,
-    10108, 10301, 18138, 5933, 6556, X, X, 7355, 13520, 8272, X, 9123, 15459,
-    16019, X, X, X, X, 5934, 8273, 14823, 9124, 5935, 8278, 14180, 14205,
-    14173, 14166, 14177, X, 14165, 14163, 8274, 14197, 14172, 14200, X, 14201,
-    8282, 8287, 8283, 8291, 14192, 8284, 14184, 14168, X, 8276, 14160, 14194,
-    14203, 14167, 8290, 14208, 14179, 17106, 17116, 17127, 17108, 17110, X,
-    10310, 17104, 10119, 10303, 10110, X, X, X, X, 10116, 10307, 17508, X,
-    17498, 17493, 17499, 17509, 17513, 17512, 10309, 10308, X, X, 17500, 17514,
-    17503, 15505, 15513, 15525, 15511, X, X, 15515, X, X, X, X, X, 9515, 14893,
-    16094, 16103, 16093, 16089, 16086, 9516, 16084, 9149, 16077, 9514, 16083,
-    9513, 16088, 16085, 16101, 16096, 16090, 16095, 19768, 14238, 9153, X, X,
-    16110, 16117, 9520, X, 16121, 9524, 16113, 16111, X, 16120, X, 9519, 16119,
-    9521, 9522, 16112, 9523, 16118, 16114, 16115, 16116, 9159, X, X, X, 16690,
-    16702, 9845, 9850, 9851, X, 10145, 17179, 17188, 17185, 17187, X, 10142,
-    17180, X, 17186, 10138, 17182, 10146, 17178, 17183, 17190, 16710, 17184,
-    17177, 10139, 17176, 10140, 17191, 10141, 17189, 10144, 17175, X, 19450,
-    19620, 19413, 19659, X, 19668, 19619, 19412, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 5168, X, X, X, 5169, X, X, X, X, X,
-    X, 13934, X, X, X, X, 13892, X, X, X, X, 14588, 8546, X, 14586, 14565,
-    14570, 14563, 19485, 14582, 14549, 14556, X, 14580, 14590, 14566, 19072,
-    14553, 12289, 12290, X, 7207, 7211, 12721, 7210, 7208, 7209, X, 13313,
-    7695, 8136, X, 8134, 8135, 13948, X, X, 8999, 5641, X, 11367, 19518, 5749,
-    X, X, 11370, X, X, 5752, 11369, 14612, 14636, 8564, 14643, 14635, 8573,
-    14624, 8584, X, X, 8583, 8577, X, X, 14642, 8565, 14622, 14613, 14626,
-    14638, 8585, 19508, 8567, 14621, X, 14614, 8576, X, 8575, 14617, 14627,
-    14637, 18761, 18759, 18830, 10856, 10870, 18905, 18884, X, 18904, 18950,
-    18951, 5642, X, X, X, X, 5910, 11462, X, X, 11648, X, 6154, X, 6157, 19139,
-    11649, X, 6155, 6156, 19595, X, 8741, X, X, X, X, X, 15534, 9158, X, X,
-    15545, 15544, X, 15539, 9160, 15543, 15535, 15536, 9152, 9154, X, 15541,
-    15533, 9156, 9155, 15537, 15542, 15540, 9157, 15538, X, 19318, X, X, X, X,
+    X, X, X, 19733, X, X, 14379, 14377, X, 14373, 8423, 14371, 8429, 14376,
+    14383, 14374, 14382, X, X, 8876, 8873, X, 8874, X, 15066, 15058, 8872,
+    8869, 15059, X, X, 8871, 15062, X, 15064, X, X, 7761, 13404, 13403, 7759,
+    7760, 19706, X, X, 8202, 8201, 14049, X, 19707, 14048, 7762, X, X, X, X, X,
+    8617, 14700, 8618, 14699, X, X, X, 15347, 15933, 9422, 7287, 12844, 12838,
+    12836, X, 7285, 13432, 7280, 12841, 12845, 12847, 12843, 12837, 7286,
+    12842, 12840, 7279, 12848, 7289, 12846, 7283, 12839, X, 7284, 7281, X, X,
+    X, 19012, X, X, X, 19197, X, 19613, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19339, X, X, X, X, X, X, X, 19526,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19151, X, X, 19478, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19393, X, X, X, X, X, X, X, X, 19043, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 6996, 13675, 17291, 6997,
-    X, X, 15655, 15654, 16831, X, 10997, 10998, 10999, 11000, 11001, 11002,
-    11003, 11004, 11005, 11006, 11007, 11008, 11009, 11010, 11011, 11012,
-    11013, 11014, 11015, 11016, 11017, 11018, 11019, 11020, 11021, 11022,
-    11023, 11024, 11025, 11026, 11027, 11028, 9651, X, 10930, X, X, X, X,
-    11318, 11211, 5672, 5673, X, X, 5810, X, 11503, X, 6626, 6625, 12529,
-    12528, 7476, 10931, 5587, 11325, X, X, X, X, X, 11725, X, 5729, 11427, X,
-    6071, 11573, X, 12178, 6713, X, 8944, 5555, X, 19317, X, 5872, X, X, 8487,
-    5556, 5618, 5619, X, 5731, 5730, X, 11428, 5873, X, 11574, X, 6072, 10780,
-    18645, X, 18646, 18647, X, X, 18928, 5621, 11364, 5733, X, 5877, 5878,
-    5876, X, 5879, 6086, 6085, X, 11854, 6389, 6388, X, X, 12637, 7611, 7612,
-    X, X, X, 8060, 15219, 8972, 16408, X, 5628, 5738, X, 6424, 11871, X, 12224,
-    6759, 7655, X, 13876, 8090, 8529, X, 15795, 15796, X, 19418, 16941, 10236,
-    18825, 5629, X, 11872, 6425, 6760, X, 12225, 8543, 19482, 14551, 8556, X,
-    14567, 14547, X, 8549, 14571, 14555, 8550, 14564, 8540, 8125, 14573, 13909,
-    14552, X, 19472, 14578, 8545, 14575, 8542, 14569, 8553, 14560, 14589, X, X,
-    X, X, 11294, X, X, X, X, X, X, 11302, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 19246, X, X, X, X, X, X, X, X, X, X, X, 19016,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19154, X, X, X, 14466,
-    14458, X, 14460, X, 14465, 14464, 8481, X, 13780, 14462, X, X, 8482, X,
-    14457, 14461, X, X, X, X, 15143, X, 15150, 15141, X, 15148, 15139, 15147,
-    15151, 12626, 12628, X, 12630, 7135, 7141, 13207, 12634, 12625, 7592,
-    13205, X, 7140, 7138, 12636, X, 13206, X, 12627, X, 7139, 12631, 7142,
-    12633, X, X, 7137, 12632, 12635, 12629, 19354, 7136, 7614, 7634, 7618,
-    8062, 13248, 7619, X, 7615, 7630, 7625, 7623, 13236, 7635, 13233, 13246,
-    13242, 13836, 13835, X, X, X, X, X, X, X, X, X, X, X, 13231, 13852, X,
-    6548, 6546, 12007, X, 6545, X, X, X, 6550, 6552, 6549, X, 12010, 12006,
-    6553, X, 6547, 6183, X, 6551, 12009, X, X, 12008, X, 6544, X, X, X, X, X,
-    16010, X, X, 16011, X, X, X, X, 16618, X, X, 10096, 10095, 10093, 10094,
-    10097, X, 17487, 10298, 10297, 17835, 18135, X, X, X, 10743, 10742, 5925,
-    12013, X, 12028, 12030, X, X, X, X, X, X, X, X, X, X, X, X, X, 6942, 6936,
-    6944, 6941, 12452, 12455, 6937, X, 12446, X, 6930, 6940, X, 6943, 6945,
-    16029, X, 16059, X, X, 19221, 9505, 14849, 16041, 16032, 16035, 16073,
-    16042, 16033, 16031, 16028, X, 9498, 16051, 9497, 9501, 16046, 16054, 9491,
-    16070, 16074, 9493, X, 16037, 16057, 16061, 16034, 8727, 14897, 8730, 8731,
-    14887, 14900, 8732, 8726, 8725, 14896, 8733, 14886, 14889, 14899, 14895, X,
-    X, 15532, 15521, 8724, X, X, X, X, 9148, 15509, 15530, 15510, 9143, X,
-    15507, X, 5033, 11257, 5099, 5184, 5189, 5100, 11256, 5053, 5054, 5101,
-    5133, 5025, 5134, 5028, 5180, 5258, 5259, 5260, 5261, 5262, 5263, 5264,
-    5265, 5266, 5267, 5031, 5030, 5139, 5141, 5140, 5032, 19017, X, X, X, X, X,
+    X, 19699, X, X, X, X, X, X, 19540, X, X, X, 19023, 19225, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19442, X, X, X, X, X, X, X, X,
+    X, X, X, 5782, X, X, X, X, X, X, X, X, X, 6222, X, X, X, X, X, X, X, X, X,
+    X, 7455, 13042, 12076, 6638, 12077, 6637, X, 19082, X, 6635, X, 6636, X, X,
+    X, 12542, X, X, 19252, X, 7480, 13077, X, 7483, 13076, 7667, 7482, 7481, X,
+    7964, X, 7963, 7962, 8433, 9950, 16902, 16900, 16898, 16897, 9952, 16896,
+    9953, X, X, X, X, 16894, 16895, 9949, 9954, 9951, X, X, 16893, X, 10221, X,
+    17360, 17358, 17363, 17361, X, 17359, 17362, X, X, 10041, 17008, X, X,
+    10040, 17011, 17009, 17010, X, X, 10042, X, X, 19718, 17440, 19717, 10268,
+    17441, X, X, 10266, 17442, 10267, 17439, 17443, X, 17437, X, X, 10431,
+    6532, 6533, 11996, X, 12396, 12395, 6883, 6886, 6885, 6884, 12392, 12394,
+    12393, X, X, 12851, 7291, 12855, 12854, 12853, 12849, 7290, 7294, 7297, X,
+    X, 7298, 12850, 12852, 7296, 7295, 7293, 7788, X, 13455, 13468, 13456,
+    13453, 7792, X, 7789, X, 13459, 13462, 7791, 13463, 7795, 13464, 13454,
+    13461, 13465, 13457, 13452, 13450, X, X, 13466, X, X, 14098, X, X, X, X,
+    11290, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19479, X, X, X, 11796, 6333, 6332, 11797, X, X, X, 6692, X,
+    7094, 12597, X, 13173, X, 7541, 8014, 13172, 8013, X, 8923, 19253, 15133,
+    9678, X, 9962, 16916, 19255, 10549, X, 10724, 8029, 13804, X, 8030, 13803,
+    8027, X, X, X, X, 14470, 14472, 8483, 14471, 14469, 14468, X, X, X, 15154,
+    8941, 8939, X, 8940, 15152, 15153, X, 8937, 15749, 15747, X, 9308, 8045,
+    8042, 13812, X, 13214, X, 7597, X, X, X, X, X, X, X, X, X, 8050, 8054,
+    13816, 8495, 8052, 13820, 8056, 14481, 13822, 8497, 8048, 8051, 13823, X,
+    13824, 13830, 8065, X, 13858, 13841, 13855, 14499, 8068, 13859, 13862,
+    8067, 13844, 13861, 13860, 8069, 13837, 8064, 8072, X, 8070, 13857, X,
+    13847, 8074, 13864, 13856, 13865, 8082, 8080, 13854, 13853, X, 13851,
+    15221, 15220, 8975, X, 19172, X, X, X, 8976, 15799, 15802, 9365, X, 19173,
+    9364, 15803, 15798, 9367, 15800, 19167, 9366, 15797, X, 15801, 9712, 9709,
+    16417, 16416, X, 16415, 16410, X, 17839, X, 17840, 17838, X, 10586, X,
+    18139, 18140, X, 18532, 18667, 18772, 5936, 6184, X, 10109, 5937, X, 13526,
+    14157, X, 10834, 11471, X, X, X, 11472, 11474, 5938, 11475, 14882, 8715,
+    19732, 8716, X, 14836, 8708, 14840, 14878, 8717, X, 8709, 8711, 8718,
+    14884, 14871, 14866, X, X, 14847, 14846, 8707, 14832, 8704, 14856, 14833,
+    14854, X, X, 14843, 14879, X, 10204, 17294, 17305, 17665, 17668, 17670,
+    17669, X, 17663, 17667, 17662, X, 17664, 10375, 17661, X, 17666, X, X,
+    17992, 17981, 10524, X, X, 10525, 17980, 17985, 17991, 17983, 17990, X,
+    5024, 5026, 5027, 5104, X, 10959, 10960, 10961, 5073, 5074, 5069, 5070,
+    5077, 5078, 5081, 5082, 5065, 5066, 5186, X, 5061, 5062, X, X, X, X, X, X,
+    X, 5095, 5096, X, 13717, 13703, 13709, 13711, 13699, 13714, 7969, 13698,
+    19161, 7976, 7992, 7988, 13700, 7982, X, X, 7989, 7985, 7981, X, 13707, X,
+    X, X, X, X, 7987, X, X, X, 14402, 7528, X, 8912, X, 8913, 8911, X, 5537, X,
+    5606, 5608, 5607, 11331, 5609, 5715, 11353, X, 5716, X, X, X, X, X, 5850,
+    5851, X, X, X, 11409, X, 6036, X, 12327, X, X, 6836, X, X, 19596, X, 12330,
+    X, 6828, 6831, 6833, 6835, 6832, 12326, 12325, X, 6830, 12328, 12329, X,
+    12322, 6834, X, 6829, X, X, 19623, 12324, X, 8741, X, X, X, X, X, 15534,
+    9158, X, X, 15545, 15544, X, 15539, 9160, 15543, 15535, 15536, 9152, 9154,
+    X, 15541, 15533, 9156, 9155, 15537, 15542, 15540, 9157, 15538, X, 5316,
+    5317, 5318, 5319, 5320, 5321, 5322, 5323, 5324, 5325, 5326, 5327, 5328,
+    5329, 5330, 5331, 5332, 5333, 5334, 5335, 5336, 5337, 5338, 5339, 5340,
+    5341, 5057, 5045, 5058, 5153, X, 5495, 5497, X, 5498, X, X, X, 11309, 5517,
+    5515, 5518, 5516, 11310, 5560, 11319, 11317, 5559, 5558, X, X, 5654, 5653,
+    5652, X, 5655, 5651, X, X, X, X, 5778, 5779, 5508, 5509, 11208, 5529, X, X,
+    5589, 5590, 5591, 11396, 5678, 19075, 11347, X, 5815, X, 11397, 5813, 5814,
+    11395, X, X, 5816, 5812, X, X, X, X, 11505, 6575, 11506, X, 15770, 15761,
+    X, 9336, X, X, 9330, 16383, 9684, 15769, 9332, 9334, 15766, 9338, 15765,
+    15760, 15759, 9682, 15773, 16386, 16925, 9687, X, 16392, X, 16390, X,
+    16926, X, 9688, 16391, 15778, X, 9359, 15786, 8962, 9348, 15202, X, X,
+    9351, X, 9355, 9357, 9354, 9353, 19739, 9347, 15789, 9344, 9360, X, X, X,
+    X, X, X, X, 9695, 9696, 16399, 9705, 9702, 12250, 12242, 12263, 12279,
+    6783, 12252, 12270, X, 12244, 12277, 12278, 12281, 12272, 12257, 12265,
+    6789, 6776, 6784, 6796, 6773, 6775, X, X, 19459, 12249, 6793, 6786, 12275,
+    12246, 6795, 6790, 12255, 18324, X, 18320, 18322, 10651, X, X, X, 18500,
+    18501, 10730, 18499, X, X, X, 18654, 10785, 18652, 18653, 18757, X, X,
+    10855, 18828, 18826, 18827, 18829, X, X, 19502, 18929, X, 15500, 16076,
+    16666, 16668, 16667, X, 10121, 17136, 17515, 18907, 5939, X, 12035, 12036,
+    12034, 12033, 6574, X, 12474, 12472, X, X, 12471, X, 6949, 6951, 6950,
+    12473, X, X, X, 19765, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19509, X, X, X, X, 19473, 7681, X, 13913,
+    13935, 13924, 8123, 19751, 8118, 13907, 8119, 13923, X, 13916, 13929, 8115,
+    13889, 13931, 8105, 13897, 8108, 8107, X, 8124, X, 13891, 13925, 13926,
+    8110, 8560, X, X, 15270, 15271, 9386, 9387, 16459, 16458, 17405, 18655,
+    5637, 11336, 5746, X, 6126, 11626, X, 6801, 8562, 5638, X, 12286, 6802,
+    12287, X, 10006, 5639, 19517, X, 11913, X, 12975, 12961, 7386, 7383, 12973,
+    X, 12976, 12962, 7384, 7381, X, X, X, X, 7862, 13569, 7861, X, 13572,
+    13575, 7858, 7856, 13564, 13573, 13571, 13568, 13576, 13577, 13579, 13580,
+    13563, 18372, 10670, 10669, 10668, 18373, 18543, 18541, X, 18540, 18369,
+    18542, 18375, 18539, X, 18677, 18643, 18675, 10797, 18676, 18678, X, 18776,
+    10828, 18775, 18774, 10829, X, 10859, 18886, 18909, 18908, 18910, 14250,
+    8320, X, X, 14253, 14254, 8324, X, 14256, X, 14258, X, 14259, 14247, 14246,
+    14260, 8323, 14257, 14255, X, 8321, 8317, 8328, 14251, 14252, 14249, X,
+    8322, X, X, 8318, X, 19746, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 19233, X, X, X, X, X, X, X, X, X, X, 13954, 8164, X, X, X, 14634,
+    14633, 14607, 8569, X, 14632, 14610, 14611, X, 8579, 14641, 8574, 14631, X,
+    14604, 8580, 8570, 14619, 14609, 17415, 17410, X, X, 16476, 17411, 10253,
+    17407, X, 10250, 17420, 10251, 17408, 17409, 17413, 10256, X, 10255, X, X,
+    17412, 10418, 17772, 17778, 10419, 17769, 10416, 10413, 17780, 10417, X,
+    10414, 10031, 16984, 16990, X, 16988, 10027, 10026, 10023, 16986, X, X, X,
+    10029, 10028, 10025, X, 16989, 16985, 16987, X, 10030, X, X, X, 10260,
+    17423, X, 10257, 10258, 17425, 10259, 17422, 6849, X, 12348, 12359, X,
+    12350, 12360, 12357, 12349, 19655, 6845, 12362, 12347, 6848, 19271, 19651,
+    X, X, 12799, 12790, 12801, 19101, 12793, 12804, 12805, 12791, 12803, 12800,
+    12798, 12802, 7253, X, 6954, 13601, 8313, X, 14910, 10315, X, 17885, X, X,
+    6188, X, X, X, 7873, X, X, X, 7872, X, 14240, 8314, 14242, 14241, X, X,
+    14911, 8745, 15546, 15549, 15548, 17892, 10471, 17899, X, X, 18384, 10478,
+    17553, 17890, 10474, 17891, 17896, X, X, 10476, 10477, 17889, 17898, 17900,
+    17893, 17895, 17897, 17894, 17901, 10473, 10479, 10475, X, 10472, 18165, X,
+    10604, 14955, 8778, 14962, 14961, 8785, X, 8786, 14963, 8780, 14960, 8784,
+    14965, 14956, X, 14958, 8781, 14954, 14957, 14964, 8782, 14966, X, X, X, X,
+    X, 8783, X, 9185, 15570, 15576, 15568, 17208, X, 10162, 17207, 10160,
+    10163, 17590, 17591, 17592, 10331, X, 17593, X, 10332, 10490, 17922, 17923,
+    17921, 17920, 17924, 10489, 18178, 18176, 18177, 18179, 18175, 18180,
+    18393, X, 18394, 18392, 10682, 14312, 14311, 8364, 14315, 14305, 14314,
+    14303, 14313, 14308, 8366, X, 14987, X, 14982, 14988, 14983, 14981, 14984,
+    8809, X, 14986, X, 14985, 8810, 9201, 9200, 15589, 15592, 15584, 15588,
+    9202, 15587, 15602, 15620, 15617, 15612, 15598, 15597, 15606, 15625, 9215,
+    15628, 15604, 15608, 9595, X, X, X, X, X, 9603, 9598, 16237, 16234, 16210,
+    9593, X, 18957, X, 9592, 9599, X, X, X, 5251, 5252, 5254, 5253, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19585,
+    19164, X, X, 19571, X, X, 11497, X, 5961, X, X, 5964, 5949, 5973, 11490, X,
+    X, 11709, 5947, 5969, 5948, 5956, 5957, 11495, 11491, 5962, 5954, 11487,
+    5950, 11498, 5971, 5974, 5953, 5966, 5972, 5951, 11496, 19118, X, X, X,
+    13695, 7966, 19303, 13696, 19306, X, X, 19119, 15078, 8883, 19120, X, X, X,
+    9269, X, 17725, X, 10936, X, X, 11328, X, 5692, X, X, X, X, 19648, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19492, X, X, X, X, X, X, 19273, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19386, X, X, X, X, X, X, X, 5111, 5110,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19588, 19592, X, X, X, 19581, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 19584, 19590, 19591, X, X, X, X, X, X, X, 19688, 19530, 19291, X, X,
-    X, X, X, X, X, X, X, X, 19529, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19379, X, X, X, X, X, X, X, X, X, X, X, X, X, 19390, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19327, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19647, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19750, X, X, X, X, X, X, X, X, X, X, X, X, X, 19780, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 5172, 5170, 5173, 5171, X, X, 5174,
-    5175, 5177, 5176, X, X, X, X, X, X, 19277, 11562, X, 11557, 11559, 11561,
-    11558, 6064, 11555, X, 11556, 6061, 6062, 11560, 11563, 6063, 11564, X, X,
-    X, X, X, X, 19612, 11815, X, 11809, 18063, 18064, X, 5620, X, 5732, X, X,
-    X, 11363, X, X, 6078, 6080, X, 11432, 11579, 11578, 11577, X, 11431, 11430,
-    5875, 6079, 6077, 5874, X, X, X, 6371, 11831, 19426, 6090, 11604, X, 11594,
-    6087, X, 6106, 11599, 11605, 6092, 6094, X, 11595, X, 11596, 11597, X,
-    6105, 6099, 6104, 11598, 6103, 6089, 6088, 6101, X, X, X, X, X, X, X,
+    19409, X, X, X, X, X, X, X, X, 18997, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19370, X, X, X, X, X, X, X, X, X,
+    19274, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    7943, X, X, X, 10629, 18472, X, 10849, 10850, X, 7944, 18047, 18048, 18632,
+    18744, X, X, 18819, 18878, 18927, 18954, 9252, 10219, 17719, 18049, 18481,
+    18745, X, X, 9645, X, 17353, 17720, 18050, 18051, 18052, 18304, X, 18300,
+    10716, 18303, 18302, 10633, 5131, 5132, 5148, 5149, 5150, 5151, 5152, X,
+    5183, 5193, 5194, 5195, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 19302, X, X, X, X, X, X, X, X, X, X, X, X, 11301, X, X, X, X, X,
+    X, X, 11299, X, X, X, X, X, X, X, X, X, X, X, X, 11205, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19359, X, X, X, X, X, X, X, X, X, X,
+    X, X, 19134, 19094, X, X, X, 19586, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, 5202, 5203, X, X, X, X, X, X, X, X, X, X, X, X, 5197, 5198, 5199, X,
+    12584, 7072, 7075, X, X, 12575, 12581, X, X, X, 7074, 12570, X, 6672,
+    13119, 12582, X, 12573, X, 7073, 12572, X, X, X, X, X, X, 13110, X, X,
+    7517, 19362, X, 13746, X, X, 13751, 13749, 8012, X, 13761, X, 19236, 13752,
+    X, 13754, 13742, 14439, 14437, 8480, 8478, 14447, 14438, 14448, 14444,
+    14436, 14450, 14435, 14442, 8477, 8476, 8475, 14440, 15138, 15142, 15137,
+    X, 8935, X, 15140, 8936, 15146, 15145, 15144, 19280, X, 15149, X, X, X, X,
+    15737, 15739, 9306, 15740, X, 15735, X, 15734, 15744, X, 15742, 9305,
+    15745, 15736, 12193, 12623, 12194, 6734, 12197, 12187, 6733, 12189, X,
+    12190, 19102, X, 12192, 6729, X, X, 7130, X, 18960, 12188, 12184, 7131, X,
+    X, 12198, 7127, 12621, 12191, X, 12620, 12186, 12195, 6090, 11604, X,
+    11594, 6087, X, 6106, 11599, 11605, 6092, 6094, X, 11595, X, 11596, 11597,
+    X, 6105, 6099, 6104, 11598, 6103, 6089, 6088, 6101, X, X, X, X, X, X, X,
     19183, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
     X, X, 19282, X, X, X, X, X, 19440, X, X, 19487, X, X, X, X, X, X, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19258, X, X,
     8547, 14701, X, X, 8554, X, X, X, X, X, X, 15239, 15237, X, 15259, 15235,
     X, 15253, 8539, 8980, 15231, 15258, 19486, 15236, 15250, 8985, 8978, X,
-    15256, X, 15500, 16076, 16666, 16668, 16667, X, 10121, 17136, 17515, 18907,
-    5939, X, 12035, 12036, 12034, 12033, 6574, X, 12474, 12472, X, X, 12471, X,
-    6949, 6951, 6950, 12473, X, X, X, 19645, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19009, X, X, X, X, 7128,
-    6738, 7129, 12199, 12622, 6731, 7133, 6737, 6736, 6735, 7132, 12200, 7134,
-    6730, X, 12185, X, X, X, X, X, X, X, X, X, X, X, X, 7590, 7638, 13253,
-    13229, 7627, 7631, 13252, X, 13239, 7632, 7626, 13228, 19385, 8063, 13255,
-    13237, 7637, 13240, 13254, 7636, X, 13834, X, 7617, 13235, 7622, 7633, X,
-    7628, 13244, 13234, 13232, 13250, 16411, X, X, X, 9710, X, 9707, 9711,
-    16409, 9708, 16412, 16413, 16418, 19170, X, 16414, X, X, 16943, X, X, X,
-    9992, X, 17392, 9991, 17390, 17391, 10237, 10408, 17752, X, 14175, X, 8275,
-    8295, X, 14190, 8297, X, 14186, 8286, 8280, 8288, 8277, 8294, X, 14169,
-    14189, 14164, 14198, X, X, 19041, X, X, X, X, 14206, X, X, X, X, 19184, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19349, X, X, X,
-    X, X, X, 12772, 12773, 12774, 7238, X, 7234, 12763, 19598, 12771, 12776,
-    7239, X, 12761, 12767, 12760, 12770, 19599, 19600, 12766, 7235, 7237,
-    12775, X, 12759, 12762, 12768, 19601, 12782, 12789, X, X, X, X, X, 13379,
-    13383, X, 13382, 14019, 14030, X, X, 13385, X, 13380, 14018, 7745, X, X,
-    7744, 13378, 13381, 7746, X, 7743, 7742, 13377, 13386, X, 6954, 13601,
-    8313, X, 14910, 10315, X, 17885, X, X, 6188, X, X, X, 7873, X, X, X, 7872,
-    X, 14240, 8314, 14242, 14241, X, X, 14911, 8745, 15546, 15549, 15548,
-    18163, X, X, 18167, X, 18168, 10602, 18169, 18166, X, 18164, 10605, 10601,
-    18170, X, 10603, 10600, X, X, X, 10675, X, X, 10676, 18383, 18382, 18385,
-    18386, X, 10677, 18548, 18553, 16159, 9566, 9562, 16160, 16162, 16161,
-    16169, 16170, X, 9564, X, 9559, X, X, 16163, X, 16742, 9862, X, 16733,
-    9863, 9866, 16738, X, 16735, 9865, X, X, 16739, 16740, 16734, 16743, 7419,
-    7416, 13012, 7422, 13015, 7424, 7417, X, X, X, X, 13631, 13634, 7898, X,
-    7908, 7904, 13632, X, X, 7912, 7905, 7910, 7900, X, 7897, 7899, 7911,
-    13633, 7903, 7906, 7902, 17219, 17217, 17213, 10172, X, 17599, X, 17600,
-    17598, X, 17602, 10336, 10337, 17929, 10495, 17601, 17928, 10494, 18186,
-    18187, 10612, 18185, X, 18184, X, 18398, 10684, X, 18692, 18785, 18784, X,
-    5381, 5382, X, 5383, 5384, 5385, 5386, 5387, 5388, 5389, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19166, X, X, X, X, X, X, X,
-    X, X, X, 6993, 14362, X, X, 15042, 15649, 15650, 9235, X, 9236, 16263,
-    9617, X, X, 10202, X, 17657, X, 10369, 17973, 10521, 17972, 17974, 17971,
-    15652, X, 15651, 9237, X, 9238, X, 15653, 16264, 9240, 9618, X, 9239, X, X,
-    X, 9919, 16266, 9620, 9619, 16267, 16270, 16268, 16269, 9621, X, 9924,
-    9922, X, X, 9921, 16828, 10702, 18430, 18429, 10701, 18428, 10700, 18427,
-    X, 18587, 18589, 18588, X, 18585, 10765, 18582, 18586, 18591, X, 18590,
-    18583, 18584, 10764, 18701, 10809, X, 18702, 10807, 10808, X, X, 18796,
-    10843, 17322, 17317, 17321, X, 17319, 17318, 17316, X, 17313, X, 10208,
-    10207, X, 10209, 10206, 17323, X, X, X, X, X, 17686, 17689, X, 17687,
-    17691, X, X, X, 17692, X, 17684, 16866, X, 16872, 9935, X, 16864, 9936, X,
-    9937, 16869, X, X, X, 17341, 17328, 17329, 17332, 17330, X, 17324, 19060,
-    X, 17327, 17337, 17331, X, X, 10210, X, 17339, 17336, 10211, 18811, 18812,
-    18805, 18808, 18816, 18810, 18809, 18807, X, 18813, X, 18869, X, 18870, X,
-    18872, 18871, 18874, 18873, 18900, 18899, 18925, X, 18926, X, 18939, 10889,
-    10893, X, 18949, 10894, X, 19313, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19034, 19380, X, X, X,
+    15256, X, 17845, 17861, 17854, 10459, 10460, 17858, X, 17846, 10455, 10457,
+    17841, 17849, 17843, X, 17859, 17857, 17842, 17850, X, X, X, 18147, 10461,
+    17851, 10588, 10590, 10587, X, 18152, 18144, 18142, 9509, 16087, 16106,
+    16078, 16079, 16102, 9510, 16107, 9512, 16108, 16092, 15504, 16098, 16091,
+    16100, 16097, X, X, X, 16082, 9507, 16105, 9508, 16080, 9511, 16678, 16099,
+    16104, X, 19055, X, X, 19310, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19766, X, X, X, 8468, 14429,
+    14417, 14426, X, X, 14416, X, X, 8464, X, 8466, X, 14421, X, 14430, X, X,
+    15101, 8902, 15107, X, X, 8907, 15103, 15110, 15095, 8909, 8903, 15100,
+    15125, 8916, 15124, 8922, X, 15117, 8917, X, 15131, 8918, 15119, 15122,
+    15127, 15121, 15116, X, X, X, X, 15123, 15721, 9296, 15724, 15723, 15726,
+    15728, 18962, 9294, X, 15722, X, 15720, 15741, 15743, 15738, X, X, X, X,
+    16361, 16366, 16360, 16365, X, 16358, 16368, 16364, 16369, 16363, 16359,
+    16367, X, 16370, 16362, 19335, 16919, 9968, X, 9966, X, 9965, 9967, X, X,
+    15415, X, 9083, 15410, X, 9082, 15400, X, 15402, 9075, 15407, 15406, 15409,
+    9080, 15404, 15403, X, X, 9079, 9074, 15405, 9077, 15411, 15413, X, 15408,
+    15401, 9078, X, X, 19357, X, X, X, X, X, X, X, X, X, X, 19663, X, 19358, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19132, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, 19578, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19321, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 18991, 18990,
+    18972, 18981, 18963, 18974, 18983, 18965, 18978, 18987, 18969, 18980,
+    18989, 18971, 18975, 18984, 9254, 19036, 9258, 15676, 9253, 9261, 15679,
+    15680, 9259, 9260, 15686, 15683, 15684, X, 19038, X, 9649, 16321, 9646,
+    16318, 9648, 9650, X, 16319, 9647, X, 16320, X, 16317, X, X, 9945, 12564,
+    7061, 12546, X, 12551, 7054, 7065, 12549, 7049, 7059, 7064, 12556, X, 7060,
+    7063, X, X, 12559, 7055, 12550, X, X, X, 12562, 12563, X, 7057, 12561,
+    7053, 7068, X, 12553, 8003, 8001, X, 13725, 7998, 13729, 19198, 13724,
+    13726, 13720, 7996, X, 13739, 13738, 13735, 7995, 7999, 8000, 12571, 13732,
+    7997, 7525, 13734, 13721, 13737, 13736, X, 13740, X, 14428, X, 13733,
+    14445, 8472, 8479, X, 14433, X, 14443, 14432, 14441, 8473, 14446, 14434,
+    8474, 14449, X, X, X, X, X, 19244, X, 15118, 8920, 8919, 8921, 15130,
+    15120, 15126, 15115, 15129, 15128, 15132, 17368, X, 17634, 17739, X, X,
+    18059, 18060, X, 10551, X, 18315, X, 10643, X, 18316, X, 18493, 10726, X,
+    10725, 18492, 10779, 19288, 18642, X, X, 10939, X, 5547, 5868, 11424,
+    12626, 12628, X, 12630, 7135, 7141, 13207, 12634, 12625, 7592, 13205, X,
+    7140, 7138, 12636, X, 13206, X, 12627, X, 7139, 12631, 7142, 12633, X, X,
+    7137, 12632, 12635, 12629, 19354, 7136, 12665, 12653, 7151, 12646, 12643,
+    12644, 7152, 12659, 12666, 7154, 12650, 12649, 7162, 7161, 7147, 7153,
+    7156, 12662, X, X, 12656, 7150, 12641, 12664, 12655, 12657, 12661, X, X, X,
+    X, X, 19602, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 19653, X, X, X, X, X, 19269, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19618, X, X, X, X, X,
+    19432, 19433, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 19250, X, X, X, X, X, X, X, 11274, X, 11275, X, X, 11276,
+    X, 11277, X, 11278, X, X, X, X, X, X, X, 11279, X, X, X, X, X, 11280, X,
+    11281, X, 7051, X, 12566, 12554, 12558, 7056, 7067, 12555, 7062, 12560,
+    12567, 13094, X, 12565, 7069, 7050, 12557, 12548, X, 7058, X, X, 12547, X,
+    X, 12552, X, X, X, X, X, 19709, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, 19117, X, X, X, X, 15992, X, X, X,
+    X, 9798, 9803, 9796, 16603, 16594, 16606, 16598, 16604, 9804, 9797, 16591,
+    16597, 16607, 16600, 16605, 16593, X, X, 16601, 9799, 16599, 9802, 9801,
+    16595, 12427, 6918, X, 12433, 6922, 6913, 12441, X, X, X, X, X, X, 7342, X,
+    7351, 7340, 7338, 12916, 7346, 7343, 12918, X, X, 7345, 12917, 12915,
+    12920, 7350, 7348, 14138, X, 18418, X, 18576, X, 18795, X, X, X, X, X, X,
+    X, 6990, X, X, 16822, 17274, X, 6991, X, X, 9232, X, 16823, 10363, 17653,
+    10517, X, 18224, 18225, 10696, 18226, X, 18227, 18228, 18419, 10698, X,
+    10697, X, 18578, 18577, 10762, 19039, X, X, 10805, 10842, 10865, 18864,
+    18916, 18917, X, X, X, X, X, X, X, X, X, X, X, 11303, X, X, X, X, X, X, X,
+    X, X, X, 11298, X, X, X, X, X, X, X, X, X, X, 19292, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19196, X, X, X, X, X, X, X, X,
+    X, X, X, 19493, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 19634, X, X, X, X, X, X, X, X, X, X, 19547, 19419, X, 19006, X, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19731, 19466, 19541, X, X, X, X, 19230, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19346, X, X, X, X, X, X, X,
-    X, 6220, X, X, X, X, 5519, X, 5561, 11320, X, 5562, 11339, 5945, 11697, X,
-    X, 10926, X, 5520, 5563, X, 5656, 11340, X, X, 10927, 12076, 6638, 12077,
-    6637, X, 19082, X, 6635, X, 6636, X, X, X, 12542, X, X, 19252, X, 7480,
-    13077, X, 7483, 13076, 7667, 7482, 7481, X, 7964, X, 7963, 7962, 8433,
-    5838, 11404, X, X, 6023, 11532, X, 11531, X, X, 6021, 6024, X, 19182,
-    11530, 19181, 6022, 19177, X, X, X, X, X, 11760, X, 11761, 6300, X, X, X,
-    X, 6666, 7535, 7531, 13170, 13154, 13157, X, 7539, 13167, 13159, 7532,
-    7540, X, 13164, 13162, X, X, 13147, 13168, 13156, 13151, X, 13141, 13169,
-    13153, 13140, X, 7538, 13158, 13171, 13155, 13143, 13148, 13801, 13781,
+    19735, X, X, X, 7947, 13681, X, X, X, X, X, X, X, X, 8425, 8419, 14372,
+    8428, 14378, 14381, 8421, 8422, 14375, 8420, 14384, 8426, 14385, X, 14380,
+    8427, X, 14369, 8424, 14370, 12097, 12085, 12100, X, 19148, 12087, 6650,
+    6664, 6646, 6663, 6655, 6660, 6644, 12086, 12092, 6659, 12104, 6661, X,
+    6651, X, X, 12094, 12091, 6649, X, 12084, 6662, 12099, 6654, 12101, 6665,
+    13112, 13131, 7524, 19195, 13137, 7518, 7520, 13120, 13115, 7076, 7519,
+    13117, 13132, 13136, 13127, X, 13129, X, X, X, 13107, X, X, X, X, 13722, X,
+    13731, 13730, 8002, 13723, X, 14596, 14594, 14593, X, 14592, 14591, 8558,
+    14595, 8997, 15264, 15266, 8998, 15265, 9384, X, 9383, 15842, X, X, 16453,
+    16452, 16454, X, X, 9728, X, 16967, 10004, X, 17404, 10247, 12740, 12727,
+    12730, 12723, 12724, 7232, 7217, 12739, 12748, 7227, 7213, X, 7222, 12731,
+    7224, 12732, 12742, 19231, X, X, 7226, 12757, 12725, 7219, 7218, 7230,
+    12722, 12755, 12743, 12756, 12750, 12736, 15297, 15851, X, 15304, 19574, X,
+    X, X, X, X, X, X, X, X, 15283, 15861, 15871, 9391, 15870, 15882, 9393,
+    15868, X, 15872, 9404, X, 15863, 9396, 19575, 15875, 16470, 9408, 13367, X,
+    13371, X, 13360, X, 13365, X, X, 7735, 7736, 13370, 13358, 13354, 13372, X,
+    13362, X, X, 13366, X, X, X, 13356, X, 8172, 8173, 14010, 8179, X, 13998,
+    14007, 12782, 12789, X, X, X, X, X, 13379, 13383, X, 13382, 14019, 14030,
+    X, X, 13385, X, 13380, 14018, 7745, X, X, 7744, 13378, 13381, 7746, X,
+    7743, 7742, 13377, 13386, X, 17166, 17169, X, 10134, X, 17543, X, X, 17546,
+    X, 17540, 17542, X, X, 17541, 17544, 17545, 17167, 17539, X, X, 10469,
+    17879, 17882, 17884, 17877, 17878, 17881, 17883, 10470, 10468, 9845, 9850,
+    9851, X, 10145, 17179, 17188, 17185, 17187, X, 10142, 17180, X, 17186,
+    10138, 17182, 10146, 17178, 17183, 17190, 16710, 17184, 17177, 10139,
+    17176, 10140, 17191, 10141, 17189, 10144, 17175, X, 19616, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19734, X, X, 11507, X, X, 5982, 5981, 19076, X, 5985, 5983, 5984, X, X, X,
+    6262, X, 6261, 11732, 11729, 11730, X, 11728, 6263, 6259, 6258, X, 6260,
+    6257, 19077, X, X, X, 9190, X, X, 9872, X, 9871, X, X, X, X, 10491, 10579,
+    10683, 6201, 7415, 8793, X, 17925, 10949, X, X, 19762, X, X, X, X, X, X,
+    11686, 17926, 18183, X, 18182, 18396, 18397, 18395, 18564, 10754, 6212,
+    6980, 6979, 7432, 7431, 13031, 13032, 13030, X, 7430, 13649, X, 13650,
+    13646, 7916, 13647, X, 13648, X, X, X, X, 14318, 16229, 16235, X, X, 9596,
+    X, 16225, 16231, 16221, 16215, 9594, X, X, X, 15613, 16219, 9602, 16212, X,
+    X, X, X, X, 16788, 9883, 16787, 16784, 16803, 9887, X, 16800, 16792, 17949,
+    X, 17933, 10499, 17947, X, X, 17931, 10500, X, 17942, X, 17938, 10505,
+    17948, 17932, 17935, 10497, 17950, 19211, 17943, 17946, 10503, 10508,
+    10506, 17939, 17934, X, 10501, 10502, 17930, 10498, 18410, X, 19625, 19628,
+    10755, 18571, 18574, 18570, 18572, 18573, 18567, 18568, 18565, X, X, 18569,
+    18566, 10756, 10757, X, X, 18694, X, 18696, X, X, X, X, X, 18695, 18697, X,
+    5157, X, X, 5179, X, 5178, X, X, X, 5154, 5155, 5162, X, X, 5163, X, X, X,
+    X, X, 5165, 5164, X, X, X, X, X, X, X, X, X, X, 19343, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19333, X, X, X, X, X, X, X, X, X, 15079, X, 9276, 15707, X,
+    15704, X, 9270, 9282, 9283, X, 9273, 15702, 9275, 15694, 9281, 19169,
+    15706, 9272, 15708, 9271, X, 15703, 15705, 9274, 11543, 11550, 11546, 6041,
+    6045, 6048, 11541, 11549, 6039, X, X, X, X, X, 6319, 6327, X, 11790, 11783,
+    6328, 11794, 11779, 11786, X, X, 6318, 11780, 6316, 11787, 11791, 6315, X,
+    17421, 17785, 17424, X, 17786, 10420, 17784, X, X, 17783, X, 17782, 10421,
+    19624, X, 10563, X, X, 18097, 18098, 19626, X, X, X, 18334, 18333, 10655,
+    X, 18332, 18507, 18508, 7251, X, X, 12796, 19677, 12792, X, 12795, 12806,
+    12797, 7252, 12355, X, 7248, 7250, 19003, X, X, X, X, 13401, 13390, 13388,
+    19665, 13389, X, 13396, X, 13397, 13393, 7752, 13398, 12818, 12815, 7267,
+    X, 12817, 7260, X, 7261, X, X, 7767, 13408, 13409, 7768, 13405, 13407,
+    13411, 13410, 13406, X, 7764, 7765, X, 14057, 8207, 8206, 14051, 8204, X,
+    14054, 8208, 14055, 14743, 18956, X, 14740, 14735, 14737, 14738, 14731, X,
+    8648, X, X, 8647, X, 8643, 14734, X, 8650, X, 8651, 14733, 14736, 14744,
+    8645, 8646, 14742, 14732, X, X, X, 15373, 9059, 8665, X, 14761, 14760, X,
+    X, X, X, 15396, 9070, 9069, 15397, 15398, X, 9453, 9452, X, 16568, 15970,
+    15972, 15971, 16567, 16565, 16569, 16566, X, 9785, X, X, X, 17041, 10059,
+    10740, X, X, 10789, 10788, 10790, 18665, 18664, X, 18836, 18769, 18837,
+    10857, X, 10858, 18885, X, X, 10895, 5915, X, 12002, X, X, 12408, 12409,
+    12407, X, X, 6896, X, 12410, 15426, 15425, 15422, X, 15430, 15427, 15431,
+    9104, X, 15443, 9093, 15432, 15433, X, 15429, X, X, X, 9103, X, X, X, X,
+    15990, 9468, 9477, 9473, 15987, X, 9470, 9474, 15999, 10584, 5920, X, 5921,
+    6907, 6543, 7331, 12420, X, X, X, 8258, 5922, 6909, 12421, 12422, 6908,
+    6910, 5923, X, 12423, 7333, 12912, 7335, 7332, 7334, X, 13503, 7819, X,
+    13502, 13501, 14826, X, 14827, X, 14825, 14828, X, 8702, X, 14824, X, 9125,
+    X, X, 16024, 16020, 16023, 16025, 16022, 16021, X, 16632, 16633, 16634,
+    9816, 9817, 17099, 17098, 17100, X, 17492, 17491, 14838, X, 14863, 14855,
+    14880, 14858, 8719, 14875, X, 8710, X, 14861, 14869, 14842, 14868, X,
+    14885, 14837, 14870, X, 14883, X, 14831, 8285, X, 14845, 14844, 8712, X,
+    14848, 14850, 14865, 17495, X, 17497, 17496, 17502, 17507, 17494, 17501,
+    17506, 10306, X, 17504, X, 10304, 17505, 10302, 10305, 17856, 17510, X, X,
+    10458, X, 17848, 17852, 17844, 17847, X, 17855, 10456, 17860, 17853, 15505,
+    15513, 15525, 15511, X, X, 15515, X, X, X, X, X, 9515, 14893, 16094, 16103,
+    16093, 16089, 16086, 9516, 16084, 9149, 16077, 9514, 16083, 9513, 16088,
+    16085, 16101, 16096, 16090, 16095, 14231, 8310, 8311, X, X, X, X, X, X,
+    14239, 8742, 14902, 14908, 14903, 14904, 18958, 14909, X, 8744, X, 8736,
+    8743, 14901, 14228, 8739, 8737, 14907, 14906, 8738, 8740, 14905, 8735,
+    16138, X, 9534, 16141, 9528, 16139, 16129, 9527, 16714, 9533, X, 9530, X,
+    9538, X, 16128, X, 16132, 9526, 16131, 16133, 16134, 9537, 16136, 16140,
+    16144, X, 9541, 9846, 16709, 16715, 16712, 14270, 8345, X, X, 14269, 8344,
+    X, X, X, 14271, 8343, X, 14946, 14949, 14947, 14948, 14952, 14945, 14953,
+    14950, 14951, 9184, 15565, X, X, 9183, X, 16158, 16156, X, X, 9557, 13628,
+    13629, X, X, X, 14290, 14288, 14292, 14293, 14299, X, 14295, 14297, X,
+    14289, 14284, X, 14296, X, X, 14298, 14291, 14294, 14285, 8355, 14287,
+    14286, 8354, 8356, X, 8790, 14968, 10170, 10168, 10169, 10334, 10167,
+    17209, 16755, 10333, 10335, X, 10492, 10493, X, 18181, X, 10800, 10799,
+    6207, X, X, 11482, 7426, X, 11479, 11480, 11478, X, 11481, X, X, 11690,
+    11687, 14329, 14321, 14336, 14324, 14334, 14341, 14333, 8378, X, 8374,
+    14322, X, 14328, 8376, X, 14327, 8377, 8379, 14330, X, 8371, 8372, 14342,
+    14340, X, 14339, 14325, X, 14337, X, 8375, X, 5381, 5382, X, 5383, 5384,
+    5385, 5386, 5387, 5388, 5389, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19166, X, X, X, X, X, X, X, X, X, X, 6993, 14362, X,
+    X, 15042, 15649, 15650, 9235, X, 9236, 16263, 9617, X, X, 10202, X, 17657,
+    X, 10369, 17973, 10521, 17972, 17974, 17971, 15652, X, 15651, 9237, X,
+    9238, X, 15653, 16264, 9240, 9618, X, 9239, X, X, X, 9919, 16266, 9620,
+    9619, 16267, 16270, 16268, 16269, 9621, X, 9924, 9922, X, X, 9921, 16828,
+    10702, 18430, 18429, 10701, 18428, 10700, 18427, X, 18587, 18589, 18588, X,
+    18585, 10765, 18582, 18586, 18591, X, 18590, 18583, 18584, 10764, 18701,
+    10809, X, 18702, 10807, 10808, X, X, 18796, 10843, 17322, 17317, 17321, X,
+    17319, 17318, 17316, X, 17313, X, 10208, 10207, X, 10209, 10206, 17323, X,
+    X, X, X, X, 17686, 17689, X, 17687, 17691, X, X, X, 17692, X, 17684, 16866,
+    X, 16872, 9935, X, 16864, 9936, X, 9937, 16869, X, X, X, 17341, 17328,
+    17329, 17332, 17330, X, 17324, 19060, X, 17327, 17337, 17331, X, X, 10210,
+    X, 17339, 17336, 10211, 18811, 18812, 18805, 18808, 18816, 18810, 18809,
+    18807, X, 18813, X, 18869, X, 18870, X, 18872, 18871, 18874, 18873, 18900,
+    18899, 18925, X, 18926, X, 18939, 10889, 10893, X, 18949, 10894, X, 5417,
+    5418, 5419, 5420, 5421, 5422, 5423, 5424, 5425, 5426, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19721, X, X, X, X, X, X, X, X,
+    X, X, 19232, 19423, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19168, X, X, X, X, X, X, X, X, X, X, X, 19338, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19587, X, X, 19373, X, X,
+    X, X, X, X, X, X, 8526, X, X, 14504, 14523, 14528, 14516, 8522, 14533,
+    8519, 14502, X, 14503, 8512, 8521, 14510, 8524, 8525, 14511, X, 14524,
+    14530, 8520, X, 8514, 14509, 16411, X, X, X, 9710, X, 9707, 9711, 16409,
+    9708, 16412, 16413, 16418, 19170, X, 16414, X, X, 16943, X, X, X, 9992, X,
+    17392, 9991, 17390, 17391, 10237, 10408, 17752, X, 13536, X, 13543, X, X,
+    7850, 13557, 13552, 7845, 7843, 13548, 13544, 13530, 7834, 13535, 13527, X,
+    7842, 7844, 13540, 13537, 7839, 13553, 7836, 13538, 13560, 13546, X, 13545,
+    7835, X, 9241, 15660, 15656, X, X, X, 15662, X, 16277, X, 16280, 16282,
+    16272, 16276, 16273, 9623, 9626, 9628, 16274, 16275, 9627, 16278, 16281,
+    16279, 9629, X, 9625, 16271, 9622, X, 9624, 18705, X, 10844, 10868, 18924,
+    7452, X, 9633, 9932, 17676, X, 18594, X, X, 18938, 13041, X, 10892, 7453,
+    16849, X, 17677, X, 17998, X, X, 18438, 18595, 7454, X, 15666, 15667,
+    18804, X, 18802, 18799, X, X, 18801, 18800, 18866, X, X, X, X, 18868,
+    18867, X, X, 18897, X, 18896, 18895, 18898, X, 10884, 10885, 18944, 18948,
+    X, X, X, X, X, 19259, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 19514, X, X, X, X, X, 19639, X, X, X, X, X, X,
+    19564, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19293,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19451, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, 10940, X, X, X, X, X, X, X, X, X, X, X, X,
+    19742, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5146, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19507, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 11209, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19330,
+    X, X, X, 19549, X, X, X, X, X, X, X, X, X, X, X, X, X, 19104, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19018, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19519, X, X, X, X, X, 19537, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, 19157, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19122, X, X, X, X, X, X, X, X, X, X, X, X, X, 5465, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19087, X, X, X, X, X, X, X, X, X, X, X, X,
+    15301, 9024, 15290, 15295, 9013, X, 15275, 9026, X, 9004, 15274, 15307,
+    9028, 15278, 15294, 19569, 15280, 15310, 15306, 9002, 9012, 18093, 18096,
+    18088, 18325, 18326, 18330, 18331, X, 18328, 18329, 18327, 19594, 10654, X,
+    X, X, X, 10732, 18506, X, X, 18503, 18504, 18505, 10733, X, 18657, 18656,
+    X, 18760, 10822, 18758, 6160, 6159, 6158, 11650, X, X, X, 6509, X, 6510,
+    11959, X, 12334, X, 12337, 6839, 12335, X, 6838, 12336, 6840, X, 12781,
+    12780, 12779, 7241, X, 13374, 13375, 7740, 13373, 13376, 14686, 8612,
+    14690, X, 14680, X, 14691, 19676, X, 19656, 14681, 14682, X, 14692, 14689,
+    14687, 14688, 14684, 14683, 19559, 14693, 8609, X, 14685, X, 8614, 8608,
+    8615, 8616, 19712, 8611, 8610, 8619, 8621, 19715, 14704, X, X, X, X, 15350,
+    9050, 15354, 9049, 15351, 9048, X, 14703, 14710, 15353, X, 9051, 15355,
+    15352, 15349, X, X, 15936, 15940, 15942, 15938, 15937, 15935, 9425, 15375,
+    14739, 15377, 9063, 15378, 15374, X, 9060, 15370, 9062, 15367, 15372,
+    15376, 15369, X, 19752, 8644, 19760, 15366, 9061, 15368, X, X, X, X, X,
+    9440, 15952, 9444, X, 9442, X, 8808, 8797, X, 14978, X, X, 8802, X, 14979,
+    8795, 8794, X, 8805, 8804, 8803, 8801, 8806, 14976, 8796, 8798, 8800, X, X,
+    9192, 9195, X, 9199, 9193, 9198, 9196, X, 19556, X, X, X, X, X, X, X, X, X,
+    19764, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19444,
+    X, X, X, X, X, X, X, X, X, X, X, X, 6479, 6495, 11922, 6486, X, 11943,
+    6471, X, 6474, 11934, X, 11920, 11924, 6482, 6484, 11927, 6491, 6477, 6475,
+    6476, 6490, 14612, 14636, 8564, 14643, 14635, 8573, 14624, 8584, X, X,
+    8583, 8577, X, X, 14642, 8565, 14622, 14613, 14626, 14638, 8585, 19508,
+    8567, 14621, X, 14614, 8576, X, 8575, 14617, 14627, 14637, 17771, 17774,
+    17775, 17776, 17779, X, 17417, 17770, 10415, 17777, 17781, 17773, X, X, X,
+    18084, 10561, 18087, 10562, 18095, 18086, 18083, X, 18085, 18089, 18092,
+    18091, 18094, 18082, X, 10560, 18090, 19633, 12331, 12778, X, 15328, X,
+    10033, 5646, 6508, 12332, 12333, 14011, 8180, X, X, 14667, X, X, 8602,
+    15329, X, 19636, 9413, 19637, 10422, 5647, 14012, 5648, X, 5912, 11463,
+    5911, 14044, 14037, 8190, 14041, 14040, 8191, 8197, X, 8198, 14043, 8188,
+    14034, 14032, 14038, 14031, 8195, 14033, 14039, 14045, 8189, 8194, 8192,
+    8193, X, X, 19669, 8187, X, X, X, X, 8613, 8209, 14052, 8203, 8205, 14056,
+    X, 14053, 14050, X, X, X, X, X, 14713, X, 14702, 8620, 8623, 8622, 8627,
+    8626, 14714, 14712, 14705, 14709, 14708, 8624, 14711, 14707, 14715, 14706,
+    8625, 16560, 16556, 16557, 16554, X, 16551, X, 9778, 9775, 16550, 16552, X,
+    9777, 16558, X, 10054, X, 19176, 17028, 17023, 10053, X, X, 10051, X,
+    17030, 10052, 17026, 17027, 17024, 17031, 17449, 7937, X, X, 8230, 14096,
+    8229, 14095, X, X, X, X, 14763, X, 9071, 15399, 9072, X, X, X, X, X, X,
+    10573, 18122, X, 5914, 6538, 12001, X, 6895, X, 6894, 10066, X, 10069, X,
+    X, X, X, 10286, 17065, X, 17817, X, 17816, X, 18128, 10577, 10578, 18527,
+    18344, X, 18526, X, 18838, 18906, 5916, X, X, 6175, X, 12003, 6539, X,
+    9218, X, 9221, 9223, 9222, X, X, 9219, 9220, X, 16240, 16239, 9604, 16241,
+    X, 16242, 9605, X, X, X, 16812, 16810, 17258, X, 16808, 16809, 9897, 16805,
+    16813, 16807, 16811, 18218, 10617, 10692, 18414, 18413, 18412, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 11202,
+    11203, X, X, X, X, X, X, 13227, X, 7621, 7641, 7640, X, 7629, 19391, 13245,
+    13241, 13238, 13256, 7624, 7616, X, X, 13243, 8077, 7620, 13251, X, 7642,
+    7639, 13247, 13230, X, X, 12430, 6915, 6916, 12432, X, 12426, 12429, 12438,
+    12436, X, 6917, 12442, 6920, 12439, 12431, 12428, X, X, 14139, 12437, 6912,
+    12440, 12425, 12434, 6914, 6919, 12435, 6923, 6921, X, 10761, X, 10760,
+    18698, 18699, 10841, 18794, X, 10874, X, 6989, 8403, 15647, 15646, 16254,
+    16253, X, X, 10200, 17273, 17272, 17651, 17649, 17652, 17650, X, X, 10516,
+    17964, 17965, 17966, 16260, 9614, X, X, 9918, X, 16257, 16262, 16259,
+    16258, X, 9615, X, 9916, X, 16825, 9912, X, 16826, X, X, 16824, X, 9915,
+    9913, 9917, X, 9914, X, X, X, X, 13759, 13756, X, X, X, 19609, X, 13757,
+    13760, 13764, X, 13160, 13766, 14451, 19563, 8010, 13767, 13743, 13753,
+    19242, 13758, X, X, 8008, 8011, 13765, 13768, 13747, 13744, 13801, 13781,
     13794, 13779, X, 13802, 19285, 8025, X, 13796, 14459, 13782, 8022, X,
     13786, X, 8023, 13785, 13790, X, X, 13787, X, X, X, 13793, X, X, X, X,
-    14463, X, 6870, X, 12373, 12374, 12375, X, 6877, 12372, 6873, 12376, 6874,
-    X, X, X, X, 12826, 12830, 12828, 12827, X, 12831, X, X, X, 12832, 12833,
-    12825, X, 12824, 19736, 7275, 12858, X, X, X, 7299, X, 7303, 7301, X, 7304,
-    12861, 12856, 12857, 12860, 12859, X, X, X, X, X, X, X, 13445, 13446,
-    13444, X, 13443, 7785, X, X, X, X, 5191, X, 5119, X, X, X, 5192, X, X, X,
-    X, X, X, X, X, X, X, X, X, 11259, X, X, X, X, X, X, X, X, X, 19340, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19400, X, X,
-    X, X, X, X, X, X, X, 19348, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19771, X, X, X, X, X, X, X, X, 19465, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19137, X, X,
-    X, X, X, X, X, X, 19407, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19420, X, X, X, X, X, X, X, X, 11213, X, X, X, X,
-    19761, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19534, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19073, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19520, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19153, 19223, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19267, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19185, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19209, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19051, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19681, X, 19249,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 19673, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19248, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19501, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19229, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19458, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 11295, X, X, X, 11297, X, X, X, X, X, X, 11296, X, X, X,
-    X, 19528, 19187, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19155, X, X, X, X, X, X, X, 19532, 19238, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19671, X, X,
-    X, X, X, X, X, X, 19658, 19105, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, 19194, X, X, X, X, X, X, X, X, X, 5103, 10951,
-    X, X, X, X, X, X, 5120, 5205, 5137, X, X, X, X, X, 5040, X, X, X, X, X, X,
-    X, X, 16065, 16066, 16053, 16052, 16048, 9502, X, 9494, 16068, 16067,
-    14829, 16045, 16049, 16043, X, 16062, 16047, X, 16069, 16040, 16038, 16050,
-    16060, 16055, 9504, 7855, 13566, 13565, 13578, 7857, 13567, 7859, 7854,
-    13570, 7863, X, 7860, 13574, X, X, X, 8307, 14223, X, 14212, 8304, X,
-    14891, 14221, 14209, 8302, 14214, 8305, 14218, 14216, 8308, 8301, 12989,
-    7390, 7391, 12993, 19763, X, X, X, 7866, 13582, X, 7871, 13598, 7870,
-    13600, X, X, 13588, 7868, 13599, X, 13583, 7869, 13595, 13591, 13593,
-    13587, 13594, X, X, 7865, 13590, 16138, X, 9534, 16141, 9528, 16139, 16129,
-    9527, 16714, 9533, X, 9530, X, 9538, X, 16128, X, 16132, 9526, 16131,
-    16133, 16134, 9537, 16136, 16140, 16144, X, 9541, 9846, 16709, 16715,
-    16712, 16155, 16157, X, 9558, X, 16731, X, 16732, 10155, X, 17910, 17912,
-    17909, 17911, 18171, 18389, X, X, 18887, 6197, 6963, 13005, 13007, 13006,
-    X, 13620, 7894, X, 13618, X, 7893, 13621, 16182, X, X, 16183, 16179, 9577,
-    9573, X, X, 9572, 9574, X, 16178, X, 16746, 9868, X, X, 16748, 9870, 16751,
-    16747, X, 16750, 9869, 16749, X, 9867, X, X, 10161, 10164, 14312, 14311,
-    8364, 14315, X, 14314, 14303, 14313, 14308, 8366, X, 14987, X, 14982,
-    14988, 14983, 14981, 14984, 8809, X, 14986, X, 14985, 8810, 9201, 9200,
-    15589, 15592, 15584, 15588, 9202, 15587, 16208, 9597, 16220, 16206, 16207,
-    9591, 16236, 9601, 16223, 16228, 16222, 16782, 16218, 16226, 16224, 16211,
-    16205, 16232, 9600, 16233, X, 16227, X, 16216, 16214, 16209, X, 18998, X,
-    16217, 16230, 16213, 17949, X, 17933, 10499, 17947, X, X, 17931, 10500, X,
-    17942, X, 17938, 10505, 17948, 17932, 17935, 10497, 17950, 19211, 17943,
-    17946, 10503, 10508, 10506, 17939, 17934, X, 10501, 10502, 17930, 10498,
-    10802, X, 18693, 10801, 10803, X, X, X, 18788, 18789, 10837, 18787, X,
-    18859, 18858, 18860, 10864, 18861, 10863, 18862, 18890, 18893, 18892,
-    10873, 18891, X, X, 19406, 10883, 10881, 10882, 10888, 17254, X, X, 17256,
-    X, 17257, 10193, 17253, 10192, 17255, 10189, 10190, 10191, 16806, X, X,
-    10352, 17630, 17628, 17629, 10350, 10353, 10351, X, X, X, 17953, 17954,
-    10510, X, 18217, 18219, 6590, X, 6594, 12054, 6593, X, X, X, X, X, 12503,
-    6984, 6985, 6986, 12504, 12500, 6983, 12501, X, 12502, 12499, X, X, X,
-    7445, X, X, 7442, 13036, 7443, 7446, 13037, 7934, 8396, 14353, 14355, 8398,
-    8397, 8399, 8400, 14354, 8838, 8839, 8837, 9227, 8836, 15030, X, X, X,
-    9228, 16245, 16815, 9901, 10196, 17632, 17636, 10356, 17633, 10357, 10355,
-    17637, 10358, 17635, 17262, X, 17639, 17638, 10359, 17640, 17960, 10514,
-    17959, 17956, 10513, 17957, 17958, X, 18220, 18221, 10618, X, 10695, X, X,
-    18415, X, X, 10693, 10694, 18416, X, X, 10758, 10759, 18575, 10199, 17268,
-    17647, 10360, 17645, 17648, 10361, X, 17643, X, 17646, 17644, 17641, 10362,
-    17642, X, X, X, X, 17961, X, X, 17963, 17962, X, 18222, X, 18223, X, 19329,
-    X, 18417, 16260, 9614, X, X, 9918, X, 16257, 16262, 16259, 16258, X, 9615,
-    X, 9916, X, 16825, 9912, X, 16826, X, X, 16824, X, 9915, 9913, 9917, X,
-    9914, X, X, X, X, 13759, 13756, X, X, X, 19609, X, 13757, 13760, 13764, X,
-    13160, 13766, 14451, 19563, 8010, 13767, 13743, 13753, 19242, 13758, X, X,
-    8008, 8011, 13765, 13768, 13747, 13744, 15741, 15743, 15738, X, X, X, X,
-    16361, 16366, 16360, 16365, X, 16358, 16368, 16364, 16369, 16363, 16359,
-    16367, X, 16370, 16362, 19335, 16919, 9968, X, 9966, X, 9965, 9967, X, X,
-    6879, 12390, X, 12385, 12382, X, X, 12389, X, X, 6881, 6882, 12388, 12387,
-    12386, 12383, 12384, 12391, 6880, X, X, X, X, X, X, X, X, 7282, X, 7288,
-    12402, 6893, X, X, 7306, 12867, 12865, 12871, 7307, 12866, 12870, 12868,
-    12869, X, X, 13447, 13449, X, 7786, X, 13448, 7787, 8228, 8227, 8226,
-    14094, X, X, X, X, 14762, 8664, 10740, X, X, 10789, 10788, 10790, 18665,
-    18664, X, 18836, 18769, 18837, 10857, X, 10858, 18885, X, X, 10895, 5915,
-    X, 12002, X, X, 12408, 12409, 12407, X, X, 6896, X, 12410, 9464, 15991, X,
-    9472, X, X, 15994, 15989, 9471, 9475, 15988, X, 9469, X, 15998, 9466,
-    15997, 15996, 9478, 15750, 9465, X, 15995, 15986, X, 9479, 15993, 9467, X,
-    X, X, X, 5118, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19525, 19527, X, X, 11344, X, 5666, 5667, 5660, X,
-    X, 11341, 11343, X, X, X, X, X, X, 5799, 11382, 5796, 5800, 11392, 11380,
-    5797, 11384, X, X, X, 5798, X, 5801, X, 5787, 19118, X, X, X, 13695, 7966,
-    19303, 13696, 19306, X, X, 19119, 15078, 8883, 19120, X, X, X, 9269, X,
-    17725, X, 10936, X, X, 11328, X, 5692, X, X, X, X, 19648, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19492, X, X,
-    X, X, X, X, 19273, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19386, X, X, X, X, X, X, X, 5111, 5110, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19409, X, X, X,
-    X, X, X, X, X, 18997, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19370, X, X, X, X, X, X, X, X, X, 19274, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 7943, X, X, X, 10629,
-    18472, X, 10849, 10850, X, 7944, 17712, 17711, X, X, X, X, 18739, 10851, X,
-    18877, 18902, X, X, X, 8863, 16315, 16316, X, 16884, 8864, X, 10391, X, X,
-    18478, 10715, 18479, 18477, 18740, X, 18818, X, 19353, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 19638, X, X, X, X, X, X, X, X, X, X,
+    14463, X, 9052, X, 9053, 9432, 9770, 16538, 9769, X, 17013, 10043, X,
+    17446, 18106, 5770, 6169, 11988, 11987, 6527, 11986, 6528, 11989, X, 12377,
+    6872, 6871, 12379, 12378, 6876, X, 6875, X, 10147, 17567, 17902, X, 18687,
+    6192, 12998, 7405, 7883, 14935, 14934, 9542, 16146, 9543, 17192, 10322, X,
+    X, X, 10887, 6193, 12037, 12999, X, X, 7884, X, 13611, 13612, X, 14261,
+    17578, 17586, 17577, 10325, 10327, 17582, 10326, 17583, X, 17588, 17916, X,
+    10486, 17913, X, 17917, X, X, 10483, 17915, 10488, X, 10485, X, 17914, X,
+    10487, 17918, 10482, X, X, X, 19692, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19664, X, X, X, X, 7780, X,
+    13433, X, X, 13426, 13428, 13430, X, 13431, 13429, 7781, X, 13434, X,
+    13427, X, X, X, X, X, X, X, X, X, 14075, 8218, 14083, X, 10609, 10611, X,
+    18174, 10610, 18172, 10484, 18173, 10608, 10679, 10681, 18391, 10680,
+    18390, X, 18559, 10751, 18558, 10752, 18556, 18555, 18560, 18561, 18689, X,
+    18557, X, X, 18783, 18780, 18781, 7907, 13635, 7909, 7901, 13630, X, X, X,
+    X, X, X, X, X, 14300, 8358, 14302, X, 8360, 8362, X, 14301, 8359, 8363, X,
+    8361, X, X, X, 8799, 14980, 8807, 14977, 17219, 17217, 17213, 10172, X,
+    17599, X, 17600, 17598, X, 17602, 10336, 10337, 17929, 10495, 17601, 17928,
+    10494, 18186, 18187, 10612, 18185, X, 18184, X, 18398, 10684, X, 18692,
+    18785, 18784, X, 5357, 5358, X, 5359, 5360, 5361, 5362, 5363, 5364, 5365,
+    X, X, X, X, X, X, X, 5366, 5367, 5368, 5369, 5370, 5371, 5372, 5373, 5374,
+    5375, 5376, 5377, 5378, 5379, 5380, 7016, X, X, X, X, 12506, 7009, 12507,
+    19022, 7030, X, 7021, 7000, 7001, 12526, 7472, X, 7014, 7013, 12508, 7017,
+    13058, 7008, 12519, 7023, 7022, 7012, 12511, 12520, X, 12505, 7011, 11755,
+    11754, 6295, 11757, 11759, 11748, 11751, 11758, 6296, X, X, 11745, 11749,
+    19143, X, 11753, 12098, 6291, 12102, 6278, 11750, 6279, 6292, 6285, 6281,
+    X, 11746, 6284, 6289, 6298, 11747, 11740, 7521, 13126, 13108, 13122, 7522,
+    13124, 19193, 13130, X, 13134, X, X, 13125, 13113, 13121, X, 13135, 13133,
+    13123, 13118, 13111, 13727, 13109, 7526, 13116, 7527, 7523, 13106, 13128,
+    13114, 19129, X, 19469, 15815, X, 15811, 15807, 15827, 15824, 9370, X, X,
+    15831, 15814, 9381, 15821, X, X, 15810, 15820, 9378, 15840, X, 15837,
+    15823, 15808, 19491, 19452, 15828, 15830, 9374, 15818, 15813, 5751, 5750,
+    6127, 11368, X, X, 11454, X, X, 19127, 11458, 11460, 11461, 5908, 5909,
+    11457, 5904, X, 11455, X, 11459, 5905, X, 5900, X, 5901, 19522, 5907,
+    11456, 5899, 6128, 5902, 13978, 13975, 13958, 8167, 13988, 13985, 13993,
+    8142, 13973, 8170, X, 13980, X, X, 8152, 8155, X, 13979, 8169, 13963,
+    13318, X, X, 13989, 13987, 13991, X, X, 19545, X, X, X, 19135, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    6200, 8357, X, X, 8792, 15585, 15591, 15586, 15583, 15590, X, 16196, 9585,
+    17594, 16193, 16194, 16192, 14304, 9584, 16197, 16191, 9583, 9586, 16195,
+    16757, 9879, 16758, 16759, X, 17211, 10171, 17595, 17596, X, X, 17597,
+    17927, 16208, 9597, 16220, 16206, 16207, 9591, 16236, 9601, 16223, 16228,
+    16222, 16782, 16218, 16226, 16224, 16211, 16205, 16232, 9600, 16233, X,
+    16227, X, 16216, 16214, 16209, X, 18998, X, 16217, 16230, 16213, 17250, X,
+    10176, 17221, X, 19703, X, X, 17616, 17609, 10340, X, 17604, 17619, 17611,
+    17235, X, 17621, 17605, X, 10339, 17615, 10341, 10349, 10347, 17617, 10348,
+    17607, X, 17608, 17613, 17618, 18191, X, X, X, X, X, X, X, 18197, 18402,
+    18407, 10691, 18409, X, 10685, X, 18405, 18411, 10690, 10686, X, 10687,
+    18401, 18408, 10689, 18406, 10688, 18400, 18404, 18403, X, 18399, 18934,
+    18935, 18933, 18943, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 19301, X, X, X, 14466, 14458, X, 14460, X,
+    14465, 14464, 8481, X, 13780, 14462, X, X, 8482, X, 14457, 14461, X, X, X,
+    X, 15143, X, 15150, 15141, X, 15148, 15139, 15147, 15151, 6725, 6383,
+    11845, 19382, 12196, 6726, 11834, 6384, 6728, 6385, 6381, 6386, 11844,
+    11833, 11848, 6378, X, 19344, 11836, 11841, 11838, 6379, X, 12182, X,
+    12183, X, X, X, X, X, X, 12972, 12969, 12967, X, X, 7380, 12970, 7385,
+    12964, 12979, X, 12981, 12965, X, 7382, 12982, 12977, 12963, 12968, 12978,
+    12974, 12971, X, 7387, 12980, 12966, X, 18448, X, 18444, 18447, 10708, X,
+    X, 18445, 18446, X, 18440, 18443, 10707, X, X, X, 10769, 18608, 18603,
+    18607, X, 18610, 18606, X, 18602, X, 10771, 18605, 18609, 10770, 18600,
+    17338, 17325, 17334, 17335, X, 17333, X, X, X, X, 17696, 17698, 17701, X,
+    X, 17695, X, 10387, 17703, 17694, 17704, X, 17700, 17702, 17706, 17699,
+    17707, 17697, 17693, 10388, X, 17705, 15055, X, 8862, 16313, X, X, 16877,
+    16878, 16876, 17343, 17342, 10212, 17709, 17344, 17708, X, X, 18043, 10536,
+    10538, 18042, X, X, 10537, X, 18291, 18293, 18292, 18473, 10713, X, 10817,
+    18301, 10635, X, 10634, 18483, 18482, 10717, 10718, X, X, 10776, 18633,
+    10775, X, 18748, 18749, 18747, 18746, 10853, X, 18820, 18821, 18822, 10852,
+    18879, 18882, 18881, 18880, X, X, 18953, X, 19353, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19638, X, X, X, X, X, X, X, X, X, X,
     19778, X, 19103, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
     X, X, 19351, X, X, X, X, X, X, X, X, X, X, X, 19483, X, X, X, X, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19319, X, X, X, X, X, X, X, X, X,
@@ -3181,544 +3300,428 @@ const BACKWARD_TABLE_LOWER: &'static [u16] = &[
     19152, X, X, X, X, X, X, X, X, X, X, X, 19110, X, X, X, X, X, X, X, X, X,
     X, X, X, X, X, X, X, X, X, X, X, 19015, X, X, X, X, X, X, X, X, X, X, X, X,
     12209, 6752, 6744, 6746, 6751, 12221, 6749, 12639, 7144, 6754, 12206,
-    12214, 6750, 12213, 12210, 12218, 12220, 6743, 6747, 6753, 7146, 15221,
-    15220, 8975, X, 19172, X, X, X, 8976, 15799, 15802, 9365, X, 19173, 9364,
-    15803, 15798, 9367, 15800, 19167, 9366, 15797, X, 15801, 9712, 9709, 16417,
-    16416, X, 16415, 16410, X, 13536, X, 13543, X, X, 7850, 13557, 13552, 7845,
-    7843, 13548, 13544, 13530, 7834, 13535, 13527, X, 7842, 7844, 13540, 13537,
-    7839, 13553, 7836, 13538, 13560, 13546, X, 13545, 7835, X, 10204, 17294,
-    17305, 17665, 17668, 17670, 17669, X, 17663, 17667, 17662, X, 17664, 10375,
-    17661, X, 17666, X, X, 17992, 17981, 10524, X, X, 10525, 17980, 17985,
-    17991, 17983, 17990, X, 11029, 11030, 11031, 11032, 11033, 11034, 11035,
-    11036, 11037, 11038, 11039, 11040, 11041, 11042, 11043, 11044, 11045,
-    11046, 11047, 11048, X, X, X, X, X, X, X, 11261, 11262, 10955, 10956, X,
-    8451, 14407, 8447, 8448, 8454, 8442, 5212, 8440, 14401, X, X, X, X, X,
-    8449, X, X, 14410, X, X, X, 8899, 8894, X, 15093, 15089, X, 15083, 8888,
-    8884, 15092, 11543, 11550, 11546, 6041, 6045, 6048, 11541, 11549, 6039, X,
-    X, X, X, X, 6319, 6327, X, 11790, 11783, 6328, 11794, 11779, 11786, X, X,
-    6318, 11780, 6316, 11787, 11791, 6315, X, 17791, 10423, 17790, 17789,
-    17787, 17788, 10656, 18099, 18509, 18832, X, 5649, X, 11371, 5753, 11372,
-    X, X, X, 11464, 11465, X, X, X, X, 11656, X, X, 11652, X, 11651, 9421,
-    15925, 19685, 9419, X, 15927, 15924, 15921, 15928, 15922, 15923, 9418, X,
-    X, X, X, 16997, X, 16523, X, 16522, 16524, X, 16994, 9760, X, 16520, X,
-    9758, X, 9762, 9761, 7276, X, 12834, 12829, X, 13423, 19737, 12835, 7277,
-    7274, X, X, X, 13417, X, 13416, X, 13418, 13419, 13421, 13420, 13425, 7776,
-    7773, 7777, 13415, 7778, 13424, 7775, 13422, 7774, X, 13622, 13619, X, X,
-    14283, 8353, 14275, 14281, X, X, 8348, 8351, 14274, 8346, 14278, 14959,
-    8350, X, 14273, X, 14279, 14276, 14282, 14272, 14280, 8349, 8352, 14277,
-    8347, X, 8779, 17208, X, 10162, 17207, 10160, 10163, 17590, 17591, 17592,
-    10331, X, 17593, X, 10332, 10490, 17922, 17923, 17921, 17920, 17924, 10489,
-    18178, 18176, 18177, 18179, 18175, 18180, 18393, X, 18394, 18392, 10682,
-    15585, 15591, 15586, 15583, 15590, X, 16196, 9585, 17594, 16193, 16194,
-    16192, 14304, 9584, 16197, 16191, 9583, 9586, 16195, 16757, 9879, 16758,
-    16759, X, 17211, 10171, 17595, 17596, X, X, 17597, 17927, 16229, 16235, X,
-    X, 9596, X, 16225, 16231, 16221, 16215, 9594, X, X, X, 15613, 16219, 9602,
-    16212, X, X, X, X, X, 16788, 9883, 16787, 16784, 16803, 9887, X, 16800,
-    16792, 18201, X, X, 10615, X, X, 18216, 18203, X, 18208, 18210, 18188,
-    18213, 18199, 18204, 18192, 18196, 18215, 18206, 18189, 18193, 18195,
-    18205, X, 10614, 18198, X, 19316, X, X, X, X, 11330, X, X, 11539, X, X, X,
-    10937, X, 11777, 12121, 12585, 7077, X, 19627, 17735, X, 10641, 5536, 5714,
-    11352, X, 5848, 5849, X, 6309, X, X, 19213, 7551, X, 8934, 15136, 9303,
-    9304, X, 15733, 9964, 17366, 17367, X, 10642, 18753, 11315, 5614, X, 5546,
-    X, 11359, 11358, X, X, X, X, 5867, 11421, 11422, 11420, X, 11423, X, 9052,
-    X, 9053, 9432, 9770, 16538, 9769, X, 17013, 10043, X, 17446, 18106, 5770,
-    6169, 11988, 11987, 6527, 11986, 6528, 11989, X, 12377, 6872, 6871, 12379,
-    12378, 6876, X, 6875, X, 8329, 8767, X, 14937, 14936, 14938, X, 15560,
-    15561, 9176, 9857, 9544, 9858, X, 17196, 17193, 17195, 17194, 10149, X,
-    17568, 17904, 17903, 11684, 7407, 7406, 13000, X, 13613, X, X, 11260, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19693, X, 12071, 12061, 6619, 6610, 6618, 12056, X, 12068, X,
-    12059, 6614, 12060, X, 12055, 6621, 6608, 6617, 6607, X, 12057, 12062, X,
-    12069, 6615, 6612, 12064, 6620, 12067, 12063, 6609, 6622, 6613, 6283,
-    11741, 11743, X, 6286, X, 6288, 11739, 11744, X, X, 6297, 6293, 11752,
-    6299, 19147, 6290, 11742, 6287, X, X, 6282, 6280, X, 11756, X, 6294, X, X,
-    X, X, X, 5204, X, X, X, X, X, X, X, X, X, 5200, X, X, 5161, 5160, X, X,
-    5196, X, X, X, X, X, X, X, X, X, X, 19603, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19749, X, X, X, X, X, X, X, X, X,
-    19622, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19435, X, X, X, X, X, X, X, X, X, X, 7160, 12652, 7158, 7159, 12642, 12658,
-    X, 7149, X, X, 13226, 12660, 12654, X, 12645, X, 12663, 12648, 7155, 13249,
-    12651, 7157, 7148, X, 14807, X, X, 15449, X, 9484, X, X, 16617, 16616, X,
-    17089, X, X, X, 18353, X, X, 5924, 11669, 12004, 6911, 12424, X, 12914, X,
-    X, X, 7336, 12913, 7337, 12012, 12026, 12032, 6569, 12029, 6566, X, 12019,
-    12025, 12027, X, 12014, 6565, 6560, 12020, 6567, 6570, 6564, X, 6557,
-    12024, 12018, 12031, 6572, 6568, 6563, 12023, 7360, 12021, 6561, 6571, X,
-    18919, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19276, X, X, 10244, 10241, X, 17393, 17397, 17401,
-    19499, X, X, 17758, 17755, 17764, X, 17763, 17761, 17756, X, 10412, X, X,
-    X, X, X, 17757, 10411, 9998, 17760, 10410, 17765, 17759, 12740, 12727,
-    12730, 12723, 12724, 7232, 7217, X, 12748, 7227, 7213, X, 7222, 12731,
-    7224, 12732, 12742, 19231, X, X, 7226, 12757, 12725, 7219, 7218, 7230,
-    12722, 12755, 12743, 12756, 12750, 12736, 10016, X, 15867, X, 9390, 15862,
-    9394, 15854, 9022, 15858, 19399, 15883, 15859, 15857, 9399, X, 15881, X,
-    15856, 15874, 15873, 15886, 15864, 9403, X, X, X, X, X, 19567, 16473,
-    19580, 15895, 15903, X, X, 15902, 15900, X, 15906, 9412, 15897, 15904, X,
-    9410, X, X, 15892, 15894, 9411, 15891, 15907, 19604, 15898, X, X, 16495,
-    9751, 19621, X, 16506, 16504, 9745, 16494, 6849, X, 12348, 12359, X, 12350,
-    12360, 12357, 12349, 19655, 6845, 12362, 12347, 6848, 19271, 19651, X, X,
-    12799, 12790, 12801, 19101, 12793, 12804, 12805, 12791, 12803, 12800,
-    12798, 12802, 7253, X, 15547, 16122, 16124, 16123, X, X, X, X, X, 9839, X,
-    10137, 17170, 17172, 17171, X, X, 10316, X, X, X, 17887, 17886, X, 18161,
-    10598, X, X, 10674, 18546, 18545, 10748, X, 18550, X, 18549, 18552, 18551,
-    X, 18686, X, 10798, 18685, 18683, X, 18684, X, X, X, 10832, 10831, 18778,
-    18779, 10833, X, 18853, 18854, 10872, X, 10878, X, 18911, 18942, 16736,
-    16741, 9864, X, 9861, 16737, X, 17206, 10158, 10156, 10159, 10157, 17205,
-    17202, 17201, X, 17204, X, X, 17203, 17589, 10329, 17580, 17579, X, 10324,
-    17585, 17584, 17576, 17587, 17581, 10328, 7907, 13635, 7909, 7901, 13630,
-    X, X, X, X, X, X, X, X, 14300, 8358, 14302, X, 8360, 8362, X, 14301, 8359,
-    8363, X, 8361, X, X, X, 8799, 14980, 8807, 14977, 10836, 10862, 18786,
-    18889, X, 10880, 6213, 6585, X, 8814, X, 10613, 6214, 6981, 7917, 8370,
-    10338, 6586, X, 12498, X, 13033, 19341, 7435, 7433, 7437, 13035, X, 7436,
-    7434, X, X, 5278, 5279, 5280, 5281, 5282, 5283, 5284, 5285, 5286, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19199, X, X, X, X,
-    X, X, X, X, X, X, 7450, X, X, 15050, X, 15049, X, 9242, 9243, 15663, X,
-    16283, 16843, X, X, 9630, 9928, 16841, X, 16844, 9929, X, 17306, 16842,
-    10386, 17685, X, 17683, 17690, X, 17682, 17681, 10385, 10383, 10382, X, X,
-    X, X, X, X, X, X, 17688, 18007, 18013, 10529, 18008, X, 18011, 18015,
-    10530, 18010, X, 18002, X, 19512, X, X, 19040, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19516, X, X, X,
-    11796, 6333, 6332, 11797, X, X, X, 6692, X, 7094, 12597, X, 13173, X, 7541,
-    8014, 13172, 8013, X, 8923, 19253, 15133, 9678, X, 9962, 16916, 19255,
-    10549, X, 10724, 11361, X, 11362, 19251, 11426, X, X, 6068, 11571, 11569,
-    6069, 11568, 11570, 11572, X, 6067, X, X, X, X, X, 6361, 6362, 6359, X, X,
-    6358, 12175, 6360, X, X, X, 8373, 14338, 14323, 14326, 14335, X, X, X, X,
-    X, 15631, 15000, X, 14993, 15012, 15021, 14996, 8825, X, 15009, 8815, 8817,
-    8829, 14994, X, 19463, 8818, 8820, 8830, 17233, 17246, 19615, 17248, 17223,
-    10180, X, 17249, X, X, 17237, X, 10184, 17234, X, X, 10186, 17243, X, X, X,
-    10178, 17229, 17244, X, 17238, 16771, 17245, 17226, X, 10183, X, 5157, X,
-    X, 5179, X, 5178, X, X, X, 5154, 5155, 5162, X, X, 5163, X, X, X, X, X,
-    5165, 5164, X, X, X, X, X, X, X, X, X, X, 19343, X, X, X, X, X, X, X, X, X,
-    X, X, X, 19333, X, X, X, X, X, X, X, X, X, 15079, X, 9276, 15707, X, 15704,
-    X, 9270, 9282, 9283, X, 9273, 15702, 9275, 15694, 9281, 19169, 15706, 9272,
-    15708, 9271, X, 15703, 15705, 9274, 12140, 12123, X, 6683, 12133, 6686,
-    6689, X, 6684, 12137, 6687, X, 7087, 12143, 12125, X, X, 12127, 12134,
-    12138, 12142, 12139, 12132, 12135, X, 19234, 12129, 6691, 12131, 12130,
-    12141, 6682, 12609, 7115, X, X, X, X, 7555, 7554, X, X, X, 13178, 13182,
-    13184, 7556, 13187, 19283, 7560, 13189, X, 7562, X, 7558, 7566, 19284,
-    7563, 13180, 7557, X, 13179, 13177, 13191, 6725, 6383, 11845, 19382, 12196,
-    6726, 11834, 6384, 6728, 6385, 6381, 6386, 11844, 11833, 11848, 6378, X,
-    19344, 11836, 11841, 11838, 6379, X, 12182, X, 12183, X, X, X, X, X, X,
-    12972, 12969, 12967, X, X, 7380, 12970, 7385, 12964, 12979, X, 12981,
-    12965, X, 7382, 12982, 12977, 12963, 12968, 12978, 12974, 12971, X, 7387,
-    12980, 12966, X, 18452, 10711, 18458, X, 18457, X, 18453, 18465, X, 18454,
-    18615, 18468, 18470, 18461, 18455, 18616, 18618, 18612, 10772, X, 18625,
-    18623, 10773, 18622, 18621, 18614, 18611, 18617, 18626, 18613, 18619, 8865,
-    X, 17352, 17351, 17350, 17714, X, X, 17718, 17717, 17716, 17715, 10392,
-    18046, 18299, 10632, 18298, 18480, 18631, 18630, 10774, 18629, 18743,
-    18742, 18741, X, X, 9251, X, 16885, 10218, X, 5495, 5497, X, 5498, X, X, X,
-    11309, 5517, 5515, 5518, 5516, 11310, 5560, 11319, 11317, 5559, 5558, X, X,
-    5654, 5653, 5652, X, 5655, 5651, X, X, X, X, 5778, 5779, 5679, X, X, 5817,
-    X, X, 11398, X, X, 5987, 5988, 5986, 5989, 11508, 11509, X, X, X, X, X, X,
-    19078, X, X, X, 19081, X, 6266, 11733, X, 6265, X, 16388, 9973, 16924, X,
-    16385, 16387, 9974, 9690, 9972, 9689, 9976, 16389, 9686, X, X, 19378, X, X,
-    19375, X, X, 17379, X, 17371, X, X, X, X, X, 16932, 17372, 18496, 18495,
-    18498, 10781, 10729, 18649, 18497, X, X, 18648, 10783, 10782, 10821, 18754,
-    18824, 5625, X, X, 13866, 16405, 10945, X, 5883, 11610, 6109, 6107, X,
-    6108, X, 11870, 6423, 6757, 13295, 7689, 7671, 13276, 13297, X, 19214,
-    7677, 7687, 13278, 13288, 13273, 13277, 7682, 13272, 7670, 7679, 7676,
-    13281, 7189, 13910, 7673, X, X, X, X, X, X, X, 19635, X, X, 14210, 14213,
-    8306, X, 14211, X, 14222, 14220, 14215, 14217, 14219, 8303, X, X, X, X, X,
-    X, X, 14892, 14898, 14888, 14894, 8723, 14890, 8729, X, X, 8728, X, 18724,
-    18729, 18719, 18722, 10816, 18726, X, 18733, 18620, X, 18720, 18730, 18734,
-    18725, 18718, X, X, 18727, 18732, 18731, 18624, 18723, 18717, 18721, 10847,
-    10848, 18716, X, 18815, 18806, 18814, 18047, 18048, 18632, 18744, X, X,
-    18819, 18878, 18927, 18954, 9252, 10219, 17719, 18049, 18481, 18745, X, X,
-    9645, X, 17353, 17720, 18050, 18051, 18052, 18304, X, 18300, 10716, 18303,
-    18302, 10633, 5131, 5132, 5148, 5149, 5150, 5151, 5152, X, 5183, 5193,
-    5194, 5195, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19302, X, X, X, X, X, X, X, X, X, X, X, X, 11301, X, X, X, X, X, X, X,
-    11299, X, X, X, X, X, X, X, X, X, X, X, X, 11205, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19359, X, X, X, X, X, X, X, X, X, X, X, X,
-    19134, 19094, X, X, X, 19586, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    5202, 5203, X, X, X, X, X, X, X, X, X, X, X, X, 5197, 5198, 5199, X, 12584,
-    7072, 7075, X, X, 12575, 12581, X, X, X, 7074, 12570, X, 6672, 13119,
-    12582, X, 12573, X, 7073, 12572, X, X, X, X, X, X, 13110, X, X, 7517,
-    15125, 8916, 15124, 8922, X, 15117, 8917, X, 15131, 8918, 15119, 15122,
-    15127, 15121, 15116, X, X, X, X, 15123, 15721, 9296, 15724, 15723, 15726,
-    15728, 18962, 9294, X, 15722, X, 15720, 12170, 12167, 12168, 12169, 12171,
-    6707, X, X, 12612, 12611, X, 7119, X, 7118, 19297, X, X, X, X, 7570, 13194,
-    X, 7569, 7571, 7568, X, X, X, X, 8028, 13193, X, 9058, X, 15959, 15960,
-    9439, X, 19753, 15958, 15961, 9441, 9438, 15954, 15951, 15956, 15953, 9445,
-    15955, X, 19754, 15957, 9443, X, 19758, X, X, 9776, 16555, X, 16549, 16553,
-    16559, 7937, X, X, 8230, 14096, 8229, 14095, X, X, X, X, 14763, X, 9071,
-    15399, 9072, X, X, X, X, X, X, 10573, 18122, X, 5914, 6538, 12001, X, 6895,
-    X, 6894, 6899, 12415, 6897, 12413, 6902, 6898, 6903, 6901, 12414, 6900,
-    7315, 7314, 12900, 7323, 12893, 12899, 7319, 12892, 12898, 12896, 7318,
-    7320, 12895, 7313, 12894, 7324, 7321, 7325, 7322, 12891, 12890, 12897,
-    18132, 18131, 10582, X, X, X, 18349, X, 18347, X, 18345, 18348, 10663,
-    18350, X, 10662, X, 18528, X, 10791, 10793, 18666, 10792, 18770, 18840,
-    18842, 18839, 18841, 10877, X, X, X, 19197, X, 19613, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19339, X, X, X, X,
-    X, X, X, 19526, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19699, X, X, X, X, X, X, 19540, X, X, X, 19023, 19225, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19442, X, X, X,
-    X, X, X, X, X, X, X, X, 5782, X, X, X, X, X, X, X, X, X, 6222, X, X, X, X,
-    X, X, X, X, X, X, 7455, 13042, 5820, 5819, 11399, 5990, X, X, X, X, X, X,
-    7044, X, X, 13078, X, 8438, 15077, 8882, X, 19095, 16323, X, X, 18053,
-    10934, 5596, X, X, 11736, 12078, 7489, 7487, 6027, 11533, 19190, 19208, X,
-    11534, 19186, 6029, X, 11536, 6025, 11537, 11535, 6028, 6030, 6033, 6032,
-    6026, 11538, X, X, X, X, X, X, X, X, X, X, X, X, X, 19474, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, 19441, X, 19052, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19020, X, X, 6616, 6604, X, X, 12058, 12066, X, 6603,
-    6611, 6623, X, 12072, 12070, X, X, X, X, 6605, 11755, 11754, 6295, 11757,
-    11759, 11748, 11751, 11758, 6296, X, X, 11745, 11749, 19143, X, 11753,
-    12098, 6291, 12102, 6278, 11750, 6279, 6292, 6285, 6281, X, 11746, 6284,
-    6289, 6298, 11747, 11740, 8003, 8001, X, 13725, 7998, 13729, 19198, 13724,
-    13726, 13720, 7996, X, 13739, 13738, 13735, 7995, 7999, 8000, 12571, 13732,
-    7997, 7525, 13734, 13721, 13737, 13736, X, 13740, X, 14428, X, 13733,
-    16355, 16348, X, 16910, 9961, 16908, 16913, 16912, X, X, 9960, X, 16911,
-    16907, 16915, 16914, 9959, X, 16909, X, 9677, X, X, X, 10225, X, X, X,
-    17365, 17736, 17737, 17738, 8029, 13804, X, 8030, 13803, 8027, X, X, X, X,
-    14470, 14472, 8483, 14471, 14469, 14468, X, X, X, 15154, 8941, 8939, X,
-    8940, 15152, 15153, X, 8937, 15749, 15747, X, 9308, 14493, 15170, 19365, X,
-    8502, 14485, 14489, 8948, 8493, 14482, 14483, 8950, 8501, 8503, 8500,
-    14491, X, X, 15174, 15175, 15180, 9324, 15187, X, 8956, X, 8955, 15182,
-    19383, 9323, 15171, 8954, 15778, X, 9359, 15786, 8962, 9348, 15202, X, X,
-    9351, X, 9355, 9357, 9354, 9353, 19739, 9347, 15789, 9344, 9360, X, X, X,
-    X, X, X, X, 9695, 9696, 16399, 9705, 9702, 7196, 7203, 7186, 7198, 12695,
-    7200, 7183, X, 7182, 12681, X, 12685, 7191, 12703, 12694, 12686, 7195,
-    7192, X, 7184, 7187, X, X, X, X, X, X, X, X, 19467, X, X, 8703, X, X, X,
-    14839, X, X, X, X, X, X, 14835, 14873, 14834, 9138, 15499, X, X, 15482, X,
-    X, 15460, 15490, 9130, 15475, 15485, 9133, 15478, 9131, 15463, 18365,
-    18364, 18141, 18359, 17511, 18368, 18357, 18362, X, 18366, 18356, X, 18536,
-    10666, 18363, X, X, 18672, 18537, 18535, 18533, 18534, 18538, X, 10795,
-    18670, 18668, 18673, 18671, X, 18674, 10796, 17862, 17535, 17875, 17864, X,
-    10463, 17870, X, 17872, 17867, 17874, 17869, 17868, 10464, X, X, 18154,
-    18155, X, 18157, 10595, 10596, 18158, 18156, X, 18153, X, 18371, 18374,
-    18370, X, 10671, 14250, 8320, X, X, 14253, 14254, 8324, X, 14256, X, 14258,
-    X, 14259, 14247, 14246, 14260, 8323, 14257, 14255, X, 8321, 8317, 8328,
-    14251, 14252, 14249, X, 8322, X, X, 8318, X, 19381, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19733, X,
-    X, 14379, 14377, X, 14373, 8423, 14371, 8429, 14376, 14383, 14374, 14382,
-    X, X, 8876, 8873, X, 8874, X, 15066, 15058, 8872, 8869, 15059, X, X, 8871,
-    15062, X, 15064, X, X, 14021, 14028, X, 8184, 14027, 14024, 19649, 8186, X,
-    19644, X, 14026, 19650, X, 14020, 14022, 14025, 14023, 8185, 14029, 8183,
-    8603, X, X, 14676, 14675, 14673, X, 8606, 8605, 7754, 14694, 9763, 10428,
-    10735, 18764, 5757, X, 11979, 5213, X, X, 12363, X, 12364, X, X, X, X, X,
-    12809, 12810, 7755, 7756, X, X, X, 14046, X, 14697, 14696, 14695, 15362,
-    15357, 15360, 15365, 9054, 15359, X, 9434, 15950, 15949, X, 9437, 9435,
-    15947, 9433, 15948, X, 9436, X, X, X, 16546, X, 16548, X, 16547, 16539,
-    16543, 16542, 16540, 9772, 9773, 9448, X, X, X, 16562, X, 9782, 16564,
-    16563, X, 15391, 9784, 9783, 9780, 9781, X, X, X, X, X, 17039, X, 17037,
-    10058, 17038, X, 17040, 17036, 17035, X, X, 17459, 17463, 10285, 17469,
-    10284, X, 17470, 17467, 10281, 17468, 17461, 10282, 10280, 17814, 17465, X,
-    X, 17471, X, X, 17811, X, X, X, 10442, 10440, 17813, X, 17815, 17812,
-    10441, 10438, 10439, 9092, 15442, 9098, 15423, X, X, 15439, 15420, X,
-    15441, 15424, X, 9105, 9102, 15440, 15434, 9088, 9096, 9095, X, 9094, 9100,
-    X, 15421, 9101, 15435, 9097, 9087, 15437, 9090, 9091, 9099, 10584, 5920, X,
-    5921, 6907, X, 7331, 12420, X, X, X, 8258, 5922, 6909, 12421, 12422, 6908,
-    6910, 5923, X, 12423, 7333, 12912, 7335, 7332, 7334, X, 13503, 7819, X,
-    13502, 13501, 11473, X, X, 11682, 11683, 11677, X, 19294, X, X, 11681,
-    6186, X, 6187, 11678, 11676, 11675, 11679, 6185, 11680, 12445, X, X, X,
-    12016, 6559, 12015, 12017, X, 6558, 12022, 6562, 9136, 15472, 15466, X,
-    9129, 14872, 9128, 15483, X, 9126, 9141, 9134, 15484, 15473, 15465, 15492,
-    15477, 9140, 15496, 9137, 15495, X, 15489, 15494, X, X, X, 15497, X, X, X,
-    X, 19215, X, 19661, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19689, X, X, X, X, X, X, 19548, X, X, X, X, X, X,
-    19402, X, X, X, X, 19583, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 9942,
-    X, X, 10399, 18305, 18484, X, 10777, 18634, X, X, 18955, X, X, X, 9943, X,
-    X, X, 19296, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19064, X, X, X, 17830, X, 10449, 17831, 18530,
-    10827, 18771, 5918, 6542, 6541, 12418, 6905, 19538, X, 12417, 12908, X,
-    7328, 13489, 12907, X, X, X, 7815, 13492, 13490, 13491, 7814, X, 17955,
-    10354, 10512, X, 18790, X, X, 6596, 7936, 7935, X, X, X, X, 8401, 14357,
-    14356, 8402, X, X, 15034, 8843, 8840, 15033, 8842, 15031, 8841, X, 15032,
-    X, 15634, 9610, 10515, 6987, X, X, X, 9910, X, 10804, 6988, 13672, X,
-    14358, X, 14360, X, 14359, X, 15038, 15035, 8845, X, 8846, 15036, 15037, X,
-    15637, 15642, 9230, 15636, 15638, 15645, 18700, 6992, 7939, 7940, 13673,
-    8404, 8405, 14361, 8406, X, 8850, X, 8852, 15040, 15041, 15039, 8847, 8848,
-    8851, 8849, 19401, X, 15648, 9233, 9234, X, X, 16261, 9616, 16256, 16255,
+    12214, 6750, 12213, 12210, 12218, 12220, 6743, 6747, 6753, 7146, 6764,
+    12227, 12232, 19660, 6770, 6762, 12231, 6765, 6768, X, X, 12234, X, 6763,
+    12239, 6766, X, 6769, 12228, 12233, 12237, 12229, 12226, X, X, 12238,
+    12235, X, X, X, X, X, 12531, 12532, 7037, 19552, 12533, 19061, 12530, 7038,
+    7036, 7035, 12534, 19062, 13071, 19063, X, 19065, 13692, X, X, 14386,
+    15072, X, X, X, 9262, 9653, 16322, 19589, 14398, X, 14413, 14391, 14400,
+    8452, 8453, 8445, 14409, 8455, 14396, 14395, 14393, 14411, 8443, 14405,
+    14394, 8446, 14403, 8441, 14399, 14406, 14408, X, X, 14412, 8450, 14392,
+    8444, 14397, X, 8439, 11540, X, X, X, 6313, 11778, X, 6311, 6312, 6310,
+    12586, X, X, X, 6678, 6677, 6679, 6676, X, 12122, 6314, 6675, X, 7078,
+    7079, X, 7080, X, 13138, X, X, X, 8373, 14338, 14323, 14326, 14335, X, X,
+    X, X, X, 15631, 15000, X, 14993, 15012, 15021, 14996, 8825, X, 15009, 8815,
+    8817, 8829, 14994, X, 19463, 8818, 8820, 8830, 19332, 19630, X, X, 19008,
+    X, 16778, 17225, X, 17230, 10179, 10181, 17236, 10175, 17251, 17242, 17231,
+    17232, 17241, X, 10188, 17240, 17224, 17239, 17227, 17252, 10187, 10185,
+    17228, X, 17247, X, 11185, 11186, 11187, 11188, 11189, 11190, 11191, 11192,
+    11193, 11194, 11195, 11196, 11197, 11198, 11199, 11200, X, 11174, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19396, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 5034, 5047, X, 5049, 5051, 5055, 5056, 5059, 5060, 5063,
+    5064, 5067, 5068, 5071, 5072, 5075, 5190, 5290, 5291, 5292, 5293, 5294,
+    5295, 5296, 5297, 5298, 5299, 5300, 5301, 5302, 5303, 5304, 5305, 5306,
+    5307, 5308, 5309, 5310, 5311, 5312, 5313, 5314, 5315, 10963, 5181, 10964,
+    X, 5122, 19031, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19392, 19740, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19029, X,
+    5573, 5572, 11322, 5574, 5580, X, 5575, 5576, 11324, 11323, 5578, 5579, X,
+    5577, X, X, X, X, X, X, 5662, 5663, 5664, 5665, 5661, 5668, 11346, X,
+    11342, 10958, 5669, 5685, 5820, 5819, 11399, 5990, X, X, X, X, X, X, 7044,
+    X, X, 13078, X, 8438, 15077, 8882, X, 19095, 16323, X, X, 18053, 10934,
+    5596, X, X, 11736, 12078, 7489, 7487, 19180, 12568, 12569, 7070, 7071, X,
+    X, 13105, 7514, 7516, 13104, 7515, 13719, 7994, X, X, X, X, 8456, 8457,
+    14414, X, 8901, X, 8900, X, 15709, 16336, 16335, X, 18883, 5534, 7088, X,
+    X, 7089, 19218, 7091, X, X, X, 7090, X, X, X, 12589, 12590, X, X, X, X,
+    12596, X, 13145, 7530, 13755, 13144, 13163, X, X, 7536, X, 13161, X, 12811,
+    7758, X, X, 8199, 8200, X, 5760, 5761, 11467, 6165, 6164, 6852, 12365,
+    14047, 5762, 5763, 5764, 5765, X, X, X, 6166, 6167, 11664, 11663, X, X,
+    6521, 11982, 11980, 9771, 16541, 16544, 16545, X, 9774, X, 10048, 17021, X,
+    10045, 17015, 10047, 10049, X, 19743, 10046, 17020, 17016, 10044, 17019,
+    17014, 17018, 17017, X, X, 17448, 10271, 10272, 10269, X, 10270, 9448, X,
+    X, X, 16562, X, 9782, 16564, 16563, X, 15391, 9784, 9783, 9780, 9781, X, X,
+    X, X, X, 17039, X, 17037, 10058, 17038, X, 17040, 17036, 17035, X, X,
+    17459, 17047, 17057, 17054, 17056, X, 17044, 17060, 10060, X, 17055, 17064,
+    17052, 10064, 10061, 17050, 17045, 17063, 9787, X, X, X, 19083, X, X, X,
+    17462, X, X, 17460, 17466, 10283, 17464, 7805, 13481, 7810, 7800, 7808,
+    13478, 7799, 13482, X, X, 13485, X, X, X, 14126, 14117, 8244, 14124, 14121,
+    14113, 14122, 8246, 14114, X, 14110, X, X, 8679, 14119, X, 8243, 14125,
+    12904, 12902, X, 13488, X, 14129, 14130, 14799, 14800, 8681, 8682, 14798,
+    14801, 14797, 8680, X, 9106, X, 8683, 15444, X, 9480, 16000, 9481, X, 9805,
+    16613, 16611, 16612, 17086, 17085, 17084, 10102, X, 10101, 10099, 17091,
+    17094, 10098, 17095, X, 10105, 17093, X, 17092, 10299, X, 10300, 17490,
+    17488, 17489, X, X, 17837, X, 17836, 10454, 18137, 10585, 18136, X, 18354,
+    18531, 10744, 7375, 12933, 12937, 7378, 12927, 12951, X, 12950, 12958,
+    7367, 7364, 12956, 12952, 12943, 12938, 7370, 7366, 12929, 7362, 12953,
+    7363, X, 12931, X, X, X, X, X, X, X, X, X, 19324, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19002, X, X, X, X, X, X, X, X,
+    X, X, 13728, 14420, 8467, 8470, 8465, 14419, 14423, 14418, X, 8459, 8469,
+    14415, 8463, 14422, X, 8461, 8460, 14425, 8462, 14427, 19200, 14424, 8458,
+    X, 19597, 11956, 11958, 11953, 11950, 11952, X, X, X, 6503, 19189, X, X,
+    6501, X, X, 11954, 6502, 11951, 11948, 6500, 11955, X, 11949, 6504, 11957,
+    X, X, X, X, 12323, 8182, 7741, 19642, X, 8181, 14016, 14015, X, 14013,
+    14014, X, 14017, 14669, 14668, 14672, X, 14671, 14670, 9036, 15332, X,
+    15331, 9037, 15330, 15908, X, 15909, 9414, X, 16510, 16511, X, 9838, 16697,
+    16699, X, 9836, 16691, 16695, X, 16698, 9834, 9837, 16701, 16693, 16694,
+    16700, 16692, 16696, 9835, 17163, X, 17162, 10133, 17168, 10135, X, X,
+    10132, 17164, 10136, 17165, X, 19318, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19151, X, X, 19478,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19393, X, X,
+    X, X, X, X, X, X, 19043, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 6996, 13675, 17291, 6997, X, X, 15655, 15654, 16831,
     X, 11263, X, X, X, 11264, X, 11265, 11266, 11267, X, 11268, X, 11269,
     11270, X, X, X, X, X, X, X, 11271, X, X, X, X, X, X, 11272, 11273, X, X,
     6794, 12262, 12254, 6787, 12274, 12266, X, 6781, 12280, 12253, 6777, 12271,
     12261, 6782, 12267, 6774, 12243, 6791, 7194, 6780, 12260, 12259, 12248, X,
-    12276, X, 12269, X, X, 6772, 11911, X, 12283, 6798, 12284, X, 6799, X,
-    12714, 7205, 7204, X, 13312, 13310, 13311, 13309, X, 13308, X, X, 13940,
-    13943, 8131, 13941, 8130, 13942, X, 14597, X, X, 15267, 15268, 13325, X, X,
-    13970, X, 7706, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    8165, 7719, 8147, 13964, 8161, X, 13952, 10011, 10018, 16982, 16974, 10013,
-    X, 16978, 16977, 16983, 10019, X, 10014, 10017, 16976, 10021, 10015, 10022,
-    10009, 16980, X, 16972, X, X, 17419, 19565, X, 10254, 17416, 17418, X,
-    10252, 17414, 19633, 12331, 12778, X, 15328, X, 10033, 5646, 6508, 12332,
-    12333, 14011, 8180, X, X, 14667, X, X, 8602, 15329, X, 19636, 9413, 19637,
-    10422, 5647, 14012, 5648, X, 5912, 11463, 5911, 14686, 8612, 14690, X,
-    14680, X, 14691, 19676, X, 19656, 14681, 14682, X, 14692, 14689, 14687,
-    14688, 14684, 14683, 19559, 14693, 8609, X, 14685, X, 8614, 8608, 8615,
-    8616, 19712, 8611, 8610, 9423, 9428, 9429, 15939, 9426, 15934, 9427, 9047,
-    15941, 9424, X, X, 19716, 16529, X, 16528, 16536, 16530, 16535, 16532,
-    9766, 16534, X, X, 9767, X, 9768, X, 16533, 16531, X, X, 19097, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    19047, 19025, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19342, X, 11383, 5802, 11387, X, 11391,
-    11388, X, X, 11385, 5788, 5790, 5803, X, 5792, 11377, 5795, 5793, 5794,
-    11393, 11390, 11381, 5791, X, X, 11378, 5789, X, X, X, 11386, X, X, 17785,
-    17424, X, 17786, 10420, 17784, X, X, 17783, X, 17782, 10421, 19624, X,
-    10563, X, X, 18097, 18098, 19626, X, X, X, 18334, 18333, 10655, X, 18332,
-    18507, 18508, 13395, 13392, X, 7750, 13391, 7748, 7751, 13394, 13402, 7249,
-    7749, 13400, 13399, 7753, X, X, X, X, X, X, X, 19666, 14035, 19159, X, X,
-    14036, 8196, X, 14042, X, X, 9926, 16837, 16835, 16834, X, 16840, X, 16839,
-    16838, X, 16833, 9925, 16832, X, 16836, 9927, X, X, 17296, X, 17300, 17297,
-    17299, 17298, 17295, 17301, 17304, 17302, 17303, 10205, 15668, 15669, X, X,
-    16299, X, 16294, 16291, 16298, X, X, X, 16300, X, X, 9637, 16297, 16293, X,
-    X, 16292, 16296, 16295, 9636, X, X, 16860, 16855, 16853, 16862, 16854, X,
-    11112, 11113, 11114, 11115, 11116, 11117, 11118, 11119, 11120, 11121,
-    11122, 11123, 11124, 11125, 11126, 11127, 11128, 11129, 11130, 11131,
-    11132, 11133, 11134, X, X, X, X, X, 10962, 10953, 10954, X, 6305, 11774, X,
-    6307, X, 6306, X, 11775, 6304, 6303, 11765, X, 11764, X, 11762, 11767,
-    11766, 11763, 11772, 11773, 11770, 11768, 6302, X, X, X, 11771, 6308,
-    11776, X, X, 10041, 17008, X, X, 10040, 17011, 17009, 17010, X, X, 10042,
-    X, X, 19718, 17440, 19717, 10268, 17441, X, X, 10266, 17442, 10267, 17439,
-    17443, X, 17437, X, X, 10431, 7292, 13441, X, 13439, 13435, 7782, X, 13436,
-    7783, 13437, 13438, 13440, X, 7784, X, X, 14088, 19352, 14087, 14086,
-    14085, X, X, X, X, 14749, 8653, X, 14746, 14748, X, 8654, 8668, 14774, X,
-    14777, 14765, 14770, 14764, 8670, X, 14768, X, X, X, 14766, 8669, X, 14773,
-    14772, 14769, 14771, 14767, 9076, 14776, 8666, 14775, X, X, X, X, X, X, X,
-    5156, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 5159, 9254, 19036, 9258, 15676, 9253, 9261, 15679, 15680, 9259, 9260,
-    15686, 15683, 15684, X, 19038, X, 9649, 16321, 9646, 16318, 9648, 9650, X,
-    16319, 9647, X, 16320, X, 16317, X, X, 9945, 7968, 13708, 7974, 7980, 8255,
-    X, 19160, 7978, 13705, 7991, 7971, 7979, 13713, 14404, 13718, 13706, X,
-    13697, 13710, 13704, 7977, 13716, X, X, 7973, 7993, 7986, X, 7975, 7972, X,
-    7983, 11540, X, X, X, 6313, 11778, X, 6311, 6312, 6310, 12586, X, X, X,
-    6678, 6677, 6679, 6676, X, 12122, 6314, 6675, X, 7078, 7079, X, 7080, X,
-    13138, X, X, X, 9190, X, X, 9872, X, 9871, X, X, X, X, 10491, 10579, 10683,
-    6201, 7415, 8793, X, 17925, 10949, X, X, 19762, X, X, X, X, X, X, 11686,
-    14320, 14316, 14319, 8368, 14317, 8369, X, X, 14495, 8813, 8812, X, 8811,
-    X, 14989, 14990, X, X, 15594, 15596, 9206, 9203, X, 9205, 9204, 15595,
-    15593, X, X, X, X, X, 6195, X, 7892, 7891, 14943, 14944, X, 9182, 16729,
-    9556, 16730, 17200, 6196, X, 12483, 6962, 6961, X, 13003, X, 13004, 13617,
-    X, 13616, X, 13615, X, X, 5464, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19417, X, 6606, 6602, X, X,
-    X, X, X, X, X, X, X, X, 12073, X, 7025, 7003, X, 7019, X, 7024, 12513,
-    12512, 12517, 12518, 7006, X, 7015, X, X, X, 7028, X, 6698, X, 12601, 7104,
-    19268, X, 7550, 7549, 7548, 8019, 8020, 13776, 8933, 9680, 5543, X, 5611,
-    11356, 19270, 19272, 11418, 5866, X, X, X, 6340, X, X, X, X, 14455, 6367,
-    6368, 11828, X, X, 6717, 12181, 6720, 6716, 6722, 6718, 6719, 6721, X, X,
-    X, 7126, 7125, 7124, X, X, X, 13203, 7583, 7586, 7584, X, 13202, 7589, X,
-    7585, 13204, 6392, 6739, 12201, 12202, X, X, 12638, 7143, 7613, 8061,
-    13833, 5623, X, 5557, 5624, X, 11365, 5737, 5736, 5734, 5735, X, X, X,
-    5882, 11439, 11441, 5881, 11433, X, 11434, X, 8250, 8252, 14112, X, X,
-    8251, 14115, 8245, 14123, 14116, 14120, X, 14118, 8248, 14111, 8253, 7801,
-    8249, 8254, X, X, X, X, X, 8675, 14787, 14789, 14791, 14795, X, 14785,
-    12911, 7330, 12910, 12909, X, 7329, X, 13498, X, 13500, 13493, 13494, 7816,
-    13495, 7817, 13499, 13496, 13497, 7818, X, 8256, 8257, X, 14134, X, X, X,
-    14805, 14806, X, 15448, 9109, 12011, 12444, 6925, X, X, 12924, 19523, X,
-    7358, X, 7356, 7357, 7359, X, X, 12923, X, X, 13525, 13522, 13524, 7830,
-    7832, 7831, 13521, 7833, 13523, X, 14154, 14155, X, 14156, 14838, X, 14863,
-    14855, 14880, 14858, 8719, 14875, X, 8710, X, 14861, 14869, 14842, 14868,
-    X, 14885, 14837, 14870, X, 14883, X, 14831, 8285, X, 14845, 14844, 8712, X,
-    14848, 14850, 14865, 18146, 18143, X, X, 18148, 18150, 10591, 10593, X,
-    18149, 10594, 10592, 18151, 19086, X, X, X, 10589, X, X, X, X, X, 10665,
-    18355, 18361, 10667, 18145, 18360, X, 18367, 18358, 10314, 16081, 17518,
-    17531, 17525, 17522, 17517, 17516, 17537, X, 17521, 17520, 10312, 17529, X,
-    10311, X, X, 10313, 17524, 17536, X, 17865, 17866, X, 10465, 17863, 10462,
-    17871, X, 10466, 17873, 6190, X, 6957, 6958, 12481, X, X, 12482, 6956, X,
-    7399, X, 7397, X, 7396, 7403, 7395, 7404, 12997, 7401, X, 7398, 7402, 7400,
-    7394, X, X, 7881, X, 7875, 13608, 7880, 8337, 8335, 8776, 8775, 8773, 8777,
-    X, 8771, 8772, X, 8770, X, 14942, X, X, 15563, X, 9180, 9181, 9179, X,
-    15562, X, 15564, X, 16150, 16152, X, 9553, 16153, 9546, 16149, 13628,
-    13629, X, X, X, 14290, 14288, 14292, 14293, 14299, X, 14295, 14297, X,
-    14289, 14284, X, 14296, X, X, 14298, 14291, 14294, 14285, 8355, 14287,
-    14286, 8354, 8356, X, 8790, 14968, 11692, 11688, 6208, 6211, X, 11689,
-    6210, 11691, X, X, 6209, X, X, X, X, 12047, 12049, 6583, 12045, 12048,
-    12046, 6581, 6584, X, 6582, X, X, X, X, 12489, 12493, 12490, 15006, 15010,
-    X, 15014, 8823, 14997, 14995, 15007, X, X, X, X, 15004, 15003, X, 15008,
-    15011, X, 15016, X, X, X, 15599, X, 9207, 15609, 15601, 9212, 9216, 15618,
-    15626, 15611, 17250, X, 10176, 17221, X, 19703, X, X, 17616, 17609, 10340,
-    X, 17604, 17619, 17611, 17235, X, 17621, 17605, X, 10339, 17615, 10341,
-    10349, 10347, 17617, 10348, 17607, X, 17608, 17613, 17618, 18410, X, 19625,
-    19628, 10755, 18571, 18574, 18570, 18572, 18573, 18567, 18568, 18565, X, X,
-    18569, 18566, 10756, 10757, X, X, 18694, X, 18696, X, X, X, X, X, 18695,
-    18697, X, 5144, 5147, X, X, X, X, 5142, 5143, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19606, 19210, X, X, X, X, X, X,
-    X, 19247, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 19773, X, X, X, X, X, X, 19631, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5135, X, X, X, X, X, X, X,
-    X, 19032, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, 5917, X, 6904, 12764, 7326, X, X, 7813, 14127, 14128, 9488, X, 16016,
-    16012, X, X, 16620, 16630, 9813, 9812, X, 16624, 16626, X, 16621, X, 16625,
-    16619, 16628, 9811, 16627, 16623, X, 16629, X, 16622, 10100, 17090, 17096,
-    10104, 10106, 10103, 7375, 12933, 12937, 7378, 12927, 12951, X, 12950,
-    12958, 7367, 7364, 12956, 12952, 12943, 12938, 7370, 7366, 12929, 7362,
-    12953, 7363, X, 12931, X, X, X, X, X, X, X, X, X, 19324, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19002, X, X, X, X, X, X,
-    X, X, X, X, 13728, 14420, 8467, 8470, 8465, 14419, 14423, 14418, X, 8459,
-    8469, 14415, 8463, 14422, X, 8461, 8460, 14425, 8462, 14427, 19200, 14424,
-    8458, X, 19597, 11956, 11958, 11953, 11950, 11952, X, X, X, 6503, 19189, X,
-    X, 6501, X, X, 11954, 6502, 11951, 11948, 6500, 11955, X, 11949, 6504,
-    11957, X, X, X, X, 12323, 6842, 6843, X, 12345, 12339, X, 12344, X, 12340,
-    6841, 12343, 12341, X, X, X, X, X, X, X, 12787, 12784, X, 12786, 7246,
-    7245, 7243, 12783, 12788, 7242, 7244, 12785, 13384, 17428, 17430, 17434,
-    17795, X, 17793, X, X, 19694, X, 10427, 17792, X, X, X, 10565, X, X, X, X,
-    10658, 18512, 10657, 18514, 18511, 18513, 10786, 18763, 5756, 11978, 12807,
-    12808, 14721, 9057, 8641, 8634, X, 8639, 8632, 14726, 8640, 14725, 8636,
-    8631, 8637, 14729, 15361, 15363, X, X, X, X, X, X, X, X, X, 8635, X, X,
-    15358, 9055, 15364, 9056, 8660, X, 14756, X, X, X, 15395, X, 15394, X, X,
-    15390, X, X, 9067, 15393, 15392, 9068, X, X, X, X, X, 9450, X, 15969, X,
-    9451, 9447, 9449, X, 9446, 17047, 17057, 17054, 17056, X, 17044, X, 10060,
-    X, 17055, 17064, 17052, 10064, 10061, 17050, 17045, 17063, 9787, X, X, X,
-    19083, X, X, X, 17462, X, X, 17460, 17466, 10283, 17464, 14783, 8677, X,
-    14790, 14794, 14786, 14782, X, 14781, X, X, X, 14792, 14784, 14788, 8678,
-    X, 8676, 14796, 8674, 14793, X, 15436, X, X, X, X, X, 9089, 15428, 9476,
-    15438, 9107, 9108, 15445, 15446, X, 15447, 16008, X, 16009, 9483, 16006,
-    16005, 16007, 16004, 9809, 16615, 9807, 9808, 17088, 10091, 17087, 17340,
-    X, 17485, 17486, 10295, X, 10296, 10092, 17833, 17834, 18134, 14826, X,
-    14827, X, 14825, 14828, X, 8702, X, 14824, X, 9125, X, X, 16024, 16020,
-    16023, 16025, 16022, 16021, X, 16632, 16633, 16634, 9816, 9817, 17099,
-    17098, 17100, X, 17492, 17491, 14882, 8715, 19732, 8716, X, 14836, 8708,
-    14840, 14878, 8717, X, 8709, 8711, 8718, 14884, 14871, 14866, X, X, 14847,
-    14846, 8707, 14832, 8704, 14856, 14833, 14854, X, X, 14843, 14879, X, 8860,
-    X, 15664, X, X, 9244, 15665, X, X, X, 16285, 16284, 9931, 9631, 9632, X,
-    16288, 16287, 16286, X, X, 16845, 16848, X, 16847, 16846, 9930, 17310,
-    17308, 17307, X, 11080, 11081, 11082, 11083, 11084, 11085, 11086, 11087,
-    11088, 11089, 11090, 11091, 11092, 11093, 11094, 11095, 11096, 11097,
-    11098, 11099, 11100, 11101, 11102, 11103, 11104, 11105, 11106, 11107,
-    11108, 11109, 11110, 11111, 5507, 5521, 19068, X, X, X, X, X, X, X, X, X,
-    X, 19070, X, X, 7477, 7957, X, 8879, 19369, 11306, 5588, X, 5677, 5675,
-    5676, X, X, 6256, X, X, 7761, 13404, 13403, 7759, 7760, 19706, X, X, 8202,
-    8201, 14049, X, 19707, 14048, 7762, X, X, X, X, X, 8617, 14700, 8618,
-    14699, X, X, X, 15347, 15933, 9422, 14072, X, 14084, X, 14073, 14074, X, X,
-    14082, 14081, 14078, 7779, 8219, 14076, 14079, 8220, 14080, 14077, X, X, X,
-    X, X, X, X, 14741, X, 14745, 8649, X, 15371, 8652, 8665, X, 14761, 14760,
-    X, X, X, X, 15396, 9070, 9069, 15397, 15398, X, 9453, 9452, X, 16568,
-    15970, 15972, 15971, 16567, 16565, 16569, 16566, X, 9785, X, X, X, 17041,
-    10059, 12411, 12412, X, X, 12883, 12889, X, X, 12887, 7311, 12885, X,
-    12886, 12888, X, X, X, 12884, 7796, X, 13469, 7798, 13471, 7797, 13470, X,
-    X, X, X, X, 14107, 8241, 16596, 16592, 16602, 9800, 16609, 16608, X, X, X,
-    17076, 17072, 10079, X, 17066, 10073, 10089, 17078, 10081, 10077, 17069,
-    10084, 10087, 17080, 10076, 17071, 10085, 17082, 17079, 17067, 10080,
-    10074, 10088, 14809, 14822, 14814, X, 14808, 8694, 8700, 14819, X, 14812,
-    X, 8697, X, X, 8695, 14820, 8692, 8691, 14815, 8696, 8271, X, 14818, 14810,
-    8693, 8698, 8699, X, X, X, X, 9118, 12451, 6939, 6934, 6927, 6932, 6928,
-    6947, 12449, 12941, 6935, X, X, 12461, 12090, X, X, X, X, X, X, X, X,
-    12944, 7374, X, 12928, X, 12939, 12935, X, 12954, X, 9241, 15660, 15656, X,
-    X, X, 15662, X, 16277, X, 16280, 16282, 16272, 16276, 16273, 9623, 9626,
-    9628, 16274, 16275, 9627, X, 16281, 16279, 9629, X, 9625, 16271, 9622, X,
-    9624, 18705, X, 10844, 10868, 18924, 7452, X, 9633, 9932, 17676, X, 18594,
-    X, X, X, 13041, X, 10892, 7453, 16849, X, 17677, X, 17998, X, X, 18438,
-    18595, 7454, X, 15666, 15667, 18804, X, 18802, 18799, X, X, 18801, 18800,
-    18866, X, X, X, X, 18868, 18867, X, X, 18897, X, 18896, 18895, 18898, X,
-    10884, 10885, 18944, 18948, X, X, X, X, X, 19259, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19514, X, X, X, X,
-    X, 19639, X, X, X, X, X, X, 19564, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19293, X, X, X, X, X, X, X, X, X, X, X, X, 19451, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 10940, X, X, X, X,
-    X, X, X, X, X, X, X, X, 19742, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, 5146, X, X, X, X, X, X, X, X, X, X, X, X, X, 19507, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, 11209, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 19330, X, X, X, 19549, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19104, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19018,
-    X, X, X, X, X, X, X, X, X, X, X, X, 19519, X, X, X, X, X, 19537, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 19157, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, 19122, X, X, X, X, X, X, X, X, X, X, X, X, X, 5465, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19087, X, X, X, X, X, X,
-    X, X, X, X, X, X, 15301, 9024, 15290, 15295, 9013, X, 15275, 9026, X, 9004,
-    15274, 15307, 9028, 15278, 15294, 19569, 15280, 15310, 15306, 9002, 9012,
-    12769, 12777, 12765, X, 7236, X, X, X, X, X, X, X, X, X, X, 7738, 13359, X,
-    X, 13361, 13357, X, 13369, 13355, 13368, 7734, 13353, 14000, 13363, 7737,
-    X, 13364, 14677, X, 14674, 15333, 9038, 8604, X, X, X, 14679, 14678, X,
-    15336, 15334, 9415, X, 9039, 15335, 15911, X, X, X, X, 9416, 15910, 15919,
-    15918, 15916, X, 15915, 15912, 15913, 15344, X, 15345, 15346, 9045, X, X,
-    15932, 15931, X, X, 16526, 9764, 9765, 19696, 17006, 17003, 17004, 17005,
-    17436, 17435, 10265, 17796, 18336, 5758, X, 6851, X, 7757, 14698, 19698,
-    5759, 9771, 16541, 16544, 16545, X, 9774, X, 10048, 17021, X, 10045, 17015,
-    10047, 10049, X, 19743, 10046, 17020, 17016, 10044, 17019, 17014, 17018,
-    17017, X, X, 17448, 10271, 10272, 10269, X, 10270, 10277, 10275, 10276, X,
-    X, X, X, 17809, 17810, 10437, X, 10436, 18120, 18121, 18119, X, 18519,
-    18520, X, X, 5776, 11469, 6174, X, 11999, 6537, 6536, 12000, X, X, 12403,
-    6892, 10443, X, X, 10575, X, 18127, X, 18126, 18124, 18123, 18125, X,
-    10574, 10576, X, X, 10661, X, X, 18343, 18342, X, X, 18521, X, 18523,
-    18525, 18524, 18522, X, X, 10741, 15426, 15425, 15422, X, 15430, 15427,
-    15431, 9104, X, 15443, 9093, 15432, 15433, X, 15429, X, X, X, X, X, X, X,
-    X, 15990, 9468, 9477, 9473, 15987, X, 9470, 9474, 15999, 12427, 6918, X,
-    12433, 6922, 6913, 12441, X, X, X, X, X, X, 7342, X, 7351, 7340, 7338,
-    12916, 7346, 7343, 12918, X, X, 7345, 12917, 12915, 12920, 7350, 7348,
-    14138, X, 17275, X, 17280, 17276, 17279, 10201, X, 17070, 17278, 17277, X,
-    10366, 10364, 10367, 10365, 17654, 17655, 17656, 10368, X, X, X, 17970,
-    10519, 17968, X, 10520, 17967, 17969, 10518, 18229, 18422, 18230, 18231, X,
-    10619, X, 18421, X, X, 18420, X, 18579, 18918, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, 6994, X, X, X, 6995, 17987, X, 17986, 17989, 17984, 17982,
-    X, 17988, X, 18244, 18242, 10623, 18241, 18247, 18245, X, 10624, 18240,
-    18238, X, 18239, 10626, 18243, 10625, 18246, 18425, 18431, X, X, 18426,
-    10703, 18432, 16850, X, 16856, 19535, X, 16851, 17320, 16852, 16863, X, X,
-    X, X, X, X, X, 16859, 9933, 16858, 16857, X, 16861, X, X, X, X, 17312,
-    17315, X, X, 17314, X, 5417, 5418, 5419, 5420, 5421, 5422, 5423, 5424,
-    5425, 5426, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19721, X, X, X, X, X, X, X, X, X, X, 19232, 19423, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19168, X, X, X, X, X, X, X, X,
-    X, X, X, 19338, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, 19587, X, X, 19373, X, X, X, X, X, X, X, X, 8526, X, X, 14504, 14523,
-    14528, 14516, 8522, 14533, 8519, 14502, X, 14503, 8512, 8521, 14510, 8524,
-    8525, 14511, X, 14524, 14530, 8520, X, 8514, 14509, 7956, 13887, 19448,
-    8538, 15224, 15223, X, X, 5632, 5890, 11887, 6439, X, 6438, X, 12240,
-    12241, X, 12677, 12678, 7177, 7178, X, 7179, 13265, X, X, 7668, X, 8103, X,
-    8102, 9993, 16946, X, 16957, 9995, 16964, X, 16953, X, 16948, 19298, X,
-    16965, 16944, 16955, X, 10002, 16960, 16966, 16954, 9994, 16956, 16945,
-    10001, X, X, 16963, 16950, 9997, 19496, 16952, 16949, 12314, 6808, 12308,
-    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 12729, 7220,
-    7225, 19142, 19544, X, 12738, 12744, 9407, 15877, 15860, 15887, 9402, X,
-    9392, 15880, X, 15884, 15889, 15878, 15866, 9395, 9398, 9406, 9401, X,
-    15869, 15293, 19577, X, 15865, 15888, 9397, X, 9400, 15890, 9389, 15879,
-    15853, 15885, 15320, 15326, 15322, X, 9033, 15321, 15325, 15317, X, 15319,
-    9032, X, X, X, X, 15323, 15318, X, 9034, X, 9029, X, 19605, 15327, X, 9030,
-    15896, 15893, 15905, 15899, 15901, 9409, 11975, 11971, 11974, X, 11970,
-    6520, 11973, 19121, 6517, 6516, 19652, 6519, 11976, 11972, X, X, X, X,
-    6847, 6850, 12354, 12353, 12352, 6844, 12361, 12351, X, 6846, 12794, X,
-    12358, 12356, 12818, 12815, 7267, X, 12817, 7260, X, 7261, X, X, 7767,
-    13408, 13409, 7768, 13405, 13407, 13411, 13410, 13406, X, 7764, 7765, X,
-    14057, 8207, 8206, 14051, 8204, X, 14054, 8208, 14055, 15375, 14739, 15377,
-    9063, 15378, 15374, X, 9060, 15370, 9062, 15367, 15372, 15376, 15369, X,
-    19752, 8644, 19760, 15366, 9061, 15368, X, X, X, X, X, 9440, 15952, 9444,
-    X, 9442, X, 6977, X, 6978, X, 12492, X, 12494, 12496, X, 6975, 12495, X, X,
-    6976, X, X, X, X, X, 13642, 12491, 13018, 13027, 13025, 13020, 13021,
-    13026, 13028, 7428, X, 13023, 9208, X, 15615, 14999, X, 9209, 15622, 15627,
-    15619, X, 15621, 15630, 15623, 15605, 15614, X, X, 9217, X, 9213, 15603,
-    15616, 9211, 15610, 9210, 15624, 15607, 15600, 9214, 15629, X, X, 10966,
-    10967, 10968, 10969, 10970, 10971, 10972, 10973, 10974, 10975, 10976,
-    10977, 10978, 10979, 10980, 10981, 10982, 10983, 10984, 10985, 10986,
-    10987, 10988, 10989, 10990, 10991, 10992, 10993, 10994, 10995, 10996,
-    19044, 5210, 8878, 5211, X, 5505, X, 5583, 5808, 6251, 19046, 5506, 5586,
-    5584, 5585, X, X, 5809, X, X, X, 5978, 6253, 6252, 6254, X, X, X, 7031, X,
-    X, X, 19489, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 13532, 13534,
-    13539, 13559, 7847, 7837, X, 13531, 7848, 7849, 13542, 13549, 13555, 16642,
-    16645, 19084, 9823, 16647, 16636, 16643, 16649, 9820, 9824, 9818, X, 19001,
-    16638, 16654, X, X, 16648, X, 16639, 16663, 16657, 16635, 17119, 16641,
-    9819, X, 16652, X, 16662, 9827, X, 9245, 9246, 16290, 9635, 9634, 16289, X,
-    17311, X, 17678, 17680, 17679, 10381, 10380, 10379, X, 10706, 18439, X,
-    10705, 18597, 18596, X, 10845, 18798, 7941, 15051, X, X, X, 15670, 16307,
-    X, X, 9640, 16312, 16311, 9638, 16306, 16310, 9639, X, X, X, X, X, X,
-    16873, X, 9938, X, 16868, 9934, X, 16865, 16871, 16874, X, 9939, X, 16870,
-    16867, 16875, 18275, 18280, 18282, 18285, 18269, X, 18289, 18290, 18283,
-    18287, 18278, X, 18464, 18467, X, 10709, X, 18466, 18471, 18469, 10710,
-    18460, 18450, 18449, 10712, 18462, 18463, 18459, 18451, X, 18456, 18286,
-    10390, X, X, X, 18295, 18294, 18297, 18296, 10631, X, X, 18474, X, 18476,
-    18475, 10714, 18628, X, 18737, 18738, 10818, 18876, 18901, 10886, X, 14365,
-    16883, 17348, 18045, 15056, X, 17349, 5076, 5079, 5080, 5083, 5084, X, X,
-    X, X, 5124, 5125, 5128, 5129, 5126, 5127, 5052, 5037, 5038, 5039, X, 5041,
-    5042, 5043, 5044, X, 5085, 5086, 5087, 5088, 5089, 5090, 5130, 5187, 5188,
-    11254, 5121, 11255, 5185, X, X, X, X, X, X, X, 18996, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, X, X, X, X, 5342, 5343, 5344, 5345, 5346, 5347, 5348,
-    5349, 5350, 5351, 5352, 5353, 5354, 5355, 5356, 12521, 7020, 12509, 7002,
-    X, 7005, 7004, 12522, 7018, 7007, 7027, 7029, 12516, 7026, X, 12524, 12510,
-    12525, X, 12514, X, 12523, X, 12515, X, X, X, X, 7010, X, X, X, 14140,
+    12276, X, 12269, X, X, 6772, 5634, 5895, X, 6462, X, 11910, X, X, 12282, X,
+    X, X, 12707, 12709, X, 12708, X, 12710, 7691, 13305, 12711, 19505, 13304,
+    13306, 13307, 13936, 8128, 13937, 13939, 8129, 8127, 13938, 12314, 6808,
+    12308, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    12729, 7220, 7225, 19142, 19544, X, 12738, 12744, 9007, 15316, 9011, 9018,
+    X, 15277, 15852, 15286, X, 9005, 9023, 9020, 9008, 15296, 15281, 9021,
+    15298, 9015, 9017, 9000, X, 15300, 15292, 15279, 9016, 15308, 15311, 15288,
+    15299, 19641, 9006, 9388, 12769, 12777, 12765, X, 7236, X, X, X, X, X, X,
+    X, X, X, X, 7738, 13359, X, X, 13361, 13357, X, 13369, 13355, 13368, 7734,
+    13353, 14000, 13363, 7737, X, 13364, 6842, 6843, X, 12345, 12339, X, 12344,
+    X, 12340, 6841, 12343, 12341, X, X, X, X, X, X, X, 12787, 12784, X, 12786,
+    7246, 7245, 7243, 12783, 12788, 7242, 7244, 12785, 13384, 16521, 16525, X,
+    9759, 19360, 17001, 10038, 10263, 10039, 10036, 16998, 16996, X, 16999, X,
+    17002, 10037, 17000, 16995, X, X, 17429, 17432, 17794, 17427, X, 18102,
+    17433, X, 10426, 17431, 10264, 7276, X, 12834, 12829, X, 13423, 19737,
+    12835, 7277, 7274, X, X, X, 13417, X, 13416, X, 13418, 13419, 13421, 13420,
+    13425, 7776, 7773, 7777, 13415, 7778, 13424, 7775, 13422, 7774, X, 8329,
+    8767, X, 14937, 14936, 14938, X, 15560, 15561, 9176, 9857, 9544, 9858, X,
+    17196, 17193, 17195, 17194, 10149, X, 17568, 17904, 17903, 11684, 7407,
+    7406, 13000, X, 13613, X, X, 11260, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19693, X, 5967, 11502,
+    11489, 5965, 11492, X, X, 11494, X, 6241, 11711, 11723, 6233, X, 11724,
+    6228, 6238, X, X, 6231, 11705, 6239, 11704, 11708, 11715, 11713, 6247,
+    6242, 11699, 11701, 6244, 6232, 19133, 16324, 10220, 5533, 5694, 5709,
+    5704, X, 5699, 5698, 5705, 5703, 5696, 5710, 5697, 5693, 5708, 5707, 5706,
+    5695, X, 5702, 19136, X, 5701, X, X, 5711, 5700, X, 19179, X, 12222, X,
+    12223, X, 6758, 12668, X, 7163, 7164, 12667, X, X, 19410, X, 7649, X, 7645,
+    X, 13257, 7652, 7651, 7644, 7647, 7650, 7646, X, X, 13870, 7643, 8084,
+    19416, 13289, 7669, 7690, 7680, X, 7684, 7683, 13267, X, 13296, 13302,
+    13294, 13301, X, X, 13282, 13268, 13300, 13284, 7672, 7685, X, 13293, 7678,
+    X, X, X, 13292, 13269, 7686, X, 7688, 15269, X, 15845, 15844, 9385, 15843,
+    15846, 16455, X, X, 16456, 16457, X, 16968, 10005, 10249, 17767, X, 10653,
+    11335, X, 6800, 12285, 7206, X, X, 7692, X, 8132, 13944, X, 8561, 13327,
+    7701, 13321, 13351, 7703, 13331, 7733, X, 7727, 13320, 7724, 7722, 7731,
+    13338, 7726, 12735, 13339, 7725, 13346, 7698, 13335, 7716, 13323, 7715, X,
+    7713, 7705, 7704, 13949, 13348, X, X, 10838, 18792, 10840, X, 18791, 18793,
+    10839, 18863, X, 18915, X, X, X, X, X, X, 6597, X, X, X, 8844, X, 15635, X,
+    16249, 9908, 9909, X, 6598, X, 5236, X, 5237, X, X, X, X, X, X, X, X, X,
+    5239, X, X, X, 5240, X, X, X, 5241, X, X, X, 5242, X, X, X, 5234, X, X, X,
+    16610, 10090, 17083, X, X, 10294, X, 17829, 17828, 10583, 18351, X, 18529,
+    10826, 11470, X, X, 6540, 6176, X, X, 12416, X, X, 12906, 12901, 12905,
+    12903, 7327, 9488, X, 16016, 16012, X, X, 16620, 16630, 9813, 9812, X,
+    16624, 16626, X, 16621, X, 16625, 16619, 16628, 9811, 16627, 16623, X,
+    16629, X, 16622, 10100, 17090, 17096, 10104, 10106, 10103, 12946, X, 12936,
+    X, 12945, 12930, 12934, 12957, 7377, 12949, 12940, 7361, 12955, 12926, X,
+    12948, X, 7376, 7371, 12925, 7369, 7368, 7373, 12947, 7365, 7372, 12453,
+    14158, 12942, X, X, 12932, 16029, X, 16059, X, X, 19221, 9505, 14849,
+    16041, 16032, 16035, 16073, 16042, 16033, 16031, 16028, X, 9498, 16051,
+    9497, 9501, 16046, 16054, 9491, 16070, 16074, 9493, X, 16037, 16057, 16061,
+    16034, 7855, 13566, 13565, 13578, 7857, 13567, 7859, 7854, 13570, 7863, X,
+    7860, 13574, X, X, X, 8307, 14223, X, 14212, 8304, X, 14891, 14221, 14209,
+    8302, 14214, 8305, 14218, 14216, 8308, 8301, 5940, 12475, X, 12983, 12984,
+    X, X, X, 14224, X, 18376, 18777, 5941, 6952, 12476, X, X, X, 13581, 7864,
+    X, 14226, 14225, 8309, X, 8734, 16109, 9517, X, 9518, X, X, 11141, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 11135, 11136, 11137, 11138, 11139, 11140,
+    11142, 11143, 11144, 11145, 11146, 11147, 11148, 11149, 11150, 11151,
+    12521, 7020, 12509, 7002, X, 7005, 7004, 12522, 7018, 7007, 7027, 7029,
+    12516, 7026, X, 12524, 12510, 12525, X, 12514, X, 12523, X, 12515, X, X, X,
+    X, 7010, X, X, X, 19489, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    13532, 13534, 13539, 13559, 7847, 7837, X, 13531, 7848, 7849, 13542, 13549,
+    13555, 16071, 9500, X, 9499, 16026, 9503, 16064, 16036, 16056, 16030,
+    16044, 16039, 9495, 9496, 16058, 16075, 16072, 16063, X, 19550, X, X, X, X,
+    X, X, X, 16027, X, 9492, 16651, X, 8860, X, 15664, X, X, 9244, 15665, X, X,
+    X, 16285, 16284, 9931, 9631, 9632, X, 16288, 16287, 16286, X, X, 16845,
+    16848, X, 16847, 16846, 9930, 17310, 17308, 17307, X, 10997, 10998, 10999,
+    11000, 11001, 11002, 11003, 11004, 11005, 11006, 11007, 11008, 11009,
+    11010, 11011, 11012, 11013, 11014, 11015, 11016, 11017, 11018, 11019,
+    11020, 11021, 11022, 11023, 11024, 11025, 11026, 11027, 11028, 5528, 5582,
+    X, 5581, 5671, 5670, 5806, 5805, 5807, 5804, X, 5976, 5975, 5977, X, X, X,
+    X, 6249, X, 6248, 6250, X, 6624, X, 5206, 12527, 5207, 7475, 5209, 5208,
+    13691, 7968, 13708, 7974, 7980, 8255, X, 19160, 7978, 13705, 7991, 7971,
+    7979, 13713, 14404, 13718, 13706, X, 13697, 13710, 13704, 7977, 13716, X,
+    X, 7973, 7993, 7986, X, 7975, 7972, X, 7983, 19203, X, 10397, 18057, 10546,
+    X, X, 18639, 18638, 10820, X, 5535, 5605, X, X, 6035, X, X, X, X, 12120, X,
+    X, X, X, 8004, 8005, 19206, 14431, 8910, 15113, 15719, 13175, 13174, 7545,
+    X, 7544, 7543, 7547, 7542, X, X, 13774, 13771, 8016, 13770, 13775, X, 8018,
+    13773, 8015, 8017, 13772, 19260, 14452, 19701, 14453, 14454, X, X, X, X,
+    8924, 8932, 11361, X, 11362, 19251, 11426, X, X, 6068, 11571, 11569, 6069,
+    11568, 11570, 11572, X, 6067, X, X, X, X, X, 6361, 6362, 6359, X, X, 6358,
+    12175, 6360, X, X, X, 19670, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 18999, 19427, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19320,
+    X, 9671, 16342, X, X, 9674, 16344, 9673, 16337, 16339, X, X, X, X, 9958,
+    16905, X, 9957, 16906, 9956, 16904, 9955, 16903, X, 10224, 10223, 17732,
+    17734, 19204, 17733, 10395, 10396, 10938, 11354, 19054, 5720, 11355, 5863,
+    X, 5861, 5862, 5864, X, 6054, 6053, X, 11551, 6055, X, X, 11552, 11798, X,
+    11799, X, 6334, 6336, 6338, 6335, 6339, 6337, 19266, X, X, 17447, X, 17800,
+    19445, X, 10433, X, 17798, 17799, X, 18107, 18110, 18108, 18109, 18338, X,
+    X, 10660, 18663, 18765, X, 10825, 18833, 18834, 10871, 5771, 6878, X,
+    14070, X, 13622, 13619, X, X, 14283, 8353, 14275, 14281, X, X, 8348, 8351,
+    14274, 8346, 14278, 14959, 8350, X, 14273, X, 14279, 14276, 14282, 14272,
+    14280, 8349, 8352, 14277, 8347, X, 8779, 16182, X, X, 16183, 16179, 9577,
+    9573, X, X, 9572, 9574, X, 16178, X, 16746, 9868, X, X, 16748, 9870, 16751,
+    16747, 16745, 16750, 9869, 16749, X, 9867, X, X, 10161, 10164, 13019, 7427,
+    7429, 13022, 13029, 13024, X, X, 7913, 13645, 13637, 13643, 13644, 7914, X,
+    13636, 13638, 12488, 13640, 13641, 13639, 8365, X, X, X, 14309, 16756,
+    14310, 14307, 7915, 8367, 14306, 9208, X, 15615, 14999, X, 9209, 15622,
+    15627, 15619, X, 15621, 15630, 15623, 15605, 15614, X, X, 9217, X, 9213,
+    15603, 15616, 9211, 15610, 9210, 15624, 15607, 15600, 9214, 15629, X, X,
+    10966, 10967, 10968, 10969, 10970, 10971, 10972, 10973, 10974, 10975,
+    10976, 10977, 10978, 10979, 10980, 10981, 10982, 10983, 10984, 10985,
+    10986, 10987, 10988, 10989, 10990, 10991, 10992, 10993, 10994, 10995,
+    10996, 16890, 9946, 16888, X, 16889, 16887, 16886, X, X, 16891, 9944, X, X,
+    17356, 17357, X, 15677, 17355, 9947, 10393, 17721, 17722, X, 10636, 10637,
+    18307, 18306, 10720, 10719, 18636, X, 5504, 13102, 7512, X, 7498, 7495,
+    13093, 7492, 19156, 13099, 19090, 7499, 13103, X, 13083, 13097, 7502,
+    13084, 13087, 13092, 19219, X, 7503, 7501, 7513, X, X, X, X, 7508, 19146,
+    7496, 7648, 9284, 15099, 15108, 8904, X, 8908, 15098, 15104, 15109, 15094,
+    8906, 15102, X, X, 15106, 15112, 15096, 15105, X, 8905, 15111, X, X, X,
+    15097, X, X, X, 9288, 15711, 9286, 9285, 16355, 16348, X, 16910, 9961,
+    16908, 16913, 16912, 16353, X, 9960, X, 16911, 16907, 16915, 16914, 9959,
+    X, 16909, X, 9677, X, X, X, 10225, X, X, X, 17365, 17736, 17737, 17738,
+    11565, 6206, 7567, X, X, 5548, 5724, 5723, 5722, X, X, 6065, X, X, 7117, X,
+    14467, 5549, 5550, 5551, 5615, X, X, 6705, X, 12166, X, X, X, 8026, 5552,
+    11333, 7593, X, 12624, 7591, 19355, X, X, X, 7594, X, X, X, X, X, X, X,
+    13209, 13218, 8043, 19356, 7596, 7601, 8044, 13220, 7608, 13810, 13210,
+    7600, 7603, 7598, 13208, 13222, 7638, 13253, 13229, 7627, 7631, 13252, X,
+    13239, 7632, 7626, 13228, 19385, 8063, 13255, 13237, 7637, 13240, 13254,
+    7636, X, 13834, X, 7617, 13235, 7622, 7633, X, 7628, 13244, 13234, 13232,
+    13250, 13882, X, X, X, 8535, 19345, 14537, 8532, 8533, 8531, 14542, 14541,
+    14538, 8537, X, X, 14540, 8096, X, X, 14544, 14539, 8534, 8530, 8536,
+    14543, X, X, X, 8977, X, 15222, 15804, 9371, 9379, X, 15833, 9380, 15805,
+    15839, 15826, 15832, 9377, 19470, X, 15829, X, 15836, X, 9382, X, 9376,
+    15822, 15809, 15841, 15806, 15834, 9373, X, 15816, X, 15817, 9372, 9369,
+    5903, 5906, X, X, X, 11645, 11643, 11630, 6140, 11637, 6135, 11631, X,
+    11639, 19188, 11636, 6138, 11635, 6145, 11644, 6147, X, 6149, X, 11629,
+    19524, 6136, 11646, X, 6143, 6146, X, 16675, 9506, 9828, 16685, 16681, X,
+    16679, 16674, 16689, X, X, X, 9832, X, 16670, 16682, 16683, 16673, 16672,
+    16686, X, 16676, 16671, 16677, X, 16688, 16669, 16687, 16684, 9830, 9829,
+    19768, 14238, 9153, X, X, 16110, 16117, 9520, X, 16121, 9524, 16113, 16111,
+    X, 16120, X, 9519, 16119, 9521, 9522, 16112, 9523, 16118, 16114, 16115,
+    16116, 9159, X, X, X, 16690, 16702, 16704, 16716, 16705, X, 16711, X, 9841,
+    9847, 16717, X, X, 9843, X, 9853, 9848, 16719, 16713, 9844, 16706, 9854,
+    16707, 16708, 9855, 9852, 9531, X, 9842, 16720, 9856, X, 9849, 16718,
+    16155, 16157, X, 9558, X, 16731, X, 16732, 10155, X, 17910, 17912, 17909,
+    17911, 18171, 18389, X, X, 18887, 6197, 6963, 13005, 13007, 13006, X,
+    13620, 7894, X, 13618, X, 7893, 13621, 14970, 14969, 14974, 8788, X, 14971,
+    14967, 14972, 14973, 8789, 8791, 14975, X, 15582, 15581, X, 15579, 15580,
+    9187, 9189, 9186, 9188, 16184, 16185, 16180, X, 16181, 9570, 9575, 9569,
+    9576, 9571, 11692, 11688, 6208, 6211, X, 11689, 6210, 11691, X, X, 6209, X,
+    X, X, X, 12047, 12049, 6583, 12045, 12048, 12046, 6581, 6584, X, 6582, X,
+    X, X, X, 12489, 12493, 12490, 8819, X, X, X, X, 8828, 15002, X, 14991,
+    8826, 15001, 8822, 15019, 8827, 15017, 15005, 15015, 8824, 14992, 15018,
+    15013, X, 15020, 8816, X, X, 8831, 8821, X, X, 14998, X, 11152, 11153,
+    11154, 11155, 11156, 11157, 11158, 11159, 11160, 11161, 11162, 11163,
+    11164, 11165, 11166, 11167, 11168, 11169, 11170, 11171, 11172, 11173,
+    11175, 11176, 11177, 11178, 11179, 11180, 11181, 11182, 11183, 11184,
+    13066, 13054, X, 7460, X, 13059, 13065, 7459, 13052, 7463, 13056, 13049,
+    7461, 13053, 7466, 7471, X, 13070, X, 13048, X, 7467, X, 13069, X, X, 7462,
+    13055, 7458, 13050, 13046, 13060, 6283, 11741, 11743, X, 6286, X, 6288,
+    11739, 11744, X, X, 6297, 6293, 11752, 6299, 19147, 6290, 11742, 6287, X,
+    X, 6282, 6280, X, 11756, X, 6294, X, X, X, X, X, 5204, X, X, X, X, X, X, X,
+    X, X, 5200, X, X, 5161, 5160, X, X, 5196, X, X, X, X, X, X, X, X, X, X,
+    19603, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    19749, X, X, X, X, X, X, X, X, X, 19622, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, 19435, X, X, X, X, X, X, X, X, X, X,
+    7160, 12652, 7158, 7159, 12642, 12658, X, 7149, X, X, 13226, 12660, 12654,
+    X, 12645, X, 12663, 12648, 7155, 13249, 12651, 7157, 7148, X, 8250, 8252,
+    14112, X, X, 8251, 14115, 8245, 14123, 14116, 14120, X, 14118, 8248, 14111,
+    8253, 7801, 8249, 8254, X, X, X, X, X, 8675, 14787, 14789, 14791, 14795, X,
+    14785, 14132, 14133, 14131, X, 8686, 14803, 14802, 14804, 8685, 8684, X, X,
+    16001, 16003, X, 9482, 16002, 16614, 9806, 17484, X, 17483, 10451, 17832,
+    10453, 10452, 18133, 18352, 10664, 5919, 12419, 6906, 18843, 18844, 10794,
+    5929, X, 6554, 14148, 9120, 10107, 17097, 5930, X, 7353, 7352, 14149,
+    19723, X, X, 16631, 5931, 6924, X, X, 14150, 14151, 14152, 9121, 9814,
+    5932, X, 6555, 12443, 7846, X, 7838, 13528, 13533, 13550, 13556, 7851,
+    13529, 13541, 13547, 7841, X, X, 13558, 13551, 13554, X, X, X, X, X, X, X,
+    X, 19679, X, X, X, 7840, X, 14174, 16642, 16645, 19084, 9823, 16647, 16636,
+    16643, 16649, 9820, 9824, 9818, X, 19001, 16638, 16654, X, X, 16648, X,
+    16639, 16663, 16657, 16635, 17119, 16641, 9819, X, 16652, X, 16662, 9827,
+    X, 17309, X, 10377, 17674, 17675, 10378, X, 17673, X, 17995, 17994, 17997,
+    10526, 17996, X, 18251, 18253, 18252, X, X, 18434, 18437, 18435, 18436,
+    18593, 10767, X, X, X, 18703, 18704, 18260, 18604, X, X, 18601, X, 18598,
+    X, 18599, 10768, 18709, 18711, 18714, 18710, 18715, X, 18708, X, 18706, X,
+    10813, 18712, 10815, 10814, 18707, 18713, X, X, X, X, 18803, 10846, 10389,
+    10532, X, X, X, X, X, 17326, 18041, 18032, 10534, 18028, 10535, X, X,
+    18037, 18031, 18021, 10533, 18034, 18029, 18030, X, 18016, 18023, 18038, X,
+    18035, X, 18027, X, 18039, 18817, 18875, X, X, 18952, 7945, X, 15674, X,
+    9641, X, X, X, 16880, 16879, X, 17345, X, X, X, 10539, 10630, 18627, 18945,
+    X, X, X, 7946, 9250, X, 9642, X, 19512, X, X, 19040, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19516, X, X,
+    X, 6696, 6693, 6695, 6697, 6694, 12598, 12144, X, 19372, X, 12600, 12599,
+    7100, X, 7096, X, X, 7097, 7099, 7101, 7098, X, 7103, 7102, X, X, X, X, X,
+    7546, 15748, 9309, 9307, 8938, X, X, 16373, 16371, 16372, 15746, 16921,
+    9969, 16920, 17369, 17370, 16374, 17740, X, 5553, 5727, 5871, 11425, 5870,
+    X, 6357, 8484, 19300, 5616, 5728, 6709, 8031, 10941, 8058, 8498, X, 13826,
+    13831, 13819, 8508, X, 8499, 8057, 13817, 13832, X, 8507, 8055, 8492,
+    13829, X, 8059, 13821, 13815, 8049, 13818, X, 13827, X, 8491, 8496, 8046,
+    13828, X, 8494, 13845, 8073, X, 8071, 12647, 13838, X, 14529, 13839, 8066,
+    8079, 14501, X, 8075, 8076, 13840, 13863, 14500, 13848, 13843, 8078, 13849,
+    13846, X, 19395, 8083, X, X, X, X, X, X, 18257, 18263, 18261, 18255, 18266,
+    X, 18254, X, 10628, 18262, X, X, X, 18258, 10627, 18265, X, X, 18264, X, X,
+    X, X, 18442, 18441, X, X, 19212, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 10965, X, X, 8086, 8087,
+    13869, 13872, 8085, 13867, 13871, X, 13868, X, 8527, 19415, X, 14534, X, X,
+    8971, 15218, 9706, 9361, 15791, 9362, 9363, 15793, 15792, 15794, 16407, X,
+    X, 16406, 13295, 7689, 7671, 13276, 13297, X, 19214, 7677, 7687, 13278,
+    13288, 13273, 13277, 7682, 13272, 7670, 7679, 7676, 13281, 7189, 13910,
+    7673, X, X, X, X, X, X, X, 19635, X, X, 9831, 16680, 17532, X, X, X, X, X,
+    17138, 10127, 17142, 17139, 17146, 17152, 17141, X, 17161, 10124, 17155,
+    17144, 17156, 17151, 17158, 17143, 10129, 10128, 17145, 17159, 17137,
+    17157, 10467, 17880, 17876, 18159, 10597, X, 18160, X, X, 18378, 10672,
+    18380, 10673, 18377, 18379, 10746, X, 18544, 10745, 18681, 18680, X, 18679,
+    X, X, 18848, 18849, 18851, 18850, X, 11477, 5943, 10143, X, 17181, 17549,
+    17563, 17558, 17560, 17548, 10318, X, 17547, 10321, 10320, X, 17562, 17554,
+    17551, 17557, X, 17550, X, 17552, 17561, 17559, X, 10319, 17566, 17564,
+    17555, 17565, 17556, X, 19450, 19620, 19413, 19659, X, 19668, 19619, 19412,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 5168,
+    X, X, X, 5169, X, X, X, X, X, X, 13934, X, X, X, X, 13892, X, X, X, X,
+    14588, 8546, X, 14586, 14565, 14570, 14563, 19485, 14582, 14549, 14556, X,
+    14580, 14590, 14566, 19072, 14553, 12288, 19515, 12719, 12718, 12716, X,
+    12715, 12720, 12717, X, X, 7693, 7694, X, X, 8133, 13945, X, 13946, 13947,
+    X, X, X, 14602, 14603, 14601, X, 14599, 14600, 8563, 15272, 15849, 13325,
+    X, X, 13970, X, 7706, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, 8165, 7719, 8147, 13964, 8161, X, 13952, 9743, 9733, 16485, 16465, 9735,
+    16477, 9742, 9737, 16475, 16971, 16481, 16487, 16480, 16463, 16478, 16489,
+    16491, 9732, 16490, 9738, 9744, X, 9741, X, 16484, 9740, 16479, X, 16467,
+    16472, X, 16483, 15320, 15326, 15322, X, 9033, 15321, 15325, 15317, X,
+    15319, 9032, X, X, X, X, 15323, 15318, X, 9034, X, 9029, X, 19605, 15327,
+    X, 9030, 15896, 15893, 15905, 15899, 15901, 9409, 15914, 15917, 15920, X,
+    X, 16516, 16513, 16514, 9757, 16512, 16518, 16517, 16515, X, 16992, 16993,
+    10034, X, 10035, 16991, X, 10262, 17426, 10261, 10424, X, 10425, 10564,
+    18101, 18100, 18335, 18510, 15344, X, 15345, 15346, 9045, X, X, 15932,
+    15931, X, X, 16526, 9764, 9765, 19696, 17006, 17003, 17004, 17005, 17436,
+    17435, 10265, 17796, 18336, 5758, X, 6851, X, 7757, 14698, 19698, 5759,
+    15362, 15357, 15360, 15365, 9054, 15359, X, 9434, 15950, 15949, X, 9437,
+    9435, 15947, 9433, 15948, X, 9436, X, X, X, 16546, X, 16548, X, 16547,
+    16539, 16543, 16542, 16540, 9772, 9773, 8660, X, 14756, X, X, X, 15395, X,
+    15394, X, X, 15390, X, X, 9067, 15393, 15392, 9068, X, X, X, X, X, 9450, X,
+    15969, X, 9451, 9447, 9449, X, 9446, 10065, 9791, 16581, 16571, 9789,
+    16575, 9793, 16572, 16577, 9792, 16580, 16583, X, X, X, X, 17061, 17062,
+    17046, 17053, 17051, X, X, 10063, 17058, 16578, X, 17049, X, 17059, 10062,
+    17048, 7316, 7312, 7317, X, X, X, X, X, 13487, 13480, X, 8247, 13479, X,
+    7802, 7809, 7806, 7812, 7811, 7807, X, 13473, 13476, X, 13475, 7803, 13477,
+    13486, 7804, 13474, 13483, 13484, 18132, 18131, 10582, X, X, X, 18349,
+    18346, 18347, X, 18345, 18348, 10663, 18350, X, 10662, X, 18528, X, 10791,
+    10793, 18666, 10792, 18770, 18840, 18842, 18839, 18841, 10877, X, X, X,
+    19645, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19009, X, X, X, X, 8047, X, X, X, 8506, 15169, 14492, X,
+    14484, 15168, X, 14488, 14490, X, X, 14487, X, 8505, X, 14486, 8509, X, X,
+    X, 15184, X, X, 8504, 8949, 14505, 14532, 14514, 14515, 14506, 14526,
+    14517, 14527, 14519, X, 8515, 15191, 8518, 8516, 14531, 14522, 14518, X, X,
+    14507, 8968, 14521, 8523, 14513, 19394, 14512, 19408, X, X, 8517, 8513,
+    15212, 10407, X, X, 18072, 18073, X, 10557, X, 18071, 10649, X, 18651,
+    10784, 18755, 18756, X, 5631, X, 5888, 5889, 6111, X, 11886, 6771, 7176,
+    7666, X, X, 7491, X, 8100, 8101, 15812, 9375, X, 9368, X, 15835, 15838,
+    15819, 16432, X, X, X, 19684, X, X, X, X, X, 16424, X, 16420, 9725, X, X,
+    9714, 9719, 9715, 16434, 16445, 9713, 16426, 16435, 11937, 6130, 6153,
+    6144, 11632, 6133, 6148, 11640, 6131, 6132, 11935, 11633, 6139, 6150,
+    11647, 11634, 6137, X, 6142, 11915, 6151, 11641, 6141, X, 6152, 6129,
+    11638, 6134, 11642, 11936, X, X, 13034, 7920, 13656, X, 7919, 7921, 13661,
+    7923, 13658, 13659, 13651, 7922, 13662, X, X, 13653, X, 13654, 13652, 7918,
+    X, 13660, 13655, 13657, X, X, X, 14332, X, 14331, 9881, 9893, 9886, 16775,
+    16791, 16785, 9892, 16765, 10177, 16793, 16796, 9888, X, 16779, 9895, 9885,
+    X, X, X, 9884, 16789, 16795, 9882, X, 16772, 16794, X, X, 16773, X, X, X,
+    19296, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 19064, X, X, X, 13505, X, X, 7821, 13504, 13506, X, 7820,
+    X, X, X, X, 14136, 14137, 14135, 8259, X, X, X, 8687, X, 8688, X, 9111, X,
+    15451, 15450, 9110, X, 17955, 10354, 10512, X, 18790, X, X, 6596, 7936,
+    7935, X, X, X, X, 8401, 14357, 14356, 8402, X, X, 15034, 8843, 8840, 15033,
+    8842, 15031, 8841, X, 15032, X, 15634, 17262, X, 17639, 17638, 10359,
+    17640, 17960, 10514, 17959, 17956, 10513, 17957, 17958, X, 18220, 18221,
+    10618, X, 10695, X, X, 18415, X, X, 10693, 10694, 18416, X, X, 10758,
+    10759, 18575, 15640, 15644, 15641, 15639, 15643, 9231, X, 19178, 16252, X,
+    16250, 9612, X, 9611, 16251, 9613, X, X, X, X, 16821, X, X, 16820, 9911,
+    16819, 17267, X, 17269, 17271, 17270, X, 18966, 18977, 18986, 18968, 18973,
+    18982, 18964, 18979, 18988, 18970, 18976, 18985, 18967, 5243, 5244, 5246,
+    5245, 5255, 5256, 5257, 5050, X, X, X, X, X, X, X, X, X, X, X, 19542, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19027, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19533, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19497, X, X, X, X, X, X, X, X, X, X, X, X, 19687, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19477, X, X, X, X, X, X, X, X,
+    19579, X, X, X, X, 19024, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19281, X, X, X, X, X, X, 19264, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, 19056, X, X, X, X, X, X, X, X, X, X, X, X,
+    19702, X, X, X, X, X, 19675, X, X, X, X, X, X, X, X, X, X, X, X, X, 11314,
+    14598, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19367, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, 19481, X, 12273, 6779, 6792, 19498, 12268,
+    12258, 6785, 12256, 6778, 12251, 6788, 12264, 12245, 12247, X, X, X, X,
+    19007, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, 19057, X, X, X, X, X, X, 19000, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19511, X, X, X, X, X, X, X,
+    5390, 5391, 5392, 5393, 5394, 5395, 5396, 5397, 5398, 5399, 5400, 5401,
+    5402, 5403, 5404, 5405, 5406, 5407, 5408, 5409, 5410, 5411, 5412, 5413,
+    5414, 5415, 5416, 6627, X, 7034, X, 7032, 7033, X, X, X, X, 9652, 10932,
+    5674, X, X, X, 5811, 11394, 19058, 19067, X, 19004, 5979, 5980, 19059,
+    11504, X, X, 11726, 6255, 11727, X, 10944, 6074, 19328, 6073, 6715, X,
+    12619, X, 7581, 7853, 7582, 7580, 8037, X, 15166, 8946, 9317, 19331, 11316,
+    11429, X, 11576, 6075, 11575, 6076, X, 19074, 6370, 11830, 11829, 6369,
+    16928, X, X, 10227, 16930, 16929, 9975, 16927, 16931, 17380, 17376, 17378,
+    X, 17373, 17374, X, 17377, 17375, 10401, X, X, 10404, 10403, 10402, 10552,
+    18065, 10553, 17742, 10644, 18318, 10645, 10728, 10405, 17385, X, 17386,
+    17382, X, 10232, 17743, X, 17746, X, X, 17747, 17745, 17748, 10406, 17744,
+    X, X, 18069, 10555, 18068, 18067, 18066, 10554, 10556, X, 18319, 10647,
+    10646, 19384, X, 6548, 6546, 12007, X, 6545, X, X, X, 6550, 6552, 6549, X,
+    12010, 12006, 6553, X, 6547, 6183, X, 6551, 12009, X, X, 12008, X, 6544, X,
+    X, X, X, X, 16010, X, X, 16011, X, X, X, X, 16618, X, X, 10096, 10095,
+    10093, 10094, 10097, X, 17487, 10298, 10297, 17835, 18135, X, X, X, 10743,
+    10742, 5925, 12012, 12026, 12032, 6569, 12029, 6566, X, 12019, 12025,
+    12027, X, 12014, 6565, 6560, 12020, 6567, 6570, 6564, X, 6557, 12024,
+    12018, 12031, 6572, 6568, 6563, 12023, 7360, 12021, 6561, 6571, X, 17658,
+    X, 17977, X, 10522, X, 17976, 17975, 10523, X, 18236, 18235, X, 18233, X,
+    18232, 10621, 10620, 18237, 18580, 10763, 18424, 10699, 18423, 18234, X,
+    18581, 10806, X, 10866, 18865, 18894, X, 10875, X, 18921, 10876, 18922,
+    18923, 18937, 18936, 10891, 18947, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, 19686, X, X, X, X, X, X, X, X, X, X, X, X, 19263, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19165, X, X, 19572,
+    X, X, X, X, X, X, X, X, X, X, 7112, 19278, 7111, X, 12604, 7108, 12606,
+    19279, 7113, 12607, X, X, 7116, X, 7114, 12608, 12165, 12610, X, 7110, X,
+    7109, X, 12605, 18063, 18064, X, 5620, X, 5732, X, X, X, 11363, X, X, 6078,
+    6080, X, 11432, 11579, 11578, 11577, X, 11431, 11430, 5875, 6079, 6077,
+    5874, X, X, X, 6371, 11831, 19426, 6392, 6739, 12201, 12202, X, X, 12638,
+    7143, 7613, 8061, 13833, 5623, X, 5557, 5624, X, 11365, 5737, 5736, 5734,
+    5735, X, X, X, 5882, 11439, 11441, 5881, 11433, X, 11434, X, 14109, 14106,
+    13472, X, 8242, X, 18961, 14108, X, X, X, X, X, X, 14780, X, 8671, 14778,
+    8672, 14779, 8673, X, X, X, 9084, 15419, 15416, 15418, 9085, 9086, 15417,
+    16596, 16592, 16602, 9800, 16609, 16608, X, X, X, 17076, 17072, 10079, X,
+    17066, 10073, 10089, 17078, 10081, 10077, 17069, 10084, 10087, 17080,
+    10076, 17071, 10085, 17082, 17079, 17067, 10080, 10074, 10088, 12921,
+    12919, 7339, X, X, 7341, 7344, X, 7347, X, 7349, X, X, X, X, X, X, X, X, X,
+    X, 13516, 7823, X, 13507, 13509, X, 13510, X, 13518, 13514, 13512, 12013,
+    X, 12028, 12030, X, X, X, X, X, X, X, X, X, X, X, X, X, 6942, 6936, 6944,
+    6941, 12452, 12455, 6937, X, 12446, X, 6930, 6940, X, 6943, 6945, 9136,
+    15472, 15466, X, 9129, 14872, 9128, 15483, X, 9126, 9141, 9134, 15484,
+    15473, 15465, 15492, 15477, 9140, 15496, 9137, 15495, X, 15489, 15494, X,
+    X, X, 15497, X, X, X, X, 19215, X, 19661, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19689, X, X, X, X, X, X,
+    19548, X, X, X, X, X, X, 19402, X, X, X, X, 19583, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, 9942, X, X, 10399, 18305, 18484, X, 10777, 18634, X, X,
+    18955, X, X, X, 9943, X, X, X, 19107, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, 19484, X, X, X, 14140,
     14821, X, 8267, 14144, X, X, 14141, 8263, 8269, 14146, 8265, 14143, 9113,
     8264, 14142, 8270, 8262, 8261, X, X, X, X, X, 14813, 14811, X, 14817, X,
-    17658, X, 17977, X, 10522, X, 17976, 17975, 10523, X, 18236, 18235, X,
-    18233, X, 18232, 10621, 10620, 18237, 18580, 10763, 18424, 10699, 18423,
-    18234, X, 18581, 10806, X, 10866, 18865, 17671, 10376, 17993, X, X, X,
-    18250, 18248, X, X, 18249, X, X, 18433, X, 10704, 18592, 10812, 10766,
-    10810, 10811, 18797, 10867, X, 7451, X, X, X, 17672, X, X, 13040, 18001,
-    18014, 18005, X, 18003, 18012, 18004, 10528, 10527, X, 17999, 18000, 18009,
-    X, X, X, 18006, X, X, X, X, X, X, 18256, 18259, X, X, X, X, 10384, X, X,
-    19202, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
-    X, X, X, X, X, X, X, 19089, 19471,
-]; // 26484 entries
+    9923, X, X, 16827, 17281, X, 16829, 9920, 16830, 17284, 17282, 17283,
+    17288, 10373, 17287, 17290, 17289, 17286, 17285, X, 10203, X, X, X, X,
+    17660, X, 17659, 10372, 10370, 10371, 17671, 10376, 17993, X, X, X, 18250,
+    18248, X, X, 18249, X, X, 18433, X, 10704, 18592, 10812, 10766, 10810,
+    10811, 18797, 10867, X, 7451, X, X, X, 17672, X, X, 13040, 18001, 18014,
+    18005, X, 18003, 18012, 18004, 10528, 10527, X, 17999, 18000, 18009, X, X,
+    X, 18006, X, X, X, X, X, X, 18256, 18259, X, X, X, X, 10384, X, X, 19202,
+    X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X, X,
+    X, X, X, X, X, 19089, 19471,
+]; // 26486 entries
 
 #[cfg(not(feature = "no-optimized-legacy-encoding"))]
 const BACKWARD_TABLE_UPPER: &'static [u16] = &[
-    0, 0, 0, 0, 0, 17555, 23867, 8527, 0, 0, 20851, 0, 0, 0, 0, 0, 0, 0, 17423,
-    12567, 15275, 0, 5124, 0, 0, 0, 0, 0, 26263, 9874, 16460, 0, 3348, 9012,
-    2173, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 6023, 9171, 5089, 0, 0, 15226, 0, 0, 0, 0, 0, 0, 0, 5891,
+    16439, 1624, 0, 4896, 0, 0, 0, 0, 0, 777, 19677, 17801, 0, 22352, 23557,
+    20760, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -3726,87 +3729,86 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6112,
-    3565, 0, 0, 0, 25058, 0, 0, 17008, 19409, 0, 10455, 15802, 263, 0, 13621,
-    8727, 20299, 24899, 23788, 14801, 22996, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    6652, 23212, 0, 2813, 0, 0, 0, 0, 930, 5397, 6427, 11215, 5972, 1856, 4513,
-    13074, 18440, 0, 3879, 0, 0, 0, 0, 0, 0, 5036, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6379,
+    8116, 0, 0, 0, 18595, 0, 0, 5476, 21877, 0, 9963, 3467, 19212, 0, 11511,
+    5289, 17114, 18436, 9092, 24449, 10969, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2422,
+    13080, 0, 1501, 0, 0, 0, 0, 22132, 4163, 15874, 25271, 6239, 4415, 4565,
+    14882, 15049, 0, 9643, 0, 0, 0, 0, 0, 0, 24251, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    22370, 9718, 14131, 11934, 0, 24865, 0, 0, 0, 0, 0, 0, 8362, 20041, 25964,
-    15087, 18938, 3659, 24407, 22844, 11550, 25507, 0, 0, 0, 0, 5717, 0, 0,
-    8587, 0, 0, 0, 18276, 0, 0, 0, 0, 0, 0, 20923, 1085, 19503, 0, 0, 0, 0,
-    8491, 0, 0, 0, 0, 0, 0, 0, 26450, 0, 5033, 0, 0, 0, 16210, 18745, 0, 0,
-    8639, 22127, 17486, 5996, 17321, 20140, 0, 0, 0, 0, 10068, 0, 8692, 0, 0,
-    0, 16687, 24971, 0, 0, 15700, 0, 13977, 0, 0, 0, 0, 15020, 0, 18449, 17137,
-    0, 6099, 6205, 0, 0, 24852, 0, 0, 12382, 15959, 22210, 11283, 17374, 0, 0,
-    0, 0, 0, 22214, 11270, 0, 11317, 5751, 0, 23824, 18757, 17067, 19527, 0, 0,
-    18583, 0, 0, 18607, 17495, 0, 9777, 0, 1670, 0, 0, 0, 0, 0, 8485, 0, 0, 0,
-    0, 0, 13665, 0, 9615, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24001, 0, 12453,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24933, 12449, 21209, 8202, 0, 0, 11786,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10129, 0, 0, 0, 0,
-    15962, 0, 0, 6411, 19693, 15753, 0, 0, 11752, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 17146, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25024, 17254, 0,
-    0, 0, 0, 0, 0, 0, 20565, 16788, 10801, 21278, 7671, 5369, 4783, 18311,
-    22688, 2338, 13112, 12702, 66, 21397, 19443, 23246, 1119, 26295, 9906,
-    3380, 9044, 384, 21812, 8759, 23028, 6684, 6459, 25996, 15119, 3691, 7857,
-    24439, 11582, 6939, 9427, 2592, 5783, 20597, 16820, 10833, 5151, 21310,
-    7703, 4815, 7096, 18343, 4594, 2370, 3913, 13144, 12734, 21429, 19475,
-    1151, 9938, 416, 9749, 13726, 8791, 14162, 23060, 8393, 6716, 18969, 6491,
-    20347, 7889, 9459, 2624, 10482, 5815, 16852, 10865, 5183, 21342, 22875,
-    4847, 7128, 20954, 4626, 3945, 21461, 24025, 11968, 1183, 448, 6236, 8823,
-    19284, 14194, 23092, 8425, 6748, 19001, 6523, 20379, 9491, 5847, 16884,
-    10897, 18089, 4879, 7160, 20986, 97, 21493, 12000, 20174, 1215, 14011, 480,
-    6268, 23277, 4297, 8855, 19316, 15829, 8457, 8045, 11810, 20411, 9523,
-    16916, 15339, 10929, 18121, 4911, 7192, 3126, 21018, 21525, 12032, 20206,
-    14043, 9075, 512, 15150, 6142, 6300, 3722, 23309, 4329, 15861, 8077, 11842,
-    20443, 9555, 16086, 15371, 10961, 4943, 7224, 3158, 10233, 21557, 12064,
-    9107, 11613, 20628, 544, 15182, 3754, 23341, 4361, 15893, 7797, 2843,
-    18812, 8109, 19596, 9587, 290, 16118, 15403, 10993, 4975, 25614, 7256,
-    3190, 10265, 1886, 21589, 7734, 9139, 11645, 20660, 2401, 5066, 576, 15214,
-    13175, 3786, 4393, 7829, 9969, 13757, 2875, 18844, 16150, 11025, 25646,
-    7288, 3031, 3222, 7920, 11453, 10297, 22400, 10513, 1918, 21621, 12789,
-    9171, 20692, 13493, 2433, 5098, 14828, 608, 15246, 15992, 13207, 5214,
-    4657, 4425, 10001, 2907, 11057, 25678, 7320, 19723, 3063, 3254, 7952, 3976,
-    10329, 22432, 10545, 12821, 9203, 13525, 14860, 640, 13239, 4457, 7447,
-    4689, 10033, 2939, 11089, 25710, 19755, 7984, 8236, 4008, 10361, 22464,
-    10577, 9235, 13557, 14311, 14892, 672, 25092, 7479, 2971, 11121, 25742,
-    19787, 8268, 4040, 22496, 10609, 9267, 14343, 14924, 24056, 14225, 16237,
-    25124, 7511, 3003, 6779, 11153, 25774, 19819, 8300, 4072, 22718, 3410,
-    22528, 10641, 9299, 19032, 14375, 24088, 16269, 21842, 25156, 7543, 6811,
-    25806, 19851, 4104, 22750, 3442, 22560, 10673, 19064, 14407, 24120, 21874,
-    25188, 6554, 7575, 24469, 6843, 2654, 25838, 4136, 3474, 22592, 22905,
-    10705, 5878, 128, 1245, 19347, 16947, 19096, 14439, 24152, 21906, 25220,
-    8885, 6586, 18151, 7607, 9811, 24501, 2686, 25870, 21049, 4168, 14074,
-    11873, 3506, 22937, 10737, 160, 1277, 16979, 14471, 24184, 21938, 25252,
-    18183, 24533, 2718, 21081, 4200, 11905, 3538, 22969, 6330, 192, 1309,
-    14503, 24216, 21970, 25284, 18215, 24565, 12095, 1697, 2750, 21113, 1341,
-    14535, 23372, 24248, 22002, 25316, 18247, 959, 24597, 12127, 1729, 21145,
-    0, 0, 0, 0, 23902, 5426, 1373, 22243, 14567, 23404, 24280, 22034, 19627,
-    12482, 15462, 320, 15434, 3816, 25348, 991, 11676, 26324, 24629, 12159,
-    23934, 5458, 1405, 14599, 23436, 24312, 13788, 22066, 19659, 15494, 1023,
-    24661, 12191, 23966, 26025, 18875, 5490, 1437, 14631, 16181, 6968, 23468,
-    24344, 21651, 13820, 22098, 17580, 15526, 12223, 26057, 5522, 1469, 14663,
-    7000, 1949, 23500, 21683, 13852, 16023, 20470, 3285, 17612, 20722, 15558,
-    1501, 14695, 7032, 12852, 2463, 1981, 23532, 21715, 13884, 3317, 13270,
-    17644, 4720, 1533, 14955, 14727, 14256, 9330, 12884, 16300, 19882, 2495,
-    2013, 23564, 7350, 21747, 13916, 6874, 13302, 17676, 1565, 14759, 9362,
-    12916, 16332, 19914, 0, 0, 0, 0, 10138, 5909, 19378, 2527, 2045, 23596,
-    7382, 13948, 0, 0, 23181, 13334, 17708, 19127, 1597, 12948, 16364, 19946,
-    10170, 8916, 5941, 2077, 23628, 13366, 17740, 19159, 1629, 706, 23121,
-    4487, 12980, 16396, 19978, 9842, 8948, 2109, 23660, 25901, 13398, 17772,
-    19191, 738, 23153, 13012, 16428, 20010, 10391, 8980, 20235, 2141, 23692,
-    25933, 13430, 17804, 19223, 770, 13044, 10423, 20267, 23724, 14105, 17836,
-    4231, 19255, 802, 23756, 17868, 4263, 0, 0, 0, 0, 0, 0, 3628, 834, 223,
-    17900, 255, 6620, 866, 17932, 2781, 898, 1760, 17964, 22274, 1792, 17996,
-    11183, 22306, 1824, 18028, 12513, 3847, 22338, 18060, 25379, 12545, 0,
-    16495, 25411, 8330, 16527, 11707, 26355, 19690, 15055, 1054, 24692, 22780,
-    18906, 25443, 16559, 11739, 0, 20076, 26387, 24375, 12254, 24724, 26088,
-    22812, 25475, 16591, 20108, 26419, 5002, 5553, 12286, 24756, 0, 0, 0, 5241,
-    26120, 16623, 5585, 12318, 5273, 26152, 20501, 20753, 16655, 0, 0, 18519,
-    5617, 12350, 5305, 26184, 18551, 20533, 20785, 5337, 22180, 5649, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    21561, 16229, 1024, 13654, 0, 18402, 0, 0, 0, 0, 0, 0, 13942, 10463, 22982,
+    22508, 222, 8210, 11837, 10562, 25606, 18028, 0, 0, 0, 0, 7169, 0, 0, 5149,
+    0, 0, 0, 12574, 0, 0, 0, 0, 0, 0, 15298, 9332, 23649, 0, 0, 0, 0, 5053, 0,
+    0, 0, 0, 0, 0, 0, 26452, 0, 24248, 0, 0, 0, 7902, 20476, 0, 0, 5201, 26210,
+    5954, 6263, 5789, 24060, 0, 0, 0, 0, 12095, 0, 5254, 0, 0, 0, 3747, 18508,
+    0, 0, 3365, 0, 8460, 0, 0, 0, 0, 21494, 0, 15058, 5605, 0, 6366, 22731, 0,
+    0, 18389, 0, 0, 7648, 15523, 25111, 25339, 5842, 0, 0, 0, 0, 0, 25115,
+    25326, 0, 25373, 7203, 0, 9128, 20488, 5535, 23673, 0, 0, 20314, 0, 0,
+    20338, 5963, 0, 16288, 0, 2909, 0, 0, 0, 0, 0, 5047, 0, 0, 0, 0, 0, 11555,
+    0, 16126, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21311, 0, 26297, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 18470, 26293, 13398, 6597, 0, 0, 25934, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12156, 0, 0, 0, 0, 15526, 0, 0,
+    15858, 3066, 3418, 0, 0, 25900, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    5614, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18561, 5722, 0, 0, 0, 0, 0, 0,
+    0, 14130, 3848, 7715, 13467, 10719, 4135, 20925, 12609, 66, 6883, 14920,
+    21911, 13114, 8707, 9366, 809, 19709, 22384, 23589, 5321, 11001, 16574,
+    13272, 2454, 15906, 23014, 22540, 8242, 11869, 25638, 20603, 7235, 14162,
+    16925, 2040, 11352, 3880, 7747, 13499, 10751, 4923, 20957, 12641, 6915,
+    8620, 14952, 4646, 21943, 9677, 8739, 9398, 19741, 23621, 16606, 2486,
+    15938, 16260, 11616, 23046, 1055, 22572, 13973, 20635, 253, 2072, 17162,
+    11384, 3912, 13531, 9990, 10783, 4955, 20989, 6947, 8652, 10593, 4678,
+    9709, 15329, 19773, 16638, 15970, 21335, 15683, 23078, 1087, 22762, 22604,
+    12354, 14005, 20667, 285, 2104, 17194, 3944, 10815, 4987, 21021, 4710,
+    9741, 19361, 15361, 16002, 15715, 13145, 23110, 1119, 13688, 22794, 24094,
+    22636, 12386, 840, 8494, 317, 10847, 3494, 5019, 10146, 25958, 4742, 9773,
+    19393, 20096, 15393, 15747, 16034, 23142, 1688, 1151, 13720, 24126, 22668,
+    12418, 11032, 872, 11900, 6409, 8526, 25669, 3526, 10178, 25990, 4774,
+    9805, 20128, 15425, 6472, 16066, 23174, 1720, 13752, 24158, 24891, 11064,
+    904, 11932, 14193, 7778, 25701, 3558, 10210, 26022, 4806, 15457, 12735,
+    1531, 20543, 6504, 23742, 16098, 19239, 23206, 1752, 13784, 24190, 18135,
+    24923, 11096, 11964, 4445, 14225, 12672, 7810, 25733, 3590, 21974, 24281,
+    10242, 4838, 8770, 12767, 1563, 20575, 2517, 11647, 23238, 13816, 18167,
+    24955, 11128, 11996, 6723, 4477, 11415, 25509, 14257, 21591, 10021, 7842,
+    3622, 9453, 22006, 24313, 14383, 10274, 4870, 24476, 8802, 1595, 15556,
+    2549, 6978, 19804, 23270, 24987, 11160, 12028, 6755, 4509, 3096, 11447,
+    14289, 21623, 16669, 10053, 9485, 22038, 14415, 24508, 8834, 2581, 19836,
+    23302, 25019, 18885, 11192, 12060, 6787, 3128, 21655, 16701, 10085, 6631,
+    9517, 22070, 24540, 8866, 2613, 19868, 14565, 18917, 6819, 18629, 3160,
+    21687, 16733, 6663, 9549, 24572, 8898, 2645, 14597, 18949, 18661, 3192,
+    21366, 14036, 7929, 21719, 16765, 6695, 2135, 9581, 24604, 8930, 2677,
+    14629, 17225, 96, 18981, 18693, 21398, 3975, 7961, 21751, 16797, 5351,
+    2167, 24636, 8962, 2709, 14661, 17257, 128, 19013, 18725, 4007, 7993,
+    21783, 5383, 2199, 24668, 21052, 8994, 13302, 2741, 7265, 17289, 19045,
+    18757, 4039, 13561, 8025, 13176, 10878, 10623, 19424, 1182, 21815, 5415,
+    2231, 24700, 21084, 22824, 9026, 347, 13334, 19550, 7297, 17321, 18789,
+    12449, 19077, 9836, 935, 13593, 8057, 10655, 10910, 1214, 5447, 2263,
+    24732, 21116, 379, 7329, 17353, 12481, 19109, 967, 13625, 8089, 10942,
+    15777, 1246, 2295, 24764, 21148, 411, 7361, 17385, 12513, 26053, 2936,
+    19141, 2327, 24796, 21180, 23773, 443, 7393, 17417, 12545, 16322, 26085,
+    2968, 2359, 24828, 0, 0, 0, 0, 9206, 22161, 21212, 4192, 23805, 475, 7425,
+    17449, 1783, 25144, 25792, 8556, 25764, 19269, 16354, 26117, 11678, 26326,
+    3000, 9238, 22193, 21244, 23837, 507, 7457, 17481, 13847, 1815, 25824,
+    26149, 3032, 9270, 22225, 21276, 22413, 18198, 23869, 539, 7489, 7873,
+    8271, 17513, 13879, 12797, 1847, 26181, 6048, 22257, 22445, 23901, 571,
+    7521, 8303, 17545, 15587, 12829, 1879, 6080, 14320, 20155, 14446, 22289,
+    3652, 7553, 8335, 17577, 15619, 23333, 24343, 12861, 1911, 6112, 14478,
+    22321, 11223, 8367, 3223, 17609, 14067, 23365, 21429, 16828, 24375, 14692,
+    2772, 12893, 1943, 6144, 10304, 14510, 11255, 13207, 8399, 17641, 23397,
+    16860, 24407, 14724, 2804, 12925, 0, 0, 0, 0, 12165, 19455, 21846, 1975,
+    6176, 10336, 11287, 8431, 0, 0, 13049, 17673, 23429, 22855, 14756, 2836,
+    12957, 12197, 19487, 19581, 6208, 10368, 17705, 23461, 22887, 14788, 2868,
+    19902, 16954, 4539, 12989, 12229, 19613, 18820, 10400, 17737, 23493, 9867,
+    22919, 14820, 19934, 16986, 13021, 12261, 19645, 10432, 25049, 17769,
+    20696, 23525, 9899, 22951, 14852, 19966, 17018, 12293, 25081, 20728, 9931,
+    19998, 998, 17050, 1277, 12325, 20030, 17082, 1309, 20062, 0, 0, 0, 0, 0,
+    0, 8179, 1341, 19172, 1373, 19204, 9060, 1405, 1437, 2390, 1469, 4223,
+    4255, 25175, 4287, 25207, 22100, 4319, 25239, 4351, 19300, 16385, 4383,
+    19332, 11709, 16417, 0, 17836, 11741, 9611, 17868, 26357, 25855, 3063,
+    21529, 9301, 18229, 158, 13910, 11773, 17900, 25887, 0, 10498, 26389,
+    22476, 23932, 18261, 602, 190, 11805, 17932, 10530, 26421, 24217, 20186,
+    23964, 18293, 0, 0, 0, 7005, 634, 17964, 20218, 23996, 7037, 666, 3683,
+    7584, 17996, 0, 0, 15128, 20250, 24028, 7069, 698, 3715, 7616, 15160,
+    20282, 26263, 7101, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -3833,11 +3835,11 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11419, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 2207, 26216, 20817, 0, 0, 0, 0, 15589, 2239, 4751, 0, 0, 0, 0,
-    26248, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 25475, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 20794, 730, 15192, 0, 0, 0, 0, 3254,
+    20826, 14098, 0, 0, 0, 0, 762, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -3918,69 +3920,70 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 18710, 0, 20871, 0, 18413, 0, 0, 0, 0, 0, 14986, 0, 24784, 0,
-    0, 0, 22656, 15621, 0, 10060, 0, 0, 23892, 12670, 2271, 7773, 18676, 0,
-    16688, 0, 0, 0, 15045, 0, 0, 0, 0, 0, 18474, 0, 17305, 11379, 6171, 0, 0,
-    0, 18484, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    3092, 8214, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6377, 0, 0,
-    22622, 0, 9621, 0, 17111, 0, 0, 20830, 0, 0, 17185, 17238, 18688, 0, 0, 0,
-    0, 0, 0, 0, 19572, 0, 0, 14989, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    25554, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 12419, 17271, 0, 0, 0, 0, 0, 13657,
-    1635, 0, 19537, 2191, 0, 0, 0, 17530, 0, 12602, 0, 10103, 0, 0, 0, 0, 0, 0,
-    0, 13596, 0, 0, 0, 6078, 34, 0, 0, 6010, 9691, 14287, 17520, 8572, 3619, 0,
-    8673, 0, 17388, 10771, 7641, 0, 25542, 0, 16762, 19411, 0, 13700, 0, 17355,
-    0, 11523, 0, 13586, 0, 16057, 0, 0, 8145, 6065, 0, 0, 0, 0, 0, 0, 0, 9649,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18405, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11352,
-    2308, 15928, 0, 0, 0, 1663, 0, 0, 0, 0, 0, 25576, 0, 0, 0, 0, 0, 0, 12590,
-    0, 0, 0, 0, 354, 0, 12624, 0, 24831, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 5683, 0, 0, 0, 0, 15734, 25005, 0, 0, 8624, 11249, 4529,
-    15287, 0, 0, 0, 0, 0, 7066, 0, 0, 17032, 17459, 0, 0, 0, 0, 0, 0, 0, 0,
-    18619, 24918, 0, 0, 0, 12383, 0, 0, 17340, 21778, 8019, 0, 0, 0, 0, 16720,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 701, 0, 0, 15719, 17042, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 24818, 23214, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9683, 8716,
-    13630, 0, 21376, 0, 0, 8167, 24885, 0, 0, 0, 0, 0, 0, 0, 18722, 0, 17102,
-    6203, 0, 0, 5700, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21361, 0, 22654, 11938,
-    18378, 0, 0, 0, 0, 0, 7636, 17204, 0, 0, 0, 0, 6616, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10204, 0, 0, 0, 24790, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 11488, 0, 8133, 0, 0, 0, 0, 0, 0, 18280, 0, 0, 0,
-    4546, 0, 0, 0, 0, 0, 20144, 0, 0, 0, 0, 12415, 25588, 11515, 20905, 0,
-    13081, 0, 0, 22161, 0, 0, 0, 0, 15622, 15654, 0, 0, 17451, 6029, 10767, 0,
-    0, 0, 23797, 0, 0, 6905, 0, 0, 0, 0, 21174, 13981, 0, 0, 0, 0, 16471, 9655,
-    0, 0, 4267, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 16052, 0, 0, 0, 0, 0, 17219, 15686, 18791, 2304, 12636,
-    6360, 3593, 2272, 13464, 15767, 14790, 0, 22134, 11303, 8553, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 20052, 0, 0, 0, 0, 0, 0, 0, 0, 12768, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 350, 0, 0, 0, 0, 0, 0, 0, 21781, 0, 0,
-    0, 0, 0, 0, 6908, 0, 0, 0, 10094, 0, 12668, 5733, 0, 0, 0, 0, 0, 7426, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 23858,
-    0, 0, 0, 0, 0, 0, 0, 9396, 0, 0, 25038, 0, 0, 0, 0, 0, 0, 17076, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 11772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 20441, 0, 15246, 0, 15022, 0, 0, 0, 0,
+    0, 21460, 0, 18321, 0, 0, 0, 4103, 3286, 0, 12087, 0, 0, 9196, 20893,
+    20858, 12711, 20407, 0, 3748, 0, 0, 0, 21519, 0, 0, 0, 0, 0, 15083, 0,
+    5773, 25435, 22697, 0, 0, 0, 15093, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 6438, 6609, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 15824, 0, 0, 4069, 0, 16132, 0, 5579, 0, 0, 15205, 0, 0,
+    5653, 5706, 20419, 0, 0, 0, 0, 0, 0, 0, 23718, 0, 0, 21463, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 18075, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7685,
+    5739, 0, 0, 0, 0, 0, 11547, 2874, 0, 23683, 20778, 0, 0, 0, 5998, 0, 16474,
+    0, 12130, 0, 0, 0, 0, 0, 0, 0, 11486, 0, 0, 0, 6345, 34, 0, 0, 6277, 16202,
+    14541, 5988, 5134, 8170, 0, 5235, 0, 5856, 10689, 6853, 0, 18063, 0, 3822,
+    21879, 0, 11590, 0, 5823, 0, 25579, 0, 11476, 0, 24862, 0, 0, 6540, 6332,
+    0, 0, 0, 0, 0, 0, 0, 16160, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 15014, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 25408, 16544, 15492, 0, 0, 0, 2902, 0, 0, 0, 0, 0, 18097,
+    0, 0, 0, 0, 0, 0, 16462, 0, 0, 0, 0, 8590, 0, 16496, 0, 18368, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7135, 0, 0, 0, 0, 3399, 18542, 0,
+    0, 5186, 25305, 4581, 1636, 0, 0, 0, 0, 0, 15653, 0, 0, 5500, 5927, 0, 0,
+    0, 0, 0, 0, 0, 0, 20350, 18455, 0, 0, 0, 7649, 0, 0, 5808, 13238, 10120, 0,
+    0, 0, 0, 3780, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19897, 0, 0, 3384, 5510, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18355, 13082, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    16194, 5278, 11520, 0, 8686, 0, 0, 6562, 18422, 0, 0, 0, 0, 0, 0, 0, 20453,
+    0, 5570, 22729, 0, 0, 7152, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8671, 0, 4101,
+    13658, 14987, 0, 0, 0, 0, 0, 6848, 5672, 0, 0, 0, 0, 9056, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14354, 0, 0, 0,
+    18327, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25544, 0, 6528, 0, 0, 0, 0, 0, 0, 12578,
+    0, 0, 0, 4598, 0, 0, 0, 0, 0, 24064, 0, 0, 0, 0, 7681, 18109, 25571, 15280,
+    0, 14889, 0, 0, 26244, 0, 0, 0, 0, 3287, 3319, 0, 0, 5919, 6296, 10685, 0,
+    0, 0, 9101, 0, 0, 16891, 0, 0, 0, 0, 13363, 8464, 0, 0, 0, 0, 17812, 16166,
+    0, 0, 20066, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24857, 0, 0, 0, 0, 0, 5687, 3351, 20522, 16540, 16508,
+    15807, 8144, 20859, 19521, 3432, 24438, 0, 26217, 25359, 5115, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 10474, 0, 0, 0, 0, 0, 0, 0, 0, 9432, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8586, 0, 0, 0, 0, 0, 0, 0, 13241, 0, 0, 0,
+    0, 0, 0, 16894, 0, 0, 0, 12121, 0, 20891, 7185, 0, 0, 0, 0, 0, 18864, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 9162, 0, 0,
+    0, 0, 0, 0, 0, 2009, 0, 0, 18575, 0, 0, 0, 0, 0, 0, 5544, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 25920, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 10199, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    2561, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25518, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14349, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11321, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18039, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 23990, 0, 0, 0, 8605, 0, 0, 0, 0, 0, 0, 0, 0, 8657, 0, 0,
-    0, 0, 0, 0, 25071, 18508, 6044, 0, 0, 24984, 0, 0, 0, 0, 0, 1087, 9393, 0,
-    0, 0, 0, 21243, 0, 0, 0, 16753, 0, 11236, 0, 0, 8518, 24951, 0, 0, 11433,
-    0, 0, 0, 0, 8179, 16721, 2558, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21182, 0, 13691,
+    0, 0, 0, 21300, 0, 0, 0, 5167, 0, 0, 0, 0, 0, 0, 0, 0, 5219, 0, 0, 0, 0, 0,
+    0, 18608, 15117, 6311, 0, 0, 18521, 0, 0, 0, 0, 0, 9334, 2006, 0, 0, 0, 0,
+    13432, 0, 0, 0, 3813, 0, 25292, 0, 0, 5080, 18488, 0, 0, 25489, 0, 0, 0, 0,
+    6574, 3781, 11318, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13371, 0, 11581, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17171, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5667, 0,
-    20884, 0, 11345, 0, 0, 0, 0, 23831, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 5639, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7119, 0, 15259, 0,
+    25401, 0, 0, 0, 0, 9135, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7062, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 21255,
-    0, 0, 0, 0, 0, 18778, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18371, 12755, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 7762, 0, 15309, 0, 11481, 0, 20322, 18641, 0, 9782, 0,
-    26452, 0, 0, 7413, 0, 15919, 4563, 0, 0, 19561, 13459, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11399, 21216, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 17407, 15786, 0, 0, 6393, 3096, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 15649, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13444, 0, 0, 0,
+    0, 0, 20509, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 14980, 9419, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 12700, 0, 1658, 0, 25537, 0, 17137, 20372, 0, 16293, 0, 26454, 0,
+    0, 18851, 0, 15483, 4615, 0, 0, 23707, 19516, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25455, 13405, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 5875, 3451, 0, 0, 15840, 6442, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 3882, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 9646, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17287, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5755, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
@@ -4008,49 +4011,52 @@ const BACKWARD_TABLE_UPPER: &'static [u16] = &[
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 18653, 8010,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 20384, 10111,
 ]; // 6086 entries
 
 #[cfg(feature = "no-optimized-legacy-encoding")]
 const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (4098, 4264), (42777, 168), (10357, 10360), (4181, 4490), (42778, 710),
     (10352, 10362), (10193, 10259), (4087, 4524), (9974, 9984), (10259, 10319),
-    (4196, 4241), (4108, 4523), (9954, 9974), (18021, 18050), (4168, 4226),
-    (42791, 10045), (9998, 10349), (4082, 4163), (37012, 12306), (4336, 4345),
-    (4448, 4485), (10011, 10321), (4176, 4263), (43084, 12849), (18095, 18271),
+    (4196, 4241), (50817, 9552), (50801, 9566), (50803, 9569), (50802, 9578),
+    (4108, 4523), (9954, 9974), (18021, 18049), (4168, 4226), (42791, 10045),
+    (9998, 10349), (4082, 4163), (37012, 12306), (4336, 4345), (4448, 4485),
+    (10011, 10321), (4176, 4263), (43084, 12849), (18095, 18271),
     (18063, 18099), (18242, 18408), (18570, 18783), (18162, 18438),
     (18189, 18556), (18122, 18407), (18535, 18662), (18161, 18412),
     (18696, 18837), (18315, 18661), (18060, 18543), (43035, 17553),
     (18165, 18631), (50975, 18342), (18316, 18745), (51246, 19255),
-    (18215, 18326), (4553, 4639), (4709, 4744), (4836, 4862), (5003, 5033),
-    (5278, 5306), (5657, 5682), (6056, 6087), (39281, 20094), (40244, 20098),
-    (9984, 10017), (43032, 20058), (10362, 10452), (10545, 10561),
-    (10755, 10783), (11113, 11132), (11570, 11577), (44868, 20095),
-    (13424, 13427), (50311, 20153), (50846, 20395), (50954, 20041),
-    (51130, 20151), (4268, 4270), (4562, 4647), (4728, 4736), (4862, 4870),
-    (5033, 5039), (5306, 5315), (5682, 5686), (6058, 6097), (6514, 6536),
-    (7005, 7016), (7477, 7488), (7924, 7938), (8311, 8321), (8704, 8712),
-    (9002, 9006), (42219, 20787), (9694, 9696), (9777, 9779), (9988, 9991),
-    (43037, 20872), (10364, 10384), (43220, 20913), (10561, 10563),
-    (10783, 10786), (11563, 11593), (12101, 12130), (12734, 12751),
-    (13427, 13445), (14115, 14131), (14733, 14745), (15375, 15381),
-    (15944, 15950), (16413, 16416), (16779, 16781), (17364, 17366),
-    (50462, 20797), (18062, 18129), (18419, 18428), (51316, 20624),
-    (18610, 18648), (37114, 21316), (4566, 4592), (4647, 4663), (4736, 4770),
-    (4870, 4881), (5039, 5051), (5315, 5336), (38401, 21021), (5686, 5702),
-    (6097, 6107), (6536, 6549), (39493, 21207), (7016, 7025), (7488, 7497),
-    (7938, 7942), (8321, 8328), (8712, 8715), (41774, 21237), (42046, 21474),
-    (42366, 21240), (9991, 9995), (43034, 20994), (10365, 10461),
-    (10563, 10573), (10786, 10797), (11132, 11142), (11593, 11603),
-    (12130, 12138), (12751, 12755), (13445, 13449), (14131, 14137),
-    (47238, 21124), (14745, 14749), (15381, 15383), (48718, 21236),
-    (16781, 16784), (49879, 21303), (17366, 17368), (50463, 21145),
-    (18127, 18238), (18310, 18365), (37038, 21991), (4881, 4896), (5051, 5079),
-    (5336, 5358), (5702, 5724), (6107, 6128), (6550, 6572), (39474, 21855),
-    (7025, 7052), (40081, 21892), (7497, 7514), (7942, 7958), (43229, 21511),
-    (10573, 10588), (10797, 10818), (11142, 11163), (11603, 11626),
-    (12138, 12162), (12755, 12777), (13449, 13472), (14141, 14152),
-    (18148, 18278), (51339, 21537), (37360, 22303), (4770, 4772), (4896, 4906),
+    (18215, 18326), (43891, 20411), (4553, 4639), (4709, 4744), (4836, 4862),
+    (5003, 5033), (5278, 5306), (5657, 5682), (6056, 6087), (39281, 20094),
+    (40244, 20098), (9984, 10017), (43032, 20058), (10362, 10452),
+    (10545, 10561), (10755, 10783), (11113, 11132), (11570, 11577),
+    (44868, 20095), (13424, 13427), (50311, 20153), (50846, 20395),
+    (50954, 20041), (51130, 20151), (40696, 20717), (37032, 20825),
+    (37033, 20827), (37035, 20829), (37034, 20830), (4268, 4270), (4562, 4647),
+    (4728, 4736), (4862, 4870), (5033, 5039), (5306, 5315), (5682, 5686),
+    (6058, 6097), (6514, 6536), (7005, 7016), (7477, 7488), (7924, 7938),
+    (8311, 8321), (8704, 8712), (9002, 9006), (42219, 20787), (9694, 9696),
+    (9777, 9779), (9988, 9991), (43037, 20872), (10364, 10384), (43220, 20913),
+    (10561, 10563), (10783, 10786), (11563, 11593), (12101, 12130),
+    (12734, 12751), (13427, 13445), (14115, 14131), (14733, 14745),
+    (15375, 15381), (15944, 15950), (16413, 16416), (16779, 16781),
+    (17364, 17366), (50462, 20797), (18062, 18129), (18419, 18428),
+    (51316, 20624), (18610, 18648), (37338, 21313), (37425, 21317),
+    (37114, 21316), (4566, 4592), (4647, 4663), (4736, 4770), (4870, 4881),
+    (5039, 5051), (5315, 5336), (38401, 21021), (5686, 5702), (6097, 6107),
+    (6536, 6549), (39493, 21207), (7016, 7025), (7488, 7497), (7938, 7942),
+    (8321, 8328), (8712, 8715), (41774, 21237), (42046, 21474), (42366, 21240),
+    (9991, 9995), (43034, 20994), (10365, 10461), (10563, 10573),
+    (10786, 10797), (11132, 11142), (11593, 11603), (12130, 12138),
+    (12751, 12755), (13445, 13449), (14131, 14137), (47238, 21124),
+    (14745, 14749), (15381, 15383), (48718, 21236), (16781, 16784),
+    (49879, 21303), (17366, 17368), (50463, 21145), (18127, 18238),
+    (18310, 18365), (37038, 21991), (4881, 4896), (5051, 5079), (5336, 5358),
+    (5702, 5724), (6107, 6128), (6550, 6572), (39474, 21855), (7025, 7052),
+    (40081, 21892), (7497, 7514), (7942, 7958), (43229, 21511), (10573, 10588),
+    (10797, 10818), (11142, 11163), (11603, 11626), (12138, 12162),
+    (12755, 12777), (13449, 13472), (14141, 14152), (18148, 18278),
+    (51339, 21537), (50988, 22021), (37360, 22303), (4770, 4772), (4896, 4906),
     (5079, 5093), (5358, 5367), (5724, 5733), (6128, 6134), (6572, 6586),
     (39820, 22285), (7514, 7516), (7943, 7960), (8328, 8342), (8715, 8729),
     (9007, 9013), (9279, 9281), (42220, 22181), (9599, 9604), (9696, 9699),
@@ -4069,126 +4075,130 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (14152, 14173), (14768, 14778), (15395, 15403), (15961, 15965),
     (49190, 22896), (16790, 16794), (49883, 22755), (50315, 22897),
     (17696, 17699), (50785, 22715), (18253, 18293), (51453, 22801),
-    (4597, 4601), (37436, 23380), (4777, 4779), (4917, 4924), (5107, 5114),
-    (5389, 5398), (5743, 5756), (6139, 6162), (6588, 6606), (7065, 7077),
-    (7530, 7539), (7974, 7991), (8351, 8361), (8734, 8738), (9017, 9021),
-    (42051, 23352), (42224, 23541), (9605, 9609), (42550, 23423),
-    (42764, 23424), (10412, 10476), (10609, 10611), (10854, 10858),
-    (11184, 11203), (11645, 11659), (12197, 12234), (12800, 12834),
-    (13490, 13513), (14173, 14194), (14778, 14791), (15403, 15416),
-    (15965, 15977), (49191, 23356), (16794, 16797), (49884, 23365),
-    (17371, 17373), (17548, 17550), (50467, 23373), (50578, 23374),
-    (50788, 23290), (50880, 23426), (18265, 18325), (18420, 18431),
-    (18621, 18668), (18749, 18760), (4601, 4674), (4779, 4783), (4924, 4927),
-    (5114, 5124), (38032, 24033), (5398, 5409), (5756, 5764), (6153, 6176),
-    (6606, 6626), (7077, 7085), (7539, 7541), (7991, 7995), (8361, 8365),
-    (41506, 23566), (9021, 9027), (42377, 24009), (9700, 9702), (9783, 9838),
-    (42765, 24027), (10373, 10418), (10476, 10483), (10611, 10624),
-    (10858, 10878), (11203, 11225), (11659, 11669), (12234, 12251),
-    (12834, 12861), (13513, 13526), (14194, 14210), (14791, 14804),
-    (15416, 15429), (48745, 23991), (16424, 16427), (49460, 24002),
-    (49565, 24003), (17117, 17119), (17373, 17375), (17550, 17552),
-    (50468, 24024), (50579, 23661), (18326, 18394), (51438, 23708),
-    (4611, 4615), (4674, 4679), (4783, 4791), (4927, 4934), (5124, 5143),
-    (5409, 5434), (5764, 5781), (6176, 6185), (6626, 6648), (39679, 24426),
-    (7085, 7099), (7541, 7549), (7995, 8006), (8365, 8378), (41507, 24394),
-    (9027, 9030), (42052, 24413), (42226, 24300), (42553, 24398),
-    (42680, 24307), (9999, 10003), (10374, 10422), (10483, 10491),
-    (10624, 10651), (10878, 10891), (11225, 11240), (11669, 11678),
-    (12251, 12263), (12861, 12867), (13526, 13539), (14210, 14226),
-    (14804, 14814), (15429, 15440), (15978, 15982), (16427, 16429),
-    (16798, 16800), (17119, 17123), (50143, 24305), (50320, 24306),
-    (50470, 24399), (18088, 18133), (18309, 18393), (51252, 24543),
-    (5434, 5446), (5781, 5797), (6185, 6201), (6648, 6669), (7099, 7118),
-    (7549, 7568), (8006, 8016), (8378, 8397), (8740, 8749), (9030, 9035),
-    (42053, 25059), (9459, 9463), (9610, 9612), (9702, 9787), (43417, 24576),
-    (10891, 10912), (11240, 11259), (11678, 11695), (12263, 12284),
-    (12867, 12891), (13539, 13552), (14226, 14246), (14814, 14832),
-    (15440, 15452), (15982, 15991), (16429, 16439), (49568, 25083),
-    (49891, 25081), (50144, 25085), (50786, 24658), (50928, 24650),
-    (51087, 24928), (18402, 18442), (4615, 4683), (4791, 4796), (4934, 4941),
-    (5143, 5165), (5446, 5480), (5797, 5815), (6201, 6221), (6669, 6701),
-    (7118, 7142), (7568, 7570), (40784, 25130), (41165, 25134), (41517, 25136),
-    (9035, 9037), (42054, 25139), (42606, 25088), (10422, 10501),
-    (10651, 10668), (10912, 10928), (11259, 11280), (11695, 11725),
-    (12284, 12315), (12891, 12924), (13552, 13588), (14246, 14249),
-    (47600, 25133), (17703, 17706), (50754, 25095), (50840, 25311),
-    (18443, 18454), (4683, 4689), (4796, 4798), (4941, 4946), (5165, 5169),
-    (5481, 5485), (5815, 5820), (6221, 6226), (6701, 6718), (7139, 7149),
-    (7570, 7588), (8017, 8033), (8398, 8422), (8750, 8765), (9037, 9049),
-    (9287, 9295), (9463, 9465), (9612, 9615), (9704, 9707), (9787, 9880),
-    (10003, 10005), (43160, 26081), (10501, 10503), (10668, 10674),
-    (10928, 10942), (11280, 11284), (11725, 11731), (12315, 12317),
-    (12900, 12937), (13560, 13595), (14249, 14278), (14833, 14855),
-    (15452, 15467), (15991, 16001), (16439, 16448), (16801, 16810),
-    (17124, 17129), (50145, 25883), (17553, 17557), (17706, 17709),
-    (50580, 25901), (17882, 17884), (51080, 25992), (18442, 18484),
-    (51565, 25775), (4689, 4692), (4798, 4803), (4946, 4953), (5169, 5183),
-    (5485, 5520), (5820, 5855), (6226, 6253), (39317, 26364), (6718, 6727),
-    (39782, 26368), (7149, 7162), (7588, 7597), (8033, 8036), (8422, 8426),
-    (8765, 8771), (9049, 9051), (9295, 9297), (9465, 9467), (9615, 9617),
-    (42475, 26345), (42610, 26348), (10503, 10511), (10674, 10684),
-    (10931, 10968), (11284, 11340), (11731, 11737), (12317, 12324),
-    (12937, 12946), (13595, 13605), (46642, 26401), (14278, 14284),
-    (14855, 14862), (15467, 15478), (48769, 26322), (16448, 16451),
-    (49578, 26334), (17129, 17132), (50477, 26347), (17813, 17815),
-    (50839, 26436), (18199, 18232), (18403, 18557), (51486, 26147),
-    (6238, 6262), (6727, 6749), (7162, 7185), (7597, 7616), (8036, 8055),
-    (8428, 8440), (11737, 11765), (12324, 12362), (12946, 12994),
-    (13605, 13649), (46527, 27011), (14284, 14322), (14865, 14899),
-    (18130, 18159), (51040, 26790), (51141, 26686), (18510, 18598),
-    (18693, 18726), (18809, 18828), (4692, 4698), (4803, 4805), (4953, 4956),
-    (5183, 5185), (5520, 5524), (5855, 5861), (6262, 6265), (6749, 6753),
-    (7185, 7192), (7616, 7622), (8055, 8057), (8426, 8446), (8771, 8788),
-    (9051, 9065), (9297, 9308), (9467, 9471), (42385, 27372), (9708, 9712),
-    (9788, 9844), (42681, 27414), (10393, 10395), (43452, 27600),
-    (10968, 10972), (11340, 11347), (11765, 11779), (12362, 12371),
-    (12994, 13006), (13649, 13662), (14322, 14331), (14862, 14908),
-    (47794, 27510), (15478, 15518), (16002, 16027), (16451, 16464),
-    (16811, 16826), (17132, 17140), (17378, 17383), (17557, 17560),
-    (17710, 17714), (17815, 17888), (50755, 27422), (51124, 27274),
-    (18528, 18576), (51510, 27180), (4698, 4700), (4805, 4811), (4956, 4968),
+    (44968, 23143), (48179, 23336), (4597, 4601), (37436, 23380), (4777, 4779),
+    (4917, 4924), (5107, 5114), (5389, 5398), (5743, 5756), (6139, 6162),
+    (6588, 6606), (7065, 7077), (7530, 7539), (7974, 7991), (8351, 8361),
+    (8734, 8738), (9017, 9021), (42051, 23352), (42224, 23541), (9605, 9609),
+    (42550, 23423), (42764, 23424), (10412, 10476), (10609, 10611),
+    (10854, 10858), (11184, 11203), (11645, 11659), (12197, 12234),
+    (12800, 12834), (13490, 13513), (14173, 14194), (14778, 14791),
+    (15403, 15416), (15965, 15977), (49191, 23356), (16794, 16797),
+    (49884, 23365), (17371, 17373), (17548, 17550), (50467, 23373),
+    (50578, 23374), (50788, 23290), (50880, 23426), (18265, 18325),
+    (18420, 18431), (18621, 18668), (18749, 18760), (43158, 23568),
+    (4601, 4674), (4779, 4783), (4924, 4927), (5114, 5124), (38032, 24033),
+    (5398, 5409), (5756, 5764), (6153, 6176), (6606, 6626), (7077, 7085),
+    (7539, 7541), (7991, 7995), (8361, 8365), (41506, 23566), (9021, 9027),
+    (42377, 24009), (9700, 9702), (9783, 9838), (42765, 24027), (10373, 10418),
+    (10476, 10483), (10611, 10624), (10858, 10878), (11203, 11225),
+    (11659, 11669), (12234, 12251), (12834, 12861), (13513, 13526),
+    (14194, 14210), (14791, 14804), (15416, 15429), (48745, 23991),
+    (16424, 16427), (49460, 24002), (49565, 24003), (17117, 17119),
+    (17373, 17375), (17550, 17552), (50468, 24024), (50579, 23661),
+    (18326, 18394), (51438, 23708), (51131, 24272), (4611, 4615), (4674, 4679),
+    (4783, 4791), (4927, 4934), (5124, 5143), (5409, 5434), (5764, 5781),
+    (6176, 6185), (6626, 6648), (39679, 24426), (7085, 7099), (7541, 7549),
+    (7995, 8006), (8365, 8378), (41507, 24394), (9027, 9030), (42052, 24413),
+    (42226, 24300), (42553, 24398), (42680, 24307), (9999, 10003),
+    (10374, 10422), (10483, 10491), (10624, 10651), (10878, 10891),
+    (11225, 11240), (11669, 11678), (12251, 12263), (12861, 12867),
+    (13526, 13539), (14210, 14226), (14804, 14814), (15429, 15440),
+    (15978, 15982), (16427, 16429), (16798, 16800), (17119, 17123),
+    (50143, 24305), (50320, 24306), (50470, 24399), (18088, 18133),
+    (18309, 18393), (51252, 24543), (38558, 24674), (51181, 24740),
+    (51330, 24798), (5434, 5446), (5781, 5797), (6185, 6201), (6648, 6669),
+    (7099, 7118), (7549, 7568), (8006, 8016), (8378, 8397), (8740, 8749),
+    (9030, 9035), (42053, 25059), (9459, 9463), (9610, 9612), (9702, 9787),
+    (43417, 24576), (10891, 10912), (11240, 11259), (11678, 11695),
+    (12263, 12284), (12867, 12891), (13539, 13552), (14226, 14246),
+    (14814, 14832), (15440, 15452), (15982, 15991), (16429, 16439),
+    (49568, 25083), (49891, 25081), (50144, 25085), (50786, 24658),
+    (50928, 24650), (51087, 24928), (18402, 18442), (38248, 25294),
+    (38236, 25296), (4615, 4683), (4791, 4796), (4934, 4941), (5143, 5165),
+    (5446, 5480), (5797, 5815), (6201, 6221), (6669, 6701), (7118, 7142),
+    (7568, 7570), (40784, 25130), (41165, 25134), (41517, 25136), (9035, 9037),
+    (42054, 25139), (42606, 25088), (10422, 10501), (10651, 10668),
+    (10912, 10928), (11259, 11280), (11695, 11725), (12284, 12315),
+    (12891, 12924), (13552, 13588), (14246, 14249), (47600, 25133),
+    (17703, 17706), (50754, 25095), (50840, 25311), (18443, 18454),
+    (4683, 4689), (4796, 4798), (4941, 4946), (5165, 5169), (5481, 5485),
+    (5815, 5820), (6221, 6226), (6701, 6718), (7139, 7149), (7570, 7588),
+    (8017, 8033), (8398, 8422), (8750, 8765), (9037, 9049), (9287, 9295),
+    (9463, 9465), (9612, 9615), (9704, 9707), (9787, 9880), (10003, 10005),
+    (43160, 26081), (10501, 10503), (10668, 10674), (10928, 10942),
+    (11280, 11284), (11725, 11731), (12315, 12317), (12900, 12937),
+    (13560, 13595), (14249, 14278), (14833, 14855), (15452, 15467),
+    (15991, 16001), (16439, 16448), (16801, 16810), (17124, 17129),
+    (50145, 25883), (17553, 17557), (17706, 17709), (50580, 25901),
+    (17882, 17884), (51080, 25992), (18442, 18484), (51565, 25775),
+    (4689, 4692), (4798, 4803), (4946, 4953), (5169, 5183), (5485, 5520),
+    (5820, 5855), (6226, 6253), (39317, 26364), (6718, 6727), (39782, 26368),
+    (7149, 7162), (7588, 7597), (8033, 8036), (8422, 8426), (8765, 8771),
+    (9049, 9051), (9295, 9297), (9465, 9467), (9615, 9617), (42475, 26345),
+    (42610, 26348), (10503, 10511), (10674, 10684), (10931, 10968),
+    (11284, 11340), (11731, 11737), (12317, 12324), (12937, 12946),
+    (13595, 13605), (46642, 26401), (14278, 14284), (14855, 14862),
+    (15467, 15478), (48769, 26322), (16448, 16451), (49578, 26334),
+    (17129, 17132), (50477, 26347), (17813, 17815), (50839, 26436),
+    (18199, 18232), (18403, 18557), (51486, 26147), (6238, 6262), (6727, 6749),
+    (7162, 7185), (7597, 7616), (8036, 8055), (8428, 8440), (11737, 11765),
+    (12324, 12362), (12946, 12994), (13605, 13649), (46527, 27011),
+    (14284, 14322), (14865, 14899), (18130, 18159), (51040, 26790),
+    (51141, 26686), (18510, 18598), (18693, 18726), (18809, 18828),
+    (4692, 4698), (4803, 4805), (4953, 4956), (5183, 5185), (5520, 5524),
+    (5855, 5861), (6262, 6265), (6749, 6753), (7185, 7192), (7616, 7622),
+    (8055, 8057), (8426, 8446), (8771, 8788), (9051, 9065), (9297, 9308),
+    (9467, 9471), (42385, 27372), (9708, 9712), (9788, 9844), (42681, 27414),
+    (10393, 10395), (43452, 27600), (10968, 10972), (11340, 11347),
+    (11765, 11779), (12362, 12371), (12994, 13006), (13649, 13662),
+    (14322, 14331), (14862, 14908), (47794, 27510), (15478, 15518),
+    (16002, 16027), (16451, 16464), (16811, 16826), (17132, 17140),
+    (17378, 17383), (17557, 17560), (17710, 17714), (17815, 17888),
+    (50755, 27422), (51124, 27274), (18528, 18576), (51510, 27180),
+    (43284, 27722), (44565, 28007), (4698, 4700), (4805, 4811), (4956, 4968),
     (5185, 5212), (5524, 5558), (5861, 5886), (6265, 6292), (6753, 6792),
     (7192, 7195), (40825, 27699), (41556, 27653), (41833, 27656),
     (10395, 10429), (10511, 10520), (10685, 10706), (10972, 11006),
     (11347, 11380), (11779, 11817), (12371, 12411), (13006, 13008),
     (14905, 14909), (15518, 15521), (48795, 27657), (49232, 27659),
     (49594, 27660), (50328, 27661), (18156, 18201), (18246, 18290),
-    (18576, 18603), (6764, 6778), (7195, 7230), (7622, 7644), (8058, 8087),
-    (8446, 8467), (8789, 8803), (9066, 9081), (9310, 9313), (12376, 12384),
-    (13008, 13055), (13662, 13702), (14331, 14375), (14909, 14949),
-    (15521, 15550), (16028, 16042), (16472, 16478), (50859, 28379),
-    (50917, 28377), (51042, 28249), (18457, 18470), (18520, 18641),
-    (51467, 28477), (51602, 28202), (37468, 28779), (37736, 28784),
-    (5212, 5216), (5558, 5563), (5886, 5895), (6292, 6298), (6792, 6797),
-    (7230, 7238), (7644, 7659), (8087, 8093), (8467, 8471), (8803, 8815),
-    (9081, 9090), (9308, 9319), (9471, 9478), (9618, 9621), (42480, 28748),
-    (9790, 9792), (9880, 9929), (43288, 28785), (10706, 10708), (11006, 11017),
-    (11380, 11389), (11817, 11836), (12411, 12431), (13055, 13069),
-    (13702, 13725), (14375, 14386), (14949, 14966), (15534, 15568),
-    (16042, 16049), (16465, 16484), (16827, 16840), (17140, 17155),
-    (17383, 17390), (17561, 17565), (17714, 17716), (17816, 17820),
-    (50656, 28770), (17942, 18010), (18164, 18198), (51015, 28811),
-    (18652, 18682), (4701, 4709), (4811, 4814), (4969, 4971), (5216, 5222),
-    (5563, 5579), (5895, 5909), (6298, 6312), (6797, 6811), (7238, 7245),
-    (7659, 7665), (8093, 8098), (8471, 8475), (41583, 29544), (9090, 9094),
-    (9319, 9321), (9478, 9484), (9621, 9623), (9713, 9715), (42560, 29568),
-    (42716, 29224), (10396, 10432), (10521, 10525), (10708, 10721),
-    (11017, 11036), (11389, 11421), (11836, 11865), (12431, 12460),
-    (13069, 13089), (13725, 13738), (14386, 14395), (14966, 14979),
-    (15568, 15577), (16049, 16052), (16482, 16485), (16840, 16850),
-    (17155, 17160), (17390, 17394), (17565, 17569), (17716, 17720),
-    (50588, 29219), (17889, 17891), (17988, 18062), (18159, 18183),
-    (51097, 29646), (18682, 18736), (37039, 29929), (4814, 4825), (5222, 5226),
-    (5579, 5583), (5909, 5920), (6307, 6327), (6806, 6827), (7245, 7268),
-    (7665, 7686), (8098, 8105), (8475, 8481), (8816, 8824), (9094, 9098),
-    (9321, 9324), (9484, 9489), (42391, 29903), (9715, 9845), (42773, 30098),
-    (43293, 29994), (10721, 10725), (11036, 11043), (11421, 11428),
-    (11865, 11880), (12449, 12470), (13089, 13116), (13738, 13774),
-    (14395, 14407), (14979, 14992), (15577, 15586), (16052, 16066),
-    (16485, 16495), (16850, 16855), (49928, 29882), (50162, 29975),
-    (17569, 17573), (17821, 17823), (50985, 29719), (51069, 29797),
-    (51186, 29860), (51385, 29779), (18714, 18773), (4825, 4832),
+    (18576, 18603), (41567, 28598), (6764, 6778), (7195, 7230), (7622, 7644),
+    (8058, 8087), (8446, 8467), (8789, 8803), (9066, 9081), (9310, 9313),
+    (12376, 12384), (13008, 13055), (13662, 13702), (14331, 14375),
+    (14909, 14949), (15521, 15550), (16028, 16042), (16472, 16478),
+    (50859, 28379), (50917, 28377), (51042, 28249), (18457, 18470),
+    (18520, 18641), (51467, 28477), (51602, 28202), (46477, 29026),
+    (41850, 29151), (37468, 28779), (37736, 28784), (5212, 5216), (5558, 5563),
+    (5886, 5895), (6292, 6298), (6792, 6797), (7230, 7238), (7644, 7659),
+    (8087, 8093), (8467, 8471), (8803, 8815), (9081, 9090), (9308, 9319),
+    (9471, 9478), (9618, 9621), (42480, 28748), (9790, 9792), (9880, 9929),
+    (43288, 28785), (10706, 10708), (11006, 11017), (11380, 11389),
+    (11817, 11836), (12411, 12431), (13055, 13069), (13702, 13725),
+    (14375, 14386), (14949, 14966), (15534, 15568), (16042, 16049),
+    (16465, 16484), (16827, 16840), (17140, 17155), (17383, 17390),
+    (17561, 17565), (17714, 17716), (17816, 17820), (50656, 28770),
+    (17942, 18010), (18164, 18198), (51015, 28811), (18652, 18682),
+    (49247, 29185), (51469, 29482), (4701, 4709), (4811, 4814), (4969, 4971),
+    (5216, 5222), (5563, 5579), (5895, 5909), (6298, 6312), (6797, 6811),
+    (7238, 7245), (7659, 7665), (8093, 8098), (8471, 8475), (41583, 29544),
+    (9090, 9094), (9319, 9321), (9478, 9484), (9621, 9623), (9713, 9715),
+    (42560, 29568), (42716, 29224), (10396, 10432), (10521, 10525),
+    (10708, 10721), (11017, 11036), (11389, 11421), (11836, 11865),
+    (12431, 12460), (13069, 13089), (13725, 13738), (14386, 14395),
+    (14966, 14979), (15568, 15577), (16049, 16052), (16482, 16485),
+    (16840, 16850), (17155, 17160), (17390, 17394), (17565, 17569),
+    (17716, 17720), (50588, 29219), (17889, 17891), (17988, 18062),
+    (18159, 18183), (51097, 29646), (18682, 18736), (47756, 29817),
+    (46534, 30201), (37039, 29929), (4814, 4825), (5222, 5226), (5579, 5583),
+    (5909, 5920), (6307, 6327), (6806, 6827), (7245, 7268), (7665, 7686),
+    (8098, 8105), (8475, 8481), (8816, 8824), (9094, 9098), (9321, 9324),
+    (9484, 9489), (42391, 29903), (9715, 9845), (42773, 30098), (43293, 29994),
+    (10721, 10725), (11036, 11043), (11421, 11428), (11865, 11880),
+    (12449, 12470), (13089, 13116), (13738, 13774), (14395, 14407),
+    (14979, 14992), (15577, 15586), (16052, 16066), (16485, 16495),
+    (16850, 16855), (49928, 29882), (50162, 29975), (17569, 17573),
+    (17821, 17823), (50985, 29719), (51069, 29797), (51186, 29860),
+    (51385, 29779), (18714, 18773), (42651, 30679), (4825, 4832),
     (37739, 30334), (5226, 5229), (5583, 5589), (5920, 5937), (6327, 6337),
     (6827, 6837), (7268, 7276), (7677, 7701), (8105, 8116), (8481, 8496),
     (8824, 8833), (9098, 9109), (9324, 9331), (9489, 9492), (9624, 9626),
@@ -4198,31 +4208,34 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (14992, 15009), (15586, 15607), (16066, 16081), (16495, 16507),
     (16855, 16860), (17161, 17170), (17395, 17397), (17573, 17575),
     (17720, 17722), (17823, 17893), (50772, 30325), (50941, 30694),
-    (51271, 30661), (18773, 18806), (4832, 4834), (5229, 5232), (5589, 5594),
-    (5937, 5950), (6337, 6364), (6837, 6844), (7276, 7279), (7701, 7716),
-    (8116, 8125), (8496, 8504), (8833, 8838), (9109, 9116), (9331, 9333),
-    (9492, 9494), (9626, 9630), (42565, 31155), (43200, 31160), (43494, 31037),
-    (11054, 11057), (11440, 11460), (11894, 11923), (12484, 12505),
-    (13130, 13147), (13789, 13808), (14424, 14448), (15009, 15025),
-    (15607, 15620), (16081, 16093), (16507, 16517), (16860, 16867),
-    (17170, 17177), (17397, 17400), (17575, 17577), (17824, 17894),
-    (18014, 18071), (51002, 30961), (51178, 31089), (51387, 31180),
-    (18810, 18840), (4834, 4836), (37740, 31481), (38000, 31350), (5594, 5597),
-    (5950, 5954), (6364, 6369), (6844, 6854), (6995, 6997), (7279, 7298),
-    (7716, 7729), (8125, 8142), (8504, 8521), (8838, 8852), (9116, 9124),
-    (9333, 9338), (9494, 9632), (42613, 31434), (43295, 31349), (11057, 11060),
-    (11460, 11465), (11923, 11941), (12505, 12527), (13147, 13164),
-    (13808, 13836), (14448, 14474), (15027, 15040), (15620, 15644),
-    (16093, 16121), (49285, 31327), (16867, 16869), (17177, 17181),
-    (17577, 17579), (4973, 4975), (38001, 31995), (38365, 31998), (5954, 5962),
-    (6369, 6384), (6854, 6871), (7299, 7313), (7729, 7738), (8142, 8164),
-    (8521, 8538), (8845, 8854), (9118, 9131), (9338, 9345), (9496, 9502),
-    (9632, 9637), (42487, 31824), (9798, 9849), (9915, 9954), (11060, 11062),
-    (11465, 11474), (11941, 11959), (12527, 12546), (13164, 13185),
-    (13836, 13855), (14474, 14502), (47576, 32243), (15040, 15058),
-    (15644, 15649), (16102, 16124), (16518, 16530), (16869, 16876),
-    (17181, 17187), (17400, 17403), (17579, 17586), (17722, 17724),
-    (50595, 31850), (17894, 17965), (50787, 31911), (50909, 31765),
+    (51271, 30661), (18773, 18806), (47793, 31131), (39126, 31203),
+    (4832, 4834), (5229, 5232), (5589, 5594), (5937, 5950), (6337, 6364),
+    (6837, 6844), (7276, 7279), (7701, 7716), (8116, 8125), (8496, 8504),
+    (8833, 8838), (9109, 9116), (9331, 9333), (9492, 9494), (9626, 9630),
+    (42565, 31155), (43200, 31160), (43494, 31037), (11054, 11057),
+    (11440, 11460), (11894, 11923), (12484, 12505), (13130, 13147),
+    (13789, 13808), (14424, 14448), (15009, 15025), (15607, 15620),
+    (16081, 16093), (16507, 16517), (16860, 16867), (17170, 17177),
+    (17397, 17400), (17575, 17577), (17824, 17894), (18014, 18071),
+    (51002, 30961), (51178, 31089), (51387, 31180), (18810, 18840),
+    (40066, 31569), (40907, 31672), (4834, 4836), (37740, 31481),
+    (38000, 31350), (5594, 5597), (5950, 5954), (6364, 6369), (6844, 6854),
+    (6995, 6997), (7279, 7298), (7716, 7729), (8125, 8142), (8504, 8521),
+    (8838, 8852), (9116, 9124), (9333, 9338), (9494, 9632), (42613, 31434),
+    (43295, 31349), (11057, 11060), (11460, 11465), (11923, 11941),
+    (12505, 12527), (13147, 13164), (13808, 13836), (14448, 14474),
+    (15027, 15040), (15620, 15644), (16093, 16121), (49285, 31327),
+    (16867, 16869), (17177, 17181), (17577, 17579), (48886, 31750),
+    (37040, 31950), (40929, 32210), (4973, 4975), (38001, 31995),
+    (38365, 31998), (5954, 5962), (6369, 6384), (6854, 6871), (7299, 7313),
+    (7729, 7738), (8142, 8164), (8521, 8538), (8845, 8854), (9118, 9131),
+    (9338, 9345), (9496, 9502), (9632, 9637), (42487, 31824), (9798, 9849),
+    (9915, 9954), (11060, 11062), (11465, 11474), (11941, 11959),
+    (12527, 12546), (13164, 13185), (13836, 13855), (14474, 14502),
+    (47576, 32243), (15040, 15058), (15644, 15649), (16102, 16124),
+    (16518, 16530), (16869, 16876), (17181, 17187), (17400, 17403),
+    (17579, 17586), (17722, 17724), (50595, 31850), (17894, 17965),
+    (50787, 31911), (50909, 31765), (41628, 32285), (50172, 32391),
     (4975, 4978), (38002, 32597), (5598, 5601), (5962, 5965), (6384, 6389),
     (6871, 6877), (7314, 7316), (7738, 7745), (8164, 8168), (8538, 8542),
     (8854, 8868), (9131, 9151), (9345, 9355), (9502, 9512), (9638, 9723),
@@ -4231,37 +4244,39 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (14502, 14507), (15050, 15068), (15649, 15674), (16124, 16147),
     (49166, 32757), (16530, 16545), (16876, 16893), (17187, 17193),
     (17403, 17411), (17586, 17589), (50492, 32405), (17828, 17901),
-    (51364, 32655), (4978, 4991), (5235, 5242), (5602, 5614), (5965, 5983),
-    (6389, 6412), (6877, 6887), (7316, 7330), (7745, 7759), (8168, 8180),
-    (8542, 8549), (8869, 8873), (9151, 9166), (9355, 9359), (9512, 9644),
-    (9800, 9853), (43201, 32906), (10727, 10733), (11062, 11069),
-    (11478, 11502), (44539, 32898), (11970, 11980), (12559, 12578),
-    (13193, 13211), (13865, 13881), (14507, 14517), (15068, 15077),
-    (15674, 15690), (16147, 16156), (16545, 16549), (16893, 16896),
-    (17193, 17196), (17411, 17413), (50357, 33246), (17901, 17903),
-    (51549, 33263), (4991, 4997), (5242, 5246), (5614, 5631), (5983, 6006),
-    (6412, 6437), (6887, 6910), (7330, 7358), (7759, 7761), (8180, 8184),
-    (8873, 8876), (9166, 9168), (42127, 33290), (42412, 33382), (42660, 33399),
+    (51364, 32655), (38369, 32773), (41636, 32808), (4978, 4991), (5235, 5242),
+    (5602, 5614), (5965, 5983), (6389, 6412), (6877, 6887), (7316, 7330),
+    (7745, 7759), (8168, 8180), (8542, 8549), (8869, 8873), (9151, 9166),
+    (9355, 9359), (9512, 9644), (9800, 9853), (43201, 32906), (10727, 10733),
+    (11062, 11069), (11478, 11502), (44539, 32898), (11970, 11980),
+    (12559, 12578), (13193, 13211), (13865, 13881), (14507, 14517),
+    (15068, 15077), (15674, 15690), (16147, 16156), (16545, 16549),
+    (16893, 16896), (17193, 17196), (17411, 17413), (50357, 33246),
+    (17901, 17903), (51549, 33263), (40107, 33729), (45985, 33743),
+    (4991, 4997), (5242, 5246), (5614, 5631), (5983, 6006), (6412, 6437),
+    (6887, 6910), (7330, 7358), (7759, 7761), (8180, 8184), (8873, 8876),
+    (9166, 9168), (42127, 33290), (42412, 33382), (42660, 33399),
     (10529, 10534), (10733, 10742), (11069, 11149), (11502, 11529),
     (11980, 12017), (12578, 12619), (13211, 13267), (13881, 13919),
     (47285, 33301), (15077, 15084), (15690, 15693), (16156, 16159),
     (16549, 16551), (16896, 16899), (17196, 17199), (50358, 33387),
     (50493, 33388), (50598, 33389), (50836, 33518), (50897, 33741),
-    (18347, 18353), (18547, 18582), (51505, 33721), (7333, 7356),
-    (40482, 33836), (7761, 7778), (8184, 8200), (8549, 8564), (8876, 8886),
-    (9168, 9179), (9360, 9369), (9513, 9520), (9645, 9649), (13219, 13265),
-    (13887, 13944), (14518, 14558), (15084, 15134), (15693, 15724),
-    (16159, 16194), (16551, 16573), (16899, 16920), (17200, 17211),
-    (18059, 18143), (51047, 34053), (51190, 33828), (18608, 18614),
-    (51558, 33890), (37765, 34411), (5631, 5633), (6006, 6010), (6437, 6446),
-    (6910, 6922), (7358, 7367), (7778, 7792), (8200, 8210), (8564, 8575),
-    (8886, 8891), (9179, 9190), (9369, 9373), (9520, 9525), (9647, 9653),
-    (9723, 9726), (9853, 9855), (43302, 34381), (11091, 11095), (11529, 11533),
-    (12017, 12041), (12619, 12639), (13267, 13282), (13944, 13959),
-    (14558, 14591), (15134, 15167), (15724, 15748), (16194, 16220),
-    (16569, 16597), (16921, 16932), (17199, 17210), (17413, 17427),
-    (17591, 17597), (17726, 17733), (50599, 34371), (17903, 18000),
-    (18113, 18145), (4998, 5002), (5246, 5248), (38402, 34920), (6010, 6014),
+    (18347, 18353), (18547, 18582), (51505, 33721), (46013, 33807),
+    (47314, 33960), (7333, 7356), (40482, 33836), (7761, 7778), (8184, 8200),
+    (8549, 8564), (8876, 8886), (9168, 9179), (9360, 9369), (9513, 9520),
+    (9645, 9649), (13219, 13265), (13887, 13944), (14518, 14558),
+    (15084, 15134), (15693, 15724), (16159, 16194), (16551, 16573),
+    (16899, 16920), (17200, 17211), (18059, 18143), (51047, 34053),
+    (51190, 33828), (18608, 18614), (51558, 33890), (37765, 34411),
+    (5631, 5633), (6006, 6010), (6437, 6446), (6910, 6922), (7358, 7367),
+    (7778, 7792), (8200, 8210), (8564, 8575), (8886, 8891), (9179, 9190),
+    (9369, 9373), (9520, 9525), (9647, 9653), (9723, 9726), (9853, 9855),
+    (43302, 34381), (11091, 11095), (11529, 11533), (12017, 12041),
+    (12619, 12639), (13267, 13282), (13944, 13959), (14558, 14591),
+    (15134, 15167), (15724, 15748), (16194, 16220), (16569, 16597),
+    (16921, 16932), (17199, 17210), (17413, 17427), (17591, 17597),
+    (17726, 17733), (50599, 34371), (17903, 18000), (18113, 18145),
+    (41666, 35238), (4998, 5002), (5246, 5248), (38402, 34920), (6010, 6014),
     (6446, 6452), (6922, 6932), (7367, 7373), (7792, 7805), (8210, 8219),
     (8575, 8583), (8891, 8898), (9190, 9196), (9373, 9376), (9521, 9529),
     (9653, 9658), (9726, 9733), (9803, 9806), (9855, 9919), (43303, 35198),
@@ -4277,22 +4292,24 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (14611, 14617), (15186, 15203), (15762, 15779), (16233, 16250),
     (16605, 16625), (16947, 16960), (17221, 17229), (17440, 17445),
     (17606, 17612), (17741, 17745), (17836, 17838), (17911, 18001),
-    (5249, 5256), (6017, 6022), (6463, 6468), (6941, 6953), (7387, 7412),
-    (7825, 7845), (8234, 8244), (8600, 8617), (8915, 8919), (9205, 9214),
-    (9380, 9382), (9538, 9540), (9664, 9809), (9893, 9946), (43510, 35960),
-    (43863, 35926), (44309, 36210), (12056, 12066), (12667, 12681),
-    (13319, 13342), (13991, 14025), (14617, 14635), (15203, 15217),
-    (15779, 15791), (16250, 16259), (16625, 16634), (16960, 16971),
-    (49997, 36270), (17445, 17448), (50380, 36117), (17745, 17747),
-    (17945, 17971), (5256, 5264), (5635, 5639), (6022, 6033), (6469, 6484),
-    (6953, 6955), (7412, 7416), (7845, 7852), (8244, 8249), (8617, 8636),
-    (8919, 8931), (9214, 9223), (9382, 9391), (9540, 9550), (9637, 9742),
-    (9809, 9812), (9919, 9938), (42775, 36789), (10743, 10745), (11096, 11103),
+    (39236, 36215), (5249, 5256), (6017, 6022), (6463, 6468), (6941, 6953),
+    (7387, 7412), (7825, 7845), (8234, 8244), (8600, 8617), (8915, 8919),
+    (9205, 9214), (9380, 9382), (9538, 9540), (9664, 9809), (9893, 9946),
+    (43510, 35960), (43863, 35926), (44309, 36210), (12056, 12066),
+    (12667, 12681), (13319, 13342), (13991, 14025), (14617, 14635),
+    (15203, 15217), (15779, 15791), (16250, 16259), (16625, 16634),
+    (16960, 16971), (49997, 36270), (17445, 17448), (50380, 36117),
+    (17745, 17747), (17945, 17971), (46801, 36619), (48571, 36662),
+    (5256, 5264), (5635, 5639), (6022, 6033), (6469, 6484), (6953, 6955),
+    (7412, 7416), (7845, 7852), (8244, 8249), (8617, 8636), (8919, 8931),
+    (9214, 9223), (9382, 9391), (9540, 9550), (9637, 9742), (9809, 9812),
+    (9919, 9938), (42775, 36789), (10743, 10745), (11096, 11103),
     (11542, 11546), (12066, 12076), (12681, 12688), (13342, 13358),
     (14025, 14033), (14624, 14641), (15217, 15244), (15791, 15810),
     (16259, 16267), (16634, 16652), (16971, 16984), (17230, 17239),
     (17448, 17453), (17613, 17622), (17747, 17750), (17838, 17842),
-    (17913, 17991), (51588, 36792), (5265, 5273), (5639, 5645), (6033, 6040),
+    (17913, 17991), (51588, 36792), (43305, 37015), (39741, 37117),
+    (46131, 37124), (44323, 37332), (5265, 5273), (5639, 5645), (6033, 6040),
     (6474, 6496), (6955, 6982), (7416, 7429), (7852, 7873), (8249, 8265),
     (8636, 8649), (8931, 8939), (9223, 9233), (9391, 9397), (9550, 9554),
     (9670, 9672), (42510, 37306), (9812, 9939), (10536, 10541), (10745, 10751),
@@ -4301,19 +4318,20 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (15244, 15263), (15810, 15823), (16267, 16278), (16652, 16661),
     (16984, 16988), (17239, 17246), (17453, 17457), (50390, 37191),
     (50518, 37308), (17842, 17845), (50715, 37315), (51167, 37334),
-    (7429, 7438), (7873, 7890), (8265, 8276), (8649, 8662), (8939, 8955),
-    (9233, 9247), (9397, 9408), (9554, 9568), (42442, 37885), (13379, 13401),
-    (14049, 14080), (14655, 14690), (15263, 15296), (15823, 15863),
-    (16278, 16311), (16661, 16686), (16988, 17010), (17248, 17273),
-    (18056, 18067), (51037, 37843), (51158, 37696), (51289, 37436),
-    (18631, 18762), (5645, 5647), (38808, 38274), (39264, 38275),
-    (39750, 38281), (7438, 7445), (40658, 38296), (8276, 8282), (8662, 8664),
-    (41723, 38331), (9247, 9252), (9408, 9412), (42336, 38364), (9672, 9947),
-    (12721, 12724), (13401, 13405), (14080, 14084), (15296, 15301),
-    (15863, 15872), (16311, 16317), (16686, 16689), (17010, 17013),
-    (17246, 17278), (17457, 17473), (17623, 17633), (17751, 17756),
-    (17845, 17848), (17916, 18002), (51142, 37915), (51232, 38011),
-    (18683, 18687), (37770, 38433), (5273, 5278), (5647, 5657), (6041, 6050),
+    (50783, 37561), (7429, 7438), (7873, 7890), (8265, 8276), (8649, 8662),
+    (8939, 8955), (9233, 9247), (9397, 9408), (9554, 9568), (42442, 37885),
+    (13379, 13401), (14049, 14080), (14655, 14690), (15263, 15296),
+    (15823, 15863), (16278, 16311), (16661, 16686), (16988, 17010),
+    (17248, 17273), (18056, 18067), (51037, 37843), (51158, 37696),
+    (51289, 37436), (18631, 18762), (5645, 5647), (38808, 38274),
+    (39264, 38275), (39750, 38281), (7438, 7445), (40658, 38296), (8276, 8282),
+    (8662, 8664), (41723, 38331), (9247, 9252), (9408, 9412), (42336, 38364),
+    (9672, 9947), (12721, 12724), (13401, 13405), (14080, 14084),
+    (15296, 15301), (15863, 15872), (16311, 16317), (16686, 16689),
+    (17010, 17013), (17246, 17278), (17457, 17473), (17623, 17633),
+    (17751, 17756), (17845, 17848), (17916, 18002), (51142, 37915),
+    (51232, 38011), (18683, 18687), (42776, 38582), (41735, 38748),
+    (42522, 38911), (37770, 38433), (5273, 5278), (5647, 5657), (6041, 6050),
     (6497, 6506), (6983, 6995), (7445, 7462), (7891, 7905), (8282, 8291),
     (8664, 8672), (8956, 8970), (9252, 9259), (9412, 9422), (9569, 9576),
     (42444, 38704), (9751, 9933), (43202, 38430), (10541, 10545),
@@ -4322,28 +4340,29 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (15301, 15313), (15872, 15882), (16317, 16333), (16689, 16712),
     (17013, 17025), (17278, 17284), (17473, 17477), (17633, 17635),
     (17756, 17758), (17848, 17854), (17921, 17974), (51004, 38791),
-    (51155, 38845), (51581, 38565), (6050, 6056), (6506, 6508), (6997, 6999),
-    (7462, 7473), (7905, 7918), (8291, 8300), (8672, 8688), (8970, 8986),
-    (9259, 9264), (9422, 9433), (9576, 9582), (9677, 9681), (9755, 9925),
-    (44865, 39139), (12731, 12734), (13419, 13422), (14097, 14107),
-    (14706, 14721), (15313, 15341), (15882, 15899), (48896, 38984),
-    (16333, 16363), (16712, 16719), (17025, 17038), (17284, 17296),
-    (17477, 17483), (17635, 17640), (50526, 38912), (17922, 17979),
-    (50865, 39020), (18459, 18506), (6508, 6513), (39767, 39770),
-    (40686, 39649), (8300, 8305), (8688, 8696), (8986, 8992), (9262, 9268),
-    (9433, 9445), (9582, 9589), (9681, 9685), (9758, 9951), (12098, 12100),
-    (14107, 14110), (14721, 14729), (15341, 15359), (15899, 15922),
-    (16352, 16382), (16719, 16751), (17038, 17074), (17296, 17318),
-    (17483, 17498), (17640, 17656), (17759, 17764), (17854, 17857),
-    (17952, 18006), (51361, 39811), (39768, 40165), (40687, 40169),
-    (8305, 8308), (8696, 8699), (8992, 8998), (9268, 9270), (9445, 9448),
-    (9589, 9594), (9685, 9687), (9765, 9771), (9826, 9944), (46190, 40166),
-    (14110, 14113), (14729, 14732), (15359, 15371), (15922, 15934),
-    (16382, 16400), (16751, 16766), (17074, 17100), (17312, 17349),
-    (17498, 17530), (17656, 17685), (17764, 17793), (17857, 18007),
-    (50886, 40244), (7001, 7005), (7473, 7476), (7920, 7924), (8308, 8311),
-    (8699, 8704), (8998, 9002), (9270, 9278), (9448, 9458), (9594, 9598),
-    (9687, 9694), (9771, 9953), (10268, 10271), (46191, 40697), (14113, 14115),
+    (51155, 38845), (51581, 38565), (48104, 39382), (6050, 6056), (6506, 6508),
+    (6997, 6999), (7462, 7473), (7905, 7918), (8291, 8300), (8672, 8688),
+    (8970, 8986), (9259, 9264), (9422, 9433), (9576, 9582), (9677, 9681),
+    (9755, 9925), (44865, 39139), (12731, 12734), (13419, 13422),
+    (14097, 14107), (14706, 14721), (15313, 15341), (15882, 15899),
+    (48896, 38984), (16333, 16363), (16712, 16719), (17025, 17038),
+    (17284, 17296), (17477, 17483), (17635, 17640), (50526, 38912),
+    (17922, 17979), (50865, 39020), (18459, 18506), (50764, 39726),
+    (6508, 6513), (39767, 39770), (40686, 39649), (8300, 8305), (8688, 8696),
+    (8986, 8992), (9262, 9268), (9433, 9445), (9582, 9589), (9681, 9685),
+    (9758, 9951), (12098, 12100), (14107, 14110), (14721, 14729),
+    (15341, 15359), (15899, 15922), (16352, 16382), (16719, 16751),
+    (17038, 17074), (17296, 17318), (17483, 17498), (17640, 17656),
+    (17759, 17764), (17854, 17857), (17952, 18006), (51361, 39811),
+    (50554, 40432), (39768, 40165), (40687, 40169), (8305, 8308), (8696, 8699),
+    (8992, 8998), (9268, 9270), (9445, 9448), (9589, 9594), (9685, 9687),
+    (9765, 9771), (9826, 9944), (46190, 40166), (14110, 14113), (14729, 14732),
+    (15359, 15371), (15922, 15934), (16382, 16400), (16751, 16766),
+    (17074, 17100), (17312, 17349), (17498, 17530), (17656, 17685),
+    (17764, 17793), (17857, 18007), (50886, 40244), (49539, 40726),
+    (7001, 7005), (7473, 7476), (7920, 7924), (8308, 8311), (8699, 8704),
+    (8998, 9002), (9270, 9278), (9448, 9458), (9594, 9598), (9687, 9694),
+    (9771, 9953), (10268, 10271), (46191, 40697), (14113, 14115),
     (47500, 40615), (15371, 15375), (15934, 15944), (16400, 16413),
     (16766, 16779), (17100, 17111), (17349, 17364), (17530, 17543),
     (17685, 17694), (17793, 17808), (17863, 18014), (43140, 64012),
@@ -4369,40 +4388,40 @@ const BACKWARD_SEARCH_LOWER: &'static [(u16, u16)] = &[
     (18065, 18213), (18704, 18804), (18147, 18242), (18391, 18435),
     (18529, 18823), (51518, 35843), (18733, 18761), (18516, 18839),
     (51203, 39261), (51035, 41296), (18377, 18425),
-]; // 1561 entries
+]; // 1624 entries
 
 #[cfg(feature = "no-optimized-legacy-encoding")]
 const BACKWARD_SEARCH_UPPER: &'static [u16] = &[
-    0, 3, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 10, 11, 14, 16, 16, 16,
-    16, 17, 22, 24, 25, 28, 29, 30, 32, 34, 35, 36, 38, 39, 40, 41, 42, 64,
-    104, 145, 168, 210, 251, 296, 338, 381, 414, 444, 488, 531, 550, 594, 623,
-    646, 689, 734, 775, 818, 857, 889, 928, 964, 999, 1036, 1060, 1096, 1134,
-    1166, 1198, 1235, 1273, 1296, 1326, 1366, 1397, 1423, 1448, 1473, 1473,
-    1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473,
-    1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473,
-    1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473,
-    1473, 1473, 1473, 1473, 1473, 1473, 1473, 1473, 1475, 1475, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479, 1479,
-    1479, 1479, 1479, 1479, 1479, 1479, 1479, 1481, 1482, 1484, 1485, 1486,
-    1487, 1489, 1490, 1491, 1493, 1494, 1496, 1498, 1499, 1500, 1501, 1502,
-    1503, 1505, 1507, 1508, 1508, 1509, 1510, 1511, 1513, 1514, 1515, 1515,
-    1516, 1518, 1520, 1522, 1523, 1524, 1524, 1526, 1528, 1529, 1530, 1531,
-    1532, 1533, 1534, 1535, 1535, 1535, 1535, 1536, 1537, 1537, 1537, 1538,
-    1540, 1542, 1543, 1544, 1544, 1544, 1546, 1546, 1548, 1548, 1548, 1548,
-    1548, 1549, 1550, 1552, 1555, 1556, 1557, 1558, 1558, 1558, 1558, 1559,
-    1559, 1559, 1559, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560,
-    1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560,
-    1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560,
-    1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1560, 1561,
+    0, 3, 6, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 7, 10, 11, 18, 20, 20, 20,
+    20, 21, 26, 28, 29, 32, 33, 34, 36, 38, 39, 40, 42, 43, 44, 45, 46, 69,
+    114, 157, 180, 223, 264, 311, 354, 398, 434, 466, 510, 553, 572, 616, 647,
+    671, 716, 763, 806, 850, 891, 925, 967, 1005, 1042, 1081, 1107, 1143, 1182,
+    1214, 1247, 1286, 1328, 1352, 1382, 1425, 1457, 1484, 1510, 1536, 1536,
+    1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536,
+    1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536,
+    1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536,
+    1536, 1536, 1536, 1536, 1536, 1536, 1536, 1536, 1538, 1538, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542, 1542,
+    1542, 1542, 1542, 1542, 1542, 1542, 1542, 1544, 1545, 1547, 1548, 1549,
+    1550, 1552, 1553, 1554, 1556, 1557, 1559, 1561, 1562, 1563, 1564, 1565,
+    1566, 1568, 1570, 1571, 1571, 1572, 1573, 1574, 1576, 1577, 1578, 1578,
+    1579, 1581, 1583, 1585, 1586, 1587, 1587, 1589, 1591, 1592, 1593, 1594,
+    1595, 1596, 1597, 1598, 1598, 1598, 1598, 1599, 1600, 1600, 1600, 1601,
+    1603, 1605, 1606, 1607, 1607, 1607, 1609, 1609, 1611, 1611, 1611, 1611,
+    1611, 1612, 1613, 1615, 1618, 1619, 1620, 1621, 1621, 1621, 1621, 1622,
+    1622, 1622, 1622, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623,
+    1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623,
+    1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623,
+    1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1623, 1624,
 ]; // 382 entries
 
 /// Returns the index pointer for code point `code` in this index.
@@ -4453,14 +4472,369 @@ pub fn backward(code: u32) -> u16 {
 #[cfg(test)]
 multi_byte_tests! {
     dups = [
-        0...5023, 5206, 5207, 5208, 5209, 5214, 5247, 5248, 5249, 5250, 5287,
-        5289, 6410, 6422, 6543, 6732, 7300, 7410, 7915, 8240, 8281, 8870, 9081,
-        9103, 9741, 9802, 9810, 9840, 9909, 10024, 10696, 10825, 10950, 10957,
-        11332, 11345, 11458, 11479, 12065, 12497, 12739, 13142, 14159, 14187,
-        14305, 14651, 14708, 14975, 15488, 15930, 15967, 16278, 16353, 16745,
-        17060, 17421, 17713, 18346, 18728, 18938, 18957, 18992, 18993, 18994,
-        18995, 19028, 19035, 19088, 19096, 19112, 19162, 19240, 19299, 19305,
-        19309, 19326, 19355, 19398, 19424, 19439, 19454, 19504, 19553, 19554,
-        19557, 19611, 19643, 19672, 19697, 19720, 19748,
+        0...5023, 5247, 5248, 5249, 5250, 5287, 5289, 10957, 11345, 18992,
+        18993, 18994, 18995, 19028, 19035, 19088, 19096, 19112, 19240, 19299,
+        19309, 19326, 19398, 19424, 19439, 19454, 19553, 19554, 19557, 19611,
+        19672, 19697, 19720, 19748,
+    ],
+    golden = [
+        0xd9ace1bbdbd971c2, 0xe214b459e37dc33f, // forward & backward hash
+        // 14653 valid code points in 4079 runs
+        167, 2, 6, 3, 5, 1, 31, 1, 31, 2, 82, 1, 7, 1, 252, 1, 3, 1, 6, 1, 14,
+        1, 10, 1, 13, 1, 6, 1, 59, 2, 1, 3, 1, 1, 11, 1, 183, 17, 1, 7, 7, 17,
+        1, 7, 55, 1, 14, 64, 1, 1, 7105, 2, 3, 2, 2, 2, 7, 3, 10, 1, 2, 1, 5,
+        1, 112, 1, 86, 1, 1, 1, 3, 1, 12, 1, 10, 1, 62, 10, 6, 10, 22, 4, 2, 4,
+        30, 2, 45, 1, 45, 1, 4, 1, 3, 3, 2, 1, 1, 1, 3, 3, 2, 1, 5, 2, 28, 1,
+        13, 2, 4, 2, 45, 1, 3, 1, 11, 1, 25, 1, 320, 32, 1, 1, 62, 10, 10, 10,
+        130, 1, 1, 1, 9, 1, 3, 1, 3, 1, 3, 1, 3, 1, 7, 1, 7, 1, 7, 1, 7, 1, 19,
+        37, 12, 15, 4, 2, 10, 2, 16, 2, 8, 2, 8, 2, 3, 1, 2, 2, 18, 4, 31, 2,
+        57, 1, 1, 1, 250, 1, 1858, 1, 3, 1, 1, 3, 1, 1, 1, 2, 7, 1, 6, 2, 7, 1,
+        1, 1, 2, 1, 1, 1, 1, 1, 7, 1, 5, 1, 1, 1, 7, 1, 3, 1, 1, 2, 1, 1, 6, 2,
+        6, 1, 4, 1, 79, 1, 204, 4, 1, 14, 1, 2, 7, 2, 2, 9, 23, 83, 7, 4, 2,
+        86, 5, 3, 6, 37, 165, 1, 97, 1, 113, 1, 234, 2, 12, 3, 2, 1, 34, 1, 9,
+        1, 2, 2, 2, 1, 164, 1, 230, 1, 63, 1, 129, 1, 21, 1, 15, 1, 103, 1, 17,
+        1, 1, 1, 31, 2, 33, 1, 4, 1, 34, 1, 1, 1, 13, 1, 2, 1, 180, 1, 52, 1,
+        8, 1, 105, 1, 43, 1, 101, 1, 48, 1, 157, 1, 21, 1, 63, 1, 14, 1, 68, 1,
+        50, 1, 76, 1, 84, 1, 32, 1, 32, 1, 48, 1, 25, 1, 206, 1, 14, 1, 70, 1,
+        8, 1, 18, 1, 16, 1, 37, 1, 46, 1, 18, 1, 32, 1, 87, 1, 20, 1, 82, 1, 1,
+        1, 44, 1, 44, 1, 84, 1, 170, 1, 211, 1, 43, 1, 432, 1, 70, 1, 404, 1,
+        16, 1, 34, 1, 35, 1, 104, 1, 2, 1, 592, 1, 182, 1, 80, 1, 46, 1, 15, 1,
+        101, 1, 483, 1, 437, 1, 34, 1, 239, 2, 1, 1, 3, 11, 2, 3, 1, 2, 4, 2,
+        6, 1, 4, 1, 1, 2, 1, 4, 2, 1, 1, 2, 1, 2, 2, 1, 2, 2, 1, 1, 1, 3, 1, 1,
+        1, 3, 2, 2, 2, 1, 1, 3, 1, 4, 9, 1, 9, 1, 10, 2, 2, 5, 1, 1, 2, 4, 2,
+        5, 3, 1, 1, 1, 2, 5, 1, 3, 1, 1, 2, 4, 4, 1, 2, 2, 1, 2, 5, 5, 1, 6, 1,
+        1, 6, 7, 1, 4, 1, 1, 1, 3, 2, 2, 6, 8, 3, 1, 1, 1, 1, 4, 1, 2, 2, 4, 1,
+        9, 2, 2, 3, 1, 4, 1, 9, 2, 1, 2, 2, 2, 1, 1, 1, 1, 1, 6, 1, 1, 1, 1, 2,
+        4, 2, 25, 2, 1, 1, 4, 1, 3, 2, 23, 1, 1, 1, 1, 1, 4, 1, 5, 1, 5, 12, 1,
+        2, 2, 2, 2, 1, 3, 1, 3, 3, 7, 1, 1, 1, 3, 1, 5, 1, 2, 1, 12, 10, 1, 1,
+        2, 1, 1, 1, 6, 1, 1, 3, 1, 1, 1, 4, 5, 1, 5, 1, 12, 1, 6, 1, 9, 1, 3,
+        1, 1, 1, 1, 1, 1, 4, 1, 3, 2, 1, 1, 1, 11, 1, 1, 1, 1, 1, 1, 1, 1, 2,
+        12, 2, 4, 1, 4, 1, 6, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 3, 4, 1, 3,
+        1, 3, 1, 7, 3, 2, 8, 13, 1, 2, 1, 3, 1, 2, 1, 8, 2, 2, 1, 1, 1, 5, 2,
+        2, 1, 1, 2, 2, 1, 8, 1, 6, 1, 1, 1, 2, 1, 2, 1, 1, 1, 16, 1, 1, 1, 6,
+        1, 2, 1, 1, 1, 1, 2, 4, 1, 3, 2, 2, 2, 2, 1, 6, 1, 7, 1, 3, 1, 7, 1, 3,
+        4, 1, 1, 2, 1, 1, 1, 11, 1, 1, 1, 8, 2, 1, 3, 4, 3, 1, 3, 1, 1, 1, 4,
+        4, 2, 1, 1, 1, 1, 8, 5, 1, 1, 1, 1, 1, 1, 2, 4, 3, 3, 4, 1, 5, 2, 3, 5,
+        14, 1, 2, 2, 2, 3, 7, 10, 1, 2, 2, 1, 4, 1, 3, 2, 1, 2, 4, 2, 7, 1, 1,
+        1, 4, 2, 2, 4, 3, 2, 1, 2, 3, 1, 3, 3, 1, 1, 4, 1, 4, 1, 3, 4, 1, 1, 2,
+        1, 2, 1, 6, 3, 1, 1, 4, 2, 6, 1, 2, 6, 7, 2, 1, 1, 2, 1, 2, 1, 4, 1, 6,
+        2, 7, 3, 1, 1, 2, 1, 4, 1, 1, 3, 2, 2, 1, 2, 1, 2, 6, 6, 1, 3, 1, 1, 2,
+        1, 1, 1, 4, 1, 1, 1, 1, 1, 1, 3, 1, 2, 1, 1, 2, 1, 5, 1, 1, 1, 4, 1, 3,
+        1, 1, 2, 1, 1, 1, 3, 3, 1, 3, 1, 6, 1, 2, 5, 2, 1, 4, 1, 6, 2, 3, 1, 2,
+        1, 2, 1, 5, 6, 1, 2, 1, 1, 3, 1, 2, 2, 3, 2, 10, 1, 4, 1, 2, 3, 4, 2,
+        1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 2, 1, 2, 10, 1, 3, 1, 2, 1, 2,
+        2, 1, 1, 1, 5, 1, 3, 2, 2, 3, 1, 5, 1, 5, 3, 5, 2, 4, 3, 1, 1, 1, 1, 1,
+        2, 1, 1, 1, 5, 1, 1, 1, 1, 1, 2, 4, 1, 1, 6, 1, 1, 2, 1, 1, 1, 1, 3, 8,
+        1, 12, 1, 2, 1, 1, 2, 2, 1, 1, 2, 1, 1, 2, 1, 14, 4, 2, 1, 7, 2, 14, 1,
+        1, 1, 5, 1, 4, 1, 4, 1, 4, 1, 1, 3, 2, 4, 1, 11, 9, 2, 3, 1, 10, 1, 9,
+        1, 1, 1, 3, 2, 8, 2, 2, 1, 1, 1, 1, 5, 3, 1, 14, 1, 1, 2, 3, 1, 16, 4,
+        2, 6, 1, 7, 1, 1, 3, 1, 8, 1, 2, 2, 3, 3, 2, 1, 4, 1, 1, 1, 1, 1, 10,
+        1, 5, 1, 1, 2, 1, 2, 1, 11, 2, 2, 16, 1, 2, 1, 1, 1, 2, 1, 9, 1, 7, 1,
+        3, 4, 4, 1, 6, 3, 1, 10, 3, 3, 10, 1, 10, 1, 5, 2, 3, 1, 2, 1, 1, 1,
+        14, 2, 3, 1, 1, 5, 1, 3, 2, 1, 21, 2, 5, 1, 1, 1, 9, 5, 1, 2, 1, 3, 2,
+        1, 2, 1, 7, 1, 3, 1, 2, 2, 5, 1, 6, 3, 3, 1, 1, 7, 1, 1, 2, 1, 1, 1, 3,
+        1, 10, 1, 6, 2, 2, 1, 3, 1, 4, 3, 1, 3, 4, 3, 1, 1, 1, 1, 5, 1, 13, 1,
+        4, 4, 10, 4, 5, 2, 1, 1, 1, 1, 4, 1, 2, 7, 4, 1, 5, 3, 6, 4, 3, 1, 4,
+        1, 2, 1, 6, 3, 1, 1, 2, 2, 1, 2, 2, 1, 5, 2, 2, 1, 1, 2, 2, 1, 5, 5, 1,
+        1, 2, 4, 6, 2, 7, 4, 3, 1, 1, 1, 1, 1, 3, 1, 3, 1, 2, 4, 3, 1, 5, 2, 2,
+        6, 1, 2, 1, 1, 4, 1, 3, 1, 10, 14, 2, 1, 1, 1, 1, 1, 4, 1, 1, 1, 9, 3,
+        3, 2, 1, 1, 2, 7, 2, 2, 2, 2, 3, 1, 5, 1, 4, 1, 4, 8, 1, 6, 2, 1, 3, 1,
+        2, 1, 1, 1, 3, 2, 2, 3, 2, 1, 3, 1, 1, 1, 2, 6, 1, 2, 9, 1, 1, 2, 3, 1,
+        15, 1, 15, 1, 1, 3, 1, 4, 1, 1, 4, 1, 2, 1, 8, 1, 14, 1, 1, 1, 1, 1, 1,
+        8, 8, 1, 5, 1, 8, 3, 4, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 3, 2, 11, 1,
+        7, 2, 4, 1, 2, 3, 1, 3, 6, 1, 1, 1, 2, 1, 5, 1, 2, 1, 1, 1, 1, 6, 6, 1,
+        2, 2, 5, 4, 2, 1, 6, 1, 9, 1, 3, 2, 3, 1, 2, 2, 1, 4, 1, 4, 7, 3, 1, 2,
+        1, 3, 1, 1, 4, 1, 2, 1, 4, 1, 2, 1, 1, 2, 2, 1, 1, 1, 2, 1, 1, 1, 7, 1,
+        1, 5, 2, 3, 1, 1, 1, 1, 1, 3, 2, 1, 4, 3, 4, 1, 3, 1, 2, 1, 1, 1, 1, 3,
+        3, 4, 1, 1, 3, 1, 2, 1, 5, 1, 4, 1, 11, 4, 1, 2, 4, 1, 2, 2, 4, 3, 2,
+        1, 9, 5, 2, 1, 6, 2, 6, 1, 2, 1, 1, 1, 16, 1, 1, 1, 7, 1, 2, 1, 4, 1,
+        3, 1, 3, 2, 7, 1, 9, 1, 1, 5, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1,
+        3, 2, 3, 3, 1, 3, 2, 4, 1, 1, 5, 2, 1, 1, 1, 1, 5, 1, 5, 1, 2, 2, 4, 1,
+        4, 1, 7, 1, 6, 1, 2, 1, 2, 2, 1, 6, 2, 1, 4, 1, 1, 3, 2, 3, 1, 1, 3, 1,
+        10, 2, 7, 1, 1, 2, 3, 1, 1, 1, 2, 1, 21, 1, 1, 1, 8, 5, 1, 1, 15, 1, 2,
+        1, 7, 4, 9, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 2, 2, 2, 2, 2, 1, 2, 1, 3,
+        1, 2, 1, 2, 1, 6, 1, 1, 1, 5, 1, 1, 1, 1, 3, 1, 3, 5, 2, 1, 1, 4, 2, 4,
+        1, 2, 1, 6, 1, 4, 1, 1, 2, 4, 3, 1, 1, 2, 1, 1, 1, 4, 1, 4, 1, 4, 1, 7,
+        1, 3, 1, 2, 1, 2, 2, 2, 1, 1, 1, 7, 4, 7, 1, 1, 1, 3, 1, 1, 2, 4, 1, 2,
+        5, 4, 1, 4, 2, 5, 1, 10, 4, 15, 1, 6, 1, 2, 1, 1, 1, 1, 4, 1, 1, 1, 1,
+        3, 1, 16, 3, 1, 4, 1, 2, 1, 1, 2, 2, 1, 1, 1, 1, 1, 3, 2, 1, 1, 3, 6,
+        1, 4, 2, 6, 1, 7, 2, 3, 1, 2, 2, 2, 2, 1, 1, 4, 1, 4, 1, 4, 1, 1, 1, 2,
+        4, 4, 1, 1, 6, 2, 1, 6, 1, 7, 6, 2, 1, 19, 1, 1, 1, 4, 1, 1, 11, 7, 1,
+        3, 1, 3, 1, 6, 2, 2, 8, 3, 1, 6, 2, 1, 1, 4, 1, 1, 1, 1, 1, 3, 4, 2, 3,
+        8, 1, 1, 1, 6, 1, 4, 1, 8, 4, 1, 1, 11, 1, 2, 1, 5, 1, 3, 1, 4, 1, 1,
+        1, 3, 2, 1, 3, 1, 4, 1, 3, 2, 1, 1, 1, 3, 1, 2, 2, 1, 1, 2, 4, 1, 1, 2,
+        1, 7, 1, 1, 1, 6, 1, 1, 4, 4, 1, 1, 1, 2, 1, 7, 4, 4, 1, 7, 1, 5, 1, 1,
+        1, 2, 2, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 5, 2, 1, 1, 6,
+        2, 4, 2, 1, 2, 1, 1, 5, 2, 1, 1, 1, 3, 3, 2, 3, 1, 1, 2, 2, 1, 1, 1, 1,
+        2, 1, 2, 8, 1, 1, 1, 7, 2, 2, 1, 1, 1, 2, 4, 2, 1, 3, 4, 2, 1, 2, 1, 3,
+        4, 6, 3, 3, 1, 3, 1, 3, 1, 5, 2, 11, 1, 5, 1, 9, 1, 3, 2, 7, 1, 1, 5,
+        3, 2, 3, 3, 1, 1, 7, 1, 5, 1, 10, 4, 1, 2, 2, 1, 9, 1, 1, 1, 20, 1, 5,
+        2, 1, 1, 2, 1, 4, 1, 2, 1, 4, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1,
+        2, 4, 1, 2, 1, 2, 1, 1, 1, 1, 2, 3, 1, 4, 3, 2, 1, 2, 1, 1, 1, 4, 1, 1,
+        1, 1, 3, 1, 2, 2, 1, 1, 1, 5, 1, 3, 3, 1, 1, 4, 3, 1, 3, 5, 1, 1, 1, 5,
+        1, 6, 1, 4, 1, 8, 2, 8, 3, 3, 3, 4, 1, 2, 1, 4, 2, 12, 2, 1, 2, 3, 1,
+        1, 1, 7, 1, 1, 1, 1, 3, 1, 2, 2, 1, 4, 1, 6, 3, 5, 1, 3, 2, 1, 1, 2, 1,
+        3, 1, 1, 1, 3, 1, 2, 1, 2, 1, 1, 1, 2, 8, 15, 1, 6, 1, 16, 1, 5, 1, 1,
+        1, 1, 6, 8, 1, 2, 1, 2, 2, 1, 1, 4, 2, 4, 1, 3, 2, 15, 1, 1, 12, 3, 1,
+        8, 1, 3, 1, 1, 1, 1, 1, 4, 2, 7, 1, 3, 3, 1, 7, 18, 1, 13, 1, 1, 1, 3,
+        2, 11, 1, 1, 1, 1, 9, 13, 1, 4, 1, 4, 1, 4, 1, 4, 1, 5, 1, 1, 1, 4, 1,
+        1, 3, 1, 3, 3, 1, 2, 1, 2, 2, 1, 1, 1, 1, 2, 3, 1, 2, 5, 1, 12, 2, 5,
+        1, 1, 1, 15, 1, 3, 1, 1, 1, 8, 1, 2, 1, 1, 1, 1, 1, 4, 3, 1, 1, 6, 1,
+        5, 1, 1, 3, 2, 1, 1, 1, 1, 1, 2, 1, 1, 2, 16, 1, 1, 1, 1, 1, 1, 1, 2,
+        1, 3, 1, 9, 2, 1, 2, 1, 2, 1, 1, 1, 5, 3, 2, 9, 1, 2, 1, 3, 2, 13, 1,
+        2, 2, 4, 1, 3, 1, 3, 1, 3, 2, 3, 3, 7, 1, 1, 1, 3, 1, 2, 1, 1, 1, 3, 1,
+        1, 3, 1, 2, 7, 2, 6, 1, 2, 1, 5, 3, 5, 1, 1, 1, 7, 6, 8, 1, 2, 1, 9, 1,
+        2, 1, 5, 1, 1, 1, 2, 1, 8, 15, 10, 1, 4, 1, 2, 1, 5, 2, 1, 1, 25, 2, 1,
+        11, 25, 3, 3, 1, 7, 1, 4, 17, 6, 1, 1, 2, 3, 1, 1, 1, 7, 1, 18, 2, 7,
+        10, 1, 1, 3, 1, 8, 2, 4, 1, 4, 2, 6, 1, 12, 1, 1, 1, 4, 1, 11, 1, 11,
+        11, 2, 1, 1, 1, 15, 1, 2, 1, 9, 1, 3, 1, 3, 1, 5, 1, 10, 1, 2, 12, 1,
+        2, 8, 1, 7, 1, 3, 1, 11, 1, 7, 2, 8, 2, 5, 1, 1, 7, 1, 1, 2, 1, 5, 3,
+        2, 1, 7, 3, 5, 1, 6, 1, 10, 1, 1, 1, 1, 2, 1, 2, 1, 1, 6, 2, 2, 1, 2,
+        1, 6, 1, 5, 1, 5, 2, 1, 1, 9, 7, 5, 1, 5, 1, 1, 1, 3, 1, 4, 1, 1, 1, 1,
+        1, 6, 4, 7, 1, 2, 1, 3, 1, 6, 2, 2, 1, 8, 1, 2, 1, 2, 1, 1, 2, 5, 2, 7,
+        1, 4, 1, 7, 2, 7, 2, 3, 1, 4, 1, 1, 1, 3, 1, 1, 1, 1, 1, 2, 1, 3, 2, 1,
+        1, 1, 1, 1, 1, 7, 2, 4, 2, 7, 1, 1, 1, 2, 1, 1, 2, 11, 2, 7, 1, 2, 3,
+        1, 3, 3, 1, 4, 1, 1, 1, 8, 1, 2, 1, 2, 1, 3, 1, 3, 1, 2, 1, 5, 1, 3, 1,
+        1, 1, 6, 4, 9, 2, 2, 2, 2, 1, 7, 1, 2, 1, 2, 2, 10, 4, 4, 2, 1, 1, 20,
+        2, 1, 3, 2, 1, 10, 2, 1, 1, 3, 1, 6, 2, 2, 6, 5, 1, 1, 1, 4, 2, 1, 1,
+        2, 4, 1, 1, 7, 1, 2, 1, 5, 1, 1, 1, 1, 1, 7, 1, 7, 1, 1, 1, 1, 3, 10,
+        2, 2, 2, 6, 3, 1, 1, 4, 1, 1, 3, 4, 1, 9, 1, 5, 1, 2, 1, 1, 3, 1, 1, 8,
+        1, 1, 2, 1, 3, 1, 1, 7, 1, 1, 2, 2, 1, 1, 1, 2, 1, 4, 1, 1, 1, 3, 1, 4,
+        2, 1, 1, 8, 2, 4, 1, 1, 1, 2, 1, 4, 1, 2, 2, 1, 1, 1, 1, 5, 2, 3, 1, 5,
+        2, 1, 1, 3, 2, 8, 4, 6, 1, 7, 1, 1, 1, 3, 1, 2, 1, 5, 1, 1, 4, 1, 2, 1,
+        1, 2, 1, 17, 1, 1, 1, 5, 1, 1, 1, 4, 1, 6, 1, 4, 1, 2, 1, 1, 12, 1, 1,
+        14, 4, 7, 1, 13, 2, 9, 2, 6, 1, 16, 1, 1, 1, 1, 2, 1, 1, 1, 11, 1, 4,
+        3, 1, 3, 1, 4, 1, 4, 2, 2, 1, 4, 1, 3, 1, 5, 1, 8, 1, 7, 1, 2, 1, 7, 1,
+        2, 8, 1, 13, 1, 1, 3, 1, 2, 1, 6, 1, 9, 1, 3, 1, 4, 2, 6, 1, 2, 3, 3,
+        1, 6, 1, 16, 7, 1, 5, 2, 1, 9, 1, 9, 1, 1, 1, 6, 1, 2, 1, 7, 1, 16, 2,
+        9, 1, 12, 1, 1, 13, 1, 4, 1, 4, 2, 1, 8, 1, 8, 1, 2, 2, 5, 1, 2, 1, 4,
+        1, 14, 1, 2, 1, 10, 1, 9, 6, 2, 2, 1, 6, 2, 1, 2, 1, 10, 1, 1, 1, 2, 1,
+        15, 1, 5, 1, 1, 1, 5, 1, 4, 1, 1, 2, 8, 2, 2, 4, 1, 7, 2, 1, 5, 2, 4,
+        2, 4, 1, 13, 1, 8, 1, 1, 1, 1, 1, 1, 1, 7, 1, 1, 1, 5, 1, 1, 1, 4, 3,
+        1, 5, 1, 1, 2, 2, 10, 2, 6, 1, 1, 1, 5, 2, 3, 1, 4, 1, 6, 1, 1, 1, 6,
+        1, 1, 1, 1, 6, 1, 7, 4, 1, 3, 1, 1, 1, 2, 1, 3, 1, 8, 2, 13, 1, 1, 3,
+        4, 3, 2, 1, 6, 1, 1, 4, 2, 1, 4, 2, 3, 1, 3, 1, 1, 5, 9, 3, 1, 1, 2, 1,
+        3, 1, 4, 1, 1, 4, 5, 3, 1, 1, 3, 3, 4, 3, 5, 2, 5, 2, 2, 1, 2, 1, 1, 1,
+        1, 2, 1, 3, 2, 1, 1, 1, 15, 1, 3, 1, 10, 1, 2, 2, 3, 2, 1, 1, 2, 1, 10,
+        2, 1, 2, 1, 4, 1, 1, 1, 1, 4, 1, 1, 2, 3, 1, 3, 1, 1, 1, 3, 1, 4, 1, 1,
+        2, 6, 1, 1, 2, 3, 1, 6, 2, 2, 1, 4, 1, 2, 1, 3, 2, 1, 1, 2, 1, 2, 2,
+        11, 1, 2, 1, 3, 1, 3, 1, 3, 1, 1, 1, 5, 1, 3, 2, 2, 2, 2, 1, 2, 3, 3,
+        1, 12, 1, 2, 1, 3, 1, 3, 1, 4, 1, 4, 1, 1, 1, 3, 1, 6, 1, 3, 1, 3, 2,
+        2, 1, 3, 2, 1, 2, 6, 2, 1, 2, 8, 1, 1, 1, 2, 1, 1, 1, 9, 3, 7, 1, 8, 1,
+        1, 1, 4, 1, 2, 1, 17, 1, 5, 1, 6, 13, 4, 1, 2, 1, 2, 1, 18, 1, 5, 1, 9,
+        1, 6, 1, 4, 1, 1, 1, 3, 1, 9, 1, 1, 3, 1, 6, 2, 1, 2, 2, 12, 3, 6, 1,
+        4, 1, 1, 2, 1, 1, 28, 21, 5, 1, 13, 1, 6, 2, 13, 1, 13, 1, 9, 17, 3, 1,
+        2, 2, 4, 1, 2, 1, 7, 1, 1, 1, 10, 1, 24, 1, 16, 1, 5, 2, 1, 2, 1, 1, 1,
+        19, 5, 1, 10, 1, 13, 1, 10, 1, 5, 1, 3, 1, 10, 1, 18, 1, 1, 2, 2, 1, 4,
+        2, 3, 2, 1, 11, 2, 3, 4, 1, 3, 1, 4, 1, 13, 2, 2, 2, 10, 1, 2, 1, 27,
+        1, 2, 1, 2, 14, 5, 1, 2, 1, 23, 2, 3, 2, 5, 1, 3, 1, 1, 1, 6, 1, 3, 1,
+        11, 1, 13, 1, 2, 9, 8, 1, 2, 1, 11, 1, 2, 1, 8, 1, 3, 1, 3, 1, 7, 1, 1,
+        1, 11, 1, 1, 1, 6, 5, 24, 1, 1, 1, 3, 1, 2, 1, 6, 1, 10, 3, 3, 2, 1, 2,
+        10, 1, 4, 1, 8, 1, 1, 2, 2, 1, 3, 1, 4, 2, 4, 1, 7, 1, 1, 2, 10, 1, 6,
+        1, 6, 3, 7, 1, 6, 1, 9, 1, 5, 4, 2, 2, 4, 1, 2, 1, 10, 1, 4, 4, 2, 2,
+        1, 1, 1, 1, 3, 1, 3, 2, 6, 3, 2, 2, 1, 2, 6, 1, 3, 4, 1, 1, 1, 2, 1, 2,
+        1, 1, 1, 1, 7, 1, 3, 1, 2, 1, 1, 2, 2, 6, 4, 1, 6, 1, 10, 1, 7, 1, 1,
+        10, 2, 2, 2, 1, 8, 1, 2, 1, 1, 1, 1, 1, 1, 2, 6, 1, 1, 2, 1, 3, 1, 1,
+        4, 1, 6, 1, 2, 1, 1, 2, 2, 1, 5, 3, 1, 3, 1, 6, 7, 1, 8, 1, 3, 1, 1, 1,
+        3, 1, 15, 1, 1, 1, 1, 1, 1, 1, 1, 5, 1, 2, 1, 1, 1, 2, 3, 1, 4, 1, 2,
+        4, 2, 1, 1, 1, 1, 1, 2, 1, 9, 2, 2, 1, 4, 1, 1, 2, 7, 2, 3, 1, 16, 2,
+        3, 1, 1, 1, 3, 1, 6, 1, 4, 1, 5, 3, 3, 1, 3, 1, 1, 3, 2, 1, 5, 1, 3, 1,
+        3, 2, 1, 1, 3, 1, 1, 2, 3, 3, 3, 1, 3, 2, 3, 1, 5, 1, 3, 1, 1, 4, 2, 1,
+        4, 1, 6, 1, 1, 1, 7, 2, 1, 2, 2, 1, 7, 1, 7, 3, 1, 1, 2, 1, 1, 1, 3, 1,
+        3, 1, 4, 1, 8, 1, 3, 1, 2, 1, 4, 1, 4, 1, 4, 1, 2, 1, 2, 2, 10, 1, 1,
+        1, 3, 3, 2, 4, 1, 2, 1, 1, 8, 2, 4, 1, 1, 1, 3, 1, 1, 1, 5, 1, 1, 2, 3,
+        1, 2, 1, 1, 1, 4, 7, 2, 1, 12, 5, 2, 1, 3, 2, 1, 1, 3, 2, 4, 1, 4, 3,
+        2, 1, 7, 1, 2, 1, 8, 2, 3, 1, 3, 1, 4, 3, 2, 1, 3, 1, 3, 4, 5, 1, 6, 2,
+        8, 1, 3, 1, 2, 1, 4, 1, 18, 2, 1, 3, 6, 4, 2, 1, 4, 1, 10, 4, 8, 1, 2,
+        1, 3, 1, 2, 1, 11, 2, 13, 1, 1, 2, 3, 1, 5, 1, 3, 4, 5, 1, 1, 1, 6, 1,
+        11, 7, 3, 2, 2, 1, 1, 2, 7, 1, 15, 2, 2, 4, 4, 1, 1, 1, 2, 1, 3, 1, 9,
+        1, 1, 1, 8, 1, 4, 1, 1, 1, 2, 1, 11, 2, 1, 2, 8, 1, 7, 4, 1, 1, 1, 1,
+        2, 1, 2, 1, 1, 1, 1, 1, 4, 1, 9, 1, 1, 1, 4, 2, 4, 1, 2, 1, 7, 1, 1, 2,
+        1, 1, 2, 3, 1, 4, 19, 1, 2, 2, 1, 1, 1, 5, 4, 3, 1, 1, 4, 1, 3, 2, 2,
+        2, 14, 1, 1, 1, 4, 1, 2, 2, 2, 1, 12, 3, 4, 2, 4, 6, 2, 1, 6, 4, 1, 4,
+        5, 1, 1, 2, 6, 2, 3, 1, 3, 5, 4, 3, 4, 3, 1, 1, 2, 2, 3, 1, 5, 1, 2, 2,
+        3, 2, 2, 3, 4, 1, 1, 2, 2, 4, 1, 1, 5, 1, 11, 1, 2, 1, 1, 2, 9, 1, 2,
+        1, 5, 1, 8, 1, 2, 5, 1, 1, 21, 4, 6, 1, 3, 1, 4, 2, 17, 2, 2, 1, 7, 2,
+        1, 1, 1, 1, 2, 4, 2, 2, 4, 2, 1, 2, 5, 2, 5, 1, 1, 2, 4, 1, 2, 3, 2, 1,
+        7, 2, 2, 1, 2, 1, 5, 1, 2, 1, 1, 1, 6, 2, 3, 1, 2, 1, 2, 2, 6, 2, 1, 2,
+        3, 3, 2, 1, 4, 3, 2, 1, 2, 1, 2, 1, 3, 2, 5, 1, 3, 1, 3, 3, 3, 5, 6, 1,
+        1, 1, 5, 1, 2, 1, 10, 1, 6, 1, 1, 2, 1, 1, 3, 1, 5, 4, 4, 1, 1, 3, 3,
+        1, 4, 1, 2, 1, 5, 3, 1, 1, 1, 1, 14, 1, 1, 3, 4, 2, 6, 2, 1, 1, 3, 1,
+        5, 1, 6, 1, 11, 9, 1, 2, 10, 1, 3, 1, 5, 1, 1, 3, 1, 1, 1, 1, 11, 1, 1,
+        1, 2, 1, 4, 1, 9, 2, 4, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 5, 2, 3, 1, 6,
+        1, 1, 1, 1, 1, 2, 1, 5, 2, 9, 2, 7, 4, 2, 1, 2, 2, 1, 2, 9, 8, 1, 1, 5,
+        1, 17, 1, 2, 3, 1, 6, 1, 1, 1, 2, 3, 1, 3, 1, 1, 1, 1, 9, 3, 1, 1, 1,
+        1, 1, 2, 2, 10, 7, 1, 1, 2, 1, 4, 1, 5, 1, 1, 2, 1, 1, 2, 1, 1, 1, 8,
+        3, 8, 1, 7, 1, 6, 5, 3, 1, 1, 2, 1, 1, 3, 1, 11, 1, 3, 1, 1, 2, 2, 1,
+        7, 1, 1, 1, 4, 1, 2, 1, 1, 1, 4, 2, 1, 1, 7, 1, 2, 1, 2, 3, 1, 2, 1, 1,
+        1, 1, 5, 2, 1, 1, 1, 1, 4, 2, 1, 1, 13, 1, 1, 2, 2, 2, 3, 1, 7, 1, 9,
+        2, 9, 2, 8, 1, 3, 1, 5, 1, 1, 2, 5, 4, 2, 1, 2, 1, 4, 3, 1, 1, 1, 1, 2,
+        1, 4, 1, 7, 1, 4, 2, 3, 1, 1, 1, 9, 1, 5, 1, 6, 1, 5, 3, 2, 1, 2, 1, 5,
+        1, 2, 1, 3, 1, 1, 3, 5, 2, 2, 1, 2, 1, 6, 7, 3, 1, 2, 4, 1, 1, 4, 2, 1,
+        1, 4, 2, 6, 1, 6, 1, 3, 1, 1, 3, 1, 1, 1, 2, 1, 2, 4, 5, 1, 1, 1, 1, 3,
+        1, 2, 3, 1, 1, 3, 1, 5, 5, 1, 1, 3, 1, 3, 2, 4, 4, 3, 1, 4, 1, 2, 2, 3,
+        1, 4, 2, 4, 2, 9, 2, 2, 1, 1, 1, 6, 4, 3, 1, 2, 4, 5, 1, 2, 1, 8, 1, 1,
+        3, 4, 2, 2, 1, 1, 2, 2, 5, 1, 6, 2, 5, 2, 2, 4, 4, 1, 1, 3, 6, 2, 1, 3,
+        1, 1, 1, 3, 2, 3, 1, 3, 3, 6, 4, 4, 1, 2, 1, 1, 1, 5, 1, 1, 1, 12, 2,
+        1, 2, 1, 4, 1, 3, 15, 1, 1, 1, 1, 1, 1, 7, 2, 1, 5, 1, 1, 3, 2, 1, 9,
+        9, 1, 1, 2, 1, 2, 1, 8, 2, 6, 1, 3, 2, 2, 2, 1, 7, 2, 1, 1, 1, 1, 2, 2,
+        1, 3, 4, 1, 1, 2, 2, 1, 1, 2, 1, 4, 1, 1, 5, 2, 2, 20, 4, 5, 2, 3, 1,
+        1, 1, 7, 1, 3, 1, 9, 3, 1, 3, 1, 2, 8, 1, 9, 2, 1, 2, 1, 3, 3, 1, 6, 2,
+        1, 1, 1, 1, 4, 1, 2, 2, 1, 2, 2, 2, 1, 1, 4, 2, 2, 2, 5, 1, 4, 1, 2, 2,
+        2, 1, 1, 2, 3, 2, 1, 1, 3, 2, 2, 2, 3, 1, 2, 3, 2, 1, 5, 5, 2, 1, 3, 1,
+        1, 1, 2, 6, 1, 1, 5, 3, 7, 5, 1, 2, 1, 1, 3, 1, 1, 1, 3, 1, 4, 1, 1, 2,
+        5, 1, 1, 4, 2, 1, 1, 1, 1, 1, 5, 1, 1, 1, 3, 2, 1, 1, 2, 1, 35, 5, 2,
+        1, 2, 1, 6, 1, 2, 1, 16, 2, 1, 3, 9, 1, 1, 2, 2, 1, 2, 1, 3, 2, 6, 1,
+        7, 5, 5, 1, 3, 1, 4, 1, 1, 3, 4, 1, 4, 1, 1, 5, 8, 2, 2, 1, 2, 1, 7, 1,
+        2, 1, 12, 1, 4, 1, 4, 1, 1, 3, 1, 4, 5, 1, 5, 1, 1, 2, 5, 1, 1, 1, 7,
+        1, 2, 1, 3, 7, 1, 4, 16, 2, 12, 3, 3, 1, 29, 2, 1, 3, 11, 1, 1, 1, 6,
+        4, 4, 1, 1, 1, 2, 1, 13, 1, 3, 3, 3, 1, 4, 1, 1, 1, 1, 1, 10, 153, 1,
+        1, 3, 2, 3, 3, 3, 2, 1, 1, 4, 1, 3, 2, 2, 2, 1, 2, 7, 1, 1, 1, 10, 1,
+        1, 1, 2, 1, 3, 1, 7, 3, 1, 1, 11, 1, 2, 1, 3, 3, 5, 1, 3, 1, 6, 2, 2,
+        1, 5, 1, 15, 1, 1, 1, 1, 1, 10, 1, 2, 1, 1, 3, 2, 1, 6, 1, 2, 1, 14, 1,
+        3, 1, 7, 1, 5, 3, 8, 1, 6, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 3, 1, 1, 3,
+        1, 2, 5, 1, 1, 3, 3, 3, 1, 2, 3, 1, 1, 4, 4, 3, 1, 1, 1, 1, 1, 1, 3, 5,
+        1, 2, 1, 4, 1, 2, 5, 1, 5, 3, 3, 2, 1, 1, 4, 1, 4, 2, 2, 1, 2, 1, 2, 1,
+        6, 3, 3, 1, 1, 3, 3, 1, 3, 1, 2, 1, 2, 2, 1, 1, 1, 7, 4, 1, 4, 1, 6, 2,
+        11, 1, 2, 1, 4, 6, 1, 1, 7, 2, 7, 1, 3, 2, 2, 1, 1, 1, 1, 10, 2, 1, 2,
+        1, 1, 1, 3, 1, 5, 1, 1, 1, 1, 1, 3, 1, 2, 8, 2, 2, 2, 4, 2, 1, 2, 2,
+        12, 5, 2, 1, 1, 1, 3, 1, 4, 1, 1, 1, 1, 2, 7, 1, 5, 4, 2, 1, 2, 2, 8,
+        1, 1, 5, 1, 1, 10, 1, 2, 2, 4, 1, 2, 1, 1, 1, 6, 1, 1, 1, 8, 1, 6, 1,
+        2, 1, 2, 1, 4, 2, 1, 1, 5, 1, 7, 1, 6, 1, 4, 2, 3, 2, 6, 1, 5, 1, 2, 1,
+        7, 2, 3, 1, 3, 4, 8, 2, 2, 1, 1, 1, 3, 2, 1, 2, 9, 1, 2, 1, 2, 1, 1, 1,
+        2, 1, 1, 1, 1, 1, 1, 2, 6, 1, 8, 1, 2, 1, 1, 1, 2, 1, 1, 1, 2, 1, 5, 1,
+        2, 1, 2, 1, 2, 3, 5, 2, 3, 1, 1, 2, 2, 1, 8, 3, 4, 1, 9, 1, 3, 1, 7, 1,
+        12, 1, 1, 1, 2, 13, 7, 1, 1, 1, 2, 1, 4, 1, 6, 1, 13, 2, 4, 1, 1, 1,
+        10, 2, 2, 8, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 10, 1, 1, 1, 12, 2, 7,
+        1, 14, 1, 1, 12, 1, 15, 6, 1, 6, 1, 1, 1, 1, 2, 11, 1, 10, 1, 2, 1, 1,
+        1, 10, 2, 3, 8, 1, 3, 1, 1, 17, 1, 1, 2, 6, 1, 11, 1, 6, 1, 9, 1, 8, 1,
+        1, 1, 2, 1, 2, 1, 11, 2, 1, 4, 1, 7, 2, 4, 1, 1, 19, 1, 2, 1, 6, 1, 1,
+        1, 4, 1, 3, 1, 1, 1, 2, 1, 3, 1, 7, 1, 5, 1, 6, 2, 8, 2, 2, 3, 1, 3, 1,
+        6, 5, 2, 1, 2, 12, 1, 1, 2, 6, 1, 5, 1, 1, 1, 1, 1, 5, 2, 4, 1, 4, 1,
+        12, 1, 2, 3, 1, 11, 6, 1, 7, 1, 2, 1, 8, 1, 1, 2, 11, 1, 10, 1, 6, 1,
+        15, 1, 1, 7, 1, 1, 2, 1, 11, 1, 3, 2, 1, 1, 7, 1, 1, 1, 2, 1, 15, 2, 1,
+        3, 8, 1, 1, 1, 18, 2, 3, 1, 13, 1, 5, 4, 3, 1, 8, 2, 4, 1, 8, 1, 1, 1,
+        6, 2, 1, 1, 4, 1, 4, 1, 6, 1, 6, 1, 4, 3, 6, 1, 5, 2, 4, 1, 5, 3, 1, 5,
+        6, 1, 10, 1, 2, 1, 3, 2, 6, 1, 5, 1, 3, 2, 1, 2, 3, 2, 4, 1, 1, 1, 5,
+        2, 1, 1, 2, 1, 2, 1, 5, 1, 5, 1, 5, 1, 2, 2, 1, 1, 4, 8, 3, 2, 5, 1, 2,
+        1, 8, 1, 3, 2, 5, 1, 4, 4, 3, 1, 23, 1, 2, 3, 2, 1, 2, 1, 10, 2, 3, 1,
+        1, 1, 6, 7, 7, 2, 1, 1, 15, 2, 3, 4, 5, 1, 1, 1, 11, 1, 3, 1, 6, 1, 2,
+        1, 3, 1, 6, 2, 1, 5, 36, 3, 9, 1, 1, 3, 5, 1, 3, 3, 1, 1, 6, 1, 3, 1,
+        6, 2, 3, 5, 7, 1, 15, 1, 5, 1, 5, 4, 4, 2, 3, 1, 14, 1, 4, 1, 1, 2, 3,
+        1, 2, 1, 4, 1, 6, 1, 2, 1, 6, 2, 2, 1, 5, 1, 1, 1, 3, 1, 8, 1, 5, 1, 6,
+        1, 5, 1, 7, 1, 2, 3, 1, 1, 5, 3, 2, 1, 3, 1, 3, 1, 1, 3, 3, 3, 5, 1, 1,
+        1, 4, 1, 4, 1, 1, 2, 9, 3, 2, 1, 4, 2, 3, 1, 7, 2, 2, 1, 2, 1, 1, 2, 2,
+        1, 3, 4, 2, 3, 5, 1, 3, 1, 3, 6, 8, 1, 1, 1, 12, 1, 1, 5, 2, 2, 2, 1,
+        7, 1, 9, 1, 3, 2, 3, 1, 4, 1, 1, 1, 11, 3, 2, 1, 3, 1, 3, 1, 11, 1, 4,
+        2, 4, 2, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2, 5, 2, 15, 1, 1, 2, 7, 1, 4, 1,
+        1, 2, 4, 1, 2, 1, 3, 1, 2, 1, 1, 2, 1, 3, 1, 3, 1, 1, 4, 2, 5, 1, 4, 1,
+        1, 3, 1, 1, 4, 2, 1, 3, 2, 1, 2, 2, 4, 17, 5, 2, 5, 1, 8, 1, 2, 1, 3,
+        2, 5, 1, 3, 1, 3, 1, 3, 1, 3, 2, 2, 1, 1, 1, 1, 1, 6, 1, 4, 2, 1, 1, 3,
+        2, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2, 2, 2, 1, 1, 1, 2, 4, 1, 4, 2, 3, 1, 1,
+        1, 1, 1, 7, 1, 6, 1, 1, 2, 1, 1, 4, 2, 1, 1, 2, 1, 4, 1, 8, 1, 4, 2, 1,
+        1, 7, 3, 3, 1, 1, 1, 3, 1, 2, 1, 3, 3, 1, 1, 2, 1, 6, 1, 2, 4, 1, 1, 1,
+        3, 1, 1, 9, 1, 8, 1, 1, 1, 1, 1, 1, 1, 9, 1, 8, 1, 1, 1, 3, 2, 1, 1,
+        12, 1, 3, 1, 5, 1, 5, 1, 2, 1, 18, 1, 1, 1, 7, 1, 3, 1, 4, 1, 1, 1, 3,
+        1, 6, 1, 3, 2, 7, 2, 13, 1, 2, 1, 2, 2, 1, 1, 4, 1, 4, 1, 2, 3, 1, 2,
+        5, 1, 4, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 3, 5, 1, 3, 1, 1, 1, 2, 151, 1,
+        1, 1, 1, 5, 1, 3, 1, 12, 3, 4, 2, 1, 1, 2, 1, 1, 1, 2, 1, 3, 1, 6, 1,
+        5, 1, 7, 1, 1, 2, 3, 1, 3, 2, 2, 1, 2, 1, 7, 1, 4, 1, 3, 1, 6, 1, 6, 2,
+        2, 1, 20, 1, 2, 1, 1, 1, 1, 2, 1, 1, 3, 1, 1, 1, 1, 1, 2, 1, 13, 1, 1,
+        1, 3, 1, 2, 1, 3, 2, 7, 1, 1, 1, 1, 1, 7, 2, 1, 1, 2, 2, 5, 1, 1, 1, 1,
+        72, 1, 1, 4, 1, 6, 1, 3, 1, 4, 1, 1, 1, 1, 2, 2, 2, 2, 3, 2, 1, 11, 2,
+        1, 1, 2, 2, 3, 1, 1, 1, 1, 1, 2, 1, 6, 2, 6, 1, 2, 1, 1, 1, 2, 1, 2, 2,
+        4, 2, 7, 1, 1, 1, 9, 1, 6, 1, 7, 1, 7, 5, 1, 1, 5, 1, 6, 1, 2, 2, 1, 1,
+        25, 1, 1, 1, 1, 2, 1, 1, 2, 1, 4, 1, 2, 2, 7, 1, 2, 1, 8, 1, 1, 2, 5,
+        1, 15, 1, 2, 1, 2, 1, 1, 2, 3, 1, 1, 1, 1, 1, 3, 4, 2, 1, 11, 1, 9, 1,
+        1, 2, 5, 1, 4, 1, 5, 5, 1, 7, 1, 2, 1, 2, 1, 1, 1, 6, 5, 1, 1, 1, 4, 2,
+        2, 2, 7, 3, 5, 1, 2, 1, 2, 1, 1, 2, 9, 1, 6, 1, 7, 1, 2, 1, 9, 1, 7, 2,
+        4, 2, 2, 1, 1, 1, 2, 2, 8, 1, 1, 2, 3, 1, 8, 1, 1, 1, 15, 1, 8, 54, 2,
+        2, 1, 3, 1, 2, 1, 1, 1, 4, 6, 1, 2, 2, 1, 6, 1, 2, 1, 1, 3, 2, 1, 1, 1,
+        1, 2, 2, 7, 8, 7, 1, 1, 1, 2, 1, 2, 1, 1, 3, 5, 1, 13, 4, 3, 1, 3, 2,
+        4, 1, 12, 8, 3, 1, 2, 1, 3, 1, 1, 3, 4, 1, 2, 1, 1, 2, 1, 1, 3, 1, 9,
+        2, 2, 1, 4, 1, 1, 1, 2, 3, 3, 1, 1, 1, 4, 1, 23, 1, 2, 1, 1, 1, 3, 2,
+        2, 1, 3, 1, 1, 2, 6, 1, 3, 2, 1, 4, 8, 1, 1, 4, 3, 1, 1, 1, 1, 1, 1, 1,
+        2, 1, 2, 2, 1, 5, 10, 1, 7, 2, 6, 1, 7, 3, 17, 1, 1, 1, 6, 1, 1, 1, 15,
+        1, 17, 1, 4, 2, 4, 1, 14, 1, 2, 1, 4, 1, 1, 4, 7, 2, 3, 1, 1, 1, 2, 2,
+        4, 1, 4, 5, 8, 1, 3, 1, 1, 1, 5, 5, 11, 1, 1, 1, 2, 1, 12, 1, 1, 1, 2,
+        1, 3, 1, 4, 1, 3, 1, 1, 1, 7, 1, 8, 1, 2, 4, 3, 1, 9, 2, 1, 1, 3, 1, 3,
+        3, 1, 1, 9, 1, 2, 1, 2, 1, 4, 1, 4, 1, 2, 1, 1, 1, 1, 4, 5, 5, 2, 1, 5,
+        1, 5, 1, 5, 4, 2, 1, 13, 1, 2, 2, 2, 2, 1, 1, 2, 1, 5, 4, 2, 1, 2, 1,
+        1, 3, 1, 1, 9, 1, 2, 1, 4, 1, 5, 2, 1, 1, 11, 2, 13, 5, 6, 1, 1, 1, 2,
+        3, 20, 1, 1, 1, 3, 1, 1, 1, 5, 2, 1, 1, 5, 3, 4, 5, 6, 1, 5, 1, 1, 1,
+        1, 1, 2, 1, 6, 1, 5, 1, 4, 1, 15, 1, 3, 3, 4, 1, 2, 2, 1, 3, 2, 2, 1,
+        1, 2, 1, 10, 1, 9, 1, 1, 1, 6, 1, 1, 2, 1, 1, 2, 2, 2, 3, 3, 1, 4, 1,
+        1, 1, 1, 1, 2, 1, 1, 2, 3, 1, 4, 1, 2, 1, 8, 1, 3, 1, 10, 1, 1, 1, 8,
+        1, 1, 8, 1, 1, 3, 2, 2, 1, 1, 1, 15, 1, 4, 1, 4, 1, 3, 3, 1, 1, 1, 1,
+        2, 3, 12, 2, 1, 2, 2, 1, 14, 1, 2, 1, 1, 4, 1, 7, 5, 1, 1, 1, 4, 1, 9,
+        1, 2, 1, 11, 2, 4, 2, 1, 1, 1, 5, 2, 1, 1, 1, 3, 3, 4, 1, 12, 2, 9,
+        243, 1, 2, 4, 2, 1, 1, 2, 2, 1, 1, 2, 1, 10, 3, 1, 2, 2, 1, 2, 1, 1, 1,
+        3, 2, 2, 1, 4, 1, 2, 3, 3, 1, 8, 2, 1, 1, 9, 2, 7, 3, 3, 1, 8, 54, 1,
+        1, 1, 1, 5, 3, 1, 1, 1, 1, 7, 6, 5, 1, 2, 1, 3, 5, 8, 1, 2, 3, 1, 2, 5,
+        1, 4, 5, 4, 1, 10, 3, 3, 1, 1, 2, 9, 1, 2, 2, 5, 1, 3, 1, 2, 1, 1, 2,
+        2, 1, 2, 1, 4, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 2, 2, 16, 3, 14,
+        1, 3, 1, 1, 2, 3, 4, 4, 2, 7, 1, 1, 1, 2, 1, 1, 1, 6, 1, 1, 1, 7, 2, 1,
+        1, 2, 2, 5, 1, 11, 1, 3, 1, 1, 2, 1, 2, 3, 2, 3, 2, 3, 1, 4, 1, 1, 6,
+        1, 3, 1, 1, 1, 1, 3, 1, 1, 1, 3, 3, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1,
+        3, 1, 12, 1, 2, 1, 2, 1, 3, 4, 1, 2, 4, 1, 3, 1, 7, 1, 1, 1, 5, 4, 1,
+        2, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 5, 1, 1, 1, 6, 2, 7, 2, 4, 1, 1,
+        1, 1, 1, 1, 7, 1, 2, 2, 1, 1, 2, 1, 1, 4, 1, 12, 1, 1, 1, 9, 1, 3, 2,
+        4, 1, 2, 2, 1, 1, 4, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 3, 1, 1, 5, 1, 1,
+        4, 1, 3, 1, 8, 3, 3, 1, 6, 1, 4, 1, 1, 1, 4, 2, 6, 51, 2, 2, 4, 1, 3,
+        2, 1, 1, 1, 1, 9, 1, 1, 1, 1, 2, 1, 1, 2, 14, 1, 3, 1, 2, 2, 1, 1, 1,
+        1, 1, 3, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 3, 1, 1, 1, 2, 1, 1, 1,
+        4, 1, 1, 3, 9, 1, 2, 2, 2, 1, 1, 2, 2, 1, 13, 1, 1, 4, 1, 1, 4, 1, 1,
+        1, 1, 1, 1, 1, 3, 1, 2, 1, 1, 1, 10, 1, 2, 1, 2, 1, 1, 52, 4, 2, 3, 2,
+        1, 1, 6, 2, 11, 3, 3, 1, 1, 3, 3, 3, 1, 1, 1, 1, 15, 1, 3, 1, 1, 2, 4,
+        1, 1, 1, 2, 1, 3, 1, 2, 2, 1, 1, 10, 1, 7, 1, 3, 1, 3, 1, 1, 2, 3, 2,
+        6, 1, 1, 1, 4, 1, 1, 1, 6, 1, 3, 1, 7, 2, 10, 1, 3, 1, 5, 1, 6, 1, 3,
+        2, 3, 1, 1, 1, 8, 60, 1, 2, 1, 1, 1, 1, 3, 1, 2, 2, 3, 1, 2, 1, 5, 3,
+        2, 2, 1, 2, 1, 1, 8, 1, 1, 3, 1, 2, 1, 1, 1, 1, 1, 2, 2, 3, 5, 1, 3, 2,
+        2, 1, 6, 2, 1, 1, 4, 1, 1, 1, 5, 1, 3, 2, 6, 3, 3, 1, 4, 1, 3, 1, 1, 2,
+        2, 1, 3, 1, 1, 1, 1, 2, 3, 1, 2, 1, 6, 1, 1, 1, 6, 1, 2, 1, 3, 1, 4, 3,
+        3, 2, 1, 1, 3, 3, 1, 2, 3, 2, 4, 2, 5, 1, 1, 1, 2, 1, 4, 7, 4, 1, 1, 4,
+        2, 2, 1, 1, 3, 1, 3, 1, 1, 1, 2, 1, 3, 5, 2, 1, 2, 3, 1, 1, 3, 1, 2, 1,
+        5, 8, 5, 1, 4, 1, 1, 1, 3, 1, 5, 1, 3, 3, 1, 6, 2, 4, 1, 7, 5, 1, 1, 1,
+        2, 3, 3, 2, 1, 4, 2, 3, 1, 1, 3, 2, 2, 1, 3, 3, 4, 1, 2, 1, 1, 1, 7, 2,
+        1, 1, 1, 1, 7, 1, 1, 1, 1, 1, 6, 4, 3, 1, 2, 2, 3, 4, 2, 2, 1, 1, 3, 1,
+        4, 106, 3, 1, 2, 2, 1, 3, 7, 1, 5, 1, 2, 2, 7, 6, 1, 1, 1, 1, 2, 1, 3,
+        1, 1, 1, 4, 1, 2, 1, 2, 1, 2, 3, 5, 1, 2, 1, 3, 2, 1, 1, 7, 1, 1, 4, 3,
+        2, 1, 1, 4, 1, 8, 1, 3, 5, 6, 2, 7, 1, 3, 1, 1, 1, 1, 1, 4, 1, 9, 3, 1,
+        1, 1, 1, 1, 1, 15, 1, 5, 1, 2, 1, 1, 1, 12, 1, 2, 1, 3, 1, 1, 1, 2, 1,
+        10, 1, 11, 1, 6, 1, 2, 1, 6, 1, 10, 1, 11, 1, 1, 1, 1, 1, 1, 1, 7, 1,
+        1, 1, 3, 1, 2, 86, 1, 3, 2, 1, 2, 1, 2, 1, 2, 2, 9, 2, 4, 2, 1, 1, 5,
+        1, 3, 2, 2, 1, 1, 1, 1, 3, 2, 1, 1, 3, 4, 3, 2, 1, 1, 1, 1, 1, 2, 4, 1,
+        3, 6, 1, 4, 1, 1, 1, 7, 3, 5, 2, 1, 1, 4, 1, 6, 1, 5, 1, 3, 4, 2, 1, 2,
+        3, 3, 1, 2, 1, 2, 1, 5, 1, 1, 1, 1, 1, 4, 2, 17, 2, 1, 1, 2, 1, 4, 2,
+        10, 2, 1, 1, 6, 1, 7, 1, 5, 2, 3, 1, 5, 1, 8, 2, 1, 14, 1, 2, 3, 1, 2,
+        2, 1, 3, 1, 3, 1, 1, 1, 1, 1, 11, 2, 23130, 2, 1058, 2, 1, 18, 4, 10,
+        1, 4, 1, 14, 1, 4, 149, 61, 1, 1, 1, 30, 129, 6, 7, 1, 65692, 1, 65, 1,
+        75, 1, 168, 1, 66, 1, 153, 1, 1, 1, 68, 1, 97, 1, 54, 1, 1, 1, 52, 1,
+        19, 1, 85, 1, 103, 1, 191, 1, 70, 1, 22, 1, 13, 1, 15, 1, 27, 1, 118,
+        1, 716, 1, 48, 1, 570, 1, 82, 1, 28, 1, 58, 1, 60, 1, 91, 1, 94, 1, 26,
+        2, 37, 1, 256, 1, 103, 1, 470, 1, 391, 1, 18, 1, 181, 1, 52, 1, 59, 1,
+        23, 1, 135, 1, 61, 1, 66, 1, 254, 1, 124, 1, 42, 1, 83, 1, 37, 1, 8, 1,
+        19, 1, 17, 2, 36, 1, 24, 1, 73, 2, 64, 1, 41, 1, 30, 2, 43, 2, 77, 1,
+        38, 1, 56, 1, 57, 1, 70, 1, 42, 1, 4, 1, 82, 1, 88, 1, 22, 1, 248, 1,
+        352, 1, 339, 1, 34, 1, 26, 1, 5, 1, 102, 1, 197, 1, 222, 1, 178, 1, 45,
+        1, 72, 1, 604, 1, 160, 1, 25, 1, 5, 1, 91, 1, 37, 1, 28, 1, 35, 1, 199,
+        1, 75, 1, 47, 1, 283, 1, 24, 1, 145, 1, 77, 1, 19, 1, 53, 1, 136, 1,
+        1058, 1, 105, 1, 40, 1, 525, 1, 6, 1, 50, 1, 293, 2, 34, 1, 46, 3, 55,
+        1, 1, 1, 86, 1, 33, 1, 263, 1, 49, 1, 25, 1, 110, 1, 349, 1, 50, 1, 59,
+        1, 28, 1, 169, 1, 41, 1, 148, 1, 792, 1, 126, 1, 318, 1, 46, 2, 242, 2,
+        113, 2, 203, 1, 131, 1, 1, 1, 49, 1, 2, 1, 13, 1, 37, 2, 3, 1, 72, 2,
+        2, 1, 71, 1, 6, 1, 4, 1, 173, 2, 3, 1, 16, 3, 7, 1, 68, 2, 39, 1, 20,
+        1, 148, 2, 72, 1, 161, 1, 1, 1, 54, 1, 152, 1, 36, 1, 97, 1, 870, 1,
+        205, 1, 14, 2, 10, 1, 38, 1, 12, 1, 1, 1, 49, 1, 10, 1, 2, 1, 10, 1, 1,
+        1, 20, 1, 4, 1, 13, 1, 39, 1, 27, 1, 22, 1, 14, 4, 1, 3, 80, 1, 18, 1,
+        25, 1, 10, 1, 323, 1, 285, 1, 622, 1, 282, 1, 223, 1, 104, 1, 57, 1,
+        47, 1, 194, 1, 716, 1, 36, 1, 279, 1, 84, 1, 228, 1, 372, 1, 1718, 1,
+        345, 1, 535, 1, 1170, 1, 133, 1, 2, 1, 284, 1, 228, 1, 20, 1, 40, 1, 1,
+        1, 95, 1, 202, 1, 2, 1, 163, 1, 3, 2, 117, 2, 4, 1, 68, 1, 89, 1, 40,
+        1, 3, 1, 95, 1, 161, 1, 42, 1, 1, 1, 342, 1, 45, 1, 1248, 1, 4, 1,
+        1025, 1, 68, 1, 48, 1, 180, 1, 2376, 1, 369, 1, 182, 1, 344, 1, 38, 1,
+        312, 1, 3, 1, 65, 1, 17, 1, 39, 1, 68, 1, 12, 1, 19, 1, 80, 1, 66, 2,
+        65, 1, 9, 1, 58, 1, 40, 1, 13, 1, 74, 1, 26, 1, 680, 1, 5, 1, 38, 1,
+        531, 1, 31, 1, 98, 1, 43, 1, 1984, 1, 2034, 1, 22339, 1, 17, 1,
     ]
 }
@@ -2,6 +2,8 @@
 //
 // Any copyright is dedicated to the Public Domain.
 // https://creativecommons.org/publicdomain/zero/1.0/
+//
+// AUTOGENERATED BY gen_index.py; edit the documentation there instead.
 
 //! Traditional Chinese index tables for
 //! [rust-encoding](https://github.com/lifthrasiir/rust-encoding).
@@ -18,5 +20,5 @@ extern crate encoding_index_tests;
 ///
 /// > This matches the Big5 standard
 /// > in combination with the Hong Kong Supplementary Character Set and other common extensions.
+#[cfg(feature = "index-big5")]
 pub mod big5;
-
@@ -5,275 +5,24 @@
 //! An interface for retrieving an encoding (or a set of encodings) from a string/numeric label.
 
 use all;
+use label_table;
 use types::EncodingRef;
 
 /// Returns an encoding from given label, defined in the WHATWG Encoding standard, if any.
 /// Implements "get an encoding" algorithm: http://encoding.spec.whatwg.org/#concept-encoding-get
 pub fn encoding_from_whatwg_label(label: &str) -> Option<EncodingRef> {
-    let label = label.trim_matches(&[' ', '\n', '\r', '\t', '\x0C'][..]);
-    let label: String =
-        label.chars().map(|c| match c { 'A'...'Z' => (c as u8 + 32) as char, _ => c }).collect();
-    match &label[..] {
-        "unicode-1-1-utf-8" |
-        "utf-8" |
-        "utf8" =>
-            Some(all::UTF_8 as EncodingRef),
-        "866" |
-        "cp866" |
-        "csibm866" |
-        "ibm866" =>
-            Some(all::IBM866 as EncodingRef),
-        "csisolatin2" |
-        "iso-8859-2" |
-        "iso-ir-101" |
-        "iso8859-2" |
-        "iso88592" |
-        "iso_8859-2" |
-        "iso_8859-2:1987" |
-        "l2" |
-        "latin2" =>
-            Some(all::ISO_8859_2 as EncodingRef),
-        "csisolatin3" |
-        "iso-8859-3" |
-        "iso-ir-109" |
-        "iso8859-3" |
-        "iso88593" |
-        "iso_8859-3" |
-        "iso_8859-3:1988" |
-        "l3" |
-        "latin3" =>
-            Some(all::ISO_8859_3 as EncodingRef),
-        "csisolatin4" |
-        "iso-8859-4" |
-        "iso-ir-110" |
-        "iso8859-4" |
-        "iso88594" |
-        "iso_8859-4" |
-        "iso_8859-4:1988" |
-        "l4" |
-        "latin4" =>
-            Some(all::ISO_8859_4 as EncodingRef),
-        "csisolatincyrillic" |
-        "cyrillic" |
-        "iso-8859-5" |
-        "iso-ir-144" |
-        "iso8859-5" |
-        "iso88595" |
-        "iso_8859-5" |
-        "iso_8859-5:1988" =>
-            Some(all::ISO_8859_5 as EncodingRef),
-        "arabic" |
-        "asmo-708" |
-        "csiso88596e" |
-        "csiso88596i" |
-        "csisolatinarabic" |
-        "ecma-114" |
-        "iso-8859-6" |
-        "iso-8859-6-e" |
-        "iso-8859-6-i" |
-        "iso-ir-127" |
-        "iso8859-6" |
-        "iso88596" |
-        "iso_8859-6" |
-        "iso_8859-6:1987" =>
-            Some(all::ISO_8859_6 as EncodingRef),
-        "csisolatingreek" |
-        "ecma-118" |
-        "elot_928" |
-        "greek" |
-        "greek8" |
-        "iso-8859-7" |
-        "iso-ir-126" |
-        "iso8859-7" |
-        "iso88597" |
-        "iso_8859-7" |
-        "iso_8859-7:1987" |
-        "sun_eu_greek" =>
-            Some(all::ISO_8859_7 as EncodingRef),
-        "csiso88598e" |
-        "csisolatinhebrew" |
-        "hebrew" |
-        "iso-8859-8" |
-        "iso-8859-8-e" |
-        "iso-ir-138" |
-        "iso8859-8" |
-        "iso88598" |
-        "iso_8859-8" |
-        "iso_8859-8:1988" |
-        "visual" =>
-            Some(all::ISO_8859_8 as EncodingRef),
-        "csiso88598i" |
-        "iso-8859-8-i" |
-        "logical" =>
-            Some(all::whatwg::ISO_8859_8_I as EncodingRef),
-        "csisolatin6" |
-        "iso-8859-10" |
-        "iso-ir-157" |
-        "iso8859-10" |
-        "iso885910" |
-        "l6" |
-        "latin6" =>
-            Some(all::ISO_8859_10 as EncodingRef),
-        "iso-8859-13" |
-        "iso8859-13" |
-        "iso885913" =>
-            Some(all::ISO_8859_13 as EncodingRef),
-        "iso-8859-14" |
-        "iso8859-14" |
-        "iso885914" =>
-            Some(all::ISO_8859_14 as EncodingRef),
-        "csisolatin9" |
-        "iso-8859-15" |
-        "iso8859-15" |
-        "iso885915" |
-        "iso_8859-15" |
-        "l9" =>
-            Some(all::ISO_8859_15 as EncodingRef),
-        "iso-8859-16" =>
-            Some(all::ISO_8859_16 as EncodingRef),
-        "cskoi8r" |
-        "koi" |
-        "koi8" |
-        "koi8-r" |
-        "koi8_r" =>
-            Some(all::KOI8_R as EncodingRef),
-        "koi8-ru" |
-        "koi8-u" =>
-            Some(all::KOI8_U as EncodingRef),
-        "csmacintosh" |
-        "mac" |
-        "macintosh" |
-        "x-mac-roman" =>
-            Some(all::MAC_ROMAN as EncodingRef),
-        "dos-874" |
-        "iso-8859-11" |
-        "iso8859-11" |
-        "iso885911" |
-        "tis-620" |
-        "windows-874" =>
-            Some(all::WINDOWS_874 as EncodingRef),
-        "cp1250" |
-        "windows-1250" |
-        "x-cp1250" =>
-            Some(all::WINDOWS_1250 as EncodingRef),
-        "cp1251" |
-        "windows-1251" |
-        "x-cp1251" =>
-            Some(all::WINDOWS_1251 as EncodingRef),
-        "ansi_x3.4-1968" |
-        "ascii" |
-        "cp1252" |
-        "cp819" |
-        "csisolatin1" |
-        "ibm819" |
-        "iso-8859-1" |
-        "iso-ir-100" |
-        "iso8859-1" |
-        "iso88591" |
-        "iso_8859-1" |
-        "iso_8859-1:1987" |
-        "l1" |
-        "latin1" |
-        "us-ascii" |
-        "windows-1252" |
-        "x-cp1252" =>
-            Some(all::WINDOWS_1252 as EncodingRef),
-        "cp1253" |
-        "windows-1253" |
-        "x-cp1253" =>
-            Some(all::WINDOWS_1253 as EncodingRef),
-        "cp1254" |
-        "csisolatin5" |
-        "iso-8859-9" |
-        "iso-ir-148" |
-        "iso8859-9" |
-        "iso88599" |
-        "iso_8859-9" |
-        "iso_8859-9:1989" |
-        "l5" |
-        "latin5" |
-        "windows-1254" |
-        "x-cp1254" =>
-            Some(all::WINDOWS_1254 as EncodingRef),
-        "cp1255" |
-        "windows-1255" |
-        "x-cp1255" =>
-            Some(all::WINDOWS_1255 as EncodingRef),
-        "cp1256" |
-        "windows-1256" |
-        "x-cp1256" =>
-            Some(all::WINDOWS_1256 as EncodingRef),
-        "cp1257" |
-        "windows-1257" |
-        "x-cp1257" =>
-            Some(all::WINDOWS_1257 as EncodingRef),
-        "cp1258" |
-        "windows-1258" |
-        "x-cp1258" =>
-            Some(all::WINDOWS_1258 as EncodingRef),
-        "x-mac-cyrillic" |
-        "x-mac-ukrainian" =>
-            Some(all::MAC_CYRILLIC as EncodingRef),
-        "chinese" |
-        "csgb2312" |
-        "csiso58gb231280" |
-        "gb2312" |
-        "gb_2312" |
-        "gb_2312-80" |
-        "gbk" |
-        "iso-ir-58" |
-        "x-gbk" =>
-            Some(all::GBK as EncodingRef),
-        "gb18030" =>
-            Some(all::GB18030 as EncodingRef),
-        "big5" |
-        "big5-hkscs" |
-        "cn-big5" |
-        "csbig5" |
-        "x-x-big5" =>
-            Some(all::BIG5_2003 as EncodingRef),
-        "cseucpkdfmtjapanese" |
-        "euc-jp" |
-        "x-euc-jp" =>
-            Some(all::EUC_JP as EncodingRef),
-        "csiso2022jp" |
-        "iso-2022-jp" =>
-            Some(all::ISO_2022_JP as EncodingRef),
-        "csshiftjis" |
-        "ms932" |
-        "ms_kanji" |
-        "shift-jis" |
-        "shift_jis" |
-        "sjis" |
-        "windows-31j" |
-        "x-sjis" =>
-            Some(all::WINDOWS_31J as EncodingRef),
-        "cseuckr" |
-        "csksc56011987" |
-        "euc-kr" |
-        "iso-ir-149" |
-        "korean" |
-        "ks_c_5601-1987" |
-        "ks_c_5601-1989" |
-        "ksc5601" |
-        "ksc_5601" |
-        "windows-949" =>
-            Some(all::WINDOWS_949 as EncodingRef),
-        "csiso2022kr" |
-        "hz-gb-2312" |
-        "iso-2022-kr" |
-        "iso-2022-cn" |
-        "iso-2022-cn-ext" =>
-            Some(all::whatwg::REPLACEMENT as EncodingRef),
-        "utf-16be" =>
-            Some(all::UTF_16BE as EncodingRef),
-        "utf-16" |
-        "utf-16le" =>
-            Some(all::UTF_16LE as EncodingRef),
-        "x-user-defined" =>
-            Some(all::whatwg::X_USER_DEFINED as EncodingRef),
-        _ => None
+    encoding_from_whatwg_label_bytes(label.as_bytes())
+}
+
+/// Same to `encoding_from_whatwg_label` but receives a byte sequence,
+/// e.g. a label directly taken from the HTTP header. Non-ASCII bytes never match.
+pub fn encoding_from_whatwg_label_bytes(label: &[u8]) -> Option<EncodingRef> {
+    fn is_whitespace(b: &u8) -> bool {
+        match *b { b' ' | b'\n' | b'\r' | b'\t' | b'\x0C' => true, _ => false }
     }
+    let start = label.iter().position(|b| !is_whitespace(b)).unwrap_or(label.len());
+    let end = label.iter().rposition(|b| !is_whitespace(b)).map_or(start, |i| i + 1);
+    label_table::lookup(&label[start..end])
 }
 
 /// Returns an encoding from Windows code page number.
@@ -282,38 +31,70 @@ pub fn encoding_from_whatwg_label(label: &str) -> Option<EncodingRef> {
 pub fn encoding_from_windows_code_page(cp: usize) -> Option<EncodingRef> {
     match cp {
         65001 => Some(all::UTF_8 as EncodingRef),
+        #[cfg(feature = "index-ibm866")]
         866 => Some(all::IBM866 as EncodingRef),
         28591 => Some(all::ISO_8859_1 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-2")]
         28592 => Some(all::ISO_8859_2 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-3")]
         28593 => Some(all::ISO_8859_3 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-4")]
         28594 => Some(all::ISO_8859_4 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-5")]
         28595 => Some(all::ISO_8859_5 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-6")]
         28596 => Some(all::ISO_8859_6 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-7")]
         28597 => Some(all::ISO_8859_7 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-8")]
         28598 => Some(all::ISO_8859_8 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-8")]
         38598 => Some(all::whatwg::ISO_8859_8_I as EncodingRef),
+        #[cfg(feature = "index-iso-8859-13")]
         28603 => Some(all::ISO_8859_13 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-15")]
         28605 => Some(all::ISO_8859_15 as EncodingRef),
+        #[cfg(feature = "index-koi8-r")]
         20866 => Some(all::KOI8_R as EncodingRef),
+        #[cfg(feature = "index-koi8-u")]
         21866 => Some(all::KOI8_U as EncodingRef),
+        #[cfg(feature = "index-macintosh")]
         10000 => Some(all::MAC_ROMAN as EncodingRef),
+        #[cfg(feature = "index-windows-874")]
         874 => Some(all::WINDOWS_874 as EncodingRef),
+        #[cfg(feature = "index-windows-1250")]
         1250 => Some(all::WINDOWS_1250 as EncodingRef),
+        #[cfg(feature = "index-windows-1251")]
         1251 => Some(all::WINDOWS_1251 as EncodingRef),
+        #[cfg(feature = "index-windows-1252")]
         1252 => Some(all::WINDOWS_1252 as EncodingRef),
+        #[cfg(feature = "index-windows-1253")]
         1253 => Some(all::WINDOWS_1253 as EncodingRef),
+        #[cfg(feature = "index-windows-1254")]
         1254 => Some(all::WINDOWS_1254 as EncodingRef),
+        #[cfg(feature = "index-windows-1255")]
         1255 => Some(all::WINDOWS_1255 as EncodingRef),
+        #[cfg(feature = "index-windows-1256")]
         1256 => Some(all::WINDOWS_1256 as EncodingRef),
+        #[cfg(feature = "index-windows-1257")]
         1257 => Some(all::WINDOWS_1257 as EncodingRef),
+        #[cfg(feature = "index-windows-1258")]
         1258 => Some(all::WINDOWS_1258 as EncodingRef),
+        #[cfg(feature = "index-x-mac-cyrillic")]
         1259 => Some(all::MAC_CYRILLIC as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
         936 | 54936 => Some(all::GB18030 as EncodingRef), // XXX technically wrong
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
         52936 => Some(all::HZ as EncodingRef),
+        #[cfg(feature = "index-big5")]
         950 => Some(all::BIG5_2003 as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         20932 => Some(all::EUC_JP as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         50220 => Some(all::ISO_2022_JP as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
         932 => Some(all::WINDOWS_31J as EncodingRef),
+        #[cfg(feature = "index-euc-kr")]
         949 => Some(all::WINDOWS_949 as EncodingRef),
         1201 => Some(all::UTF_16BE as EncodingRef),
         1200 => Some(all::UTF_16LE as EncodingRef),
@@ -325,7 +106,7 @@ pub fn encoding_from_windows_code_page(cp: usize) -> Option<EncodingRef> {
 mod tests {
     extern crate test;
     use all;
-    use super::encoding_from_whatwg_label;
+    use super::{encoding_from_whatwg_label, encoding_from_whatwg_label_bytes};
 
     #[test]
     fn test_encoding_from_whatwg_label() {
@@ -334,10 +115,19 @@ mod tests {
         assert!(encoding_from_whatwg_label("\t\n\x0C\r utf-8\t\n\x0C\r ").is_some());
         assert!(encoding_from_whatwg_label("\u{A0}utf-8").is_none(),
                 "Non-ASCII whitespace should not be trimmed");
-        assert!(encoding_from_whatwg_label("greek").is_some());
+        if cfg!(feature = "index-iso-8859-7") {
+            assert!(encoding_from_whatwg_label("greek").is_some());
+        }
         assert!(encoding_from_whatwg_label("gree\u{212A}").is_none(),
                 "Case-insensitive matching should be ASCII only. Kelvin sign does not match k.");
 
+        assert!(encoding_from_whatwg_label("").is_none());
+        assert!(encoding_from_whatwg_label(" \t ").is_none());
+        assert!(encoding_from_whatwg_label("utf-8x").is_none());
+        if cfg!(feature = "index-windows-1252") {
+            assert!(encoding_from_whatwg_label("ISO_8859-1:1987").is_some());
+        }
+
         // checks if the `whatwg_name` method returns the label that resolves back to that encoding
         for encoding in all::encodings() {
             if let Some(whatwg_name) = encoding.whatwg_name() {
@@ -348,6 +138,16 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_encoding_from_whatwg_label_bytes() {
+        if cfg!(all(feature = "index-jis0208", feature = "index-jis0212")) {
+            assert_eq!(encoding_from_whatwg_label_bytes(b" Shift_JIS\r\n").map(|e| e.name()),
+                       Some("windows-31j"));
+        }
+        assert!(encoding_from_whatwg_label_bytes(b"\xa0utf-8").is_none());
+        assert!(encoding_from_whatwg_label_bytes(b"utf-8\xff").is_none());
+    }
+
     #[bench]
     fn bench_encoding_from_whatwg_label(bencher: &mut test::Bencher) {
         bencher.iter(|| test::black_box({
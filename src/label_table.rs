@@ -0,0 +1,203 @@
+// AUTOGENERATED FROM encodings.json OF THE ENCODING STANDARD BY gen_index.py.
+// https://encoding.spec.whatwg.org/
+
+//! A perfect hash table for WHATWG encoding labels.
+
+use all;
+use types::EncodingRef;
+
+const LABELS: &'static [(&'static str, u8)] = &[
+    ("koi8-ru", 17), ("", 0), ("iso_8859-1", 22), ("", 0), ("windows-874", 19),
+    ("chinese", 30), ("iso_8859-6:1987", 7), ("iso-8859-2", 3),
+    ("x-mac-roman", 18), ("euc-kr", 36), ("iso8859-14", 13), ("koi8-u", 17),
+    ("gb18030", 31), ("dos-874", 19), ("iso_8859-5", 6), ("l3", 4),
+    ("iso-8859-5", 6), ("koi8-r", 16), ("arabic", 7), ("iso8859-7", 8),
+    ("", 0), ("iso-ir-148", 24), ("", 0), ("x-x-big5", 32),
+    ("iso-8859-10", 11), ("iso-ir-127", 7), ("csibm866", 2), ("ms932", 35),
+    ("windows-1258", 28), ("", 0), ("latin4", 5), ("ansi_x3.4-1968", 22),
+    ("iso-ir-101", 3), ("iso8859-6", 7), ("koi8", 16), ("iso88598", 9),
+    ("iso8859-8", 9), ("latin1", 22), ("koi8_r", 16), ("", 0), ("", 0),
+    ("iso_8859-2:1987", 3), ("csisolatinarabic", 7), ("iso88599", 24),
+    ("iso_8859-8:1988", 9), ("iso_8859-1:1987", 22), ("iso_8859-3", 4),
+    ("iso-ir-126", 8), ("korean", 36), ("x-cp1252", 22), ("windows-1252", 22),
+    ("iso_8859-9", 24), ("x-mac-cyrillic", 29), ("iso8859-4", 5), ("", 0),
+    ("cn-big5", 32), ("x-sjis", 35), ("csiso58gb231280", 30), ("", 0),
+    ("windows-1253", 23), ("utf-8", 1), ("iso88596", 7), ("cyrillic", 6),
+    ("iso8859-9", 24), ("", 0), ("gbk", 30), ("csiso88598e", 9),
+    ("iso-8859-16", 15), ("csiso2022kr", 37), ("csisolatin6", 11),
+    ("iso-8859-14", 13), ("us-ascii", 22), ("", 0), ("x-mac-ukrainian", 29),
+    ("iso8859-11", 19), ("iso8859-3", 4), ("x-cp1258", 28),
+    ("iso-8859-6-e", 7), ("x-cp1250", 20), ("latin2", 3), ("cseuckr", 36),
+    ("ibm866", 2), ("iso_8859-2", 3), ("", 0), ("iso_8859-5:1988", 6),
+    ("iso_8859-7:1987", 8), ("ibm819", 22), ("big5", 32), ("asmo-708", 7),
+    ("", 0), ("", 0), ("iso_8859-15", 14), ("windows-949", 36), ("", 0),
+    ("iso-2022-cn-ext", 37), ("csisolatin3", 4), ("iso-ir-58", 30),
+    ("sjis", 35), ("iso-ir-149", 36), ("windows-1255", 25), ("l9", 14),
+    ("l1", 22), ("iso-8859-13", 12), ("", 0), ("latin6", 11),
+    ("csisolatinhebrew", 9), ("logical", 10), ("utf-16le", 39), ("mac", 18),
+    ("gb_2312-80", 30), ("iso885913", 12), ("866", 2), ("shift-jis", 35),
+    ("x-cp1254", 24), ("", 0), ("elot_928", 8), ("hz-gb-2312", 37),
+    ("x-gbk", 30), ("iso_8859-8", 9), ("iso8859-5", 6), ("utf8", 1),
+    ("csiso88596i", 7), ("iso_8859-4", 5), ("windows-1256", 26),
+    ("iso-8859-1", 22), ("iso88593", 4), ("x-cp1255", 25), ("csisolatin5", 24),
+    ("csgb2312", 30), ("csiso88596e", 7), ("utf-16", 39),
+    ("iso_8859-9:1989", 24), ("", 0), ("", 0), ("", 0), ("iso_8859-4:1988", 5),
+    ("iso8859-10", 11), ("gb2312", 30), ("iso885914", 13), ("", 0),
+    ("tis-620", 19), ("iso-8859-11", 19), ("iso-ir-109", 4), ("", 0),
+    ("iso885910", 11), ("cp1253", 23), ("iso_8859-7", 8), ("cp1251", 21),
+    ("sun_eu_greek", 8), ("utf-16be", 38), ("", 0), ("l6", 11), ("cp1257", 27),
+    ("ms_kanji", 35), ("x-cp1251", 21), ("big5-hkscs", 32), ("x-cp1253", 23),
+    ("csiso2022jp", 34), ("cp819", 22), ("", 0), ("x-cp1256", 26),
+    ("ksc_5601", 36), ("ecma-118", 8), ("l2", 3), ("csisolatin4", 5),
+    ("macintosh", 18), ("greek8", 8), ("x-user-defined", 40),
+    ("iso-ir-100", 22), ("cp1258", 28), ("cp1250", 20), ("", 0), ("", 0),
+    ("windows-31j", 35), ("iso8859-15", 14), ("", 0), ("iso-8859-8-i", 10),
+    ("", 0), ("cp1255", 25), ("cp1256", 26), ("cseucpkdfmtjapanese", 33),
+    ("csisolatin9", 14), ("iso-2022-kr", 37), ("csshiftjis", 35),
+    ("iso-ir-144", 6), ("windows-1257", 27), ("latin3", 4), ("iso88592", 3),
+    ("csisolatincyrillic", 6), ("iso885911", 19), ("iso-8859-9", 24),
+    ("csisolatingreek", 8), ("iso-2022-jp", 34), ("iso-ir-110", 5),
+    ("iso-ir-138", 9), ("", 0), ("visual", 9), ("iso8859-13", 12),
+    ("x-cp1257", 27), ("", 0), ("cskoi8r", 16), ("ascii", 22),
+    ("x-euc-jp", 33), ("csisolatin2", 3), ("", 0), ("greek", 8),
+    ("iso-8859-15", 14), ("cp1252", 22), ("iso_8859-6", 7),
+    ("ks_c_5601-1989", 36), ("", 0), ("csmacintosh", 18), ("latin5", 24),
+    ("ks_c_5601-1987", 36), ("", 0), ("", 0), ("hebrew", 9), ("", 0),
+    ("iso8859-1", 22), ("csksc56011987", 36), ("windows-1251", 21),
+    ("iso88594", 5), ("l4", 5), ("iso-8859-3", 4), ("iso88597", 8),
+    ("iso-2022-cn", 37), ("iso8859-2", 3), ("", 0), ("csisolatin1", 22),
+    ("iso-8859-6", 7), ("csbig5", 32), ("l5", 24), ("ecma-114", 7),
+    ("iso-8859-6-i", 7), ("iso-8859-4", 5), ("windows-1250", 20),
+    ("ksc5601", 36), ("iso-8859-7", 8), ("koi", 16), ("iso_8859-3:1988", 4),
+    ("gb_2312", 30), ("shift_jis", 35), ("unicode-1-1-utf-8", 1),
+    ("euc-jp", 33), ("iso-ir-157", 11), ("", 0), ("iso-8859-8-e", 9),
+    ("windows-1254", 24), ("iso88591", 22), ("iso88595", 6), ("cp1254", 24),
+    ("csiso88598i", 10), ("", 0), ("cp866", 2), ("iso885915", 14),
+    ("iso-8859-8", 9),
+]; // 256 entries
+
+const DISPLACEMENTS: &'static [u16] = &[
+    56, 0, 373, 17, 60, 59, 14, 1441, 26, 16, 94, 557, 319, 469, 0, 22, 0, 239,
+    149, 2, 1, 714, 337, 509, 1720, 2, 4, 0, 230, 1822, 545, 1885,
+]; // 32 entries
+
+#[inline]
+fn fold(b: u8) -> u8 {
+    if b'A' <= b && b <= b'Z' { b | 0x20 } else { b }
+}
+
+fn encoding(id: u8) -> Option<EncodingRef> {
+    match id {
+        1 => Some(all::UTF_8 as EncodingRef),
+        #[cfg(feature = "index-ibm866")]
+        2 => Some(all::IBM866 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-2")]
+        3 => Some(all::ISO_8859_2 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-3")]
+        4 => Some(all::ISO_8859_3 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-4")]
+        5 => Some(all::ISO_8859_4 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-5")]
+        6 => Some(all::ISO_8859_5 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-6")]
+        7 => Some(all::ISO_8859_6 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-7")]
+        8 => Some(all::ISO_8859_7 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-8")]
+        9 => Some(all::ISO_8859_8 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-8")]
+        10 => Some(all::whatwg::ISO_8859_8_I as EncodingRef),
+        #[cfg(feature = "index-iso-8859-10")]
+        11 => Some(all::ISO_8859_10 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-13")]
+        12 => Some(all::ISO_8859_13 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-14")]
+        13 => Some(all::ISO_8859_14 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-15")]
+        14 => Some(all::ISO_8859_15 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-16")]
+        15 => Some(all::ISO_8859_16 as EncodingRef),
+        #[cfg(feature = "index-koi8-r")]
+        16 => Some(all::KOI8_R as EncodingRef),
+        #[cfg(feature = "index-koi8-u")]
+        17 => Some(all::KOI8_U as EncodingRef),
+        #[cfg(feature = "index-macintosh")]
+        18 => Some(all::MAC_ROMAN as EncodingRef),
+        #[cfg(feature = "index-windows-874")]
+        19 => Some(all::WINDOWS_874 as EncodingRef),
+        #[cfg(feature = "index-windows-1250")]
+        20 => Some(all::WINDOWS_1250 as EncodingRef),
+        #[cfg(feature = "index-windows-1251")]
+        21 => Some(all::WINDOWS_1251 as EncodingRef),
+        #[cfg(feature = "index-windows-1252")]
+        22 => Some(all::WINDOWS_1252 as EncodingRef),
+        #[cfg(feature = "index-windows-1253")]
+        23 => Some(all::WINDOWS_1253 as EncodingRef),
+        #[cfg(feature = "index-windows-1254")]
+        24 => Some(all::WINDOWS_1254 as EncodingRef),
+        #[cfg(feature = "index-windows-1255")]
+        25 => Some(all::WINDOWS_1255 as EncodingRef),
+        #[cfg(feature = "index-windows-1256")]
+        26 => Some(all::WINDOWS_1256 as EncodingRef),
+        #[cfg(feature = "index-windows-1257")]
+        27 => Some(all::WINDOWS_1257 as EncodingRef),
+        #[cfg(feature = "index-windows-1258")]
+        28 => Some(all::WINDOWS_1258 as EncodingRef),
+        #[cfg(feature = "index-x-mac-cyrillic")]
+        29 => Some(all::MAC_CYRILLIC as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        30 => Some(all::GBK as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        31 => Some(all::GB18030 as EncodingRef),
+        #[cfg(feature = "index-big5")]
+        32 => Some(all::BIG5_2003 as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        33 => Some(all::EUC_JP as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        34 => Some(all::ISO_2022_JP as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        35 => Some(all::WINDOWS_31J as EncodingRef),
+        #[cfg(feature = "index-euc-kr")]
+        36 => Some(all::WINDOWS_949 as EncodingRef),
+        37 => Some(all::whatwg::REPLACEMENT as EncodingRef),
+        38 => Some(all::UTF_16BE as EncodingRef),
+        39 => Some(all::UTF_16LE as EncodingRef),
+        40 => Some(all::whatwg::X_USER_DEFINED as EncodingRef),
+        _ => None
+    }
+}
+
+/// Returns an encoding from given (already trimmed) label, matched case-insensitively.
+/// Does not allocate and only compares against one candidate label.
+pub fn lookup(label: &[u8]) -> Option<EncodingRef> {
+    if label.len() > 19 { return None; }
+    let mut h = 0x811c9dc5u32;
+    for &b in label {
+        h = (h ^ fold(b) as u32).wrapping_mul(0x01000193);
+    }
+    let disp = DISPLACEMENTS[(h & 31) as usize] as u32;
+    let (name, id) = LABELS[((h ^ disp).wrapping_mul(0x9e3779b1) >> 24) as usize];
+    if name.len() != label.len() { return None; }
+    for (&a, &b) in name.as_bytes().iter().zip(label.iter()) {
+        if a != fold(b) { return None; }
+    }
+    encoding(id)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{LABELS, encoding, lookup};
+
+    #[test]
+    fn test_all_labels() {
+        for &(name, id) in LABELS {
+            if id == 0 { continue; }
+            let upper: Vec<u8> = name.bytes().map(|b| b.to_ascii_uppercase()).collect();
+            let expected = encoding(id).map(|e| e.name());
+            assert_eq!(lookup(name.as_bytes()).map(|e| e.name()), expected);
+            assert_eq!(lookup(&upper).map(|e| e.name()), expected);
+            assert!(lookup(&name.as_bytes()[1..]).map_or(true, |e| Some(e.name()) != expected));
+        }
+        assert!(lookup(b"").is_none());
+    }
+}
@@ -39,6 +39,16 @@
 //! **This feature is strongly intended for end users.
 //! Do not enable this feature from library crates, ever.**
 //!
+//! Each index table also has its own Cargo feature named after the index
+//! (`index-big5`, `index-jis0212`, `index-windows-1252` and so on), all enabled by default.
+//! An application that only needs a handful of encodings can depend on Encoding
+//! with `default-features = false` and enable the corresponding features;
+//! encodings whose indices are missing are left out of `encoding::all`,
+//! and `encoding::label` will return `None` for them.
+//! Some encodings need more than one index:
+//! EUC-JP, ISO-2022-JP and Windows code page 932 need both `index-jis0208` and `index-jis0212`,
+//! and GBK, GB 18030 and HZ need both `index-gb18030` and `index-gb18030-ranges`.
+//!
 //! For finer-tuned optimization, see `src/index/gen_index.py` for
 //! custom table generation. At the most reduced (and slowest) setting,
 //! the minimal size of data table is about 160 KB.
@@ -58,6 +68,7 @@
 //! To encode a string with unrepresentable characters:
 //!
 //! ~~~~ {.rust}
+//! # #[cfg(feature = "index-iso-8859-2")] {
 //! use encoding::{Encoding, EncoderTrap};
 //! use encoding::all::ISO_8859_2;
 //!
@@ -68,6 +79,7 @@
 //!            Ok(vec![65,99,109,101]));
 //! assert_eq!(ISO_8859_2.encode("Acme\u{a9}", EncoderTrap::NcrEscape),
 //!            Ok(vec![65,99,109,101,38,35,49,54,57,59]));
+//! # }
 //! ~~~~
 //!
 //! To decode a byte sequence:
@@ -83,6 +95,7 @@
 //! To decode a byte sequence with invalid sequences:
 //!
 //! ~~~~ {.rust}
+//! # #[cfg(feature = "index-iso-8859-6")] {
 //! use encoding::{Encoding, DecoderTrap};
 //! use encoding::all::ISO_8859_6;
 //!
@@ -91,11 +104,13 @@
 //!            Ok("Acme\u{fffd}".to_string()));
 //! assert_eq!(ISO_8859_6.decode(&[65,99,109,101,169], DecoderTrap::Ignore),
 //!            Ok("Acme".to_string()));
+//! # }
 //! ~~~~
 //!
 //! To encode or decode the input into the already allocated buffer:
 //!
 //! ~~~~ {.rust}
+//! # #[cfg(all(feature = "index-iso-8859-2", feature = "index-iso-8859-6"))] {
 //! use encoding::{Encoding, EncoderTrap, DecoderTrap};
 //! use encoding::all::{ISO_8859_2, ISO_8859_6};
 //!
@@ -107,6 +122,7 @@
 //!
 //! assert_eq!(bytes, [65,99,109,101]);
 //! assert_eq!(chars, "Acme\u{fffd}");
+//! # }
 //! ~~~~
 //!
 //! A practical example of custom encoder traps:
@@ -135,6 +151,7 @@
 //! Getting the encoding from the string label, as specified in WHATWG Encoding standard:
 //!
 //! ~~~~ {.rust}
+//! # #[cfg(feature = "index-euc-kr")] {
 //! use encoding::{Encoding, DecoderTrap};
 //! use encoding::label::encoding_from_whatwg_label;
 //! use encoding::all::WINDOWS_949;
@@ -149,6 +166,7 @@
 //! // corresponding Encoding native API:
 //! assert_eq!(WINDOWS_949.decode(broken, DecoderTrap::Replace),
 //!            Ok("\u{c6b0}\u{c640}\u{fffd}\u{c559}".to_string()));
+//! # }
 //! ~~~~
 //!
 //! ## Types and Stuffs
@@ -171,6 +189,10 @@
 //!   which type is also known as `EncodingRef`.
 //!   It is useful when a list of required encodings is not available in advance,
 //!   but it will result in the larger binary and missed optimization opportunities.
+//! * `encoding::repertoire` can find encodings which can encode given string without an error,
+//!   from the most compact one.
+//! * `encoding::detect` can guess the encoding of an unlabeled document among given candidates
+//!   in a single pass.
 //!
 //! **`RawEncoder`** is an experimental incremental encoder.
 //! At each step of `raw_feed`, it receives a slice of string
@@ -252,15 +274,25 @@ pub mod codec {
     pub mod singlebyte;
     pub mod utf_8;
     pub mod utf_16;
+    #[cfg(feature = "index-euc-kr")]
     pub mod korean;
+    #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
     pub mod japanese;
+    #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
     pub mod simpchinese;
+    #[cfg(feature = "index-big5")]
     pub mod tradchinese;
     pub mod whatwg;
 }
 
 pub mod all;
 pub mod label;
+pub mod repertoire;
+pub mod detect;
+mod label_table;
+mod dfa_table;
+mod repertoire_table;
+mod detect_table;
 
 /// Determine the encoding by looking for a Byte Order Mark (BOM)
 /// and decoded a single string in memory.
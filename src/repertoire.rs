@@ -0,0 +1,135 @@
+// This is a part of rust-encoding.
+// Copyright (c) 2013-2015, Kang Seonghoon.
+// See README.md and LICENSE.txt for details.
+
+//! An interface for finding encodings which can encode given characters without an error.
+
+use repertoire_table;
+use types::EncodingRef;
+
+/// A set of encodings which can encode given characters without an error.
+///
+/// Encodings are ordered roughly from the most compact ones:
+/// ASCII, single-byte encodings, multi-byte encodings, GB 18030 and finally UTF-8.
+/// Encodings unavailable due to disabled indices are never returned.
+/// Encodings only differing in their labels (e.g. `whatwg::ISO_8859_8_I`)
+/// and UTF-16 are not included.
+#[derive(Clone, Copy, PartialEq, Eq, Debug)]
+pub struct EncodingSet(u64);
+
+impl EncodingSet {
+    /// Returns the set of every encoding.
+    pub fn all() -> EncodingSet {
+        EncodingSet(repertoire_table::ALL)
+    }
+
+    /// Returns the set of encodings which can encode given character.
+    pub fn for_char(ch: char) -> EncodingSet {
+        EncodingSet(repertoire_table::lookup(ch as u32))
+    }
+
+    /// Returns the set of encodings which can encode every character in given string.
+    /// Takes one table lookup per non-ASCII character,
+    /// and stops early once only encodings encoding every character remain.
+    pub fn for_str(s: &str) -> EncodingSet {
+        let mut set = repertoire_table::ALL;
+        for ch in s.chars() {
+            if ch < '\u{80}' { continue; } // every encoding can encode ASCII
+            set &= repertoire_table::lookup(ch as u32);
+            if set == repertoire_table::UNIVERSAL { break; }
+        }
+        EncodingSet(set)
+    }
+
+    /// Returns the set of encodings in both sets.
+    pub fn intersect(self, other: EncodingSet) -> EncodingSet {
+        EncodingSet(self.0 & other.0)
+    }
+
+    /// Returns true if given encoding is in the set.
+    pub fn contains(&self, encoding: EncodingRef) -> bool {
+        self.iter().any(|e| e.name() == encoding.name())
+    }
+
+    /// Returns true if the set has no (available) encoding.
+    pub fn is_empty(&self) -> bool {
+        self.first().is_none()
+    }
+
+    /// Returns the first, and normally the most compact, encoding in the set.
+    pub fn first(&self) -> Option<EncodingRef> {
+        self.iter().next()
+    }
+
+    /// Returns a list of encodings in the set, in the order described above.
+    pub fn encodings(&self) -> Vec<EncodingRef> {
+        self.iter().collect()
+    }
+
+    fn iter<'a>(&'a self) -> Box<Iterator<Item=EncodingRef> + 'a> {
+        Box::new((0..repertoire_table::NENCODINGS)
+            .filter(move |&i| (self.0 >> i) & 1 == 1)
+            .filter_map(repertoire_table::encoding))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::EncodingSet;
+    use all;
+    use types::EncodingRef;
+
+    fn names(set: EncodingSet) -> Vec<&'static str> {
+        set.encodings().iter().map(|e| e.name()).collect()
+    }
+
+    #[test]
+    fn test_ascii() {
+        assert_eq!(EncodingSet::for_str(""), EncodingSet::all());
+        assert_eq!(EncodingSet::for_str("Hello, world!"), EncodingSet::all());
+        assert_eq!(EncodingSet::for_str("Hello").first().map(|e| e.name()), Some("ascii"));
+        assert!(EncodingSet::all().contains(all::UTF_8 as EncodingRef));
+        assert!(!EncodingSet::all().contains(all::UTF_16LE as EncodingRef));
+    }
+
+    #[test]
+    fn test_latin1() {
+        let set = EncodingSet::for_str("caf\u{e9}");
+        assert_eq!(set.first().map(|e| e.name()), Some("iso-8859-1"));
+        assert!(!set.contains(all::ASCII as EncodingRef));
+        assert!(set.contains(all::UTF_8 as EncodingRef));
+        assert_eq!(set, EncodingSet::for_char('\u{e9}'));
+    }
+
+    #[test]
+    #[cfg(all(feature = "index-euc-kr",
+              feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+    fn test_korean() {
+        let set = EncodingSet::for_str("\u{d55c}\u{ad6d}\u{c5b4}");
+        assert_eq!(names(set), vec!["windows-949", "gb18030", "utf-8"]);
+        assert!(set.contains(all::WINDOWS_949 as EncodingRef));
+    }
+
+    #[test]
+    fn test_universal() {
+        let set = EncodingSet::for_str("\u{d55c}\u{3042}\u{1f600}abc");
+        assert_eq!(set.encodings().last().map(|e| e.name()), Some("utf-8"));
+        assert!(!set.contains(all::ASCII as EncodingRef));
+        assert!(!set.is_empty());
+        // U+E5E5 cannot be encoded in GB 18030
+        let set = EncodingSet::for_str("\u{e5e5}");
+        assert_eq!(names(set), vec!["utf-8"]);
+        assert_eq!(EncodingSet::for_str("\u{e5e5}\u{d55c}"), set);
+        // and the order of characters doesn't matter
+        assert_eq!(EncodingSet::for_str("\u{1f600}\u{e5e5}"), set);
+        assert_eq!(EncodingSet::for_str("\u{e5e5}\u{1f600}"), set);
+    }
+
+    #[test]
+    fn test_intersect() {
+        let set = EncodingSet::for_char('\u{e9}').intersect(EncodingSet::for_char('\u{20ac}'));
+        assert!(!set.contains(all::ISO_8859_1 as EncodingRef));
+        assert_eq!(set, EncodingSet::for_str("\u{e9}\u{20ac}"));
+        assert!(set.intersect(EncodingSet::for_char('\u{e5e5}')).contains(all::UTF_8 as EncodingRef));
+    }
+}
@@ -0,0 +1,2202 @@
+// AUTOGENERATED FROM THE INDICES OF THE ENCODING STANDARD BY gen_index.py.
+// https://encoding.spec.whatwg.org/
+
+//! A trie from code points to the set of encodings which can encode them.
+
+use all;
+use types::EncodingRef;
+
+/// The number of encodings, which may be unavailable due to disabled indices.
+pub const NENCODINGS: usize = 39;
+
+/// The set of every encoding.
+pub const ALL: u64 = 0x7fffffffff;
+
+/// The set of encodings which can encode every code point.
+pub const UNIVERSAL: u64 = 0x4000000000;
+
+const BITSETS: &'static [u64] = &[
+    0x6000000000, 0x4000000000, 0x6000000004, 0x6000000020, 0x6000000200,
+    0x6000000400, 0x6000000840, 0x6000002000, 0x6000002020, 0x6000008000,
+    0x600000fff2, 0x6000030000, 0x6000030008, 0x6000040000, 0x6000080000,
+    0x600008fff2, 0x6000100010, 0x6000108010, 0x6000506812, 0x6000800200,
+    0x6001000020, 0x6001100030, 0x6001446842, 0x600144e022, 0x6002000000,
+    0x6002000400, 0x6004000000, 0x6004000100, 0x6006000400, 0x6008001040,
+    0x6008001840, 0x6008109010, 0x6008109030, 0x6008109850, 0x600818fff2,
+    0x600850d850, 0x600898fff2, 0x6008b8fff2, 0x6009447842, 0x600950d850,
+    0x600a88fff2, 0x6010000000, 0x6010108010, 0x6010108850, 0x6011446022,
+    0x601144e000, 0x601144e002, 0x601144e022, 0x601144e822, 0x601144e862,
+    0x601154e032, 0x601154e872, 0x6013440000, 0x601388fff2, 0x6013c8fff2,
+    0x601544e822, 0x601544e862, 0x601554e032, 0x601554e872, 0x6019447842,
+    0x601954f832, 0x601954f872, 0x601a88fff2, 0x601bd8fff2, 0x601f445402,
+    0x601ff01602, 0x601ff40000, 0x6020040000, 0x6020200080, 0x6020220000,
+    0x6020220080, 0x6020220088, 0x6037c40000, 0x603fc47622, 0x603ff45422,
+    0x603ff45602, 0x603ff49000, 0x603ff4d606, 0x603ff7f602, 0x603ffc0000,
+    0x603ffffffe, 0x6040000000, 0x6040000020, 0x6040000840, 0x6040030008,
+    0x6040040000, 0x6040140010, 0x6040140030, 0x6040404802, 0x6041040020,
+    0x6048109010, 0x6048140050, 0x6050108850, 0x6051444002, 0x6053444002,
+    0x605544c000, 0x6059447842, 0x605944f842, 0x605954f872, 0x605f401402,
+    0x605f405402, 0x605f540472, 0x605fc01622, 0x605fc05622, 0x605fc35622,
+    0x605ff0fff2, 0x607ff40000, 0x607ff47402, 0x610000fff2, 0x6380000000,
+    0x6397c44402, 0x63c0000000, 0x63c0040000, 0x63df540472, 0x63dff40000,
+    0x63fff40000, 0x63fff4f402, 0x6800000000, 0x6817440000, 0x681f444442,
+    0x6840000840, 0x685544c000, 0x6859447842, 0x7000000000, 0x7000030008,
+    0x7040000000, 0x7380000000, 0x73c0000000, 0x73c0800a00, 0x7400000000,
+    0x7400100010, 0x740144e022, 0x7408001840, 0x7408109010, 0x741154e872,
+    0x741544e022, 0x741954f832, 0x741d54f872, 0x7420070000, 0x7440000000,
+    0x7440040000, 0x745df0157a, 0x7460070000, 0x7780000000, 0x77c0000000,
+    0x77c0040000, 0x77dff40000, 0x7800000000, 0x7800010008, 0x7800030008,
+    0x783ffc0000, 0x7840000000, 0x7848140070, 0x7b80000000, 0x7bc0000000,
+    0x7c00000000, 0x7c3ffc0004, 0x7c40000000, 0x7c48140050, 0x7c5ff7de2a,
+    0x7c7ffcc200, 0x7f80000000, 0x7fc0000000, 0x7fc0030008, 0x7fc0040000,
+    0x7fc0800200, 0x7fc0840200, 0x7fdf505472, 0x7fdfd40672, 0x7fe0040000,
+    0x7fe0070008, 0x7fe0200088, 0x7fe0230088, 0x7fff575472, 0x7ffff4d602,
+    0x7ffff4fef2, 0x7ffff7de7a, 0x7ffffc0004, 0x7ffffc0200, 0x7ffffc1000,
+    0x7ffffc1200, 0x7ffffc9000, 0x7fffffffff,
+]; // 183 entries
+
+const TABLE_LOWER: &'static [u8] = &[
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0,
+    147, 109, 109, 109, 109, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 117,
+    117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 7, 7, 0, 0, 0, 0, 0, 0, 7, 7, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 163, 162, 0, 81, 81, 81,
+    81, 81, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0, 162, 162, 0, 0, 81, 81, 0, 0, 0, 0,
+    154, 154, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 123, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 111, 111, 0,
+    0, 111, 111, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 147, 0, 0, 0, 157, 0,
+    0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0, 0, 109,
+    0, 0, 0, 109, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 147, 155, 0, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155,
+    155, 155, 155, 129, 129, 129, 129, 129, 129, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 1, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123, 123,
+    129, 129, 129, 129, 129, 129, 0, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 0, 0, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 123, 123, 123, 123, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123,
+    123, 123, 123, 123, 123, 123, 123, 123, 123, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 0, 123, 123, 123, 0, 0, 0, 0, 0, 123, 0, 27, 27, 27, 27, 27, 27,
+    27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 118, 158, 0, 155, 147, 147, 0, 117, 0, 0, 81, 0, 0, 0, 0, 0, 0, 0,
+    87, 152, 85, 91, 52, 86, 0, 0, 147, 147, 147, 147, 147, 147, 147, 147, 147,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 172,
+    172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172,
+    172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172,
+    172, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 111, 111, 111, 111,
+    111, 109, 109, 109, 109, 109, 157, 157, 157, 157, 157, 157, 157, 157, 157,
+    157, 139, 139, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 0, 0, 0,
+    81, 117, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 81, 81, 81, 81, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 0, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 117, 0, 0, 108, 63, 15, 34, 15, 10,
+    15, 15, 36, 15, 62, 15, 40, 54, 53, 54, 63, 10, 10, 10, 10, 10, 10, 10, 37,
+    15, 62, 15, 40, 54, 53, 40, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 155, 155, 155,
+    155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 155,
+    155, 155, 155, 155, 155, 155, 155, 155, 155, 81, 81, 81, 81, 81, 0, 0, 0,
+    81, 81, 81, 81, 81, 81, 154, 154, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 154, 154, 154, 81, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 81, 81, 0, 0, 0, 0,
+    162, 162, 81, 0, 13, 162, 0, 0, 162, 162, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 24, 24, 24, 24, 24, 24, 24, 24, 24, 24, 0, 24, 24, 24, 24, 24, 163, 144,
+    163, 144, 129, 129, 129, 129, 129, 129, 129, 129, 163, 139, 139, 144, 163,
+    139, 139, 144, 163, 139, 139, 144, 163, 139, 139, 144, 163, 144, 139, 139,
+    155, 155, 155, 155, 155, 155, 155, 155, 155, 155, 0, 0, 0, 0, 0, 0, 0, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 154, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 144, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 138, 0, 0,
+    0, 129, 0, 0, 0, 0, 0, 154, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 41,
+    160, 0, 0, 4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 123, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 0, 147, 0, 117, 117, 0, 117, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0,
+    0, 117, 0, 166, 165, 19, 165, 165, 165, 165, 165, 165, 165, 19, 19, 19, 19,
+    19, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 117, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 111, 81, 81, 125, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 125, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 125, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 111, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 125, 81, 81, 81, 81, 81, 81, 81, 81, 81, 125, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 147, 147, 126, 126, 109, 126, 109, 126, 126, 109, 109, 109, 126, 109,
+    109, 109, 109, 109, 109, 126, 126, 126, 109, 126, 126, 109, 109, 126, 126,
+    126, 109, 109, 109, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 0, 0, 0, 0, 0, 0, 0, 153, 153, 153, 153, 0, 172, 172,
+    172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 0,
+    172, 68, 68, 71, 68, 70, 71, 68, 68, 68, 68, 68, 0, 71, 68, 139, 139, 139,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 81, 81, 81, 81, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 0, 0, 0, 0, 109, 153, 153, 153, 0, 2, 2, 2,
+    2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0, 0, 0, 2, 2,
+    2, 2, 2, 0, 135, 134, 58, 22, 61, 59, 97, 57, 135, 137, 135, 58, 131, 134,
+    58, 55, 88, 44, 131, 136, 58, 38, 61, 173, 122, 135, 134, 56, 137, 18, 88,
+    46, 115, 114, 79, 0, 0, 154, 177, 117, 0, 0, 0, 0, 0, 0, 0, 0, 146, 0, 162,
+    144, 0, 147, 0, 0, 0, 66, 66, 162, 0, 0, 109, 0, 39, 39, 16, 16, 16, 16,
+    83, 83, 6, 6, 30, 132, 3, 3, 16, 16, 17, 17, 30, 30, 7, 7, 7, 7, 45, 31,
+    31, 32, 32, 35, 35, 0, 47, 51, 51, 22, 61, 59, 97, 50, 47, 61, 47, 51, 23,
+    51, 51, 48, 88, 44, 23, 60, 51, 38, 61, 167, 96, 47, 51, 49, 61, 18, 88,
+    98, 7, 7, 7, 7, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 147, 147, 147, 147, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 80, 94, 64, 73, 141, 110,
+    65, 175, 168, 78, 93, 77, 75, 105, 107, 119, 176, 174, 104, 103, 113, 74,
+    116, 159, 101, 100, 93, 77, 99, 102, 99, 94, 7, 7, 0, 0, 0, 0, 0, 0, 0, 0,
+    7, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 72, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 111, 0, 111, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    123, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117,
+    0, 147, 0, 0, 147, 0, 117, 0, 147, 0, 0, 0, 0, 123, 0, 0, 147, 123, 0, 0,
+    0, 123, 117, 0, 117, 0, 165, 165, 0, 165, 165, 165, 165, 165, 165, 166, 19,
+    19, 19, 19, 19, 19, 19, 165, 165, 165, 165, 165, 165, 165, 165, 165, 165,
+    165, 165, 165, 165, 165, 11, 11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 162, 162, 123, 162,
+    123, 123, 123, 162, 162, 162, 162, 162, 155, 162, 161, 147, 161, 162, 123,
+    129, 162, 162, 162, 126, 162, 162, 129, 129, 129, 129, 162, 147, 123, 123,
+    154, 162, 123, 162, 123, 155, 155, 155, 123, 162, 129, 162, 162, 162, 129,
+    123, 155, 155, 129, 126, 162, 126, 162, 162, 147, 123, 155, 162, 162, 162,
+    126, 123, 154, 147, 147, 153, 162, 123, 162, 143, 126, 162, 162, 155, 162,
+    129, 125, 162, 162, 155, 162, 162, 123, 123, 144, 153, 129, 162, 126, 123,
+    154, 161, 162, 162, 161, 155, 162, 129, 161, 162, 147, 155, 162, 162, 123,
+    162, 143, 126, 123, 129, 123, 129, 162, 162, 162, 162, 162, 162, 147, 123,
+    147, 162, 161, 162, 153, 162, 147, 126, 147, 147, 123, 123, 147, 162, 162,
+    151, 123, 162, 162, 162, 162, 162, 147, 147, 147, 147, 123, 129, 155, 155,
+    143, 129, 126, 153, 129, 129, 123, 147, 123, 162, 123, 123, 162, 154, 151,
+    147, 123, 123, 147, 162, 162, 162, 162, 162, 147, 161, 147, 162, 153, 161,
+    155, 162, 162, 162, 162, 161, 161, 155, 147, 151, 147, 162, 157, 147, 154,
+    147, 162, 155, 127, 162, 123, 162, 123, 162, 147, 162, 153, 123, 161, 147,
+    154, 155, 154, 123, 153, 162, 147, 162, 147, 123, 147, 147, 154, 162, 162,
+    155, 123, 147, 123, 154, 162, 147, 123, 153, 162, 155, 161, 162, 123, 151,
+    154, 123, 147, 162, 161, 147, 162, 153, 155, 162, 155, 162, 147, 123, 125,
+    123, 123, 153, 154, 147, 147, 154, 123, 154, 155, 162, 147, 161, 123, 154,
+    162, 147, 161, 147, 154, 147, 155, 162, 162, 147, 157, 123, 154, 162, 153,
+    147, 126, 162, 123, 147, 153, 162, 162, 154, 147, 147, 155, 147, 155, 162,
+    126, 147, 123, 147, 123, 162, 126, 147, 123, 123, 162, 147, 162, 147, 147,
+    147, 162, 123, 147, 147, 123, 162, 123, 147, 129, 123, 123, 147, 147, 162,
+    147, 123, 147, 154, 147, 123, 153, 147, 147, 123, 154, 154, 153, 147, 147,
+    147, 147, 123, 123, 147, 153, 123, 147, 154, 147, 147, 147, 154, 154, 147,
+    123, 126, 147, 162, 123, 154, 123, 147, 147, 154, 162, 147, 126, 123, 162,
+    147, 123, 147, 127, 123, 154, 154, 153, 147, 154, 147, 157, 155, 147, 154,
+    147, 155, 147, 123, 147, 123, 147, 147, 162, 147, 153, 153, 126, 147, 153,
+    123, 153, 123, 147, 123, 123, 154, 162, 162, 123, 162, 162, 162, 162, 154,
+    162, 162, 126, 162, 154, 162, 127, 123, 126, 129, 154, 123, 161, 155, 129,
+    147, 123, 147, 161, 147, 162, 147, 147, 147, 162, 129, 161, 123, 123, 143,
+    127, 147, 155, 161, 154, 123, 143, 162, 123, 153, 126, 153, 162, 153, 147,
+    162, 161, 162, 147, 143, 123, 129, 129, 126, 147, 123, 129, 123, 123, 123,
+    162, 153, 162, 155, 147, 162, 147, 162, 162, 154, 147, 155, 147, 155, 123,
+    147, 147, 123, 126, 147, 147, 123, 123, 143, 154, 162, 151, 147, 162, 155,
+    155, 162, 126, 123, 162, 162, 162, 147, 162, 153, 147, 129, 162, 123, 147,
+    162, 155, 147, 126, 126, 155, 162, 129, 129, 129, 129, 147, 162, 147, 123,
+    129, 155, 129, 162, 153, 123, 147, 154, 123, 147, 162, 154, 162, 162, 147,
+    126, 129, 129, 147, 123, 162, 147, 162, 147, 123, 123, 147, 154, 155, 151,
+    161, 147, 147, 155, 155, 154, 147, 123, 123, 154, 162, 154, 147, 147, 147,
+    154, 123, 123, 129, 154, 127, 155, 153, 123, 147, 147, 147, 147, 123, 162,
+    126, 129, 129, 162, 153, 154, 147, 162, 123, 154, 123, 162, 123, 162, 123,
+    129, 123, 154, 123, 123, 155, 123, 162, 147, 123, 154, 157, 153, 162, 154,
+    123, 154, 123, 154, 154, 162, 143, 126, 126, 123, 123, 162, 161, 126, 162,
+    147, 147, 147, 123, 162, 147, 162, 162, 147, 147, 123, 123, 162, 162, 162,
+    123, 162, 161, 123, 147, 161, 123, 147, 154, 162, 147, 162, 151, 161, 126,
+    162, 162, 162, 162, 123, 147, 154, 129, 129, 123, 162, 162, 162, 154, 129,
+    129, 162, 126, 123, 162, 123, 162, 123, 162, 129, 123, 123, 161, 123, 162,
+    129, 129, 123, 123, 129, 147, 129, 129, 129, 147, 147, 123, 123, 147, 154,
+    147, 129, 153, 147, 162, 147, 162, 123, 147, 155, 147, 162, 123, 155, 143,
+    154, 123, 147, 123, 123, 162, 162, 162, 162, 143, 162, 126, 123, 123, 129,
+    123, 123, 162, 123, 162, 162, 129, 161, 123, 162, 123, 126, 123, 161, 123,
+    161, 123, 162, 162, 123, 155, 147, 162, 162, 162, 153, 162, 162, 162, 162,
+    162, 162, 155, 155, 123, 129, 129, 129, 147, 147, 123, 162, 147, 162, 155,
+    162, 161, 147, 154, 155, 123, 147, 161, 147, 162, 126, 162, 129, 123, 123,
+    153, 147, 129, 127, 129, 129, 155, 129, 129, 129, 129, 129, 123, 129, 129,
+    123, 123, 126, 162, 147, 155, 123, 161, 123, 162, 147, 147, 123, 126, 161,
+    162, 147, 162, 161, 162, 147, 161, 123, 129, 155, 155, 123, 147, 129, 155,
+    129, 126, 129, 123, 123, 162, 162, 161, 147, 162, 147, 155, 161, 162, 162,
+    123, 123, 129, 129, 155, 155, 129, 129, 129, 129, 129, 129, 147, 129, 126,
+    129, 129, 123, 129, 129, 155, 129, 123, 155, 123, 147, 154, 147, 162, 162,
+    147, 155, 147, 147, 147, 123, 151, 161, 162, 155, 147, 123, 161, 123, 126,
+    147, 123, 123, 147, 129, 125, 123, 123, 123, 153, 155, 123, 155, 162, 153,
+    162, 147, 147, 155, 155, 147, 126, 147, 147, 154, 155, 147, 147, 154, 123,
+    155, 162, 153, 123, 123, 123, 123, 161, 153, 151, 147, 162, 155, 155, 161,
+    162, 123, 154, 162, 155, 162, 162, 161, 147, 147, 147, 155, 123, 155, 147,
+    147, 155, 147, 123, 123, 162, 162, 154, 123, 162, 162, 126, 161, 147, 123,
+    147, 147, 161, 162, 147, 154, 147, 155, 147, 147, 155, 155, 147, 147, 147,
+    155, 155, 155, 162, 147, 155, 123, 123, 147, 154, 147, 162, 155, 123, 162,
+    155, 155, 147, 123, 147, 147, 154, 123, 155, 162, 123, 123, 155, 147, 155,
+    155, 147, 123, 147, 147, 154, 147, 153, 154, 143, 123, 123, 161, 147, 147,
+    129, 155, 147, 147, 153, 123, 123, 147, 147, 123, 147, 147, 147, 123, 161,
+    155, 161, 147, 126, 123, 123, 151, 129, 123, 123, 155, 155, 155, 147, 126,
+    129, 123, 147, 123, 153, 147, 147, 147, 147, 155, 162, 153, 123, 123, 126,
+    123, 147, 147, 155, 161, 147, 123, 123, 155, 126, 147, 123, 147, 147, 147,
+    147, 123, 147, 147, 123, 123, 153, 153, 153, 153, 123, 147, 147, 123, 153,
+    147, 157, 147, 147, 151, 126, 123, 123, 154, 123, 153, 155, 123, 123, 161,
+    126, 123, 162, 162, 123, 155, 162, 155, 153, 147, 147, 162, 162, 123, 129,
+    147, 162, 161, 155, 154, 147, 154, 123, 126, 123, 123, 154, 154, 147, 123,
+    154, 123, 154, 123, 147, 147, 161, 123, 147, 162, 162, 147, 162, 147, 123,
+    147, 147, 162, 123, 147, 162, 147, 155, 157, 162, 161, 162, 162, 147, 123,
+    123, 123, 123, 129, 123, 126, 129, 129, 129, 129, 129, 129, 147, 123, 162,
+    155, 129, 129, 129, 123, 127, 126, 123, 162, 155, 123, 123, 147, 147, 123,
+    129, 162, 147, 147, 123, 147, 147, 147, 147, 155, 123, 147, 147, 147, 126,
+    147, 155, 162, 123, 123, 153, 154, 127, 123, 123, 162, 147, 123, 162, 155,
+    147, 123, 161, 126, 161, 155, 126, 123, 129, 129, 129, 123, 153, 129, 123,
+    162, 162, 147, 162, 147, 147, 154, 162, 155, 151, 151, 154, 161, 147, 155,
+    147, 123, 147, 129, 123, 123, 147, 143, 123, 123, 123, 161, 123, 147, 147,
+    153, 157, 123, 126, 126, 123, 123, 129, 123, 123, 123, 147, 147, 154, 154,
+    155, 155, 147, 151, 123, 162, 153, 147, 162, 147, 123, 154, 162, 153, 154,
+    147, 147, 147, 162, 123, 155, 155, 147, 162, 123, 162, 147, 147, 147, 157,
+    147, 147, 123, 123, 147, 147, 147, 147, 129, 162, 147, 123, 123, 126, 147,
+    129, 129, 123, 154, 147, 162, 162, 123, 162, 147, 123, 123, 162, 147, 154,
+    147, 147, 126, 123, 126, 123, 151, 147, 123, 162, 147, 154, 147, 162, 147,
+    126, 154, 154, 147, 147, 153, 147, 154, 154, 123, 123, 143, 147, 129, 123,
+    147, 129, 123, 126, 153, 126, 147, 155, 147, 162, 126, 147, 147, 123, 157,
+    162, 162, 147, 126, 162, 162, 126, 162, 123, 123, 155, 147, 129, 129, 123,
+    162, 147, 123, 162, 162, 162, 147, 129, 123, 123, 162, 162, 154, 162, 123,
+    153, 162, 162, 129, 162, 161, 123, 162, 126, 147, 126, 123, 123, 147, 161,
+    162, 162, 162, 147, 129, 129, 129, 123, 162, 123, 123, 161, 147, 147, 147,
+    123, 155, 162, 123, 123, 162, 157, 147, 162, 123, 126, 123, 153, 155, 123,
+    147, 147, 123, 151, 123, 147, 162, 147, 147, 154, 155, 162, 147, 147, 147,
+    147, 162, 162, 155, 162, 162, 123, 147, 129, 155, 154, 162, 147, 162, 157,
+    147, 123, 147, 162, 123, 162, 129, 129, 129, 129, 129, 161, 147, 123, 155,
+    123, 123, 147, 123, 162, 123, 155, 123, 147, 147, 147, 162, 147, 126, 151,
+    162, 123, 147, 162, 161, 154, 147, 147, 147, 123, 162, 147, 147, 162, 155,
+    123, 147, 147, 123, 123, 147, 147, 147, 147, 123, 155, 147, 147, 147, 123,
+    162, 147, 147, 147, 147, 147, 123, 123, 123, 147, 147, 123, 123, 123, 147,
+    123, 147, 147, 147, 123, 147, 147, 147, 147, 162, 147, 147, 147, 147, 147,
+    123, 123, 162, 162, 147, 147, 147, 147, 147, 162, 162, 123, 151, 123, 147,
+    147, 147, 162, 147, 153, 162, 147, 123, 123, 126, 123, 129, 147, 129, 147,
+    161, 153, 155, 147, 147, 147, 155, 147, 147, 147, 123, 147, 147, 147, 123,
+    151, 123, 147, 147, 162, 123, 154, 154, 123, 123, 147, 147, 123, 123, 147,
+    147, 123, 162, 155, 123, 147, 147, 147, 123, 147, 147, 123, 162, 123, 123,
+    154, 123, 153, 147, 147, 147, 123, 123, 147, 147, 147, 147, 123, 162, 162,
+    123, 155, 162, 162, 153, 162, 162, 129, 162, 161, 162, 162, 123, 162, 161,
+    155, 147, 161, 155, 162, 123, 162, 162, 162, 123, 162, 162, 126, 147, 162,
+    123, 123, 147, 157, 123, 162, 125, 162, 162, 162, 162, 162, 162, 161, 129,
+    126, 154, 147, 162, 127, 162, 162, 162, 162, 123, 126, 147, 147, 162, 147,
+    147, 123, 162, 147, 162, 162, 154, 147, 147, 151, 153, 147, 123, 126, 123,
+    143, 162, 162, 123, 162, 126, 147, 162, 153, 143, 154, 154, 162, 162, 154,
+    147, 154, 154, 162, 147, 162, 147, 153, 155, 155, 162, 123, 129, 125, 161,
+    123, 129, 129, 126, 147, 162, 161, 129, 123, 147, 162, 154, 147, 162, 155,
+    143, 162, 147, 154, 162, 161, 161, 162, 123, 126, 147, 162, 147, 123, 147,
+    155, 123, 125, 147, 147, 143, 123, 123, 129, 129, 123, 123, 147, 147, 123,
+    155, 147, 147, 147, 161, 155, 123, 147, 162, 162, 147, 147, 161, 147, 129,
+    129, 129, 129, 129, 129, 155, 147, 123, 147, 125, 129, 123, 123, 129, 126,
+    147, 153, 147, 147, 147, 155, 147, 123, 147, 147, 147, 123, 155, 147, 147,
+    123, 147, 147, 147, 162, 147, 147, 123, 123, 147, 147, 147, 147, 129, 129,
+    123, 123, 155, 162, 123, 123, 123, 153, 147, 151, 162, 147, 147, 154, 147,
+    123, 162, 126, 162, 154, 153, 154, 153, 161, 123, 147, 155, 153, 147, 147,
+    153, 147, 123, 147, 147, 155, 123, 147, 155, 162, 162, 123, 153, 123, 154,
+    147, 153, 126, 123, 147, 123, 123, 129, 147, 123, 129, 126, 129, 147, 123,
+    147, 147, 161, 123, 153, 123, 147, 154, 147, 147, 147, 154, 126, 147, 123,
+    123, 126, 123, 147, 147, 147, 147, 123, 147, 123, 155, 147, 123, 147, 162,
+    147, 147, 147, 123, 147, 147, 123, 129, 147, 147, 123, 153, 123, 147, 126,
+    162, 123, 147, 126, 147, 154, 126, 147, 147, 154, 147, 147, 123, 123, 161,
+    123, 162, 162, 147, 123, 129, 162, 162, 147, 129, 162, 123, 129, 147, 147,
+    126, 162, 123, 147, 129, 129, 162, 123, 123, 155, 155, 162, 147, 155, 162,
+    161, 162, 129, 162, 123, 147, 154, 147, 129, 153, 162, 162, 123, 127, 123,
+    123, 147, 147, 162, 147, 153, 147, 123, 123, 123, 147, 161, 162, 123, 153,
+    147, 147, 123, 155, 147, 147, 129, 154, 155, 126, 147, 153, 162, 123, 129,
+    162, 147, 147, 162, 155, 147, 147, 123, 162, 129, 129, 123, 129, 129, 162,
+    161, 162, 123, 129, 162, 147, 162, 123, 129, 129, 123, 153, 154, 126, 147,
+    147, 147, 147, 154, 162, 162, 147, 147, 123, 147, 126, 154, 155, 155, 162,
+    147, 147, 162, 147, 147, 147, 154, 162, 147, 153, 147, 154, 129, 162, 155,
+    143, 162, 147, 123, 147, 155, 126, 162, 161, 126, 153, 123, 162, 126, 144,
+    147, 162, 154, 162, 126, 162, 162, 123, 147, 162, 123, 147, 123, 162, 155,
+    126, 123, 147, 147, 126, 147, 123, 154, 147, 154, 147, 154, 123, 154, 147,
+    155, 126, 129, 143, 147, 129, 162, 162, 155, 154, 123, 125, 126, 161, 123,
+    123, 162, 162, 161, 126, 143, 162, 147, 162, 161, 155, 162, 162, 162, 123,
+    123, 123, 162, 154, 162, 126, 123, 129, 147, 162, 162, 162, 123, 147, 155,
+    123, 154, 147, 147, 147, 123, 162, 129, 162, 129, 123, 123, 155, 123, 123,
+    162, 162, 123, 155, 155, 155, 155, 123, 147, 147, 162, 162, 162, 162, 123,
+    123, 126, 161, 153, 147, 155, 129, 129, 129, 129, 129, 129, 123, 123, 147,
+    155, 147, 147, 155, 161, 162, 153, 147, 162, 147, 155, 161, 162, 147, 123,
+    161, 147, 161, 162, 162, 147, 123, 147, 162, 162, 162, 147, 147, 153, 147,
+    123, 147, 153, 143, 147, 162, 123, 123, 162, 123, 162, 147, 147, 162, 123,
+    123, 147, 162, 161, 147, 123, 162, 147, 153, 147, 153, 123, 161, 161, 154,
+    147, 147, 147, 162, 153, 126, 162, 162, 147, 123, 147, 123, 161, 123, 162,
+    147, 162, 153, 123, 123, 162, 162, 147, 155, 147, 162, 147, 147, 123, 147,
+    147, 162, 161, 154, 147, 147, 155, 155, 147, 147, 147, 147, 123, 162, 123,
+    153, 147, 161, 123, 123, 161, 147, 162, 147, 162, 155, 153, 162, 161, 162,
+    123, 153, 147, 147, 162, 123, 162, 162, 147, 147, 123, 162, 162, 162, 147,
+    126, 147, 147, 147, 162, 147, 123, 147, 123, 162, 154, 147, 147, 123, 162,
+    147, 147, 154, 123, 154, 147, 147, 154, 162, 147, 162, 154, 162, 153, 161,
+    147, 123, 129, 147, 154, 147, 162, 147, 123, 154, 127, 153, 147, 147, 162,
+    147, 154, 147, 151, 154, 147, 123, 123, 123, 153, 123, 147, 154, 155, 147,
+    147, 162, 123, 154, 154, 147, 147, 162, 123, 153, 123, 127, 127, 154, 147,
+    123, 155, 123, 147, 123, 147, 155, 154, 123, 147, 153, 154, 162, 154, 162,
+    162, 153, 153, 123, 123, 153, 129, 129, 147, 129, 123, 147, 123, 147, 123,
+    123, 123, 123, 123, 147, 147, 154, 147, 123, 147, 147, 123, 129, 151, 162,
+    153, 162, 129, 162, 162, 162, 129, 162, 162, 162, 126, 153, 155, 162, 129,
+    129, 147, 162, 161, 123, 126, 126, 162, 162, 162, 147, 155, 123, 123, 147,
+    162, 162, 162, 147, 162, 129, 162, 161, 123, 147, 155, 155, 162, 155, 126,
+    123, 123, 162, 147, 147, 161, 147, 123, 153, 123, 162, 147, 126, 153, 162,
+    123, 147, 147, 147, 162, 162, 123, 147, 123, 147, 147, 123, 162, 162, 161,
+    153, 162, 161, 162, 162, 123, 129, 144, 126, 123, 126, 129, 123, 123, 162,
+    123, 155, 161, 161, 162, 162, 162, 161, 147, 162, 162, 155, 154, 162, 153,
+    162, 162, 162, 147, 157, 162, 162, 162, 155, 162, 162, 126, 123, 155, 147,
+    162, 161, 147, 123, 123, 123, 162, 161, 162, 123, 147, 153, 147, 155, 147,
+    147, 162, 123, 147, 147, 147, 155, 123, 123, 126, 129, 129, 123, 129, 129,
+    143, 147, 147, 155, 155, 147, 155, 155, 147, 147, 162, 147, 155, 162, 161,
+    155, 162, 162, 147, 123, 123, 147, 162, 147, 153, 147, 147, 147, 123, 126,
+    123, 129, 129, 161, 147, 155, 154, 147, 147, 123, 155, 162, 162, 155, 147,
+    162, 147, 161, 161, 155, 147, 162, 123, 147, 123, 162, 147, 162, 147, 123,
+    154, 147, 147, 147, 153, 154, 123, 147, 153, 162, 147, 162, 147, 147, 161,
+    147, 147, 147, 155, 155, 162, 162, 123, 161, 147, 123, 147, 162, 147, 147,
+    147, 154, 154, 147, 147, 129, 147, 129, 129, 129, 123, 123, 129, 153, 123,
+    123, 147, 147, 155, 155, 154, 147, 162, 155, 123, 147, 161, 157, 147, 154,
+    154, 147, 123, 147, 155, 162, 123, 155, 147, 147, 155, 126, 147, 129, 129,
+    129, 129, 129, 123, 129, 147, 123, 147, 153, 123, 147, 147, 155, 147, 155,
+    123, 123, 123, 162, 147, 123, 147, 147, 147, 155, 147, 123, 123, 155, 126,
+    129, 155, 123, 155, 154, 147, 147, 147, 147, 123, 123, 147, 147, 139, 162,
+    154, 123, 161, 155, 147, 147, 155, 154, 123, 147, 153, 162, 147, 129, 154,
+    161, 147, 151, 162, 123, 154, 123, 147, 151, 147, 123, 162, 162, 147, 155,
+    123, 162, 123, 154, 123, 147, 155, 162, 147, 154, 147, 123, 123, 129, 123,
+    162, 147, 123, 147, 151, 126, 147, 147, 123, 155, 123, 123, 147, 147, 147,
+    147, 147, 123, 129, 147, 147, 147, 147, 147, 162, 147, 123, 147, 153, 154,
+    147, 123, 123, 147, 123, 147, 123, 162, 147, 123, 162, 155, 147, 123, 129,
+    154, 127, 162, 123, 162, 123, 147, 147, 161, 162, 154, 153, 161, 123, 129,
+    147, 161, 162, 147, 147, 147, 154, 154, 147, 151, 123, 162, 153, 126, 123,
+    129, 162, 123, 126, 123, 162, 162, 147, 129, 147, 147, 147, 162, 123, 162,
+    123, 162, 162, 147, 147, 162, 123, 162, 147, 161, 161, 162, 161, 123, 123,
+    123, 123, 162, 162, 147, 155, 162, 147, 147, 162, 147, 123, 123, 155, 162,
+    123, 126, 147, 153, 123, 147, 147, 147, 161, 123, 161, 161, 147, 147, 162,
+    154, 147, 154, 162, 147, 162, 147, 162, 162, 151, 151, 147, 162, 162, 162,
+    123, 123, 147, 129, 123, 123, 153, 155, 127, 162, 123, 162, 154, 162, 154,
+    147, 123, 147, 123, 154, 147, 162, 155, 123, 123, 162, 123, 147, 161, 129,
+    129, 129, 129, 161, 123, 154, 155, 151, 147, 154, 154, 162, 147, 126, 129,
+    126, 162, 147, 147, 162, 154, 154, 147, 147, 155, 147, 127, 123, 151, 162,
+    123, 123, 147, 147, 162, 162, 154, 153, 123, 123, 123, 162, 123, 147, 147,
+    126, 123, 123, 154, 123, 151, 154, 147, 154, 147, 147, 147, 147, 123, 147,
+    123, 123, 147, 123, 123, 123, 154, 123, 147, 162, 153, 155, 162, 162, 147,
+    123, 162, 147, 147, 154, 147, 147, 123, 123, 162, 162, 155, 162, 123, 162,
+    126, 153, 155, 123, 147, 147, 162, 162, 126, 162, 147, 123, 123, 162, 123,
+    162, 127, 162, 129, 126, 129, 129, 147, 147, 162, 147, 155, 162, 123, 147,
+    155, 147, 162, 162, 162, 162, 123, 162, 123, 147, 162, 147, 123, 153, 147,
+    123, 162, 147, 162, 162, 123, 155, 123, 147, 155, 153, 147, 162, 123, 162,
+    123, 162, 153, 147, 147, 125, 162, 147, 147, 151, 147, 162, 123, 162, 155,
+    147, 162, 123, 162, 162, 129, 147, 153, 161, 147, 155, 162, 147, 153, 123,
+    147, 147, 153, 147, 147, 147, 153, 162, 162, 162, 157, 162, 162, 123, 123,
+    147, 161, 155, 162, 147, 155, 162, 161, 147, 129, 153, 126, 126, 126, 129,
+    123, 129, 129, 129, 129, 129, 129, 147, 129, 129, 123, 129, 151, 162, 147,
+    123, 162, 162, 147, 123, 147, 147, 147, 155, 126, 147, 162, 162, 162, 162,
+    161, 155, 161, 123, 162, 155, 129, 147, 155, 153, 162, 147, 162, 162, 126,
+    162, 162, 129, 123, 123, 123, 126, 123, 123, 126, 153, 123, 126, 147, 162,
+    147, 161, 123, 162, 155, 147, 123, 147, 147, 147, 147, 126, 123, 162, 147,
+    147, 147, 162, 154, 123, 147, 162, 123, 123, 123, 153, 147, 154, 123, 154,
+    129, 123, 129, 147, 154, 125, 153, 147, 153, 162, 153, 162, 147, 162, 147,
+    126, 147, 147, 162, 147, 153, 162, 147, 154, 162, 123, 162, 123, 147, 147,
+    147, 154, 154, 161, 147, 147, 153, 162, 147, 147, 153, 123, 147, 161, 153,
+    162, 162, 153, 155, 147, 162, 147, 147, 147, 123, 147, 123, 126, 126, 126,
+    126, 123, 123, 129, 147, 147, 155, 123, 147, 147, 123, 123, 147, 147, 154,
+    147, 147, 123, 147, 147, 123, 147, 147, 154, 162, 127, 147, 157, 147, 154,
+    162, 147, 153, 161, 162, 147, 129, 126, 161, 147, 129, 123, 155, 129, 129,
+    129, 126, 123, 123, 155, 153, 123, 147, 153, 123, 147, 161, 162, 147, 147,
+    161, 147, 147, 162, 162, 123, 147, 123, 123, 162, 147, 154, 147, 123, 147,
+    126, 123, 147, 161, 154, 162, 154, 161, 147, 162, 123, 123, 153, 155, 123,
+    123, 123, 126, 153, 123, 129, 123, 126, 126, 129, 147, 147, 154, 123, 147,
+    153, 147, 147, 147, 147, 162, 153, 126, 147, 123, 147, 123, 151, 126, 154,
+    153, 147, 147, 162, 155, 154, 123, 153, 123, 147, 154, 162, 147, 147, 123,
+    123, 162, 147, 153, 161, 154, 147, 123, 154, 123, 147, 147, 147, 155, 147,
+    125, 125, 147, 147, 147, 123, 162, 162, 147, 155, 123, 147, 147, 154, 162,
+    147, 123, 147, 162, 147, 123, 147, 123, 151, 147, 123, 147, 154, 162, 123,
+    161, 155, 147, 147, 147, 147, 147, 162, 123, 123, 147, 147, 154, 147, 147,
+    147, 123, 126, 154, 154, 123, 147, 147, 147, 147, 123, 123, 147, 147, 147,
+    123, 147, 147, 153, 123, 154, 123, 123, 123, 123, 123, 147, 154, 154, 147,
+    147, 153, 153, 147, 123, 147, 147, 154, 126, 123, 123, 147, 147, 154, 147,
+    125, 123, 123, 147, 147, 147, 154, 147, 123, 123, 154, 147, 147, 147, 147,
+    123, 123, 153, 147, 126, 123, 147, 147, 161, 123, 147, 157, 162, 147, 161,
+    147, 147, 162, 147, 154, 123, 154, 147, 123, 126, 153, 147, 147, 123, 123,
+    161, 123, 153, 147, 123, 147, 154, 153, 129, 155, 162, 162, 123, 162, 129,
+    147, 162, 162, 143, 147, 161, 147, 147, 123, 147, 129, 129, 147, 153, 162,
+    147, 154, 147, 129, 155, 123, 123, 154, 147, 153, 139, 129, 147, 147, 162,
+    154, 147, 147, 147, 147, 162, 147, 162, 126, 157, 147, 123, 162, 162, 162,
+    129, 162, 157, 154, 129, 147, 162, 147, 123, 147, 126, 147, 147, 147, 147,
+    147, 155, 155, 129, 154, 147, 123, 147, 147, 155, 123, 162, 155, 162, 123,
+    162, 161, 155, 155, 126, 155, 155, 155, 161, 123, 147, 123, 155, 162, 162,
+    162, 147, 123, 123, 155, 129, 123, 155, 155, 147, 147, 147, 154, 147, 162,
+    123, 147, 123, 155, 162, 123, 162, 123, 147, 154, 155, 161, 162, 162, 162,
+    147, 162, 162, 162, 147, 157, 162, 151, 162, 155, 147, 147, 162, 153, 147,
+    155, 162, 123, 154, 162, 157, 151, 154, 123, 147, 162, 154, 162, 147, 147,
+    123, 129, 147, 154, 151, 147, 162, 161, 147, 147, 123, 162, 162, 147, 162,
+    147, 123, 147, 155, 147, 147, 162, 155, 162, 155, 162, 123, 153, 153, 162,
+    147, 153, 155, 123, 147, 155, 123, 147, 161, 123, 123, 155, 147, 147, 147,
+    162, 162, 147, 155, 147, 147, 151, 161, 123, 123, 123, 147, 162, 147, 162,
+    155, 162, 123, 147, 162, 153, 147, 162, 147, 129, 126, 143, 129, 129, 129,
+    123, 129, 129, 123, 129, 129, 129, 123, 129, 129, 129, 129, 123, 123, 123,
+    147, 162, 162, 147, 162, 123, 155, 147, 147, 123, 155, 147, 147, 162, 147,
+    154, 162, 157, 147, 147, 162, 151, 162, 123, 147, 157, 147, 162, 155, 162,
+    153, 147, 147, 126, 123, 143, 126, 129, 129, 129, 162, 123, 147, 125, 157,
+    162, 162, 162, 147, 147, 147, 162, 161, 147, 123, 154, 147, 162, 153, 147,
+    147, 153, 155, 147, 162, 162, 151, 147, 147, 155, 162, 147, 147, 123, 123,
+    147, 123, 161, 123, 126, 126, 126, 143, 126, 129, 129, 129, 123, 129, 129,
+    123, 126, 129, 126, 129, 139, 123, 154, 162, 154, 147, 161, 123, 154, 147,
+    147, 123, 162, 157, 147, 147, 147, 123, 147, 154, 147, 123, 162, 161, 147,
+    147, 147, 147, 155, 155, 147, 162, 123, 162, 147, 147, 162, 154, 147, 151,
+    162, 126, 123, 126, 129, 123, 129, 129, 123, 147, 155, 123, 123, 126, 147,
+    147, 161, 162, 123, 147, 147, 147, 123, 154, 147, 161, 147, 123, 147, 162,
+    154, 147, 162, 147, 155, 162, 147, 154, 154, 147, 155, 147, 154, 147, 162,
+    154, 147, 151, 155, 147, 162, 147, 162, 162, 161, 147, 129, 147, 147, 129,
+    147, 147, 126, 143, 129, 147, 154, 162, 147, 147, 147, 162, 147, 147, 161,
+    147, 123, 123, 147, 147, 162, 123, 127, 147, 161, 162, 162, 147, 123, 147,
+    147, 147, 123, 147, 123, 147, 147, 147, 154, 123, 147, 147, 126, 129, 129,
+    123, 123, 123, 129, 123, 129, 147, 147, 147, 151, 147, 147, 154, 147, 123,
+    151, 162, 123, 151, 154, 161, 147, 157, 154, 153, 127, 153, 123, 162, 147,
+    153, 147, 162, 155, 147, 147, 155, 157, 162, 123, 151, 126, 147, 147, 151,
+    147, 147, 154, 123, 123, 123, 123, 129, 147, 147, 147, 162, 154, 162, 154,
+    147, 123, 153, 147, 147, 155, 151, 147, 147, 147, 147, 147, 123, 129, 129,
+    147, 153, 154, 123, 123, 153, 123, 125, 153, 147, 147, 155, 154, 147, 154,
+    123, 123, 147, 154, 151, 153, 123, 154, 147, 154, 147, 147, 147, 154, 123,
+    162, 123, 123, 147, 154, 147, 147, 154, 147, 162, 162, 151, 154, 127, 154,
+    147, 147, 147, 147, 147, 147, 147, 123, 147, 147, 147, 147, 162, 123, 123,
+    129, 125, 154, 147, 123, 123, 147, 147, 147, 154, 123, 147, 147, 123, 151,
+    155, 147, 129, 147, 147, 147, 147, 162, 147, 123, 123, 143, 162, 147, 123,
+    123, 162, 123, 123, 147, 162, 147, 155, 155, 155, 123, 151, 162, 151, 123,
+    129, 129, 123, 147, 129, 129, 129, 129, 123, 147, 147, 147, 162, 123, 155,
+    154, 147, 147, 147, 154, 123, 147, 147, 147, 147, 147, 147, 147, 157, 162,
+    147, 129, 147, 154, 147, 162, 147, 123, 147, 123, 154, 123, 147, 123, 123,
+    162, 155, 147, 151, 147, 147, 126, 155, 123, 123, 155, 126, 129, 129, 147,
+    129, 162, 162, 147, 153, 123, 151, 147, 123, 147, 147, 147, 147, 155, 153,
+    154, 123, 154, 157, 147, 162, 147, 162, 147, 151, 123, 147, 147, 147, 126,
+    154, 123, 147, 154, 147, 123, 162, 147, 157, 147, 147, 147, 147, 123, 162,
+    147, 147, 147, 126, 151, 162, 123, 123, 123, 123, 162, 147, 123, 151, 123,
+    162, 126, 147, 147, 129, 162, 147, 147, 147, 147, 147, 162, 147, 154, 147,
+    162, 147, 147, 147, 147, 154, 154, 147, 147, 123, 123, 162, 147, 154, 123,
+    154, 123, 162, 162, 147, 126, 147, 147, 147, 147, 147, 147, 123, 154, 125,
+    147, 147, 147, 123, 147, 162, 147, 123, 123, 147, 123, 147, 153, 147, 123,
+    154, 123, 123, 147, 147, 147, 123, 123, 123, 147, 147, 154, 123, 155, 147,
+    147, 154, 147, 147, 123, 147, 123, 154, 162, 162, 147, 147, 153, 162, 129,
+    123, 147, 123, 123, 162, 147, 123, 147, 155, 147, 154, 162, 147, 162, 123,
+    162, 147, 162, 162, 162, 153, 123, 155, 147, 147, 126, 147, 147, 129, 155,
+    147, 155, 147, 129, 147, 147, 161, 147, 123, 147, 153, 147, 147, 123, 147,
+    147, 123, 147, 147, 129, 151, 155, 162, 161, 162, 147, 153, 123, 129, 147,
+    147, 147, 147, 129, 162, 123, 162, 147, 161, 123, 147, 123, 147, 162, 147,
+    162, 147, 126, 147, 123, 129, 147, 147, 155, 123, 129, 123, 123, 123, 147,
+    147, 123, 162, 147, 147, 123, 129, 147, 123, 147, 147, 155, 123, 129, 162,
+    161, 147, 147, 123, 162, 162, 162, 155, 126, 147, 123, 147, 147, 154, 154,
+    123, 123, 123, 147, 147, 123, 147, 155, 153, 126, 157, 147, 157, 123, 123,
+    123, 123, 162, 147, 147, 147, 147, 123, 147, 147, 147, 147, 147, 147, 147,
+    162, 147, 151, 162, 147, 162, 147, 162, 123, 123, 157, 123, 123, 129, 147,
+    147, 151, 147, 162, 151, 125, 123, 123, 129, 147, 147, 123, 157, 162, 123,
+    162, 147, 123, 147, 147, 147, 161, 162, 162, 147, 151, 162, 153, 157, 129,
+    129, 153, 147, 147, 147, 154, 147, 147, 157, 147, 147, 147, 151, 162, 123,
+    147, 151, 123, 162, 147, 162, 162, 154, 147, 162, 155, 147, 147, 147, 123,
+    129, 129, 123, 123, 125, 123, 147, 147, 147, 123, 123, 155, 157, 123, 147,
+    123, 123, 151, 162, 147, 125, 151, 123, 147, 147, 123, 147, 147, 151, 123,
+    147, 147, 147, 147, 147, 147, 147, 147, 162, 123, 157, 123, 162, 162, 162,
+    162, 147, 162, 162, 155, 155, 151, 162, 123, 147, 147, 157, 147, 154, 147,
+    162, 123, 123, 129, 123, 155, 123, 147, 123, 147, 147, 123, 147, 151, 123,
+    147, 123, 157, 123, 162, 154, 147, 147, 147, 147, 123, 147, 125, 123, 147,
+    123, 154, 147, 123, 123, 123, 154, 123, 123, 129, 123, 154, 147, 147, 147,
+    151, 147, 151, 147, 162, 147, 155, 147, 147, 127, 147, 153, 162, 126, 123,
+    147, 147, 123, 123, 147, 153, 161, 153, 155, 147, 162, 147, 161, 147, 154,
+    147, 147, 162, 129, 162, 125, 161, 147, 153, 162, 155, 123, 123, 123, 126,
+    129, 126, 151, 155, 126, 153, 161, 162, 153, 155, 162, 123, 127, 123, 125,
+    162, 123, 123, 123, 123, 162, 161, 162, 162, 154, 123, 147, 147, 123, 126,
+    129, 147, 123, 162, 154, 123, 126, 154, 162, 147, 123, 154, 162, 147, 162,
+    155, 123, 161, 147, 129, 129, 147, 155, 161, 123, 123, 162, 147, 129, 147,
+    147, 162, 143, 155, 162, 123, 162, 129, 129, 161, 147, 147, 162, 147, 147,
+    147, 147, 162, 123, 162, 162, 129, 147, 162, 154, 147, 162, 123, 147, 161,
+    147, 157, 161, 147, 155, 123, 129, 123, 123, 147, 153, 155, 153, 155, 154,
+    123, 147, 155, 147, 123, 147, 147, 155, 147, 129, 129, 157, 147, 155, 147,
+    147, 147, 162, 129, 123, 154, 155, 123, 123, 153, 153, 153, 147, 123, 123,
+    162, 129, 125, 147, 147, 147, 154, 147, 129, 123, 162, 147, 153, 147, 147,
+    123, 161, 123, 129, 147, 126, 147, 161, 126, 162, 123, 162, 162, 161, 147,
+    147, 161, 123, 123, 162, 147, 154, 129, 147, 162, 123, 147, 161, 123, 123,
+    161, 153, 153, 153, 147, 153, 123, 123, 123, 162, 154, 147, 155, 162, 123,
+    162, 147, 162, 123, 147, 161, 155, 129, 129, 129, 162, 147, 155, 123, 144,
+    143, 129, 123, 147, 162, 154, 147, 154, 162, 123, 162, 123, 147, 162, 147,
+    123, 161, 162, 162, 147, 162, 126, 129, 123, 123, 147, 147, 147, 147, 123,
+    147, 123, 123, 123, 155, 155, 153, 123, 147, 154, 161, 162, 129, 123, 129,
+    147, 147, 153, 161, 123, 123, 147, 147, 147, 151, 147, 147, 129, 129, 147,
+    123, 147, 147, 147, 123, 147, 147, 161, 162, 147, 123, 147, 147, 155, 147,
+    147, 147, 155, 155, 123, 147, 147, 147, 123, 154, 155, 155, 161, 147, 123,
+    162, 129, 123, 123, 147, 123, 147, 123, 147, 147, 147, 147, 147, 154, 155,
+    123, 123, 147, 123, 147, 147, 123, 153, 123, 147, 147, 123, 147, 161, 147,
+    147, 147, 123, 123, 147, 147, 147, 123, 162, 147, 147, 153, 162, 162, 123,
+    147, 123, 129, 129, 162, 147, 123, 147, 147, 123, 123, 155, 123, 123, 161,
+    155, 147, 147, 147, 155, 162, 147, 161, 126, 129, 129, 129, 123, 129, 123,
+    129, 155, 123, 155, 129, 123, 123, 147, 123, 162, 123, 129, 147, 147, 147,
+    123, 155, 147, 161, 125, 155, 123, 155, 123, 123, 129, 129, 129, 123, 123,
+    123, 123, 147, 162, 147, 123, 147, 154, 123, 147, 147, 147, 153, 162, 123,
+    155, 123, 123, 162, 144, 162, 147, 123, 162, 123, 161, 147, 153, 147, 162,
+    155, 147, 161, 129, 129, 123, 147, 155, 123, 162, 123, 147, 147, 162, 126,
+    147, 147, 155, 162, 162, 147, 147, 151, 147, 162, 153, 123, 147, 161, 155,
+    123, 147, 123, 129, 153, 147, 123, 147, 147, 147, 123, 162, 147, 123, 147,
+    155, 123, 126, 123, 147, 123, 123, 147, 123, 154, 123, 147, 153, 153, 155,
+    147, 123, 125, 147, 123, 153, 123, 147, 147, 147, 155, 123, 162, 162, 147,
+    123, 147, 147, 155, 154, 162, 162, 147, 147, 147, 123, 123, 147, 154, 147,
+    147, 161, 147, 153, 162, 162, 123, 123, 162, 157, 157, 162, 162, 161, 161,
+    162, 147, 123, 143, 143, 147, 123, 147, 123, 161, 147, 123, 154, 154, 162,
+    147, 125, 147, 147, 153, 147, 147, 147, 147, 123, 155, 153, 147, 153, 123,
+    123, 162, 162, 123, 129, 123, 147, 155, 123, 147, 162, 125, 162, 147, 155,
+    147, 147, 123, 162, 162, 123, 147, 162, 147, 123, 162, 123, 123, 123, 147,
+    147, 147, 162, 162, 123, 155, 155, 147, 151, 129, 123, 154, 123, 147, 162,
+    147, 162, 143, 123, 147, 147, 147, 147, 162, 147, 123, 162, 153, 154, 162,
+    147, 154, 123, 155, 154, 154, 123, 126, 126, 147, 123, 162, 147, 147, 127,
+    147, 147, 147, 154, 154, 126, 126, 129, 123, 123, 147, 123, 147, 162, 147,
+    123, 147, 147, 147, 123, 123, 147, 155, 162, 123, 143, 162, 147, 155, 147,
+    162, 147, 147, 147, 147, 129, 123, 147, 147, 129, 162, 127, 147, 162, 161,
+    161, 162, 147, 123, 123, 129, 129, 147, 162, 147, 147, 123, 126, 154, 154,
+    123, 154, 126, 123, 154, 162, 123, 126, 123, 126, 123, 153, 126, 126, 123,
+    126, 129, 125, 147, 162, 126, 123, 126, 127, 129, 162, 147, 147, 126, 129,
+    161, 147, 161, 123, 161, 147, 161, 143, 123, 123, 147, 162, 147, 162, 147,
+    147, 129, 129, 123, 123, 153, 162, 147, 162, 123, 147, 162, 123, 147, 123,
+    123, 123, 147, 161, 154, 155, 153, 162, 147, 162, 162, 154, 147, 162, 162,
+    162, 162, 123, 162, 123, 162, 123, 155, 123, 129, 129, 123, 143, 123, 123,
+    129, 123, 147, 123, 147, 155, 126, 154, 147, 123, 147, 154, 147, 161, 147,
+    154, 155, 147, 126, 123, 162, 162, 147, 162, 153, 153, 127, 147, 161, 162,
+    126, 126, 154, 162, 123, 123, 154, 123, 162, 162, 123, 154, 147, 153, 161,
+    123, 147, 126, 123, 129, 125, 129, 147, 147, 123, 123, 147, 155, 155, 147,
+    147, 161, 147, 147, 153, 147, 147, 147, 123, 147, 147, 162, 123, 147, 147,
+    155, 155, 153, 147, 155, 147, 153, 127, 126, 126, 147, 129, 126, 123, 147,
+    123, 123, 147, 147, 151, 161, 161, 129, 123, 154, 123, 147, 123, 147, 147,
+    147, 147, 123, 154, 162, 123, 126, 153, 123, 123, 147, 153, 123, 126, 147,
+    126, 147, 147, 147, 147, 123, 123, 153, 147, 153, 126, 127, 147, 147, 123,
+    123, 147, 162, 147, 126, 147, 153, 123, 123, 126, 155, 162, 123, 147, 162,
+    147, 162, 162, 123, 123, 126, 129, 129, 155, 162, 126, 129, 126, 123, 123,
+    161, 123, 129, 155, 123, 162, 147, 155, 129, 153, 123, 147, 147, 153, 123,
+    147, 155, 162, 155, 126, 155, 123, 123, 161, 147, 154, 162, 154, 147, 154,
+    147, 154, 154, 154, 151, 151, 147, 162, 154, 147, 154, 147, 147, 154, 147,
+    147, 147, 154, 153, 147, 154, 154, 154, 154, 154, 153, 147, 147, 147, 147,
+    147, 154, 154, 154, 154, 154, 147, 126, 123, 147, 126, 126, 123, 153, 153,
+    154, 147, 147, 147, 147, 147, 153, 123, 147, 123, 123, 153, 153, 123, 154,
+    147, 147, 147, 123, 147, 147, 147, 147, 123, 147, 126, 123, 123, 147, 147,
+    151, 154, 123, 147, 147, 154, 147, 123, 147, 123, 123, 126, 126, 126, 154,
+    147, 147, 153, 147, 147, 147, 123, 147, 147, 147, 154, 123, 147, 154, 154,
+    147, 123, 147, 126, 123, 126, 153, 123, 123, 126, 127, 147, 154, 147, 154,
+    147, 126, 154, 154, 147, 123, 126, 123, 147, 126, 126, 123, 123, 147, 154,
+    154, 153, 147, 147, 147, 147, 147, 147, 153, 147, 147, 151, 147, 147, 123,
+    123, 147, 154, 147, 151, 154, 154, 147, 162, 147, 154, 147, 147, 154, 157,
+    147, 147, 126, 126, 147, 126, 123, 123, 147, 147, 154, 147, 154, 154, 153,
+    147, 147, 153, 153, 123, 147, 126, 154, 147, 147, 147, 162, 126, 123, 123,
+    147, 147, 153, 126, 153, 147, 154, 147, 126, 154, 126, 147, 126, 154, 153,
+    147, 154, 147, 151, 147, 147, 162, 154, 123, 123, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 123,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129,
+    123, 123, 129, 147, 155, 161, 123, 126, 147, 123, 147, 147, 154, 153, 126,
+    147, 162, 161, 123, 123, 162, 162, 123, 129, 161, 123, 129, 147, 147, 147,
+    147, 161, 123, 129, 126, 153, 123, 154, 153, 153, 154, 147, 162, 147, 162,
+    147, 162, 147, 123, 147, 147, 123, 162, 147, 147, 123, 123, 123, 162, 147,
+    147, 161, 162, 129, 147, 162, 147, 147, 123, 162, 126, 147, 123, 147, 162,
+    147, 162, 147, 157, 147, 147, 147, 154, 123, 162, 162, 123, 147, 129, 123,
+    123, 147, 147, 123, 147, 157, 162, 162, 123, 162, 161, 162, 162, 147, 123,
+    125, 123, 161, 162, 155, 147, 147, 162, 147, 161, 123, 155, 162, 155, 162,
+    162, 161, 123, 147, 161, 123, 147, 147, 123, 123, 129, 157, 123, 123, 162,
+    147, 147, 123, 162, 129, 129, 129, 123, 147, 147, 147, 161, 123, 129, 123,
+    154, 123, 162, 123, 162, 123, 147, 147, 154, 126, 129, 123, 147, 129, 162,
+    154, 162, 162, 123, 162, 147, 162, 162, 123, 123, 147, 147, 123, 147, 161,
+    123, 147, 162, 123, 161, 147, 161, 162, 155, 162, 123, 129, 129, 129, 155,
+    162, 162, 147, 143, 147, 147, 147, 147, 123, 162, 155, 162, 147, 147, 147,
+    123, 123, 147, 147, 161, 155, 147, 161, 162, 162, 155, 161, 162, 123, 147,
+    147, 162, 123, 123, 154, 162, 127, 154, 143, 162, 123, 123, 129, 129, 129,
+    129, 129, 129, 129, 129, 147, 155, 123, 157, 147, 144, 154, 123, 147, 155,
+    147, 123, 123, 123, 147, 147, 123, 161, 147, 129, 123, 155, 162, 155, 147,
+    154, 147, 162, 162, 147, 161, 162, 162, 123, 123, 123, 129, 129, 147, 147,
+    123, 147, 126, 162, 123, 161, 153, 123, 123, 147, 147, 162, 147, 162, 147,
+    147, 147, 123, 162, 123, 129, 123, 126, 123, 153, 123, 147, 155, 147, 154,
+    155, 162, 162, 147, 147, 162, 129, 162, 155, 147, 147, 162, 147, 126, 153,
+    155, 123, 155, 154, 123, 147, 147, 153, 147, 126, 123, 147, 123, 147, 154,
+    153, 153, 147, 123, 147, 147, 154, 155, 161, 161, 123, 155, 162, 129, 154,
+    154, 153, 154, 147, 162, 162, 126, 123, 161, 147, 162, 123, 155, 147, 153,
+    126, 126, 123, 123, 162, 162, 147, 162, 162, 154, 123, 147, 123, 155, 151,
+    123, 162, 123, 155, 123, 155, 123, 123, 147, 155, 147, 147, 147, 147, 123,
+    147, 147, 147, 161, 154, 161, 147, 147, 126, 147, 161, 147, 123, 129, 147,
+    155, 147, 123, 147, 129, 123, 155, 162, 123, 162, 157, 155, 147, 155, 162,
+    147, 147, 123, 123, 129, 155, 162, 151, 147, 129, 162, 147, 162, 147, 129,
+    147, 147, 129, 126, 123, 129, 129, 123, 129, 129, 129, 129, 129, 129, 123,
+    162, 162, 161, 162, 157, 147, 162, 129, 153, 123, 162, 161, 123, 162, 162,
+    147, 162, 162, 162, 162, 162, 161, 155, 155, 162, 123, 123, 155, 147, 143,
+    129, 123, 129, 123, 123, 129, 129, 153, 162, 126, 147, 129, 155, 161, 123,
+    147, 123, 162, 147, 147, 155, 147, 153, 129, 157, 147, 162, 154, 147, 147,
+    147, 147, 162, 161, 157, 162, 147, 155, 123, 147, 123, 126, 123, 129, 129,
+    129, 123, 129, 129, 123, 147, 123, 147, 123, 143, 155, 153, 147, 162, 154,
+    147, 147, 147, 162, 147, 147, 123, 155, 161, 147, 147, 154, 147, 157, 147,
+    153, 155, 129, 147, 162, 126, 155, 162, 147, 147, 147, 162, 147, 161, 147,
+    151, 162, 147, 162, 147, 153, 155, 123, 147, 123, 127, 155, 147, 162, 147,
+    161, 147, 123, 147, 162, 155, 147, 161, 123, 155, 123, 162, 162, 123, 155,
+    153, 123, 147, 151, 161, 162, 162, 162, 155, 147, 155, 147, 153, 123, 123,
+    147, 123, 129, 123, 123, 147, 129, 129, 123, 123, 147, 123, 147, 147, 147,
+    147, 161, 147, 126, 154, 123, 147, 147, 147, 153, 123, 147, 155, 147, 123,
+    147, 123, 147, 162, 123, 155, 155, 162, 129, 147, 147, 147, 123, 123, 161,
+    123, 126, 123, 147, 129, 129, 129, 123, 143, 129, 147, 155, 147, 154, 147,
+    123, 123, 154, 123, 123, 155, 147, 162, 147, 147, 162, 147, 147, 153, 151,
+    161, 151, 123, 162, 147, 154, 147, 123, 162, 161, 154, 147, 162, 147, 147,
+    161, 162, 147, 155, 147, 123, 161, 147, 123, 126, 127, 147, 126, 129, 123,
+    129, 153, 123, 147, 123, 123, 147, 153, 147, 147, 147, 147, 147, 155, 147,
+    147, 147, 123, 162, 147, 162, 154, 153, 147, 162, 154, 147, 162, 123, 147,
+    147, 151, 161, 153, 154, 147, 162, 147, 147, 147, 147, 161, 162, 161, 126,
+    147, 147, 154, 123, 123, 147, 123, 154, 147, 153, 155, 153, 153, 162, 126,
+    147, 123, 147, 155, 123, 153, 147, 147, 147, 162, 155, 147, 162, 153, 147,
+    153, 147, 147, 147, 147, 157, 153, 154, 123, 123, 154, 147, 147, 126, 147,
+    153, 147, 162, 161, 147, 147, 147, 147, 144, 147, 147, 147, 147, 147, 147,
+    147, 162, 123, 147, 123, 154, 151, 162, 161, 147, 147, 129, 123, 162, 123,
+    147, 147, 147, 147, 123, 162, 154, 147, 147, 147, 147, 127, 123, 147, 155,
+    154, 154, 123, 147, 154, 153, 147, 147, 123, 123, 123, 155, 123, 126, 123,
+    123, 144, 154, 147, 147, 154, 147, 147, 123, 147, 147, 147, 123, 123, 147,
+    123, 123, 147, 147, 147, 123, 123, 147, 147, 161, 162, 129, 162, 129, 147,
+    147, 162, 154, 147, 123, 123, 147, 143, 151, 154, 123, 162, 154, 129, 129,
+    129, 123, 123, 147, 147, 147, 123, 123, 162, 161, 162, 155, 147, 123, 147,
+    147, 123, 162, 147, 161, 147, 147, 147, 147, 147, 123, 155, 155, 147, 123,
+    155, 147, 147, 147, 161, 147, 161, 162, 147, 161, 129, 162, 147, 126, 143,
+    129, 155, 155, 123, 147, 162, 123, 147, 147, 155, 162, 147, 162, 147, 147,
+    161, 162, 162, 147, 162, 162, 147, 147, 153, 155, 162, 161, 161, 147, 147,
+    161, 147, 123, 123, 153, 161, 155, 123, 129, 123, 129, 162, 147, 162, 147,
+    162, 123, 155, 123, 147, 147, 147, 147, 123, 123, 147, 129, 129, 143, 123,
+    126, 161, 147, 162, 147, 147, 147, 147, 161, 147, 154, 147, 162, 147, 161,
+    147, 147, 147, 147, 147, 154, 123, 147, 162, 155, 147, 155, 123, 147, 155,
+    147, 123, 129, 123, 162, 123, 147, 147, 147, 147, 155, 147, 123, 147, 155,
+    147, 123, 147, 147, 147, 147, 147, 162, 161, 123, 147, 147, 154, 147, 161,
+    126, 147, 147, 155, 161, 147, 123, 123, 123, 126, 155, 161, 155, 147, 123,
+    123, 147, 147, 147, 123, 155, 147, 147, 147, 147, 147, 147, 147, 155, 123,
+    154, 147, 126, 147, 147, 155, 147, 147, 153, 126, 126, 147, 153, 123, 155,
+    147, 161, 161, 147, 123, 147, 123, 155, 147, 147, 123, 151, 162, 147, 126,
+    147, 161, 129, 127, 123, 147, 123, 147, 147, 162, 162, 147, 123, 123, 123,
+    154, 154, 129, 147, 147, 162, 123, 162, 147, 154, 123, 154, 126, 123, 147,
+    162, 162, 147, 155, 129, 123, 123, 162, 147, 123, 162, 147, 162, 147, 123,
+    123, 147, 162, 147, 123, 147, 162, 154, 147, 153, 147, 147, 129, 123, 154,
+    147, 147, 162, 162, 126, 126, 143, 129, 123, 123, 155, 147, 147, 147, 147,
+    155, 154, 147, 123, 155, 123, 162, 162, 147, 147, 161, 162, 147, 147, 154,
+    154, 147, 162, 147, 147, 161, 123, 126, 147, 147, 154, 123, 147, 161, 147,
+    153, 123, 147, 123, 162, 147, 162, 162, 147, 147, 147, 147, 151, 157, 155,
+    129, 126, 126, 153, 147, 123, 162, 147, 126, 162, 123, 147, 123, 123, 147,
+    123, 147, 153, 126, 123, 147, 147, 147, 147, 147, 123, 123, 153, 147, 147,
+    147, 147, 147, 147, 147, 161, 162, 123, 162, 147, 162, 123, 147, 162, 127,
+    153, 123, 126, 154, 123, 123, 123, 154, 123, 123, 123, 154, 123, 147, 154,
+    153, 153, 123, 126, 147, 147, 147, 147, 147, 154, 129, 129, 123, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 162, 147, 147,
+    147, 155, 123, 123, 147, 161, 147, 161, 153, 129, 147, 162, 123, 154, 154,
+    147, 123, 123, 155, 154, 123, 154, 123, 154, 123, 154, 147, 153, 147, 153,
+    154, 123, 147, 154, 154, 154, 123, 123, 154, 123, 154, 147, 154, 147, 153,
+    123, 123, 147, 147, 153, 123, 161, 123, 147, 123, 147, 147, 147, 147, 154,
+    153, 153, 123, 154, 154, 147, 147, 147, 147, 123, 154, 123, 123, 154, 123,
+    123, 147, 153, 147, 153, 154, 147, 154, 123, 143, 129, 147, 154, 154, 123,
+    147, 123, 153, 147, 162, 123, 154, 147, 123, 154, 147, 153, 123, 123, 123,
+    154, 123, 147, 123, 154, 147, 154, 147, 147, 154, 147, 147, 123, 154, 126,
+    154, 123, 154, 123, 147, 154, 147, 147, 147, 154, 147, 147, 147, 126, 154,
+    154, 147, 153, 153, 154, 154, 154, 123, 154, 147, 147, 161, 147, 123, 147,
+    147, 126, 147, 154, 147, 154, 147, 147, 147, 154, 147, 154, 154, 147, 154,
+    154, 154, 147, 154, 147, 123, 147, 154, 147, 123, 123, 147, 147, 147, 147,
+    154, 147, 147, 126, 123, 154, 154, 147, 147, 147, 153, 147, 147, 153, 147,
+    154, 147, 154, 126, 154, 147, 123, 153, 154, 123, 147, 126, 147, 147, 147,
+    123, 147, 123, 154, 147, 153, 123, 153, 123, 127, 123, 154, 154, 147, 147,
+    154, 123, 147, 153, 154, 123, 147, 123, 147, 147, 129, 129, 129, 129, 129,
+    129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 123,
+    162, 147, 147, 123, 147, 162, 155, 154, 155, 154, 147, 162, 147, 153, 147,
+    153, 123, 123, 123, 147, 162, 147, 147, 123, 123, 162, 123, 147, 147, 123,
+    147, 147, 147, 162, 123, 147, 161, 147, 123, 123, 161, 162, 123, 162, 153,
+    126, 147, 147, 147, 147, 147, 161, 147, 123, 147, 161, 147, 147, 123, 147,
+    154, 154, 123, 154, 154, 154, 154, 154, 147, 123, 154, 154, 123, 154, 123,
+    147, 126, 126, 147, 123, 154, 147, 154, 123, 147, 123, 147, 123, 147, 154,
+    126, 154, 147, 154, 147, 147, 123, 147, 123, 154, 154, 147, 154, 154, 147,
+    154, 126, 123, 154, 123, 153, 153, 123, 126, 154, 153, 147, 154, 147, 123,
+    147, 123, 147, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 123, 129, 129, 129, 129,
+    123, 129, 129, 129, 129, 129, 129, 129, 123, 147, 161, 123, 123, 155, 162,
+    123, 123, 123, 147, 162, 129, 147, 147, 147, 147, 147, 155, 147, 147, 155,
+    147, 147, 123, 123, 154, 123, 147, 147, 123, 123, 155, 123, 147, 153, 129,
+    129, 147, 157, 147, 147, 123, 123, 162, 162, 147, 155, 162, 147, 155, 123,
+    147, 123, 147, 161, 155, 147, 147, 161, 162, 147, 162, 129, 161, 147, 123,
+    147, 147, 147, 155, 147, 147, 126, 161, 162, 123, 129, 147, 123, 162, 154,
+    147, 147, 147, 155, 147, 147, 147, 147, 147, 147, 147, 147, 161, 162, 161,
+    155, 155, 162, 123, 162, 147, 123, 162, 162, 162, 162, 155, 153, 147, 147,
+    123, 153, 129, 129, 147, 147, 153, 147, 147, 123, 162, 147, 147, 147, 147,
+    147, 154, 123, 162, 147, 123, 153, 161, 147, 162, 147, 147, 154, 153, 147,
+    154, 147, 129, 155, 153, 147, 153, 161, 147, 147, 147, 147, 126, 147, 123,
+    129, 147, 155, 147, 151, 123, 147, 123, 123, 126, 126, 123, 126, 147, 154,
+    154, 154, 154, 129, 153, 123, 147, 154, 147, 147, 123, 123, 147, 147, 123,
+    123, 153, 147, 147, 147, 154, 147, 147, 147, 154, 123, 154, 147, 147, 147,
+    154, 153, 147, 126, 147, 147, 123, 147, 147, 154, 154, 154, 154, 147, 147,
+    147, 126, 147, 154, 154, 154, 151, 154, 147, 123, 153, 147, 154, 154, 153,
+    147, 147, 154, 123, 147, 126, 154, 154, 147, 147, 147, 147, 147, 147, 147,
+    147, 153, 147, 147, 147, 147, 126, 151, 147, 154, 123, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 123, 129,
+    129, 129, 129, 129, 129, 129, 129, 162, 162, 123, 143, 161, 123, 129, 162,
+    123, 161, 162, 147, 129, 129, 147, 123, 147, 123, 147, 162, 123, 129, 162,
+    147, 155, 162, 155, 147, 147, 129, 129, 126, 129, 129, 129, 129, 129, 162,
+    162, 157, 162, 155, 162, 162, 123, 125, 129, 129, 162, 147, 162, 126, 162,
+    162, 162, 129, 126, 162, 154, 161, 162, 123, 154, 162, 155, 147, 162, 162,
+    162, 123, 162, 162, 123, 155, 126, 123, 162, 123, 153, 154, 154, 123, 162,
+    154, 161, 162, 162, 161, 162, 154, 154, 126, 129, 161, 154, 123, 155, 154,
+    151, 154, 123, 162, 154, 162, 162, 154, 147, 147, 154, 157, 126, 154, 155,
+    123, 147, 123, 154, 147, 162, 123, 129, 147, 157, 123, 155, 147, 157, 123,
+    155, 123, 129, 147, 147, 123, 162, 123, 147, 129, 155, 123, 155, 147, 123,
+    162, 147, 123, 123, 161, 129, 129, 129, 123, 129, 147, 147, 147, 155, 147,
+    147, 147, 161, 155, 155, 127, 147, 147, 147, 162, 147, 155, 147, 147, 147,
+    147, 147, 123, 147, 123, 147, 147, 147, 147, 147, 154, 123, 147, 127, 147,
+    147, 147, 162, 147, 147, 147, 147, 155, 147, 147, 147, 123, 155, 147, 147,
+    155, 147, 147, 162, 162, 162, 162, 162, 162, 155, 155, 123, 162, 147, 126,
+    147, 153, 155, 153, 123, 155, 123, 123, 129, 129, 147, 147, 147, 153, 147,
+    147, 155, 147, 162, 123, 162, 147, 162, 129, 162, 123, 147, 161, 155, 162,
+    147, 123, 123, 123, 126, 123, 147, 155, 155, 154, 147, 147, 147, 154, 153,
+    147, 147, 123, 147, 153, 162, 126, 162, 129, 154, 162, 162, 162, 162, 154,
+    162, 123, 147, 147, 147, 153, 154, 154, 147, 153, 126, 162, 154, 126, 126,
+    147, 147, 147, 147, 147, 147, 153, 147, 123, 147, 153, 123, 147, 154, 126,
+    147, 154, 154, 151, 123, 153, 153, 147, 151, 123, 147, 147, 123, 147, 123,
+    154, 123, 154, 123, 123, 123, 126, 154, 147, 123, 153, 154, 147, 153, 147,
+    147, 153, 147, 153, 153, 147, 147, 147, 123, 147, 154, 123, 126, 153, 154,
+    123, 123, 154, 123, 154, 123, 147, 154, 123, 154, 147, 147, 153, 123, 147,
+    147, 147, 147, 155, 123, 123, 154, 123, 154, 147, 153, 154, 147, 154, 147,
+    153, 153, 154, 147, 123, 123, 147, 147, 147, 147, 147, 147, 147, 147, 155,
+    147, 147, 147, 151, 147, 147, 154, 153, 147, 154, 153, 123, 153, 123, 153,
+    147, 153, 123, 147, 123, 147, 147, 147, 147, 147, 153, 123, 151, 123, 153,
+    123, 147, 147, 123, 147, 147, 147, 147, 153, 154, 123, 147, 147, 147, 147,
+    147, 123, 154, 153, 154, 147, 123, 153, 154, 151, 147, 147, 123, 123, 153,
+    123, 147, 147, 127, 147, 151, 154, 147, 154, 147, 147, 147, 147, 147, 123,
+    154, 147, 153, 153, 147, 147, 147, 154, 153, 123, 147, 123, 147, 123, 147,
+    147, 123, 147, 123, 123, 147, 147, 147, 123, 154, 147, 147, 155, 123, 147,
+    147, 123, 154, 147, 154, 153, 147, 147, 154, 147, 123, 147, 147, 147, 147,
+    123, 147, 154, 147, 123, 126, 147, 153, 123, 155, 123, 147, 147, 147, 147,
+    153, 154, 147, 147, 147, 147, 161, 153, 153, 147, 147, 123, 147, 153, 154,
+    147, 147, 123, 123, 153, 125, 123, 147, 153, 123, 147, 147, 147, 147, 147,
+    147, 147, 153, 147, 147, 153, 153, 147, 147, 123, 154, 153, 126, 147, 123,
+    123, 123, 123, 147, 126, 147, 147, 154, 153, 147, 147, 153, 147, 147, 147,
+    147, 123, 123, 147, 147, 154, 154, 126, 123, 147, 123, 147, 123, 123, 126,
+    127, 123, 147, 153, 123, 147, 153, 147, 147, 123, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 123, 129, 123,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123,
+    129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 123, 123, 129, 129,
+    129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 123,
+    129, 129, 129, 129, 123, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 123, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 154, 123,
+    153, 154, 123, 123, 147, 126, 147, 154, 126, 154, 147, 147, 147, 154, 147,
+    154, 154, 154, 154, 123, 126, 123, 154, 126, 123, 147, 147, 123, 147, 147,
+    147, 123, 123, 153, 123, 147, 147, 154, 147, 147, 154, 147, 153, 153, 123,
+    123, 147, 147, 147, 147, 154, 154, 154, 123, 126, 123, 147, 147, 154, 123,
+    147, 147, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 123, 129, 129, 123,
+    162, 129, 147, 129, 162, 123, 162, 147, 162, 129, 129, 129, 129, 129, 147,
+    162, 162, 162, 147, 153, 162, 147, 123, 147, 155, 129, 123, 123, 147, 123,
+    123, 162, 154, 154, 154, 162, 147, 123, 123, 147, 147, 162, 162, 147, 161,
+    147, 154, 162, 123, 162, 154, 143, 129, 147, 147, 147, 162, 154, 123, 161,
+    162, 162, 123, 154, 162, 126, 147, 123, 162, 162, 147, 147, 162, 162, 162,
+    162, 147, 162, 147, 154, 162, 162, 162, 129, 123, 126, 155, 147, 147, 162,
+    154, 147, 147, 154, 147, 154, 154, 147, 147, 147, 162, 129, 147, 123, 161,
+    147, 162, 162, 161, 155, 126, 147, 123, 161, 161, 161, 147, 154, 147, 162,
+    123, 123, 162, 123, 147, 154, 123, 123, 162, 147, 162, 147, 123, 123, 154,
+    153, 154, 123, 153, 147, 154, 153, 123, 147, 123, 126, 123, 126, 123, 127,
+    161, 129, 123, 126, 162, 123, 147, 143, 147, 155, 154, 123, 162, 123, 147,
+    153, 147, 147, 153, 161, 126, 147, 147, 123, 147, 162, 123, 162, 147, 154,
+    126, 129, 129, 123, 155, 123, 123, 147, 161, 147, 147, 123, 153, 147, 147,
+    123, 123, 147, 123, 153, 147, 147, 154, 147, 126, 147, 123, 154, 147, 147,
+    147, 147, 147, 123, 123, 154, 147, 147, 147, 147, 147, 147, 123, 123, 154,
+    147, 147, 147, 151, 154, 154, 154, 147, 154, 154, 147, 154, 123, 151, 123,
+    154, 147, 147, 153, 154, 154, 154, 154, 147, 123, 147, 154, 154, 123, 126,
+    147, 147, 147, 147, 123, 123, 147, 123, 147, 147, 147, 154, 123, 147, 147,
+    147, 126, 154, 154, 154, 153, 147, 147, 147, 147, 127, 126, 123, 153, 154,
+    147, 125, 153, 147, 147, 154, 147, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 123, 129, 129, 123, 129, 129, 129, 123, 129, 129, 123, 129,
+    129, 129, 123, 129, 129, 129, 129, 129, 129, 147, 147, 147, 126, 154, 123,
+    153, 125, 123, 147, 123, 147, 147, 123, 129, 123, 123, 129, 129, 129, 123,
+    129, 123, 123, 129, 129, 129, 154, 127, 123, 129, 162, 147, 123, 147, 154,
+    123, 153, 123, 147, 147, 154, 154, 123, 154, 129, 123, 123, 162, 147, 153,
+    154, 153, 147, 147, 147, 154, 123, 147, 147, 123, 126, 154, 147, 123, 147,
+    126, 147, 123, 154, 123, 147, 147, 154, 123, 154, 154, 125, 147, 123, 153,
+    154, 154, 147, 157, 161, 147, 154, 147, 147, 123, 147, 147, 123, 147, 147,
+    129, 129, 123, 123, 129, 129, 129, 129, 129, 123, 129, 129, 123, 129, 123,
+    129, 129, 129, 129, 129, 129, 129, 162, 161, 161, 162, 123, 123, 147, 151,
+    153, 123, 123, 154, 147, 147, 126, 126, 126, 147, 126, 147, 123, 147, 147,
+    147, 147, 147, 154, 154, 154, 147, 147, 154, 147, 147, 153, 151, 123, 153,
+    147, 154, 123, 154, 123, 154, 147, 147, 147, 153, 147, 147, 125, 147, 147,
+    147, 123, 147, 154, 154, 123, 147, 126, 126, 147, 147, 147, 123, 123, 154,
+    147, 147, 147, 147, 147, 123, 154, 147, 153, 154, 147, 154, 147, 123, 147,
+    147, 147, 123, 147, 154, 153, 147, 147, 123, 147, 147, 147, 154, 147, 154,
+    123, 147, 154, 154, 123, 123, 147, 154, 129, 129, 129, 123, 129, 129, 129,
+    129, 129, 123, 129, 129, 129, 123, 123, 129, 129, 129, 129, 129, 123, 123,
+    129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 161, 155, 155, 123, 126,
+    129, 147, 147, 123, 123, 147, 129, 129, 147, 123, 153, 147, 161, 147, 162,
+    154, 147, 147, 123, 162, 126, 123, 123, 153, 123, 126, 161, 123, 147, 123,
+    155, 147, 147, 153, 123, 155, 123, 147, 147, 147, 147, 147, 129, 147, 147,
+    147, 129, 123, 147, 147, 147, 153, 147, 154, 123, 123, 123, 147, 161, 123,
+    162, 162, 162, 162, 162, 147, 129, 155, 129, 147, 147, 147, 161, 153, 162,
+    123, 161, 147, 123, 162, 147, 147, 123, 153, 147, 154, 147, 123, 123, 123,
+    147, 147, 123, 147, 153, 123, 147, 147, 147, 147, 123, 123, 123, 123, 123,
+    127, 126, 147, 154, 153, 153, 123, 147, 126, 126, 123, 123, 147, 147, 123,
+    123, 147, 127, 153, 147, 123, 147, 147, 123, 153, 147, 147, 154, 153, 123,
+    123, 123, 123, 126, 123, 126, 126, 147, 153, 147, 154, 147, 123, 147, 147,
+    153, 147, 123, 147, 123, 126, 123, 123, 123, 126, 147, 153, 147, 153, 153,
+    126, 147, 126, 154, 147, 123, 127, 123, 154, 153, 153, 127, 123, 147, 123,
+    123, 123, 126, 147, 147, 123, 123, 147, 147, 123, 123, 147, 123, 153, 127,
+    153, 151, 147, 147, 147, 147, 147, 123, 147, 123, 153, 123, 147, 147, 147,
+    154, 147, 147, 126, 123, 123, 123, 147, 147, 123, 129, 129, 123, 123, 129,
+    129, 129, 129, 123, 123, 129, 123, 129, 129, 123, 129, 129, 129, 123, 129,
+    129, 123, 123, 123, 123, 129, 129, 129, 123, 129, 129, 123, 123, 123, 129,
+    129, 129, 129, 129, 123, 123, 129, 129, 129, 129, 129, 129, 129, 123, 123,
+    129, 129, 129, 129, 129, 129, 129, 123, 123, 129, 129, 129, 129, 147, 123,
+    123, 153, 147, 147, 153, 153, 153, 154, 123, 123, 123, 123, 126, 123, 147,
+    123, 153, 123, 147, 153, 123, 147, 147, 147, 123, 154, 123, 147, 147, 153,
+    147, 153, 147, 147, 126, 147, 126, 123, 126, 123, 147, 147, 147, 123, 123,
+    147, 126, 154, 147, 147, 147, 123, 147, 147, 147, 153, 147, 147, 153, 154,
+    126, 147, 147, 147, 147, 123, 147, 147, 147, 153, 147, 153, 147, 147, 147,
+    123, 123, 126, 147, 123, 147, 123, 147, 123, 147, 147, 147, 147, 153, 147,
+    147, 147, 147, 147, 123, 153, 153, 147, 127, 147, 126, 147, 147, 123, 147,
+    147, 147, 147, 147, 153, 147, 147, 147, 153, 123, 147, 147, 151, 147, 153,
+    147, 147, 147, 147, 147, 147, 147, 147, 147, 147, 147, 147, 147, 147, 123,
+    147, 123, 147, 123, 147, 123, 147, 147, 147, 147, 147, 147, 147, 123, 147,
+    123, 153, 154, 153, 123, 147, 154, 129, 123, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 123, 129, 129, 123, 129, 123, 123, 123, 129,
+    123, 129, 129, 123, 129, 129, 129, 123, 129, 123, 147, 126, 155, 147, 123,
+    123, 147, 155, 161, 147, 147, 161, 153, 147, 147, 123, 123, 153, 162, 162,
+    147, 126, 123, 154, 123, 147, 147, 147, 147, 162, 123, 162, 147, 123, 147,
+    151, 143, 123, 123, 123, 147, 129, 123, 123, 153, 162, 162, 161, 153, 162,
+    126, 147, 162, 147, 147, 123, 162, 126, 147, 162, 162, 161, 154, 155, 147,
+    147, 123, 123, 123, 123, 147, 154, 127, 147, 147, 129, 123, 129, 162, 147,
+    155, 123, 147, 162, 123, 153, 147, 129, 147, 155, 147, 147, 147, 123, 147,
+    123, 147, 147, 147, 147, 129, 123, 147, 147, 147, 147, 154, 154, 147, 147,
+    154, 153, 129, 129, 154, 123, 153, 147, 147, 147, 147, 147, 123, 147, 147,
+    147, 147, 154, 129, 123, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 154, 123, 123, 151, 147, 147, 123, 147, 154, 123, 123, 147, 129, 129,
+    129, 154, 126, 123, 129, 81, 81, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 109, 109, 109, 109, 0,
+    2, 2, 2, 2, 2, 2, 2, 2, 0, 2, 2, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 117, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 109, 109, 109, 109, 109,
+    109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109,
+    109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 144, 162, 155,
+    155, 155, 155, 155, 0, 0, 0, 0, 147, 147, 147, 147, 147, 147, 147, 147,
+    147, 147, 0, 147, 147, 147, 147, 0, 147, 147, 147, 147, 147, 147, 147, 147,
+    147, 147, 147, 147, 147, 147, 0, 147, 147, 147, 147, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 26, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0,
+    26, 0, 8, 8, 30, 30, 3, 3, 82, 82, 6, 6, 30, 132, 0, 0, 30, 30, 20, 89, 81,
+    81, 3, 3, 30, 30, 83, 16, 16, 30, 30, 16, 16, 81, 111, 0, 112, 111, 0, 0,
+    67, 111, 144, 0, 0, 111, 0, 0, 0, 140, 0, 145, 0, 0, 0, 147, 0, 0, 0, 12,
+    170, 0, 0, 144, 169, 153, 81, 81, 0, 81, 81, 81, 0, 81, 81, 81, 111, 0, 81,
+    111, 0, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 0, 129,
+    0, 129, 0, 129, 0, 129, 0, 129, 0, 129, 0, 129, 0, 0, 0, 27, 27, 27, 27,
+    27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27, 27,
+    27, 27, 27, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 117, 0, 0, 0, 0, 0, 0,
+    123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 123, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 123, 123, 0, 0, 0, 0, 123, 123, 0, 0, 0,
+    0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 172, 68, 68, 71, 68, 70, 71, 68, 68, 68,
+    68, 68, 0, 71, 68, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172, 172,
+    172, 172, 172, 172, 172, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117,
+    117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117, 117,
+    117, 117, 117, 117, 117, 117, 117, 162, 162, 162, 162, 0, 161, 153, 153,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 153, 144, 162, 162, 129,
+    129, 0, 0, 0, 0, 0, 153, 147, 109, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    0, 0, 0, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 109, 109, 0, 0, 109, 0, 0, 0, 109, 0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0,
+    0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 117, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 81, 81, 0, 0, 0, 0, 0, 0, 81, 81, 81, 81, 0, 41, 41, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 41, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117,
+    123, 123, 123, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 182, 182, 182, 182, 182, 182,
+    182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182,
+    182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 182, 14, 14, 14, 14, 14,
+    14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+    14, 14, 14, 14, 0, 0, 0, 0, 123, 123, 0, 123, 123, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 123, 123, 126, 129, 123,
+    129, 129, 153, 129, 143, 123, 143, 155, 129, 162, 147, 123, 155, 153, 162,
+    147, 129, 123, 161, 123, 162, 162, 129, 162, 153, 129, 129, 161, 129, 129,
+    126, 123, 123, 123, 129, 123, 123, 155, 123, 125, 123, 125, 123, 123, 129,
+    143, 123, 162, 123, 123, 125, 125, 123, 123, 123, 123, 123, 123, 162, 147,
+    161, 162, 162, 123, 162, 162, 162, 129, 162, 129, 123, 162, 162, 162, 162,
+    123, 126, 123, 129, 161, 123, 129, 154, 147, 123, 147, 162, 129, 123, 123,
+    123, 129, 123, 161, 123, 162, 162, 162, 123, 123, 155, 147, 129, 129, 129,
+    126, 126, 123, 162, 147, 162, 155, 147, 155, 162, 162, 123, 123, 123, 162,
+    126, 155, 123, 155, 129, 123, 155, 123, 129, 129, 129, 129, 123, 123, 129,
+    129, 147, 147, 123, 162, 161, 123, 129, 147, 162, 123, 162, 123, 162, 126,
+    162, 147, 162, 162, 147, 147, 155, 147, 147, 155, 155, 129, 123, 155, 123,
+    162, 147, 147, 155, 123, 147, 162, 162, 123, 123, 162, 155, 153, 162, 147,
+    147, 147, 151, 161, 161, 147, 157, 162, 143, 126, 123, 129, 123, 129, 129,
+    129, 129, 129, 129, 153, 129, 126, 162, 162, 123, 123, 147, 147, 123, 162,
+    154, 147, 123, 147, 147, 147, 123, 123, 123, 162, 151, 162, 123, 143, 126,
+    126, 129, 123, 129, 129, 129, 123, 147, 129, 162, 162, 123, 157, 123, 162,
+    147, 154, 153, 147, 162, 123, 162, 123, 123, 123, 161, 126, 147, 162, 153,
+    154, 127, 161, 162, 151, 162, 161, 162, 154, 162, 162, 129, 147, 147, 147,
+    123, 147, 123, 147, 126, 147, 123, 126, 129, 125, 155, 123, 129, 123, 147,
+    147, 147, 147, 147, 162, 123, 123, 147, 147, 147, 147, 143, 147, 147, 147,
+    153, 123, 153, 147, 154, 154, 162, 155, 127, 123, 147, 129, 123, 153, 129,
+    129, 123, 123, 147, 155, 123, 129, 123, 129, 129, 129, 123, 123, 162, 154,
+    147, 147, 147, 147, 162, 154, 153, 154, 147, 154, 147, 123, 155, 155, 123,
+    147, 154, 147, 147, 147, 123, 153, 147, 154, 155, 162, 147, 147, 147, 123,
+    155, 162, 161, 147, 147, 147, 123, 155, 126, 161, 147, 123, 147, 154, 123,
+    162, 123, 147, 147, 151, 147, 162, 147, 123, 147, 147, 147, 123, 123, 147,
+    154, 123, 123, 147, 147, 123, 147, 147, 154, 147, 147, 147, 123, 154, 147,
+    147, 154, 153, 154, 147, 123, 161, 147, 147, 162, 147, 126, 162, 123, 151,
+    162, 154, 154, 162, 162, 162, 162, 123, 129, 162, 123, 129, 129, 162, 162,
+    162, 162, 129, 123, 129, 162, 129, 123, 123, 162, 123, 161, 123, 161, 162,
+    126, 123, 126, 126, 154, 161, 162, 123, 123, 129, 161, 161, 161, 161, 126,
+    161, 162, 162, 147, 147, 123, 129, 155, 162, 153, 123, 161, 162, 147, 123,
+    129, 123, 126, 126, 123, 126, 126, 129, 126, 161, 123, 129, 162, 154, 123,
+    155, 147, 161, 162, 123, 162, 162, 162, 129, 129, 162, 126, 129, 129, 147,
+    123, 123, 162, 154, 147, 126, 155, 162, 154, 129, 123, 129, 162, 123, 162,
+    147, 147, 161, 123, 147, 162, 162, 162, 144, 162, 162, 147, 129, 123, 129,
+    123, 157, 147, 126, 126, 143, 123, 129, 123, 162, 162, 147, 147, 147, 147,
+    162, 126, 126, 162, 126, 153, 154, 123, 147, 147, 123, 147, 147, 147, 162,
+    123, 162, 162, 129, 129, 162, 125, 123, 153, 123, 129, 162, 162, 162, 161,
+    161, 147, 126, 123, 143, 129, 129, 126, 153, 123, 123, 123, 153, 123, 147,
+    153, 123, 162, 129, 153, 123, 154, 154, 162, 123, 153, 126, 123, 147, 123,
+    147, 123, 123, 123, 147, 155, 147, 126, 154, 147, 154, 123, 147, 154, 161,
+    162, 151, 147, 123, 162, 162, 162, 162, 147, 162, 126, 123, 129, 123, 123,
+    123, 162, 123, 123, 147, 129, 154, 147, 153, 123, 153, 147, 123, 123, 147,
+    153, 162, 143, 143, 147, 147, 155, 162, 162, 155, 129, 155, 129, 123, 162,
+    129, 125, 161, 123, 129, 147, 147, 161, 162, 162, 162, 153, 161, 162, 162,
+    123, 162, 161, 147, 129, 153, 147, 125, 147, 162, 154, 123, 129, 129, 147,
+    162, 162, 147, 161, 143, 123, 147, 147, 154, 161, 123, 126, 123, 153, 126,
+    147, 123, 161, 123, 123, 147, 123, 162, 123, 123, 123, 129, 155, 154, 154,
+    162, 162, 162, 155, 123, 161, 162, 162, 162, 162, 162, 161, 162, 162, 162,
+    162, 162, 123, 155, 161, 143, 162, 129, 126, 155, 155, 129, 147, 123, 162,
+    155, 123, 129, 147, 147, 162, 155, 155, 162, 147, 162, 161, 161, 161, 155,
+    147, 155, 129, 151, 129, 155, 153, 147, 162, 162, 123, 162, 162, 153, 162,
+    123, 147, 147, 155, 147, 155, 147, 155, 147, 162, 123, 127, 147, 147, 147,
+    123, 147, 153, 162, 155, 162, 147, 162, 161, 161, 155, 123, 147, 162, 162,
+    162, 147, 147, 147, 147, 153, 129, 162, 153, 155, 155, 162, 161, 155, 162,
+    162, 155, 147, 161, 147, 155, 126, 162, 129, 123, 147, 147, 162, 123, 147,
+    155, 153, 162, 153, 155, 147, 154, 153, 123, 147, 162, 161, 155, 162, 161,
+    155, 147, 123, 162, 162, 123, 123, 147, 162, 155, 123, 123, 123, 147, 147,
+    123, 162, 147, 155, 161, 123, 161, 129, 123, 129, 129, 129, 123, 147, 155,
+    123, 123, 155, 147, 155, 147, 161, 162, 155, 162, 147, 161, 147, 151, 147,
+    155, 153, 153, 123, 147, 155, 123, 162, 129, 123, 155, 147, 154, 155, 155,
+    155, 129, 123, 123, 155, 123, 129, 129, 129, 123, 123, 123, 123, 123, 123,
+    155, 155, 155, 129, 123, 123, 161, 162, 147, 161, 147, 123, 147, 147, 147,
+    147, 147, 147, 162, 153, 154, 154, 154, 154, 147, 154, 123, 126, 155, 147,
+    155, 123, 155, 126, 129, 123, 129, 123, 155, 123, 129, 129, 147, 123, 155,
+    147, 162, 162, 155, 155, 147, 155, 147, 129, 129, 129, 123, 123, 155, 123,
+    123, 155, 129, 123, 129, 147, 161, 123, 153, 147, 123, 147, 162, 162, 147,
+    123, 123, 123, 129, 129, 123, 123, 155, 123, 153, 147, 123, 155, 129, 147,
+    154, 147, 143, 162, 147, 162, 147, 162, 147, 153, 155, 147, 155, 123, 147,
+    147, 155, 147, 123, 155, 147, 161, 147, 147, 123, 162, 155, 161, 162, 161,
+    147, 147, 147, 147, 155, 147, 147, 154, 123, 155, 147, 153, 147, 126, 129,
+    129, 123, 147, 147, 126, 123, 126, 129, 123, 154, 147, 147, 147, 123, 147,
+    147, 151, 147, 154, 129, 123, 123, 147, 147, 154, 147, 153, 155, 123, 123,
+    123, 123, 162, 147, 147, 123, 162, 155, 129, 126, 155, 147, 123, 147, 123,
+    123, 147, 155, 123, 155, 153, 147, 162, 155, 126, 126, 129, 129, 123, 147,
+    123, 162, 162, 123, 123, 143, 129, 161, 147, 123, 147, 155, 123, 123, 126,
+    126, 162, 155, 155, 123, 155, 162, 155, 155, 162, 123, 123, 155, 147, 123,
+    123, 126, 126, 129, 129, 162, 123, 123, 155, 123, 129, 162, 147, 123, 162,
+    126, 162, 123, 155, 161, 162, 155, 123, 155, 125, 155, 151, 147, 147, 155,
+    147, 151, 155, 155, 123, 123, 123, 155, 157, 147, 123, 126, 162, 129, 162,
+    162, 161, 147, 129, 129, 123, 129, 126, 129, 126, 129, 155, 123, 126, 123,
+    129, 126, 129, 147, 147, 123, 155, 147, 147, 123, 147, 147, 123, 147, 162,
+    147, 147, 153, 155, 147, 147, 147, 123, 147, 123, 123, 147, 155, 147, 129,
+    151, 147, 147, 147, 162, 147, 147, 154, 155, 162, 162, 147, 154, 155, 147,
+    123, 155, 162, 123, 147, 162, 147, 147, 151, 147, 147, 162, 123, 147, 147,
+    147, 154, 162, 154, 147, 147, 154, 162, 147, 147, 147, 147, 127, 147, 123,
+    153, 123, 147, 123, 125, 154, 147, 151, 155, 123, 123, 147, 126, 123, 161,
+    129, 147, 123, 147, 126, 147, 126, 123, 147, 154, 147, 123, 123, 154, 147,
+    147, 151, 147, 162, 147, 147, 147, 123, 147, 123, 147, 147, 123, 162, 157,
+    147, 153, 147, 123, 154, 147, 123, 147, 126, 154, 123, 123, 123, 123, 126,
+    126, 154, 154, 155, 147, 154, 147, 147, 123, 147, 147, 162, 126, 123, 147,
+    147, 147, 123, 162, 162, 123, 143, 154, 143, 126, 126, 129, 147, 123, 129,
+    126, 123, 162, 154, 154, 153, 154, 147, 147, 147, 123, 154, 123, 155, 161,
+    123, 162, 123, 162, 162, 162, 153, 162, 162, 155, 123, 162, 126, 123, 129,
+    123, 123, 162, 161, 129, 129, 123, 155, 123, 154, 123, 162, 147, 162, 126,
+    123, 143, 123, 154, 126, 153, 154, 151, 127, 151, 154, 123, 147, 147, 147,
+    162, 162, 123, 155, 147, 162, 155, 123, 147, 147, 162, 147, 147, 147, 147,
+    147, 161, 161, 162, 147, 147, 162, 129, 129, 129, 127, 123, 155, 155, 123,
+    147, 161, 147, 147, 147, 147, 123, 123, 162, 153, 162, 147, 147, 162, 123,
+    147, 147, 123, 155, 147, 161, 154, 123, 162, 147, 154, 126, 157, 147, 151,
+    123, 123, 147, 147, 147, 147, 147, 153, 147, 125, 155, 147, 162, 147, 147,
+    147, 162, 162, 123, 123, 155, 147, 162, 123, 123, 123, 162, 123, 123, 123,
+    147, 147, 126, 123, 129, 129, 147, 129, 153, 162, 147, 147, 147, 123, 123,
+    162, 123, 147, 123, 147, 123, 162, 147, 147, 147, 154, 155, 123, 147, 161,
+    123, 153, 147, 123, 123, 147, 123, 123, 123, 129, 129, 129, 155, 147, 123,
+    155, 147, 147, 147, 123, 161, 147, 123, 147, 123, 125, 147, 147, 147, 123,
+    147, 129, 147, 147, 123, 147, 147, 147, 147, 155, 155, 147, 155, 147, 147,
+    155, 147, 147, 147, 153, 153, 161, 147, 155, 162, 147, 161, 123, 147, 162,
+    123, 147, 162, 147, 155, 147, 147, 147, 123, 123, 129, 123, 147, 147, 147,
+    147, 147, 147, 147, 153, 153, 123, 147, 123, 147, 147, 147, 126, 147, 147,
+    147, 147, 147, 147, 123, 154, 123, 153, 147, 147, 147, 153, 123, 161, 123,
+    155, 123, 126, 129, 147, 123, 123, 123, 147, 147, 153, 147, 123, 123, 155,
+    162, 162, 161, 143, 123, 123, 162, 129, 154, 155, 123, 147, 123, 162, 162,
+    147, 161, 123, 162, 147, 147, 154, 123, 162, 147, 151, 155, 123, 147, 129,
+    129, 162, 162, 162, 162, 162, 147, 147, 123, 155, 129, 151, 147, 154, 123,
+    162, 123, 123, 162, 162, 162, 162, 123, 162, 162, 123, 123, 123, 129, 129,
+    162, 147, 162, 154, 147, 162, 162, 154, 154, 162, 154, 147, 154, 154, 123,
+    162, 151, 161, 147, 147, 153, 123, 154, 154, 123, 162, 129, 162, 129, 129,
+    123, 126, 161, 126, 123, 161, 123, 162, 155, 123, 129, 154, 123, 147, 123,
+    155, 126, 123, 123, 147, 162, 123, 147, 129, 123, 123, 147, 162, 162, 162,
+    162, 162, 143, 162, 162, 162, 143, 151, 155, 154, 162, 129, 147, 147, 147,
+    147, 123, 154, 147, 161, 162, 123, 162, 123, 147, 147, 123, 126, 123, 123,
+    162, 155, 147, 147, 123, 147, 129, 147, 154, 155, 155, 147, 147, 153, 147,
+    153, 162, 147, 162, 162, 155, 147, 147, 147, 162, 123, 162, 123, 157, 153,
+    162, 162, 123, 154, 126, 126, 129, 127, 129, 127, 143, 123, 123, 129, 129,
+    129, 123, 162, 153, 161, 123, 147, 161, 147, 154, 162, 147, 123, 123, 151,
+    126, 154, 147, 147, 147, 126, 162, 123, 154, 123, 147, 147, 123, 153, 147,
+    155, 147, 155, 162, 147, 162, 123, 123, 123, 129, 155, 123, 147, 147, 147,
+    147, 155, 147, 147, 147, 147, 147, 147, 123, 147, 155, 129, 147, 123, 123,
+    147, 147, 123, 147, 123, 147, 147, 162, 123, 155, 162, 126, 123, 162, 123,
+    147, 147, 126, 129, 123, 126, 147, 123, 147, 147, 123, 147, 147, 147, 147,
+    151, 147, 154, 123, 123, 123, 123, 147, 147, 147, 151, 123, 153, 147, 153,
+    147, 147, 147, 147, 123, 147, 147, 147, 161, 154, 126, 154, 123, 154, 154,
+    123, 123, 147, 162, 157, 126, 123, 162, 162, 162, 162, 129, 123, 162, 123,
+    123, 162, 129, 147, 162, 162, 162, 162, 126, 123, 162, 123, 147, 123, 126,
+    123, 162, 162, 147, 147, 147, 147, 147, 147, 154, 129, 129, 147, 147, 123,
+    154, 123, 162, 155, 126, 126, 129, 123, 154, 147, 123, 154, 161, 162, 123,
+    123, 129, 129, 162, 147, 125, 147, 162, 162, 154, 126, 123, 147, 147, 147,
+    147, 147, 147, 147, 147, 147, 147, 147, 123, 162, 162, 162, 153, 161, 125,
+    162, 154, 161, 162, 162, 162, 154, 161, 162, 123, 147, 147, 147, 155, 162,
+    162, 147, 123, 147, 154, 147, 162, 147, 123, 147, 147, 147, 155, 147, 162,
+    162, 162, 162, 155, 123, 123, 123, 123, 157, 123, 154, 153, 154, 154, 123,
+    147, 147, 147, 161, 153, 129, 123, 154, 123, 147, 147, 126, 153, 147, 154,
+    161, 123, 162, 162, 126, 147, 162, 154, 153, 123, 161, 161, 129, 126, 147,
+    147, 147, 143, 162, 162, 147, 162, 129, 123, 123, 161, 147, 143, 147, 162,
+    123, 147, 126, 154, 147, 153, 153, 129, 157, 123, 162, 123, 126, 123, 123,
+    161, 162, 147, 155, 147, 144, 154, 123, 162, 162, 154, 162, 162, 123, 147,
+    162, 162, 147, 161, 147, 123, 147, 162, 147, 162, 123, 155, 162, 147, 147,
+    154, 154, 162, 123, 123, 147, 147, 147, 147, 162, 154, 162, 147, 147, 161,
+    162, 147, 123, 123, 147, 126, 126, 157, 147, 162, 123, 154, 123, 147, 161,
+    162, 147, 147, 162, 155, 123, 147, 161, 147, 123, 129, 147, 123, 155, 162,
+    123, 155, 155, 147, 126, 161, 123, 147, 147, 162, 123, 147, 161, 123, 147,
+    161, 123, 162, 129, 162, 162, 162, 147, 147, 147, 162, 161, 162, 162, 161,
+    162, 161, 147, 147, 147, 162, 123, 153, 147, 147, 147, 155, 123, 147, 123,
+    147, 126, 129, 129, 123, 123, 129, 126, 123, 162, 162, 162, 154, 147, 155,
+    162, 162, 162, 161, 162, 162, 147, 162, 162, 123, 147, 129, 123, 126, 129,
+    126, 129, 129, 129, 129, 129, 129, 123, 155, 162, 123, 147, 162, 151, 123,
+    143, 127, 155, 126, 126, 129, 129, 129, 123, 129, 151, 155, 162, 154, 162,
+    153, 154, 147, 162, 147, 147, 155, 162, 154, 147, 147, 162, 154, 147, 126,
+    147, 123, 155, 143, 143, 129, 123, 129, 129, 129, 129, 129, 162, 154, 153,
+    162, 161, 147, 162, 153, 147, 162, 162, 154, 147, 123, 147, 147, 143, 126,
+    123, 155, 129, 123, 129, 162, 153, 147, 123, 155, 153, 123, 147, 147, 127,
+    123, 147, 123, 154, 123, 147, 154, 123, 123, 123, 147, 127, 126, 154, 162,
+    147, 147, 162, 154, 151, 153, 147, 162, 162, 123, 147, 154, 147, 123, 154,
+    126, 162, 153, 147, 153, 153, 161, 154, 162, 123, 147, 147, 123, 147, 125,
+    154, 123, 123, 147, 147, 123, 154, 123, 123, 162, 155, 162, 147, 154, 162,
+    147, 154, 147, 147, 147, 154, 147, 147, 147, 154, 129, 147, 123, 154, 123,
+    147, 123, 162, 147, 147, 123, 123, 153, 147, 147, 162, 147, 147, 147, 147,
+    147, 123, 147, 147, 123, 147, 147, 154, 123, 126, 155, 154, 154, 154, 147,
+    154, 147, 154, 153, 153, 162, 147, 162, 155, 147, 155, 155, 126, 147, 123,
+    147, 162, 147, 129, 147, 162, 126, 154, 125, 153, 161, 162, 123, 151, 129,
+    126, 123, 147, 126, 123, 155, 157, 162, 153, 147, 147, 161, 147, 147, 155,
+    129, 126, 129, 129, 129, 129, 155, 162, 155, 155, 154, 147, 155, 147, 123,
+    162, 147, 123, 162, 147, 147, 162, 147, 161, 162, 129, 129, 129, 123, 129,
+    129, 126, 123, 155, 147, 147, 162, 161, 147, 147, 147, 147, 162, 123, 147,
+    147, 162, 147, 123, 147, 162, 123, 161, 162, 162, 147, 155, 126, 126, 129,
+    129, 123, 129, 129, 129, 129, 129, 123, 147, 162, 162, 162, 162, 147, 162,
+    147, 162, 155, 153, 161, 162, 147, 147, 147, 147, 155, 155, 162, 162, 129,
+    129, 129, 129, 129, 129, 123, 126, 161, 147, 155, 162, 147, 147, 123, 162,
+    123, 123, 155, 147, 147, 123, 147, 123, 147, 155, 162, 151, 147, 162, 154,
+    126, 123, 129, 129, 129, 123, 147, 123, 162, 154, 161, 123, 153, 147, 155,
+    162, 147, 147, 155, 154, 123, 123, 147, 161, 162, 147, 123, 162, 162, 147,
+    147, 123, 125, 162, 154, 162, 161, 147, 162, 123, 162, 162, 162, 162, 153,
+    161, 155, 155, 147, 155, 147, 126, 129, 143, 126, 123, 129, 129, 123, 129,
+    126, 129, 147, 161, 123, 155, 162, 123, 161, 147, 147, 123, 147, 147, 161,
+    155, 147, 123, 157, 154, 147, 147, 147, 155, 147, 162, 153, 162, 125, 155,
+    147, 126, 123, 123, 129, 123, 129, 155, 155, 151, 147, 147, 147, 161, 147,
+    153, 123, 155, 147, 162, 162, 147, 147, 147, 123, 123, 147, 161, 147, 153,
+    147, 147, 147, 162, 123, 123, 155, 154, 155, 154, 147, 123, 123, 123, 147,
+    147, 161, 147, 162, 123, 147, 147, 155, 147, 154, 147, 123, 147, 147, 147,
+    147, 153, 147, 162, 157, 162, 147, 123, 147, 123, 147, 147, 123, 147, 147,
+    162, 154, 147, 123, 123, 161, 123, 154, 155, 162, 162, 147, 162, 147, 154,
+    147, 123, 129, 123, 129, 129, 126, 129, 154, 161, 147, 147, 147, 153, 154,
+    162, 153, 155, 151, 162, 127, 147, 147, 123, 147, 154, 147, 123, 153, 147,
+    153, 154, 147, 154, 123, 126, 147, 147, 123, 154, 147, 147, 153, 154, 147,
+    147, 147, 147, 154, 153, 155, 147, 123, 123, 147, 154, 162, 154, 147, 155,
+    162, 123, 123, 147, 147, 161, 143, 162, 154, 162, 162, 123, 162, 123, 147,
+    162, 162, 123, 123, 162, 162, 147, 147, 162, 147, 147, 123, 147, 129, 162,
+    151, 123, 147, 143, 123, 162, 147, 162, 154, 147, 162, 154, 147, 147, 147,
+    147, 123, 125, 147, 147, 162, 147, 123, 162, 162, 123, 162, 147, 129, 147,
+    162, 154, 143, 147, 162, 162, 123, 147, 147, 123, 147, 147, 154, 147, 162,
+    123, 147, 162, 162, 123, 147, 162, 153, 161, 151, 123, 162, 162, 143, 162,
+    162, 123, 123, 162, 162, 155, 155, 155, 162, 147, 147, 151, 147, 129, 129,
+    123, 123, 162, 154, 151, 151, 123, 125, 162, 147, 147, 147, 153, 162, 147,
+    162, 162, 123, 123, 147, 123, 162, 153, 162, 125, 162, 147, 147, 162, 161,
+    162, 123, 123, 147, 151, 127, 143, 123, 129, 126, 123, 155, 153, 123, 162,
+    154, 162, 154, 162, 127, 147, 125, 147, 123, 162, 162, 161, 147, 147, 154,
+    162, 123, 162, 157, 151, 147, 162, 147, 147, 123, 155, 123, 154, 147, 154,
+    123, 147, 123, 126, 129, 155, 147, 147, 154, 123, 147, 162, 147, 147, 147,
+    154, 151, 162, 147, 123, 147, 153, 162, 147, 151, 126, 147, 162, 126, 154,
+    123, 123, 147, 147, 123, 162, 123, 147, 161, 123, 147, 147, 147, 147, 123,
+    162, 123, 162, 162, 162, 126, 147, 162, 154, 162, 127, 126, 162, 126, 162,
+    162, 147, 147, 147, 147, 123, 123, 162, 154, 162, 123, 162, 162, 162, 162,
+    154, 129, 123, 162, 123, 147, 162, 155, 127, 126, 153, 147, 162, 147, 147,
+    162, 147, 153, 161, 143, 153, 126, 126, 143, 126, 147, 129, 129, 161, 123,
+    147, 162, 123, 162, 162, 154, 161, 162, 147, 162, 147, 162, 147, 147, 147,
+    151, 161, 147, 162, 162, 126, 126, 143, 129, 123, 129, 126, 129, 129, 126,
+    129, 129, 147, 129, 147, 162, 157, 147, 147, 162, 153, 155, 162, 162, 162,
+    153, 147, 153, 123, 123, 125, 123, 129, 123, 161, 147, 153, 155, 147, 153,
+    123, 162, 147, 147, 162, 147, 153, 162, 157, 162, 147, 162, 162, 154, 151,
+    147, 147, 123, 147, 127, 147, 129, 127, 161, 147, 162, 154, 123, 123, 147,
+    147, 123, 147, 161, 162, 153, 123, 147, 147, 151, 123, 147, 161, 155, 153,
+    147, 123, 155, 162, 162, 147, 147, 162, 162, 155, 123, 129, 129, 129, 143,
+    129, 129, 129, 143, 129, 129, 123, 155, 123, 151, 147, 147, 123, 147, 147,
+    123, 161, 147, 162, 161, 147, 147, 123, 147, 147, 147, 153, 154, 153, 151,
+    162, 147, 147, 123, 161, 162, 162, 147, 147, 147, 147, 162, 147, 162, 162,
+    154, 147, 162, 147, 162, 127, 123, 123, 126, 126, 123, 126, 147, 123, 123,
+    162, 153, 123, 161, 147, 123, 147, 154, 151, 147, 147, 147, 147, 123, 162,
+    153, 155, 155, 154, 147, 147, 155, 147, 147, 147, 162, 162, 147, 155, 147,
+    123, 123, 129, 126, 126, 126, 129, 153, 126, 125, 126, 123, 153, 123, 123,
+    129, 123, 147, 162, 123, 147, 147, 161, 147, 153, 147, 147, 161, 123, 147,
+    147, 162, 147, 162, 162, 154, 154, 157, 123, 147, 155, 123, 154, 147, 153,
+    162, 147, 154, 162, 154, 147, 155, 123, 153, 153, 154, 147, 162, 162, 162,
+    147, 147, 143, 126, 126, 123, 153, 147, 123, 147, 147, 151, 147, 162, 155,
+    147, 147, 155, 147, 155, 154, 147, 147, 161, 126, 147, 162, 147, 147, 155,
+    123, 147, 123, 162, 147, 147, 153, 153, 129, 147, 153, 123, 147, 147, 147,
+    153, 154, 123, 125, 153, 147, 161, 147, 123, 123, 147, 161, 147, 147, 123,
+    147, 147, 147, 153, 147, 154, 147, 162, 147, 162, 147, 162, 126, 154, 123,
+    147, 147, 147, 155, 126, 143, 126, 147, 123, 126, 129, 126, 129, 147, 123,
+    147, 162, 126, 123, 154, 154, 154, 147, 147, 162, 155, 147, 147, 162, 153,
+    123, 147, 129, 153, 147, 147, 147, 147, 154, 123, 147, 123, 147, 123, 129,
+    126, 126, 123, 123, 147, 123, 126, 129, 123, 123, 129, 123, 153, 153, 161,
+    147, 154, 154, 147, 147, 147, 123, 147, 129, 126, 129, 161, 147, 153, 147,
+    123, 123, 123, 154, 147, 123, 147, 147, 153, 147, 147, 154, 123, 147, 123,
+    123, 147, 147, 126, 123, 126, 147, 123, 147, 153, 123, 153, 147, 147, 123,
+    147, 147, 147, 147, 123, 147, 123, 123, 125, 123, 147, 147, 153, 154, 147,
+    123, 123, 123, 162, 162, 129, 162, 129, 147, 123, 143, 147, 123, 123, 123,
+    147, 147, 123, 147, 123, 147, 162, 147, 147, 147, 147, 161, 153, 161, 162,
+    147, 147, 154, 162, 147, 147, 154, 162, 162, 162, 157, 162, 155, 123, 126,
+    162, 123, 123, 147, 123, 126, 123, 123, 151, 126, 153, 123, 147, 151, 154,
+    161, 123, 162, 129, 123, 147, 154, 147, 129, 147, 147, 153, 147, 147, 147,
+    123, 123, 161, 153, 123, 147, 151, 154, 147, 126, 154, 161, 143, 162, 147,
+    162, 123, 123, 154, 126, 154, 147, 123, 162, 147, 155, 147, 147, 147, 123,
+    147, 147, 147, 123, 129, 162, 154, 123, 123, 161, 147, 123, 147, 161, 123,
+    129, 123, 147, 147, 155, 123, 147, 147, 155, 147, 147, 147, 155, 129, 154,
+    161, 147, 155, 155, 155, 129, 155, 147, 147, 123, 155, 155, 155, 123, 129,
+    147, 162, 129, 147, 154, 162, 123, 123, 147, 123, 129, 154, 153, 162, 155,
+    126, 123, 129, 147, 147, 147, 162, 155, 162, 147, 123, 151, 147, 153, 162,
+    147, 162, 153, 155, 123, 157, 123, 147, 155, 154, 147, 123, 162, 162, 123,
+    123, 143, 126, 129, 129, 129, 129, 129, 123, 129, 129, 162, 147, 155, 162,
+    123, 147, 161, 129, 162, 147, 123, 147, 147, 162, 162, 153, 162, 162, 162,
+    162, 162, 155, 162, 162, 162, 123, 162, 123, 147, 162, 147, 143, 157, 147,
+    147, 157, 162, 162, 161, 147, 162, 123, 155, 129, 129, 129, 147, 129, 129,
+    129, 129, 129, 123, 147, 123, 147, 123, 123, 162, 123, 157, 147, 154, 162,
+    161, 147, 147, 155, 147, 147, 155, 162, 161, 147, 162, 154, 147, 154, 157,
+    147, 162, 155, 162, 162, 147, 155, 147, 147, 162, 153, 147, 162, 147, 147,
+    162, 162, 123, 154, 147, 162, 161, 147, 147, 123, 123, 162, 147, 147, 162,
+    162, 154, 147, 147, 155, 147, 147, 151, 129, 129, 123, 129, 129, 123, 129,
+    129, 129, 129, 155, 155, 153, 123, 155, 162, 123, 123, 162, 147, 147, 162,
+    123, 147, 161, 123, 147, 147, 153, 147, 147, 155, 155, 162, 147, 147, 161,
+    147, 161, 123, 154, 147, 154, 162, 161, 147, 162, 147, 147, 162, 153, 162,
+    147, 154, 147, 162, 127, 162, 154, 162, 161, 147, 123, 123, 162, 162, 147,
+    162, 162, 162, 154, 153, 147, 143, 147, 162, 154, 162, 153, 162, 147, 147,
+    157, 147, 157, 147, 151, 123, 162, 153, 162, 147, 154, 151, 154, 147, 147,
+    147, 147, 147, 147, 147, 147, 154, 147, 147, 123, 162, 123, 123, 162, 154,
+    123, 147, 154, 151, 147, 123, 126, 147, 147, 147, 125, 123, 147, 123, 143,
+    143, 147, 147, 162, 147, 147, 162, 147, 155, 123, 123, 162, 151, 123, 123,
+    147, 162, 147, 157, 161, 147, 155, 147, 162, 161, 123, 147, 162, 129, 147,
+    161, 147, 153, 129, 129, 129, 123, 129, 129, 129, 123, 129, 129, 123, 147,
+    153, 147, 147, 154, 123, 147, 153, 123, 162, 147, 147, 153, 154, 155, 147,
+    147, 147, 147, 154, 154, 162, 147, 154, 154, 129, 147, 147, 147, 123, 155,
+    155, 162, 154, 155, 147, 155, 147, 162, 154, 155, 123, 147, 155, 147, 154,
+    147, 147, 147, 147, 147, 161, 154, 147, 147, 157, 147, 154, 123, 161, 147,
+    123, 147, 147, 147, 147, 162, 162, 153, 154, 123, 155, 147, 161, 123, 147,
+    147, 161, 123, 162, 147, 162, 151, 151, 147, 147, 161, 147, 154, 154, 147,
+    147, 157, 147, 147, 153, 147, 147, 147, 151, 151, 147, 154, 147, 162, 147,
+    126, 155, 123, 147, 162, 147, 123, 147, 147, 125, 147, 162, 162, 147, 147,
+    154, 123, 147, 147, 147, 151, 123, 154, 154, 147, 161, 162, 147, 154, 147,
+    126, 147, 126, 126, 147, 147, 123, 153, 147, 147, 123, 154, 147, 147, 147,
+    147, 157, 147, 123, 153, 154, 154, 147, 147, 147, 126, 123, 123, 151, 153,
+    147, 153, 147, 147, 155, 123, 151, 147, 155, 147, 147, 147, 123, 154, 147,
+    147, 147, 147, 154, 147, 147, 147, 123, 147, 147, 147, 162, 129, 129, 123,
+    143, 162, 147, 123, 123, 147, 129, 155, 123, 162, 147, 147, 123, 162, 154,
+    155, 129, 123, 151, 123, 123, 151, 123, 123, 147, 123, 147, 123, 162, 162,
+    162, 161, 162, 147, 155, 123, 162, 147, 147, 123, 157, 162, 144, 153, 143,
+    129, 155, 147, 123, 147, 147, 147, 123, 155, 123, 129, 129, 129, 129, 123,
+    129, 129, 129, 123, 155, 147, 127, 123, 147, 147, 123, 147, 155, 147, 162,
+    147, 147, 147, 162, 123, 147, 147, 154, 147, 147, 123, 147, 162, 123, 147,
+    123, 123, 147, 147, 123, 147, 155, 157, 155, 147, 123, 123, 123, 162, 123,
+    123, 123, 147, 123, 126, 123, 123, 123, 147, 147, 153, 147, 162, 154, 162,
+    162, 155, 154, 147, 123, 154, 123, 162, 123, 147, 123, 155, 129, 123, 123,
+    123, 123, 155, 123, 129, 147, 123, 162, 123, 123, 155, 147, 125, 123, 147,
+    147, 123, 147, 161, 147, 147, 123, 162, 123, 123, 147, 147, 154, 147, 155,
+    147, 155, 123, 123, 147, 162, 151, 123, 147, 147, 154, 147, 161, 147, 147,
+    123, 147, 162, 154, 162, 147, 123, 123, 123, 153, 154, 162, 123, 147, 147,
+    147, 123, 147, 126, 123, 123, 147, 161, 123, 154, 154, 147, 154, 154, 123,
+    123, 147, 147, 147, 123, 147, 147, 161, 147, 162, 123, 162, 154, 147, 123,
+    162, 129, 127, 123, 123, 162, 162, 129, 155, 155, 154, 162, 126, 162, 154,
+    161, 147, 162, 162, 147, 123, 123, 129, 162, 123, 162, 147, 123, 147, 123,
+    155, 155, 147, 123, 162, 147, 153, 129, 147, 147, 147, 162, 129, 147, 147,
+    154, 161, 155, 126, 147, 154, 147, 147, 147, 147, 154, 147, 147, 147, 123,
+    162, 129, 147, 162, 155, 126, 126, 123, 155, 147, 143, 129, 129, 143, 147,
+    123, 123, 147, 126, 147, 161, 162, 126, 147, 147, 123, 147, 123, 155, 162,
+    147, 147, 143, 143, 129, 129, 129, 129, 129, 155, 155, 123, 147, 161, 162,
+    154, 155, 155, 162, 154, 147, 147, 123, 129, 155, 147, 126, 162, 147, 147,
+    147, 162, 162, 162, 129, 147, 161, 126, 147, 155, 147, 147, 161, 147, 154,
+    162, 129, 129, 147, 147, 147, 123, 162, 162, 155, 147, 147, 126, 123, 147,
+    147, 147, 154, 147, 154, 147, 155, 129, 147, 155, 154, 123, 154, 147, 123,
+    154, 147, 153, 154, 123, 154, 154, 147, 147, 155, 147, 147, 147, 155, 123,
+    147, 147, 147, 151, 147, 162, 147, 155, 147, 151, 129, 129, 129, 123, 162,
+    162, 147, 147, 147, 155, 147, 151, 129, 161, 147, 126, 147, 147, 162, 123,
+    123, 154, 151, 162, 125, 155, 147, 157, 154, 147, 123, 162, 153, 147, 123,
+    126, 129, 123, 147, 153, 147, 151, 153, 125, 147, 123, 147, 151, 154, 147,
+    151, 151, 162, 147, 147, 162, 162, 123, 157, 153, 162, 151, 157, 147, 162,
+    151, 157, 147, 153, 162, 162, 162, 162, 123, 125, 147, 154, 123, 129, 123,
+    123, 154, 154, 123, 154, 153, 154, 151, 123, 147, 125, 154, 154, 123, 147,
+    155, 147, 154, 161, 147, 147, 153, 147, 147, 161, 129, 123, 147, 123, 123,
+    147, 147, 162, 147, 147, 151, 126, 151, 147, 151, 147, 162, 157, 155, 151,
+    147, 123, 147, 123, 147, 154, 147, 151, 123, 123, 151, 147, 147, 147, 125,
+    155, 147, 123, 154, 147, 151, 162, 147, 162, 162, 155, 147, 162, 126, 147,
+    153, 123, 123, 147, 123, 162, 129, 126, 126, 126, 123, 155, 147, 161, 162,
+    126, 123, 123, 147, 123, 147, 147, 155, 123, 147, 147, 127, 123, 162, 154,
+    123, 162, 155, 147, 162, 162, 155, 147, 161, 162, 162, 162, 162, 123, 129,
+    123, 162, 162, 147, 162, 143, 126, 147, 155, 147, 126, 123, 154, 147, 153,
+    162, 162, 153, 123, 126, 162, 153, 147, 126, 147, 154, 154, 123, 129, 126,
+    143, 125, 154, 153, 162, 155, 125, 123, 123, 147, 147, 162, 129, 129, 147,
+    161, 155, 162, 123, 147, 123, 123, 147, 162, 129, 123, 129, 129, 155, 144,
+    162, 162, 155, 162, 147, 123, 162, 162, 147, 147, 162, 162, 162, 147, 147,
+    147, 162, 161, 155, 123, 155, 155, 129, 126, 129, 129, 123, 147, 123, 147,
+    162, 155, 154, 153, 162, 147, 147, 147, 147, 155, 154, 147, 162, 147, 153,
+    161, 162, 154, 162, 147, 162, 155, 157, 153, 147, 155, 129, 129, 147, 155,
+    123, 147, 161, 147, 147, 155, 161, 155, 123, 123, 155, 123, 147, 127, 155,
+    147, 129, 129, 147, 154, 153, 129, 151, 147, 123, 126, 126, 154, 153, 129,
+    154, 147, 147, 155, 154, 147, 154, 123, 123, 147, 153, 123, 162, 147, 126,
+    162, 154, 162, 162, 147, 123, 147, 123, 123, 155, 147, 153, 123, 123, 123,
+    147, 147, 123, 147, 162, 147, 153, 129, 129, 123, 161, 147, 123, 153, 153,
+    126, 154, 147, 123, 147, 147, 162, 123, 154, 123, 154, 154, 161, 147, 154,
+    123, 147, 153, 123, 147, 147, 162, 155, 147, 155, 162, 147, 162, 147, 123,
+    147, 162, 155, 147, 153, 157, 123, 162, 123, 162, 123, 155, 147, 126, 153,
+    161, 147, 155, 162, 123, 123, 123, 155, 123, 155, 123, 147, 147, 147, 147,
+    155, 155, 162, 162, 147, 162, 147, 162, 147, 147, 123, 147, 162, 155, 162,
+    123, 161, 162, 147, 161, 147, 147, 162, 155, 147, 147, 147, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 162, 123, 123, 147, 155, 162, 162, 161, 147,
+    155, 147, 123, 162, 123, 155, 147, 129, 155, 147, 162, 154, 123, 147, 162,
+    147, 147, 162, 147, 155, 153, 147, 123, 126, 147, 162, 154, 161, 123, 162,
+    147, 123, 162, 162, 123, 162, 147, 161, 147, 162, 123, 129, 155, 162, 162,
+    154, 147, 147, 147, 162, 147, 123, 129, 147, 155, 147, 147, 147, 153, 155,
+    129, 129, 153, 153, 147, 155, 123, 162, 162, 162, 147, 155, 147, 147, 157,
+    155, 147, 147, 155, 147, 154, 147, 162, 147, 123, 155, 155, 129, 143, 129,
+    155, 123, 129, 126, 147, 123, 147, 123, 153, 147, 123, 123, 147, 147, 155,
+    162, 162, 155, 155, 154, 147, 147, 126, 123, 126, 123, 123, 129, 123, 147,
+    126, 147, 162, 123, 147, 147, 147, 155, 147, 162, 147, 155, 123, 162, 147,
+    154, 153, 147, 147, 147, 123, 153, 155, 155, 155, 155, 155, 126, 123, 123,
+    123, 129, 154, 151, 154, 123, 161, 123, 147, 147, 147, 147, 123, 147, 123,
+    153, 162, 147, 147, 123, 162, 147, 123, 154, 123, 147, 155, 147, 161, 125,
+    123, 155, 123, 147, 155, 151, 147, 153, 147, 147, 123, 147, 123, 147, 155,
+    147, 153, 147, 147, 147, 154, 154, 154, 147, 147, 147, 126, 147, 123, 123,
+    155, 147, 123, 123, 147, 147, 162, 129, 161, 147, 162, 147, 162, 147, 143,
+    147, 147, 162, 123, 155, 162, 147, 147, 147, 123, 162, 123, 129, 147, 147,
+    147, 147, 147, 123, 123, 143, 129, 147, 162, 123, 147, 147, 123, 154, 147,
+    147, 147, 123, 147, 123, 154, 162, 147, 147, 154, 147, 147, 147, 154, 123,
+    153, 151, 147, 162, 147, 123, 147, 147, 147, 162, 161, 155, 123, 162, 162,
+    154, 147, 126, 123, 161, 162, 123, 162, 162, 123, 162, 147, 155, 153, 155,
+    147, 129, 143, 123, 123, 123, 123, 123, 147, 147, 155, 123, 147, 162, 123,
+    129, 123, 123, 162, 123, 147, 129, 123, 123, 147, 123, 147, 123, 123, 147,
+    123, 123, 154, 147, 147, 154, 126, 129, 123, 123, 125, 162, 123, 155, 123,
+    162, 162, 162, 126, 162, 147, 154, 154, 126, 123, 123, 123, 147, 147, 154,
+    123, 154, 147, 147, 147, 123, 162, 147, 123, 123, 162, 147, 162, 129, 155,
+    162, 162, 147, 123, 127, 147, 162, 155, 123, 147, 147, 123, 129, 129, 123,
+    155, 154, 154, 147, 155, 129, 154, 154, 126, 147, 147, 155, 147, 147, 153,
+    147, 147, 123, 154, 123, 123, 123, 147, 161, 162, 126, 126, 162, 147, 162,
+    161, 126, 123, 123, 127, 153, 123, 162, 147, 162, 126, 123, 123, 123, 123,
+    123, 154, 147, 126, 162, 162, 147, 123, 155, 123, 162, 162, 123, 147, 147,
+    155, 161, 162, 123, 161, 123, 155, 155, 162, 151, 155, 147, 147, 155, 147,
+    161, 147, 153, 126, 123, 155, 127, 129, 147, 129, 123, 129, 123, 157, 147,
+    129, 147, 147, 153, 147, 153, 123, 147, 123, 123, 127, 147, 162, 123, 153,
+    161, 155, 147, 153, 162, 147, 155, 147, 129, 126, 129, 123, 125, 129, 123,
+    147, 162, 129, 123, 147, 123, 129, 129, 129, 129, 143, 129, 155, 162, 123,
+    147, 123, 162, 123, 123, 162, 147, 123, 147, 162, 147, 123, 123, 123, 123,
+    147, 123, 154, 155, 147, 147, 154, 161, 161, 147, 147, 154, 155, 147, 123,
+    126, 129, 123, 147, 155, 147, 153, 147, 123, 126, 161, 147, 147, 123, 147,
+    129, 147, 155, 147, 147, 154, 147, 153, 123, 147, 155, 162, 147, 147, 162,
+    154, 147, 147, 123, 123, 147, 123, 123, 147, 123, 123, 123, 153, 161, 147,
+    123, 147, 147, 154, 154, 162, 154, 123, 123, 147, 154, 153, 147, 147, 123,
+    147, 147, 147, 154, 123, 147, 147, 123, 123, 147, 162, 129, 153, 123, 123,
+    147, 147, 147, 129, 129, 155, 126, 147, 123, 153, 161, 147, 143, 162, 123,
+    154, 153, 123, 129, 126, 123, 126, 144, 147, 123, 162, 162, 162, 147, 147,
+    123, 123, 123, 162, 147, 147, 155, 161, 162, 147, 162, 123, 153, 123, 123,
+    123, 123, 154, 155, 123, 147, 123, 147, 123, 147, 161, 147, 147, 153, 123,
+    153, 123, 153, 147, 161, 123, 126, 162, 123, 147, 154, 123, 162, 154, 162,
+    123, 123, 123, 123, 129, 147, 147, 123, 162, 154, 123, 154, 162, 154, 147,
+    153, 154, 123, 154, 147, 123, 147, 154, 154, 147, 147, 147, 147, 153, 123,
+    154, 154, 153, 123, 123, 154, 147, 154, 147, 151, 147, 123, 147, 162, 147,
+    147, 154, 154, 154, 123, 126, 127, 129, 123, 154, 147, 147, 147, 153, 123,
+    151, 154, 147, 154, 153, 123, 123, 155, 147, 123, 147, 147, 126, 154, 154,
+    161, 153, 153, 154, 154, 123, 154, 154, 123, 153, 154, 147, 154, 154, 147,
+    154, 154, 154, 154, 154, 123, 151, 126, 123, 147, 147, 154, 154, 147, 123,
+    154, 123, 147, 154, 147, 147, 153, 147, 154, 123, 147, 147, 123, 147, 147,
+    154, 123, 123, 123, 123, 147, 154, 153, 154, 147, 147, 126, 123, 123, 147,
+    147, 154, 123, 147, 154, 151, 147, 154, 153, 147, 147, 153, 147, 154, 147,
+    153, 153, 161, 147, 154, 154, 147, 147, 151, 147, 147, 123, 123, 126, 126,
+    147, 154, 154, 151, 123, 154, 123, 147, 154, 123, 147, 147, 147, 147, 147,
+    147, 147, 154, 147, 153, 154, 153, 147, 126, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 123,
+    129, 129, 129, 129, 129, 129, 123, 123, 129, 129, 129, 129, 129, 129, 129,
+    123, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 162, 123, 162, 147, 162, 123, 123, 147, 147, 147,
+    153, 155, 129, 147, 123, 147, 147, 153, 161, 161, 162, 154, 147, 147, 162,
+    123, 154, 129, 162, 147, 129, 154, 147, 154, 126, 162, 147, 147, 147, 147,
+    155, 147, 147, 161, 147, 126, 162, 147, 147, 155, 154, 154, 123, 123, 147,
+    147, 126, 161, 155, 147, 162, 147, 123, 147, 153, 147, 162, 162, 147, 147,
+    155, 162, 147, 155, 162, 162, 147, 147, 123, 155, 161, 123, 147, 162, 147,
+    154, 147, 147, 155, 147, 162, 155, 147, 161, 147, 147, 123, 147, 147, 154,
+    123, 161, 162, 147, 147, 147, 129, 153, 129, 123, 147, 129, 155, 129, 161,
+    155, 155, 123, 147, 125, 123, 123, 147, 129, 123, 162, 147, 155, 162, 155,
+    129, 147, 123, 143, 123, 162, 147, 162, 123, 126, 126, 123, 147, 123, 123,
+    147, 126, 129, 129, 123, 147, 123, 123, 154, 154, 155, 154, 154, 126, 147,
+    153, 154, 147, 153, 123, 123, 123, 154, 154, 162, 129, 162, 162, 147, 129,
+    162, 123, 123, 123, 162, 162, 155, 126, 161, 155, 162, 123, 162, 162, 123,
+    162, 147, 123, 129, 147, 123, 162, 123, 129, 129, 129, 129, 147, 162, 123,
+    147, 162, 162, 147, 129, 129, 129, 129, 129, 129, 155, 123, 161, 155, 162,
+    155, 155, 162, 147, 129, 123, 162, 147, 155, 147, 161, 162, 147, 123, 123,
+    147, 147, 154, 147, 147, 123, 147, 123, 154, 123, 151, 155, 147, 123, 162,
+    147, 143, 129, 126, 123, 123, 129, 123, 129, 154, 147, 123, 123, 147, 162,
+    123, 155, 147, 147, 123, 147, 162, 154, 155, 123, 155, 123, 154, 123, 129,
+    161, 147, 162, 162, 147, 147, 161, 123, 147, 147, 154, 162, 162, 129, 129,
+    129, 129, 162, 154, 123, 147, 162, 126, 123, 155, 147, 162, 153, 129, 147,
+    147, 123, 147, 123, 153, 147, 147, 162, 147, 154, 123, 147, 126, 147, 162,
+    155, 147, 154, 154, 154, 153, 147, 147, 162, 123, 154, 147, 162, 154, 147,
+    162, 123, 155, 162, 147, 147, 123, 123, 147, 162, 162, 123, 123, 147, 147,
+    147, 154, 162, 162, 123, 162, 147, 147, 157, 155, 129, 123, 147, 147, 123,
+    155, 126, 162, 162, 162, 129, 126, 155, 129, 129, 147, 161, 155, 162, 162,
+    162, 161, 162, 147, 129, 147, 147, 129, 147, 123, 147, 126, 147, 154, 123,
+    154, 123, 161, 147, 126, 153, 147, 147, 162, 162, 129, 154, 162, 129, 155,
+    147, 127, 153, 154, 129, 129, 123, 147, 155, 162, 155, 147, 155, 147, 147,
+    155, 162, 144, 147, 155, 157, 129, 161, 162, 162, 157, 162, 155, 162, 123,
+    162, 155, 147, 147, 157, 162, 162, 147, 154, 151, 162, 155, 125, 155, 162,
+    123, 161, 155, 162, 162, 154, 147, 123, 147, 161, 147, 147, 147, 155, 147,
+    162, 147, 153, 161, 147, 147, 129, 123, 161, 153, 161, 147, 125, 151, 123,
+    147, 123, 147, 126, 147, 147, 147, 155, 162, 147, 147, 162, 155, 155, 123,
+    162, 123, 162, 153, 155, 162, 162, 162, 147, 162, 162, 155, 147, 155, 123,
+    123, 147, 129, 129, 126, 155, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 123, 123, 123, 154, 147, 153, 147, 162, 155, 123, 147, 162,
+    161, 155, 147, 153, 161, 123, 154, 147, 147, 147, 147, 147, 161, 157, 162,
+    162, 123, 123, 147, 147, 155, 143, 129, 129, 129, 126, 129, 129, 129, 155,
+    129, 123, 129, 162, 123, 147, 161, 155, 147, 147, 147, 155, 123, 147, 147,
+    162, 155, 154, 147, 123, 147, 154, 162, 162, 162, 147, 154, 147, 153, 126,
+    155, 157, 147, 153, 147, 162, 147, 147, 126, 123, 126, 147, 155, 129, 129,
+    129, 129, 154, 126, 147, 154, 147, 147, 147, 147, 162, 147, 147, 147, 153,
+    147, 147, 162, 147, 147, 147, 161, 162, 123, 147, 147, 162, 153, 162, 123,
+    147, 154, 147, 147, 161, 123, 162, 162, 161, 153, 154, 147, 143, 123, 155,
+    147, 162, 155, 153, 155, 153, 162, 123, 123, 147, 147, 123, 147, 162, 147,
+    123, 147, 123, 123, 147, 147, 147, 147, 147, 147, 126, 147, 155, 147, 147,
+    162, 123, 161, 123, 147, 123, 162, 161, 155, 154, 154, 129, 123, 162, 129,
+    123, 123, 129, 123, 129, 129, 147, 147, 147, 147, 147, 162, 123, 154, 147,
+    155, 147, 147, 147, 154, 123, 147, 147, 123, 147, 147, 147, 162, 147, 147,
+    161, 147, 162, 123, 151, 147, 151, 153, 147, 147, 147, 147, 155, 162, 154,
+    147, 151, 147, 147, 123, 147, 123, 126, 123, 129, 129, 129, 129, 155, 129,
+    162, 147, 125, 147, 147, 147, 154, 155, 147, 147, 147, 162, 154, 154, 153,
+    147, 154, 147, 123, 123, 147, 129, 123, 129, 147, 147, 153, 147, 155, 155,
+    155, 147, 123, 161, 123, 147, 147, 147, 147, 161, 123, 154, 147, 162, 154,
+    162, 126, 126, 123, 143, 162, 162, 147, 123, 147, 147, 147, 147, 155, 147,
+    161, 154, 123, 123, 147, 147, 147, 123, 147, 147, 147, 162, 154, 147, 123,
+    147, 162, 154, 147, 147, 147, 123, 147, 147, 147, 147, 123, 123, 123, 147,
+    154, 147, 153, 154, 162, 123, 147, 153, 157, 147, 147, 153, 147, 147, 147,
+    147, 155, 123, 155, 147, 123, 147, 154, 147, 126, 126, 147, 147, 147, 147,
+    147, 147, 123, 155, 147, 147, 147, 155, 123, 147, 154, 123, 147, 155, 147,
+    147, 147, 123, 154, 147, 147, 147, 161, 129, 147, 155, 147, 147, 161, 123,
+    147, 147, 123, 123, 147, 123, 162, 155, 161, 155, 129, 129, 129, 123, 147,
+    147, 162, 162, 147, 123, 155, 155, 162, 161, 126, 129, 123, 123, 161, 161,
+    155, 123, 147, 155, 155, 161, 147, 147, 147, 155, 147, 147, 147, 147, 147,
+    123, 123, 147, 147, 162, 123, 147, 123, 147, 161, 147, 147, 153, 162, 143,
+    126, 129, 129, 129, 129, 129, 147, 147, 147, 161, 161, 147, 153, 123, 123,
+    162, 123, 147, 155, 155, 155, 147, 161, 147, 147, 147, 161, 147, 123, 147,
+    147, 155, 123, 147, 155, 147, 147, 161, 147, 123, 161, 147, 123, 147, 161,
+    147, 123, 155, 161, 161, 147, 147, 161, 155, 155, 154, 147, 154, 147, 153,
+    147, 147, 147, 161, 147, 129, 123, 123, 147, 162, 147, 162, 147, 154, 147,
+    147, 155, 129, 155, 129, 126, 123, 123, 154, 147, 147, 123, 123, 123, 129,
+    123, 147, 161, 155, 155, 147, 161, 147, 123, 147, 162, 147, 155, 147, 147,
+    147, 147, 162, 153, 147, 161, 147, 147, 162, 147, 147, 147, 147, 155, 147,
+    147, 147, 123, 155, 147, 151, 147, 129, 154, 123, 123, 154, 147, 147, 123,
+    153, 153, 123, 162, 147, 154, 147, 123, 162, 147, 147, 161, 162, 154, 147,
+    147, 147, 126, 147, 147, 147, 147, 147, 123, 147, 147, 147, 154, 155, 147,
+    123, 147, 154, 147, 147, 161, 123, 154, 155, 147, 147, 147, 123, 162, 162,
+    162, 129, 129, 123, 147, 162, 155, 147, 162, 129, 147, 129, 147, 162, 147,
+    162, 123, 147, 153, 147, 162, 123, 147, 123, 123, 147, 161, 162, 162, 123,
+    147, 161, 123, 161, 123, 123, 147, 147, 123, 147, 162, 147, 129, 126, 123,
+    126, 161, 147, 123, 127, 126, 147, 161, 147, 147, 147, 123, 155, 147, 147,
+    126, 123, 154, 129, 129, 129, 129, 123, 147, 162, 123, 123, 147, 147, 123,
+    147, 147, 155, 155, 153, 162, 162, 127, 147, 147, 162, 161, 147, 147, 161,
+    154, 161, 123, 123, 155, 147, 147, 123, 162, 147, 147, 123, 147, 162, 161,
+    147, 147, 147, 147, 155, 147, 147, 147, 129, 147, 162, 147, 154, 123, 123,
+    154, 147, 147, 147, 123, 153, 147, 147, 147, 154, 123, 161, 123, 123, 147,
+    154, 147, 147, 153, 147, 153, 123, 147, 154, 147, 153, 123, 147, 126, 123,
+    147, 147, 155, 147, 123, 153, 162, 123, 154, 147, 147, 147, 123, 153, 126,
+    123, 127, 154, 123, 153, 147, 147, 153, 123, 123, 154, 126, 123, 123, 147,
+    147, 123, 147, 154, 123, 123, 154, 147, 153, 147, 147, 147, 162, 147, 155,
+    161, 126, 147, 147, 123, 155, 147, 147, 123, 129, 147, 147, 147, 155, 154,
+    123, 147, 147, 154, 123, 147, 147, 147, 123, 147, 147, 123, 123, 147, 154,
+    123, 154, 123, 147, 123, 123, 154, 123, 147, 154, 123, 123, 147, 154, 123,
+    126, 154, 123, 154, 126, 123, 147, 154, 154, 153, 123, 155, 147, 154, 147,
+    154, 154, 123, 123, 154, 123, 147, 154, 123, 153, 153, 154, 154, 123, 154,
+    154, 154, 154, 147, 151, 147, 147, 123, 162, 147, 147, 153, 123, 123, 147,
+    154, 154, 123, 154, 154, 154, 154, 153, 154, 123, 151, 147, 126, 126, 123,
+    123, 154, 123, 154, 123, 123, 123, 147, 123, 147, 154, 147, 147, 154, 147,
+    154, 154, 153, 154, 153, 123, 153, 123, 154, 154, 147, 123, 125, 154, 123,
+    154, 154, 147, 147, 154, 147, 153, 147, 147, 154, 154, 154, 123, 154, 147,
+    147, 123, 154, 147, 154, 126, 147, 147, 147, 147, 161, 147, 154, 123, 147,
+    154, 154, 123, 147, 147, 147, 147, 123, 154, 123, 147, 147, 147, 123, 154,
+    147, 147, 147, 147, 153, 123, 147, 123, 123, 147, 123, 147, 162, 147, 147,
+    123, 147, 153, 162, 147, 123, 154, 154, 126, 126, 123, 154, 123, 123, 154,
+    147, 147, 147, 147, 123, 154, 147, 153, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 123, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 162, 123, 147, 126, 147, 147, 147, 147, 154, 123,
+    162, 161, 123, 147, 147, 147, 123, 147, 147, 162, 162, 153, 147, 123, 147,
+    147, 147, 147, 155, 123, 147, 147, 147, 161, 162, 162, 147, 126, 147, 123,
+    123, 154, 154, 154, 147, 147, 147, 123, 154, 154, 154, 154, 154, 154, 126,
+    126, 154, 154, 123, 153, 154, 154, 147, 154, 154, 154, 147, 147, 154, 154,
+    154, 147, 154, 154, 147, 154, 154, 154, 147, 154, 147, 147, 123, 154, 123,
+    147, 154, 147, 123, 153, 147, 123, 147, 154, 147, 123, 123, 147, 147, 153,
+    154, 154, 154, 147, 123, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 162, 123, 162, 161,
+    147, 147, 123, 162, 147, 161, 147, 147, 162, 126, 147, 162, 162, 129, 161,
+    162, 147, 147, 123, 147, 123, 147, 123, 123, 147, 147, 123, 162, 123, 147,
+    123, 147, 154, 123, 147, 147, 147, 147, 147, 147, 123, 129, 147, 162, 155,
+    155, 147, 147, 129, 147, 162, 123, 155, 123, 162, 155, 147, 154, 147, 162,
+    155, 123, 147, 147, 162, 147, 161, 161, 155, 123, 147, 162, 147, 147, 147,
+    162, 147, 143, 123, 129, 129, 129, 155, 129, 153, 155, 147, 153, 147, 147,
+    155, 155, 147, 147, 147, 147, 123, 155, 144, 147, 129, 123, 155, 129, 154,
+    155, 123, 147, 153, 162, 147, 123, 147, 155, 129, 123, 147, 155, 147, 147,
+    154, 147, 147, 153, 153, 147, 155, 147, 123, 155, 147, 123, 155, 155, 123,
+    155, 129, 123, 161, 147, 162, 123, 162, 123, 147, 123, 147, 147, 161, 123,
+    123, 129, 147, 153, 123, 147, 147, 147, 147, 123, 147, 147, 154, 162, 162,
+    123, 123, 143, 126, 126, 155, 123, 123, 123, 123, 123, 123, 123, 155, 123,
+    123, 147, 126, 123, 147, 147, 126, 126, 123, 147, 147, 147, 147, 147, 123,
+    154, 147, 123, 147, 147, 123, 147, 123, 123, 147, 147, 147, 147, 154, 147,
+    147, 154, 153, 126, 154, 147, 147, 123, 123, 147, 147, 147, 154, 125, 123,
+    154, 154, 123, 147, 123, 147, 154, 123, 123, 147, 154, 147, 147, 147, 147,
+    154, 154, 123, 154, 123, 123, 154, 154, 147, 153, 154, 153, 153, 123, 129,
+    129, 129, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 123, 123, 162, 123,
+    123, 151, 126, 162, 129, 123, 129, 123, 154, 153, 154, 162, 162, 154, 123,
+    147, 147, 129, 126, 147, 129, 126, 126, 126, 129, 129, 153, 147, 147, 161,
+    147, 155, 161, 162, 123, 155, 143, 162, 162, 123, 162, 155, 126, 162, 123,
+    125, 129, 153, 147, 147, 162, 161, 144, 153, 147, 147, 162, 147, 147, 162,
+    162, 162, 154, 147, 123, 129, 126, 123, 123, 123, 123, 123, 155, 162, 155,
+    123, 154, 154, 123, 147, 162, 161, 123, 162, 126, 123, 129, 162, 147, 162,
+    147, 154, 127, 155, 162, 123, 143, 123, 153, 161, 154, 123, 147, 123, 162,
+    162, 154, 147, 123, 154, 147, 155, 162, 153, 154, 154, 147, 154, 147, 154,
+    162, 147, 162, 147, 155, 157, 162, 123, 147, 162, 147, 127, 123, 162, 123,
+    129, 123, 129, 162, 157, 162, 147, 155, 155, 162, 155, 123, 162, 129, 129,
+    129, 123, 147, 155, 147, 147, 162, 161, 147, 153, 147, 129, 129, 162, 147,
+    147, 155, 147, 162, 123, 155, 147, 147, 147, 147, 155, 154, 123, 126, 129,
+    147, 147, 147, 147, 162, 155, 147, 147, 147, 155, 155, 147, 123, 147, 154,
+    147, 147, 147, 147, 147, 154, 147, 155, 153, 155, 154, 147, 147, 147, 147,
+    123, 147, 155, 147, 147, 123, 123, 147, 147, 147, 155, 162, 161, 155, 161,
+    123, 123, 147, 162, 162, 123, 162, 123, 155, 155, 129, 129, 161, 153, 155,
+    162, 129, 162, 162, 155, 147, 123, 123, 129, 129, 129, 147, 147, 161, 155,
+    126, 147, 123, 147, 147, 123, 161, 154, 151, 155, 157, 162, 147, 151, 147,
+    147, 162, 162, 123, 147, 126, 147, 161, 123, 147, 147, 147, 123, 123, 126,
+    147, 154, 153, 126, 153, 154, 147, 147, 151, 147, 147, 153, 153, 123, 123,
+    147, 123, 147, 147, 154, 126, 147, 147, 147, 123, 123, 126, 147, 123, 153,
+    123, 123, 123, 147, 147, 147, 147, 147, 123, 126, 123, 123, 126, 147, 147,
+    123, 147, 147, 147, 147, 154, 123, 147, 153, 147, 153, 154, 123, 153, 147,
+    147, 154, 147, 147, 127, 147, 154, 151, 154, 153, 123, 123, 123, 123, 147,
+    147, 123, 147, 147, 126, 147, 123, 129, 123, 147, 126, 153, 147, 147, 147,
+    147, 147, 153, 147, 147, 147, 147, 147, 147, 147, 147, 153, 147, 147, 147,
+    147, 147, 126, 129, 123, 123, 123, 147, 151, 147, 147, 151, 154, 123, 154,
+    123, 147, 147, 123, 123, 123, 153, 147, 123, 123, 154, 123, 147, 153, 147,
+    153, 154, 123, 123, 126, 147, 147, 147, 147, 126, 126, 123, 123, 123, 147,
+    154, 153, 153, 153, 154, 123, 147, 153, 154, 154, 154, 153, 151, 153, 154,
+    147, 154, 147, 147, 154, 126, 147, 154, 154, 123, 123, 126, 147, 147, 153,
+    147, 123, 147, 147, 126, 126, 147, 123, 129, 123, 153, 147, 147, 147, 147,
+    147, 123, 147, 123, 123, 155, 123, 153, 147, 127, 123, 153, 147, 123, 123,
+    123, 154, 147, 147, 123, 147, 147, 147, 154, 123, 154, 123, 123, 147, 147,
+    151, 153, 147, 147, 154, 147, 147, 147, 123, 154, 127, 153, 147, 154, 147,
+    147, 147, 147, 147, 123, 147, 123, 126, 123, 123, 123, 123, 123, 123, 123,
+    154, 147, 147, 154, 126, 147, 147, 153, 123, 123, 123, 147, 123, 147, 123,
+    147, 147, 123, 123, 123, 147, 151, 147, 153, 147, 147, 147, 147, 147, 147,
+    147, 147, 126, 123, 123, 123, 125, 123, 123, 147, 147, 147, 154, 147, 123,
+    147, 123, 147, 153, 147, 147, 123, 154, 153, 147, 154, 147, 153, 147, 147,
+    147, 129, 147, 153, 123, 153, 147, 147, 123, 123, 123, 147, 147, 153, 155,
+    123, 147, 147, 147, 153, 147, 147, 147, 147, 153, 147, 153, 147, 123, 123,
+    147, 153, 154, 153, 154, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 123, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129,
+    129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 123, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129,
+    129, 123, 123, 129, 154, 123, 123, 147, 147, 147, 147, 123, 129, 126, 147,
+    126, 154, 154, 154, 123, 126, 154, 147, 123, 147, 147, 154, 147, 123, 147,
+    151, 126, 123, 123, 147, 147, 147, 123, 153, 147, 154, 154, 147, 153, 147,
+    147, 154, 154, 147, 147, 153, 123, 123, 129, 129, 129, 129, 123, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 123, 147, 162, 155, 147, 147, 123, 123, 123, 153, 123, 162, 123, 147,
+    147, 162, 153, 147, 155, 162, 129, 129, 129, 129, 123, 123, 147, 147, 162,
+    155, 155, 123, 162, 123, 155, 162, 154, 162, 126, 126, 129, 129, 129, 162,
+    147, 161, 147, 123, 147, 154, 147, 161, 154, 155, 162, 162, 162, 154, 123,
+    126, 123, 147, 154, 147, 123, 126, 147, 147, 127, 147, 147, 123, 162, 154,
+    147, 154, 123, 147, 123, 147, 126, 161, 154, 126, 155, 153, 123, 161, 127,
+    153, 161, 123, 154, 161, 129, 129, 147, 129, 147, 154, 154, 123, 147, 123,
+    123, 162, 157, 162, 126, 123, 123, 123, 157, 154, 147, 154, 129, 123, 147,
+    162, 162, 147, 162, 147, 154, 123, 147, 129, 147, 147, 123, 147, 147, 153,
+    147, 147, 154, 147, 147, 161, 147, 147, 129, 147, 147, 162, 123, 162, 126,
+    123, 147, 123, 123, 161, 162, 147, 126, 123, 154, 161, 147, 161, 162, 162,
+    123, 126, 129, 153, 123, 153, 162, 147, 126, 147, 127, 147, 123, 147, 126,
+    147, 155, 162, 123, 155, 151, 147, 126, 154, 147, 161, 147, 147, 147, 162,
+    147, 147, 161, 147, 147, 153, 123, 154, 123, 147, 162, 147, 162, 147, 129,
+    123, 123, 129, 153, 143, 123, 147, 147, 123, 147, 123, 147, 123, 147, 123,
+    147, 123, 147, 123, 147, 123, 147, 129, 129, 123, 129, 129, 129, 129, 161,
+    126, 123, 147, 147, 126, 162, 123, 143, 162, 123, 147, 147, 147, 154, 123,
+    147, 147, 154, 147, 153, 123, 123, 153, 123, 147, 147, 147, 147, 123, 147,
+    126, 154, 123, 147, 151, 123, 147, 123, 126, 147, 123, 153, 154, 151, 123,
+    154, 126, 126, 123, 123, 147, 123, 147, 147, 147, 154, 123, 154, 123, 147,
+    147, 154, 147, 123, 123, 154, 153, 153, 147, 153, 153, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129,
+    154, 147, 126, 123, 147, 147, 147, 154, 123, 154, 147, 147, 123, 123, 153,
+    123, 147, 123, 147, 147, 147, 147, 147, 147, 123, 125, 154, 147, 123, 147,
+    123, 155, 129, 153, 147, 153, 123, 154, 127, 154, 123, 123, 153, 123, 154,
+    123, 147, 123, 123, 147, 147, 123, 154, 154, 154, 123, 127, 153, 123, 123,
+    153, 147, 123, 153, 154, 147, 147, 147, 153, 147, 161, 147, 147, 147, 147,
+    147, 123, 147, 123, 123, 123, 123, 147, 123, 147, 153, 153, 147, 123, 147,
+    123, 129, 123, 129, 123, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 123, 129, 129, 129, 129, 123, 123, 129, 123, 129, 129, 123, 129,
+    123, 147, 123, 147, 147, 162, 147, 147, 162, 123, 123, 147, 154, 154, 154,
+    147, 147, 151, 147, 154, 154, 147, 123, 123, 123, 151, 147, 147, 126, 147,
+    123, 123, 123, 123, 153, 147, 147, 147, 123, 147, 123, 147, 147, 123, 147,
+    154, 153, 123, 147, 154, 126, 123, 147, 123, 147, 147, 153, 147, 147, 153,
+    147, 147, 147, 154, 147, 123, 147, 147, 147, 147, 123, 147, 126, 147, 147,
+    154, 147, 147, 147, 123, 154, 147, 147, 123, 147, 147, 151, 154, 147, 147,
+    147, 123, 123, 147, 153, 147, 147, 123, 154, 123, 153, 154, 147, 147, 147,
+    154, 154, 153, 129, 129, 129, 129, 129, 129, 123, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129, 123,
+    129, 162, 123, 123, 147, 123, 153, 123, 147, 161, 155, 123, 147, 147, 123,
+    129, 155, 162, 147, 129, 147, 161, 123, 147, 147, 123, 155, 126, 153, 123,
+    125, 161, 147, 123, 123, 126, 161, 147, 161, 154, 161, 123, 153, 147, 147,
+    126, 123, 147, 153, 123, 155, 147, 161, 147, 147, 147, 123, 147, 123, 153,
+    161, 147, 153, 123, 154, 153, 153, 127, 147, 123, 123, 153, 161, 123, 154,
+    161, 147, 123, 147, 123, 147, 123, 123, 147, 161, 162, 123, 147, 147, 147,
+    147, 123, 123, 147, 123, 147, 147, 147, 123, 123, 123, 147, 123, 123, 154,
+    147, 147, 126, 123, 153, 153, 147, 147, 123, 123, 147, 147, 147, 147, 147,
+    123, 153, 147, 147, 123, 147, 147, 147, 123, 153, 123, 153, 154, 123, 153,
+    154, 147, 123, 126, 123, 123, 126, 147, 147, 123, 147, 153, 123, 126, 123,
+    147, 123, 147, 147, 153, 153, 126, 154, 147, 147, 147, 154, 123, 147, 147,
+    147, 123, 123, 123, 153, 126, 126, 123, 123, 126, 123, 147, 147, 123, 123,
+    123, 123, 147, 123, 123, 123, 153, 123, 147, 153, 154, 123, 123, 147, 147,
+    123, 147, 147, 153, 126, 126, 126, 147, 154, 147, 147, 123, 147, 147, 123,
+    153, 126, 154, 147, 147, 153, 147, 153, 123, 147, 147, 123, 123, 147, 153,
+    147, 123, 123, 123, 123, 147, 147, 123, 123, 147, 123, 147, 147, 147, 126,
+    147, 153, 147, 147, 123, 129, 123, 123, 129, 129, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 123, 129, 123, 129, 129, 123, 129, 129, 129, 129, 129,
+    129, 129, 129, 129, 123, 129, 129, 129, 129, 123, 123, 123, 123, 129, 123,
+    123, 154, 147, 154, 123, 154, 147, 126, 126, 147, 123, 123, 126, 147, 147,
+    154, 154, 147, 154, 147, 123, 147, 147, 147, 147, 147, 123, 147, 147, 123,
+    147, 153, 123, 147, 154, 123, 154, 147, 126, 126, 126, 147, 147, 147, 147,
+    147, 123, 147, 147, 123, 147, 147, 147, 123, 123, 154, 123, 147, 153, 153,
+    154, 154, 123, 123, 126, 123, 123, 147, 147, 147, 147, 153, 154, 123, 123,
+    153, 153, 147, 154, 147, 147, 147, 123, 147, 147, 147, 126, 147, 123, 147,
+    123, 147, 147, 147, 147, 147, 153, 123, 147, 147, 147, 154, 147, 126, 147,
+    147, 123, 154, 123, 147, 153, 147, 154, 147, 147, 147, 153, 147, 153, 153,
+    147, 123, 147, 147, 123, 147, 147, 147, 147, 147, 153, 123, 147, 147, 123,
+    147, 147, 153, 147, 153, 147, 123, 154, 147, 147, 147, 147, 147, 154, 154,
+    154, 147, 123, 153, 147, 147, 129, 129, 129, 129, 123, 129, 129, 123, 129,
+    129, 129, 129, 129, 129, 123, 129, 123, 129, 129, 129, 123, 129, 129, 129,
+    129, 129, 129, 123, 123, 129, 129, 129, 123, 123, 123, 129, 129, 123, 129,
+    129, 129, 129, 129, 129, 129, 129, 123, 123, 129, 129, 123, 129, 123, 154,
+    123, 123, 126, 154, 147, 123, 147, 154, 129, 162, 147, 147, 123, 123, 147,
+    154, 143, 147, 123, 153, 126, 123, 123, 153, 147, 123, 147, 123, 123, 123,
+    157, 151, 147, 147, 143, 126, 126, 162, 153, 129, 162, 126, 161, 123, 129,
+    123, 147, 161, 147, 155, 154, 129, 129, 147, 123, 147, 147, 161, 147, 123,
+    147, 147, 154, 147, 153, 153, 123, 161, 147, 161, 161, 153, 129, 147, 162,
+    126, 155, 147, 147, 147, 123, 123, 147, 147, 147, 147, 161, 147, 147, 155,
+    147, 147, 147, 147, 147, 147, 147, 155, 147, 129, 123, 162, 123, 155, 161,
+    123, 153, 154, 126, 153, 147, 147, 153, 154, 123, 123, 154, 147, 154, 123,
+    147, 147, 147, 147, 153, 123, 147, 147, 153, 154, 147, 147, 147, 147, 123,
+    123, 147, 129, 161, 123, 147, 123, 147, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 27, 0, 0, 0, 27, 139, 139, 144, 139, 139, 139, 139,
+    139, 139, 139, 139, 144, 0, 0, 0, 0, 149, 149, 149, 148, 149, 148, 148,
+    149, 149, 149, 149, 149, 148, 148, 149, 149, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 117, 0, 0, 123, 123, 123, 123, 123, 123, 123, 0, 0, 0, 0, 0, 0,
+    123, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 81, 162, 0, 162, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 123, 0, 24, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25, 25,
+    25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 144, 139, 139, 144,
+    163, 144, 139, 139, 144, 139, 139, 144, 163, 139, 139, 144, 144, 139, 139,
+    144, 163, 139, 139, 144, 144, 139, 139, 144, 163, 139, 139, 144, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81,
+    81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 81, 154, 81, 81,
+    81, 81, 81, 81, 0, 0, 109, 147, 81, 81, 147, 147, 81, 0, 147, 81, 0, 81, 0,
+    0, 81, 81, 81, 0, 0, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109,
+    109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109, 109,
+    109, 109, 109, 109, 109, 144, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 0, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+    14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 0, 0,
+    0, 0, 14, 12, 147, 147, 147, 149, 147, 147, 147, 149, 147, 147, 147, 149,
+    147, 147, 147, 12, 12, 84, 124, 147, 147, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26,
+    0, 26, 0, 0, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 0, 0,
+    0, 117, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 129, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 117, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 117, 129, 0, 0, 117, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 117, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 117, 0, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 25, 0, 0, 0, 0,
+    0, 24, 24, 24, 24, 24, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0,
+    0, 0, 0, 117, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 123, 0, 0, 117, 117, 117,
+    117, 0, 117, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0,
+    117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    117, 162, 162, 154, 162, 153, 162, 81, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 123, 123, 123, 123, 123,
+    123, 123, 123, 123, 123, 123, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0,
+    117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 117, 0, 0,
+    0, 0, 0, 0, 0, 117, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 117, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0,
+    0, 0, 0, 117, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 117, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 9, 9, 9, 9, 0, 0, 0, 0, 109, 109, 0, 0, 109, 109, 0, 0,
+    0, 109, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 109, 0, 0, 0, 0,
+    117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 26, 28, 28, 126,
+    0, 0, 150, 156, 128, 129, 5, 178, 180, 66, 0, 179, 181, 76, 0, 81, 90, 90,
+    31, 133, 30, 30, 16, 130, 81, 83, 120, 30, 132, 0, 0, 17, 17, 95, 121, 16,
+    16, 29, 29, 16, 16, 31, 31, 3, 3, 21, 21, 162, 0, 0, 147, 0, 162, 0, 144,
+    144, 162, 162, 164, 111, 0, 162, 0, 0, 0, 0, 0, 162, 162, 129, 129, 0, 0,
+    0, 0, 81, 144, 0, 0, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162,
+    162, 162, 162, 162, 162, 129, 129, 129, 129, 129, 129, 129, 129, 129, 129,
+    0, 0, 0, 0, 0, 0, 0, 153, 109, 0, 0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0, 0,
+    117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 0, 0, 0, 0, 117, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 0, 0, 0, 0, 0, 0, 41, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123,
+    0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 162, 162, 162, 162, 81,
+    81, 151, 151, 151, 151, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 14,
+    14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
+    14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 149, 149, 148, 149, 148, 148,
+    149, 149, 149, 149, 149, 148, 148, 147, 147, 147, 147, 147, 147, 147, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0, 0, 0, 0, 0, 0, 19, 19,
+    19, 0, 19, 19, 19, 0, 19, 0, 19, 19, 19, 165, 165, 165, 165, 165, 165, 165,
+    165, 165, 165, 165, 165, 165, 165, 165, 169, 162, 0, 0, 142, 142, 153, 153,
+    0, 0, 111, 111, 0, 0, 129, 129, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 117, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 117, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    117, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 69, 69, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 162, 162,
+    0, 0, 123, 0, 0, 0, 0, 81, 81, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 81, 0,
+    81, 0, 41, 41, 0, 41, 0, 0, 0, 0, 0, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 123, 123, 0, 0, 0, 0, 0, 0, 0, 0, 13, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 117, 117, 0, 0, 0, 154, 106, 0, 0, 0, 81, 0, 0, 0, 0, 111, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 7, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 117, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 26, 0, 30, 132, 42, 42, 33, 33, 31,
+    31, 3, 3, 8, 8, 33, 33, 16, 16, 43, 92, 30, 132, 0, 0, 30, 30, 33, 33, 16,
+    130, 3, 3, 20, 20, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 129,
+    129, 0, 0, 0, 0, 162, 162, 162, 162, 162, 162, 162, 162, 162, 162, 0, 0, 0,
+    0, 0, 0, 162, 0, 147, 0, 0, 0, 151, 0, 0, 0, 0, 0, 0, 0, 0, 0, 81, 0, 0,
+    171, 0, 0, 0, 0, 0, 0, 0, 0, 0, 162, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 153, 117, 123, 0, 0, 147, 0, 117, 117,
+    147, 0, 117, 123, 147, 117, 0, 0, 0, 0, 0, 0, 0, 117, 0, 123, 0, 0, 0, 0,
+    117, 117, 0, 0, 13, 13, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 117, 117,
+]; // 27167 entries
+
+const TABLE_UPPER: &'static [u16] = &[
+    14150, 14150, 14150, 14150, 1223, 2487, 2370, 2274, 26981, 13542, 26003,
+    2338, 2533, 14064, 13624, 26163, 25857, 0, 25247, 25206, 25476, 0, 853, 0,
+    26804, 26192, 0, 25522, 26505, 2698, 1771, 0, 13779, 916, 2146, 0, 26726,
+    0, 0, 0, 0, 795, 2242, 1115, 13265, 1441, 24884, 25312, 24696, 13655, 739,
+    26949, 25133, 13510, 13906, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26387, 25075, 14182, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 148,
+    1374, 1255, 2519, 2402, 0, 0, 26892, 0, 0, 0, 0, 0, 0, 0, 0, 25971, 2306,
+    26842, 24817, 1079, 1664, 0, 0, 27042, 26878, 14032, 27013, 26323, 40,
+    2568, 25337, 13574, 26035, 1642, 26537, 342, 27069, 0, 0, 1583, 2730, 0, 0,
+    0, 0, 0, 0, 13811, 1840, 0, 948, 2178, 827, 2082, 1147, 1473, 24916, 24728,
+    26419, 25107, 180, 1406, 2438, 26772, 0, 24849, 13606, 0, 0, 0, 0, 0,
+    13312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 27101, 2666, 1739, 26352, 0, 1618, 0, 0, 0,
+    0, 0, 25599, 13843, 884, 26066, 980, 2114, 26066, 980, 2210, 1309, 1505,
+    24948, 24948, 24760, 0, 294, 0, 13875, 26098, 0, 1012, 0, 69, 0, 0, 371,
+    25887, 13968, 13233, 1341, 1537, 24980, 0, 0, 0, 2593, 118, 0, 0, 0, 0, 0,
+    0, 0, 1840, 24852, 1840, 0, 0, 312, 26127, 26649, 0, 0, 26288, 26156, 1184,
+    26710, 1787, 1044, 0, 0, 0, 0, 25345, 0, 26745, 0, 0, 0, 1373, 780, 0,
+    2601, 13487, 0, 435, 0, 0, 1681, 0, 211, 0, 78, 26686, 0, 2554, 25280, 0,
+    0, 2554, 25935, 0, 1373, 1840, 25277, 1618, 1425, 0, 0, 25935, 0, 0, 26356,
+    1569, 0, 25175, 14082, 0, 26942, 25744, 25337, 26468, 0, 0, 1713, 0, 0,
+    14019, 78, 0, 25516, 0, 406, 0, 0, 0, 0, 0, 25516, 0, 2639, 0, 0, 0, 25345,
+    0, 25516, 0, 2732, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26660, 0, 26356, 0, 26477,
+    0, 0, 0, 258, 26196, 0, 0, 0, 0, 0, 26288, 25277, 1282, 26649, 0, 0, 25823,
+    0, 0, 0, 0, 0, 0, 0, 26273, 13343, 0, 0, 0, 0, 0, 24805, 0, 1048, 26307,
+    25849, 0, 0, 0, 0, 13312, 0, 0, 26572, 13312, 1425, 0, 0, 26444, 25407,
+    14212, 26814, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 78, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 26477, 2732, 14114, 0, 1425, 24776, 0, 0, 0, 0, 25935, 0, 0, 2764,
+    14244, 2796, 14276, 2828, 14308, 2860, 14340, 2892, 14372, 2924, 14404,
+    2956, 14436, 2988, 14468, 3020, 14500, 3052, 14532, 3084, 14564, 3116,
+    14596, 3148, 14628, 3180, 14660, 3212, 14692, 3244, 14724, 3276, 14756,
+    3308, 14788, 3340, 14820, 3372, 14852, 3404, 14884, 3436, 14916, 3468,
+    14948, 3500, 14980, 3532, 15012, 3564, 15044, 3596, 15076, 3628, 15108,
+    3660, 15140, 3692, 15172, 3724, 15204, 3756, 15236, 3788, 15268, 3820,
+    15300, 3852, 15332, 3884, 15364, 3916, 15396, 3948, 15428, 3980, 15460,
+    4012, 15492, 4044, 15524, 4076, 15556, 4108, 15588, 4140, 15620, 4172,
+    15652, 4204, 15684, 4236, 15716, 4268, 15748, 4300, 15780, 4332, 15812,
+    4364, 15844, 4396, 15876, 4428, 15908, 4460, 15940, 4492, 15972, 4524,
+    16004, 4556, 16036, 4588, 16068, 4620, 16100, 4652, 16132, 4684, 16164,
+    4716, 16196, 4748, 16228, 4780, 16260, 4812, 16292, 4844, 16324, 4876,
+    16356, 4908, 16388, 4940, 16420, 4972, 16452, 5004, 16484, 5036, 16516,
+    5068, 16548, 5100, 16580, 5132, 16612, 5164, 16644, 5196, 16676, 5228,
+    16708, 5260, 16740, 5292, 16772, 5324, 16804, 5356, 16836, 5388, 16868,
+    5420, 16900, 5452, 16932, 5484, 16964, 5516, 16996, 5548, 17028, 5580,
+    17060, 5612, 17092, 5644, 17124, 5676, 17156, 5708, 17188, 5740, 17220,
+    5772, 17252, 5804, 17284, 5836, 17316, 5868, 17348, 5900, 17380, 5932,
+    17412, 5964, 17444, 5996, 17476, 6028, 17508, 6060, 17540, 6092, 17572,
+    6124, 17604, 6156, 17636, 6188, 17668, 6220, 17700, 6252, 17732, 6284,
+    17764, 6316, 17796, 6348, 17828, 6380, 17860, 6412, 17892, 6444, 17924,
+    6476, 17956, 6508, 17988, 6540, 18020, 6572, 18052, 6604, 18084, 6636,
+    18116, 6668, 18148, 6700, 18180, 6732, 18212, 6764, 18244, 6796, 18276,
+    6828, 18308, 6860, 18340, 6892, 18372, 6924, 18404, 6956, 18436, 6988,
+    18468, 7020, 18500, 7052, 18532, 7084, 18564, 7116, 18596, 7148, 18628,
+    7180, 18660, 7212, 18692, 7244, 18724, 7276, 18756, 7308, 18788, 7340,
+    18820, 7372, 18852, 7404, 18884, 7436, 18916, 7468, 18948, 7500, 18980,
+    7532, 19012, 7564, 19044, 7596, 19076, 7628, 19108, 7660, 19140, 7692,
+    19172, 7724, 19204, 7756, 19236, 7788, 19268, 7820, 19300, 7852, 19332,
+    7884, 19364, 7916, 19396, 7948, 19428, 7980, 19460, 8012, 19492, 8044,
+    19524, 8076, 19556, 8108, 19588, 8140, 19620, 8172, 19652, 8204, 19684,
+    8236, 19716, 8268, 19748, 8300, 19780, 8332, 19812, 8364, 19844, 8396,
+    19876, 8428, 19908, 8460, 19940, 8492, 19972, 8524, 20004, 8556, 20036,
+    8588, 20068, 8620, 20100, 8652, 20132, 8684, 20164, 8716, 20196, 8748,
+    20228, 8780, 20260, 8812, 20292, 8844, 20324, 8876, 20356, 8908, 20388,
+    8940, 20420, 8972, 20452, 9004, 20484, 9036, 20516, 9068, 20548, 9100,
+    20580, 9132, 20612, 9164, 20644, 9196, 20676, 9228, 20708, 9260, 20740,
+    9292, 20772, 9324, 20804, 9356, 20836, 9388, 20868, 9420, 20900, 9452,
+    20932, 9484, 20964, 9516, 20996, 9548, 21028, 9580, 21060, 9612, 21092,
+    9644, 21124, 9676, 21156, 9708, 21188, 9740, 21220, 9772, 21252, 9804,
+    21284, 9836, 21316, 9868, 21348, 9900, 21380, 9932, 21412, 9964, 21444,
+    9996, 21476, 10028, 21508, 10060, 21540, 10092, 21572, 10124, 21604, 10156,
+    21636, 10188, 21668, 10220, 21700, 10252, 21732, 10284, 21764, 10316,
+    21796, 10348, 21828, 10380, 21860, 10412, 21892, 10444, 21924, 10476,
+    21956, 10508, 21988, 10540, 22020, 10572, 22052, 10604, 22084, 10636,
+    22116, 10668, 22148, 10700, 22180, 10732, 22212, 10764, 22244, 10796,
+    22276, 10828, 22308, 10860, 22340, 10892, 22372, 10924, 22404, 10956,
+    22436, 10988, 22468, 11020, 22500, 11052, 22532, 11084, 22564, 11116,
+    22596, 11148, 22628, 11180, 22660, 11212, 22692, 11244, 22724, 11276,
+    22756, 11308, 22788, 11340, 22820, 11372, 22852, 11404, 22884, 11436,
+    22916, 11468, 22948, 11500, 22980, 11532, 23012, 11564, 23044, 11596,
+    23076, 11628, 23108, 11660, 23140, 11692, 23172, 11724, 23204, 11756,
+    23236, 11788, 23268, 11820, 23300, 11852, 23332, 11884, 23364, 11916,
+    23396, 11948, 23428, 11980, 23460, 12012, 23492, 12044, 23524, 12076,
+    23556, 12108, 23588, 12140, 23620, 12172, 23652, 12204, 23684, 12236,
+    23716, 12268, 23748, 12300, 23780, 12332, 23812, 12364, 23844, 12396,
+    23876, 12428, 23908, 12460, 23940, 12492, 23972, 12524, 24004, 12556,
+    24036, 12588, 24068, 12620, 24100, 12652, 24132, 12684, 24164, 12716,
+    24196, 12748, 24228, 12780, 24260, 12812, 24292, 12844, 24324, 12876,
+    24356, 12908, 24388, 12940, 24420, 12972, 24452, 13004, 24484, 13036,
+    24516, 13068, 24548, 13100, 24580, 13132, 24612, 13164, 24644, 13196,
+    24676, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948,
+    24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 24948, 13228, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 23268, 23268, 23268, 23268,
+    23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268,
+    23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268,
+    23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268, 23268,
+    23268, 23268, 23268, 23268, 483, 515, 515, 515, 515, 515, 515, 515, 515,
+    547, 515, 515, 515, 515, 515, 515, 515, 515, 515, 515, 515, 579, 23268,
+    611, 643, 675, 707, 13748, 13722, 25401, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1842, 24948,
+    1874, 24948, 1906, 1938, 24948, 1970, 2002, 2034, 2066, 0, 0, 0, 0, 0, 0,
+    27132, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 451, 13441, 13473, 0, 0, 0, 0, 26066, 13409, 25043, 25011, 13377, 0, 0,
+    25583, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 1605, 0, 780, 0, 25345, 0, 0, 0, 0, 0, 1840, 0, 25516, 0, 0, 0,
+    25280, 1373, 0, 26942, 0, 0, 25337, 25280, 1373, 26660, 26649, 0, 13345, 0,
+    0, 0, 25337, 0, 0, 0, 0, 0, 25337, 0, 26572, 13995, 25551, 0, 0, 0, 1157,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26352,
+    25744, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 294, 0, 0, 25629,
+    0, 2408, 0, 78, 0, 0, 1618, 0, 0, 13487, 277, 25744, 0, 0, 0, 0, 0, 0, 0,
+    26660, 0, 0, 13312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25744, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 26356, 294, 0, 0, 0, 0, 0, 26942, 2408, 0, 1157,
+    26572, 0, 0, 0, 1157, 0, 25744, 0, 78, 0, 0, 0, 0, 0, 0, 0, 1157, 0, 0, 0,
+    1618, 25280, 0, 0, 13487, 25345, 26227, 25769, 1425, 25849, 0, 25951, 0,
+    13487, 26356, 26847, 0, 25732, 0, 78, 25280, 0, 78, 0, 26288, 0, 25345, 0,
+    13684, 0, 1084, 0, 0, 25744, 2554, 0, 0, 0, 0, 0, 0, 0, 25516, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 26942, 0, 0, 0, 0, 0, 0, 0, 0, 0, 406, 26356, 25778, 0,
+    0, 0, 25516, 0, 0, 0, 0, 0, 1605, 0, 0, 0, 0, 0, 0, 26649, 0, 0, 0, 0,
+    26356, 0, 1605, 0, 1618, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 26588, 0, 0, 0, 0, 26288, 760, 0, 0, 1425, 1618, 26588, 25744, 0, 0, 0,
+    0, 0, 26356, 0, 0, 26468, 25345, 0, 0, 0, 0, 0, 0, 0, 0, 25744, 1425, 0, 0,
+    0, 13345, 0, 0, 1425, 1840, 78, 0, 0, 0, 0, 1373, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    26352, 0, 0, 1425, 1157, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    25161, 25280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 399, 26468, 13693, 0, 25708, 0, 0,
+    1605, 780, 0, 0, 0, 0, 0, 0, 0, 25744, 0, 25849, 1373, 0, 0, 294, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 1425, 0, 1373, 26356, 406, 0, 0, 0, 0, 0, 26352, 1425,
+    0, 0, 0, 0, 25277, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 1084, 0, 0, 0, 2408, 0, 0, 0, 0, 0, 0, 0, 0, 0, 406, 0, 25732,
+    0, 0, 0, 0, 0, 0, 14118, 0, 0, 0, 26554, 0, 0, 0, 0, 0, 26356, 0, 0, 0, 0,
+    13309, 25488, 26942, 13927, 0, 1191, 0, 0, 238, 0, 0, 0, 0, 13345, 25661,
+    0, 0, 399, 1425, 25277, 0, 0, 0, 25447, 0, 0, 1840, 0, 0, 0, 0, 26156,
+    26356, 0, 0, 0, 0, 26660, 2408, 0, 0, 26356, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26352, 0, 0, 0, 0, 0,
+    26288, 25693, 1618, 13309, 13277, 25917, 25373, 13345, 1084, 13487, 25438,
+    0, 406, 780, 26253, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26660, 0, 0, 0, 0, 0, 0, 0,
+    0, 1618, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25277, 0,
+    0, 0, 0, 0, 0, 0, 13312, 0, 0, 0, 0, 0, 0, 13312, 0, 0, 0, 25849, 0, 1373,
+    26588, 0, 0, 0, 0, 0, 1618, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 1373, 26942, 0, 0, 0, 0, 0, 0, 0, 13312, 0, 0, 13487, 0,
+    0, 0, 0, 0, 0, 78, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 780, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26352, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 13312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 26660, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26468, 0, 0, 0, 26606, 0, 0, 0,
+    0, 0, 0, 0, 0, 26572, 0, 0, 0, 0, 0, 0, 1618, 26468, 25708, 0, 0, 1618, 0,
+    0, 0, 0, 0, 25280, 1840, 0, 0, 0, 0, 105, 0, 0, 0, 32, 0, 2554, 0, 0,
+    26942, 13945, 0, 0, 13487, 0, 0, 0, 0, 25744, 13345, 1840, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 25345, 0, 25849, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25231,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 26572, 0, 1618, 0, 25516, 0, 0, 0, 0, 406, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 25277, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 25744, 0, 0, 0, 0, 0, 2554, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    25516, 2554, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2629, 0, 1809, 0, 25516, 0, 26915,
+    1605, 0, 1084, 0, 27135, 0, 0, 25809, 0, 25849, 2455, 0, 0, 26468, 26352,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26626, 406, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1425, 1425, 0, 0, 26588,
+    26356, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13312, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 26588, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 25744, 25849,
+]; // 6086 entries
+
+/// Returns the set of encodings which can encode code point `code`,
+/// where the `i`-th bit corresponds to `encoding(i)`.
+#[inline]
+pub fn lookup(code: u32) -> u64 {
+    let offset = (code >> 5) as usize;
+    let offset = if offset < 6086 {TABLE_UPPER[offset] as usize} else {0};
+    BITSETS[TABLE_LOWER[offset + ((code & 31) as usize)] as usize]
+}
+
+/// Returns the encoding for the `i`-th bit, if available.
+pub fn encoding(i: usize) -> Option<EncodingRef> {
+    match i {
+        0 => Some(all::ASCII as EncodingRef),
+        1 => Some(all::ISO_8859_1 as EncodingRef),
+        #[cfg(feature = "index-armscii-8")]
+        2 => Some(all::ARMSCII_8 as EncodingRef),
+        #[cfg(feature = "index-ibm866")]
+        3 => Some(all::IBM866 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-2")]
+        4 => Some(all::ISO_8859_2 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-3")]
+        5 => Some(all::ISO_8859_3 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-4")]
+        6 => Some(all::ISO_8859_4 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-5")]
+        7 => Some(all::ISO_8859_5 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-6")]
+        8 => Some(all::ISO_8859_6 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-7")]
+        9 => Some(all::ISO_8859_7 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-8")]
+        10 => Some(all::ISO_8859_8 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-10")]
+        11 => Some(all::ISO_8859_10 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-13")]
+        12 => Some(all::ISO_8859_13 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-14")]
+        13 => Some(all::ISO_8859_14 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-15")]
+        14 => Some(all::ISO_8859_15 as EncodingRef),
+        #[cfg(feature = "index-iso-8859-16")]
+        15 => Some(all::ISO_8859_16 as EncodingRef),
+        #[cfg(feature = "index-koi8-r")]
+        16 => Some(all::KOI8_R as EncodingRef),
+        #[cfg(feature = "index-koi8-u")]
+        17 => Some(all::KOI8_U as EncodingRef),
+        #[cfg(feature = "index-macintosh")]
+        18 => Some(all::MAC_ROMAN as EncodingRef),
+        #[cfg(feature = "index-windows-874")]
+        19 => Some(all::WINDOWS_874 as EncodingRef),
+        #[cfg(feature = "index-windows-1250")]
+        20 => Some(all::WINDOWS_1250 as EncodingRef),
+        #[cfg(feature = "index-windows-1251")]
+        21 => Some(all::WINDOWS_1251 as EncodingRef),
+        #[cfg(feature = "index-windows-1252")]
+        22 => Some(all::WINDOWS_1252 as EncodingRef),
+        #[cfg(feature = "index-windows-1253")]
+        23 => Some(all::WINDOWS_1253 as EncodingRef),
+        #[cfg(feature = "index-windows-1254")]
+        24 => Some(all::WINDOWS_1254 as EncodingRef),
+        #[cfg(feature = "index-windows-1255")]
+        25 => Some(all::WINDOWS_1255 as EncodingRef),
+        #[cfg(feature = "index-windows-1256")]
+        26 => Some(all::WINDOWS_1256 as EncodingRef),
+        #[cfg(feature = "index-windows-1257")]
+        27 => Some(all::WINDOWS_1257 as EncodingRef),
+        #[cfg(feature = "index-windows-1258")]
+        28 => Some(all::WINDOWS_1258 as EncodingRef),
+        #[cfg(feature = "index-x-mac-cyrillic")]
+        29 => Some(all::MAC_CYRILLIC as EncodingRef),
+        #[cfg(feature = "index-euc-kr")]
+        30 => Some(all::WINDOWS_949 as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        31 => Some(all::EUC_JP as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        32 => Some(all::WINDOWS_31J as EncodingRef),
+        #[cfg(all(feature = "index-jis0208", feature = "index-jis0212"))]
+        33 => Some(all::ISO_2022_JP as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        34 => Some(all::HZ as EncodingRef),
+        #[cfg(feature = "index-big5")]
+        35 => Some(all::BIG5_2003 as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        36 => Some(all::GBK as EncodingRef),
+        #[cfg(all(feature = "index-gb18030", feature = "index-gb18030-ranges"))]
+        37 => Some(all::GB18030 as EncodingRef),
+        38 => Some(all::UTF_8 as EncodingRef),
+        _ => None
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::char;
+    use super::{NENCODINGS, lookup, encoding};
+
+    #[test]
+    fn test_lookup() {
+        let mut output = Vec::new();
+        for i in 0..NENCODINGS {
+            let encoding = match encoding(i) { Some(encoding) => encoding, None => continue };
+            let mut encoder = encoding.raw_encoder();
+            // every BMP code point and a sample of astral code points
+            let astral = (0x10000..0x110000).filter(|code| code % 31 == 0);
+            for code in (0..0xd800).chain(0xe000..0x10000).chain(astral) {
+                let ch = char::from_u32(code).unwrap();
+                let mut buf = [0; 4];
+                output.clear();
+                let (_, err) = encoder.raw_feed(ch.encode_utf8(&mut buf), &mut output);
+                assert_eq!((lookup(code) >> i) & 1 == 1, err.is_none(),
+                           "{} {:?}", encoding.name(), ch);
+            }
+        }
+    }
+}
@@ -51,6 +51,11 @@ impl<'r> StrCharIndex<'r> for &'r str {
 }
 
 /// A helper struct for the stateful decoder DSL.
+// only used by CJK encodings, which may be disabled
+#[cfg_attr(not(any(feature = "index-euc-kr",
+                   all(feature = "index-jis0208", feature = "index-jis0212"),
+                   all(feature = "index-gb18030", feature = "index-gb18030-ranges"),
+                   feature = "index-big5")), allow(dead_code))]
 pub struct StatefulDecoderHelper<'a, St, Data: 'a> {
     /// The current buffer.
     pub buf: &'a [u8],
@@ -66,6 +71,10 @@ pub struct StatefulDecoderHelper<'a, St, Data: 'a> {
     _marker: PhantomData<St>,
 }
 
+#[cfg_attr(not(any(feature = "index-euc-kr",
+                   all(feature = "index-jis0208", feature = "index-jis0212"),
+                   all(feature = "index-gb18030", feature = "index-gb18030-ranges"),
+                   feature = "index-big5")), allow(dead_code))]
 impl<'a, St: Default, Data> StatefulDecoderHelper<'a, St, Data> {
     /// Makes a new decoder context out of given buffer and output callback.
     #[inline(always)]
@@ -130,6 +139,11 @@ impl<'a, St: Default, Data> StatefulDecoderHelper<'a, St, Data> {
 }
 
 /// Defines a stateful decoder from given state machine.
+// only used by CJK encodings, which may be disabled
+#[cfg_attr(not(any(feature = "index-euc-kr",
+                   all(feature = "index-jis0208", feature = "index-jis0212"),
+                   all(feature = "index-gb18030", feature = "index-gb18030-ranges"),
+                   feature = "index-big5")), allow(unused_macros))]
 macro_rules! stateful_decoder {
     (
         module $stmod:ident; // should be unique from other existing identifiers